@@ -12,6 +12,11 @@ from elile.config.settings import settings
 from elile.db.models.base import Base
 
 # Import all models to ensure they are registered with Base.metadata
+from elile.db.models.agent_checkpoint import (  # noqa: F401
+    AgentCheckpoint,
+    AgentCheckpointBlob,
+    AgentCheckpointWrite,
+)
 from elile.db.models.audit import AuditEvent  # noqa: F401
 from elile.db.models.cache import CachedDataSource  # noqa: F401
 from elile.db.models.entity import Entity, EntityRelation  # noqa: F401
@@ -0,0 +1,84 @@
+"""Add LangGraph agent checkpoint tables
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18
+
+Durable checkpointer storage for the iterative search graph:
+- agent_checkpoints: checkpoint version maps and metadata
+- agent_checkpoint_blobs: per-channel values, stored in full or as deltas
+- agent_checkpoint_writes: pending task writes
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "agent_checkpoints",
+        sa.Column("thread_id", sa.String(255), primary_key=True),
+        sa.Column("checkpoint_ns", sa.String(255), primary_key=True, server_default=""),
+        sa.Column("checkpoint_id", sa.String(64), primary_key=True),
+        sa.Column("parent_checkpoint_id", sa.String(64), nullable=True),
+        sa.Column("checkpoint_type", sa.String(50), nullable=False),
+        sa.Column("checkpoint", sa.LargeBinary, nullable=False),
+        sa.Column("metadata", postgresql.JSONB, nullable=False, server_default="{}"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "idx_agent_checkpoints_thread",
+        "agent_checkpoints",
+        ["thread_id", "checkpoint_ns"],
+    )
+
+    op.create_table(
+        "agent_checkpoint_blobs",
+        sa.Column("thread_id", sa.String(255), primary_key=True),
+        sa.Column("checkpoint_ns", sa.String(255), primary_key=True, server_default=""),
+        sa.Column("channel", sa.String(255), primary_key=True),
+        sa.Column("version", sa.String(64), primary_key=True),
+        sa.Column("encoding", sa.String(16), nullable=False, server_default="full"),
+        sa.Column("base_version", sa.String(64), nullable=True),
+        sa.Column("chain_start", sa.String(64), nullable=False),
+        sa.Column("value_type", sa.String(50), nullable=False),
+        sa.Column("blob", sa.LargeBinary, nullable=True),
+    )
+    op.create_index(
+        "idx_agent_checkpoint_blobs_chain",
+        "agent_checkpoint_blobs",
+        ["thread_id", "checkpoint_ns", "channel", "chain_start"],
+    )
+
+    op.create_table(
+        "agent_checkpoint_writes",
+        sa.Column("thread_id", sa.String(255), primary_key=True),
+        sa.Column("checkpoint_ns", sa.String(255), primary_key=True, server_default=""),
+        sa.Column("checkpoint_id", sa.String(64), primary_key=True),
+        sa.Column("task_id", sa.String(255), primary_key=True),
+        sa.Column("idx", sa.Integer, primary_key=True),
+        sa.Column("channel", sa.String(255), nullable=False),
+        sa.Column("value_type", sa.String(50), nullable=False),
+        sa.Column("blob", sa.LargeBinary, nullable=False),
+        sa.Column("task_path", sa.Text, nullable=False, server_default=""),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("agent_checkpoint_writes")
+    op.drop_index("idx_agent_checkpoint_blobs_chain", table_name="agent_checkpoint_blobs")
+    op.drop_table("agent_checkpoint_blobs")
+    op.drop_index("idx_agent_checkpoints_thread", table_name="agent_checkpoints")
+    op.drop_table("agent_checkpoints")
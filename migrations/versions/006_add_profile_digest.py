@@ -0,0 +1,29 @@
+"""Add content digest to entity profiles
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+
+Stores a Merkle-style content digest with each profile version so
+monitoring checks can skip delta detection when nothing changed:
+- entity_profiles.digest: root and per-subtree digests (findings,
+  risk score, connections)
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("entity_profiles", sa.Column("digest", postgresql.JSONB, nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("entity_profiles", "digest")
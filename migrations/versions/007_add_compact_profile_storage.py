@@ -0,0 +1,146 @@
+"""Add compact (delta) storage for entity profiles
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+Profile versions can be stored as a compressed delta against the previous
+version, with a full snapshot at the start of every delta chain:
+- entity_profiles.encoding: "full" or "delta"
+- entity_profiles.base_version: version a delta applies to
+- entity_profiles.chain_start: version of the full snapshot a chain starts from
+- entity_profiles.snapshot_delta: compressed delta
+- snapshot columns become nullable (NULL in delta rows)
+
+Existing rows are left as full snapshots; the repository mixes full and
+delta rows, so only versions written in compact mode are stored as deltas.
+Downgrading rebuilds every delta row into a full snapshot first.
+
+The delta format is inlined below rather than imported from
+elile.db.profile_delta, so this revision keeps working as that module
+changes.
+"""
+
+import json
+import zlib
+
+import sqlalchemy as sa
+from alembic import context, op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+# Snapshot columns of entity_profiles, as of this revision
+SNAPSHOT_FIELDS = (
+    "findings",
+    "risk_score",
+    "connections",
+    "data_sources_used",
+    "stale_data_used",
+)
+
+profiles = sa.table(
+    "entity_profiles",
+    sa.column("profile_id", postgresql.UUID(as_uuid=True)),
+    sa.column("entity_id", postgresql.UUID(as_uuid=True)),
+    sa.column("version", sa.Integer),
+    sa.column("encoding", sa.String),
+    sa.column("base_version", sa.Integer),
+    sa.column("chain_start", sa.Integer),
+    sa.column("snapshot_delta", sa.LargeBinary),
+    *(sa.column(name, postgresql.JSONB) for name in SNAPSHOT_FIELDS),
+)
+
+
+def _entity_ids(connection: sa.Connection, where: sa.ColumnElement[bool]) -> list:
+    stmt = sa.select(profiles.c.entity_id).where(where).group_by(profiles.c.entity_id)
+    return list(connection.execute(stmt).scalars())
+
+
+def _history(connection: sa.Connection, entity_id) -> list[sa.Row]:
+    stmt = sa.select(profiles).where(profiles.c.entity_id == entity_id).order_by(profiles.c.version)
+    return list(connection.execute(stmt))
+
+
+def _decode_delta(data: bytes) -> dict:
+    return json.loads(zlib.decompress(data))
+
+
+def _apply_value(old, operation: dict):
+    if "v" in operation:
+        return operation["v"]
+    if "l" in operation:
+        start, removed, inserted = operation["l"]
+        return [*old[:start], *inserted, *old[start + removed :]]
+    if "d" in operation:
+        patch = operation["d"]
+        deleted = set(patch.get("del", ()))
+        patched = {key: value for key, value in old.items() if key not in deleted}
+        for key, nested in patch.get("sub", {}).items():
+            patched[key] = _apply_value(old[key], nested)
+        patched.update(patch.get("set", {}))
+        return patched
+    raise ValueError(f"Unknown delta operation: {sorted(operation)}")
+
+
+def _apply_snapshot_delta(old: dict, delta: dict) -> dict:
+    snapshot = dict(old)
+    for name, operation in delta.items():
+        snapshot[name] = _apply_value(old.get(name), operation)
+    return snapshot
+
+
+def _expand_delta_profiles() -> None:
+    """Rebuild every delta row into a full snapshot."""
+    connection = op.get_bind()
+    update = (
+        profiles.update()
+        .where(profiles.c.profile_id == sa.bindparam("target_id"))
+        .values(
+            encoding="full",
+            **{name: sa.bindparam(f"new_{name}") for name in SNAPSHOT_FIELDS},
+        )
+    )
+
+    for entity_id in _entity_ids(connection, profiles.c.encoding == "delta"):
+        rows = []
+        snapshot = None
+        for row in _history(connection, entity_id):
+            if row.encoding != "delta":
+                snapshot = {name: row._mapping[name] for name in SNAPSHOT_FIELDS}
+                continue
+            snapshot = _apply_snapshot_delta(snapshot, _decode_delta(row.snapshot_delta))
+            rows.append(
+                {"target_id": row.profile_id, **{f"new_{k}": v for k, v in snapshot.items()}}
+            )
+        if rows:
+            connection.execute(update, rows)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "entity_profiles",
+        sa.Column("encoding", sa.String(16), nullable=False, server_default="full"),
+    )
+    op.add_column("entity_profiles", sa.Column("base_version", sa.Integer, nullable=True))
+    op.add_column("entity_profiles", sa.Column("chain_start", sa.Integer, nullable=True))
+    op.add_column("entity_profiles", sa.Column("snapshot_delta", sa.LargeBinary, nullable=True))
+    for name in SNAPSHOT_FIELDS:
+        op.alter_column("entity_profiles", name, existing_type=postgresql.JSONB, nullable=True)
+    op.execute("UPDATE entity_profiles SET chain_start = version")
+
+
+def downgrade() -> None:
+    if not context.is_offline_mode():
+        _expand_delta_profiles()
+
+    for name in SNAPSHOT_FIELDS:
+        op.alter_column("entity_profiles", name, existing_type=postgresql.JSONB, nullable=False)
+    op.drop_column("entity_profiles", "snapshot_delta")
+    op.drop_column("entity_profiles", "chain_start")
+    op.drop_column("entity_profiles", "base_version")
+    op.drop_column("entity_profiles", "encoding")
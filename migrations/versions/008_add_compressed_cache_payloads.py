@@ -0,0 +1,45 @@
+"""Store provider cache payloads compressed and encrypted
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+Normalized provider data is now stored zstd-compressed and AES-GCM
+encrypted, like the raw response:
+- cached_data_sources.normalized_payload: compressed, encrypted JSON
+- cached_data_sources.normalized_data becomes nullable (only set on rows
+  written before this revision, which are still read as they are)
+
+Rows are not rewritten here because the migration has no access to the
+encryption key; cache entries age out on their own. Downgrading drops
+the entries that only have an encrypted payload, since they cannot be
+turned back into plaintext without the key.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "cached_data_sources",
+        sa.Column("normalized_payload", sa.LargeBinary, nullable=True),
+    )
+    op.alter_column(
+        "cached_data_sources", "normalized_data", existing_type=postgresql.JSONB, nullable=True
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM cached_data_sources WHERE normalized_data IS NULL")
+    op.alter_column(
+        "cached_data_sources", "normalized_data", existing_type=postgresql.JSONB, nullable=False
+    )
+    op.drop_column("cached_data_sources", "normalized_payload")
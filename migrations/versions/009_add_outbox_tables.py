@@ -0,0 +1,70 @@
+"""Add durable outbox tables for notifications
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19
+
+Notifications are written here before delivery, so pending and retrying
+deliveries survive a restart and can be dispatched by any API process:
+- outbox_messages: queued notifications of every outbox, by topic
+- outbox_alerts: monitoring alerts whose notifications are queued
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox_messages",
+        sa.Column("message_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("topic", sa.String(64), nullable=False),
+        sa.Column("partition", sa.String(255), nullable=False),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.Column("key", sa.String(512), nullable=True),
+        sa.Column("reference_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("attempts", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("claimed_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text, nullable=True),
+        sa.Column("payload", postgresql.JSONB, nullable=False, server_default="{}"),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "idx_outbox_messages_due",
+        "outbox_messages",
+        ["topic", "partition", "status", "next_attempt_at"],
+    )
+    op.create_index(
+        "idx_outbox_messages_key",
+        "outbox_messages",
+        ["topic", "key", "created_at"],
+    )
+    op.create_index("idx_outbox_messages_reference", "outbox_messages", ["reference_id"])
+    op.create_index("idx_outbox_messages_finished", "outbox_messages", ["topic", "finished_at"])
+
+    op.create_table(
+        "outbox_alerts",
+        sa.Column("alert_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("status", sa.String(32), nullable=False),
+        sa.Column("payload", postgresql.JSONB, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("outbox_alerts")
+    op.drop_index("idx_outbox_messages_finished", table_name="outbox_messages")
+    op.drop_index("idx_outbox_messages_reference", table_name="outbox_messages")
+    op.drop_index("idx_outbox_messages_key", table_name="outbox_messages")
+    op.drop_index("idx_outbox_messages_due", table_name="outbox_messages")
+    op.drop_table("outbox_messages")
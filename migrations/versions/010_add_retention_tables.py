@@ -0,0 +1,63 @@
+"""Add retention record and sweep tables
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19
+
+Retention records were only kept in memory, so their deadlines and legal
+holds were lost on restart:
+- retention_records: retention lifecycle of each tracked data item
+- retention_sweeps: checkpoints of retention sweeps, for resuming them
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "retention_records",
+        sa.Column("record_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("data_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("data_type", sa.String(64), nullable=False),
+        sa.Column("status", sa.String(32), nullable=False),
+        sa.Column("legal_hold", sa.Boolean, nullable=False, server_default=sa.false()),
+        sa.Column("expires_at", sa.DateTime, nullable=False),
+        sa.Column("archive_at", sa.DateTime, nullable=True),
+        sa.Column("claimed_until", sa.DateTime, nullable=True),
+        sa.Column("payload", postgresql.JSONB, nullable=False, server_default="{}"),
+    )
+    op.create_index("idx_retention_records_tenant", "retention_records", ["tenant_id"])
+    op.create_index("idx_retention_records_data", "retention_records", ["data_id"])
+    op.create_index(
+        "idx_retention_records_status_expiry", "retention_records", ["status", "expires_at"]
+    )
+    op.create_index(
+        "idx_retention_records_status_archive", "retention_records", ["status", "archive_at"]
+    )
+
+    op.create_table(
+        "retention_sweeps",
+        sa.Column("sweep_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("started_at", sa.DateTime, nullable=False),
+        sa.Column("payload", postgresql.JSONB, nullable=False),
+    )
+    op.create_index("idx_retention_sweeps_started", "retention_sweeps", ["started_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_retention_sweeps_started", table_name="retention_sweeps")
+    op.drop_table("retention_sweeps")
+    op.drop_index("idx_retention_records_status_archive", table_name="retention_records")
+    op.drop_index("idx_retention_records_status_expiry", table_name="retention_records")
+    op.drop_index("idx_retention_records_data", table_name="retention_records")
+    op.drop_index("idx_retention_records_tenant", table_name="retention_records")
+    op.drop_table("retention_records")
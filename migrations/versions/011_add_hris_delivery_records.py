@@ -0,0 +1,46 @@
+"""Add HRIS delivery record table
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+HRIS delivery history was only kept in memory, so it was lost on restart
+and could not be kept for its retention period:
+- hris_delivery_records: delivery attempts of HRIS updates and alerts
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "hris_delivery_records",
+        sa.Column("record_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("event_type", sa.String(64), nullable=False),
+        sa.Column("success", sa.Boolean, nullable=False),
+        sa.Column("attempted_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("payload", postgresql.JSONB, nullable=False, server_default="{}"),
+    )
+    op.create_index(
+        "idx_hris_delivery_records_tenant",
+        "hris_delivery_records",
+        ["tenant_id", "attempted_at"],
+    )
+    op.create_index(
+        "idx_hris_delivery_records_attempted", "hris_delivery_records", ["attempted_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_hris_delivery_records_attempted", table_name="hris_delivery_records")
+    op.drop_index("idx_hris_delivery_records_tenant", table_name="hris_delivery_records")
+    op.drop_table("hris_delivery_records")
@@ -0,0 +1,47 @@
+"""Add monitoring config column and history indexes to outbox alerts
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19
+
+Alert history is read from outbox_alerts instead of each process's memory:
+- outbox_alerts.monitoring_config_id: config the alert was raised for
+- indexes for listing alerts by config, by status and by age, and for
+  pruning them
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "outbox_alerts",
+        sa.Column("monitoring_config_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.execute(
+        "UPDATE outbox_alerts "
+        "SET monitoring_config_id = (payload->'alert'->>'monitoring_config_id')::uuid "
+        "WHERE payload->'alert'->>'monitoring_config_id' IS NOT NULL"
+    )
+    op.create_index(
+        "idx_outbox_alerts_config", "outbox_alerts", ["monitoring_config_id", "created_at"]
+    )
+    op.create_index("idx_outbox_alerts_status", "outbox_alerts", ["status", "created_at"])
+    op.create_index("idx_outbox_alerts_created", "outbox_alerts", ["created_at"])
+    op.create_index("idx_outbox_alerts_updated", "outbox_alerts", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_outbox_alerts_updated", table_name="outbox_alerts")
+    op.drop_index("idx_outbox_alerts_created", table_name="outbox_alerts")
+    op.drop_index("idx_outbox_alerts_status", table_name="outbox_alerts")
+    op.drop_index("idx_outbox_alerts_config", table_name="outbox_alerts")
+    op.drop_column("outbox_alerts", "monitoring_config_id")
@@ -1,29 +1,50 @@
 """LangGraph agent orchestration module."""
 
-from elile.agent.graph import iterative_search_graph, research_graph
-from elile.agent.state import (
-    AgentState,
-    EntityConnection,
-    Finding,
-    Inconsistency,
-    InconsistencyType,
-    InformationType,
-    IterativeSearchState,
-    KnowledgeBase,
-    Report,
-    RiskFinding,
-    SearchPhase,
-    SearchResult,
-    ServiceConfiguration,
-    ServiceTier,
-    SubjectInfo,
-    TypeProgress,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.agent.checkpointer import (
+        PostgresCheckpointSaver,
+        SaverStats,
+        create_checkpoint_saver,
+    )
+    from elile.agent.graph import (
+        compile_iterative_search_graph,
+        iterative_search_graph,
+        research_graph,
+    )
+    from elile.agent.state import (
+        AgentState,
+        EntityConnection,
+        Finding,
+        Inconsistency,
+        InconsistencyType,
+        InformationType,
+        IterativeSearchState,
+        KnowledgeBase,
+        Report,
+        RiskFinding,
+        SearchPhase,
+        SearchResult,
+        ServiceConfiguration,
+        ServiceTier,
+        SubjectInfo,
+        TypeProgress,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Graphs
     "iterative_search_graph",
     "research_graph",
+    "compile_iterative_search_graph",
+    # Checkpointing
+    "PostgresCheckpointSaver",
+    "SaverStats",
+    "create_checkpoint_saver",
     # New state models
     "Finding",
     "Inconsistency",
@@ -0,0 +1,714 @@
+"""Durable LangGraph checkpointer with per-channel delta storage.
+
+The iterative search graph accumulates findings, connections and type
+progress across hundreds of steps. The stock savers serialize every changed
+channel in full at every step, so per-step cost grows with the investigation.
+This saver stores each channel version as either a full snapshot or a delta
+against the previous version of the same channel:
+
+- APPEND: list channels whose previous items are unchanged (by identity),
+  which is what the append reducers in ``elile.agent.state`` produce.
+- MERGE: dict channels where only some keys changed, which is what the
+  ``type_progress`` merge reducer produces.
+
+Every ``max_delta_chain`` deltas a full snapshot is written so reads replay a
+bounded chain. Because nodes never mutate state in place, identity checks are
+sufficient to detect unchanged prefixes and keys.
+
+Delta bases for the most recently written channels are kept in a bounded LRU
+(``max_cached_channels``); a channel whose base was evicted is written as a
+full snapshot next time.
+
+The sync API (``invoke``/``stream``) runs the async methods on the event loop
+already driving the saver from another thread, or on a loop owned by the
+saver when it is only used synchronously.
+
+Example:
+    ```python
+    from elile.agent.checkpointer import create_checkpoint_saver
+    from elile.agent.graph import compile_iterative_search_graph
+
+    graph = compile_iterative_search_graph(checkpointer=create_checkpoint_saver())
+    config = {"configurable": {"thread_id": str(screening_id)}}
+    await graph.ainvoke(initial_state, config)
+
+    # After a crash, resume from the last checkpoint without replaying providers
+    await graph.ainvoke(None, config)
+    ```
+"""
+
+import asyncio
+import operator
+import random
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Coroutine, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_serializable_checkpoint_metadata,
+)
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from elile.core.logging import get_logger
+from elile.db.models.agent_checkpoint import (
+    AgentCheckpoint,
+    AgentCheckpointBlob,
+    AgentCheckpointWrite,
+    BlobEncoding,
+)
+
+logger = get_logger(__name__)
+
+_T = TypeVar("_T")
+
+_SYNC_FROM_LOOP = (
+    "Synchronous PostgresCheckpointSaver calls cannot run on the event loop that drives it; "
+    "use ainvoke/astream from async code"
+)
+
+
+@dataclass
+class _ChannelHead:
+    """Last persisted value of a channel, used as the base for the next delta."""
+
+    version: str
+    value: Any
+    chain_start: str
+    chain_length: int
+
+
+@dataclass
+class SaverStats:
+    """Write statistics for a :class:`PostgresCheckpointSaver`."""
+
+    checkpoints: int = 0
+    full_blobs: int = 0
+    delta_blobs: int = 0
+    blob_bytes: int = 0
+    last_checkpoint_bytes: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to dictionary."""
+        return {
+            "checkpoints": self.checkpoints,
+            "full_blobs": self.full_blobs,
+            "delta_blobs": self.delta_blobs,
+            "blob_bytes": self.blob_bytes,
+            "last_checkpoint_bytes": self.last_checkpoint_bytes,
+        }
+
+
+def _diff_channel(old: Any, new: Any) -> tuple[BlobEncoding, Any] | None:
+    """Compute a delta payload between two channel values, if one applies.
+
+    Args:
+        old: Previously persisted channel value.
+        new: Current channel value.
+
+    Returns:
+        Tuple of (encoding, payload), or None if a full snapshot is needed.
+    """
+    if isinstance(old, list) and isinstance(new, list):
+        n = len(old)
+        if n and len(new) >= n and all(map(operator.is_, old, new)):
+            return BlobEncoding.APPEND, new[n:]
+    elif isinstance(old, dict) and isinstance(new, dict):
+        changed = {k: v for k, v in new.items() if k not in old or old[k] is not v}
+        removed = [k for k in old if k not in new]
+        if len(changed) + len(removed) < len(new):
+            return BlobEncoding.MERGE, {"set": changed, "unset": removed}
+    return None
+
+
+def _apply_channel_delta(base: Any, encoding: str, payload: Any) -> Any:
+    """Apply a delta payload produced by :func:`_diff_channel`."""
+    if encoding == BlobEncoding.APPEND.value:
+        return [*base, *payload]
+    if encoding == BlobEncoding.MERGE.value:
+        merged = {k: v for k, v in base.items() if k not in payload["unset"]}
+        merged.update(payload["set"])
+        return merged
+    raise ValueError(f"Unknown blob encoding: {encoding}")
+
+
+class PostgresCheckpointSaver(BaseCheckpointSaver[str]):
+    """LangGraph checkpoint saver backed by SQLAlchemy async sessions.
+
+    Designed for PostgreSQL; only portable column types and upserts are
+    used, so it also runs against SQLite for tests.
+
+    Attributes:
+        session_factory: Factory for database sessions.
+        max_delta_chain: Deltas allowed before forcing a full snapshot.
+        max_cached_channels: Channel delta bases kept in memory.
+        stats: Write statistics.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        serde: SerializerProtocol | None = None,
+        max_delta_chain: int = 50,
+        max_cached_channels: int = 1024,
+    ) -> None:
+        """Initialize the saver.
+
+        Args:
+            session_factory: Factory for database sessions.
+            serde: Serializer for checkpoints and channel values.
+            max_delta_chain: Deltas allowed before forcing a full snapshot.
+            max_cached_channels: Channel delta bases kept in memory, least
+                recently written evicted first.
+        """
+        super().__init__(serde=serde)
+        self.session_factory = session_factory
+        self.max_delta_chain = max_delta_chain
+        self.max_cached_channels = max_cached_channels
+        self.stats = SaverStats()
+        self._heads: OrderedDict[tuple[str, str, str], _ChannelHead] = OrderedDict()
+        self._lock = asyncio.Lock()
+        # Loop running the async API, and the saver's own loop for sync-only use
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._sync_loop: asyncio.AbstractEventLoop | None = None
+        self._sync_loop_lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Versioning
+    # -------------------------------------------------------------------------
+
+    def get_next_version(self, current: str | None, channel: None) -> str:  # noqa: ARG002
+        """Generate a sortable channel version that is unique across forks."""
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # -------------------------------------------------------------------------
+    # Async API
+    # -------------------------------------------------------------------------
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Fetch a checkpoint tuple, the latest for the thread if no ID is given."""
+        self._loop = asyncio.get_running_loop()
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+
+        stmt = select(AgentCheckpoint).where(
+            AgentCheckpoint.thread_id == thread_id,
+            AgentCheckpoint.checkpoint_ns == checkpoint_ns,
+        )
+        if checkpoint_id := get_checkpoint_id(config):
+            stmt = stmt.where(AgentCheckpoint.checkpoint_id == checkpoint_id)
+        else:
+            stmt = stmt.order_by(AgentCheckpoint.checkpoint_id.desc()).limit(1)
+
+        async with self.session_factory() as session:
+            row = (await session.execute(stmt)).scalar_one_or_none()
+            if row is None:
+                return None
+            return await self._to_tuple(session, row, prime_heads=True)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """List checkpoints, newest first."""
+        self._loop = asyncio.get_running_loop()
+        stmt = select(AgentCheckpoint)
+        if config is not None:
+            configurable = config["configurable"]
+            stmt = stmt.where(AgentCheckpoint.thread_id == configurable["thread_id"])
+            if (checkpoint_ns := configurable.get("checkpoint_ns")) is not None:
+                stmt = stmt.where(AgentCheckpoint.checkpoint_ns == checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                stmt = stmt.where(AgentCheckpoint.checkpoint_id == checkpoint_id)
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            stmt = stmt.where(AgentCheckpoint.checkpoint_id < before_id)
+        stmt = stmt.order_by(AgentCheckpoint.checkpoint_id.desc())
+        if limit is not None and not filter:
+            stmt = stmt.limit(limit)
+
+        async with self.session_factory() as session:
+            rows = (await session.execute(stmt)).scalars().all()
+            remaining = limit
+            for row in rows:
+                if filter and not all(
+                    row.checkpoint_metadata.get(key) == value for key, value in filter.items()
+                ):
+                    continue
+                if remaining is not None:
+                    if remaining <= 0:
+                        break
+                    remaining -= 1
+                yield await self._to_tuple(session, row, prime_heads=False)
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Store a checkpoint, writing only changed channels as deltas where possible."""
+        self._loop = asyncio.get_running_loop()
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        parent_checkpoint_id = configurable.get("checkpoint_id")
+
+        stored = checkpoint.copy()
+        values: dict[str, Any] = stored.pop("channel_values")  # type: ignore[misc]
+
+        async with self._lock:
+            blob_rows: list[dict[str, Any]] = []
+            heads: dict[tuple[str, str, str], _ChannelHead | None] = {}
+            for channel, version in new_versions.items():
+                row, head = self._encode_channel(thread_id, checkpoint_ns, channel, version, values)
+                blob_rows.append(row)
+                heads[(thread_id, checkpoint_ns, channel)] = head
+
+            checkpoint_type, checkpoint_blob = self.serde.dumps_typed(stored)
+            checkpoint_row = {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+                "parent_checkpoint_id": parent_checkpoint_id,
+                "checkpoint_type": checkpoint_type,
+                "checkpoint": checkpoint_blob,
+                "checkpoint_metadata": get_serializable_checkpoint_metadata(config, metadata),
+            }
+
+            async with self.session_factory() as session:
+                if blob_rows:
+                    stmt = _insert(session, AgentCheckpointBlob).values(blob_rows)
+                    await session.execute(stmt.on_conflict_do_nothing())
+                stmt = _insert(session, AgentCheckpoint).values(**checkpoint_row)
+                await session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=["thread_id", "checkpoint_ns", "checkpoint_id"],
+                        set_={
+                            "checkpoint_type": stmt.excluded.checkpoint_type,
+                            "checkpoint": stmt.excluded.checkpoint,
+                            "metadata": stmt.excluded.metadata,
+                        },
+                    )
+                )
+                await session.commit()
+
+            # Only advance delta bases once the rows are durable
+            for key, head in heads.items():
+                if head is None:
+                    self._heads.pop(key, None)
+                else:
+                    self._remember_head(key, head)
+
+            blob_bytes = sum(len(row["blob"] or b"") for row in blob_rows)
+            self.stats.checkpoints += 1
+            self.stats.blob_bytes += blob_bytes
+            self.stats.last_checkpoint_bytes = blob_bytes + len(checkpoint_blob)
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store intermediate writes linked to a checkpoint."""
+        self._loop = asyncio.get_running_loop()
+        configurable = config["configurable"]
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            value_type, blob = self.serde.dumps_typed(value)
+            rows.append(
+                {
+                    "thread_id": configurable["thread_id"],
+                    "checkpoint_ns": configurable.get("checkpoint_ns", ""),
+                    "checkpoint_id": configurable["checkpoint_id"],
+                    "task_id": task_id,
+                    "idx": WRITES_IDX_MAP.get(channel, idx),
+                    "channel": channel,
+                    "value_type": value_type,
+                    "blob": blob,
+                    "task_path": task_path,
+                }
+            )
+        if not rows:
+            return
+
+        async with self.session_factory() as session:
+            stmt = _insert(session, AgentCheckpointWrite).values(rows)
+            if all(channel in WRITES_IDX_MAP for channel, _ in writes):
+                # Special writes (errors, interrupts) replace earlier ones
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[
+                        "thread_id",
+                        "checkpoint_ns",
+                        "checkpoint_id",
+                        "task_id",
+                        "idx",
+                    ],
+                    set_={
+                        "channel": stmt.excluded.channel,
+                        "value_type": stmt.excluded.value_type,
+                        "blob": stmt.excluded.blob,
+                    },
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing()
+            await session.execute(stmt)
+            await session.commit()
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints, blobs and writes for a thread."""
+        self._loop = asyncio.get_running_loop()
+        async with self._lock, self.session_factory() as session:
+            for model in (AgentCheckpointWrite, AgentCheckpointBlob, AgentCheckpoint):
+                await session.execute(delete(model).where(model.thread_id == thread_id))
+            await session.commit()
+            for key in [k for k in self._heads if k[0] == thread_id]:
+                del self._heads[key]
+
+    # -------------------------------------------------------------------------
+    # Sync API
+    # -------------------------------------------------------------------------
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Fetch a checkpoint tuple; see :meth:`aget_tuple`."""
+        return self._run_sync(self.aget_tuple(config))
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints, newest first; see :meth:`alist`."""
+
+        async def collect() -> list[CheckpointTuple]:
+            return [t async for t in self.alist(config, filter=filter, before=before, limit=limit)]
+
+        return iter(self._run_sync(collect()))
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Store a checkpoint; see :meth:`aput`."""
+        return self._run_sync(self.aput(config, checkpoint, metadata, new_versions))
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store intermediate writes; see :meth:`aput_writes`."""
+        self._run_sync(self.aput_writes(config, writes, task_id, task_path))
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete a thread; see :meth:`adelete_thread`."""
+        self._run_sync(self.adelete_thread(thread_id))
+
+    def _run_sync(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run an async method to completion from synchronous code.
+
+        Raises:
+            asyncio.InvalidStateError: If called on the loop running the saver,
+                which would deadlock.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed() or not loop.is_running():
+            loop = self._get_sync_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise asyncio.InvalidStateError(_SYNC_FROM_LOOP)
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def _get_sync_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the saver's own event loop, starting it in a daemon thread."""
+        with self._sync_loop_lock:
+            if self._sync_loop is None or self._sync_loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="checkpoint-saver-loop", daemon=True
+                ).start()
+                self._sync_loop = loop
+            return self._sync_loop
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _remember_head(self, key: tuple[str, str, str], head: _ChannelHead) -> None:
+        """Store a channel delta base, evicting the least recently written."""
+        self._heads[key] = head
+        self._heads.move_to_end(key)
+        while len(self._heads) > self.max_cached_channels:
+            self._heads.popitem(last=False)
+
+    def _encode_channel(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        channel: str,
+        version: str | int | float,
+        values: dict[str, Any],
+    ) -> tuple[dict[str, Any], _ChannelHead | None]:
+        """Encode one channel version as a full or delta blob row."""
+        version_key = str(version)
+        row: dict[str, Any] = {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "channel": channel,
+            "version": version_key,
+            "base_version": None,
+            "chain_start": version_key,
+        }
+
+        if channel not in values:
+            row.update(encoding=BlobEncoding.EMPTY.value, value_type="empty", blob=None)
+            return row, None
+
+        value = values[channel]
+        head = self._heads.get((thread_id, checkpoint_ns, channel))
+        delta = None
+        if head is not None and head.chain_length < self.max_delta_chain:
+            delta = _diff_channel(head.value, value)
+
+        if delta is None or head is None:
+            value_type, blob = self.serde.dumps_typed(value)
+            row.update(encoding=BlobEncoding.FULL.value, value_type=value_type, blob=blob)
+            self.stats.full_blobs += 1
+            return row, _ChannelHead(version_key, value, version_key, 0)
+
+        encoding, payload = delta
+        value_type, blob = self.serde.dumps_typed(payload)
+        row.update(
+            encoding=encoding.value,
+            value_type=value_type,
+            blob=blob,
+            base_version=head.version,
+            chain_start=head.chain_start,
+        )
+        self.stats.delta_blobs += 1
+        return row, _ChannelHead(version_key, value, head.chain_start, head.chain_length + 1)
+
+    async def _load_channel_values(
+        self,
+        session: AsyncSession,
+        thread_id: str,
+        checkpoint_ns: str,
+        versions: ChannelVersions,
+    ) -> dict[str, _ChannelHead]:
+        """Load channel values, replaying delta chains where needed."""
+        if not versions:
+            return {}
+
+        wanted = {channel: str(version) for channel, version in versions.items()}
+        base = select(AgentCheckpointBlob).where(
+            AgentCheckpointBlob.thread_id == thread_id,
+            AgentCheckpointBlob.checkpoint_ns == checkpoint_ns,
+        )
+        rows = (
+            (
+                await session.execute(
+                    base.where(
+                        AgentCheckpointBlob.channel.in_(wanted),
+                        AgentCheckpointBlob.version.in_(set(wanted.values())),
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+        targets = {row.channel: row for row in rows if wanted.get(row.channel) == row.version}
+
+        # Fetch the rest of every delta chain in one query
+        chains: dict[str, dict[str, AgentCheckpointBlob]] = {}
+        delta_targets = [row for row in targets.values() if row.base_version is not None]
+        if delta_targets:
+            chain_rows = (
+                (
+                    await session.execute(
+                        base.where(
+                            or_(
+                                *(
+                                    (AgentCheckpointBlob.channel == row.channel)
+                                    & (AgentCheckpointBlob.chain_start == row.chain_start)
+                                    for row in delta_targets
+                                )
+                            )
+                        )
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            for row in chain_rows:
+                chains.setdefault(row.channel, {})[row.version] = row
+
+        loaded: dict[str, _ChannelHead] = {}
+        for channel, row in targets.items():
+            if row.encoding == BlobEncoding.EMPTY.value:
+                continue
+            chain = [row]
+            while chain[-1].base_version is not None:
+                chain.append(chains[channel][chain[-1].base_version])
+            value = self.serde.loads_typed((chain[-1].value_type, chain[-1].blob))
+            for delta_row in reversed(chain[:-1]):
+                payload = self.serde.loads_typed((delta_row.value_type, delta_row.blob))
+                value = _apply_channel_delta(value, delta_row.encoding, payload)
+            loaded[channel] = _ChannelHead(row.version, value, row.chain_start, len(chain) - 1)
+        return loaded
+
+    async def _to_tuple(
+        self,
+        session: AsyncSession,
+        row: AgentCheckpoint,
+        prime_heads: bool,
+    ) -> CheckpointTuple:
+        """Build a checkpoint tuple from a checkpoint row."""
+        checkpoint: Checkpoint = self.serde.loads_typed((row.checkpoint_type, row.checkpoint))
+        loaded = await self._load_channel_values(
+            session, row.thread_id, row.checkpoint_ns, checkpoint["channel_versions"]
+        )
+        channel_values = {channel: head.value for channel, head in loaded.items()}
+
+        if prime_heads:
+            # Values handed back to the graph become the next delta bases
+            async with self._lock:
+                for channel, loaded_head in loaded.items():
+                    key = (row.thread_id, row.checkpoint_ns, channel)
+                    head = self._heads.get(key)
+                    if head is None or head.version != loaded_head.version:
+                        self._remember_head(key, loaded_head)
+
+        writes = (
+            (
+                await session.execute(
+                    select(AgentCheckpointWrite)
+                    .where(
+                        AgentCheckpointWrite.thread_id == row.thread_id,
+                        AgentCheckpointWrite.checkpoint_ns == row.checkpoint_ns,
+                        AgentCheckpointWrite.checkpoint_id == row.checkpoint_id,
+                    )
+                    .order_by(
+                        AgentCheckpointWrite.task_path,
+                        AgentCheckpointWrite.task_id,
+                        AgentCheckpointWrite.idx,
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": row.thread_id,
+                    "checkpoint_ns": row.checkpoint_ns,
+                    "checkpoint_id": row.checkpoint_id,
+                }
+            },
+            checkpoint={**checkpoint, "channel_values": channel_values},
+            metadata=row.checkpoint_metadata,
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": row.thread_id,
+                        "checkpoint_ns": row.checkpoint_ns,
+                        "checkpoint_id": row.parent_checkpoint_id,
+                    }
+                }
+                if row.parent_checkpoint_id
+                else None
+            ),
+            pending_writes=[
+                (
+                    write.task_id,
+                    write.channel,
+                    self.serde.loads_typed((write.value_type, write.blob)),
+                )
+                for write in writes
+            ],
+        )
+
+
+def _insert(session: AsyncSession, model: type) -> Any:
+    """Get a dialect-specific INSERT supporting ON CONFLICT clauses."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return pg_insert(model)
+    if dialect == "sqlite":
+        return sqlite_insert(model)
+    raise NotImplementedError(f"Unsupported checkpoint database dialect: {dialect}")
+
+
+def create_checkpoint_saver(
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+    max_delta_chain: int = 50,
+    max_cached_channels: int = 1024,
+) -> PostgresCheckpointSaver:
+    """Create a durable checkpoint saver.
+
+    Args:
+        session_factory: Session factory. Defaults to the application's.
+        max_delta_chain: Deltas allowed before forcing a full snapshot.
+        max_cached_channels: Channel delta bases kept in memory.
+
+    Returns:
+        Configured PostgresCheckpointSaver.
+    """
+    if session_factory is None:
+        from elile.db.config import AsyncSessionLocal
+
+        session_factory = AsyncSessionLocal
+
+    return PostgresCheckpointSaver(
+        session_factory,
+        max_delta_chain=max_delta_chain,
+        max_cached_channels=max_cached_channels,
+    )
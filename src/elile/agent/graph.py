@@ -9,13 +9,20 @@ Phases:
 3. INTELLIGENCE (parallel): adverse_media, digital_footprint (Enhanced only)
 4. NETWORK (sequential by degree): D1 -> D2 -> D3 (Enhanced only)
 5. RECONCILIATION: Process inconsistency queue, generate risk findings
+
+By default types run one at a time. With ``parallel_types=True`` the graph
+fans out one SAR loop per pending type with ``Send`` and joins them before
+moving on, so a parallel phase takes as long as its slowest type.
 """
 
 from __future__ import annotations
 
 from typing import Literal
 
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, StateGraph
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import Send
 
 from elile.agent.nodes import (
     assess_type,
@@ -23,12 +30,14 @@ from elile.agent.nodes import (
     initialize_search,
     process_reconciliation,
     refine_decision,
+    run_type_sar_loop,
     search_type,
     transition_to_next_phase,
     transition_to_next_type,
 )
 from elile.agent.state import (
     PHASE_TYPES,
+    SEQUENTIAL_PHASES,
     InformationType,
     IterativeSearchState,
     SearchPhase,
@@ -169,17 +178,62 @@ def route_reconciliation(
     return "compile"
 
 
+def route_type_fan_out(
+    state: IterativeSearchState,
+) -> list[Send] | Literal["next_phase", "reconciliation", "compile"]:
+    """Fan out the pending types of the current phase (parallel mode).
+
+    Sequential phases send one type at a time; other phases send every
+    pending type at once. Each send runs a complete SAR loop for its type.
+
+    Args:
+        state: Current workflow state.
+
+    Returns:
+        Sends to the type worker, "next_phase" when the phase is done, or
+        the reconciliation route once all search phases have run.
+    """
+    current_phase = state.get("current_phase")
+    if current_phase is None or current_phase == SearchPhase.RECONCILIATION:
+        return route_reconciliation(state)
+
+    type_progress = state.get("type_progress", {})
+    service_config = state.get("service_config")
+    pending = [
+        info_type
+        for info_type in PHASE_TYPES.get(current_phase, [])
+        if (service_config is None or service_config.is_type_enabled(info_type))
+        and (
+            info_type.value not in type_progress
+            or type_progress[info_type.value].status == "pending"
+        )
+    ]
+
+    if not pending:
+        return "next_phase"
+    if current_phase in SEQUENTIAL_PHASES:
+        pending = pending[:1]
+
+    return [Send("type_worker", {**state, "current_type": info_type}) for info_type in pending]
+
+
 # =============================================================================
 # Workflow Graph Construction
 # =============================================================================
 
 
-def create_iterative_search_graph() -> StateGraph:
+def create_iterative_search_graph(parallel_types: bool = False) -> StateGraph:
     """Create the iterative search workflow graph.
 
+    Args:
+        parallel_types: Run the types of a phase concurrently via fan-out.
+
     Returns:
-        Compiled LangGraph workflow.
+        Uncompiled LangGraph workflow.
     """
+    if parallel_types:
+        return _create_parallel_search_graph()
+
     workflow = StateGraph(IterativeSearchState)
 
     # ==========================================================================
@@ -261,6 +315,61 @@ def create_iterative_search_graph() -> StateGraph:
     return workflow
 
 
+def _create_parallel_search_graph() -> StateGraph:
+    """Create the fan-out/fan-in variant of the iterative search graph.
+
+    ``next_phase`` and ``next_type`` both route through
+    ``route_type_fan_out``; ``next_type`` acts as the join, running once
+    after every type worker in the superstep has finished.
+    """
+    workflow = StateGraph(IterativeSearchState)
+
+    workflow.add_node("initialize", initialize_search)
+    workflow.add_node("type_worker", run_type_sar_loop)
+    workflow.add_node("next_type", transition_to_next_type)
+    workflow.add_node("next_phase", transition_to_next_phase)
+    workflow.add_node("reconciliation", process_reconciliation)
+    workflow.add_node("compile_report", compile_report)
+
+    fan_out_map = {
+        "type_worker": "type_worker",
+        "next_phase": "next_phase",
+        "reconciliation": "reconciliation",
+        "compile": "compile_report",
+    }
+
+    workflow.set_entry_point("initialize")
+    workflow.add_edge("initialize", "next_phase")
+    workflow.add_conditional_edges("next_phase", route_type_fan_out, fan_out_map)
+    workflow.add_edge("type_worker", "next_type")
+    workflow.add_conditional_edges("next_type", route_type_fan_out, fan_out_map)
+    workflow.add_edge("reconciliation", "compile_report")
+    workflow.add_edge("compile_report", END)
+
+    return workflow
+
+
+def compile_iterative_search_graph(
+    checkpointer: BaseCheckpointSaver | None = None,
+    parallel_types: bool = False,
+) -> CompiledStateGraph:
+    """Compile the iterative search graph, optionally with durable checkpoints.
+
+    With a checkpointer, every step is persisted under the ``thread_id`` in
+    the run config, and an interrupted investigation resumes by invoking the
+    graph again with ``None`` input and the same config.
+
+    Args:
+        checkpointer: Checkpoint saver, e.g. from
+            ``elile.agent.checkpointer.create_checkpoint_saver``.
+        parallel_types: Run the types of a phase concurrently via fan-out.
+
+    Returns:
+        Compiled LangGraph workflow.
+    """
+    return create_iterative_search_graph(parallel_types).compile(checkpointer=checkpointer)
+
+
 # Create and compile the main workflow
 iterative_search_graph = create_iterative_search_graph().compile()
 
@@ -295,7 +404,9 @@ try:
     legacy_workflow.add_node("analyze_findings", analyze_findings)
     legacy_workflow.add_node("map_connections", map_connections)
     legacy_workflow.add_node("evaluate_continuation", evaluate_continuation)
-    legacy_workflow.add_node("compile_report", legacy_compile_report)
+    # The shared report node is typed for IterativeSearchState, whose
+    # accumulating channels use reducers; read it through the legacy schema.
+    legacy_workflow.add_node("compile_report", legacy_compile_report, input_schema=AgentState)
 
     # Define the workflow edges
     legacy_workflow.set_entry_point("initialize")
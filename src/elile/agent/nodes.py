@@ -23,6 +23,10 @@ from elile.agent.state import (
     ServiceConfiguration,
     SubjectInfo,
     TypeProgress,
+    append_items,
+    merge_inconsistencies,
+    merge_knowledge_base,
+    merge_type_progress,
 )
 from elile.config.settings import get_settings
 from elile.risk.inconsistency import InconsistencyAnalyzer
@@ -187,20 +191,25 @@ async def search_type(state: IterativeSearchState) -> dict:
 
     results: list[SearchResult] = []
 
-    # Update type progress
-    if type_key in type_progress:
-        updated_progress = type_progress[type_key].model_copy()
-        updated_progress.status = "in_progress"
-        updated_progress.iterations = current_iteration + 1
-        updated_progress.queries_executed = len(final_queries)
-        type_progress[type_key] = updated_progress
-
-    return {
+    updates: dict = {
         "current_queries": [q.query for q in final_queries],
         "current_results": results,
-        "type_progress": type_progress,
     }
 
+    # Update type progress (merged into state by the type_progress reducer)
+    if progress is not None:
+        updates["type_progress"] = {
+            type_key: progress.model_copy(
+                update={
+                    "status": "in_progress",
+                    "iterations": current_iteration + 1,
+                    "queries_executed": len(final_queries),
+                }
+            )
+        }
+
+    return updates
+
 
 async def assess_type(state: IterativeSearchState) -> dict:
     """ASSESS phase of the SAR loop.
@@ -223,9 +232,6 @@ async def assess_type(state: IterativeSearchState) -> dict:
     current_queries = state.get("current_queries", [])
     type_progress = state.get("type_progress", {})
     knowledge_base = state.get("knowledge_base", KnowledgeBase())
-    all_findings = state.get("all_findings", [])
-    inconsistency_queue = state.get("inconsistency_queue", [])
-    entity_queue = state.get("entity_queue", [])
 
     if current_type is None:
         return {}
@@ -262,16 +268,19 @@ async def assess_type(state: IterativeSearchState) -> dict:
     result_count = len(current_results)
     confidence = min(0.95, 0.3 + (result_count * 0.1) + (len(new_findings) * 0.05))
 
-    # Update type progress
+    # Update type progress (copies lists rather than extending shared ones)
+    progress_updates: dict = {}
     if progress:
-        updated_progress = progress.model_copy()
-        updated_progress.findings.extend(new_findings)
-        updated_progress.gaps = gaps
-        updated_progress.discovered_entities.extend(discovered_entities)
-        updated_progress.results_received = result_count
-        updated_progress.info_gain_rate = info_gain
-        updated_progress.confidence = confidence
-        type_progress[type_key] = updated_progress
+        progress_updates[type_key] = progress.model_copy(
+            update={
+                "findings": [*progress.findings, *new_findings],
+                "gaps": gaps,
+                "discovered_entities": [*progress.discovered_entities, *discovered_entities],
+                "results_received": result_count,
+                "info_gain_rate": info_gain,
+                "confidence": confidence,
+            }
+        )
 
     # Update knowledge base based on type
     knowledge_base = _update_knowledge_base(current_type, knowledge_base, new_findings)
@@ -285,14 +294,15 @@ async def assess_type(state: IterativeSearchState) -> dict:
         info_gain=info_gain,
     )
 
+    # Accumulating channels take only the new items; see IterativeSearchState
     return {
-        "type_progress": type_progress,
+        "type_progress": progress_updates,
         "knowledge_base": knowledge_base,
         "iteration_findings": new_findings,
         "iteration_info_gain": info_gain,
-        "all_findings": all_findings + new_findings,
-        "inconsistency_queue": inconsistency_queue + new_inconsistencies,
-        "entity_queue": entity_queue + discovered_entities,
+        "all_findings": new_findings,
+        "inconsistency_queue": new_inconsistencies,
+        "entity_queue": discovered_entities,
     }
 
 
@@ -352,10 +362,9 @@ async def refine_decision(state: IterativeSearchState) -> dict:
 
     if completion_reason:
         # Mark type as complete
-        updated_progress = progress.model_copy()
-        updated_progress.status = "complete"
-        updated_progress.completion_reason = completion_reason
-        type_progress[type_key] = updated_progress
+        updated_progress = progress.model_copy(
+            update={"status": "complete", "completion_reason": completion_reason}
+        )
 
         logger.info(
             "Type complete",
@@ -366,7 +375,7 @@ async def refine_decision(state: IterativeSearchState) -> dict:
         )
 
         return {
-            "type_progress": type_progress,
+            "type_progress": {type_key: updated_progress},
             "current_iteration": 0,  # Reset for next type
         }
     else:
@@ -384,6 +393,79 @@ async def refine_decision(state: IterativeSearchState) -> dict:
         }
 
 
+# =============================================================================
+# Parallel Type Worker
+# =============================================================================
+
+# Reducers for the channels a type worker may update, mirroring the
+# annotations on IterativeSearchState.
+_TYPE_WORKER_REDUCERS = {
+    "type_progress": merge_type_progress,
+    "knowledge_base": merge_knowledge_base,
+    "inconsistency_queue": merge_inconsistencies,
+    "all_findings": append_items,
+    "risk_findings": append_items,
+    "connections": append_items,
+    "entity_queue": append_items,
+}
+
+
+async def run_type_sar_loop(state: IterativeSearchState) -> dict:
+    """Run the complete SAR loop for a single information type.
+
+    Used by the parallel workflow, which sends one copy of the state per
+    pending type in a phase with ``current_type`` set. The loop runs
+    search/assess/refine against a private view of the state and returns
+    only the accumulated updates to reducer-backed channels, so results
+    from types running concurrently merge without conflicts. Knowledge
+    base changes are returned as a delta against the fan-out state.
+
+    Args:
+        state: Workflow state with ``current_type`` set to the type to run.
+
+    Returns:
+        State updates accumulated over all iterations for the type.
+    """
+    current_type = state.get("current_type")
+    if current_type is None:
+        return {}
+
+    type_key = current_type.value
+    local: dict = {**state, "current_iteration": 0}
+    updates: dict = {}
+
+    while True:
+        for node in (search_type, assess_type, refine_decision):
+            for key, value in (await node(local)).items():
+                reducer = _TYPE_WORKER_REDUCERS.get(key)
+                if reducer is None:
+                    local[key] = value
+                else:
+                    local[key] = reducer(local.get(key), value)
+                    updates[key] = reducer(updates.get(key), value)
+
+        progress = local.get("type_progress", {}).get(type_key)
+        if progress is None or progress.status == "complete":
+            break
+
+    # Other types in the phase started from the same knowledge base, so
+    # return only what this type changed rather than its full copy.
+    updates.pop("knowledge_base", None)
+    base = state.get("knowledge_base") or KnowledgeBase()
+    knowledge_base = local.get("knowledge_base")
+    if knowledge_base is not None and knowledge_base != base:
+        updates["knowledge_base"] = knowledge_base.diff(base)
+
+    logger.info(
+        "Type SAR loop complete",
+        info_type=type_key,
+        iterations=progress.iterations if progress else 0,
+        new_findings=len(updates.get("all_findings", [])),
+    )
+
+    return updates
+
+
 # =============================================================================
 # Phase Transition Nodes
 # =============================================================================
@@ -520,7 +602,6 @@ async def process_reconciliation(state: IterativeSearchState) -> dict:
         State updates with reconciliation results.
     """
     inconsistency_queue = state.get("inconsistency_queue", [])
-    risk_findings = state.get("risk_findings", [])
 
     settings = get_settings()
     config = settings.iterative_search
@@ -541,13 +622,22 @@ async def process_reconciliation(state: IterativeSearchState) -> dict:
 
     new_risk_findings = analyzer.analyze_patterns(inconsistency_queue)
 
-    # Auto-resolve low severity if configured
+    # Auto-resolve low severity if configured (resolved copies, not in place)
     if config.auto_resolve_low_severity:
-        for inc in inconsistency_queue:
-            if inc.risk_severity == "low" and not inc.resolved:
-                inc.resolved = True
-                inc.resolution = "Auto-resolved as low severity"
-                inc.resolution_outcome = "explained"
+        inconsistency_queue = [
+            (
+                inc.model_copy(
+                    update={
+                        "resolved": True,
+                        "resolution": "Auto-resolved as low severity",
+                        "resolution_outcome": "explained",
+                    }
+                )
+                if inc.risk_severity == "low" and not inc.resolved
+                else inc
+            )
+            for inc in inconsistency_queue
+        ]
 
     logger.info(
         "Reconciliation complete",
@@ -557,7 +647,7 @@ async def process_reconciliation(state: IterativeSearchState) -> dict:
 
     return {
         "inconsistency_queue": inconsistency_queue,
-        "risk_findings": risk_findings + new_risk_findings,
+        "risk_findings": new_risk_findings,
     }
 
 
@@ -8,7 +8,6 @@ from uuid import UUID, uuid7
 from langgraph.graph.message import add_messages
 from pydantic import BaseModel, Field
 
-
 # =============================================================================
 # Core Search Models
 # =============================================================================
@@ -129,6 +128,14 @@ PHASE_TYPES: dict[SearchPhase, list[InformationType]] = {
     ],
 }
 
+# Phases whose types depend on earlier types in the same phase (foundation
+# types enrich each other; D3 expands entities found in D2). Other phases
+# can run their types concurrently.
+SEQUENTIAL_PHASES: set[SearchPhase] = {
+    SearchPhase.FOUNDATION,
+    SearchPhase.NETWORK,
+}
+
 # Types that require Enhanced tier
 ENHANCED_ONLY_TYPES: set[InformationType] = {
     InformationType.DIGITAL_FOOTPRINT,
@@ -343,6 +350,73 @@ class KnowledgeBase(BaseModel):
             if address.state and address.state not in self.known_states:
                 self.known_states.append(address.state)
 
+    def diff(self, base: "KnowledgeBase") -> "KnowledgeBaseDelta":
+        """Describe the changes made to ``base`` to arrive at this knowledge base.
+
+        Args:
+            base: Knowledge base this one was derived from.
+
+        Returns:
+            Delta holding the list items added and removed and the scalar
+            facts set since ``base``.
+        """
+        added: dict = {}
+        removed: dict = {}
+        changed: list[str] = []
+        for name in type(self).model_fields:
+            mine = getattr(self, name)
+            before = getattr(base, name)
+            if isinstance(mine, list):
+                added[name] = [item for item in mine if item not in before]
+                removed[name] = [item for item in before if item not in mine]
+            elif mine != before:
+                added[name] = mine
+                changed.append(name)
+        return KnowledgeBaseDelta(
+            added=KnowledgeBase(**added),
+            removed=KnowledgeBase(**removed),
+            changed=changed,
+        )
+
+    def apply(self, delta: "KnowledgeBaseDelta") -> "KnowledgeBase":
+        """Apply changes made by a concurrent branch to this knowledge base.
+
+        Only what the branch changed is applied, so facts another branch set
+        or removed in the meantime are kept as they are.
+
+        Args:
+            delta: Changes returned by :meth:`diff`.
+
+        Returns:
+            New knowledge base, or ``self`` if the delta changes nothing.
+        """
+        updates: dict = {}
+        for name in type(self).model_fields:
+            mine = getattr(self, name)
+            if isinstance(mine, list):
+                removed = getattr(delta.removed, name)
+                kept = [item for item in mine if item not in removed]
+                extra = [item for item in getattr(delta.added, name) if item not in kept]
+                if extra or len(kept) != len(mine):
+                    updates[name] = [*kept, *extra]
+            elif name in delta.changed and getattr(delta.added, name) != mine:
+                updates[name] = getattr(delta.added, name)
+        return self.model_copy(update=updates) if updates else self
+
+
+class KnowledgeBaseDelta(BaseModel):
+    """Changes a concurrent type made to the knowledge base it fanned out with.
+
+    Types in a parallel phase all start from the same knowledge base, so
+    they return deltas rather than full copies; merging full copies would
+    let a stale branch overwrite facts set by another branch or bring back
+    items another branch removed.
+    """
+
+    added: KnowledgeBase = Field(default_factory=KnowledgeBase)  # New items and set scalars
+    removed: KnowledgeBase = Field(default_factory=KnowledgeBase)  # List items only
+    changed: list[str] = Field(default_factory=list)  # Scalar fields set in ``added``
+
 
 # =============================================================================
 # Subject and Service Configuration
@@ -459,11 +533,71 @@ class Report(BaseModel):
 # =============================================================================
 
 
+def append_items(existing: list | None, new: list | None) -> list:
+    """Reducer that appends node output to an accumulated list.
+
+    Returns a new list that shares the existing items, so checkpoints can
+    store only the appended suffix.
+    """
+    return [*(existing or []), *(new or [])]
+
+
+def merge_type_progress(
+    existing: dict[str, TypeProgress] | None,
+    updates: dict[str, TypeProgress] | None,
+) -> dict[str, TypeProgress]:
+    """Reducer that merges per-type progress updates by type key.
+
+    Returns a new dict, so checkpoints can store only the changed types.
+    """
+    return {**(existing or {}), **(updates or {})}
+
+
+def merge_knowledge_base(
+    existing: KnowledgeBase | None,
+    new: KnowledgeBase | KnowledgeBaseDelta | None,
+) -> KnowledgeBase:
+    """Reducer for knowledge base updates.
+
+    A full knowledge base (returned by nodes that read the current state)
+    replaces the existing one. A delta (returned by concurrent types) is
+    applied on top of it, so each type only contributes what it changed.
+    """
+    if new is None:
+        return existing if existing is not None else KnowledgeBase()
+    if isinstance(new, KnowledgeBaseDelta):
+        return (existing if existing is not None else KnowledgeBase()).apply(new)
+    return existing if new == existing else new
+
+
+def merge_inconsistencies(
+    existing: list[Inconsistency] | None,
+    updates: list[Inconsistency] | None,
+) -> list[Inconsistency]:
+    """Reducer that upserts inconsistencies by ``inconsistency_id``.
+
+    New inconsistencies are appended; updated copies (e.g. resolved during
+    reconciliation) replace the entry with the same ID in place.
+    """
+    if not updates:
+        return existing or []
+    by_id = {inc.inconsistency_id: inc for inc in updates}
+    merged = [by_id.pop(inc.inconsistency_id, inc) for inc in existing or []]
+    merged.extend(by_id.values())
+    return merged
+
+
 class IterativeSearchState(TypedDict):
     """Extended state for iterative search process.
 
     This is the main state object for the LangGraph workflow, supporting
     phased search with cross-type knowledge accumulation.
+
+    Accumulating fields use reducers: nodes return only new items (or only
+    the changed ``type_progress`` entries) and must never mutate state in
+    place, which keeps checkpoint deltas small and correct. The same
+    reducers merge the results of types that run concurrently within a
+    phase.
     """
 
     # Message history (for LangGraph)
@@ -476,14 +610,16 @@ class IterativeSearchState(TypedDict):
     # Phase tracking
     current_phase: SearchPhase
     current_type: InformationType | None
-    type_progress: dict[str, TypeProgress]  # Keyed by InformationType.value
+    type_progress: Annotated[
+        dict[str, TypeProgress], merge_type_progress
+    ]  # Keyed by InformationType.value
 
     # Cross-type knowledge base (grows as types complete)
-    knowledge_base: KnowledgeBase
+    knowledge_base: Annotated[KnowledgeBase, merge_knowledge_base]
 
     # Queues for later phases
-    inconsistency_queue: list[Inconsistency]
-    entity_queue: list[Entity]  # Discovered entities for D2/D3
+    inconsistency_queue: Annotated[list[Inconsistency], merge_inconsistencies]
+    entity_queue: Annotated[list[Entity], append_items]  # Discovered entities for D2/D3
 
     # Current iteration state (within a single type's SAR loop)
     current_iteration: int
@@ -493,9 +629,9 @@ class IterativeSearchState(TypedDict):
     iteration_info_gain: float  # New facts / queries this iteration
 
     # Outputs (accumulated across all phases)
-    all_findings: list[Finding]
-    risk_findings: list[RiskFinding]
-    connections: list[EntityConnection]
+    all_findings: Annotated[list[Finding], append_items]
+    risk_findings: Annotated[list[RiskFinding], append_items]
+    connections: Annotated[list[EntityConnection], append_items]
 
     # Final output
     final_report: Report | None
@@ -1,5 +1,12 @@
 """FastAPI application for Elile employee risk assessment platform."""
 
-from .app import create_app
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .app import create_app
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = ["create_app"]
@@ -79,6 +79,15 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     # Include routers
     _configure_routers(app)
 
+    # Load provider reference data here, not in the lifespan: served by
+    # gunicorn with preload_app (see gunicorn_conf), the factory runs once
+    # in the master and the workers forked from it share the data.
+    # uvicorn --workers spawns its workers, so each loads its own copy
+    if settings.REFERENCE_DATA_PRELOAD:
+        from elile.providers.reference_data import preload_reference_data
+
+        preload_reference_data()
+
     return app
 
 
@@ -122,10 +131,12 @@ async def _lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.warning(f"Observability initialization error: {e}")
 
     # Initialize database connection pool
+    database_ready = False
     try:
         from elile.db.config import init_db
 
         await init_db()
+        database_ready = True
         logger.info("Database connection pool initialized")
 
         # Instrument SQLAlchemy if tracing is enabled
@@ -142,11 +153,96 @@ async def _lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning(f"Database initialization skipped: {e}")
 
+    # Start the buffered audit writer
+    settings = getattr(app.state, "settings", None)
+    if settings is not None and settings.AUDIT_BUFFERED:
+        try:
+            from pathlib import Path
+
+            from elile.core.audit_writer import AuditWriterConfig, start_audit_writer
+
+            spool_path = settings.AUDIT_SPOOL_PATH
+            await start_audit_writer(
+                AuditWriterConfig(
+                    max_batch_size=settings.AUDIT_BATCH_SIZE,
+                    flush_interval=settings.AUDIT_FLUSH_INTERVAL,
+                    spool_path=Path(spool_path) if spool_path else None,
+                )
+            )
+            logger.info("Buffered audit writer started")
+        except Exception as e:
+            logger.warning(f"Buffered audit writer not started: {e}")
+
+    # Dispatch notification outboxes in the background
+    if settings is not None and settings.OUTBOX_DISPATCH_ENABLED and database_ready:
+        try:
+            from elile.api.routers.v1.dashboard import configure_alert_generator
+            from elile.core.outbox import OutboxDispatcherConfig, start_outbox_dispatcher
+            from elile.db.config import AsyncSessionLocal
+            from elile.monitoring.alert_generator import create_alert_generator
+            from elile.monitoring.alert_outbox import SQLAlchemyAlertOutbox
+
+            alert_outbox = SQLAlchemyAlertOutbox(AsyncSessionLocal)
+            alert_generator = create_alert_generator(
+                include_mock_channels=True, outbox=alert_outbox
+            )
+            configure_alert_generator(alert_generator)
+
+            dispatcher = await start_outbox_dispatcher(
+                OutboxDispatcherConfig(
+                    interval=settings.OUTBOX_DISPATCH_INTERVAL,
+                    retention_hours=settings.OUTBOX_RETENTION_HOURS,
+                )
+            )
+            dispatcher.register(
+                alert_outbox.topic, alert_generator.dispatch_outbox, alert_outbox.prune
+            )
+
+            from elile.api.routers.v1.hris_webhook import (
+                configure_result_publisher,
+                get_hris_gateway,
+            )
+            from elile.hris.outbound_queue import (
+                SQLAlchemyDeliveryHistoryStore,
+                SQLAlchemyOutboundQueue,
+            )
+            from elile.hris.result_publisher import create_result_publisher
+
+            hris_queue = SQLAlchemyOutboundQueue(AsyncSessionLocal)
+            result_publisher = create_result_publisher(
+                gateway=get_hris_gateway(),
+                queue=hris_queue,
+                history_store=SQLAlchemyDeliveryHistoryStore(AsyncSessionLocal),
+            )
+            configure_result_publisher(result_publisher)
+            dispatcher.register(
+                hris_queue.topic, result_publisher.dispatch_queue, result_publisher.prune
+            )
+            logger.info("Outbox dispatcher started")
+        except Exception as e:
+            logger.warning(f"Outbox dispatcher not started: {e}")
+
     yield
 
     # Shutdown
     logger.info("Shutting down Elile API...")
 
+    # Let a dispatch in progress finish before the pool closes
+    try:
+        from elile.core.outbox import stop_outbox_dispatcher
+
+        await stop_outbox_dispatcher()
+    except Exception as e:
+        logger.warning(f"Outbox dispatcher shutdown error: {e}")
+
+    # Write queued audit events before the pool closes
+    try:
+        from elile.core.audit_writer import stop_audit_writer
+
+        await stop_audit_writer()
+    except Exception as e:
+        logger.warning(f"Audit writer shutdown error: {e}")
+
     # Close database connections
     try:
         from elile.db.config import close_db
@@ -0,0 +1,24 @@
+"""Gunicorn configuration for serving the API from preforked workers.
+
+Usage:
+    gunicorn -c python:elile.api.gunicorn_conf
+
+The application is created once in the gunicorn master (``preload_app``)
+and the uvicorn workers are forked from it. Provider reference data that
+create_app() preloads (``REFERENCE_DATA_PRELOAD``) is therefore loaded
+once, and its pages are shared copy-on-write by every worker. Set the
+number of workers with ``--workers`` or ``WEB_CONCURRENCY``.
+
+``uvicorn --workers`` does not share the data: uvicorn starts its workers
+with the spawn method, and each of them creates the application, and
+loads the data, itself.
+"""
+
+from elile.config.settings import get_settings
+
+_settings = get_settings()
+
+wsgi_app = "elile.api.app:create_app()"
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+bind = f"{_settings.API_HOST}:{_settings.API_PORT}"
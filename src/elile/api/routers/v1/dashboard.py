@@ -83,6 +83,16 @@ def _get_global_alert_generator() -> AlertGenerator:
     return _alert_generator
 
 
+def configure_alert_generator(generator: AlertGenerator | None) -> None:
+    """Replace the global alert generator.
+
+    Called at startup to install a generator with a durable outbox; None
+    resets to the lazily created in-memory one.
+    """
+    global _alert_generator
+    _alert_generator = generator
+
+
 # =============================================================================
 # In-Memory Storage (shared with screening.py)
 # =============================================================================
@@ -148,7 +158,7 @@ async def get_hr_portfolio(
     metrics = _calculate_portfolio_metrics(tenant_screenings)
 
     # Get recent alerts (up to 10)
-    recent_alerts = _get_recent_alerts(alert_generator, limit=10)
+    recent_alerts = await _get_recent_alerts(alert_generator, limit=10)
 
     return HRPortfolioResponse(
         metrics=metrics,
@@ -331,7 +341,7 @@ async def list_hr_alerts(
     )
 
     # Get alerts from generator
-    all_alerts = alert_generator.get_alert_history(limit=1000)
+    all_alerts = await alert_generator.get_alert_history(limit=1000)
 
     # Apply filters
     filtered = all_alerts
@@ -558,7 +568,9 @@ def _screening_to_summary(result: ScreeningResult) -> ScreeningSummary:
     )
 
 
-def _get_recent_alerts(alert_generator: AlertGenerator, limit: int = 10) -> list[AlertSummary]:
+async def _get_recent_alerts(
+    alert_generator: AlertGenerator, limit: int = 10
+) -> list[AlertSummary]:
     """Get recent alerts as summaries.
 
     Args:
@@ -568,7 +580,7 @@ def _get_recent_alerts(alert_generator: AlertGenerator, limit: int = 10) -> list
     Returns:
         List of AlertSummary.
     """
-    alerts = alert_generator.get_alert_history(limit=limit)
+    alerts = await alert_generator.get_alert_history(limit=limit)
     return [_alert_to_summary(a) for a in alerts]
 
 
@@ -2,6 +2,7 @@
 
 This module provides REST API endpoints for receiving HRIS webhooks:
 - POST /v1/hris/webhooks/{tenant_id} - Receive webhook from HRIS platform
+- POST /v1/hris/webhooks/{tenant_id}/batch - Receive a batch of events in one webhook
 - POST /v1/hris/webhooks/{tenant_id}/test - Test webhook connectivity
 - GET /v1/hris/webhooks/{tenant_id}/status - Check connection status
 """
@@ -12,8 +13,13 @@ from uuid import UUID
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import ValidationError
 
 from elile.api.schemas.hris_webhook import (
+    BulkEventStatus,
+    BulkWebhookEventResult,
+    BulkWebhookRequest,
+    BulkWebhookResponse,
     WebhookConnectionStatus,
     WebhookErrorCode,
     WebhookResponse,
@@ -22,11 +28,14 @@ from elile.api.schemas.hris_webhook import (
     WebhookTestResponse,
 )
 from elile.hris import (
+    HRISEvent,
     HRISEventProcessor,
     HRISGateway,
+    HRISResultPublisher,
     ProcessingStatus,
     create_event_processor,
     create_hris_gateway,
+    create_result_publisher,
 )
 
 logger = structlog.get_logger()
@@ -42,6 +51,7 @@ router = APIRouter(prefix="/hris/webhooks", tags=["hris-webhooks"])
 # Module-level singletons
 _gateway: HRISGateway | None = None
 _event_processor: HRISEventProcessor | None = None
+_result_publisher: HRISResultPublisher | None = None
 
 
 def get_hris_gateway() -> HRISGateway:
@@ -68,6 +78,28 @@ def get_event_processor() -> HRISEventProcessor:
     return _event_processor
 
 
+def get_result_publisher() -> HRISResultPublisher:
+    """Get the HRIS result publisher instance.
+
+    Returns a singleton publisher on the shared gateway. Unless one with a
+    durable queue was configured at app startup, it queues in memory.
+    """
+    global _result_publisher
+    if _result_publisher is None:
+        _result_publisher = create_result_publisher(gateway=get_hris_gateway())
+    return _result_publisher
+
+
+def configure_result_publisher(publisher: HRISResultPublisher | None) -> None:
+    """Replace the global result publisher.
+
+    Called at startup to install a publisher with a durable outbound queue;
+    None resets to the lazily created in-memory one.
+    """
+    global _result_publisher
+    _result_publisher = publisher
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -352,6 +384,212 @@ async def receive_webhook(
     )
 
 
+@router.post(
+    "/{tenant_id}/batch",
+    response_model=BulkWebhookResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Receive a batch of HRIS events",
+    description="""
+    Receive and process many HRIS events in one webhook, for bulk imports
+    such as seasonal onboarding waves.
+
+    The body is `{"events": [...]}`, each event shaped like a single webhook
+    payload with its type in `type`, `event_type` or `eventType` (or for all
+    events, in the X-Event-Type header). The signature covers the whole
+    body, so it is validated once for the batch.
+
+    Repeated events are reported as duplicates and not processed again.
+    Events without a type, or beyond the tenant's rate limit, are rejected
+    individually; the rest of the batch is still processed.
+    """,
+    responses={
+        200: {"description": "Batch received; see per-event results"},
+        400: {"description": "Invalid payload format"},
+        401: {"description": "Invalid or missing signature"},
+        404: {"description": "Unknown tenant or no connection configured"},
+    },
+)
+async def receive_webhook_batch(
+    tenant_id: UUID,
+    request: Request,
+    gateway: Annotated[HRISGateway, Depends(get_hris_gateway)],
+    event_processor: Annotated[HRISEventProcessor, Depends(get_event_processor)],
+) -> BulkWebhookResponse:
+    """Receive and process a batch of HRIS events.
+
+    Args:
+        tenant_id: The tenant ID for this webhook.
+        request: The incoming FastAPI request.
+        gateway: HRIS gateway for validation and parsing.
+        event_processor: Processor the parsed events are routed to.
+
+    Returns:
+        BulkWebhookResponse with per-event outcomes.
+
+    Raises:
+        HTTPException: If the tenant, signature or body is invalid.
+    """
+    request_id = request.headers.get("x-request-id", "unknown")
+    received_at = datetime.now(UTC)
+
+    connection = gateway.get_connection(tenant_id)
+    if connection is None or not connection.enabled:
+        error_code = (
+            WebhookErrorCode.UNKNOWN_TENANT
+            if connection is None
+            else WebhookErrorCode.CONNECTION_DISABLED
+        )
+        logger.warning(
+            "Bulk webhook received for unknown tenant or disabled connection",
+            tenant_id=str(tenant_id),
+            request_id=request_id,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error_code": error_code.value,
+                "message": f"No enabled HRIS connection for tenant: {tenant_id}",
+                "request_id": request_id,
+                "timestamp": datetime.now(UTC).isoformat(),
+            },
+        )
+
+    raw_body = await request.body()
+    headers = {k.lower(): v for k, v in request.headers.items()}
+    validation = await gateway.validate_inbound_event(
+        tenant_id=tenant_id,
+        headers=headers,
+        payload=raw_body,
+    )
+    if not validation.valid:
+        logger.warning(
+            "AUDIT: webhook_signature_failed",
+            audit_event_type="security.alert",
+            action="webhook_signature_failed",
+            tenant_id=str(tenant_id),
+            error=validation.error,
+            platform=connection.platform.value,
+            request_id=request_id,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "error_code": WebhookErrorCode.INVALID_SIGNATURE.value,
+                "message": validation.error or "Webhook signature validation failed",
+                "request_id": request_id,
+                "timestamp": datetime.now(UTC).isoformat(),
+            },
+        )
+
+    try:
+        body = BulkWebhookRequest.model_validate_json(raw_body)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error_code": WebhookErrorCode.INVALID_PAYLOAD.value,
+                "message": f"Invalid bulk payload: {e.error_count()} error(s)",
+                "request_id": request_id,
+                "timestamp": datetime.now(UTC).isoformat(),
+            },
+        ) from e
+
+    # Resolve event types; events without one are rejected individually
+    default_type = headers.get("x-event-type") or headers.get("x-webhook-event-type")
+    results: list[BulkWebhookEventResult | None] = [None] * len(body.events)
+    typed: list[tuple[int, str, dict[str, Any]]] = []
+    for index, payload in enumerate(body.events):
+        event_type = (
+            payload.get("type")
+            or payload.get("event_type")
+            or payload.get("eventType")
+            or default_type
+        )
+        if not event_type:
+            results[index] = BulkWebhookEventResult(
+                index=index,
+                status=BulkEventStatus.REJECTED,
+                error_code=WebhookErrorCode.UNKNOWN_EVENT_TYPE.value,
+                message="Event type not found in headers or payload",
+            )
+            continue
+        typed.append((index, event_type, payload))
+
+    parsed = await gateway.parse_inbound_events(
+        tenant_id=tenant_id,
+        items=[(event_type, payload) for _, event_type, payload in typed],
+    )
+    events: list[tuple[int, HRISEvent]] = []
+    for (index, event_type, _), event in zip(typed, parsed, strict=True):
+        if event is None:
+            results[index] = BulkWebhookEventResult(
+                index=index,
+                status=BulkEventStatus.REJECTED,
+                event_type=event_type,
+                error_code=WebhookErrorCode.RATE_LIMITED.value,
+                message="Rate limit exceeded for webhook events",
+            )
+        else:
+            events.append((index, event))
+
+    logger.info(
+        "AUDIT: hris_event_batch_received",
+        audit_event_type="hris.event_batch_received",
+        action="webhook_batch_received",
+        tenant_id=str(tenant_id),
+        received=len(body.events),
+        accepted=len(events),
+        platform=connection.platform.value,
+        request_id=request_id,
+    )
+
+    batch = await event_processor.process_events([event for _, event in events])
+
+    for (index, event), processing_result in zip(events, batch.results, strict=True):
+        if processing_result.status == ProcessingStatus.SUCCESS:
+            item_status = BulkEventStatus.PROCESSED
+        elif processing_result.status == ProcessingStatus.FAILED:
+            item_status = BulkEventStatus.FAILED
+        elif "duplicate_of" in processing_result.details:
+            item_status = BulkEventStatus.DUPLICATE
+        else:
+            item_status = BulkEventStatus.RECEIVED
+        results[index] = BulkWebhookEventResult(
+            index=index,
+            status=item_status,
+            event_id=event.event_id,
+            event_type=event.event_type.value,
+            action=processing_result.action.value,
+            message=processing_result.error_message,
+        )
+
+    final = [result for result in results if result is not None]
+    logger.info(
+        "AUDIT: hris_event_batch_processing_complete",
+        audit_event_type="hris.event_batch_processing_complete",
+        batch_id=str(batch.batch_id),
+        tenant_id=str(tenant_id),
+        processed=batch.count(ProcessingStatus.SUCCESS),
+        duplicates=batch.duplicates,
+        failed=batch.count(ProcessingStatus.FAILED),
+        events_per_second=round(batch.events_per_second, 1),
+        request_id=request_id,
+    )
+
+    return BulkWebhookResponse(
+        batch_id=batch.batch_id,
+        received=len(body.events),
+        processed=sum(1 for r in final if r.status == BulkEventStatus.PROCESSED),
+        duplicates=batch.duplicates,
+        rejected=sum(1 for r in final if r.status == BulkEventStatus.REJECTED),
+        failed=sum(1 for r in final if r.status == BulkEventStatus.FAILED),
+        processing_time_ms=batch.processing_time_ms,
+        events_per_second=round(batch.events_per_second, 1),
+        timestamp=received_at,
+        results=final,
+    )
+
+
 @router.post(
     "/{tenant_id}/test",
     response_model=WebhookTestResponse,
@@ -48,6 +48,62 @@ class WebhookResponse(BaseModel):
     }
 
 
+# Matches the gateway's default max_events_per_minute, so a full batch
+# is not mostly rejected by the tenant's rate limit
+MAX_BULK_EVENTS = 1000
+
+
+class BulkWebhookRequest(BaseModel):
+    """Request body for bulk webhook delivery.
+
+    The signature headers cover the whole request body, so one signature
+    check authenticates every event in the batch.
+    """
+
+    events: list[dict[str, Any]] = Field(
+        min_length=1,
+        max_length=MAX_BULK_EVENTS,
+        description="Event payloads, each with its type in type/event_type/eventType",
+    )
+
+
+class BulkEventStatus(str, Enum):
+    """Outcome of one event in a bulk webhook."""
+
+    PROCESSED = "processed"
+    RECEIVED = "received"
+    DUPLICATE = "duplicate"
+    REJECTED = "rejected"
+    FAILED = "failed"
+
+
+class BulkWebhookEventResult(BaseModel):
+    """Outcome of one event in a bulk webhook."""
+
+    index: int = Field(description="Position of the event in the request")
+    status: BulkEventStatus = Field(description="Outcome of the event")
+    event_id: UUID | None = Field(default=None, description="Event ID, if the event was parsed")
+    event_type: str | None = Field(default=None, description="Event type")
+    action: str | None = Field(default=None, description="Processing action taken")
+    error_code: str | None = Field(default=None, description="Why the event was rejected")
+    message: str | None = Field(default=None, description="Optional status message")
+
+
+class BulkWebhookResponse(BaseModel):
+    """Response for bulk webhook receipt."""
+
+    batch_id: UUID = Field(description="Identifier of the processed batch")
+    received: int = Field(description="Events in the request")
+    processed: int = Field(description="Events processed successfully")
+    duplicates: int = Field(description="Events skipped as repeats")
+    rejected: int = Field(description="Events rejected before processing")
+    failed: int = Field(description="Events whose processing failed")
+    processing_time_ms: int = Field(description="Time spent processing the batch")
+    events_per_second: float = Field(description="Processing throughput")
+    timestamp: datetime = Field(description="Time the batch was received")
+    results: list[BulkWebhookEventResult] = Field(description="Per-event outcomes, in order")
+
+
 class WebhookErrorResponse(BaseModel):
     """Error response for webhook failures."""
 
@@ -23,75 +23,83 @@ Usage:
         ...
 """
 
-from elile.compliance.consent import (
-    Consent,
-    ConsentManager,
-    ConsentResult,
-    ConsentScope,
-    ConsentVerificationMethod,
-    FCRADisclosure,
-    create_consent,
-    create_fcra_disclosure,
-)
-from elile.compliance.engine import ComplianceEngine, get_compliance_engine
-from elile.compliance.erasure import (
-    AnonymizationConfig,
-    AnonymizationMethod,
-    AnonymizationResult,
-    create_anonymizer,
-    DataAnonymizer,
-    ErasedItem,
-    ErasureBlockedException,
-    ErasureConfirmationReport,
-    ErasureExemption,
-    ErasureOperation,
-    ErasureService,
-    ErasureServiceConfig,
-    ErasureStatus,
-    ErasureType,
-    ErasureVerificationError,
-    get_erasure_service,
-    initialize_erasure_service,
-    LegalHoldException,
-    RetainedItem,
-)
-from elile.compliance.retention import (
-    DataType,
-    DeletionMethod,
-    ErasureRequest,
-    RetentionAction,
-    RetentionManager,
-    RetentionManagerConfig,
-    RetentionPolicy,
-    RetentionRecord,
-    RetentionReport,
-    RetentionStatus,
-    get_default_policies,
-    get_policies_for_locale,
-    get_policy_for_data_type,
-    get_retention_manager,
-    initialize_retention_manager,
-)
-from elile.compliance.rules import ComplianceRule, RuleRepository
-from elile.compliance.types import (
-    ENHANCED_TIER_CHECKS,
-    EXPLICIT_CONSENT_CHECKS,
-    HIRING_RESTRICTED_CHECKS,
-    CheckRestriction,
-    CheckResult,
-    CheckType,
-    Locale,
-    LocaleConfig,
-    RestrictionType,
-    RoleCategory,
-)
-from elile.compliance.validation import (
-    ServiceConfigValidator,
-    ValidationError,
-    ValidationResult,
-    validate_or_raise,
-    validate_service_config,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.compliance.consent import (
+        Consent,
+        ConsentManager,
+        ConsentResult,
+        ConsentScope,
+        ConsentVerificationMethod,
+        FCRADisclosure,
+        create_consent,
+        create_fcra_disclosure,
+    )
+    from elile.compliance.decision_table import ComplianceDecisionTable
+    from elile.compliance.engine import ComplianceEngine, get_compliance_engine
+    from elile.compliance.erasure import (
+        AnonymizationConfig,
+        AnonymizationMethod,
+        AnonymizationResult,
+        create_anonymizer,
+        DataAnonymizer,
+        ErasedItem,
+        ErasureBlockedException,
+        ErasureConfirmationReport,
+        ErasureExemption,
+        ErasureOperation,
+        ErasureService,
+        ErasureServiceConfig,
+        ErasureStatus,
+        ErasureType,
+        ErasureVerificationError,
+        get_erasure_service,
+        initialize_erasure_service,
+        LegalHoldException,
+        RetainedItem,
+    )
+    from elile.compliance.retention import (
+        DataType,
+        DeletionMethod,
+        ErasureRequest,
+        RetentionAction,
+        RetentionManager,
+        RetentionManagerConfig,
+        RetentionPolicy,
+        RetentionRecord,
+        RetentionReport,
+        RetentionStatus,
+        get_default_policies,
+        get_policies_for_locale,
+        get_policy_for_data_type,
+        get_retention_manager,
+        initialize_retention_manager,
+    )
+    from elile.compliance.rules import ComplianceRule, RuleRepository
+    from elile.compliance.types import (
+        ENHANCED_TIER_CHECKS,
+        EXPLICIT_CONSENT_CHECKS,
+        HIRING_RESTRICTED_CHECKS,
+        CheckRestriction,
+        CheckResult,
+        CheckType,
+        Locale,
+        LocaleConfig,
+        RestrictionType,
+        RoleCategory,
+    )
+    from elile.compliance.validation import (
+        ServiceConfigValidator,
+        ValidationError,
+        ValidationResult,
+        validate_or_raise,
+        validate_service_config,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Core types
@@ -108,6 +116,7 @@ __all__ = [
     "RuleRepository",
     # Engine
     "ComplianceEngine",
+    "ComplianceDecisionTable",
     "get_compliance_engine",
     # Consent
     "Consent",
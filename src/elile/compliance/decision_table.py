@@ -0,0 +1,253 @@
+"""Compiled compliance decision table.
+
+Evaluating a check against a RuleRepository means a rule lookup with
+parent-locale fallback followed by the built-in tier, consent and role
+overrides. Its inputs are small enumerations, so ComplianceDecisionTable
+evaluates every Locale x CheckType x RoleCategory x ServiceTier
+combination once when rules are loaded and stores the immutable results
+in a dense array. Evaluating a check is then a single index lookup, and
+the permitted and blocked checks of a context are precomputed as well.
+
+Compiled tables are shared between repositories holding the same rules,
+so creating engines with the default rules does not recompile them.
+"""
+
+from collections import OrderedDict
+from typing import Self
+
+from elile.agent.state import ServiceTier
+from elile.compliance.rules import RuleRepository
+from elile.compliance.types import (
+    EXPLICIT_CONSENT_CHECKS,
+    HIRING_RESTRICTED_CHECKS,
+    CheckRestriction,
+    CheckResult,
+    CheckType,
+    Locale,
+    RestrictionType,
+    RoleCategory,
+)
+
+_LOCALES = tuple(Locale)
+_CHECK_TYPES = tuple(CheckType)
+_ROLES = tuple(RoleCategory)
+_TIERS = tuple(ServiceTier)
+
+_LOCALE_INDEX = {locale: i for i, locale in enumerate(_LOCALES)}
+_CHECK_INDEX = {check_type: i for i, check_type in enumerate(_CHECK_TYPES)}
+_ROLE_INDEX = {role: i for i, role in enumerate(_ROLES)}
+_TIER_INDEX = {tier: i for i, tier in enumerate(_TIERS)}
+
+# Compiled tables by rule set, most recently used last
+_TABLE_CACHE: OrderedDict[tuple[str, ...], "ComplianceDecisionTable"] = OrderedDict()
+_TABLE_CACHE_SIZE = 8
+
+_HIRING_RESTRICTION_NOTES = "Not for hiring decisions; security/monitoring use only"
+
+
+def _context_offset(locale: Locale, role_category: RoleCategory, tier: ServiceTier) -> int:
+    context = _LOCALE_INDEX[locale] * len(_ROLES) + _ROLE_INDEX[role_category]
+    return context * len(_TIERS) + _TIER_INDEX[tier]
+
+
+def _block_reason(restriction: CheckRestriction) -> str:
+    """Get a human-readable block reason from a restriction."""
+    if restriction.notes:
+        return restriction.notes
+    if restriction.restriction_type == RestrictionType.BLOCKED:
+        return "Check type not permitted in this jurisdiction"
+    if restriction.restriction_type == RestrictionType.ROLE_RESTRICTED:
+        roles = ", ".join(r.value for r in restriction.role_categories)
+        return f"Only permitted for roles: {roles}"
+    if restriction.restriction_type == RestrictionType.TIER_RESTRICTED:
+        return "Requires Enhanced service tier"
+    return "Check not permitted"
+
+
+def evaluate_rules(
+    repository: RuleRepository,
+    locale: Locale,
+    check_type: CheckType,
+    role_category: RoleCategory,
+    tier: ServiceTier,
+) -> CheckResult:
+    """Evaluate a check directly against a rule repository.
+
+    This is the uncompiled evaluation the decision table precomputes.
+
+    Args:
+        repository: Rules to evaluate
+        locale: The geographic jurisdiction
+        check_type: The type of background check
+        role_category: The job role category
+        tier: The service tier
+
+    Returns:
+        CheckResult with permission status and restrictions
+    """
+    restriction = repository.get_effective_rule(
+        locale=locale,
+        check_type=check_type,
+        role_category=role_category,
+        tier=tier,
+    )
+    restrictions = [restriction]
+
+    if check_type in HIRING_RESTRICTED_CHECKS and restriction.permitted:
+        restrictions.append(
+            CheckRestriction(
+                check_type=check_type,
+                permitted=True,
+                restriction_type=RestrictionType.CONDITIONAL,
+                notes=_HIRING_RESTRICTION_NOTES,
+            )
+        )
+
+    return CheckResult(
+        check_type=check_type,
+        locale=locale,
+        permitted=restriction.permitted,
+        restrictions=restrictions,
+        requires_consent=restriction.requires_consent or check_type in EXPLICIT_CONSENT_CHECKS,
+        requires_disclosure=restriction.requires_disclosure,
+        requires_enhanced_tier=restriction.requires_enhanced_tier,
+        lookback_days=restriction.lookback_days,
+        block_reason=None if restriction.permitted else _block_reason(restriction),
+    )
+
+
+class ComplianceDecisionTable:
+    """Precomputed compliance decisions for every check context.
+
+    Results are stored in one flat tuple indexed by the positions of
+    locale, check type, role category and tier in their enums. A table is
+    never modified after compilation; reloading rules compiles a new table
+    that replaces the old one in a single assignment.
+
+    Attributes:
+        rules_version: Version of the repository the table was compiled from
+    """
+
+    def __init__(
+        self,
+        results: tuple[CheckResult, ...],
+        permitted: tuple[tuple[CheckType, ...], ...],
+        blocked: tuple[tuple[tuple[CheckType, str], ...], ...],
+        rules_version: int,
+    ):
+        """Initialize from compiled results; use compile() instead.
+
+        Args:
+            results: Results for every context and check type
+            permitted: Permitted check types per context
+            blocked: Blocked check types with reasons per context
+            rules_version: Version of the compiled repository
+        """
+        self._results = results
+        self._permitted = permitted
+        self._blocked = blocked
+        self.rules_version = rules_version
+
+    @classmethod
+    def compile(cls, repository: RuleRepository) -> Self:
+        """Compile the decision table for a rule repository.
+
+        Args:
+            repository: Rules to compile
+
+        Returns:
+            Compiled table, shared with earlier repositories holding the same rules
+        """
+        rules_key = tuple(rule.model_dump_json() for rule in repository.all_rules())
+        cached = _TABLE_CACHE.get(rules_key)
+        if cached is not None:
+            _TABLE_CACHE.move_to_end(rules_key)
+            return cls(cached._results, cached._permitted, cached._blocked, repository.version)
+
+        results: list[CheckResult] = []
+        permitted: list[tuple[CheckType, ...]] = []
+        blocked: list[tuple[tuple[CheckType, str], ...]] = []
+        for locale in _LOCALES:
+            for role_category in _ROLES:
+                for tier in _TIERS:
+                    context = [
+                        evaluate_rules(repository, locale, check_type, role_category, tier)
+                        for check_type in _CHECK_TYPES
+                    ]
+                    results.extend(context)
+                    permitted.append(tuple(r.check_type for r in context if r.permitted))
+                    blocked.append(
+                        tuple(
+                            (r.check_type, r.block_reason or "Not permitted")
+                            for r in context
+                            if not r.permitted
+                        )
+                    )
+
+        table = cls(tuple(results), tuple(permitted), tuple(blocked), repository.version)
+        _TABLE_CACHE[rules_key] = table
+        if len(_TABLE_CACHE) > _TABLE_CACHE_SIZE:
+            _TABLE_CACHE.popitem(last=False)
+        return table
+
+    def __len__(self) -> int:
+        """Get the number of precomputed results."""
+        return len(self._results)
+
+    def lookup(
+        self,
+        locale: Locale,
+        check_type: CheckType,
+        role_category: RoleCategory = RoleCategory.STANDARD,
+        tier: ServiceTier = ServiceTier.STANDARD,
+    ) -> CheckResult:
+        """Get the precomputed result for a check.
+
+        Args:
+            locale: The geographic jurisdiction
+            check_type: The type of background check
+            role_category: The job role category
+            tier: The service tier
+
+        Returns:
+            Shared, immutable CheckResult
+        """
+        offset = _context_offset(locale, role_category, tier)
+        return self._results[offset * len(_CHECK_TYPES) + _CHECK_INDEX[check_type]]
+
+    def context_results(
+        self,
+        locale: Locale,
+        role_category: RoleCategory = RoleCategory.STANDARD,
+        tier: ServiceTier = ServiceTier.STANDARD,
+    ) -> tuple[CheckResult, ...]:
+        """Get the results of every check type for a context.
+
+        Args:
+            locale: The geographic jurisdiction
+            role_category: The job role category
+            tier: The service tier
+
+        Returns:
+            Results in CheckType order
+        """
+        start = _context_offset(locale, role_category, tier) * len(_CHECK_TYPES)
+        return self._results[start : start + len(_CHECK_TYPES)]
+
+    def permitted_checks(
+        self,
+        locale: Locale,
+        role_category: RoleCategory = RoleCategory.STANDARD,
+        tier: ServiceTier = ServiceTier.STANDARD,
+    ) -> tuple[CheckType, ...]:
+        """Get the permitted check types for a context."""
+        return self._permitted[_context_offset(locale, role_category, tier)]
+
+    def blocked_checks(
+        self,
+        locale: Locale,
+        role_category: RoleCategory = RoleCategory.STANDARD,
+        tier: ServiceTier = ServiceTier.STANDARD,
+    ) -> tuple[tuple[CheckType, str], ...]:
+        """Get the blocked check types with reasons for a context."""
+        return self._blocked[_context_offset(locale, role_category, tier)]
@@ -2,21 +2,20 @@
 
 This module provides the ComplianceEngine class that evaluates whether
 specific background checks are permitted based on locale, role, and tier.
+Rules are compiled into a ComplianceDecisionTable when loaded, so each
+evaluation is a table lookup.
 """
 
+from collections.abc import Sequence
 from datetime import timedelta
 
 from elile.agent.state import ServiceTier
-from elile.compliance.rules import RuleRepository
+from elile.compliance.decision_table import ComplianceDecisionTable
+from elile.compliance.rules import ComplianceRule, RuleRepository
 from elile.compliance.types import (
-    CheckRestriction,
     CheckResult,
     CheckType,
-    ENHANCED_TIER_CHECKS,
-    EXPLICIT_CONSENT_CHECKS,
-    HIRING_RESTRICTED_CHECKS,
     Locale,
-    RestrictionType,
     RoleCategory,
 )
 from elile.core.logging import get_logger
@@ -49,11 +48,43 @@ class ComplianceEngine:
     def __init__(self, rule_repository: RuleRepository | None = None):
         """Initialize the compliance engine.
 
+        Compiles the rules into a decision table, so evaluating a check is
+        a table lookup.
+
         Args:
             rule_repository: Repository of compliance rules. If None,
                 uses the default rules.
         """
         self._repository = rule_repository or RuleRepository.with_default_rules()
+        self._table = ComplianceDecisionTable.compile(self._repository)
+
+    @property
+    def decision_table(self) -> ComplianceDecisionTable:
+        """Get the compiled decision table, recompiling if rules were loaded since."""
+        table = self._table
+        if table.rules_version != self._repository.version:
+            table = ComplianceDecisionTable.compile(self._repository)
+            self._table = table
+            logger.info(
+                "compliance_rules_recompiled",
+                rule_count=self._repository.count(),
+                rules_version=table.rules_version,
+            )
+        return table
+
+    def reload_rules(self, rules: Sequence[ComplianceRule]) -> None:
+        """Replace the engine's rules.
+
+        The new rules are compiled before being swapped in, so concurrent
+        evaluations see either the old or the new rule set, never a mix.
+
+        Args:
+            rules: The complete new rule set
+        """
+        repository = RuleRepository(rules=rules)
+        table = ComplianceDecisionTable.compile(repository)
+        self._repository, self._table = repository, table
+        logger.info("compliance_rules_reloaded", rule_count=repository.count())
 
     def evaluate_check(
         self,
@@ -71,57 +102,29 @@ class ComplianceEngine:
             tier: The service tier (Standard or Enhanced)
 
         Returns:
-            CheckResult with permission status and restrictions
+            CheckResult with permission status and restrictions. Results
+            are shared and immutable.
         """
-        restrictions: list[CheckRestriction] = []
-        block_reason: str | None = None
-
-        # Get the effective restriction from rules
-        restriction = self._repository.get_effective_rule(
-            locale=locale,
-            check_type=check_type,
-            role_category=role_category,
-            tier=tier,
-        )
-        restrictions.append(restriction)
-
-        # Check if blocked
-        if not restriction.permitted:
-            block_reason = restriction.notes or self._get_block_reason(restriction)
-
-        # Check hiring restrictions
-        if check_type in HIRING_RESTRICTED_CHECKS and restriction.permitted:
-            hiring_restriction = CheckRestriction(
-                check_type=check_type,
-                permitted=True,
-                restriction_type=RestrictionType.CONDITIONAL,
-                notes="Not for hiring decisions; security/monitoring use only",
-            )
-            restrictions.append(hiring_restriction)
-
-        # Build combined requirements
-        result = CheckResult(
-            check_type=check_type,
-            locale=locale,
-            permitted=restriction.permitted,
-            restrictions=restrictions,
-            requires_consent=self._requires_consent(restriction, check_type),
-            requires_disclosure=restriction.requires_disclosure,
-            requires_enhanced_tier=restriction.requires_enhanced_tier,
-            lookback_days=restriction.lookback_days,
-            block_reason=block_reason,
-        )
+        return self.decision_table.lookup(locale, check_type, role_category, tier)
 
-        logger.debug(
-            "compliance_check_evaluated",
-            locale=locale.value,
-            check_type=check_type.value,
-            role_category=role_category.value,
-            tier=tier.value,
-            permitted=result.permitted,
-        )
+    def evaluate_context(
+        self,
+        locale: Locale,
+        role_category: RoleCategory = RoleCategory.STANDARD,
+        tier: ServiceTier = ServiceTier.STANDARD,
+    ) -> dict[CheckType, CheckResult]:
+        """Evaluate every check type for a locale/role/tier combination.
 
-        return result
+        Args:
+            locale: The geographic jurisdiction
+            role_category: The job role category
+            tier: The service tier
+
+        Returns:
+            CheckResult for each check type
+        """
+        results = self.decision_table.context_results(locale, role_category, tier)
+        return {result.check_type: result for result in results}
 
     def get_permitted_checks(
         self,
@@ -139,19 +142,7 @@ class ComplianceEngine:
         Returns:
             List of permitted check types
         """
-        permitted: list[CheckType] = []
-
-        for check_type in CheckType:
-            result = self.evaluate_check(
-                locale=locale,
-                check_type=check_type,
-                role_category=role_category,
-                tier=tier,
-            )
-            if result.permitted:
-                permitted.append(check_type)
-
-        return permitted
+        return list(self.decision_table.permitted_checks(locale, role_category, tier))
 
     def get_blocked_checks(
         self,
@@ -169,20 +160,7 @@ class ComplianceEngine:
         Returns:
             List of (CheckType, reason) tuples for blocked checks
         """
-        blocked: list[tuple[CheckType, str]] = []
-
-        for check_type in CheckType:
-            result = self.evaluate_check(
-                locale=locale,
-                check_type=check_type,
-                role_category=role_category,
-                tier=tier,
-            )
-            if not result.permitted:
-                reason = result.block_reason or "Not permitted"
-                blocked.append((check_type, reason))
-
-        return blocked
+        return list(self.decision_table.blocked_checks(locale, role_category, tier))
 
     def get_lookback_period(
         self,
@@ -198,11 +176,7 @@ class ComplianceEngine:
         Returns:
             Lookback period as timedelta, or None if unlimited
         """
-        restriction = self._repository.get_effective_rule(
-            locale=locale,
-            check_type=check_type,
-        )
-        return restriction.lookback_period
+        return self.decision_table.lookup(locale, check_type).lookback_period
 
     def requires_consent(
         self,
@@ -218,11 +192,7 @@ class ComplianceEngine:
         Returns:
             True if explicit consent is required
         """
-        restriction = self._repository.get_effective_rule(
-            locale=locale,
-            check_type=check_type,
-        )
-        return self._requires_consent(restriction, check_type)
+        return self.decision_table.lookup(locale, check_type).requires_consent
 
     def requires_disclosure(
         self,
@@ -238,11 +208,7 @@ class ComplianceEngine:
         Returns:
             True if pre-check disclosure is required
         """
-        restriction = self._repository.get_effective_rule(
-            locale=locale,
-            check_type=check_type,
-        )
-        return restriction.requires_disclosure
+        return self.decision_table.lookup(locale, check_type).requires_disclosure
 
     def validate_checks(
         self,
@@ -262,16 +228,12 @@ class ComplianceEngine:
         Returns:
             Tuple of (permitted_checks, blocked_checks_with_reasons)
         """
+        table = self.decision_table
         permitted: list[CheckType] = []
         blocked: list[tuple[CheckType, str]] = []
 
         for check_type in check_types:
-            result = self.evaluate_check(
-                locale=locale,
-                check_type=check_type,
-                role_category=role_category,
-                tier=tier,
-            )
+            result = table.lookup(locale, check_type, role_category, tier)
             if result.permitted:
                 permitted.append(check_type)
             else:
@@ -280,32 +242,6 @@ class ComplianceEngine:
 
         return permitted, blocked
 
-    def _requires_consent(
-        self,
-        restriction: CheckRestriction,
-        check_type: CheckType,
-    ) -> bool:
-        """Determine if consent is required.
-
-        Combines rule-based consent with built-in consent requirements.
-        """
-        if restriction.requires_consent:
-            return True
-        if check_type in EXPLICIT_CONSENT_CHECKS:
-            return True
-        return False
-
-    def _get_block_reason(self, restriction: CheckRestriction) -> str:
-        """Get a human-readable block reason from restriction type."""
-        if restriction.restriction_type == RestrictionType.BLOCKED:
-            return "Check type not permitted in this jurisdiction"
-        if restriction.restriction_type == RestrictionType.ROLE_RESTRICTED:
-            roles = ", ".join(r.value for r in restriction.role_categories)
-            return f"Only permitted for roles: {roles}"
-        if restriction.restriction_type == RestrictionType.TIER_RESTRICTED:
-            return "Requires Enhanced service tier"
-        return "Check not permitted"
-
 
 def get_compliance_engine() -> ComplianceEngine:
     """Get a compliance engine instance with default rules.
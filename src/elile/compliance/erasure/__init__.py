@@ -48,36 +48,51 @@ Example Usage:
     ```
 """
 
-from elile.compliance.erasure.anonymizer import (
-    PII_FIELD_PATTERNS,
-    AnonymizationConfig,
-    AnonymizationResult,
-    DataAnonymizer,
-    create_anonymizer,
-)
-from elile.compliance.erasure.service import (
-    DATA_TYPE_EXEMPTIONS,
-    DEFAULT_DEADLINE_DAYS,
-    GDPR_DEADLINE_DAYS,
-    ErasureService,
-    ErasureServiceConfig,
-    get_erasure_service,
-    initialize_erasure_service,
-)
-from elile.compliance.erasure.types import (
-    AnonymizationMethod,
-    AnonymizationRule,
-    ErasedItem,
-    ErasureBlockedException,
-    ErasureConfirmationReport,
-    ErasureExemption,
-    ErasureOperation,
-    ErasureStatus,
-    ErasureType,
-    ErasureVerificationError,
-    LegalHoldException,
-    RetainedItem,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.compliance.erasure.anonymizer import (
+        PII_FIELD_PATTERNS,
+        AnonymizationConfig,
+        AnonymizationPlan,
+        AnonymizationResult,
+        DataAnonymizer,
+        create_anonymizer,
+    )
+    from elile.compliance.erasure.service import (
+        DATA_TYPE_ANONYMIZATION_RULES,
+        DATA_TYPE_EXEMPTIONS,
+        DEFAULT_DEADLINE_DAYS,
+        GDPR_DEADLINE_DAYS,
+        ErasureService,
+        ErasureServiceConfig,
+        get_erasure_service,
+        initialize_erasure_service,
+    )
+    from elile.compliance.erasure.store import (
+        InMemorySubjectDataStore,
+        SQLAlchemySubjectDataStore,
+        SubjectDataItem,
+        SubjectDataStore,
+    )
+    from elile.compliance.erasure.types import (
+        AnonymizationMethod,
+        AnonymizationRule,
+        ErasedItem,
+        ErasureBlockedException,
+        ErasureConfirmationReport,
+        ErasureExemption,
+        ErasureOperation,
+        ErasureStatus,
+        ErasureType,
+        ErasureVerificationError,
+        LegalHoldException,
+        RetainedItem,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Service
@@ -85,6 +100,11 @@ __all__ = [
     "ErasureServiceConfig",
     "get_erasure_service",
     "initialize_erasure_service",
+    # Subject data storage
+    "SubjectDataItem",
+    "SubjectDataStore",
+    "InMemorySubjectDataStore",
+    "SQLAlchemySubjectDataStore",
     # Types
     "ErasureType",
     "ErasureStatus",
@@ -102,11 +122,13 @@ __all__ = [
     # Anonymizer
     "DataAnonymizer",
     "AnonymizationConfig",
+    "AnonymizationPlan",
     "AnonymizationResult",
     "create_anonymizer",
     "PII_FIELD_PATTERNS",
     # Constants
     "DATA_TYPE_EXEMPTIONS",
+    "DATA_TYPE_ANONYMIZATION_RULES",
     "GDPR_DEADLINE_DAYS",
     "DEFAULT_DEADLINE_DAYS",
 ]
@@ -2,10 +2,15 @@
 
 This module provides the ErasureService class that handles GDPR Article 17
 erasure requests with legal hold checking, anonymization, and audit trail.
+
+Requests are processed in bulk: the data of every subject of a tenant is
+gathered with one query, anonymized per data type with shared
+anonymization plans, and written back and deleted in batches. A single
+request is a bulk run of one.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID, uuid7
@@ -14,6 +19,7 @@ from elile.compliance.erasure.anonymizer import (
     DataAnonymizer,
     create_anonymizer,
 )
+from elile.compliance.erasure.store import SubjectDataItem, SubjectDataStore
 from elile.compliance.erasure.types import (
     AnonymizationMethod,
     AnonymizationRule,
@@ -27,7 +33,7 @@ from elile.compliance.erasure.types import (
     RetainedItem,
 )
 from elile.compliance.retention.manager import RetentionManager, get_retention_manager
-from elile.compliance.retention.types import DataType
+from elile.compliance.retention.types import DataType, RetentionRecord, RetentionStatus
 from elile.compliance.types import Locale
 
 logger = logging.getLogger(__name__)
@@ -66,6 +72,17 @@ GDPR_DEADLINE_DAYS: dict[Locale, int] = {
 
 DEFAULT_DEADLINE_DAYS = 30
 
+# Explicit anonymization rules by data type; other fields use PII detection
+DATA_TYPE_ANONYMIZATION_RULES: dict[DataType, dict[str, AnonymizationRule]] = {
+    data_type: {
+        "full_name": AnonymizationRule("full_name", AnonymizationMethod.REDACTION),
+        "email": AnonymizationRule("email", AnonymizationMethod.TOKENIZATION),
+        "ssn": AnonymizationRule("ssn", AnonymizationMethod.MASKING, preserve_format=True),
+        "phone": AnonymizationRule("phone", AnonymizationMethod.MASKING, preserve_format=True),
+    }
+    for data_type in (DataType.ENTITY_PROFILE, DataType.SCREENING_RAW_DATA)
+}
+
 
 @dataclass
 class ErasureServiceConfig:
@@ -96,6 +113,9 @@ class ErasureServiceConfig:
     preserve_anonymized_for_days: int = 90
     """Days to keep anonymized data before hard delete."""
 
+    bulk_batch_size: int = 500
+    """Data items per anonymization write-back and deletion batch."""
+
     # Reporting settings
     generate_confirmation_report: bool = True
     """Whether to generate confirmation reports."""
@@ -108,6 +128,27 @@ class ErasureServiceConfig:
     """Log all erasure operations for audit."""
 
 
+@dataclass
+class _ErasureScope:
+    """The data an erasure operation covers."""
+
+    operation: ErasureOperation
+    records: list[RetentionRecord]
+    items: list[SubjectDataItem] = field(default_factory=list)
+
+
+def _in_scope(operation: ErasureOperation, data_type: DataType) -> bool:
+    return not operation.requested_data_types or data_type in operation.requested_data_types
+
+
+def _batch_failed(operations: list[ErasureOperation], error: str) -> None:
+    """Record a failed batch in the operations that had items in it."""
+    for operation in {id(operation): operation for operation in operations}.values():
+        operation.errors.append(error)
+        operation.add_audit_entry("processing_error", {"error": error})
+        logger.error(f"Error processing erasure {operation.operation_id}: {error}")
+
+
 class ErasureService:
     """Handle GDPR erasure requests.
 
@@ -124,6 +165,7 @@ class ErasureService:
         config: ErasureServiceConfig | None = None,
         retention_manager: RetentionManager | None = None,
         anonymizer: DataAnonymizer | None = None,
+        data_store: SubjectDataStore | None = None,
     ):
         """Initialize the erasure service.
 
@@ -131,10 +173,13 @@ class ErasureService:
             config: Service configuration
             retention_manager: Optional retention manager instance
             anonymizer: Optional anonymizer instance
+            data_store: Optional store of subject data to anonymize; without
+                one, every retention record of the tenant is in scope
         """
         self.config = config or ErasureServiceConfig()
         self._retention_manager = retention_manager or get_retention_manager()
         self._anonymizer = anonymizer or create_anonymizer()
+        self._data_store = data_store
 
         # In-memory storage for operations (would be database in production)
         self._operations: dict[UUID, ErasureOperation] = {}
@@ -271,11 +316,13 @@ class ErasureService:
     def _check_legal_holds(
         self,
         operation: ErasureOperation,
+        records: list[RetentionRecord],
     ) -> tuple[bool, list[RetainedItem]]:
         """Check for legal holds on subject data.
 
         Args:
             operation: The erasure operation
+            records: The subject's retention records
 
         Returns:
             Tuple of (has_blocking_hold, retained_items)
@@ -283,11 +330,7 @@ class ErasureService:
         retained_items: list[RetainedItem] = []
         has_blocking_hold = False
 
-        # Get all retention records for the tenant/subject
-        for record in self._retention_manager._records.values():
-            if record.tenant_id != operation.tenant_id:
-                continue
-
+        for record in records:
             # Check if data type is in scope
             if (
                 operation.requested_data_types
@@ -309,7 +352,7 @@ class ErasureService:
 
         return has_blocking_hold, retained_items
 
-    def _has_legal_hold(self, subject_id: UUID) -> bool:  # noqa: ARG002
+    async def _has_legal_hold(self, subject_id: UUID) -> bool:  # noqa: ARG002
         """Check if subject has any active legal holds.
 
         Args:
@@ -319,7 +362,44 @@ class ErasureService:
             True if legal hold exists
         """
         # In production, would also filter by subject_id
-        return any(record.legal_hold for record in self._retention_manager._records.values())
+        return bool(await self._retention_manager.get_records_by_status(RetentionStatus.LEGAL_HOLD))
+
+    def _block_on_legal_hold(self, scope: _ErasureScope) -> None:
+        """Block an operation if its data is under legal hold.
+
+        Args:
+            scope: The operation and its data
+
+        Raises:
+            LegalHoldException: If the operation was blocked
+        """
+        operation = scope.operation
+        has_blocking_hold, legal_hold_items = self._check_legal_holds(operation, scope.records)
+
+        if not has_blocking_hold or not self.config.block_on_any_legal_hold:
+            return
+
+        operation.status = ErasureStatus.BLOCKED
+        for item in legal_hold_items:
+            operation.retained_items.append(
+                {
+                    "data_id": str(item.data_id),
+                    "data_type": item.data_type.value,
+                    "exemption": item.exemption.value,
+                    "details": item.exemption_details,
+                }
+            )
+        operation.add_audit_entry(
+            "blocked_legal_hold",
+            {
+                "items_blocked": len(legal_hold_items),
+            },
+        )
+
+        raise LegalHoldException(
+            operation.subject_id,
+            (legal_hold_items[0].exemption_details if legal_hold_items else "Legal hold in effect"),
+        )
 
     # =========================================================================
     # Data Processing
@@ -344,8 +424,68 @@ class ErasureService:
             ErasureBlockedException: If erasure is blocked for other reasons
         """
         operation = self._get_operation(operation_id)
+        self._require_verified(operation, force)
+
+        scopes = await self._gather_scopes([operation])
+        self._block_on_legal_hold(scopes[0])
+        await self._erase(scopes)
 
-        # Check status
+        return operation
+
+    async def process_erasure_requests(
+        self,
+        operation_ids: list[UUID],
+        force: bool = False,
+    ) -> list[ErasureOperation]:
+        """Process a backlog of verified erasure requests in bulk.
+
+        The data of all subjects of a tenant is gathered with one query,
+        anonymized per data type with shared anonymization plans, and
+        written back and deleted in batches of ``bulk_batch_size``.
+
+        Unlike process_erasure_request, this does not raise for single
+        requests: unverified ones are skipped, and ones under legal hold
+        are marked blocked.
+
+        Args:
+            operation_ids: IDs of the erasure operations
+            force: Force processing even if not verified
+
+        Returns:
+            The processed operations (completed, partially completed or blocked)
+        """
+        operations: list[ErasureOperation] = []
+        for operation_id in operation_ids:
+            operation = self._get_operation(operation_id)
+            try:
+                self._require_verified(operation, force)
+            except ErasureVerificationError as e:
+                logger.warning(f"Skipping erasure operation {operation_id}: {e}")
+                continue
+            operations.append(operation)
+
+        erasable: list[_ErasureScope] = []
+        for scope in await self._gather_scopes(operations):
+            try:
+                self._block_on_legal_hold(scope)
+            except LegalHoldException:
+                continue
+            erasable.append(scope)
+
+        await self._erase(erasable)
+
+        logger.info(
+            f"Bulk erasure processed {len(operations)} operations, "
+            f"{len(operations) - len(erasable)} blocked"
+        )
+        return operations
+
+    def _require_verified(self, operation: ErasureOperation, force: bool) -> None:
+        """Check that an operation may be processed.
+
+        Raises:
+            ErasureVerificationError: If the operation is not verified
+        """
         if (
             not force
             and operation.status != ErasureStatus.VERIFIED
@@ -356,59 +496,119 @@ class ErasureService:
                 f"Operation not verified: {operation.status.value}",
             )
 
-        # Check for legal holds
-        has_blocking_hold, legal_hold_items = self._check_legal_holds(operation)
+    async def _gather_scopes(self, operations: list[ErasureOperation]) -> list[_ErasureScope]:
+        """Gather the data in scope of each operation.
 
-        if has_blocking_hold and self.config.block_on_any_legal_hold:
-            operation.status = ErasureStatus.BLOCKED
-            for item in legal_hold_items:
-                operation.retained_items.append(
-                    {
-                        "data_id": str(item.data_id),
-                        "data_type": item.data_type.value,
-                        "exemption": item.exemption.value,
-                        "details": item.exemption_details,
-                    }
-                )
-            operation.add_audit_entry(
-                "blocked_legal_hold",
-                {
-                    "items_blocked": len(legal_hold_items),
-                },
-            )
+        Retention records and stored data items are fetched once per
+        tenant for all of its operations.
 
-            raise LegalHoldException(
-                operation.subject_id,
-                (
-                    legal_hold_items[0].exemption_details
-                    if legal_hold_items
-                    else "Legal hold in effect"
-                ),
-            )
+        Args:
+            operations: The erasure operations
 
-        # Start processing
-        operation.status = ErasureStatus.PROCESSING
-        operation.started_at = datetime.utcnow()
-        operation.add_audit_entry("processing_started")
+        Returns:
+            Scope of each operation, in operation order
+        """
+        by_tenant: dict[UUID, list[ErasureOperation]] = {}
+        for operation in operations:
+            by_tenant.setdefault(operation.tenant_id, []).append(operation)
+
+        scopes: dict[UUID, _ErasureScope] = {}
+        for tenant_id, tenant_operations in by_tenant.items():
+            records = await self._retention_manager.get_records_by_tenant(tenant_id)
+
+            if self._data_store is None:
+                # Without subject data, every record of the tenant is in scope
+                for operation in tenant_operations:
+                    scopes[operation.operation_id] = _ErasureScope(
+                        operation=operation,
+                        records=[r for r in records if _in_scope(operation, r.data_type)],
+                    )
+                continue
+
+            items_by_subject: dict[UUID, list[SubjectDataItem]] = {}
+            for item in await self._data_store.find_subject_data(
+                tenant_id, {operation.subject_id for operation in tenant_operations}
+            ):
+                items_by_subject.setdefault(item.subject_id, []).append(item)
+            records_by_data_id = {record.data_id: record for record in records}
+
+            for operation in tenant_operations:
+                items = [
+                    item
+                    for item in items_by_subject.get(operation.subject_id, ())
+                    if _in_scope(operation, item.data_type)
+                ]
+                scopes[operation.operation_id] = _ErasureScope(
+                    operation=operation,
+                    records=[
+                        records_by_data_id[item.data_id]
+                        for item in items
+                        if item.data_id in records_by_data_id
+                    ],
+                    items=items,
+                )
 
-        try:
-            # Get all data for this tenant/subject
-            records = [
-                r
-                for r in self._retention_manager._records.values()
-                if r.tenant_id == operation.tenant_id
-            ]
+        return [scopes[operation.operation_id] for operation in operations]
 
-            # Filter by data type if specified
-            if operation.requested_data_types:
-                records = [r for r in records if r.data_type in operation.requested_data_types]
+    async def _erase(self, scopes: list[_ErasureScope]) -> None:
+        """Erase the data of operations that passed verification and hold checks.
 
-            # Process each record
-            for record in records:
-                await self._process_record(operation, record)
+        Does not raise: a batch that fails to be written back or deleted
+        only fails the data items in it, and is recorded in the errors of
+        the operations those items belong to. Operations with errors end
+        up partially completed.
+
+        Args:
+            scopes: The operations and their data
+        """
+        for scope in scopes:
+            scope.operation.status = ErasureStatus.PROCESSING
+            scope.operation.started_at = datetime.utcnow()
+            scope.operation.add_audit_entry("processing_started")
+
+        # Records to delete, with the operations they are erased for
+        deletions: dict[UUID, tuple[RetentionRecord, list[ErasureOperation]]] = {}
+        to_anonymize: list[tuple[SubjectDataItem, ErasureOperation]] = []
+
+        for scope in scopes:
+            operation = scope.operation
+            retained: set[UUID] = set()
+            for record in scope.records:
+                retained_item = self._retained_item(record)
+                if retained_item is not None:
+                    operation.retained_items.append(retained_item)
+                    retained.add(record.data_id)
+                elif record.status != RetentionStatus.DELETED:
+                    deletions.setdefault(record.record_id, (record, []))[1].append(operation)
+
+            tracked = {record.data_id for record in scope.records}
+            for item in scope.items:
+                if item.data_id in retained or item.data_type in DATA_TYPE_EXEMPTIONS:
+                    continue
+                # Untracked items cannot be deleted, so they are always anonymized
+                if self.config.anonymize_before_delete or item.data_id not in tracked:
+                    to_anonymize.append((item, operation))
+
+        anonymized = await self._anonymize_items(to_anonymize)
+        deleted = await self._delete_records(list(deletions.values()))
+
+        # Deleted items are reported by their deletion
+        timestamp = datetime.utcnow().isoformat()
+        for item, operation in to_anonymize:
+            if item.data_id in anonymized and item.data_id not in deleted:
+                operation.erased_items.append(
+                    {
+                        "data_id": str(item.data_id),
+                        "data_type": item.data_type.value,
+                        "action": ErasureType.ANONYMIZE.value,
+                        "timestamp": timestamp,
+                    }
+                )
 
+        for scope in scopes:
+            operation = scope.operation
             # Determine final status
-            if operation.items_retained_count > 0:
+            if operation.items_retained_count > 0 or operation.errors:
                 operation.status = ErasureStatus.PARTIALLY_COMPLETED
             else:
                 operation.status = ErasureStatus.COMPLETED
@@ -419,137 +619,164 @@ class ErasureService:
                 {
                     "items_erased": operation.items_erased_count,
                     "items_retained": operation.items_retained_count,
+                    "errors": len(operation.errors),
                 },
             )
 
             logger.info(
-                f"Erasure operation {operation_id} completed: "
+                f"Erasure operation {operation.operation_id} completed: "
                 f"{operation.items_erased_count} erased, "
-                f"{operation.items_retained_count} retained"
+                f"{operation.items_retained_count} retained, "
+                f"{len(operation.errors)} errors"
             )
 
-        except Exception as e:
-            operation.errors.append(str(e))
-            operation.add_audit_entry("processing_error", {"error": str(e)})
-            logger.error(f"Error processing erasure {operation_id}: {e}")
-            raise
-
-        return operation
-
-    async def _process_record(
-        self,
-        operation: ErasureOperation,
-        record: Any,
-    ) -> None:
-        """Process a single retention record for erasure.
+    def _retained_item(self, record: RetentionRecord) -> dict[str, Any] | None:
+        """Get the retained item entry for a record that must not be erased.
 
         Args:
-            operation: The erasure operation
-            record: The retention record to process
+            record: The retention record
+
+        Returns:
+            Retained item entry, or None if the record can be erased
         """
         # Check for regulatory exemptions
         if record.data_type in DATA_TYPE_EXEMPTIONS:
-            exemption, reason, retention_days = DATA_TYPE_EXEMPTIONS[record.data_type]
-            operation.retained_items.append(
-                {
-                    "data_id": str(record.data_id),
-                    "data_type": record.data_type.value,
-                    "exemption": exemption.value,
-                    "details": reason,
-                    "legal_basis": reason,
-                }
-            )
-            return
+            exemption, reason, _retention_days = DATA_TYPE_EXEMPTIONS[record.data_type]
+            return {
+                "data_id": str(record.data_id),
+                "data_type": record.data_type.value,
+                "exemption": exemption.value,
+                "details": reason,
+                "legal_basis": reason,
+            }
 
         # Check legal hold
         if record.legal_hold:
-            operation.retained_items.append(
-                {
-                    "data_id": str(record.data_id),
-                    "data_type": record.data_type.value,
-                    "exemption": ErasureExemption.LEGAL_HOLD.value,
-                    "details": record.legal_hold_reason or "Legal hold in effect",
-                }
-            )
-            return
-
-        # Anonymize if configured
-        if self.config.anonymize_before_delete:
-            await self._anonymize_subject_data(operation.subject_id, record.data_type)
-
-        # Process deletion through retention manager
-        success = await self._retention_manager.process_deletion(record)
+            return {
+                "data_id": str(record.data_id),
+                "data_type": record.data_type.value,
+                "exemption": ErasureExemption.LEGAL_HOLD.value,
+                "details": record.legal_hold_reason or "Legal hold in effect",
+            }
 
-        if success:
-            operation.erased_items.append(
-                {
-                    "data_id": str(record.data_id),
-                    "data_type": record.data_type.value,
-                    "action": operation.erasure_type.value,
-                    "timestamp": datetime.utcnow().isoformat(),
-                }
-            )
-        else:
-            operation.errors.append(f"Failed to delete {record.data_type.value}: {record.data_id}")
+        return None
 
-    async def _anonymize_subject_data(
+    async def _anonymize_items(
         self,
-        subject_id: UUID,
-        data_type: DataType,
-    ) -> bool:
-        """Anonymize PII while preserving statistical data.
+        items: list[tuple[SubjectDataItem, ErasureOperation]],
+    ) -> set[UUID]:
+        """Anonymize PII in stored data items while preserving statistical data.
+
+        Items are anonymized per data type in batches, and each batch is
+        written back with a single save.
 
         Args:
-            subject_id: ID of the subject
-            data_type: Type of data to anonymize
+            items: Items to anonymize, with the operation they belong to
 
         Returns:
-            True if anonymization was successful
+            IDs of the items that were anonymized
         """
-        # Create sample data structure for the data type
-        # In production, this would fetch actual data from database
-        sample_data = {
-            "subject_id": str(subject_id),
-            "full_name": "John Smith",
-            "email": "john.smith@example.com",
-            "ssn": "123-45-6789",
-            "date_of_birth": "1985-03-15",
-            "address": "123 Main Street",
-            "city": "Springfield",
-            "state": "IL",
-            "phone": "555-123-4567",
-        }
+        if self._data_store is None or not items:
+            return set()
+
+        by_type: dict[DataType, list[tuple[SubjectDataItem, ErasureOperation]]] = {}
+        for entry in items:
+            by_type.setdefault(entry[0].data_type, []).append(entry)
+
+        anonymized: set[UUID] = set()
+        batch_size = self.config.bulk_batch_size
+        for data_type, typed in by_type.items():
+            rules = DATA_TYPE_ANONYMIZATION_RULES.get(data_type)
+            for start in range(0, len(typed), batch_size):
+                batch = typed[start : start + batch_size]
+                try:
+                    results = self._anonymizer.anonymize_records(
+                        [item.payload for item, _ in batch],
+                        data_ids=[item.data_id for item, _ in batch],
+                        data_type=data_type,
+                        explicit_rules=rules,
+                    )
 
-        # Define rules based on data type
-        rules = {}
-        if data_type in (DataType.ENTITY_PROFILE, DataType.SCREENING_RAW_DATA):
-            # Anonymize all PII fields
-            rules = {
-                "full_name": AnonymizationRule("full_name", AnonymizationMethod.REDACTION),
-                "email": AnonymizationRule("email", AnonymizationMethod.TOKENIZATION),
-                "ssn": AnonymizationRule("ssn", AnonymizationMethod.MASKING, preserve_format=True),
-                "phone": AnonymizationRule(
-                    "phone", AnonymizationMethod.MASKING, preserve_format=True
-                ),
-            }
+                    now = datetime.utcnow()
+                    saved: list[tuple[SubjectDataItem, dict[str, Any]]] = []
+                    for (item, operation), (payload, result) in zip(batch, results, strict=True):
+                        if result.success:
+                            saved.append((item, payload))
+                        else:
+                            operation.errors.append(
+                                f"Failed to anonymize {data_type.value}: {item.data_id}"
+                            )
+
+                    await self._data_store.save_items(
+                        [
+                            replace(item, payload=payload, anonymized_at=now)
+                            for item, payload in saved
+                        ]
+                    )
+                except Exception as e:
+                    _batch_failed(
+                        [operation for _, operation in batch],
+                        f"Failed to anonymize {len(batch)} {data_type.value} items: {e}",
+                    )
+                    continue
 
-        # Perform anonymization
-        anonymized, result = self._anonymizer.anonymize_record(
-            sample_data,
-            data_id=subject_id,
-            data_type=data_type,
-            explicit_rules=rules,
-        )
+                for item, payload in saved:
+                    item.payload = payload
+                    item.anonymized_at = now
+                    anonymized.add(item.data_id)
 
-        if result.success:
-            logger.info(
-                f"Anonymized {len(result.fields_anonymized)} fields for "
-                f"{data_type.value} of subject {subject_id}"
-            )
-            return True
-        else:
-            logger.error(f"Anonymization failed: {result.error_message}")
-            return False
+        logger.info(f"Anonymized {len(anonymized)} data items")
+        return anonymized
+
+    async def _delete_records(
+        self,
+        deletions: list[tuple[RetentionRecord, list[ErasureOperation]]],
+    ) -> set[UUID]:
+        """Delete records through the retention manager in batches.
+
+        A batch that fails is recorded in its operations' errors, and the
+        remaining batches are still deleted.
+
+        Args:
+            deletions: Records to delete, with the operations they are erased for
+
+        Returns:
+            Data IDs of the deleted records
+        """
+        deleted: set[UUID] = set()
+        batch_size = self.config.bulk_batch_size
+        for start in range(0, len(deletions), batch_size):
+            batch = deletions[start : start + batch_size]
+            try:
+                results = await self._retention_manager.process_deletions(
+                    [record for record, _ in batch]
+                )
+            except Exception as e:
+                _batch_failed(
+                    [operation for _, operations in batch for operation in operations],
+                    f"Failed to delete {len(batch)} records: {e}",
+                )
+                continue
+
+            timestamp = datetime.utcnow().isoformat()
+            for (record, operations), success in zip(batch, results, strict=True):
+                if success:
+                    deleted.add(record.data_id)
+                for operation in operations:
+                    if success:
+                        operation.erased_items.append(
+                            {
+                                "data_id": str(record.data_id),
+                                "data_type": record.data_type.value,
+                                "action": operation.erasure_type.value,
+                                "timestamp": timestamp,
+                            }
+                        )
+                    else:
+                        operation.errors.append(
+                            f"Failed to delete {record.data_type.value}: {record.data_id}"
+                        )
+        return deleted
 
     # =========================================================================
     # Reporting
@@ -794,6 +1021,7 @@ def initialize_erasure_service(
     config: ErasureServiceConfig | None = None,
     retention_manager: RetentionManager | None = None,
     anonymizer: DataAnonymizer | None = None,
+    data_store: SubjectDataStore | None = None,
 ) -> ErasureService:
     """Initialize the global erasure service.
 
@@ -801,6 +1029,7 @@ def initialize_erasure_service(
         config: Service configuration
         retention_manager: Optional retention manager
         anonymizer: Optional anonymizer
+        data_store: Optional subject data store
 
     Returns:
         The initialized ErasureService
@@ -810,5 +1039,6 @@ def initialize_erasure_service(
         config=config,
         retention_manager=retention_manager,
         anonymizer=anonymizer,
+        data_store=data_store,
     )
     return _service
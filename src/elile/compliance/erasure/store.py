@@ -0,0 +1,315 @@
+"""Subject data storage for bulk erasure.
+
+Erasing a subject means finding everything held about them (profiles,
+cache entries, audit payloads, screening results) and anonymizing or
+deleting it. A SubjectDataStore answers that with one set-based query per
+tenant for any number of subjects, and writes anonymized payloads back in
+batches, so the ErasureService does not issue a query and an update per
+data item.
+
+Classes:
+    SubjectDataItem: One stored data item about a subject
+    SubjectDataStore: Protocol for subject data storage
+    InMemorySubjectDataStore: In-memory store implementation
+    SQLAlchemySubjectDataStore: Store over the profile, cache and audit tables
+"""
+
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Protocol
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from elile.compliance.retention.types import DataType
+from elile.core.encryption import Encryptor, get_encryptor
+from elile.db.models.audit import AuditEvent
+from elile.db.models.cache import CachedDataSource
+from elile.db.models.entity import Entity
+from elile.db.models.profile import ProfileTrigger
+from elile.db.profile_delta import SNAPSHOT_FIELDS
+from elile.db.repositories.profile import ProfileRepository
+from elile.providers.cache_payload import decode_json_payload, encode_json_payload, encode_payload
+
+
+@dataclass
+class SubjectDataItem:
+    """A stored data item about a data subject.
+
+    Attributes:
+        data_id: ID of the data item (as tracked by the retention manager)
+        data_type: Type of the data
+        subject_id: Subject the data is about
+        tenant_id: Tenant that owns the data
+        payload: Stored fields of the item
+        anonymized_at: When the payload was anonymized
+    """
+
+    data_id: UUID
+    data_type: DataType
+    subject_id: UUID
+    tenant_id: UUID
+    payload: dict[str, Any] = field(default_factory=dict)
+    anonymized_at: datetime | None = None
+
+
+class SubjectDataStore(Protocol):
+    """Protocol for subject data storage."""
+
+    async def find_subject_data(
+        self,
+        tenant_id: UUID,
+        subject_ids: Collection[UUID],
+        data_types: Collection[DataType] | None = None,
+    ) -> list[SubjectDataItem]:
+        """Find all data items about a set of subjects in one query.
+
+        Args:
+            tenant_id: Tenant that owns the data
+            subject_ids: Subjects to find data for
+            data_types: Data types to include (None = all)
+
+        Returns:
+            Data items about any of the subjects
+        """
+        ...
+
+    async def save_items(self, items: list[SubjectDataItem]) -> None:
+        """Write back the payloads of data items in one batch."""
+        ...
+
+
+class InMemorySubjectDataStore:
+    """In-memory implementation of SubjectDataStore for testing.
+
+    Items are indexed by tenant and subject.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the store."""
+        self._items: dict[UUID, SubjectDataItem] = {}
+        self._by_subject: dict[tuple[UUID, UUID], dict[UUID, None]] = {}
+
+    def __len__(self) -> int:
+        """Get the number of stored items."""
+        return len(self._items)
+
+    async def find_subject_data(
+        self,
+        tenant_id: UUID,
+        subject_ids: Collection[UUID],
+        data_types: Collection[DataType] | None = None,
+    ) -> list[SubjectDataItem]:
+        """Find all data items about a set of subjects in one query."""
+        found: list[SubjectDataItem] = []
+        for subject_id in subject_ids:
+            for data_id in self._by_subject.get((tenant_id, subject_id), ()):
+                item = self._items[data_id]
+                if data_types is None or item.data_type in data_types:
+                    found.append(item)
+        return found
+
+    async def save_items(self, items: list[SubjectDataItem]) -> None:
+        """Insert or update data items in one batch."""
+        for item in items:
+            previous = self._items.get(item.data_id)
+            if previous is not None:
+                key = (previous.tenant_id, previous.subject_id)
+                self._by_subject[key].pop(item.data_id, None)
+            self._items[item.data_id] = item
+            self._by_subject.setdefault((item.tenant_id, item.subject_id), {})[item.data_id] = None
+
+    def get_item(self, data_id: UUID) -> SubjectDataItem | None:
+        """Get a data item by ID."""
+        return self._items.get(data_id)
+
+
+# Data types stored in entity_profiles
+_PROFILE_TYPES = {DataType.ENTITY_PROFILE, DataType.SCREENING_RESULT}
+
+
+class SQLAlchemySubjectDataStore:
+    """SubjectDataStore over the tables that hold subject data.
+
+    A subject is an entity of the tenant, and its data items are rows
+    keyed by the entity ID:
+
+    - ``entity_profiles``: profiles created by a screening are
+      SCREENING_RESULT items, other profiles ENTITY_PROFILE items; the
+      payload is the snapshot (findings, risk score, connections, sources)
+    - ``cached_data_sources``: CACHE_ENTRY items; the payload is the
+      decrypted normalized data
+    - ``audit_events``: AUDIT_LOG items; the payload is the event data
+
+    Each table is queried with ``entity_id IN (...)``, ``chunk_size``
+    subjects per statement to stay within the database's bind parameter
+    limit, and items are written back with one batched UPDATE per table
+    and chunk. ``anonymized_at`` is not stored.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        encryptor: Encryptor | None = None,
+        chunk_size: int = 1000,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            session_factory: Factory for database sessions
+            encryptor: Encryptor of cached payloads (uses the configured one if None)
+            chunk_size: Subjects or items per statement
+        """
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+        self._encryptor = encryptor
+
+    @property
+    def encryptor(self) -> Encryptor:
+        """Get the encryptor of cached payloads."""
+        if self._encryptor is None:
+            self._encryptor = get_encryptor()
+        return self._encryptor
+
+    async def find_subject_data(
+        self,
+        tenant_id: UUID,
+        subject_ids: Collection[UUID],
+        data_types: Collection[DataType] | None = None,
+    ) -> list[SubjectDataItem]:
+        """Find all data items about a set of subjects, one query per table and chunk."""
+        types = set(DataType) if data_types is None else set(data_types)
+        subjects = list(subject_ids)
+        found: list[SubjectDataItem] = []
+        async with self.session_factory() as session:
+            for start in range(0, len(subjects), self.chunk_size):
+                chunk = subjects[start : start + self.chunk_size]
+                if types & _PROFILE_TYPES:
+                    found.extend(await self._find_profiles(session, tenant_id, chunk, types))
+                if DataType.CACHE_ENTRY in types:
+                    found.extend(await self._find_cache_entries(session, tenant_id, chunk))
+                if DataType.AUDIT_LOG in types:
+                    found.extend(await self._find_audit_events(session, tenant_id, chunk))
+        return found
+
+    async def save_items(self, items: list[SubjectDataItem]) -> None:
+        """Write back the payloads of data items, one UPDATE per table and chunk.
+
+        Raises:
+            ValueError: If an item's data type is not stored in these tables
+        """
+        if not items:
+            return
+
+        profiles: dict[UUID, dict[str, Any]] = {}
+        cache_rows: list[dict[str, Any]] = []
+        audit_rows: list[dict[str, Any]] = []
+        for item in items:
+            if item.data_type in _PROFILE_TYPES:
+                profiles[item.data_id] = {name: item.payload.get(name) for name in SNAPSHOT_FIELDS}
+            elif item.data_type == DataType.CACHE_ENTRY:
+                cache_rows.append(
+                    {
+                        "cache_id": item.data_id,
+                        "normalized_payload": encode_json_payload(self.encryptor, item.payload),
+                        "normalized_data": None,
+                        # The raw response cannot be anonymized field by field
+                        "raw_response": encode_payload(self.encryptor, b""),
+                    }
+                )
+            elif item.data_type == DataType.AUDIT_LOG:
+                audit_rows.append({"audit_id": item.data_id, "event_data": item.payload})
+            else:
+                raise ValueError(f"No table stores {item.data_type.value} items")
+
+        async with self.session_factory() as session:
+            repository = ProfileRepository(session)
+            profile_ids = list(profiles)
+            for start in range(0, len(profile_ids), self.chunk_size):
+                chunk = profile_ids[start : start + self.chunk_size]
+                await repository.replace_snapshots(
+                    {profile_id: profiles[profile_id] for profile_id in chunk}, commit=False
+                )
+            for model, rows in ((CachedDataSource, cache_rows), (AuditEvent, audit_rows)):
+                for start in range(0, len(rows), self.chunk_size):
+                    await session.execute(update(model), rows[start : start + self.chunk_size])
+            await session.commit()
+
+    async def _find_profiles(
+        self,
+        session: AsyncSession,
+        tenant_id: UUID,
+        subject_ids: list[UUID],
+        types: set[DataType],
+    ) -> list[SubjectDataItem]:
+        profiles = await ProfileRepository(session).get_for_entities(
+            subject_ids, tenant_id=tenant_id
+        )
+        items = []
+        for profile in profiles:
+            data_type = (
+                DataType.SCREENING_RESULT
+                if profile.trigger_type == ProfileTrigger.SCREENING.value
+                else DataType.ENTITY_PROFILE
+            )
+            if data_type in types:
+                items.append(
+                    SubjectDataItem(
+                        data_id=profile.profile_id,
+                        data_type=data_type,
+                        subject_id=profile.entity_id,
+                        tenant_id=tenant_id,
+                        payload={name: getattr(profile, name) for name in SNAPSHOT_FIELDS},
+                    )
+                )
+        return items
+
+    async def _find_cache_entries(
+        self, session: AsyncSession, tenant_id: UUID, subject_ids: list[UUID]
+    ) -> list[SubjectDataItem]:
+        stmt = (
+            select(
+                CachedDataSource.cache_id,
+                CachedDataSource.entity_id,
+                CachedDataSource.normalized_payload,
+                CachedDataSource.normalized_data,
+            )
+            .join(Entity, Entity.entity_id == CachedDataSource.entity_id)
+            .where(CachedDataSource.entity_id.in_(subject_ids), Entity.tenant_id == tenant_id)
+        )
+        items = []
+        for cache_id, entity_id, payload, legacy_data in await session.execute(stmt):
+            if payload is not None:
+                data = decode_json_payload(self.encryptor, payload)
+            else:
+                data = legacy_data  # Written before payloads were encrypted
+            items.append(
+                SubjectDataItem(
+                    data_id=cache_id,
+                    data_type=DataType.CACHE_ENTRY,
+                    subject_id=entity_id,
+                    tenant_id=tenant_id,
+                    payload=dict(data or {}),
+                )
+            )
+        return items
+
+    async def _find_audit_events(
+        self, session: AsyncSession, tenant_id: UUID, subject_ids: list[UUID]
+    ) -> list[SubjectDataItem]:
+        stmt = select(AuditEvent.audit_id, AuditEvent.entity_id, AuditEvent.event_data).where(
+            AuditEvent.tenant_id == tenant_id, AuditEvent.entity_id.in_(subject_ids)
+        )
+        return [
+            SubjectDataItem(
+                data_id=audit_id,
+                data_type=DataType.AUDIT_LOG,
+                subject_id=entity_id,
+                tenant_id=tenant_id,
+                payload=dict(event_data),
+            )
+            for audit_id, entity_id, event_data in await session.execute(stmt)
+        ]
@@ -48,7 +48,7 @@ class ErasureStatus(str, Enum):
     """Successfully completed."""
 
     PARTIALLY_COMPLETED = "partially_completed"
-    """Some data deleted, some retained due to exemptions."""
+    """Some data deleted, some retained due to exemptions or failed to erase."""
 
     REJECTED = "rejected"
     """Request rejected (invalid, duplicate, etc.)."""
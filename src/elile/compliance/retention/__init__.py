@@ -17,7 +17,7 @@ Usage:
     manager = get_retention_manager()
 
     # Track data retention
-    record = manager.track_data(
+    record = await manager.track_data(
         data_id=some_uuid,
         data_type=DataType.SCREENING_RESULT,
         tenant_id=tenant_uuid,
@@ -25,7 +25,7 @@ Usage:
     )
 
     # Place legal hold
-    manager.place_legal_hold(some_uuid, "Litigation hold - Case #123")
+    await manager.place_legal_hold(some_uuid, "Litigation hold - Case #123")
 
     # Submit erasure request
     request = await manager.submit_erasure_request(
@@ -36,30 +36,48 @@ Usage:
     )
 
     # Generate compliance report
-    report = manager.generate_report(tenant_id=tenant_uuid)
+    report = await manager.generate_report(tenant_id=tenant_uuid)
+
+    # Sweep due records (resumes an interrupted sweep)
+    progress = await manager.run_sweep()
 """
 
-from elile.compliance.retention.manager import (
-    RetentionManager,
-    RetentionManagerConfig,
-    get_retention_manager,
-    initialize_retention_manager,
-)
-from elile.compliance.retention.policies import (
-    get_default_policies,
-    get_policies_for_locale,
-    get_policy_for_data_type,
-)
-from elile.compliance.retention.types import (
-    DataType,
-    DeletionMethod,
-    ErasureRequest,
-    RetentionAction,
-    RetentionPolicy,
-    RetentionRecord,
-    RetentionReport,
-    RetentionStatus,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.compliance.retention.manager import (
+        RetentionManager,
+        RetentionManagerConfig,
+        get_retention_manager,
+        initialize_retention_manager,
+    )
+    from elile.compliance.retention.policies import (
+        get_default_policies,
+        get_policies_for_locale,
+        get_policy_for_data_type,
+    )
+    from elile.compliance.retention.store import (
+        InMemoryRetentionStore,
+        RetentionStore,
+        SQLAlchemyRetentionStore,
+        create_bulk_delete_callback,
+    )
+    from elile.compliance.retention.types import (
+        DataType,
+        DeletionMethod,
+        ErasureRequest,
+        RetentionAction,
+        RetentionPolicy,
+        RetentionRecord,
+        RetentionReport,
+        RetentionStatus,
+        RetentionSweepPhase,
+        RetentionSweepProgress,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Types
@@ -67,11 +85,18 @@ __all__ = [
     "DeletionMethod",
     "RetentionAction",
     "RetentionStatus",
+    "RetentionSweepPhase",
     # Models
     "RetentionPolicy",
     "RetentionRecord",
     "RetentionReport",
     "ErasureRequest",
+    "RetentionSweepProgress",
+    # Storage
+    "RetentionStore",
+    "InMemoryRetentionStore",
+    "SQLAlchemyRetentionStore",
+    "create_bulk_delete_callback",
     # Manager
     "RetentionManager",
     "RetentionManagerConfig",
@@ -6,6 +6,12 @@ This module provides the RetentionManager class that:
 - Handles archival and deletion workflows
 - Processes erasure requests
 - Generates compliance reports
+
+Records live in a RetentionStore with due-time indexes. Retention sweeps
+claim only the records whose deadlines have passed, process them in
+chunks (one store transaction per chunk, with bulk archive and delete
+callbacks where configured) and checkpoint their progress so an
+interrupted sweep resumes where it stopped.
 """
 
 import asyncio
@@ -21,6 +27,7 @@ from elile.compliance.retention.policies import (
     get_default_policies,
     get_policy_for_data_type,
 )
+from elile.compliance.retention.store import InMemoryRetentionStore, RetentionStore
 from elile.compliance.retention.types import (
     DataType,
     DeletionMethod,
@@ -30,6 +37,8 @@ from elile.compliance.retention.types import (
     RetentionRecord,
     RetentionReport,
     RetentionStatus,
+    RetentionSweepPhase,
+    RetentionSweepProgress,
 )
 from elile.compliance.types import Locale
 
@@ -41,6 +50,12 @@ DeletionCallback = Callable[[UUID, DataType], Coroutine[Any, Any, bool]]
 ArchiveCallback = Callable[[UUID, DataType, dict[str, Any]], Coroutine[Any, Any, bool]]
 AnonymizeCallback = Callable[[UUID, DataType], Coroutine[Any, Any, bool]]
 
+# Bulk callbacks take a whole chunk and return one success flag per item
+BulkDeletionCallback = Callable[[list[tuple[UUID, DataType]]], Coroutine[Any, Any, list[bool]]]
+BulkArchiveCallback = Callable[
+    [list[tuple[UUID, DataType, dict[str, Any]]]], Coroutine[Any, Any, list[bool]]
+]
+
 
 @dataclass
 class RetentionManagerConfig:
@@ -51,7 +66,7 @@ class RetentionManagerConfig:
     """How often to check for expired data."""
 
     batch_size: int = 100
-    """Number of items to process per batch."""
+    """Number of items to process per batch (one store transaction per batch)."""
 
     # Warning thresholds
     warning_days: int = 30
@@ -88,6 +103,9 @@ class RetentionManager:
         delete_callback: DeletionCallback | None = None,
         archive_callback: ArchiveCallback | None = None,
         anonymize_callback: AnonymizeCallback | None = None,
+        store: RetentionStore | None = None,
+        bulk_delete_callback: BulkDeletionCallback | None = None,
+        bulk_archive_callback: BulkArchiveCallback | None = None,
     ):
         """Initialize the retention manager.
 
@@ -96,14 +114,20 @@ class RetentionManager:
             delete_callback: Async function to delete data
             archive_callback: Async function to archive data
             anonymize_callback: Async function to anonymize data
+            store: Retention record store (defaults to in-memory)
+            bulk_delete_callback: Async function to delete a batch of data
+                items; preferred over delete_callback for batches
+            bulk_archive_callback: Async function to archive a batch of data
+                items; preferred over archive_callback for batches
         """
         self.config = config or RetentionManagerConfig()
         self._delete_callback = delete_callback
         self._archive_callback = archive_callback
         self._anonymize_callback = anonymize_callback
+        self._bulk_delete_callback = bulk_delete_callback
+        self._bulk_archive_callback = bulk_archive_callback
 
-        # In-memory storage for records (would be database in production)
-        self._records: dict[UUID, RetentionRecord] = {}
+        self._store: RetentionStore = store if store is not None else InMemoryRetentionStore()
         self._policies: dict[UUID, RetentionPolicy] = {}
         self._erasure_requests: dict[UUID, ErasureRequest] = {}
 
@@ -161,7 +185,7 @@ class RetentionManager:
     # Record Management
     # =========================================================================
 
-    def track_data(
+    async def track_data(
         self,
         data_id: UUID,
         data_type: DataType,
@@ -224,12 +248,12 @@ class RetentionManager:
             },
         )
 
-        self._records[record.record_id] = record
+        await self._store.save_records([record])
         logger.debug(f"Tracking retention for {data_type} {data_id}, expires {expires_at}")
 
         return record
 
-    def get_record(self, record_id: UUID) -> RetentionRecord | None:
+    async def get_record(self, record_id: UUID) -> RetentionRecord | None:
         """Get a retention record by ID.
 
         Args:
@@ -238,9 +262,9 @@ class RetentionManager:
         Returns:
             The record, or None if not found
         """
-        return self._records.get(record_id)
+        return await self._store.get_record(record_id)
 
-    def get_record_by_data_id(self, data_id: UUID) -> RetentionRecord | None:
+    async def get_record_by_data_id(self, data_id: UUID) -> RetentionRecord | None:
         """Get a retention record by data ID.
 
         Args:
@@ -249,12 +273,9 @@ class RetentionManager:
         Returns:
             The record, or None if not found
         """
-        for record in self._records.values():
-            if record.data_id == data_id:
-                return record
-        return None
+        return await self._store.get_record_by_data_id(data_id)
 
-    def get_records_by_status(self, status: RetentionStatus) -> list[RetentionRecord]:
+    async def get_records_by_status(self, status: RetentionStatus) -> list[RetentionRecord]:
         """Get all records with a specific status.
 
         Args:
@@ -263,9 +284,9 @@ class RetentionManager:
         Returns:
             List of matching records
         """
-        return [r for r in self._records.values() if r.status == status]
+        return await self._store.get_records_by_status(status)
 
-    def get_records_by_tenant(self, tenant_id: UUID) -> list[RetentionRecord]:
+    async def get_records_by_tenant(self, tenant_id: UUID) -> list[RetentionRecord]:
         """Get all records for a tenant.
 
         Args:
@@ -274,13 +295,13 @@ class RetentionManager:
         Returns:
             List of tenant's records
         """
-        return [r for r in self._records.values() if r.tenant_id == tenant_id]
+        return await self._store.get_records_by_tenant(tenant_id)
 
     # =========================================================================
     # Legal Hold Management
     # =========================================================================
 
-    def place_legal_hold(
+    async def place_legal_hold(
         self,
         data_id: UUID,
         reason: str,
@@ -294,16 +315,17 @@ class RetentionManager:
         Returns:
             True if hold was placed successfully
         """
-        record = self.get_record_by_data_id(data_id)
+        record = await self.get_record_by_data_id(data_id)
         if record is None:
             logger.error(f"Cannot place legal hold: no record for {data_id}")
             return False
 
         record.place_legal_hold(reason)
+        await self._store.save_records([record])
         logger.info(f"Legal hold placed on {data_id}: {reason}")
         return True
 
-    def release_legal_hold(self, data_id: UUID) -> bool:
+    async def release_legal_hold(self, data_id: UUID) -> bool:
         """Release a legal hold on data.
 
         Args:
@@ -312,7 +334,7 @@ class RetentionManager:
         Returns:
             True if hold was released successfully
         """
-        record = self.get_record_by_data_id(data_id)
+        record = await self.get_record_by_data_id(data_id)
         if record is None:
             logger.error(f"Cannot release legal hold: no record for {data_id}")
             return False
@@ -322,6 +344,7 @@ class RetentionManager:
             return False
 
         record.release_legal_hold()
+        await self._store.save_records([record])
         logger.info(f"Legal hold released on {data_id}")
         return True
 
@@ -332,63 +355,117 @@ class RetentionManager:
     async def check_expiring_data(self) -> list[RetentionRecord]:
         """Find data that is expiring soon.
 
+        Only records not already flagged are returned.
+
         Returns:
             List of records approaching expiry
         """
         warning_threshold = datetime.utcnow() + timedelta(days=self.config.warning_days)
-        expiring = []
-
-        for record in self._records.values():
-            if record.legal_hold:
-                continue
-            if record.status in (RetentionStatus.DELETED, RetentionStatus.ARCHIVED):
-                continue
-            if record.expires_at <= warning_threshold:
-                if record.status != RetentionStatus.EXPIRY_WARNING:
-                    record.status = RetentionStatus.EXPIRY_WARNING
-                expiring.append(record)
-
+        expiring = await self._store.claim_due(RetentionSweepPhase.WARNING, warning_threshold)
+        await self._mark(expiring, RetentionStatus.EXPIRY_WARNING)
         return expiring
 
     async def check_expired_data(self) -> list[RetentionRecord]:
         """Find data that has expired.
 
         Returns:
-            List of expired records
+            List of records newly marked for deletion
         """
-        now = datetime.utcnow()
-        expired = []
-
-        for record in self._records.values():
-            if record.legal_hold:
-                continue
-            if record.status in (RetentionStatus.DELETED, RetentionStatus.ARCHIVED):
-                continue
-            if record.expires_at <= now:
-                record.status = RetentionStatus.DELETION_PENDING
-                expired.append(record)
-
+        expired = await self._store.claim_due(RetentionSweepPhase.EXPIRY, datetime.utcnow())
+        await self._mark(expired, RetentionStatus.DELETION_PENDING)
         return expired
 
     async def check_archive_pending(self) -> list[RetentionRecord]:
         """Find data that should be archived.
 
         Returns:
-            List of records pending archival
+            List of records newly marked for archival
         """
-        now = datetime.utcnow()
-        pending = []
+        pending = await self._store.claim_due(RetentionSweepPhase.ARCHIVAL, datetime.utcnow())
+        await self._mark(pending, RetentionStatus.ARCHIVE_PENDING)
+        return pending
 
-        for record in self._records.values():
-            if record.legal_hold:
-                continue
-            if record.status != RetentionStatus.ACTIVE:
-                continue
-            if record.archive_at and record.archive_at <= now:
-                record.status = RetentionStatus.ARCHIVE_PENDING
-                pending.append(record)
+    async def _mark(self, records: list[RetentionRecord], status: RetentionStatus) -> None:
+        for record in records:
+            record.status = status
+        await self._store.save_records(records)
 
-        return pending
+    async def run_sweep(self, as_of: datetime | None = None) -> RetentionSweepProgress:
+        """Run a retention sweep over every due record.
+
+        Flags records approaching expiry, marks expired records for
+        deletion (deleting them when auto_delete is set) and marks records
+        past their archive date for archival (archiving them when
+        auto_archive is set). Records are claimed and processed in chunks
+        of batch_size, and each chunk is saved together with the sweep
+        checkpoint. An unfinished sweep is resumed with its original
+        cutoff rather than starting a new one.
+
+        Args:
+            as_of: Cutoff time for a new sweep (defaults to now)
+
+        Returns:
+            The sweep checkpoint, complete
+        """
+        progress = await self._store.get_sweep_progress()
+        if progress is None or progress.is_complete:
+            progress = RetentionSweepProgress(as_of=as_of or datetime.utcnow())
+        else:
+            logger.info(f"Resuming retention sweep {progress.sweep_id} at {progress.phase.value}")
+
+        phases = list(RetentionSweepPhase)
+        while progress.phase is not None:
+            phase = progress.phase
+            cutoff = progress.as_of
+            if phase == RetentionSweepPhase.WARNING:
+                cutoff += timedelta(days=self.config.warning_days)
+
+            while chunk := await self._store.claim_due(phase, cutoff, self.config.batch_size):
+                await self._sweep_chunk(phase, chunk, progress)
+                progress.chunks += 1
+                await self._store.save_records(chunk, progress)
+
+            next_index = phases.index(phase) + 1
+            progress.phase = phases[next_index] if next_index < len(phases) else None
+            if progress.phase is None:
+                progress.completed_at = datetime.utcnow()
+            await self._store.save_records([], progress)
+
+        logger.info(
+            f"Retention sweep {progress.sweep_id} completed: "
+            f"{progress.warned} warned, {progress.expired} expired, "
+            f"{progress.deleted} deleted, {progress.archived} archived, "
+            f"{progress.failed} failed in {progress.chunks} chunks"
+        )
+        return progress
+
+    async def _sweep_chunk(
+        self,
+        phase: RetentionSweepPhase,
+        chunk: list[RetentionRecord],
+        progress: RetentionSweepProgress,
+    ) -> None:
+        """Apply one sweep phase to a chunk of due records."""
+        if phase == RetentionSweepPhase.WARNING:
+            for record in chunk:
+                record.status = RetentionStatus.EXPIRY_WARNING
+            progress.warned += len(chunk)
+        elif phase == RetentionSweepPhase.EXPIRY:
+            for record in chunk:
+                record.status = RetentionStatus.DELETION_PENDING
+            progress.expired += len(chunk)
+            if self.config.auto_delete:
+                results = await self._delete_records(chunk)
+                progress.deleted += sum(results)
+                progress.failed += results.count(False)
+        else:
+            for record in chunk:
+                record.status = RetentionStatus.ARCHIVE_PENDING
+            progress.archive_due += len(chunk)
+            if self.config.auto_archive:
+                results = await self._archive_records(chunk)
+                progress.archived += sum(results)
+                progress.failed += results.count(False)
 
     async def process_archival(self, record: RetentionRecord) -> bool:
         """Archive a data item.
@@ -399,37 +476,74 @@ class RetentionManager:
         Returns:
             True if archival was successful
         """
-        if record.legal_hold:
-            logger.warning(f"Cannot archive {record.data_id}: under legal hold")
-            return False
+        return (await self.process_archivals([record]))[0]
 
-        policy = self._policies.get(record.policy_id)
-        if policy is None:
-            logger.error(f"No policy found for record {record.record_id}")
-            return False
+    async def process_archivals(self, records: list[RetentionRecord]) -> list[bool]:
+        """Archive a batch of data items.
+
+        Uses the bulk archive callback when configured, and saves the
+        records in one store transaction.
 
-        if self._archive_callback:
+        Args:
+            records: The retention records
+
+        Returns:
+            Success flag for each record
+        """
+        results = await self._archive_records(records)
+        await self._store.save_records(records)
+        return results
+
+    async def _archive_records(self, records: list[RetentionRecord]) -> list[bool]:
+        """Archive records without saving them."""
+        results = [False] * len(records)
+        batch: list[tuple[int, RetentionRecord, RetentionPolicy]] = []
+        for i, record in enumerate(records):
+            if record.legal_hold:
+                logger.warning(f"Cannot archive {record.data_id}: under legal hold")
+                continue
+            policy = self._policies.get(record.policy_id)
+            if policy is None:
+                logger.error(f"No policy found for record {record.record_id}")
+                continue
+            batch.append((i, record, policy))
+
+        if not batch:
+            return results
+
+        items = [
+            (
+                record.data_id,
+                record.data_type,
+                {"policy": policy.name, "expires_at": record.expires_at.isoformat()},
+            )
+            for _, record, policy in batch
+        ]
+        if self._bulk_archive_callback:
             try:
-                success = await self._archive_callback(
-                    record.data_id,
-                    record.data_type,
-                    {"policy": policy.name, "expires_at": record.expires_at.isoformat()},
-                )
-                if success:
-                    record.status = RetentionStatus.ARCHIVED
-                    record.add_event(RetentionAction.ARCHIVED)
-                    logger.info(f"Archived {record.data_type} {record.data_id}")
-                    return True
+                archived = await self._bulk_archive_callback(items)
             except Exception as e:
-                logger.error(f"Archive failed for {record.data_id}: {e}")
-                return False
+                logger.error(f"Bulk archive of {len(items)} items failed: {e}")
+                archived = [False] * len(items)
+        elif self._archive_callback:
+            archived = []
+            for data_id, data_type, metadata in items:
+                try:
+                    archived.append(await self._archive_callback(data_id, data_type, metadata))
+                except Exception as e:
+                    logger.error(f"Archive failed for {data_id}: {e}")
+                    archived.append(False)
         else:
             # No callback, just mark as archived
-            record.status = RetentionStatus.ARCHIVED
-            record.add_event(RetentionAction.ARCHIVED)
-            return True
+            archived = [True] * len(items)
 
-        return False
+        for (i, record, _), success in zip(batch, archived, strict=True):
+            if success:
+                record.status = RetentionStatus.ARCHIVED
+                record.add_event(RetentionAction.ARCHIVED)
+                logger.info(f"Archived {record.data_type} {record.data_id}")
+                results[i] = True
+        return results
 
     async def process_deletion(self, record: RetentionRecord) -> bool:
         """Delete a data item.
@@ -440,41 +554,79 @@ class RetentionManager:
         Returns:
             True if deletion was successful
         """
-        if record.legal_hold:
-            logger.warning(f"Cannot delete {record.data_id}: under legal hold")
-            return False
+        return (await self.process_deletions([record]))[0]
 
-        policy = self._policies.get(record.policy_id)
-        if policy is None:
-            logger.error(f"No policy found for record {record.record_id}")
-            return False
+    async def process_deletions(self, records: list[RetentionRecord]) -> list[bool]:
+        """Delete a batch of data items.
+
+        Records are grouped by their policy's deletion method. Hard
+        deletes use the bulk delete callback when configured, and the
+        records are saved in one store transaction.
 
-        # Archive first if required
-        if policy.archive_before_delete and record.status != RetentionStatus.ARCHIVED:
-            await self.process_archival(record)
-
-        # Execute deletion based on method
-        success = False
-
-        if policy.deletion_method == DeletionMethod.SOFT_DELETE:
-            success = await self._soft_delete(record)
-        elif policy.deletion_method == DeletionMethod.HARD_DELETE:
-            success = await self._hard_delete(record)
-        elif policy.deletion_method == DeletionMethod.ANONYMIZE:
-            success = await self._anonymize(record)
-        elif policy.deletion_method == DeletionMethod.CRYPTO_SHRED:
-            success = await self._hard_delete(record)  # Same as hard delete for now
-        elif policy.deletion_method == DeletionMethod.ARCHIVE:
-            # Archive-only, don't actually delete
-            success = await self.process_archival(record)
-
-        if success:
-            record.status = RetentionStatus.DELETED
-            record.deleted_at = datetime.utcnow()
-            record.add_event(RetentionAction.DELETED, {"method": policy.deletion_method.value})
-            logger.info(f"Deleted {record.data_type} {record.data_id} ({policy.deletion_method})")
-
-        return success
+        Args:
+            records: The retention records
+
+        Returns:
+            Success flag for each record
+        """
+        results = await self._delete_records(records)
+        await self._store.save_records(records)
+        return results
+
+    async def _delete_records(self, records: list[RetentionRecord]) -> list[bool]:
+        """Delete records without saving them."""
+        results = [False] * len(records)
+        by_method: dict[DeletionMethod, list[int]] = {}
+        to_archive: list[RetentionRecord] = []
+        for i, record in enumerate(records):
+            if record.legal_hold:
+                logger.warning(f"Cannot delete {record.data_id}: under legal hold")
+                continue
+            policy = self._policies.get(record.policy_id)
+            if policy is None:
+                logger.error(f"No policy found for record {record.record_id}")
+                continue
+            # Archive first if required
+            if policy.archive_before_delete and record.status != RetentionStatus.ARCHIVED:
+                to_archive.append(record)
+            by_method.setdefault(policy.deletion_method, []).append(i)
+
+        if to_archive:
+            await self._archive_records(to_archive)
+
+        for method, indexes in by_method.items():
+            batch = [records[i] for i in indexes]
+            if method == DeletionMethod.SOFT_DELETE:
+                deleted = [await self._soft_delete(record) for record in batch]
+            elif method in (DeletionMethod.HARD_DELETE, DeletionMethod.CRYPTO_SHRED):
+                # Crypto shred is the same as hard delete for now
+                deleted = await self._hard_delete_many(batch)
+            elif method == DeletionMethod.ANONYMIZE:
+                deleted = [await self._anonymize(record) for record in batch]
+            else:
+                # Archive-only, don't actually delete
+                deleted = await self._archive_records(batch)
+
+            for i, record, success in zip(indexes, batch, deleted, strict=True):
+                if success:
+                    record.status = RetentionStatus.DELETED
+                    record.deleted_at = datetime.utcnow()
+                    record.add_event(RetentionAction.DELETED, {"method": method.value})
+                    logger.info(f"Deleted {record.data_type} {record.data_id} ({method})")
+                    results[i] = True
+        return results
+
+    async def _hard_delete_many(self, records: list[RetentionRecord]) -> list[bool]:
+        """Hard delete records, in one call if a bulk callback is configured."""
+        if self._bulk_delete_callback:
+            try:
+                return await self._bulk_delete_callback(
+                    [(record.data_id, record.data_type) for record in records]
+                )
+            except Exception as e:
+                logger.error(f"Bulk delete of {len(records)} items failed: {e}")
+                return [False] * len(records)
+        return [await self._hard_delete(record) for record in records]
 
     async def _soft_delete(self, record: RetentionRecord) -> bool:  # noqa: ARG002
         """Perform soft delete (mark as deleted)."""
@@ -586,12 +738,8 @@ class RetentionManager:
         request.status = "processing"
 
         # Find all records for this subject
-        subject_records = [
-            r
-            for r in self._records.values()
-            if r.tenant_id == request.tenant_id
-            # In production, would also filter by subject_id
-        ]
+        # In production, would also filter by subject_id
+        subject_records = await self._store.get_records_by_tenant(request.tenant_id)
 
         # Filter by data type if specified
         if request.requested_data_types:
@@ -640,7 +788,7 @@ class RetentionManager:
     # Reporting
     # =========================================================================
 
-    def generate_report(self, tenant_id: UUID | None = None) -> RetentionReport:
+    async def generate_report(self, tenant_id: UUID | None = None) -> RetentionReport:
         """Generate a retention status report.
 
         Args:
@@ -654,13 +802,9 @@ class RetentionManager:
             tenant_id=tenant_id,
         )
 
-        records = (
-            self.get_records_by_tenant(tenant_id) if tenant_id else list(self._records.values())
-        )
-
         now = datetime.utcnow()
 
-        for record in records:
+        async for record in self._store.iter_records(tenant_id):
             # Count by status
             if record.status == RetentionStatus.ACTIVE:
                 report.active_count += 1
@@ -724,22 +868,7 @@ class RetentionManager:
             try:
                 await asyncio.sleep(self.config.check_interval_seconds)
 
-                # Check for expiring data
-                expiring = await self.check_expiring_data()
-                if expiring:
-                    logger.info(f"Found {len(expiring)} items approaching expiry")
-
-                # Check for expired data
-                expired = await self.check_expired_data()
-                if expired and self.config.auto_delete:
-                    for record in expired[: self.config.batch_size]:
-                        await self.process_deletion(record)
-
-                # Check for archive pending
-                archive_pending = await self.check_archive_pending()
-                if archive_pending and self.config.auto_archive:
-                    for record in archive_pending[: self.config.batch_size]:
-                        await self.process_archival(record)
+                await self.run_sweep()
 
             except asyncio.CancelledError:
                 break
@@ -768,6 +897,9 @@ def initialize_retention_manager(
     delete_callback: DeletionCallback | None = None,
     archive_callback: ArchiveCallback | None = None,
     anonymize_callback: AnonymizeCallback | None = None,
+    store: RetentionStore | None = None,
+    bulk_delete_callback: BulkDeletionCallback | None = None,
+    bulk_archive_callback: BulkArchiveCallback | None = None,
 ) -> RetentionManager:
     """Initialize the global retention manager.
 
@@ -776,6 +908,9 @@ def initialize_retention_manager(
         delete_callback: Async function to delete data
         archive_callback: Async function to archive data
         anonymize_callback: Async function to anonymize data
+        store: Retention record store (defaults to in-memory)
+        bulk_delete_callback: Async function to delete a batch of data items
+        bulk_archive_callback: Async function to archive a batch of data items
 
     Returns:
         The initialized RetentionManager
@@ -786,5 +921,8 @@ def initialize_retention_manager(
         delete_callback=delete_callback,
         archive_callback=archive_callback,
         anonymize_callback=anonymize_callback,
+        store=store,
+        bulk_delete_callback=bulk_delete_callback,
+        bulk_archive_callback=bulk_archive_callback,
     )
     return _manager
@@ -0,0 +1,542 @@
+"""Retention record storage with due-time indexes.
+
+The RetentionManager keeps its records in a RetentionStore rather than
+scanning an in-memory dict. Stores index records by tenant, data ID and
+status, and keep one due-time index per sweep phase, so a retention sweep
+only touches records whose deadline has actually passed:
+
+- WARNING: records not yet warned, keyed on expires_at
+- EXPIRY: records that can still expire, keyed on expires_at
+- ARCHIVAL: active records with an archive date, keyed on archive_at
+
+Records under legal hold, deleted, archived or already pending deletion
+are in none of the due indexes.
+
+Classes:
+    RetentionStore: Protocol for retention record storage
+    InMemoryRetentionStore: In-memory store implementation
+    SQLAlchemyRetentionStore: Store backed by the retention tables
+
+Functions:
+    create_bulk_delete_callback: Bulk deletion of data rows for the manager
+"""
+
+import heapq
+import logging
+from collections.abc import AsyncIterator, Mapping
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Protocol
+from uuid import UUID
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from elile.compliance.retention.types import (
+    DataType,
+    RetentionRecord,
+    RetentionStatus,
+    RetentionSweepPhase,
+    RetentionSweepProgress,
+)
+from elile.db.models.retention import RetentionRecordModel, RetentionSweep
+
+if TYPE_CHECKING:
+    from elile.compliance.retention.manager import BulkDeletionCallback
+
+logger = logging.getLogger(__name__)
+
+# Statuses that still have an open warning or expiry deadline
+_EXPIRING_STATUSES = frozenset(
+    {RetentionStatus.ACTIVE, RetentionStatus.ARCHIVE_PENDING, RetentionStatus.EXPIRY_WARNING}
+)
+
+
+def due_deadlines(record: RetentionRecord) -> list[tuple[RetentionSweepPhase, datetime]]:
+    """Get the sweep phases a record is waiting for, with their deadlines.
+
+    Args:
+        record: The retention record
+
+    Returns:
+        (phase, due time) pairs; empty if no sweep needs to touch the record
+    """
+    if record.legal_hold or record.status not in _EXPIRING_STATUSES:
+        return []
+    deadlines = [(RetentionSweepPhase.EXPIRY, record.expires_at)]
+    if record.status != RetentionStatus.EXPIRY_WARNING:
+        deadlines.append((RetentionSweepPhase.WARNING, record.expires_at))
+    if record.status == RetentionStatus.ACTIVE and record.archive_at is not None:
+        deadlines.append((RetentionSweepPhase.ARCHIVAL, record.archive_at))
+    return deadlines
+
+
+class RetentionStore(Protocol):
+    """Protocol for retention record storage."""
+
+    async def save_records(
+        self,
+        records: list[RetentionRecord],
+        progress: RetentionSweepProgress | None = None,
+    ) -> None:
+        """Insert or update records in one transaction.
+
+        Args:
+            records: Records to save
+            progress: Sweep checkpoint to save in the same transaction
+        """
+        ...
+
+    async def get_record(self, record_id: UUID) -> RetentionRecord | None:
+        """Get a record by ID."""
+        ...
+
+    async def get_record_by_data_id(self, data_id: UUID) -> RetentionRecord | None:
+        """Get the record tracking a data item."""
+        ...
+
+    async def get_records_by_status(self, status: RetentionStatus) -> list[RetentionRecord]:
+        """Get all records with a status."""
+        ...
+
+    async def get_records_by_tenant(self, tenant_id: UUID) -> list[RetentionRecord]:
+        """Get all records of a tenant."""
+        ...
+
+    def iter_records(self, tenant_id: UUID | None = None) -> AsyncIterator[RetentionRecord]:
+        """Iterate over all records, optionally of one tenant."""
+        ...
+
+    async def claim_due(
+        self,
+        phase: RetentionSweepPhase,
+        as_of: datetime,
+        limit: int | None = None,
+    ) -> list[RetentionRecord]:
+        """Claim records whose deadline for a phase is at or before ``as_of``.
+
+        Records are returned earliest deadline first. A claimed record is
+        not returned for the phase again unless it is saved back still
+        waiting for it.
+
+        Args:
+            phase: Sweep phase whose deadline to check
+            as_of: Cutoff time
+            limit: Maximum records to claim (None = all due)
+
+        Returns:
+            Due records
+        """
+        ...
+
+    async def get_sweep_progress(self) -> RetentionSweepProgress | None:
+        """Get the checkpoint of the most recent sweep."""
+        ...
+
+
+class InMemoryRetentionStore:
+    """In-memory implementation of RetentionStore.
+
+    Records are kept as live objects. Saved records are (re)indexed in
+    bulk at the start of the next indexed query, which keeps saves cheap
+    during a sweep. Due indexes are heaps keyed on the deadline; entries
+    left behind by a later save are skipped, and compacted once they
+    outnumber the live ones.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the store."""
+        self._records: dict[UUID, RetentionRecord] = {}
+        self._by_tenant: dict[UUID, dict[UUID, None]] = {}
+        self._by_data_id: dict[UUID, UUID] = {}
+        self._by_status: dict[RetentionStatus, dict[UUID, None]] = {}
+        self._indexed_status: dict[UUID, RetentionStatus] = {}
+        self._due: dict[RetentionSweepPhase, list[tuple[datetime, int, UUID]]] = {
+            phase: [] for phase in RetentionSweepPhase
+        }
+        self._scheduled: dict[UUID, int] = {}
+        self._entries: dict[UUID, int] = {}
+        self._unindexed: dict[UUID, None] = {}
+        self._sequence = 0
+        self._live_entries = 0
+        self._progress: RetentionSweepProgress | None = None
+
+    def __len__(self) -> int:
+        """Get the number of records."""
+        return len(self._records)
+
+    async def save_records(
+        self,
+        records: list[RetentionRecord],
+        progress: RetentionSweepProgress | None = None,
+    ) -> None:
+        """Insert or update records in one transaction."""
+        for record in records:
+            if record.record_id not in self._records:
+                self._records[record.record_id] = record
+                self._by_tenant.setdefault(record.tenant_id, {})[record.record_id] = None
+                self._by_data_id.setdefault(record.data_id, record.record_id)
+            self._unindexed[record.record_id] = None
+        if progress is not None:
+            self._progress = progress
+
+    async def get_record(self, record_id: UUID) -> RetentionRecord | None:
+        """Get a record by ID."""
+        return self._records.get(record_id)
+
+    async def get_record_by_data_id(self, data_id: UUID) -> RetentionRecord | None:
+        """Get the record tracking a data item."""
+        record_id = self._by_data_id.get(data_id)
+        return self._records[record_id] if record_id is not None else None
+
+    async def get_records_by_status(self, status: RetentionStatus) -> list[RetentionRecord]:
+        """Get all records with a status."""
+        self._refresh()
+        return [self._records[record_id] for record_id in self._by_status.get(status, ())]
+
+    async def get_records_by_tenant(self, tenant_id: UUID) -> list[RetentionRecord]:
+        """Get all records of a tenant."""
+        return [self._records[record_id] for record_id in self._by_tenant.get(tenant_id, ())]
+
+    async def iter_records(self, tenant_id: UUID | None = None) -> AsyncIterator[RetentionRecord]:
+        """Iterate over all records, optionally of one tenant."""
+        if tenant_id is None:
+            for record in list(self._records.values()):
+                yield record
+        else:
+            for record in await self.get_records_by_tenant(tenant_id):
+                yield record
+
+    async def claim_due(
+        self,
+        phase: RetentionSweepPhase,
+        as_of: datetime,
+        limit: int | None = None,
+    ) -> list[RetentionRecord]:
+        """Claim records whose deadline for a phase is at or before ``as_of``."""
+        self._refresh()
+        heap = self._due[phase]
+        claimed: list[RetentionRecord] = []
+        while heap and heap[0][0] <= as_of and (limit is None or len(claimed) < limit):
+            _, sequence, record_id = heapq.heappop(heap)
+            if self._scheduled.get(record_id) != sequence:
+                continue  # Saved again since
+            self._entries[record_id] -= 1
+            self._live_entries -= 1
+            claimed.append(self._records[record_id])
+        return claimed
+
+    async def get_sweep_progress(self) -> RetentionSweepProgress | None:
+        """Get the checkpoint of the most recent sweep."""
+        return self._progress
+
+    def _refresh(self) -> None:
+        """Index records saved since the last indexed query."""
+        if not self._unindexed:
+            return
+
+        pushed: dict[RetentionSweepPhase, list[tuple[datetime, int, UUID]]] = {
+            phase: [] for phase in RetentionSweepPhase
+        }
+        for record_id in self._unindexed:
+            record = self._records[record_id]
+
+            previous = self._indexed_status.get(record_id)
+            if previous != record.status:
+                if previous is not None:
+                    del self._by_status[previous][record_id]
+                self._by_status.setdefault(record.status, {})[record_id] = None
+                self._indexed_status[record_id] = record.status
+
+            # A new sequence number invalidates the record's old heap entries
+            self._live_entries -= self._entries.pop(record_id, 0)
+            self._scheduled.pop(record_id, None)
+            deadlines = due_deadlines(record)
+            if deadlines:
+                self._sequence += 1
+                self._scheduled[record_id] = self._sequence
+                self._entries[record_id] = len(deadlines)
+                self._live_entries += len(deadlines)
+                for phase, due_at in deadlines:
+                    pushed[phase].append((due_at, self._sequence, record_id))
+        self._unindexed.clear()
+
+        for phase, entries in pushed.items():
+            heap = self._due[phase]
+            if len(entries) > len(heap):
+                heap.extend(entries)
+                heapq.heapify(heap)
+            else:
+                for entry in entries:
+                    heapq.heappush(heap, entry)
+        self._compact()
+
+    def _compact(self) -> None:
+        total = sum(len(heap) for heap in self._due.values())
+        if total - self._live_entries <= max(self._live_entries, 1024):
+            return
+        for phase, heap in self._due.items():
+            live = [entry for entry in heap if self._scheduled.get(entry[2]) == entry[1]]
+            heapq.heapify(live)
+            self._due[phase] = live
+
+
+# Statuses whose deadline each phase waits for (legal holds are excluded too)
+_PHASE_STATUSES: dict[RetentionSweepPhase, frozenset[RetentionStatus]] = {
+    RetentionSweepPhase.WARNING: _EXPIRING_STATUSES - {RetentionStatus.EXPIRY_WARNING},
+    RetentionSweepPhase.EXPIRY: _EXPIRING_STATUSES,
+    RetentionSweepPhase.ARCHIVAL: frozenset({RetentionStatus.ACTIVE}),
+}
+
+
+class SQLAlchemyRetentionStore:
+    """RetentionStore backed by the retention_records and retention_sweeps tables.
+
+    The due indexes are the (status, expires_at) and (status, archive_at)
+    indexes of retention_records. A claim is a lease: a record claimed by
+    a process that died before saving it back is claimed again once
+    ``claim_lease`` has passed.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        claim_lease: timedelta = timedelta(minutes=15),
+        page_size: int = 1000,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            session_factory: Factory for database sessions
+            claim_lease: How long a claim holds if the record is not saved back
+            page_size: Records read per query by iter_records
+        """
+        self.session_factory = session_factory
+        self.claim_lease = claim_lease
+        self.page_size = page_size
+
+    async def save_records(
+        self,
+        records: list[RetentionRecord],
+        progress: RetentionSweepProgress | None = None,
+    ) -> None:
+        """Insert or update records in one transaction, releasing their claims."""
+        async with self.session_factory() as session:
+            if records:
+                existing = set(
+                    (
+                        await session.execute(
+                            select(RetentionRecordModel.record_id).where(
+                                RetentionRecordModel.record_id.in_([r.record_id for r in records])
+                            )
+                        )
+                    ).scalars()
+                )
+                values = [_row_values(r) for r in records if r.record_id in existing]
+                if values:
+                    await session.execute(update(RetentionRecordModel), values)
+                session.add_all(
+                    RetentionRecordModel(**_row_values(r))
+                    for r in records
+                    if r.record_id not in existing
+                )
+            if progress is not None:
+                await session.merge(
+                    RetentionSweep(
+                        sweep_id=progress.sweep_id,
+                        started_at=progress.started_at,
+                        payload=progress.to_dict(),
+                    )
+                )
+            await session.commit()
+
+    async def get_record(self, record_id: UUID) -> RetentionRecord | None:
+        """Get a record by ID."""
+        async with self.session_factory() as session:
+            row = await session.get(RetentionRecordModel, record_id)
+            return _from_row(row) if row is not None else None
+
+    async def get_record_by_data_id(self, data_id: UUID) -> RetentionRecord | None:
+        """Get the record tracking a data item."""
+        stmt = (
+            select(RetentionRecordModel)
+            .where(RetentionRecordModel.data_id == data_id)
+            .order_by(RetentionRecordModel.record_id)
+            .limit(1)
+        )
+        async with self.session_factory() as session:
+            row = (await session.execute(stmt)).scalar_one_or_none()
+            return _from_row(row) if row is not None else None
+
+    async def get_records_by_status(self, status: RetentionStatus) -> list[RetentionRecord]:
+        """Get all records with a status."""
+        stmt = select(RetentionRecordModel).where(RetentionRecordModel.status == status.value)
+        return await self._fetch(stmt)
+
+    async def get_records_by_tenant(self, tenant_id: UUID) -> list[RetentionRecord]:
+        """Get all records of a tenant."""
+        stmt = select(RetentionRecordModel).where(RetentionRecordModel.tenant_id == tenant_id)
+        return await self._fetch(stmt)
+
+    async def iter_records(self, tenant_id: UUID | None = None) -> AsyncIterator[RetentionRecord]:
+        """Iterate over all records, optionally of one tenant, a page at a time."""
+        stmt = select(RetentionRecordModel).order_by(RetentionRecordModel.record_id)
+        if tenant_id is not None:
+            stmt = stmt.where(RetentionRecordModel.tenant_id == tenant_id)
+        after: UUID | None = None
+        while True:
+            page_stmt = (
+                stmt if after is None else stmt.where(RetentionRecordModel.record_id > after)
+            )
+            page = await self._fetch(page_stmt.limit(self.page_size))
+            for record in page:
+                yield record
+            if len(page) < self.page_size:
+                return
+            after = page[-1].record_id
+
+    async def claim_due(
+        self,
+        phase: RetentionSweepPhase,
+        as_of: datetime,
+        limit: int | None = None,
+    ) -> list[RetentionRecord]:
+        """Claim records whose deadline for a phase is at or before ``as_of``."""
+        deadline = (
+            RetentionRecordModel.archive_at
+            if phase == RetentionSweepPhase.ARCHIVAL
+            else RetentionRecordModel.expires_at
+        )
+        now = datetime.utcnow()
+        stmt = (
+            select(RetentionRecordModel)
+            .where(
+                RetentionRecordModel.status.in_([s.value for s in _PHASE_STATUSES[phase]]),
+                RetentionRecordModel.legal_hold.is_(False),
+                deadline <= as_of,
+                or_(
+                    RetentionRecordModel.claimed_until.is_(None),
+                    RetentionRecordModel.claimed_until < now,
+                ),
+            )
+            .order_by(deadline)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        async with self.session_factory() as session:
+            rows = list((await session.execute(stmt)).scalars().all())
+            for row in rows:
+                row.claimed_until = now + self.claim_lease
+            records = [_from_row(row) for row in rows]
+            await session.commit()
+        return records
+
+    async def get_sweep_progress(self) -> RetentionSweepProgress | None:
+        """Get the checkpoint of the most recent sweep."""
+        stmt = select(RetentionSweep).order_by(RetentionSweep.started_at.desc()).limit(1)
+        async with self.session_factory() as session:
+            row = (await session.execute(stmt)).scalar_one_or_none()
+            return RetentionSweepProgress.from_dict(row.payload) if row is not None else None
+
+    async def _fetch(self, stmt: Any) -> list[RetentionRecord]:
+        async with self.session_factory() as session:
+            return [_from_row(row) for row in (await session.execute(stmt)).scalars().all()]
+
+
+def _row_values(record: RetentionRecord) -> dict[str, Any]:
+    return {
+        "record_id": record.record_id,
+        "tenant_id": record.tenant_id,
+        "data_id": record.data_id,
+        "data_type": record.data_type.value,
+        "status": record.status.value,
+        "legal_hold": record.legal_hold,
+        "expires_at": record.expires_at,
+        "archive_at": record.archive_at,
+        "claimed_until": None,
+        "payload": {
+            "policy_id": str(record.policy_id),
+            "created_at": record.created_at.isoformat(),
+            "deleted_at": record.deleted_at.isoformat() if record.deleted_at else None,
+            "legal_hold_reason": record.legal_hold_reason,
+            "legal_hold_placed_at": (
+                record.legal_hold_placed_at.isoformat() if record.legal_hold_placed_at else None
+            ),
+            "events": record.events,
+        },
+    }
+
+
+def _from_row(row: RetentionRecordModel) -> RetentionRecord:
+    payload = row.payload
+    deleted_at, hold_placed_at = payload.get("deleted_at"), payload.get("legal_hold_placed_at")
+    return RetentionRecord(
+        record_id=row.record_id,
+        data_type=DataType(row.data_type),
+        data_id=row.data_id,
+        tenant_id=row.tenant_id,
+        policy_id=UUID(payload["policy_id"]),
+        status=RetentionStatus(row.status),
+        created_at=datetime.fromisoformat(payload["created_at"]),
+        expires_at=row.expires_at,
+        archive_at=row.archive_at,
+        deleted_at=datetime.fromisoformat(deleted_at) if deleted_at else None,
+        legal_hold=row.legal_hold,
+        legal_hold_reason=payload.get("legal_hold_reason"),
+        legal_hold_placed_at=datetime.fromisoformat(hold_placed_at) if hold_placed_at else None,
+        events=list(payload.get("events", [])),
+    )
+
+
+def create_bulk_delete_callback(
+    session_factory: async_sessionmaker[AsyncSession],
+    tables: Mapping[DataType, Any],
+    *,
+    chunk_size: int = 500,
+) -> "BulkDeletionCallback":
+    """Create a bulk delete callback that removes data rows in chunks.
+
+    Each chunk is one ``DELETE ... WHERE id IN (...)`` statement per table,
+    committed on its own, so a large sweep neither holds one long
+    transaction nor issues a statement per row. A chunk that fails is
+    reported as not deleted without affecting the others; deleting a row
+    that is already gone counts as success.
+
+    Args:
+        session_factory: Factory for database sessions
+        tables: ORM model of each data type's rows, whose primary key is
+            the data ID; items of other data types are not deleted
+        chunk_size: Rows deleted per statement
+
+    Returns:
+        Callback for RetentionManager(bulk_delete_callback=...)
+    """
+
+    async def bulk_delete(items: list[tuple[UUID, DataType]]) -> list[bool]:
+        results = [False] * len(items)
+        by_model: dict[Any, list[int]] = {}
+        for i, (_, data_type) in enumerate(items):
+            model = tables.get(data_type)
+            if model is not None:
+                by_model.setdefault(model, []).append(i)
+
+        for model, indexes in by_model.items():
+            (key,) = model.__mapper__.primary_key
+            for start in range(0, len(indexes), chunk_size):
+                chunk = indexes[start : start + chunk_size]
+                try:
+                    async with session_factory() as session:
+                        await session.execute(
+                            delete(model).where(key.in_([items[i][0] for i in chunk]))
+                        )
+                        await session.commit()
+                except Exception as e:
+                    logger.error(
+                        f"Bulk delete of {len(chunk)} {model.__tablename__} rows failed: {e}"
+                    )
+                    continue
+                for i in chunk:
+                    results[i] = True
+        return results
+
+    return bulk_delete
@@ -5,6 +5,7 @@ This module defines the core types for the data retention framework:
 - DeletionMethod: Methods for removing data
 - RetentionPolicy: Policy configuration for data retention
 - RetentionStatus: Status of data retention lifecycle
+- RetentionSweepPhase / RetentionSweepProgress: Resumable retention sweeps
 """
 
 from dataclasses import dataclass, field
@@ -328,6 +329,108 @@ class RetentionRecord:
         return max(0, delta.days)
 
 
+class RetentionSweepPhase(str, Enum):
+    """Phases of a retention sweep, in the order they run.
+
+    Each phase handles the records whose corresponding deadline is due.
+    """
+
+    WARNING = "warning"
+    """Flag records whose expiry falls within the warning period."""
+
+    EXPIRY = "expiry"
+    """Mark expired records for deletion, deleting them if enabled."""
+
+    ARCHIVAL = "archival"
+    """Mark records past their archive date, archiving them if enabled."""
+
+
+@dataclass
+class RetentionSweepProgress:
+    """Checkpoint of a retention sweep.
+
+    Saved together with every chunk of records the sweep processes, so an
+    interrupted sweep resumes with the same cutoff and counters.
+    """
+
+    sweep_id: UUID = field(default_factory=uuid7)
+    """Unique identifier for this sweep."""
+
+    as_of: datetime = field(default_factory=datetime.utcnow)
+    """Cutoff time deadlines are compared against."""
+
+    phase: RetentionSweepPhase | None = RetentionSweepPhase.WARNING
+    """Phase in progress (None once the sweep is complete)."""
+
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    """When the sweep started."""
+
+    completed_at: datetime | None = None
+    """When the sweep completed."""
+
+    chunks: int = 0
+    """Chunks of records processed."""
+
+    warned: int = 0
+    """Records flagged as approaching expiry."""
+
+    expired: int = 0
+    """Records marked for deletion."""
+
+    deleted: int = 0
+    """Records deleted."""
+
+    archive_due: int = 0
+    """Records marked for archival."""
+
+    archived: int = 0
+    """Records archived."""
+
+    failed: int = 0
+    """Archivals or deletions that failed."""
+
+    @property
+    def is_complete(self) -> bool:
+        """Check if the sweep has finished every phase."""
+        return self.phase is None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "sweep_id": str(self.sweep_id),
+            "as_of": self.as_of.isoformat(),
+            "phase": self.phase.value if self.phase else None,
+            "started_at": self.started_at.isoformat(),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "chunks": self.chunks,
+            "warned": self.warned,
+            "expired": self.expired,
+            "deleted": self.deleted,
+            "archive_due": self.archive_due,
+            "archived": self.archived,
+            "failed": self.failed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RetentionSweepProgress":
+        """Create from a dictionary produced by to_dict()."""
+        completed_at = data.get("completed_at")
+        return cls(
+            sweep_id=UUID(data["sweep_id"]),
+            as_of=datetime.fromisoformat(data["as_of"]),
+            phase=RetentionSweepPhase(data["phase"]) if data.get("phase") else None,
+            started_at=datetime.fromisoformat(data["started_at"]),
+            completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+            chunks=data.get("chunks", 0),
+            warned=data.get("warned", 0),
+            expired=data.get("expired", 0),
+            deleted=data.get("deleted", 0),
+            archive_due=data.get("archive_due", 0),
+            archived=data.get("archived", 0),
+            failed=data.get("failed", 0),
+        )
+
+
 @dataclass
 class RetentionReport:
     """Summary report of retention status across data."""
@@ -78,7 +78,8 @@ class RuleRepository:
     """Repository for loading and querying compliance rules.
 
     Provides efficient lookup of rules by locale, check type, and role.
-    Rules are indexed for fast access.
+    Rules are indexed for fast access. The version increases whenever
+    rules are loaded, so compiled decision tables can detect staleness.
     """
 
     def __init__(self, rules: Sequence[ComplianceRule] | None = None):
@@ -91,6 +92,7 @@ class RuleRepository:
         self._by_locale: dict[Locale, list[ComplianceRule]] = {}
         self._by_check: dict[CheckType, list[ComplianceRule]] = {}
         self._by_locale_check: dict[tuple[Locale, CheckType], list[ComplianceRule]] = {}
+        self._version = 0
 
         if rules:
             self.load_rules(rules)
@@ -103,6 +105,12 @@ class RuleRepository:
         """
         for rule in rules:
             self._add_rule(rule)
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Get the rule set version, increased on every load."""
+        return self._version
 
     def _add_rule(self, rule: ComplianceRule) -> None:
         """Add a single rule to indexes."""
@@ -224,7 +232,7 @@ class RuleRepository:
 
         # Apply built-in tier restrictions
         if check_type in ENHANCED_TIER_CHECKS:
-            restriction.requires_enhanced_tier = True
+            restriction = restriction.model_copy(update={"requires_enhanced_tier": True})
             if tier == ServiceTier.STANDARD:
                 restriction = CheckRestriction(
                     check_type=check_type,
@@ -236,7 +244,7 @@ class RuleRepository:
 
         # Apply built-in consent requirements
         if check_type in EXPLICIT_CONSENT_CHECKS:
-            restriction.requires_consent = True
+            restriction = restriction.model_copy(update={"requires_consent": True})
 
         # Apply role restrictions if specified
         if restriction.role_categories and role_category not in restriction.role_categories:
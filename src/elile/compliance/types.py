@@ -11,7 +11,7 @@ from datetime import timedelta
 from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Locale(str, Enum):
@@ -170,9 +170,12 @@ class CheckRestriction(BaseModel):
     """Outcome of compliance rule evaluation for a specific check.
 
     Represents whether a check is permitted and any restrictions
-    that apply based on locale, role, and tier.
+    that apply based on locale, role, and tier. Immutable, so compiled
+    decisions can be shared between callers.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     check_type: CheckType
     permitted: bool = True
     restriction_type: RestrictionType | None = None
@@ -209,8 +212,11 @@ class CheckResult(BaseModel):
     """Result of evaluating whether a check can be performed.
 
     This is the output of the compliance engine's evaluate_check method.
+    Immutable, since the engine returns precomputed results.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     check_type: CheckType
     locale: Locale
     permitted: bool
@@ -125,6 +125,28 @@ class Settings(BaseSettings):
     API_PORT: int = 8000
     CORS_ORIGINS: list[str] = []
 
+    # Audit Logging (buffered writer batches events outside request transactions).
+    # Each process spools to AUDIT_SPOOL_PATH with its PID added, so workers can
+    # share the directory; rejected events go to <stem>.rejected<suffix> there.
+    AUDIT_BUFFERED: bool = False
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL: float = 0.5
+    AUDIT_SPOOL_PATH: str | None = "var/audit/spool.jsonl"
+
+    # Notification outboxes (monitoring alerts, HRIS updates) are stored in the
+    # database and dispatched in the background; finished messages are pruned.
+    OUTBOX_DISPATCH_ENABLED: bool = True
+    OUTBOX_DISPATCH_INTERVAL: float = 5.0
+    OUTBOX_RETENTION_HOURS: float = 168.0
+
+    # Provider reference data (sanctions lists, breach catalogs, institutions).
+    # With a directory, datasets are snapshotted there and shared by processes.
+    # Preloading loads them when the API app or a queue manager is created, so
+    # workers forked afterwards (gunicorn --preload) share the loaded pages.
+    REFERENCE_DATA_DIR: str | None = None
+    REFERENCE_DATA_RELOAD_INTERVAL: float = 60.0
+    REFERENCE_DATA_PRELOAD: bool = False
+
     # Multi-Tenancy
     DEFAULT_TENANT_ID: str = "00000000-0000-0000-0000-000000000000"
 
@@ -137,6 +159,21 @@ class Settings(BaseSettings):
     # Iterative Search Configuration
     iterative_search: IterativeSearchConfig = IterativeSearchConfig()
 
+    # LLM Response Cache (deterministic calls only unless nonzero temperature enabled)
+    llm_cache_enabled: bool = False
+    llm_cache_backend: Literal["memory", "redis", "sqlite"] = "memory"
+    llm_cache_ttl_seconds: int = 86400
+    llm_cache_max_entries: int = 1024
+    llm_cache_nonzero_temperature: bool = False
+    llm_cache_sqlite_path: str = ".cache/llm_responses.sqlite3"
+
+    # LLM Call Scheduler (per-provider limits, priority queue, fallback)
+    llm_scheduler_enabled: bool = False
+    llm_max_concurrency: int = 8
+    llm_tokens_per_minute: int = 400_000
+    llm_max_retries: int = 3
+    llm_fallback_providers: list[ModelProvider] = []
+
     def get_api_key(self, provider: ModelProvider) -> SecretStr | None:
         """Get API key for the specified provider."""
         match provider:
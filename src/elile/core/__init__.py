@@ -1,34 +1,62 @@
 """Core services and utilities for Elile."""
 
-from .audit import AuditLogger, audit_operation, audit_operation_v2
-from .context import (
-    ActorType,
-    CacheScope,
-    RequestContext,
-    create_context,
-    get_current_context,
-    get_current_context_or_none,
-    request_context,
-    reset_context,
-    set_context,
-)
-from .exceptions import (
-    BudgetExceededError,
-    ComplianceError,
-    ConsentExpiredError,
-    ConsentScopeError,
-    ContextNotSetError,
-    TenantAccessDeniedError,
-    TenantInactiveError,
-    TenantNotFoundError,
-)
-from .tenant import TenantService
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .audit import AuditLogger, audit_operation, audit_operation_v2
+    from .audit_writer import (
+        AuditWriterConfig,
+        BufferedAuditWriter,
+        get_audit_writer,
+        start_audit_writer,
+        stop_audit_writer,
+    )
+    from .context import (
+        ActorType,
+        CacheScope,
+        RequestContext,
+        create_context,
+        get_current_context,
+        get_current_context_or_none,
+        request_context,
+        reset_context,
+        set_context,
+    )
+    from .exceptions import (
+        AuditWriteError,
+        BudgetExceededError,
+        ComplianceError,
+        ConsentExpiredError,
+        ConsentScopeError,
+        ContextNotSetError,
+        TenantAccessDeniedError,
+        TenantInactiveError,
+        TenantNotFoundError,
+    )
+    from .outbox import (
+        OutboxDispatcher,
+        OutboxDispatcherConfig,
+        get_outbox_dispatcher,
+        retry_delay,
+        start_outbox_dispatcher,
+        stop_outbox_dispatcher,
+    )
+    from .tenant import TenantService
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Audit
     "AuditLogger",
     "audit_operation",
     "audit_operation_v2",
+    "AuditWriterConfig",
+    "BufferedAuditWriter",
+    "get_audit_writer",
+    "start_audit_writer",
+    "stop_audit_writer",
     # Context
     "ActorType",
     "CacheScope",
@@ -40,6 +68,7 @@ __all__ = [
     "reset_context",
     "set_context",
     # Exceptions
+    "AuditWriteError",
     "BudgetExceededError",
     "ComplianceError",
     "ConsentExpiredError",
@@ -48,6 +77,13 @@ __all__ = [
     "TenantAccessDeniedError",
     "TenantInactiveError",
     "TenantNotFoundError",
+    # Outbox
+    "OutboxDispatcher",
+    "OutboxDispatcherConfig",
+    "get_outbox_dispatcher",
+    "retry_delay",
+    "start_outbox_dispatcher",
+    "stop_outbox_dispatcher",
     # Tenant
     "TenantService",
 ]
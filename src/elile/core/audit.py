@@ -9,6 +9,7 @@ from uuid import UUID, uuid7
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from elile.core.audit_writer import BufferedAuditWriter, get_audit_writer
 from elile.db.models.audit import AuditEvent, AuditEventType, AuditSeverity
 
 
@@ -19,13 +20,16 @@ class AuditLogger:
     for compliance, security monitoring, and debugging.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, writer: BufferedAuditWriter | None = None):
         """Initialize audit logger with database session.
 
         Args:
             db: Async SQLAlchemy session for database operations
+            writer: Buffered writer for new events (default: the running
+                global writer; events are flushed in ``db`` if there is none)
         """
         self.db = db
+        self.writer = writer
 
     async def log_event(
         self,
@@ -40,6 +44,7 @@ class AuditLogger:
         resource_id: str | None = None,
         ip_address: str | None = None,
         user_agent: str | None = None,
+        sync: bool = False,
     ) -> AuditEvent:
         """Create an immutable audit log entry.
 
@@ -55,10 +60,15 @@ class AuditLogger:
             resource_id: Optional resource ID
             ip_address: Client IP address
             user_agent: Client user agent string
+            sync: With a buffered writer, wait until the event is committed
 
         Returns:
             Created AuditEvent instance
 
+        Raises:
+            AuditWriteError: With ``sync``, if the buffered writer could not
+                commit the event
+
         Example:
             >>> logger = AuditLogger(db_session)
             >>> event = await logger.log_event(
@@ -89,6 +99,11 @@ class AuditLogger:
             user_agent=user_agent,
         )
 
+        writer = self.writer if self.writer is not None else get_audit_writer()
+        if writer is not None:
+            # Written in its own transaction, batched with other events
+            return await writer.write(event, sync=sync)
+
         self.db.add(event)
         await self.db.flush()
 
@@ -0,0 +1,569 @@
+"""Buffered, batched writer for audit events.
+
+Writing each audit event with its own flush costs a database round-trip
+per event, and a request emits several. BufferedAuditWriter queues events
+in process and a background task writes them with one multi-row INSERT
+per batch, once ``max_batch_size`` events are waiting or every
+``flush_interval`` seconds.
+
+Guarantees:
+- Order: one flusher writes events in the order they were queued, and
+  audit_id and created_at are set when an event is queued, so the events
+  of a correlation ID keep their order when queried.
+- Durability: a batch that cannot be written because the database is
+  unavailable is appended to a local spool file (JSON lines, fsynced) and
+  replayed before any newer event once the database is back. Each process
+  spools to its own file (the spool path with its PID added), and spool
+  files are locked while they are appended to or replayed, so workers
+  sharing a spool directory never replay or remove each other's events
+  mid-write. Any process replays spool files no other process holds,
+  including those left behind by processes that exited. File I/O and
+  locking run in worker threads, and a lock held by another process is
+  waited for with asyncio.sleep, so neither blocks the event loop.
+- Rejected events: a batch the database rejects (constraint violations,
+  bad data) is retried one event at a time, and the events it still
+  rejects are moved to a dead-letter file instead of blocking the events
+  behind them. Spool lines that cannot be parsed are moved there too.
+- Sync writes: ``write(event, sync=True)`` returns only after the event,
+  and everything queued before it, is committed, and raises
+  AuditWriteError if the event was spooled or rejected instead.
+
+Usage:
+    writer = await start_audit_writer(AuditWriterConfig(spool_path=path))
+    logger = AuditLogger(db)  # Uses the started writer
+    await logger.log_event(...)  # Queued
+    await logger.log_event(..., sync=True)  # Committed before returning
+    await stop_audit_writer()  # Flushes what is left
+"""
+
+import asyncio
+import fcntl
+import json
+import logging
+import os
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, Any
+from uuid import UUID, uuid7
+
+from pydantic import BaseModel, Field
+from sqlalchemy import exc, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from elile.core.exceptions import AuditWriteError
+from elile.db.models.audit import AuditEvent
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+# AuditEvent columns written by the writer
+_COLUMNS = (
+    "audit_id",
+    "event_type",
+    "severity",
+    "tenant_id",
+    "user_id",
+    "correlation_id",
+    "entity_id",
+    "resource_type",
+    "resource_id",
+    "event_data",
+    "ip_address",
+    "user_agent",
+    "created_at",
+)
+_UUID_COLUMNS = frozenset({"audit_id", "tenant_id", "user_id", "correlation_id", "entity_id"})
+
+# Seconds between attempts to lock a file another process holds
+_LOCK_RETRY_INTERVAL = 0.05
+
+
+class AuditWriterConfig(BaseModel):
+    """Configuration for the buffered audit writer."""
+
+    max_batch_size: int = Field(default=500, ge=1, description="Events per INSERT")
+    flush_interval: float = Field(
+        default=0.5, gt=0, description="Seconds between background flushes"
+    )
+    max_queue_size: int = Field(
+        default=10_000, ge=1, description="Queued events before writers wait for a flush"
+    )
+    spool_path: Path | None = Field(
+        default=None,
+        description="Spool file for events the database could not take (PID is added per process)",
+    )
+    dead_letter_path: Path | None = Field(
+        default=None,
+        description="File for events the database rejects (default: next to the spool file)",
+    )
+
+
+@dataclass
+class AuditWriterStats:
+    """Statistics for the buffered audit writer."""
+
+    queued: int = 0
+    written: int = 0
+    batches: int = 0
+    spooled: int = 0
+    replayed: int = 0
+    failed_batches: int = 0
+    dead_lettered: int = 0
+
+
+def _row(event: AuditEvent) -> dict[str, Any]:
+    """Get the column values of an event, assigning ID and timestamp if unset."""
+    if event.audit_id is None:
+        event.audit_id = uuid7()
+    if event.created_at is None:
+        event.created_at = datetime.now(UTC)
+    return {name: getattr(event, name) for name in _COLUMNS}
+
+
+def _to_record(row: dict[str, Any]) -> dict[str, Any]:
+    record = dict(row)
+    for name in _UUID_COLUMNS:
+        if record[name] is not None:
+            record[name] = str(record[name])
+    record["created_at"] = record["created_at"].isoformat()
+    return record
+
+
+def _from_record(record: dict[str, Any]) -> dict[str, Any]:
+    row = {name: record[name] for name in _COLUMNS}
+    for name in _UUID_COLUMNS:
+        if row[name] is not None:
+            row[name] = UUID(row[name])
+    row["created_at"] = datetime.fromisoformat(row["created_at"])
+    return row
+
+
+def _dumps(record: dict[str, Any]) -> str:
+    return json.dumps(record, separators=(",", ":"), default=str) + "\n"
+
+
+def _is_unavailable(error: Exception) -> bool:
+    """Check if an error means the database could not be reached.
+
+    Other errors mean the database rejected the rows themselves, and
+    writing them again would fail the same way.
+    """
+    if isinstance(error, exc.DBAPIError):
+        return error.connection_invalidated or isinstance(
+            error, exc.OperationalError | exc.InterfaceError
+        )
+    return isinstance(error, OSError | exc.TimeoutError)
+
+
+def _try_lock(path: Path) -> IO[str] | None:
+    """Open a file for appending and lock it, unless another process holds the lock.
+
+    The file is reopened if another process replaced or removed it before
+    it was locked, so the lock is always on the file at ``path``.
+
+    Returns:
+        The locked file, positioned at its end, or None if it is held
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        handle = path.open("a+", encoding="utf-8")
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            current = os.stat(path).st_ino == os.fstat(handle.fileno()).st_ino
+        except BlockingIOError:
+            handle.close()
+            return None
+        except FileNotFoundError:
+            current = False
+        except BaseException:
+            handle.close()
+            raise
+        if current:
+            return handle
+        handle.close()
+
+
+@asynccontextmanager
+async def _locked(path: Path, *, wait: bool = True) -> AsyncIterator[IO[str] | None]:
+    """Open a file for appending, holding an exclusive lock on it.
+
+    The file is opened and locked in a worker thread. While another
+    process holds the lock, the lock is tried again every
+    ``_LOCK_RETRY_INTERVAL`` seconds rather than blocking the event loop.
+
+    Args:
+        path: File to open (created if missing)
+        wait: Wait for the lock; otherwise yield None if another process holds it
+
+    Yields:
+        The locked file, positioned at its end
+    """
+    while (handle := await asyncio.to_thread(_try_lock, path)) is None:
+        if not wait:
+            yield None
+            return
+        await asyncio.sleep(_LOCK_RETRY_INTERVAL)
+    try:
+        yield handle
+    finally:
+        handle.close()  # Releases the lock
+
+
+def _modified(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:  # Replayed by another process meanwhile
+        return 0.0
+
+
+def _append(handle: IO[str], lines: list[str]) -> None:
+    handle.writelines(lines)
+    handle.flush()
+    os.fsync(handle.fileno())
+
+
+def _read_lines(handle: IO[str]) -> list[str]:
+    handle.seek(0)
+    return handle.readlines()
+
+
+def _rewrite(path: Path, lines: list[str]) -> None:
+    """Replace a file's content atomically."""
+    temporary = path.with_name(path.name + ".tmp")
+    with temporary.open("w", encoding="utf-8") as handle:
+        _append(handle, lines)
+    temporary.replace(path)
+
+
+class BufferedAuditWriter:
+    """In-process queue of audit events written in batches.
+
+    Attributes:
+        config: Writer configuration
+        stats: Write statistics
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory | None = None,
+        config: AuditWriterConfig | None = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            session_factory: Creates sessions for writing (default: the app's)
+            config: Writer configuration
+        """
+        if session_factory is None:
+            from elile.db.config import get_async_session
+
+            session_factory = get_async_session
+
+        self.config = config or AuditWriterConfig()
+        self.stats = AuditWriterStats()
+        self._session_factory = session_factory
+        self._queue: deque[dict[str, Any]] = deque()
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task[None] | None = None
+        # Sync writes waiting for their event: why it was not committed, if it was not
+        self._not_committed: dict[UUID, str | None] = {}
+
+    def __len__(self) -> int:
+        """Get the number of queued events."""
+        return len(self._queue)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background flusher is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def spool_path(self) -> Path | None:
+        """Spool file of this process."""
+        path = self.config.spool_path
+        if path is None:
+            return None
+        return path.with_name(f"{path.stem}.{os.getpid()}{path.suffix}")
+
+    @property
+    def dead_letter_path(self) -> Path | None:
+        """File for events the database rejects."""
+        if self.config.dead_letter_path is not None:
+            return self.config.dead_letter_path
+        path = self.config.spool_path
+        if path is None:
+            return None
+        return path.with_name(f"{path.stem}.rejected{path.suffix}")
+
+    async def start(self) -> None:
+        """Start the background flusher, replaying any spooled events first."""
+        if self.is_running:
+            return
+        await self.flush()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="audit-writer")
+
+    async def stop(self) -> None:
+        """Stop the background flusher and write everything still queued."""
+        if self._task is not None:
+            # Let a flush in progress finish rather than cancelling it
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def write(self, event: AuditEvent, *, sync: bool = False) -> AuditEvent:
+        """Queue an audit event.
+
+        Args:
+            event: Event to write; audit_id and created_at are set if missing
+            sync: Wait until the event is committed
+
+        Returns:
+            The event
+
+        Raises:
+            AuditWriteError: With ``sync``, if the event was spooled or
+                rejected by the database instead of committed
+        """
+        if len(self._queue) >= self.config.max_queue_size:
+            await self.flush()  # Backpressure
+
+        row = _row(event)
+        self._queue.append(row)
+        self.stats.queued += 1
+
+        if sync:
+            audit_id = row["audit_id"]
+            self._not_committed[audit_id] = None
+            try:
+                await self.flush()
+            finally:
+                reason = self._not_committed.pop(audit_id)
+            if reason is not None:
+                raise AuditWriteError(audit_id, reason)
+        elif len(self._queue) >= self.config.max_batch_size:
+            self._wakeup.set()
+        return event
+
+    async def flush(self) -> int:
+        """Write all queued events now.
+
+        Spooled events are replayed first. Batches the database cannot
+        take are spooled, and events it rejects are dead-lettered.
+
+        Returns:
+            Number of events written to the database
+        """
+        async with self._lock:
+            if not await self._replay_spools():
+                # Still down; keep newer events behind the spooled ones
+                await self._spool(self._drain(len(self._queue)))
+                return 0
+
+            written = self.stats.written
+            while self._queue:
+                batch = self._drain(self.config.max_batch_size)
+                inserted, error = await self._insert(batch)
+                if error is not None:
+                    rest = batch[inserted:] + self._drain(len(self._queue))
+                    if self.spool_path is None:
+                        # Nowhere durable to put them; surface the failure
+                        self._queue.extendleft(reversed(rest))
+                        raise error
+                    await self._spool(rest)
+            return self.stats.written - written
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.config.flush_interval)
+            self._wakeup.clear()
+            if self._queue and not self._stopping:
+                try:
+                    await self.flush()
+                except Exception:
+                    logger.exception("Audit writer flush failed")
+
+    def _drain(self, count: int) -> list[dict[str, Any]]:
+        return [self._queue.popleft() for _ in range(min(count, len(self._queue)))]
+
+    async def _insert(self, rows: list[dict[str, Any]]) -> tuple[int, Exception | None]:
+        """Insert rows in one statement, dead-lettering rows the database rejects.
+
+        A rejected batch is retried one row at a time, so only the rows
+        the database rejects on their own are dead-lettered.
+
+        Returns:
+            Number of leading rows written or dead-lettered, and the error
+            if the database became unavailable before the rest
+        """
+        try:
+            # A cancelled caller must not abandon a batch already taken off the queue
+            await asyncio.shield(self._execute(rows))
+        except Exception as e:
+            if _is_unavailable(e):
+                self.stats.failed_batches += 1
+                logger.warning(f"Audit batch of {len(rows)} events not written: {e}")
+                return 0, e
+            if len(rows) == 1:
+                await self._dead_letter(rows, str(e))
+                return 1, None
+            logger.warning(f"Audit batch of {len(rows)} events rejected, writing one by one: {e}")
+            for inserted, row in enumerate(rows):
+                _, error = await self._insert([row])
+                if error is not None:
+                    return inserted, error
+            return len(rows), None
+        self.stats.written += len(rows)
+        self.stats.batches += 1
+        return len(rows), None
+
+    async def _execute(self, rows: list[dict[str, Any]]) -> None:
+        async with self._session_factory() as session:
+            await session.execute(insert(AuditEvent), rows)
+            await session.commit()
+
+    def _not_committed_because(self, rows: list[dict[str, Any]], reason: str) -> None:
+        for row in rows:
+            if row["audit_id"] in self._not_committed:
+                self._not_committed[row["audit_id"]] = reason
+
+    async def _spool(self, rows: list[dict[str, Any]]) -> None:
+        """Append rows to this process's spool file and sync it to disk."""
+        if not rows:
+            return
+        path = self.spool_path
+        assert path is not None  # flush raises without a spool path
+        lines = [_dumps(_to_record(row)) for row in rows]
+        async with _locked(path) as spool:
+            assert spool is not None
+            await asyncio.to_thread(_append, spool, lines)
+        self.stats.spooled += len(rows)
+        self._not_committed_because(rows, f"database unavailable, spooled to {path}")
+        logger.warning(f"Spooled {len(rows)} audit events to {path}")
+
+    async def _dead_letter(self, rows: list[dict[str, Any]], error: str) -> None:
+        """Move rows the database rejects out of the way of the others."""
+        await self._write_dead_letters(
+            [{"error": error, "record": _to_record(row)} for row in rows]
+        )
+        self._not_committed_because(rows, f"rejected by the database: {error}")
+
+    async def _write_dead_letters(self, entries: list[dict[str, Any]]) -> None:
+        self.stats.dead_lettered += len(entries)
+        path = self.dead_letter_path
+        if path is None:
+            for entry in entries:
+                logger.error(f"Dropped audit event rejected by the database: {entry}")
+            return
+        async with _locked(path) as dead_letters:
+            assert dead_letters is not None
+            await asyncio.to_thread(_append, dead_letters, [_dumps(entry) for entry in entries])
+        logger.error(f"Moved {len(entries)} rejected audit events to {path}")
+
+    def _spool_files(self) -> list[Path]:
+        """Get the spool files of every process, this one's last."""
+        base = self.config.spool_path
+        if base is None or not base.parent.exists():
+            return []
+        # Spool files are <stem>.<pid><suffix>; the unsuffixed path is from older versions
+        files = [
+            path
+            for path in base.parent.glob(f"{base.stem}.*{base.suffix}")
+            if path.name[len(base.stem) + 1 : len(path.name) - len(base.suffix)].isdigit()
+        ]
+        if base.exists():
+            files.append(base)
+        own = self.spool_path
+        return sorted(files, key=lambda path: (path == own, _modified(path), path.name))
+
+    async def _replay_spools(self) -> bool:
+        """Write spooled events to the database; False if it is still unavailable.
+
+        Spool files another process holds a lock on are skipped; that
+        process (or a later flush) replays them. This process's own file
+        is waited for, since its events must be written first.
+        """
+        for path in await asyncio.to_thread(self._spool_files):
+            async with _locked(path, wait=path == self.spool_path) as spool:
+                if spool is not None and not await self._replay(path, spool):
+                    return False
+        return True
+
+    async def _replay(self, path: Path, spool: IO[str]) -> bool:
+        """Replay one locked spool file, removing it once it is written."""
+        rows: list[dict[str, Any]] = []
+        corrupt: list[dict[str, Any]] = []
+        for line in await asyncio.to_thread(_read_lines, spool):
+            if not line.strip():
+                continue
+            try:
+                rows.append(_from_record(json.loads(line)))
+            except (ValueError, KeyError, TypeError) as e:
+                # Truncated by a crash mid-write, or otherwise unreadable
+                corrupt.append({"error": f"Unreadable spool line: {e}", "line": line})
+        if corrupt:
+            await self._write_dead_letters(corrupt)
+
+        for start in range(0, len(rows), self.config.max_batch_size):
+            batch = rows[start : start + self.config.max_batch_size]
+            inserted, error = await self._insert(batch)
+            self.stats.replayed += inserted
+            if error is not None:
+                # Keep what is left, in order
+                rest = [_dumps(_to_record(row)) for row in rows[start + inserted :]]
+                await asyncio.to_thread(_rewrite, path, rest)
+                return False
+
+        await asyncio.to_thread(path.unlink)
+        if rows:
+            logger.info(f"Replayed {len(rows)} spooled audit events from {path}")
+        return True
+
+
+# Global writer instance (started with the application)
+_audit_writer: BufferedAuditWriter | None = None
+
+
+def get_audit_writer() -> BufferedAuditWriter | None:
+    """Get the running global audit writer, if any."""
+    return _audit_writer
+
+
+async def start_audit_writer(
+    config: AuditWriterConfig | None = None,
+    session_factory: SessionFactory | None = None,
+) -> BufferedAuditWriter:
+    """Start the global audit writer.
+
+    Args:
+        config: Writer configuration
+        session_factory: Creates sessions for writing (default: the app's)
+
+    Returns:
+        The started writer
+    """
+    global _audit_writer
+
+    if _audit_writer is None:
+        _audit_writer = BufferedAuditWriter(session_factory, config)
+    await _audit_writer.start()
+    return _audit_writer
+
+
+async def stop_audit_writer() -> None:
+    """Stop the global audit writer, writing any queued events."""
+    global _audit_writer
+
+    if _audit_writer is not None:
+        writer, _audit_writer = _audit_writer, None
+        await writer.stop()
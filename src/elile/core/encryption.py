@@ -18,6 +18,10 @@ Usage:
     # JSON field encryption
     encrypted = encrypt_json({"ssn": "123-45-6789"})
     decrypted = decrypt_json(encrypted)
+
+    # Batches (one call for many values)
+    ciphertexts = encryptor.encrypt_many([b"a", b"b"])
+    plaintexts = encryptor.decrypt_many(ciphertexts)
 """
 
 import base64
@@ -25,6 +29,7 @@ import hashlib
 import json
 import os
 import secrets
+from collections.abc import Sequence
 from typing import Any
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
@@ -125,6 +130,62 @@ class Encryptor:
         except Exception as e:
             raise DecryptionError(f"Decryption failed: {e}") from e
 
+    def encrypt_many(
+        self, plaintexts: Sequence[bytes], associated_data: bytes | None = None
+    ) -> list[bytes]:
+        """Encrypt many values in one call.
+
+        Nonces for the whole batch are drawn at once.
+
+        Args:
+            plaintexts: Data to encrypt
+            associated_data: Optional AAD, shared by all values
+
+        Returns:
+            Encrypted values, in the same order
+
+        Raises:
+            EncryptionError: If encryption fails
+        """
+        nonces = secrets.token_bytes(NONCE_SIZE * len(plaintexts))
+        encrypt = self._aesgcm.encrypt
+        try:
+            encrypted = []
+            for i, plaintext in enumerate(plaintexts):
+                nonce = nonces[i * NONCE_SIZE : (i + 1) * NONCE_SIZE]
+                encrypted.append(nonce + encrypt(nonce, plaintext, associated_data))
+            return encrypted
+        except Exception as e:
+            raise EncryptionError(f"Encryption failed: {e}") from e
+
+    def decrypt_many(
+        self, ciphertexts: Sequence[bytes], associated_data: bytes | None = None
+    ) -> list[bytes]:
+        """Decrypt many values in one call.
+
+        Args:
+            ciphertexts: Values encrypted with this key
+            associated_data: Optional AAD, shared by all values
+
+        Returns:
+            Decrypted values, in the same order
+
+        Raises:
+            DecryptionError: If any value fails to decrypt
+        """
+        decrypt = self._aesgcm.decrypt
+        decrypted = []
+        for ciphertext in ciphertexts:
+            if len(ciphertext) < NONCE_SIZE + 16:
+                raise DecryptionError("Ciphertext too short")
+            try:
+                decrypted.append(
+                    decrypt(ciphertext[:NONCE_SIZE], ciphertext[NONCE_SIZE:], associated_data)
+                )
+            except Exception as e:
+                raise DecryptionError(f"Decryption failed: {e}") from e
+        return decrypted
+
     def encrypt_string(self, plaintext: str, associated_data: bytes | None = None) -> str:
         """Encrypt a string and return base64-encoded result.
 
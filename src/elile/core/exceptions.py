@@ -177,3 +177,23 @@ class AuthenticationError(ElileError):
 
     def __str__(self) -> str:
         return f"AuthenticationError: {self.args[0]}"
+
+
+class AuditWriteError(ElileError):
+    """Raised when an audit event written with ``sync=True`` was not committed.
+
+    The event was spooled for a later replay, or rejected by the database
+    and dead-lettered.
+
+    Attributes:
+        audit_id: ID of the event
+        reason: Why the event was not committed
+    """
+
+    def __init__(self, audit_id: UUID, reason: str):
+        super().__init__(f"Audit event {audit_id} was not committed: {reason}")
+        self.audit_id = audit_id
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f"AuditWriteError: {self.args[0]}"
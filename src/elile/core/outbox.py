@@ -0,0 +1,228 @@
+"""Shared delivery machinery for notification outboxes.
+
+Monitoring alerts and HRIS updates are written to an outbox before they
+are sent, and failed sends are retried from there. This module holds what
+those outboxes share:
+
+- retry_delay(): capped exponential backoff with jitter between attempts
+- OutboxDispatcher: background task that drains every registered outbox
+  on an interval, and prunes finished messages once their retention has
+  passed so the outbox tables don't grow without bound
+
+Usage:
+    dispatcher = await start_outbox_dispatcher(OutboxDispatcherConfig(interval=5))
+    dispatcher.register("monitoring.alerts", generator.dispatch_outbox, outbox.prune)
+    ...
+    await stop_outbox_dispatcher()  # Lets a dispatch in progress finish
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Sized
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+DispatchFn = Callable[[], Awaitable[Sized]]
+PruneFn = Callable[[datetime], Awaitable[int]]
+
+
+def retry_delay(attempts: int, base_seconds: float, max_seconds: float) -> timedelta:
+    """Get the backoff before the next delivery attempt.
+
+    Exponential in the number of attempts, capped, with jitter so failures
+    from one mass event (an outage during an onboarding wave, a burst of
+    alerts) don't all retry at the same moment.
+
+    Args:
+        attempts: Attempts made so far
+        base_seconds: Delay after the first attempt; doubles with each further one
+        max_seconds: Upper bound on the delay
+
+    Returns:
+        Delay before the next attempt
+    """
+    delay = min(base_seconds * 2 ** max(attempts - 1, 0), max_seconds)
+    return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+
+class OutboxDispatcherConfig(BaseModel):
+    """Configuration for the outbox dispatcher."""
+
+    interval: float = Field(default=5.0, gt=0, description="Seconds between dispatch runs")
+    retention_hours: float = Field(
+        default=168, ge=0, description="Hours finished messages are kept before pruning"
+    )
+    prune_interval: float = Field(default=3600, gt=0, description="Seconds between prune runs")
+
+
+@dataclass
+class OutboxDispatcherStats:
+    """Statistics for the outbox dispatcher."""
+
+    runs: int = 0
+    attempted: int = 0
+    pruned: int = 0
+    errors: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class _Registration:
+    dispatch: DispatchFn
+    prune: PruneFn | None
+
+
+class OutboxDispatcher:
+    """Background task delivering due messages from registered outboxes.
+
+    Each run calls every registered dispatch function; an outbox that
+    raises is logged and retried on the next run without holding up the
+    others. Pruning runs at most every ``prune_interval`` seconds.
+
+    Attributes:
+        config: Dispatcher configuration
+        stats: Dispatch statistics
+    """
+
+    def __init__(self, config: OutboxDispatcherConfig | None = None) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            config: Dispatcher configuration
+        """
+        self.config = config or OutboxDispatcherConfig()
+        self.stats = OutboxDispatcherStats()
+        self._outboxes: dict[str, _Registration] = {}
+        self._pruned_at: float | None = None
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background task is running."""
+        return self._task is not None and not self._task.done()
+
+    def register(self, name: str, dispatch: DispatchFn, prune: PruneFn | None = None) -> None:
+        """Register an outbox.
+
+        Args:
+            name: Name used in logs and statistics
+            dispatch: Delivers due messages, returning those attempted
+            prune: Deletes messages finished before the given time
+        """
+        self._outboxes[name] = _Registration(dispatch, prune)
+
+    def unregister(self, name: str) -> None:
+        """Stop dispatching an outbox."""
+        self._outboxes.pop(name, None)
+
+    async def start(self) -> None:
+        """Start the background task."""
+        if self.is_running:
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="outbox-dispatcher")
+
+    async def stop(self) -> None:
+        """Stop the background task, letting a run in progress finish."""
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+
+    def wake(self) -> None:
+        """Run the next dispatch now instead of waiting for the interval."""
+        self._wakeup.set()
+
+    async def run_once(self) -> int:
+        """Dispatch every registered outbox once, pruning if it is due.
+
+        Returns:
+            Number of messages attempted
+        """
+        self.stats.runs += 1
+        attempted = 0
+        for name, outbox in list(self._outboxes.items()):
+            try:
+                attempted += len(await outbox.dispatch())
+            except Exception:
+                self.stats.errors[name] = self.stats.errors.get(name, 0) + 1
+                logger.exception("Outbox dispatch failed: %s", name)
+        self.stats.attempted += attempted
+
+        now = time.monotonic()
+        if self._pruned_at is None or now - self._pruned_at >= self.config.prune_interval:
+            self._pruned_at = now
+            await self.prune()
+        return attempted
+
+    async def prune(self) -> int:
+        """Delete finished messages older than the retention period.
+
+        Returns:
+            Number of messages deleted
+        """
+        before = datetime.now(UTC) - timedelta(hours=self.config.retention_hours)
+        pruned = 0
+        for name, outbox in list(self._outboxes.items()):
+            if outbox.prune is None:
+                continue
+            try:
+                pruned += await outbox.prune(before)
+            except Exception:
+                self.stats.errors[name] = self.stats.errors.get(name, 0) + 1
+                logger.exception("Outbox prune failed: %s", name)
+        self.stats.pruned += pruned
+        return pruned
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            await self.run_once()
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.config.interval)
+            self._wakeup.clear()
+
+
+# Global dispatcher instance (started with the application)
+_outbox_dispatcher: OutboxDispatcher | None = None
+
+
+def get_outbox_dispatcher() -> OutboxDispatcher | None:
+    """Get the running global outbox dispatcher, if any."""
+    return _outbox_dispatcher
+
+
+async def start_outbox_dispatcher(
+    config: OutboxDispatcherConfig | None = None,
+) -> OutboxDispatcher:
+    """Start the global outbox dispatcher.
+
+    Args:
+        config: Dispatcher configuration
+
+    Returns:
+        The started dispatcher; register outboxes on it
+    """
+    global _outbox_dispatcher
+
+    if _outbox_dispatcher is None:
+        _outbox_dispatcher = OutboxDispatcher(config)
+    await _outbox_dispatcher.start()
+    return _outbox_dispatcher
+
+
+async def stop_outbox_dispatcher() -> None:
+    """Stop the global outbox dispatcher."""
+    global _outbox_dispatcher
+
+    if _outbox_dispatcher is not None:
+        dispatcher, _outbox_dispatcher = _outbox_dispatcher, None
+        await dispatcher.stop()
@@ -1,10 +1,19 @@
 """Database models for Elile."""
 
+from .agent_checkpoint import (
+    AgentCheckpoint,
+    AgentCheckpointBlob,
+    AgentCheckpointWrite,
+    BlobEncoding,
+)
 from .audit import AuditEvent, AuditEventType, AuditSeverity
 from .base import Base, TimestampMixin
 from .cache import CachedDataSource, DataOrigin, FreshnessStatus
 from .entity import Entity, EntityRelation, EntityType
-from .profile import EntityProfile, ProfileTrigger
+from .hris import HRISDeliveryRecord
+from .outbox import OutboxAlert, OutboxMessage
+from .profile import EntityProfile, ProfileEncoding, ProfileTrigger
+from .retention import RetentionRecordModel, RetentionSweep
 from .tenant import Tenant
 
 __all__ = [
@@ -15,6 +24,7 @@ __all__ = [
     "EntityRelation",
     "EntityProfile",
     "ProfileTrigger",
+    "ProfileEncoding",
     "CachedDataSource",
     "DataOrigin",
     "FreshnessStatus",
@@ -22,4 +32,13 @@ __all__ = [
     "AuditEventType",
     "AuditSeverity",
     "Tenant",
+    "AgentCheckpoint",
+    "AgentCheckpointBlob",
+    "AgentCheckpointWrite",
+    "BlobEncoding",
+    "OutboxMessage",
+    "OutboxAlert",
+    "HRISDeliveryRecord",
+    "RetentionRecordModel",
+    "RetentionSweep",
 ]
@@ -0,0 +1,103 @@
+"""LangGraph checkpoint models for durable agent workflow state."""
+
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import DateTime, Index, Integer, LargeBinary, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, PortableJSON
+
+
+class BlobEncoding(str, Enum):
+    """How a channel blob is encoded relative to earlier versions.
+
+    - FULL: Complete serialized channel value
+    - APPEND: Items appended to the list stored at ``base_version``
+    - MERGE: Keys set/unset on the dict stored at ``base_version``
+    - EMPTY: Channel has no value at this version
+    """
+
+    FULL = "full"
+    APPEND = "append"
+    MERGE = "merge"
+    EMPTY = "empty"
+
+
+class AgentCheckpoint(Base):
+    """A LangGraph checkpoint, without its channel values.
+
+    Channel values live in ``agent_checkpoint_blobs`` keyed by channel
+    version, so a checkpoint row only carries the version map and metadata.
+    """
+
+    __tablename__ = "agent_checkpoints"
+
+    thread_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    checkpoint_ns: Mapped[str] = mapped_column(String(255), primary_key=True, default="")
+    checkpoint_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    parent_checkpoint_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    # Serialized checkpoint (channel versions, versions seen) via the saver's serde
+    checkpoint_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    checkpoint: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    checkpoint_metadata: Mapped[dict] = mapped_column(
+        "metadata", PortableJSON(), nullable=False, default=dict
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (Index("idx_agent_checkpoints_thread", "thread_id", "checkpoint_ns"),)
+
+
+class AgentCheckpointBlob(Base):
+    """A versioned channel value, stored in full or as a delta.
+
+    Delta rows reference ``base_version`` of the same channel. ``chain_start``
+    is the version of the full snapshot the delta chain starts from, so a
+    value can be rebuilt with one range query over the chain.
+    """
+
+    __tablename__ = "agent_checkpoint_blobs"
+
+    thread_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    checkpoint_ns: Mapped[str] = mapped_column(String(255), primary_key=True, default="")
+    channel: Mapped[str] = mapped_column(String(255), primary_key=True)
+    version: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    encoding: Mapped[str] = mapped_column(
+        String(16), nullable=False, default=BlobEncoding.FULL.value
+    )
+    base_version: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    chain_start: Mapped[str] = mapped_column(String(64), nullable=False)
+    value_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    blob: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+
+    __table_args__ = (
+        Index(
+            "idx_agent_checkpoint_blobs_chain",
+            "thread_id",
+            "checkpoint_ns",
+            "channel",
+            "chain_start",
+        ),
+    )
+
+
+class AgentCheckpointWrite(Base):
+    """A pending write from a task, linked to the checkpoint it follows."""
+
+    __tablename__ = "agent_checkpoint_writes"
+
+    thread_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    checkpoint_ns: Mapped[str] = mapped_column(String(255), primary_key=True, default="")
+    checkpoint_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    task_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    idx: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    channel: Mapped[str] = mapped_column(String(255), nullable=False)
+    value_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    blob: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    task_path: Mapped[str] = mapped_column(Text, nullable=False, default="")
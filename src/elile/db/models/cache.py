@@ -10,6 +10,9 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, PortableJSON, PortableUUID, TimestampMixin
 
+# Loading group of the deferred payload columns
+PAYLOAD_GROUP = "payload"
+
 
 class DataOrigin(str, Enum):
     """Origin of the data source.
@@ -41,6 +44,12 @@ class CachedDataSource(Base, TimestampMixin):
 
     Stores responses from background check providers to minimize API calls
     and reduce costs. Tracks freshness, origin, and cost information.
+
+    Payload columns are deferred (loading group ``PAYLOAD_GROUP``), so
+    queries that only need freshness metadata do not read them. New rows
+    store the normalized data compressed and encrypted in
+    ``normalized_payload``; ``normalized_data`` is only set on rows
+    written before that.
     """
 
     __tablename__ = "cached_data_sources"
@@ -66,9 +75,16 @@ class CachedDataSource(Base, TimestampMixin):
     fresh_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     stale_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
-    # Data (raw_response should be encrypted by application layer)
-    raw_response: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # Encrypted
-    normalized_data: Mapped[dict] = mapped_column(PortableJSON(), nullable=False)
+    # Data (compressed and encrypted by the application layer)
+    raw_response: Mapped[bytes] = mapped_column(
+        LargeBinary, nullable=False, deferred=True, deferred_group=PAYLOAD_GROUP
+    )  # Encrypted
+    normalized_payload: Mapped[bytes | None] = mapped_column(
+        LargeBinary, nullable=True, deferred=True, deferred_group=PAYLOAD_GROUP
+    )  # Encrypted
+    normalized_data: Mapped[dict | None] = mapped_column(
+        PortableJSON(), nullable=True, deferred=True, deferred_group=PAYLOAD_GROUP
+    )  # Legacy plaintext rows
 
     # Cost tracking
     cost_incurred: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
@@ -0,0 +1,31 @@
+"""HRIS models for delivery records of published results."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Boolean, DateTime, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, PortableJSON, PortableUUID
+
+
+class HRISDeliveryRecord(Base):
+    """One attempt to deliver an update or alert to an HRIS platform.
+
+    The columns delivery history is filtered and purged on are kept as
+    columns; the rest of the attempt is kept in ``payload``.
+    """
+
+    __tablename__ = "hris_delivery_records"
+
+    record_id: Mapped[UUID] = mapped_column(PortableUUID(), primary_key=True)
+    tenant_id: Mapped[UUID] = mapped_column(PortableUUID(), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    success: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    attempted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    payload: Mapped[dict] = mapped_column(PortableJSON(), nullable=False, default=dict)
+
+    __table_args__ = (
+        Index("idx_hris_delivery_records_tenant", "tenant_id", "attempted_at"),
+        Index("idx_hris_delivery_records_attempted", "attempted_at"),
+    )
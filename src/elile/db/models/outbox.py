@@ -0,0 +1,75 @@
+"""Outbox models for notifications waiting to be delivered."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, PortableJSON, PortableUUID
+
+
+class OutboxMessage(Base):
+    """A message in a notification outbox.
+
+    Outboxes share this table and are told apart by ``topic``. ``partition``
+    is what an outbox drains by (a notification channel, an HRIS tenant),
+    ``key`` deduplicates or coalesces messages, and ``reference_id`` groups
+    the messages created for one alert or publish. The message content is
+    kept in ``payload``.
+
+    A dispatcher claims pending messages by setting ``claimed_until``; a
+    claim left behind by a process that died mid-delivery expires, and the
+    message becomes due again.
+    """
+
+    __tablename__ = "outbox_messages"
+
+    message_id: Mapped[UUID] = mapped_column(PortableUUID(), primary_key=True)
+    topic: Mapped[str] = mapped_column(String(64), nullable=False)
+    partition: Mapped[str] = mapped_column(String(255), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    key: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    reference_id: Mapped[UUID | None] = mapped_column(PortableUUID(), nullable=True)
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    claimed_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    payload: Mapped[dict] = mapped_column(PortableJSON(), nullable=False, default=dict)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("idx_outbox_messages_due", "topic", "partition", "status", "next_attempt_at"),
+        Index("idx_outbox_messages_key", "topic", "key", "created_at"),
+        Index("idx_outbox_messages_reference", "reference_id"),
+        Index("idx_outbox_messages_finished", "topic", "finished_at"),
+    )
+
+
+class OutboxAlert(Base):
+    """A monitoring alert whose notifications go through the outbox.
+
+    Kept so the dispatcher can update an alert's delivery status after the
+    process that generated it is gone, and so alert history is read from
+    here rather than from any one process's memory. Alerts are pruned
+    with their notifications.
+    """
+
+    __tablename__ = "outbox_alerts"
+
+    alert_id: Mapped[UUID] = mapped_column(PortableUUID(), primary_key=True)
+    monitoring_config_id: Mapped[UUID | None] = mapped_column(PortableUUID(), nullable=True)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    payload: Mapped[dict] = mapped_column(PortableJSON(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("idx_outbox_alerts_config", "monitoring_config_id", "created_at"),
+        Index("idx_outbox_alerts_status", "status", "created_at"),
+        Index("idx_outbox_alerts_created", "created_at"),
+        Index("idx_outbox_alerts_updated", "updated_at"),
+    )
@@ -3,7 +3,7 @@
 from enum import Enum
 from uuid import UUID, uuid7
 
-from sqlalchemy import ForeignKey, Index, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, LargeBinary, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, PortableJSON, PortableUUID, TimestampMixin
@@ -17,12 +17,30 @@ class ProfileTrigger(str, Enum):
     MANUAL = "manual"
 
 
+class ProfileEncoding(str, Enum):
+    """How a profile's snapshot data is stored.
+
+    - FULL: Snapshot columns hold the complete data
+    - DELTA: Snapshot columns are empty; ``snapshot_delta`` holds a
+      compressed delta against ``base_version``
+    """
+
+    FULL = "full"
+    DELTA = "delta"
+
+
 class EntityProfile(Base, TimestampMixin):
     """Versioned profile snapshot for an entity.
 
     Each profile represents a point-in-time view of an entity's risk assessment,
     including findings, connections, and risk scores. Profiles are versioned to
     track evolution over time and support comparison between investigations.
+
+    With compact storage, versions between periodic full snapshots store
+    their findings, risk score, connections and data sources as a delta
+    against the previous version. ``chain_start`` is the version of the
+    full snapshot the delta chain starts from, so a version can be rebuilt
+    with one range query; ProfileRepository does this on read.
     """
 
     __tablename__ = "entity_profiles"
@@ -39,22 +57,32 @@ class EntityProfile(Base, TimestampMixin):
         PortableUUID(), nullable=True
     )  # Screening or monitoring run ID
 
-    # Snapshot data - findings from this investigation
+    # Snapshot data - findings from this investigation (NULL in delta rows)
     findings: Mapped[dict] = mapped_column(
-        PortableJSON(), nullable=False
+        PortableJSON(), nullable=True
     )  # List of Finding objects as dicts
-    risk_score: Mapped[dict] = mapped_column(PortableJSON(), nullable=False)  # RiskScore object as dict
-    connections: Mapped[dict] = mapped_column(PortableJSON(), nullable=False)  # Connection graph as dict
+    risk_score: Mapped[dict] = mapped_column(PortableJSON(), nullable=True)  # RiskScore object as dict
+    connections: Mapped[dict] = mapped_column(PortableJSON(), nullable=True)  # Connection graph as dict
     connection_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
     # Data sources used in this profile
     data_sources_used: Mapped[dict] = mapped_column(
-        PortableJSON(), nullable=False
+        PortableJSON(), nullable=True
     )  # List of data source references
     stale_data_used: Mapped[dict] = mapped_column(
-        PortableJSON(), nullable=False, default=dict
+        PortableJSON(), nullable=True, default=dict
     )  # Flagged stale sources
 
+    # Snapshot storage - full, or a delta against the previous version
+    encoding: Mapped[str] = mapped_column(
+        String(16), nullable=False, default=ProfileEncoding.FULL.value
+    )
+    base_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    chain_start: Mapped[int | None] = mapped_column(
+        Integer, nullable=True
+    )  # Version of the full snapshot a delta chain starts from
+    snapshot_delta: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+
     # Evolution tracking - comparison to previous versions
     previous_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
     delta: Mapped[dict | None] = mapped_column(
@@ -63,6 +91,9 @@ class EntityProfile(Base, TimestampMixin):
     evolution_signals: Mapped[dict] = mapped_column(
         PortableJSON(), nullable=False, default=dict
     )  # Detected evolution patterns
+    digest: Mapped[dict | None] = mapped_column(
+        PortableJSON(), nullable=True
+    )  # ProfileDigest of findings, risk score and connections
 
     # Relationships
     entity: Mapped["Entity"] = relationship("Entity", back_populates="profiles")
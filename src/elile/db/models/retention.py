@@ -0,0 +1,57 @@
+"""Retention models for tracked data items and sweep checkpoints."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Boolean, DateTime, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, PortableJSON, PortableUUID
+
+
+class RetentionRecordModel(Base):
+    """Retention lifecycle of one data item.
+
+    The columns the retention sweep queries on (status, legal hold and the
+    expiry and archive deadlines) are kept as columns; the rest of the
+    record, including its event history, is kept in ``payload``.
+
+    Timestamps are naive UTC, as the retention types use them.
+
+    A sweep claims due records by setting ``claimed_until``; a claim left
+    behind by a process that died mid-sweep expires, and the record is due
+    again.
+    """
+
+    __tablename__ = "retention_records"
+
+    record_id: Mapped[UUID] = mapped_column(PortableUUID(), primary_key=True)
+    tenant_id: Mapped[UUID] = mapped_column(PortableUUID(), nullable=False)
+    data_id: Mapped[UUID] = mapped_column(PortableUUID(), nullable=False)
+    data_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    legal_hold: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+
+    expires_at: Mapped[datetime] = mapped_column(DateTime(), nullable=False)
+    archive_at: Mapped[datetime | None] = mapped_column(DateTime(), nullable=True)
+    claimed_until: Mapped[datetime | None] = mapped_column(DateTime(), nullable=True)
+    payload: Mapped[dict] = mapped_column(PortableJSON(), nullable=False, default=dict)
+
+    __table_args__ = (
+        Index("idx_retention_records_tenant", "tenant_id"),
+        Index("idx_retention_records_data", "data_id"),
+        Index("idx_retention_records_status_expiry", "status", "expires_at"),
+        Index("idx_retention_records_status_archive", "status", "archive_at"),
+    )
+
+
+class RetentionSweep(Base):
+    """Checkpoint of a retention sweep, saved with every chunk it processes."""
+
+    __tablename__ = "retention_sweeps"
+
+    sweep_id: Mapped[UUID] = mapped_column(PortableUUID(), primary_key=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime(), nullable=False)
+    payload: Mapped[dict] = mapped_column(PortableJSON(), nullable=False)
+
+    __table_args__ = (Index("idx_retention_sweeps_started", "started_at"),)
@@ -0,0 +1,159 @@
+"""Delta encoding of entity profile snapshots.
+
+Consecutive profile versions of a monitored entity usually differ in a few
+findings or a risk score, if at all. Compact profile storage keeps a full
+snapshot every so often and stores the versions in between as a
+compressed structural delta against the previous version.
+
+A delta maps each changed snapshot field to an operation:
+
+- ``{"v": value}``: replace the value
+- ``{"d": {"set": {...}, "del": [...], "sub": {...}}}``: patch a dict, where
+  ``sub`` holds nested operations for changed keys
+- ``{"l": [start, removed, inserted]}``: splice a list, replacing
+  ``removed`` items at ``start`` with ``inserted``
+
+Unchanged fields are left out, so a version that changed nothing encodes
+to an empty delta.
+"""
+
+import json
+import zlib
+from collections.abc import Mapping
+from typing import Any
+
+# EntityProfile columns covered by a snapshot
+SNAPSHOT_FIELDS = (
+    "findings",
+    "risk_score",
+    "connections",
+    "data_sources_used",
+    "stale_data_used",
+)
+
+COMPRESSION_LEVEL = 6
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), default=str).encode()
+
+
+def diff_value(old: Any, new: Any) -> dict[str, Any] | None:
+    """Compute the operation turning one JSON value into another.
+
+    Args:
+        old: Previous value
+        new: Current value
+
+    Returns:
+        The operation, or None if the values are equal
+    """
+    if old == new:
+        return None
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        patch: dict[str, Any] = {}
+        for key, value in new.items():
+            if key not in old:
+                patch.setdefault("set", {})[key] = value
+            else:
+                nested = diff_value(old[key], value)
+                if nested is not None:
+                    patch.setdefault("sub", {})[key] = nested
+        removed = [key for key in old if key not in new]
+        if removed:
+            patch["del"] = removed
+        return {"d": patch}
+
+    if isinstance(old, list) and isinstance(new, list):
+        # Replace only the part between the common prefix and suffix
+        limit = min(len(old), len(new))
+        start = 0
+        while start < limit and old[start] == new[start]:
+            start += 1
+        end = 0
+        while end < limit - start and old[-1 - end] == new[-1 - end]:
+            end += 1
+        return {"l": [start, len(old) - start - end, new[start : len(new) - end]]}
+
+    return {"v": new}
+
+
+def apply_value(old: Any, operation: Mapping[str, Any]) -> Any:
+    """Apply an operation produced by diff_value.
+
+    The result shares unchanged parts with ``old``.
+
+    Args:
+        old: Previous value
+        operation: Operation to apply
+
+    Returns:
+        The current value
+    """
+    if "v" in operation:
+        return operation["v"]
+
+    if "l" in operation:
+        start, removed, inserted = operation["l"]
+        return [*old[:start], *inserted, *old[start + removed :]]
+
+    if "d" in operation:
+        patch = operation["d"]
+        deleted = set(patch.get("del", ()))
+        patched = {key: value for key, value in old.items() if key not in deleted}
+        for key, nested in patch.get("sub", {}).items():
+            patched[key] = apply_value(old[key], nested)
+        patched.update(patch.get("set", {}))
+        return patched
+
+    raise ValueError(f"Unknown delta operation: {sorted(operation)}")
+
+
+def diff_snapshot(old: Mapping[str, Any], new: Mapping[str, Any]) -> dict[str, Any]:
+    """Compute the delta between two profile snapshots.
+
+    Args:
+        old: Previous snapshot, keyed by SNAPSHOT_FIELDS
+        new: Current snapshot, keyed by SNAPSHOT_FIELDS
+
+    Returns:
+        Operation per changed field
+    """
+    delta: dict[str, Any] = {}
+    for name in SNAPSHOT_FIELDS:
+        operation = diff_value(old.get(name), new.get(name))
+        if operation is not None:
+            delta[name] = operation
+    return delta
+
+
+def apply_snapshot_delta(old: Mapping[str, Any], delta: Mapping[str, Any]) -> dict[str, Any]:
+    """Apply a delta produced by diff_snapshot.
+
+    Args:
+        old: Previous snapshot
+        delta: Operation per changed field
+
+    Returns:
+        The current snapshot
+    """
+    snapshot = dict(old)
+    for name, operation in delta.items():
+        snapshot[name] = apply_value(old.get(name), operation)
+    return snapshot
+
+
+def encode_delta(delta: Mapping[str, Any]) -> bytes:
+    """Serialize and compress a snapshot delta."""
+    return zlib.compress(_dumps(delta), COMPRESSION_LEVEL)
+
+
+def decode_delta(data: bytes) -> dict[str, Any]:
+    """Decompress and deserialize a snapshot delta."""
+    return json.loads(zlib.decompress(data))
+
+
+def snapshot_size(snapshot: Mapping[str, Any]) -> int:
+    """Get the size of a snapshot stored in full, in bytes."""
+    return sum(len(_dumps(snapshot.get(name))) for name in SNAPSHOT_FIELDS)
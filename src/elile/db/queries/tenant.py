@@ -4,9 +4,10 @@ from uuid import UUID
 
 from sqlalchemy import Select, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
 from elile.core.context import CacheScope, get_current_context
-from elile.db.models.cache import CachedDataSource, DataOrigin
+from elile.db.models.cache import PAYLOAD_GROUP, CachedDataSource, DataOrigin
 
 
 def filter_cache_by_tenant(
@@ -93,6 +94,7 @@ async def get_tenant_cache_entry(
             CachedDataSource.check_type == check_type,
         )
         .order_by(CachedDataSource.acquired_at.desc())
+        .options(undefer_group(PAYLOAD_GROUP))
     )
 
     query = filter_cache_by_tenant(query, tenant_id, cache_scope)
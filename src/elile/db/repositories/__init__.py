@@ -3,11 +3,13 @@
 from .base import BaseRepository
 from .cache import CacheRepository
 from .entity import EntityRepository
+from .outbox import OutboxRepository
 from .profile import ProfileRepository
 
 __all__ = [
     "BaseRepository",
     "CacheRepository",
     "EntityRepository",
+    "OutboxRepository",
     "ProfileRepository",
 ]
@@ -1,11 +1,14 @@
 """Cache repository for managing cached data source records."""
 
+from collections.abc import Collection
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import Select, delete, select, update
+from sqlalchemy.orm import undefer_group
 
-from elile.db.models.cache import CachedDataSource, FreshnessStatus
+from elile.db.models.cache import PAYLOAD_GROUP, CachedDataSource, FreshnessStatus
 from elile.db.repositories.base import BaseRepository
 
 
@@ -13,11 +16,16 @@ class CacheRepository(BaseRepository[CachedDataSource, UUID]):
     """Repository for CachedDataSource model operations.
 
     Provides cache-specific queries including freshness management
-    and tenant-isolated access.
+    and tenant-isolated access. Payload columns are only loaded when a
+    query asks for them (``with_payload``) or through get_payloads.
     """
 
     model = CachedDataSource
 
+    @staticmethod
+    def _with_payload(stmt: Select, with_payload: bool) -> Select:
+        return stmt.options(undefer_group(PAYLOAD_GROUP)) if with_payload else stmt
+
     async def get_by_provider(
         self,
         provider_id: str,
@@ -53,6 +61,7 @@ class CacheRepository(BaseRepository[CachedDataSource, UUID]):
         *,
         provider_id: str | None = None,
         fresh_only: bool = False,
+        with_payload: bool = False,
     ) -> list[CachedDataSource]:
         """Get cached entries for an entity.
 
@@ -60,6 +69,7 @@ class CacheRepository(BaseRepository[CachedDataSource, UUID]):
             entity_id: Entity to get cached data for
             provider_id: Optional provider filter
             fresh_only: Only return fresh entries
+            with_payload: Also load the payload columns
 
         Returns:
             List of cached entries
@@ -74,9 +84,82 @@ class CacheRepository(BaseRepository[CachedDataSource, UUID]):
 
         stmt = stmt.order_by(CachedDataSource.acquired_at.desc())
 
+        result = await self.db.execute(self._with_payload(stmt, with_payload))
+        return list(result.scalars().all())
+
+    async def get_for_entities(
+        self,
+        entity_ids: Collection[UUID],
+        *,
+        provider_ids: Collection[str] | None = None,
+        check_types: Collection[str] | None = None,
+    ) -> list[CachedDataSource]:
+        """Get cached entries for many entities in one query.
+
+        Payload columns are not loaded; use get_payloads for the entries
+        that are actually needed.
+
+        Args:
+            entity_ids: Entities to get cached data for
+            provider_ids: Optional provider filter
+            check_types: Optional check type filter
+
+        Returns:
+            List of cached entries, newest first
+        """
+        if not entity_ids:
+            return []
+
+        stmt = select(CachedDataSource).where(CachedDataSource.entity_id.in_(entity_ids))
+
+        if provider_ids is not None:
+            stmt = stmt.where(CachedDataSource.provider_id.in_(provider_ids))
+
+        if check_types is not None:
+            stmt = stmt.where(CachedDataSource.check_type.in_(check_types))
+
+        stmt = stmt.order_by(CachedDataSource.acquired_at.desc())
+
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_payloads(
+        self,
+        cache_ids: Collection[UUID],
+    ) -> dict[UUID, tuple[dict[str, Any] | None, bytes | None]]:
+        """Get the stored normalized data of cache entries.
+
+        Args:
+            cache_ids: Cache entry IDs
+
+        Returns:
+            Cache ID -> (legacy plaintext data, encrypted payload)
+        """
+        if not cache_ids:
+            return {}
+
+        stmt = select(
+            CachedDataSource.cache_id,
+            CachedDataSource.normalized_data,
+            CachedDataSource.normalized_payload,
+        ).where(CachedDataSource.cache_id.in_(cache_ids))
+
+        result = await self.db.execute(stmt)
+        return {cache_id: (data, payload) for cache_id, data, payload in result.all()}
+
+    async def get_raw_response(self, cache_id: UUID) -> bytes | None:
+        """Get the stored (encrypted) raw response of a cache entry.
+
+        Args:
+            cache_id: Cache entry ID
+
+        Returns:
+            Encrypted raw response or None if not found
+        """
+        stmt = select(CachedDataSource.raw_response).where(CachedDataSource.cache_id == cache_id)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get_by_check_type(
         self,
         entity_id: UUID,
@@ -112,6 +195,8 @@ class CacheRepository(BaseRepository[CachedDataSource, UUID]):
         entity_id: UUID,
         provider_id: str,
         check_type: str,
+        *,
+        with_payload: bool = False,
     ) -> CachedDataSource | None:
         """Get a fresh cached entry if available.
 
@@ -119,6 +204,7 @@ class CacheRepository(BaseRepository[CachedDataSource, UUID]):
             entity_id: Entity the data is for
             provider_id: Data provider
             check_type: Type of background check
+            with_payload: Also load the payload columns
 
         Returns:
             Fresh cached entry or None
@@ -133,7 +219,7 @@ class CacheRepository(BaseRepository[CachedDataSource, UUID]):
             .where(CachedDataSource.fresh_until > now)
         )
 
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(self._with_payload(stmt, with_payload))
         return result.scalar_one_or_none()
 
     async def mark_stale(
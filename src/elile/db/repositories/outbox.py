@@ -0,0 +1,216 @@
+"""Outbox repository for notifications waiting to be delivered."""
+
+from collections.abc import Collection, Sequence
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, func, or_, select, update
+
+from elile.db.models.outbox import OutboxMessage
+from elile.db.repositories.base import BaseRepository
+
+# Status of messages still waiting for an attempt; any other status is final
+PENDING_STATUS = "pending"
+
+
+def as_utc(value: datetime) -> datetime:
+    """Attach UTC to a timestamp read back without a zone (as SQLite returns them)."""
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+
+
+class OutboxRepository(BaseRepository[OutboxMessage, UUID]):
+    """Repository for OutboxMessage operations shared by every outbox.
+
+    Claims use ``SELECT ... FOR UPDATE SKIP LOCKED``, so dispatchers in
+    several processes never claim the same message; the claim itself is
+    the ``claimed_until`` lease written in the same transaction.
+    """
+
+    model = OutboxMessage
+
+    async def claim_due(
+        self,
+        topic: str,
+        partition: str,
+        as_of: datetime,
+        limit: int,
+        *,
+        now: datetime,
+        lease_until: datetime,
+    ) -> list[OutboxMessage]:
+        """Claim pending messages of a partition due by ``as_of``, earliest first.
+
+        Args:
+            topic: Outbox topic
+            partition: Partition to claim from
+            as_of: Latest next_attempt_at to claim
+            limit: Maximum messages to claim
+            now: Current time; claims that ran out before it are ignored
+            lease_until: When the new claims run out
+
+        Returns:
+            Claimed messages
+        """
+        stmt = (
+            select(OutboxMessage)
+            .where(
+                OutboxMessage.topic == topic,
+                OutboxMessage.partition == partition,
+                OutboxMessage.status == PENDING_STATUS,
+                OutboxMessage.next_attempt_at <= as_of,
+                or_(OutboxMessage.claimed_until.is_(None), OutboxMessage.claimed_until < now),
+            )
+            .order_by(OutboxMessage.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        rows = list((await self.db.execute(stmt)).scalars().all())
+        for row in rows:
+            row.claimed_until = lease_until
+        await self.db.flush()
+        return rows
+
+    async def pending_partitions(self, topic: str, now: datetime) -> list[str]:
+        """Get partitions with pending messages that are not claimed.
+
+        Args:
+            topic: Outbox topic
+            now: Current time; claims that ran out before it are ignored
+
+        Returns:
+            Partition names
+        """
+        stmt = (
+            select(OutboxMessage.partition)
+            .where(
+                OutboxMessage.topic == topic,
+                OutboxMessage.status == PENDING_STATUS,
+                or_(OutboxMessage.claimed_until.is_(None), OutboxMessage.claimed_until < now),
+            )
+            .distinct()
+        )
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def latest_by_key(
+        self,
+        topic: str,
+        keys: Collection[str],
+        since: datetime,
+    ) -> dict[str, datetime]:
+        """Get when each key was last enqueued, for keys enqueued since ``since``.
+
+        Args:
+            topic: Outbox topic
+            keys: Keys to look up
+            since: Earliest enqueue time to consider
+
+        Returns:
+            Latest created_at by key
+        """
+        if not keys:
+            return {}
+        stmt = (
+            select(OutboxMessage.key, func.max(OutboxMessage.created_at))
+            .where(
+                OutboxMessage.topic == topic,
+                OutboxMessage.key.in_(keys),
+                OutboxMessage.created_at >= since,
+            )
+            .group_by(OutboxMessage.key)
+        )
+        return dict((await self.db.execute(stmt)).tuples().all())
+
+    async def list_pending_by_key(
+        self,
+        topic: str,
+        keys: Collection[str],
+    ) -> list[OutboxMessage]:
+        """Get pending messages carrying any of ``keys``.
+
+        Args:
+            topic: Outbox topic
+            keys: Keys to look up
+
+        Returns:
+            Pending messages, claimed or not
+        """
+        if not keys:
+            return []
+        stmt = select(OutboxMessage).where(
+            OutboxMessage.topic == topic,
+            OutboxMessage.key.in_(keys),
+            OutboxMessage.status == PENDING_STATUS,
+        )
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def list_by_reference(self, topic: str, reference_id: UUID) -> list[OutboxMessage]:
+        """Get the messages created for one alert or publish, in enqueue order.
+
+        Args:
+            topic: Outbox topic
+            reference_id: Alert or publish the messages belong to
+
+        Returns:
+            Messages of the reference
+        """
+        stmt = (
+            select(OutboxMessage)
+            .where(OutboxMessage.topic == topic, OutboxMessage.reference_id == reference_id)
+            .order_by(OutboxMessage.created_at, OutboxMessage.message_id)
+        )
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def list_by_references(
+        self, topic: str, reference_ids: Collection[UUID]
+    ) -> list[OutboxMessage]:
+        """Get the messages created for several alerts or publishes, in enqueue order.
+
+        Args:
+            topic: Outbox topic
+            reference_ids: Alerts or publishes the messages belong to
+
+        Returns:
+            Messages of the references
+        """
+        if not reference_ids:
+            return []
+        stmt = (
+            select(OutboxMessage)
+            .where(OutboxMessage.topic == topic, OutboxMessage.reference_id.in_(reference_ids))
+            .order_by(OutboxMessage.created_at, OutboxMessage.message_id)
+        )
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def update_many(self, values: Sequence[dict[str, Any]]) -> None:
+        """Update messages in one statement per batch, by primary key.
+
+        Args:
+            values: Column values, each including ``message_id``
+        """
+        if values:
+            await self.db.execute(update(OutboxMessage), list(values))
+
+    async def prune(self, topic: str, before: datetime, *, batch_size: int = 1000) -> int:
+        """Delete messages that finished before ``before``, in batches.
+
+        Args:
+            topic: Outbox topic
+            before: Messages finished before this time are deleted
+            batch_size: Messages deleted per statement
+
+        Returns:
+            Number of messages deleted
+        """
+        finished = (
+            select(OutboxMessage.message_id)
+            .where(OutboxMessage.topic == topic, OutboxMessage.finished_at < before)
+            .limit(batch_size)
+        )
+        deleted = 0
+        while ids := (await self.db.execute(finished)).scalars().all():
+            await self.db.execute(delete(OutboxMessage).where(OutboxMessage.message_id.in_(ids)))
+            deleted += len(ids)
+            if len(ids) < batch_size:
+                break
+        return deleted
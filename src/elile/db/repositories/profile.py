@@ -1,21 +1,449 @@
-"""Profile repository for managing entity profile records."""
-
+"""Profile repository for managing entity profile records.
+
+In compact mode the repository writes a full snapshot every
+``max_delta_chain + 1`` versions and stores the versions in between as a
+compressed delta against the previous version (see elile.db.profile_delta).
+Reads rebuild delta rows from their chain with one range query per chain,
+and only for the versions actually returned. Full and delta rows can be
+mixed, so switching modes needs no rewrite of existing rows. Updating or
+deleting a version re-encodes the delta row built on it, so the chain
+still rebuilds.
+
+Every version written through the repository also gets the ProfileDigest
+of its snapshot, which monitoring checks pass to the delta detector as
+the baseline digest.
+"""
+
+import copy
+from collections.abc import Collection, Mapping, Sequence
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
-
-from elile.db.models.profile import EntityProfile, ProfileTrigger
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import flag_modified, set_committed_value
+
+from elile.db.models.entity import Entity
+from elile.db.models.profile import EntityProfile, ProfileEncoding, ProfileTrigger
+from elile.db.profile_delta import (
+    SNAPSHOT_FIELDS,
+    apply_snapshot_delta,
+    decode_delta,
+    diff_snapshot,
+    encode_delta,
+    snapshot_size,
+)
 from elile.db.repositories.base import BaseRepository
+from elile.monitoring.fingerprints import compute_profile_digest
+
+DEFAULT_MAX_DELTA_CHAIN = 20
+
+
+def _snapshot_of(profile: EntityProfile) -> dict[str, Any]:
+    return {name: getattr(profile, name) for name in SNAPSHOT_FIELDS}
+
+
+def _digest_of(snapshot: dict[str, Any]) -> dict[str, str] | None:
+    """Compute the stored digest of a snapshot, keyed by SNAPSHOT_FIELDS.
+
+    Returns:
+        ProfileDigest as a dict, or None if the findings, risk score or
+        connections are not stored in the shape the delta detector takes
+    """
+    findings = snapshot["findings"] or []
+    risk_score = snapshot["risk_score"] or None
+    connections = snapshot["connections"] or []
+    if not (
+        isinstance(findings, list)
+        and all(isinstance(finding, dict) for finding in findings)
+        and isinstance(risk_score, dict | None)
+        and isinstance(connections, list)
+    ):
+        return None
+    return compute_profile_digest(findings, risk_score, connections).to_dict()
+
+
+def _is_unresolved(profile: EntityProfile) -> bool:
+    """Check if a profile is a delta row whose snapshot has not been rebuilt."""
+    return profile.encoding == ProfileEncoding.DELTA.value and profile.findings is None
+
+
+def _set_snapshot(profile: EntityProfile, snapshot: dict[str, Any]) -> None:
+    """Set snapshot fields without marking the profile as modified."""
+    for name in SNAPSHOT_FIELDS:
+        set_committed_value(profile, name, snapshot[name])
+
+
+def _store_full(profile: EntityProfile, snapshot: dict[str, Any]) -> None:
+    """Turn a profile into a full row that starts a new chain."""
+    profile.encoding = ProfileEncoding.FULL.value
+    profile.base_version = None
+    profile.chain_start = profile.version
+    profile.snapshot_delta = None
+    for name in SNAPSHOT_FIELDS:
+        setattr(profile, name, snapshot[name])
+        # Rebuilt snapshots are loaded as committed, so force them to be written
+        flag_modified(profile, name)
 
 
 class ProfileRepository(BaseRepository[EntityProfile, UUID]):
     """Repository for EntityProfile model operations.
 
     Provides profile-specific queries in addition to base CRUD operations.
+    Profiles returned by any query method have their snapshot fields
+    populated, whether they are stored in full or as deltas.
+
+    Attributes:
+        compact: Whether new versions are stored as deltas where possible
+        max_delta_chain: Deltas allowed before a full snapshot is written
     """
 
     model = EntityProfile
 
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        compact: bool = False,
+        max_delta_chain: int = DEFAULT_MAX_DELTA_CHAIN,
+    ):
+        """Initialize repository with database session.
+
+        Args:
+            db: Async SQLAlchemy session
+            compact: Store new versions as deltas against the previous version
+            max_delta_chain: Deltas allowed before a full snapshot is written
+        """
+        super().__init__(db)
+        self.compact = compact
+        self.max_delta_chain = max_delta_chain
+
+    # =========================================================================
+    # Compact storage
+    # =========================================================================
+
+    async def create(self, obj: EntityProfile, *, commit: bool = True) -> EntityProfile:
+        """Create a profile version, as a delta in compact mode.
+
+        Args:
+            obj: Profile to create
+            commit: Whether to commit the transaction
+
+        Returns:
+            Created profile, with its snapshot fields populated
+        """
+        encoded = await self._encode([obj])
+        created = await super().create(obj, commit=commit)
+        for profile, snapshot in encoded:
+            _set_snapshot(profile, snapshot)
+        return created
+
+    async def create_many(
+        self, objs: Sequence[EntityProfile], *, commit: bool = True
+    ) -> list[EntityProfile]:
+        """Create several profile versions, as deltas in compact mode.
+
+        Versions of the same entity are encoded against each other in
+        version order.
+
+        Args:
+            objs: Profiles to create
+            commit: Whether to commit the transaction
+
+        Returns:
+            Created profiles, with their snapshot fields populated
+        """
+        encoded = await self._encode(objs)
+        created = await super().create_many(objs, commit=commit)
+        for profile, snapshot in encoded:
+            _set_snapshot(profile, snapshot)
+        return created
+
+    async def _encode(
+        self,
+        profiles: Sequence[EntityProfile],
+    ) -> list[tuple[EntityProfile, dict[str, Any]]]:
+        """Digest new profiles and turn them into delta rows where compact storage allows.
+
+        Args:
+            profiles: New profiles
+
+        Returns:
+            (profile, snapshot) for each profile turned into a delta row
+        """
+        for profile in profiles:
+            if profile.digest is None:
+                profile.digest = _digest_of(_snapshot_of(profile))
+        if not self.compact:
+            return []
+
+        encoded: list[tuple[EntityProfile, dict[str, Any]]] = []
+        # Latest version per entity: (version, chain start, snapshot)
+        heads: dict[UUID, tuple[int, int, dict[str, Any]] | None] = {}
+        for profile in sorted(profiles, key=lambda p: p.version):
+            snapshot = _snapshot_of(profile)
+            if profile.entity_id not in heads:
+                heads[profile.entity_id] = await self._head(profile.entity_id, profile.version)
+            head = heads[profile.entity_id]
+
+            profile.encoding = ProfileEncoding.FULL.value
+            profile.base_version = None
+            profile.chain_start = profile.version
+            profile.snapshot_delta = None
+
+            if head is not None and profile.version - head[1] <= self.max_delta_chain:
+                version, chain_start, previous = head
+                data = encode_delta(diff_snapshot(previous, snapshot))
+                if len(data) < snapshot_size(snapshot):
+                    profile.encoding = ProfileEncoding.DELTA.value
+                    profile.base_version = version
+                    profile.chain_start = chain_start
+                    profile.snapshot_delta = data
+                    for name in SNAPSHOT_FIELDS:
+                        setattr(profile, name, None)
+                    encoded.append((profile, snapshot))
+
+            heads[profile.entity_id] = (profile.version, profile.chain_start, snapshot)
+        return encoded
+
+    async def update(
+        self, obj: EntityProfile, updates: dict[str, Any], *, commit: bool = True
+    ) -> EntityProfile:
+        """Update a profile, keeping its delta chain and digest consistent.
+
+        When the snapshot changes, a delta row is stored in full (its delta
+        would no longer rebuild the new snapshot), the delta row built on
+        it is re-encoded against the new snapshot, and the digest is
+        refreshed.
+
+        Args:
+            obj: Profile to update
+            updates: Dictionary of field: value to update
+            commit: Whether to commit the transaction
+
+        Returns:
+            Updated profile
+        """
+        if updates.keys().isdisjoint(SNAPSHOT_FIELDS):
+            return await super().update(obj, updates, commit=commit)
+
+        await self._resolve([obj])
+        successor = await self._successor(obj)
+        snapshot = {
+            **_snapshot_of(obj),
+            **{name: updates[name] for name in SNAPSHOT_FIELDS if name in updates},
+        }
+        if "digest" not in updates:
+            updates = {**updates, "digest": _digest_of(snapshot)}
+        if obj.encoding == ProfileEncoding.DELTA.value:
+            _store_full(obj, snapshot)
+        if successor is not None:
+            self._rebase(successor, snapshot)
+        return await super().update(obj, updates, commit=commit)
+
+    async def delete(self, obj: EntityProfile, *, commit: bool = True) -> None:
+        """Delete a profile, storing the delta row built on it in full.
+
+        Args:
+            obj: Profile to delete
+            commit: Whether to commit the transaction
+        """
+        successor = await self._successor(obj)
+        if successor is not None:
+            _store_full(successor, _snapshot_of(successor))
+        await super().delete(obj, commit=commit)
+
+    async def replace_snapshots(
+        self, snapshots: Mapping[UUID, dict[str, Any]], *, commit: bool = True
+    ) -> None:
+        """Overwrite the snapshots of several profiles, for example with anonymized data.
+
+        Each profile is stored in full with its new snapshot and digest. A
+        delta row built on a replaced profile that is not replaced itself is
+        stored in full first, so it still rebuilds to its own data. The
+        changed rows are flushed together.
+
+        Args:
+            snapshots: New snapshot, keyed by SNAPSHOT_FIELDS, per profile ID
+            commit: Whether to commit the transaction
+        """
+        if not snapshots:
+            return
+        profiles = await self.get_many(list(snapshots))
+        stmt = select(EntityProfile).where(
+            EntityProfile.encoding == ProfileEncoding.DELTA.value,
+            EntityProfile.profile_id.not_in(list(snapshots)),
+            or_(
+                *(
+                    and_(
+                        EntityProfile.entity_id == profile.entity_id,
+                        EntityProfile.base_version == profile.version,
+                    )
+                    for profile in profiles
+                )
+            ),
+        )
+        successors = await self._resolve((await self.db.execute(stmt)).scalars().all())
+
+        for successor in successors:
+            _store_full(successor, _snapshot_of(successor))
+        for profile in profiles:
+            snapshot = snapshots[profile.profile_id]
+            _store_full(profile, snapshot)
+            profile.digest = _digest_of(snapshot)
+
+        if commit:
+            await self.db.commit()
+        else:
+            await self.db.flush()
+
+    async def _successor(self, profile: EntityProfile) -> EntityProfile | None:
+        """Get the delta row built on a profile, with its snapshot rebuilt.
+
+        Returns:
+            The next version if it is stored as a delta against the profile
+        """
+        stmt = select(EntityProfile).where(
+            EntityProfile.entity_id == profile.entity_id,
+            EntityProfile.base_version == profile.version,
+            EntityProfile.encoding == ProfileEncoding.DELTA.value,
+        )
+        successor = (await self.db.execute(stmt)).scalar_one_or_none()
+        if successor is not None:
+            await self._resolve([successor])
+        return successor
+
+    def _rebase(self, profile: EntityProfile, base: dict[str, Any]) -> None:
+        """Re-encode a delta row against a new snapshot of its base version."""
+        snapshot = _snapshot_of(profile)
+        data = encode_delta(diff_snapshot(base, snapshot))
+        if len(data) < snapshot_size(snapshot):
+            profile.snapshot_delta = data
+        else:
+            _store_full(profile, snapshot)
+
+    async def _head(
+        self,
+        entity_id: UUID,
+        before_version: int,
+    ) -> tuple[int, int, dict[str, Any]] | None:
+        """Get the latest stored version below a version number.
+
+        Returns:
+            (version, chain start, snapshot), or None if there is none
+        """
+        stmt = (
+            select(EntityProfile)
+            .where(EntityProfile.entity_id == entity_id)
+            .where(EntityProfile.version < before_version)
+            .order_by(EntityProfile.version.desc())
+            .limit(1)
+        )
+        result = await self.db.execute(stmt)
+        profile = result.scalar_one_or_none()
+        if profile is None:
+            return None
+
+        await self._resolve([profile])
+        chain_start = profile.chain_start if profile.chain_start is not None else profile.version
+        return profile.version, chain_start, _snapshot_of(profile)
+
+    async def _resolve(self, profiles: Sequence[EntityProfile]) -> list[EntityProfile]:
+        """Rebuild the snapshot fields of delta rows.
+
+        Chains of all unresolved profiles are fetched in one query, from
+        their full snapshot up to the newest requested version, and
+        replayed in version order.
+
+        Args:
+            profiles: Profiles about to be returned
+
+        Returns:
+            The same profiles, with snapshot fields populated
+
+        Raises:
+            ValueError: If a delta chain has a missing version
+        """
+        unresolved = [profile for profile in profiles if _is_unresolved(profile)]
+        if not unresolved:
+            return list(profiles)
+
+        # Newest requested version per chain
+        chains: dict[tuple[UUID, int], int] = {}
+        for profile in unresolved:
+            key = (profile.entity_id, profile.chain_start)
+            chains[key] = max(chains.get(key, profile.version), profile.version)
+
+        stmt = (
+            select(EntityProfile)
+            .where(
+                or_(
+                    *(
+                        and_(
+                            EntityProfile.entity_id == entity_id,
+                            EntityProfile.version.between(chain_start, last_version),
+                        )
+                        for (entity_id, chain_start), last_version in chains.items()
+                    )
+                )
+            )
+            .order_by(EntityProfile.entity_id, EntityProfile.version)
+        )
+        result = await self.db.execute(stmt)
+
+        wanted = {id(profile) for profile in unresolved}
+        snapshot: dict[str, Any] | None = None
+        previous: EntityProfile | None = None
+        for profile in result.scalars().all():
+            if previous is None or previous.entity_id != profile.entity_id:
+                snapshot, previous = None, None
+
+            if not _is_unresolved(profile):
+                # Copied so rebuilt versions never share objects with loaded ones
+                snapshot = copy.deepcopy(_snapshot_of(profile))
+            else:
+                if snapshot is None or previous is None or profile.base_version != previous.version:
+                    raise ValueError(
+                        f"Broken profile delta chain for entity {profile.entity_id} "
+                        f"at version {profile.version}"
+                    )
+                snapshot = apply_snapshot_delta(snapshot, decode_delta(profile.snapshot_delta))
+                if id(profile) in wanted:
+                    last = chains[(profile.entity_id, profile.chain_start)] == profile.version
+                    _set_snapshot(profile, snapshot if last else copy.deepcopy(snapshot))
+            previous = profile
+
+        return list(profiles)
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    async def get(self, pk: UUID) -> EntityProfile | None:
+        """Get a profile by ID.
+
+        Args:
+            pk: Profile ID
+
+        Returns:
+            Profile or None if not found
+        """
+        profile = await super().get(pk)
+        if profile is not None:
+            await self._resolve([profile])
+        return profile
+
+    async def get_many(self, pks: Sequence[UUID]) -> list[EntityProfile]:
+        """Get multiple profiles by ID.
+
+        Args:
+            pks: Profile IDs
+
+        Returns:
+            List of found profiles
+        """
+        return await self._resolve(await super().get_many(pks))
+
     async def get_by_entity(
         self,
         entity_id: UUID,
@@ -35,7 +463,32 @@ class ProfileRepository(BaseRepository[EntityProfile, UUID]):
         stmt = stmt.order_by(EntityProfile.version.desc()).limit(limit)
 
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return await self._resolve(result.scalars().all())
+
+    async def get_for_entities(
+        self,
+        entity_ids: Collection[UUID],
+        *,
+        tenant_id: UUID | None = None,
+    ) -> list[EntityProfile]:
+        """Get every profile of several entities in one query.
+
+        Args:
+            entity_ids: Entities to get profiles for
+            tenant_id: Only include entities of this tenant
+
+        Returns:
+            List of profiles ordered by entity and version
+        """
+        stmt = select(EntityProfile).where(EntityProfile.entity_id.in_(list(entity_ids)))
+        if tenant_id is not None:
+            stmt = stmt.join(Entity, Entity.entity_id == EntityProfile.entity_id).where(
+                Entity.tenant_id == tenant_id
+            )
+        stmt = stmt.order_by(EntityProfile.entity_id, EntityProfile.version)
+
+        result = await self.db.execute(stmt)
+        return await self._resolve(result.scalars().all())
 
     async def get_latest(self, entity_id: UUID) -> EntityProfile | None:
         """Get the latest profile for an entity.
@@ -54,7 +507,10 @@ class ProfileRepository(BaseRepository[EntityProfile, UUID]):
         )
 
         result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        profile = result.scalar_one_or_none()
+        if profile is not None:
+            await self._resolve([profile])
+        return profile
 
     async def get_by_version(self, entity_id: UUID, version: int) -> EntityProfile | None:
         """Get a specific profile version for an entity.
@@ -73,7 +529,10 @@ class ProfileRepository(BaseRepository[EntityProfile, UUID]):
         )
 
         result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        profile = result.scalar_one_or_none()
+        if profile is not None:
+            await self._resolve([profile])
+        return profile
 
     async def get_by_trigger(
         self,
@@ -97,7 +556,7 @@ class ProfileRepository(BaseRepository[EntityProfile, UUID]):
         stmt = stmt.order_by(EntityProfile.created_at.desc()).limit(limit).offset(offset)
 
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return await self._resolve(result.scalars().all())
 
     async def get_screening_profiles(
         self,
@@ -177,4 +636,27 @@ class ProfileRepository(BaseRepository[EntityProfile, UUID]):
         )
 
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return await self._resolve(result.scalars().all())
+
+    async def list(
+        self,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        order_by: str | None = None,
+        descending: bool = False,
+    ) -> list[EntityProfile]:
+        """List profiles with pagination.
+
+        Args:
+            limit: Maximum profiles to return
+            offset: Number of profiles to skip
+            order_by: Column name to order by (default: primary key)
+            descending: Sort in descending order
+
+        Returns:
+            List of profiles
+        """
+        return await self._resolve(
+            await super().list(limit=limit, offset=offset, order_by=order_by, descending=descending)
+        )
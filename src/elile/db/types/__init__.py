@@ -1,5 +1,24 @@
 """SQLAlchemy custom types."""
 
-from .encrypted import EncryptedJSON, EncryptedString
+from .encrypted import (
+    EncryptedJSON,
+    EncryptedString,
+    EncryptedValue,
+    decrypt_values,
+    decrypt_values_async,
+    encrypt_values,
+    encrypt_values_async,
+    encrypted_values,
+)
 
-__all__ = ["EncryptedString", "EncryptedJSON"]
+__all__ = [
+    "EncryptedString",
+    "EncryptedJSON",
+    # Bulk and lazy decryption
+    "EncryptedValue",
+    "decrypt_values",
+    "decrypt_values_async",
+    "encrypt_values",
+    "encrypt_values_async",
+    "encrypted_values",
+]
@@ -11,8 +11,30 @@ Usage:
 
         ssn = Column(EncryptedString())  # Encrypted string
         pii_data = Column(EncryptedJSON())  # Encrypted JSON
+
+Bulk loads:
+    Decrypting inline runs AES-GCM, base64 and JSON decoding for every
+    value while the result is fetched, on the event loop. Columns declared
+    with ``lazy=True`` load as EncryptedValue proxies instead, which are
+    decrypted on first access (so columns never read are never
+    decrypted), or all at once:
+
+        class SensitiveModel(Base):
+            ssn = Column(EncryptedString(lazy=True))
+
+        rows = (await session.execute(select(SensitiveModel))).scalars().all()
+        await decrypt_values_async(encrypted_values(rows))  # In a worker thread
+        rows[0].ssn.get()
+
+    encrypt_values_async likewise encrypts a batch of values for a bulk
+    insert off the event loop; the resulting proxies are stored as they are.
 """
 
+import asyncio
+import base64
+import json
+import logging
+from collections.abc import Iterable, Sequence
 from typing import Any
 
 from sqlalchemy import Text, TypeDecorator
@@ -24,8 +46,192 @@ from elile.core.encryption import (
     decrypt_string,
     encrypt_json,
     encrypt_string,
+    get_encryptor,
 )
 
+# Values per worker thread call in the async batch functions
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _dumps(value: Any) -> str:
+    # Same serialization as Encryptor.encrypt_json
+    return json.dumps(value, separators=(",", ":"), sort_keys=True)
+
+
+def _unencrypted(stored: str, is_json: bool) -> Any:
+    """Read a value that was stored unencrypted (development mode)."""
+    if not is_json:
+        return stored
+    try:
+        return json.loads(stored)
+    except json.JSONDecodeError:
+        return stored
+
+
+class EncryptedValue:
+    """Stored value of a lazy encrypted column, decrypted on first access.
+
+    Returned instead of the plaintext by ``EncryptedString(lazy=True)`` and
+    ``EncryptedJSON(lazy=True)``. Binding an EncryptedValue stores its
+    ciphertext unchanged, without re-encrypting.
+
+    Attributes:
+        stored: Value as stored in the database (base64 ciphertext)
+        is_json: Whether the plaintext is JSON
+    """
+
+    __slots__ = ("stored", "is_json", "_value", "_decrypted")
+
+    def __init__(self, stored: str, *, is_json: bool = False):
+        """Initialize from a stored value.
+
+        Args:
+            stored: Value as stored in the database
+            is_json: Whether the plaintext is JSON
+        """
+        self.stored = stored
+        self.is_json = is_json
+        self._value: Any = None
+        self._decrypted = False
+
+    @property
+    def is_decrypted(self) -> bool:
+        """Whether the plaintext is available without decrypting."""
+        return self._decrypted
+
+    def get(self) -> Any:
+        """Get the plaintext, decrypting it on first call."""
+        if not self._decrypted:
+            decrypt_values([self])
+        return self._value
+
+    def _set(self, value: Any) -> None:
+        self._value = value
+        self._decrypted = True
+
+    def __repr__(self) -> str:
+        state = "decrypted" if self._decrypted else "encrypted"
+        return f"<EncryptedValue({state}, is_json={self.is_json})>"
+
+
+def decrypt_values(values: Iterable[EncryptedValue]) -> None:
+    """Decrypt many encrypted values in one batch.
+
+    Values that are already decrypted are skipped. If the batch contains
+    values that were stored unencrypted, it falls back to one value at a
+    time, reading those as plaintext like the column types do.
+
+    Args:
+        values: Values to decrypt
+    """
+    pending = [value for value in values if not value.is_decrypted]
+    if not pending:
+        return
+
+    try:
+        encryptor = get_encryptor()
+        plaintexts = encryptor.decrypt_many(
+            [base64.b64decode(value.stored, validate=True) for value in pending]
+        )
+    except (DecryptionError, EncryptionKeyError, ValueError):
+        for value in pending:
+            try:
+                plaintext = get_encryptor().decrypt(base64.b64decode(value.stored, validate=True))
+            except (DecryptionError, EncryptionKeyError, ValueError):
+                value._set(_unencrypted(value.stored, value.is_json))
+            else:
+                text = plaintext.decode("utf-8")
+                value._set(json.loads(text) if value.is_json else text)
+        return
+
+    for value, plaintext in zip(pending, plaintexts, strict=True):
+        text = plaintext.decode("utf-8")
+        value._set(json.loads(text) if value.is_json else text)
+
+
+def encrypt_values(values: Sequence[Any], *, is_json: bool = False) -> list[EncryptedValue]:
+    """Encrypt many values for storage in one batch.
+
+    Args:
+        values: Plaintext strings, or JSON-serializable values if is_json
+        is_json: Whether the values are for an EncryptedJSON column
+
+    Returns:
+        Encrypted values, already holding their plaintext
+    """
+    plaintexts = [_dumps(value) if is_json else value for value in values]
+    try:
+        ciphertexts = get_encryptor().encrypt_many([text.encode("utf-8") for text in plaintexts])
+        stored = [base64.b64encode(ciphertext).decode("ascii") for ciphertext in ciphertexts]
+    except EncryptionKeyError:
+        # Same development-mode fallback as the column types
+        logging.warning("ENCRYPTION_KEY not configured. Storing sensitive data unencrypted.")
+        stored = plaintexts
+
+    encrypted = []
+    for value, text in zip(values, stored, strict=True):
+        item = EncryptedValue(text, is_json=is_json)
+        item._set(value)
+        encrypted.append(item)
+    return encrypted
+
+
+async def decrypt_values_async(
+    values: Iterable[EncryptedValue], *, batch_size: int = DEFAULT_BATCH_SIZE
+) -> None:
+    """Decrypt many encrypted values in a worker thread.
+
+    Batches run one after another, so the event loop gets control back
+    between them.
+
+    Args:
+        values: Values to decrypt
+        batch_size: Values per worker thread call
+    """
+    pending = [value for value in values if not value.is_decrypted]
+    for start in range(0, len(pending), batch_size):
+        await asyncio.to_thread(decrypt_values, pending[start : start + batch_size])
+
+
+async def encrypt_values_async(
+    values: Sequence[Any], *, is_json: bool = False, batch_size: int = DEFAULT_BATCH_SIZE
+) -> list[EncryptedValue]:
+    """Encrypt many values for storage in a worker thread.
+
+    Args:
+        values: Plaintext strings, or JSON-serializable values if is_json
+        is_json: Whether the values are for an EncryptedJSON column
+        batch_size: Values per worker thread call
+
+    Returns:
+        Encrypted values, already holding their plaintext
+    """
+    encrypted: list[EncryptedValue] = []
+    for start in range(0, len(values), batch_size):
+        encrypted.extend(
+            await asyncio.to_thread(
+                encrypt_values, values[start : start + batch_size], is_json=is_json
+            )
+        )
+    return encrypted
+
+
+def encrypted_values(instances: Iterable[object]) -> list[EncryptedValue]:
+    """Collect the still-encrypted lazy column values of loaded instances.
+
+    Args:
+        instances: ORM instances
+
+    Returns:
+        EncryptedValue proxies not yet decrypted
+    """
+    return [
+        value
+        for instance in instances
+        for value in vars(instance).values()
+        if isinstance(value, EncryptedValue) and not value.is_decrypted
+    ]
+
 
 class EncryptedString(TypeDecorator):
     """SQLAlchemy type that transparently encrypts/decrypts string values.
@@ -39,15 +245,28 @@ class EncryptedString(TypeDecorator):
 
         user = User(ssn="123-45-6789")  # Stored encrypted
         print(user.ssn)  # Returns "123-45-6789" (decrypted)
+
+    With ``lazy=True`` values load as EncryptedValue proxies.
     """
 
     impl = Text
     cache_ok = True
 
-    def process_bind_param(self, value: str | None, dialect) -> str | None:
+    def __init__(self, *args: Any, lazy: bool = False, **kwargs: Any):
+        """Initialize the type.
+
+        Args:
+            lazy: Load values as EncryptedValue proxies instead of decrypting
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy = lazy
+
+    def process_bind_param(self, value: str | EncryptedValue | None, dialect) -> str | None:
         """Encrypt value before storing in database."""
         if value is None:
             return None
+        if isinstance(value, EncryptedValue):
+            return value.stored
         try:
             return encrypt_string(value)
         except EncryptionKeyError:
@@ -60,10 +279,12 @@ class EncryptedString(TypeDecorator):
             )
             return value
 
-    def process_result_value(self, value: str | None, dialect) -> str | None:
+    def process_result_value(self, value: str | None, dialect) -> str | EncryptedValue | None:
         """Decrypt value when reading from database."""
         if value is None:
             return None
+        if self.lazy:
+            return EncryptedValue(value)
         try:
             return decrypt_string(value)
         except (DecryptionError, EncryptionKeyError):
@@ -84,15 +305,28 @@ class EncryptedJSON(TypeDecorator):
 
         source = DataSource(raw_response={"data": "sensitive"})  # Stored encrypted
         print(source.raw_response)  # Returns {"data": "sensitive"} (decrypted)
+
+    With ``lazy=True`` values load as EncryptedValue proxies.
     """
 
     impl = Text
     cache_ok = True
 
+    def __init__(self, *args: Any, lazy: bool = False, **kwargs: Any):
+        """Initialize the type.
+
+        Args:
+            lazy: Load values as EncryptedValue proxies instead of decrypting
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy = lazy
+
     def process_bind_param(self, value: Any | None, dialect) -> str | None:
         """Encrypt JSON value before storing in database."""
         if value is None:
             return None
+        if isinstance(value, EncryptedValue):
+            return value.stored
         try:
             return encrypt_json(value)
         except EncryptionKeyError:
@@ -109,6 +343,8 @@ class EncryptedJSON(TypeDecorator):
         """Decrypt JSON value when reading from database."""
         if value is None:
             return None
+        if self.lazy:
+            return EncryptedValue(value, is_json=True)
         try:
             return decrypt_json(value)
         except (DecryptionError, EncryptionKeyError):
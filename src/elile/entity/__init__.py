@@ -33,47 +33,54 @@ Relationships:
     neighbors = await graph.get_neighbors(entity_id, depth=2)
 """
 
-from elile.entity.deduplication import (
-    DeduplicationResult,
-    DuplicateCandidate,
-    EntityDeduplicator,
-    MergeResult,
-)
-from elile.entity.graph import (
-    PathSegment,
-    RelationshipEdge,
-    RelationshipGraph,
-    RelationshipPath,
-)
-from elile.entity.identifiers import IdentifierManager, IdentifierUpdate
-from elile.entity.manager import EntityCreateResult, EntityManager
-from elile.entity.matcher import EntityMatcher
-from elile.entity.types import (
-    IdentifierRecord,
-    IdentifierType,
-    MatchedField,
-    MatchResult,
-    MatchType,
-    RelationType,
-    ResolutionDecision,
-    SubjectIdentifiers,
-)
-from elile.entity.tenant import (
-    EntityAccessControl,
-    TenantAwareEntityService,
-    TenantEntityCreateResult,
-    TenantScopedQuery,
-)
-from elile.entity.validation import (
-    EntityValidator,
-    ValidationError,
-    ValidationResult,
-    ValidationSeverity,
-    ValidationWarning,
-    validate_identifier,
-    validate_or_raise,
-    validate_subject,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.entity.deduplication import (
+        DeduplicationResult,
+        DuplicateCandidate,
+        EntityDeduplicator,
+        MergeResult,
+    )
+    from elile.entity.graph import (
+        PathSegment,
+        RelationshipEdge,
+        RelationshipGraph,
+        RelationshipPath,
+    )
+    from elile.entity.identifiers import IdentifierManager, IdentifierUpdate
+    from elile.entity.manager import EntityCreateResult, EntityManager
+    from elile.entity.matcher import EntityMatcher
+    from elile.entity.types import (
+        IdentifierRecord,
+        IdentifierType,
+        MatchedField,
+        MatchResult,
+        MatchType,
+        RelationType,
+        ResolutionDecision,
+        SubjectIdentifiers,
+    )
+    from elile.entity.tenant import (
+        EntityAccessControl,
+        TenantAwareEntityService,
+        TenantEntityCreateResult,
+        TenantScopedQuery,
+    )
+    from elile.entity.validation import (
+        EntityValidator,
+        ValidationError,
+        ValidationResult,
+        ValidationSeverity,
+        ValidationWarning,
+        validate_identifier,
+        validate_or_raise,
+        validate_subject,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Manager
@@ -4,6 +4,7 @@ This module provides:
 - HRISGateway: Core gateway for managing HRIS connections and events
 - HRISEventProcessor: Routes HRIS events to appropriate handlers
 - HRISResultPublisher: Publishes screening results and alerts to HRIS platforms
+- OutboundQueue: Durable queue of outbound HRIS messages with coalescing and retry
 - HRISAdapter: Protocol for platform-specific adapters
 - HRISEvent: Normalized event representation from HRIS platforms
 - Event types and platform enums for HRIS integration
@@ -48,42 +49,62 @@ Example usage:
     )
 """
 
-from elile.hris.event_processor import (
-    EventStore,
-    HRISEventProcessor,
-    InMemoryEventStore,
-    ProcessingAction,
-    ProcessingResult,
-    ProcessingStatus,
-    ProcessorConfig,
-    create_event_processor,
-)
-from elile.hris.gateway import (
-    AlertUpdate,
-    BaseHRISAdapter,
-    EmployeeInfo,
-    GatewayConfig,
-    HRISAdapter,
-    HRISConnection,
-    HRISConnectionStatus,
-    HRISEvent,
-    HRISEventType,
-    HRISGateway,
-    HRISPlatform,
-    MockHRISAdapter,
-    ScreeningUpdate,
-    WebhookValidationResult,
-    create_hris_gateway,
-)
-from elile.hris.result_publisher import (
-    DeliveryRecord,
-    HRISResultPublisher,
-    PublishEventType,
-    PublisherConfig,
-    PublishResult,
-    PublishStatus,
-    create_result_publisher,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.hris.event_processor import (
+        BatchEventStore,
+        BatchProcessingResult,
+        EventStore,
+        HRISEventProcessor,
+        InMemoryEventStore,
+        ProcessingAction,
+        ProcessingResult,
+        ProcessingStatus,
+        ProcessorConfig,
+        create_event_processor,
+    )
+    from elile.hris.gateway import (
+        AlertUpdate,
+        BaseHRISAdapter,
+        BatchHRISAdapter,
+        EmployeeInfo,
+        GatewayConfig,
+        HRISAdapter,
+        HRISConnection,
+        HRISConnectionStatus,
+        HRISEvent,
+        HRISEventType,
+        HRISGateway,
+        HRISPlatform,
+        MockHRISAdapter,
+        ScreeningUpdate,
+        WebhookValidationResult,
+        create_hris_gateway,
+    )
+    from elile.hris.outbound_queue import (
+        DeliveryHistoryStore,
+        InMemoryDeliveryHistoryStore,
+        InMemoryOutboundQueue,
+        OutboundMessage,
+        OutboundQueue,
+        OutboundStatus,
+        SQLAlchemyDeliveryHistoryStore,
+        SQLAlchemyOutboundQueue,
+    )
+    from elile.hris.result_publisher import (
+        DeliveryRecord,
+        HRISResultPublisher,
+        PublisherConfig,
+        PublishEventType,
+        PublishResult,
+        PublishStatus,
+        create_result_publisher,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Core gateway
@@ -97,7 +118,9 @@ __all__ = [
     "ProcessingStatus",
     "ProcessingAction",
     "EventStore",
+    "BatchEventStore",
     "InMemoryEventStore",
+    "BatchProcessingResult",
     "create_event_processor",
     # Result publisher
     "HRISResultPublisher",
@@ -107,9 +130,19 @@ __all__ = [
     "PublishEventType",
     "DeliveryRecord",
     "create_result_publisher",
+    # Outbound queue and delivery history
+    "OutboundQueue",
+    "InMemoryOutboundQueue",
+    "SQLAlchemyOutboundQueue",
+    "OutboundMessage",
+    "OutboundStatus",
+    "DeliveryHistoryStore",
+    "InMemoryDeliveryHistoryStore",
+    "SQLAlchemyDeliveryHistoryStore",
     # Adapter protocol and base class
     "HRISAdapter",
     "BaseHRISAdapter",
+    "BatchHRISAdapter",
     "MockHRISAdapter",
     # Event types
     "HRISEvent",
@@ -2,10 +2,21 @@
 
 This module processes incoming HRIS events and routes them to the appropriate
 subsystems (screening, monitoring, vigilance management).
+
+Events can be processed one at a time (process_event) or in bulk
+(process_events) for onboarding waves. The bulk path drops repeated
+events, resolves employee mappings and pending screenings with one store
+query per tenant, writes store changes back in one flush, and starts
+screenings in pipelined batches.
 """
 
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any, Protocol
 from uuid import UUID, uuid7
@@ -114,6 +125,51 @@ class ProcessingResult:
         }
 
 
+@dataclass
+class BatchProcessingResult:
+    """Result of processing a batch of HRIS events.
+
+    Results are in the order the events were given.
+    """
+
+    batch_id: UUID = field(default_factory=uuid7)
+    results: list[ProcessingResult] = field(default_factory=list)
+    duplicates: int = 0
+    started_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    processing_time_ms: int = 0
+
+    @property
+    def total(self) -> int:
+        """Number of events in the batch."""
+        return len(self.results)
+
+    @property
+    def events_per_second(self) -> float:
+        """Throughput of the batch."""
+        if self.processing_time_ms <= 0:
+            return float(self.total)
+        return self.total * 1000 / self.processing_time_ms
+
+    def count(self, status: ProcessingStatus) -> int:
+        """Count results with the given status."""
+        return sum(1 for r in self.results if r.status == status)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "batch_id": str(self.batch_id),
+            "total": self.total,
+            "succeeded": self.count(ProcessingStatus.SUCCESS),
+            "skipped": self.count(ProcessingStatus.SKIPPED),
+            "failed": self.count(ProcessingStatus.FAILED),
+            "duplicates": self.duplicates,
+            "started_at": self.started_at.isoformat(),
+            "processing_time_ms": self.processing_time_ms,
+            "events_per_second": round(self.events_per_second, 1),
+            "results": [r.to_dict() for r in self.results],
+        }
+
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -153,6 +209,31 @@ class ProcessorConfig(BaseModel):
     max_retries: int = Field(default=3, ge=0, le=10)
     retry_delay_seconds: int = Field(default=60, ge=10, le=600)
 
+    # Bulk ingestion
+    dedup_window_seconds: int = Field(
+        default=3600,
+        ge=0,
+        le=86400,
+        description="Window in which a repeat of a bulk-ingested event is dropped",
+    )
+    dedup_cache_size: int = Field(
+        default=100_000,
+        ge=0,
+        description="Recent event keys remembered for de-duplication",
+    )
+    screening_batch_size: int = Field(
+        default=50,
+        ge=1,
+        le=1000,
+        description="Screenings started per request during bulk ingestion",
+    )
+    max_concurrent_screening_batches: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Screening batches in flight at once during bulk ingestion",
+    )
+
 
 # =============================================================================
 # Service Protocols
@@ -177,6 +258,17 @@ class ScreeningServiceProtocol(Protocol):
         ...
 
 
+class BatchScreeningServiceProtocol(ScreeningServiceProtocol, Protocol):
+    """Protocol for screening services that can start many screenings per request."""
+
+    async def initiate_screenings(
+        self,
+        requests: list[ScreeningRequest],
+    ) -> list[UUID]:
+        """Initiate screenings and return their IDs, in order."""
+        ...
+
+
 class MonitoringServiceProtocol(Protocol):
     """Protocol for the monitoring service interface."""
 
@@ -268,6 +360,50 @@ class EventStore(Protocol):
         ...
 
 
+class BatchEventStore(EventStore, Protocol):
+    """Protocol for event stores that can read and write many employees at once."""
+
+    async def get_pending_screenings(
+        self,
+        tenant_id: UUID,
+        employee_ids: list[str],
+    ) -> dict[str, ScreeningRequest]:
+        """Get the pending screening requests of several employees."""
+        ...
+
+    async def get_subject_ids_by_employee_ids(
+        self,
+        tenant_id: UUID,
+        employee_ids: list[str],
+    ) -> dict[str, UUID]:
+        """Get subject IDs for several HRIS employee IDs."""
+        ...
+
+    async def save_pending_screenings(
+        self,
+        tenant_id: UUID,
+        requests: dict[str, ScreeningRequest],
+    ) -> None:
+        """Save pending screening requests keyed by employee ID."""
+        ...
+
+    async def remove_pending_screenings(
+        self,
+        tenant_id: UUID,
+        employee_ids: list[str],
+    ) -> int:
+        """Remove pending screening requests, returning how many existed."""
+        ...
+
+    async def save_employee_mappings(
+        self,
+        tenant_id: UUID,
+        mappings: dict[str, UUID],
+    ) -> None:
+        """Save mappings from HRIS employee IDs to subject IDs."""
+        ...
+
+
 class InMemoryEventStore:
     """In-memory implementation of EventStore for testing."""
 
@@ -319,6 +455,178 @@ class InMemoryEventStore:
     ) -> None:
         self._employee_mappings[self._key(tenant_id, employee_id)] = subject_id
 
+    async def get_pending_screenings(
+        self,
+        tenant_id: UUID,
+        employee_ids: list[str],
+    ) -> dict[str, ScreeningRequest]:
+        found = {}
+        for employee_id in employee_ids:
+            request = self._pending_screenings.get(self._key(tenant_id, employee_id))
+            if request is not None:
+                found[employee_id] = request
+        return found
+
+    async def get_subject_ids_by_employee_ids(
+        self,
+        tenant_id: UUID,
+        employee_ids: list[str],
+    ) -> dict[str, UUID]:
+        found = {}
+        for employee_id in employee_ids:
+            subject_id = self._employee_mappings.get(self._key(tenant_id, employee_id))
+            if subject_id is not None:
+                found[employee_id] = subject_id
+        return found
+
+    async def save_pending_screenings(
+        self,
+        tenant_id: UUID,
+        requests: dict[str, ScreeningRequest],
+    ) -> None:
+        for employee_id, request in requests.items():
+            self._pending_screenings[self._key(tenant_id, employee_id)] = request
+
+    async def remove_pending_screenings(
+        self,
+        tenant_id: UUID,
+        employee_ids: list[str],
+    ) -> int:
+        removed = 0
+        for employee_id in employee_ids:
+            if self._pending_screenings.pop(self._key(tenant_id, employee_id), None):
+                removed += 1
+        return removed
+
+    async def save_employee_mappings(
+        self,
+        tenant_id: UUID,
+        mappings: dict[str, UUID],
+    ) -> None:
+        for employee_id, subject_id in mappings.items():
+            self._employee_mappings[self._key(tenant_id, employee_id)] = subject_id
+
+
+class _BufferedEventStore:
+    """Event store view used while processing one tenant's part of a batch.
+
+    Pending screenings and employee mappings for the batch's employees are
+    fetched up front and writes are buffered, so handlers see each other's
+    changes within the batch while the backing store is queried and
+    written once. Stores implementing BatchEventStore get one call per
+    operation; others get one call per employee.
+    """
+
+    def __init__(self, store: EventStore, tenant_id: UUID) -> None:
+        self._store = store
+        self._tenant_id = tenant_id
+        self._pending: dict[str, ScreeningRequest | None] = {}
+        self._mappings: dict[str, UUID | None] = {}
+        self._saved_pending: dict[str, ScreeningRequest] = {}
+        self._removed_pending: set[str] = set()
+        self._saved_mappings: dict[str, UUID] = {}
+        self._stored_pending: set[str] = set()
+
+    async def prefetch(self, employee_ids: list[str]) -> None:
+        """Load the pending screenings and mappings of the given employees."""
+        store: Any = self._store
+        if hasattr(store, "get_pending_screenings"):
+            pending = await store.get_pending_screenings(self._tenant_id, employee_ids)
+            mappings = await store.get_subject_ids_by_employee_ids(self._tenant_id, employee_ids)
+        else:
+            pending = {}
+            mappings = {}
+            for employee_id in employee_ids:
+                pending[employee_id] = await store.get_pending_screening(
+                    self._tenant_id, employee_id
+                )
+                mappings[employee_id] = await store.get_subject_id_by_employee_id(
+                    self._tenant_id, employee_id
+                )
+        for employee_id in employee_ids:
+            self._pending[employee_id] = pending.get(employee_id)
+            self._mappings[employee_id] = mappings.get(employee_id)
+        self._stored_pending.update(e for e in employee_ids if pending.get(e) is not None)
+
+    async def flush(self) -> None:
+        """Write buffered changes to the backing store."""
+        store: Any = self._store
+        if hasattr(store, "save_pending_screenings"):
+            if self._removed_pending:
+                await store.remove_pending_screenings(
+                    self._tenant_id, sorted(self._removed_pending)
+                )
+            if self._saved_pending:
+                await store.save_pending_screenings(self._tenant_id, self._saved_pending)
+            if self._saved_mappings:
+                await store.save_employee_mappings(self._tenant_id, self._saved_mappings)
+        else:
+            for employee_id in sorted(self._removed_pending):
+                await store.remove_pending_screening(self._tenant_id, employee_id)
+            for employee_id, request in self._saved_pending.items():
+                await store.save_pending_screening(self._tenant_id, employee_id, request)
+            for employee_id, subject_id in self._saved_mappings.items():
+                await store.save_employee_mapping(self._tenant_id, employee_id, subject_id)
+        self._stored_pending.difference_update(self._removed_pending)
+        self._stored_pending.update(self._saved_pending)
+        self._saved_pending.clear()
+        self._removed_pending.clear()
+        self._saved_mappings.clear()
+
+    async def save_pending_screening(
+        self,
+        tenant_id: UUID,  # noqa: ARG002
+        employee_id: str,
+        request: ScreeningRequest,
+    ) -> None:
+        self._pending[employee_id] = request
+        self._saved_pending[employee_id] = request
+        self._removed_pending.discard(employee_id)
+
+    async def get_pending_screening(
+        self,
+        tenant_id: UUID,
+        employee_id: str,
+    ) -> ScreeningRequest | None:
+        if employee_id not in self._pending:
+            request = await self._store.get_pending_screening(tenant_id, employee_id)
+            self._pending[employee_id] = request
+            if request is not None:
+                self._stored_pending.add(employee_id)
+        return self._pending[employee_id]
+
+    async def remove_pending_screening(
+        self,
+        tenant_id: UUID,
+        employee_id: str,
+    ) -> bool:
+        existed = await self.get_pending_screening(tenant_id, employee_id) is not None
+        self._pending[employee_id] = None
+        self._saved_pending.pop(employee_id, None)
+        if employee_id in self._stored_pending:
+            self._removed_pending.add(employee_id)
+        return existed
+
+    async def get_subject_id_by_employee_id(
+        self,
+        tenant_id: UUID,
+        employee_id: str,
+    ) -> UUID | None:
+        if employee_id not in self._mappings:
+            self._mappings[employee_id] = await self._store.get_subject_id_by_employee_id(
+                tenant_id, employee_id
+            )
+        return self._mappings[employee_id]
+
+    async def save_employee_mapping(
+        self,
+        tenant_id: UUID,  # noqa: ARG002
+        employee_id: str,
+        subject_id: UUID,
+    ) -> None:
+        self._mappings[employee_id] = subject_id
+        self._saved_mappings[employee_id] = subject_id
+
 
 # =============================================================================
 # HRIS Event Processor
@@ -370,6 +678,8 @@ class HRISEventProcessor:
         self._vigilance_service = vigilance_service
         self._event_store = event_store or InMemoryEventStore()
         self._processed_count: dict[HRISEventType, int] = {}
+        self._recent_events: OrderedDict[str, tuple[UUID, datetime]] = OrderedDict()
+        self._duplicate_count = 0
 
     async def process_event(self, event: HRISEvent) -> ProcessingResult:
         """Process an HRIS event.
@@ -379,6 +689,108 @@ class HRISEventProcessor:
         Args:
             event: The HRIS event to process.
 
+        Returns:
+            ProcessingResult with status and details.
+        """
+        return await self._process(event, self._event_store)
+
+    async def process_events(self, events: list[HRISEvent]) -> BatchProcessingResult:
+        """Process a batch of HRIS events.
+
+        Events repeating one already ingested within dedup_window_seconds
+        are skipped; an event that fails is forgotten again, so the
+        platform's redelivery of it is processed. The rest are processed in order per tenant against a
+        buffered view of the event store, which is prefetched and flushed
+        with one query per tenant; screenings started by consent events are
+        then initiated in batches of screening_batch_size.
+
+        Args:
+            events: Events to process.
+
+        Returns:
+            BatchProcessingResult with one result per event, in order.
+        """
+        batch = BatchProcessingResult()
+        started = time.perf_counter()
+        results: list[ProcessingResult | None] = [None] * len(events)
+
+        by_tenant: dict[UUID, list[int]] = {}
+        now = datetime.now(UTC)
+        for index, event in enumerate(events):
+            original_id = self._check_duplicate(event, now)
+            if original_id is not None:
+                batch.duplicates += 1
+                results[index] = ProcessingResult(
+                    event_id=event.event_id,
+                    event_type=event.event_type,
+                    status=ProcessingStatus.SKIPPED,
+                    details={"reason": "Duplicate event", "duplicate_of": str(original_id)},
+                )
+                continue
+            by_tenant.setdefault(event.tenant_id, []).append(index)
+
+        screenings: list[tuple[ScreeningRequest, ProcessingResult]] = []
+        for tenant_id, indexes in by_tenant.items():
+            store = _BufferedEventStore(self._event_store, tenant_id)
+            tenant_screenings: list[tuple[ScreeningRequest, ProcessingResult]] = []
+            try:
+                await store.prefetch(list(dict.fromkeys(events[i].employee_id for i in indexes)))
+                for index in indexes:
+                    results[index] = await self._process(events[index], store, tenant_screenings)
+                await store.flush()
+            except Exception as e:
+                logger.exception(
+                    "Failed to process HRIS event batch for tenant",
+                    tenant_id=str(tenant_id),
+                    events=len(indexes),
+                )
+                for index in indexes:
+                    results[index] = ProcessingResult(
+                        event_id=events[index].event_id,
+                        event_type=events[index].event_type,
+                        status=ProcessingStatus.FAILED,
+                        error_message=str(e),
+                    )
+                continue
+            screenings.extend(tenant_screenings)
+
+        await self._start_screenings(screenings)
+
+        for event, result in zip(events, results, strict=True):
+            if result is not None and result.status == ProcessingStatus.FAILED:
+                self._forget_event(event)
+
+        batch.results = [r for r in results if r is not None]
+        batch.processing_time_ms = max(int((time.perf_counter() - started) * 1000), 1)
+
+        logger.info(
+            "AUDIT: hris_event_batch_processed",
+            audit_event_type="hris.event_batch_processed",
+            batch_id=str(batch.batch_id),
+            total=batch.total,
+            duplicates=batch.duplicates,
+            failed=batch.count(ProcessingStatus.FAILED),
+            screenings_started=len(screenings),
+            processing_time_ms=batch.processing_time_ms,
+            events_per_second=round(batch.events_per_second, 1),
+        )
+
+        return batch
+
+    async def _process(
+        self,
+        event: HRISEvent,
+        store: EventStore,
+        screenings: list[tuple[ScreeningRequest, ProcessingResult]] | None = None,
+    ) -> ProcessingResult:
+        """Route an event to its handler.
+
+        Args:
+            event: The HRIS event to process.
+            store: Event store the handlers read and write.
+            screenings: If given, screenings to start are collected here
+                instead of being started by the handler.
+
         Returns:
             ProcessingResult with status and details.
         """
@@ -400,19 +812,19 @@ class HRISEventProcessor:
         try:
             match event.event_type:
                 case HRISEventType.HIRE_INITIATED:
-                    result = await self._handle_hire_initiated(event, result)
+                    result = await self._handle_hire_initiated(event, result, store)
 
                 case HRISEventType.CONSENT_GRANTED:
-                    result = await self._handle_consent_granted(event, result)
+                    result = await self._handle_consent_granted(event, result, store, screenings)
 
                 case HRISEventType.POSITION_CHANGED:
-                    result = await self._handle_position_changed(event, result)
+                    result = await self._handle_position_changed(event, result, store)
 
                 case HRISEventType.EMPLOYEE_TERMINATED:
-                    result = await self._handle_employee_terminated(event, result)
+                    result = await self._handle_employee_terminated(event, result, store)
 
                 case HRISEventType.REHIRE_INITIATED:
-                    result = await self._handle_rehire_initiated(event, result)
+                    result = await self._handle_rehire_initiated(event, result, store)
 
                 case _:
                     # Outbound events or unknown types are skipped
@@ -457,6 +869,7 @@ class HRISEventProcessor:
         self,
         event: HRISEvent,
         result: ProcessingResult,
+        store: EventStore,
     ) -> ProcessingResult:
         """Handle a hire.initiated event.
 
@@ -466,6 +879,7 @@ class HRISEventProcessor:
         Args:
             event: The hire initiated event.
             result: The result to populate.
+            store: Event store to read and write.
 
         Returns:
             Updated processing result.
@@ -499,7 +913,7 @@ class HRISEventProcessor:
         )
 
         # Store pending screening
-        await self._event_store.save_pending_screening(
+        await store.save_pending_screening(
             tenant_id=event.tenant_id,
             employee_id=event.employee_id,
             request=screening_request,
@@ -508,7 +922,7 @@ class HRISEventProcessor:
         # Create subject ID mapping if we have one
         if screening_request.subject.full_name:
             subject_id = uuid7()
-            await self._event_store.save_employee_mapping(
+            await store.save_employee_mapping(
                 tenant_id=event.tenant_id,
                 employee_id=event.employee_id,
                 subject_id=subject_id,
@@ -540,6 +954,8 @@ class HRISEventProcessor:
         self,
         event: HRISEvent,
         result: ProcessingResult,
+        store: EventStore,
+        screenings: list[tuple[ScreeningRequest, ProcessingResult]] | None = None,
     ) -> ProcessingResult:
         """Handle a consent.granted event.
 
@@ -548,12 +964,15 @@ class HRISEventProcessor:
         Args:
             event: The consent granted event.
             result: The result to populate.
+            store: Event store to read and write.
+            screenings: If given, the screening is collected here for the
+                caller to start instead of being started now.
 
         Returns:
             Updated processing result.
         """
         # Get pending screening
-        pending_request = await self._event_store.get_pending_screening(
+        pending_request = await store.get_pending_screening(
             tenant_id=event.tenant_id,
             employee_id=event.employee_id,
         )
@@ -595,30 +1014,20 @@ class HRISEventProcessor:
 
         # Start screening if service is available
         if self._screening_service is not None and self.config.auto_start_screening:
-            try:
-                screening_id = await self._screening_service.initiate_screening(
-                    screening_request
-                )
-                result.screening_id = screening_id
-                result.action = ProcessingAction.SCREENING_STARTED
-                result.details["screening_status"] = "started"
-            except Exception as e:
-                logger.error(
-                    "Failed to start screening",
-                    screening_id=str(screening_request.screening_id),
-                    error=str(e),
-                )
+            if screenings is not None:
                 result.screening_id = screening_request.screening_id
                 result.action = ProcessingAction.SCREENING_STARTED
-                result.details["screening_status"] = "queued"
-                result.details["error"] = str(e)
+                screenings.append((screening_request, result))
+            else:
+                screening_id, error = await self._initiate_screening(screening_request)
+                self._record_screening_start(result, screening_request, screening_id, error)
         else:
             result.screening_id = screening_request.screening_id
             result.action = ProcessingAction.SCREENING_STARTED
             result.details["screening_status"] = "queued"
 
         # Remove pending screening
-        await self._event_store.remove_pending_screening(
+        await store.remove_pending_screening(
             tenant_id=event.tenant_id,
             employee_id=event.employee_id,
         )
@@ -639,6 +1048,7 @@ class HRISEventProcessor:
         self,
         event: HRISEvent,
         result: ProcessingResult,
+        store: EventStore,
     ) -> ProcessingResult:
         """Handle a position.changed event.
 
@@ -647,12 +1057,13 @@ class HRISEventProcessor:
         Args:
             event: The position changed event.
             result: The result to populate.
+            store: Event store to read and write.
 
         Returns:
             Updated processing result.
         """
         # Get subject ID from mapping
-        subject_id = await self._event_store.get_subject_id_by_employee_id(
+        subject_id = await store.get_subject_id_by_employee_id(
             tenant_id=event.tenant_id,
             employee_id=event.employee_id,
         )
@@ -726,6 +1137,7 @@ class HRISEventProcessor:
         self,
         event: HRISEvent,
         result: ProcessingResult,
+        store: EventStore,
     ) -> ProcessingResult:
         """Handle an employee.terminated event.
 
@@ -734,12 +1146,13 @@ class HRISEventProcessor:
         Args:
             event: The termination event.
             result: The result to populate.
+            store: Event store to read and write.
 
         Returns:
             Updated processing result.
         """
         # Get subject ID from mapping
-        subject_id = await self._event_store.get_subject_id_by_employee_id(
+        subject_id = await store.get_subject_id_by_employee_id(
             tenant_id=event.tenant_id,
             employee_id=event.employee_id,
         )
@@ -804,6 +1217,7 @@ class HRISEventProcessor:
         self,
         event: HRISEvent,
         result: ProcessingResult,
+        store: EventStore,
     ) -> ProcessingResult:
         """Handle a rehire.initiated event.
 
@@ -813,12 +1227,13 @@ class HRISEventProcessor:
         Args:
             event: The rehire event.
             result: The result to populate.
+            store: Event store to read and write.
 
         Returns:
             Updated processing result.
         """
         # Check if we have an existing subject mapping
-        subject_id = await self._event_store.get_subject_id_by_employee_id(
+        subject_id = await store.get_subject_id_by_employee_id(
             tenant_id=event.tenant_id,
             employee_id=event.employee_id,
         )
@@ -851,7 +1266,7 @@ class HRISEventProcessor:
         )
 
         # Store pending screening
-        await self._event_store.save_pending_screening(
+        await store.save_pending_screening(
             tenant_id=event.tenant_id,
             employee_id=event.employee_id,
             request=screening_request,
@@ -905,6 +1320,141 @@ class HRISEventProcessor:
 
         return result
 
+    async def _initiate_screening(
+        self,
+        request: ScreeningRequest,
+    ) -> tuple[UUID | None, Exception | None]:
+        """Initiate one screening, returning its ID or the error raised."""
+        if self._screening_service is None:
+            return None, RuntimeError("No screening service configured")
+        try:
+            return await self._screening_service.initiate_screening(request), None
+        except Exception as e:
+            return None, e
+
+    async def _start_screenings(
+        self,
+        screenings: list[tuple[ScreeningRequest, ProcessingResult]],
+    ) -> None:
+        """Start screenings collected during batch processing.
+
+        Screenings are started screening_batch_size at a time, with up to
+        max_concurrent_screening_batches batches in flight. Services
+        implementing BatchScreeningServiceProtocol get one request per
+        batch; others get concurrent initiate_screening calls.
+
+        Args:
+            screenings: Screening requests with the results to update.
+        """
+        if not screenings:
+            return
+
+        initiate_screenings = getattr(self._screening_service, "initiate_screenings", None)
+        size = self.config.screening_batch_size
+        slots = asyncio.Semaphore(self.config.max_concurrent_screening_batches)
+
+        async def start(chunk: list[tuple[ScreeningRequest, ProcessingResult]]) -> None:
+            requests = [request for request, _ in chunk]
+            outcomes: list[tuple[UUID | None, Exception | None]]
+            async with slots:
+                if initiate_screenings is not None:
+                    try:
+                        screening_ids = list(await initiate_screenings(requests))
+                        if len(screening_ids) != len(requests):
+                            raise ValueError(
+                                f"Screening service returned {len(screening_ids)} IDs "
+                                f"for {len(requests)} requests"
+                            )
+                        outcomes = [(screening_id, None) for screening_id in screening_ids]
+                    except Exception as e:
+                        outcomes = [(None, e)] * len(requests)
+                else:
+                    outcomes = list(
+                        await asyncio.gather(*(self._initiate_screening(r) for r in requests))
+                    )
+            for (request, result), (screening_id, error) in zip(chunk, outcomes, strict=True):
+                self._record_screening_start(result, request, screening_id, error)
+
+        await asyncio.gather(
+            *(start(screenings[i : i + size]) for i in range(0, len(screenings), size))
+        )
+
+    def _record_screening_start(
+        self,
+        result: ProcessingResult,
+        request: ScreeningRequest,
+        screening_id: UUID | None,
+        error: Exception | None,
+    ) -> None:
+        """Record the outcome of starting a screening on its processing result."""
+        result.action = ProcessingAction.SCREENING_STARTED
+        if error is None:
+            result.screening_id = screening_id
+            result.details["screening_status"] = "started"
+            return
+
+        logger.error(
+            "Failed to start screening",
+            screening_id=str(request.screening_id),
+            error=str(error),
+        )
+        result.screening_id = request.screening_id
+        result.details["screening_status"] = "queued"
+        result.details["error"] = str(error)
+
+    def _check_duplicate(self, event: HRISEvent, now: datetime) -> UUID | None:
+        """Check an event against recently ingested ones and remember it.
+
+        Args:
+            event: Event to check.
+            now: Current time.
+
+        Returns:
+            ID of the earlier event this one repeats, or None.
+        """
+        if self.config.dedup_cache_size == 0:
+            return None
+
+        key = self._dedup_key(event)
+        window = timedelta(seconds=self.config.dedup_window_seconds)
+        seen = self._recent_events.get(key)
+        if seen is not None and now - seen[1] < window:
+            self._duplicate_count += 1
+            return seen[0]
+
+        self._recent_events[key] = (event.event_id, now)
+        self._recent_events.move_to_end(key)
+        while len(self._recent_events) > self.config.dedup_cache_size:
+            self._recent_events.popitem(last=False)
+        return None
+
+    def _forget_event(self, event: HRISEvent) -> None:
+        """Drop a failed event from the de-duplication cache.
+
+        Args:
+            event: Event that was remembered by _check_duplicate.
+        """
+        key = self._dedup_key(event)
+        seen = self._recent_events.get(key)
+        if seen is not None and seen[0] == event.event_id:
+            del self._recent_events[key]
+
+    @staticmethod
+    def _dedup_key(event: HRISEvent) -> str:
+        """Get the key identifying an event for de-duplication.
+
+        Events are identified by the platform's own event ID when the
+        payload carries one, and otherwise by their type, employee and data.
+        """
+        data = event.event_data
+        source_id = data.get("event_id") or data.get("eventId") or data.get("id")
+        if source_id:
+            identity: list[Any] = [str(event.tenant_id), event.platform.value, source_id]
+        else:
+            identity = [str(event.tenant_id), event.event_type.value, event.employee_id, data]
+        encoded = json.dumps(identity, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
     # =============================================================================
     # Helper Methods
     # =============================================================================
@@ -1098,6 +1648,7 @@ class HRISEventProcessor:
         return {
             "events_processed": dict(self._processed_count),
             "total_processed": sum(self._processed_count.values()),
+            "duplicates_skipped": self._duplicate_count,
         }
 
 
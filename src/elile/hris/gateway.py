@@ -283,6 +283,28 @@ class HRISAdapter(Protocol):
         ...
 
 
+class BatchHRISAdapter(HRISAdapter, Protocol):
+    """Protocol for adapters that can push many screening updates per request."""
+
+    async def publish_updates(
+        self,
+        tenant_id: UUID,
+        updates: list[tuple[str, ScreeningUpdate]],
+        credentials: dict[str, Any],
+    ) -> list[bool]:
+        """Push a batch of screening updates to HRIS.
+
+        Args:
+            tenant_id: Tenant ID for this integration
+            updates: (employee_id, update) pairs to push
+            credentials: Platform-specific credentials
+
+        Returns:
+            One delivery flag per update, in order
+        """
+        ...
+
+
 class GatewayConfig(BaseModel):
     """Configuration for the HRIS Integration Gateway."""
 
@@ -535,12 +557,52 @@ class HRISGateway:
             tenant_id=tenant_id,
         )
 
+    async def parse_inbound_events(
+        self,
+        tenant_id: UUID,
+        items: list[tuple[str, dict[str, Any]]],
+    ) -> list[HRISEvent | None]:
+        """Parse a batch of inbound events for one tenant.
+
+        The connection and adapter are resolved once for the batch. Events
+        beyond the tenant's remaining rate limit are not parsed.
+
+        Args:
+            tenant_id: Tenant ID for this request
+            items: (event_type, payload) pairs
+
+        Returns:
+            One parsed HRISEvent per item, or None where the item was rate
+            limited or the tenant has no usable connection
+        """
+        connection = self.get_connection(tenant_id)
+        if not connection:
+            return [None] * len(items)
+
+        adapter = self.get_adapter(connection.platform)
+        if not adapter:
+            return [None] * len(items)
+
+        # Check rate limiting
+        current_count = self._event_counts.get(tenant_id, 0)
+        allowed = max(self._config.max_events_per_minute - current_count, 0)
+        self._event_counts[tenant_id] = current_count + min(allowed, len(items))
+
+        events: list[HRISEvent | None] = [
+            await adapter.parse_event(event_type=event_type, payload=payload, tenant_id=tenant_id)
+            for event_type, payload in items[:allowed]
+        ]
+        events.extend([None] * (len(items) - len(events)))
+        return events
+
     async def publish_screening_update(
         self,
         tenant_id: UUID,
         employee_id: str,
         update: ScreeningUpdate,
         credentials: dict[str, Any],
+        *,
+        retry: bool = True,
     ) -> bool:
         """Publish a screening update to the HRIS.
 
@@ -549,6 +611,8 @@ class HRISGateway:
             employee_id: HRIS employee identifier
             update: Screening status update
             credentials: Platform credentials
+            retry: Retry a failed request; callers that reschedule failed
+                updates with backoff themselves pass False
 
         Returns:
             True if update was successfully published
@@ -562,7 +626,8 @@ class HRISGateway:
             return False
 
         # Retry logic
-        for attempt in range(self._config.max_retries + 1):
+        max_retries = self._config.max_retries if retry else 0
+        for attempt in range(max_retries + 1):
             try:
                 result = await adapter.publish_update(
                     tenant_id=tenant_id,
@@ -574,7 +639,7 @@ class HRISGateway:
                     self.update_connection_status(tenant_id, HRISConnectionStatus.CONNECTED)
                     return True
             except Exception:
-                if attempt < self._config.max_retries:
+                if attempt < max_retries:
                     # Would normally await delay here
                     continue
                 self.update_connection_status(
@@ -586,12 +651,80 @@ class HRISGateway:
 
         return False
 
+    async def publish_screening_updates(
+        self,
+        tenant_id: UUID,
+        updates: list[tuple[str, ScreeningUpdate]],
+        credentials: dict[str, Any],
+    ) -> list[bool]:
+        """Publish several screening updates for one tenant.
+
+        Adapters implementing BatchHRISAdapter receive the updates in a
+        single request; others receive one publish_screening_update call
+        per update. Each update gets one attempt: retrying a batch in place
+        would hammer an HRIS that is already failing, so failed updates are
+        left to the caller (HRISResultPublisher reschedules them with
+        backoff).
+
+        Args:
+            tenant_id: Tenant ID
+            updates: (employee_id, update) pairs to publish
+            credentials: Platform credentials
+
+        Returns:
+            One flag per update, True if it was successfully published
+        """
+        connection = self.get_connection(tenant_id)
+        if not connection or not connection.enabled:
+            return [False] * len(updates)
+
+        adapter = self.get_adapter(connection.platform)
+        if not adapter:
+            return [False] * len(updates)
+
+        publish_updates = getattr(adapter, "publish_updates", None)
+        if publish_updates is None:
+            return [
+                await self.publish_screening_update(
+                    tenant_id=tenant_id,
+                    employee_id=employee_id,
+                    update=update,
+                    credentials=credentials,
+                    retry=False,
+                )
+                for employee_id, update in updates
+            ]
+
+        try:
+            results = list(
+                await publish_updates(
+                    tenant_id=tenant_id,
+                    updates=updates,
+                    credentials=credentials,
+                )
+            )
+        except Exception:
+            self.update_connection_status(
+                tenant_id,
+                HRISConnectionStatus.ERROR,
+                "Failed to publish updates",
+            )
+            return [False] * len(updates)
+
+        if len(results) != len(updates):
+            return [False] * len(updates)
+        if any(results):
+            self.update_connection_status(tenant_id, HRISConnectionStatus.CONNECTED)
+        return results
+
     async def publish_alert(
         self,
         tenant_id: UUID,
         employee_id: str,
         alert: AlertUpdate,
         credentials: dict[str, Any],
+        *,
+        retry: bool = True,
     ) -> bool:
         """Publish a monitoring alert to the HRIS.
 
@@ -600,6 +733,8 @@ class HRISGateway:
             employee_id: HRIS employee identifier
             alert: Alert to send
             credentials: Platform credentials
+            retry: Retry a failed request; callers that reschedule failed
+                alerts with backoff themselves pass False
 
         Returns:
             True if alert was successfully published
@@ -613,7 +748,8 @@ class HRISGateway:
             return False
 
         # Retry logic
-        for attempt in range(self._config.max_retries + 1):
+        max_retries = self._config.max_retries if retry else 0
+        for attempt in range(max_retries + 1):
             try:
                 result = await adapter.publish_alert(
                     tenant_id=tenant_id,
@@ -625,7 +761,7 @@ class HRISGateway:
                     self.update_connection_status(tenant_id, HRISConnectionStatus.CONNECTED)
                     return True
             except Exception:
-                if attempt < self._config.max_retries:
+                if attempt < max_retries:
                     continue
                 self.update_connection_status(
                     tenant_id,
@@ -815,6 +951,7 @@ class MockHRISAdapter(BaseHRISAdapter):
         self._employees: dict[str, EmployeeInfo] = {}
         self._published_updates: list[ScreeningUpdate] = []
         self._published_alerts: list[AlertUpdate] = []
+        self.batch_sizes: list[int] = []
 
     @property
     def platform_id(self) -> HRISPlatform:
@@ -910,6 +1047,18 @@ class MockHRISAdapter(BaseHRISAdapter):
         self._published_alerts.append(alert)
         return True
 
+    async def publish_updates(
+        self,
+        tenant_id: UUID,
+        updates: list[tuple[str, ScreeningUpdate]],
+        credentials: dict[str, Any],
+    ) -> list[bool]:
+        self.batch_sizes.append(len(updates))
+        return [
+            await self.publish_update(tenant_id, employee_id, update, credentials)
+            for employee_id, update in updates
+        ]
+
     async def get_employee(
         self,
         tenant_id: UUID,  # noqa: ARG002
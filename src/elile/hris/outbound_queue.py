@@ -0,0 +1,720 @@
+"""Durable outbound queue and delivery history for HRIS publishing.
+
+Every update or alert the HRISResultPublisher sends is first written to an
+OutboundQueue. The publisher then delivers queued messages per tenant
+connection, batching screening updates where the adapter supports it, and
+writes each attempt back: delivered messages leave the queue, failed ones
+are rescheduled with exponential backoff until their retries run out.
+
+Progress updates carry a coalescing key (one per screening). A newer
+progress update for the same screening supersedes one that is still
+waiting, so a burst of progress events results in a single delivery of
+the latest state.
+
+Delivery attempts are recorded in a DeliveryHistoryStore, which applies
+retention rather than growing without bound. Finished messages of the
+database-backed queue are kept for reporting until prune() removes them;
+the application's OutboxDispatcher (elile.core.outbox) dispatches and
+prunes the queue in the background.
+
+Classes:
+    OutboundStatus: Delivery status of a queued message
+    OutboundMessage: One update or alert to deliver
+    OutboundQueue: Protocol for outbound queue storage
+    InMemoryOutboundQueue: In-memory outbound queue implementation
+    SQLAlchemyOutboundQueue: Outbound queue stored in the database
+    DeliveryHistoryStore: Protocol for delivery history storage
+    InMemoryDeliveryHistoryStore: In-memory delivery history implementation
+    SQLAlchemyDeliveryHistoryStore: Delivery history stored in the database
+"""
+
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Protocol
+from uuid import UUID, uuid7
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from elile.db.models.hris import HRISDeliveryRecord
+from elile.db.models.outbox import OutboxMessage
+from elile.db.repositories.outbox import OutboxRepository, as_utc
+from elile.hris.gateway import AlertUpdate, ScreeningUpdate
+
+if TYPE_CHECKING:
+    from elile.hris.result_publisher import DeliveryRecord, PublishEventType
+
+
+class OutboundStatus(str, Enum):
+    """Delivery status of a queued message."""
+
+    PENDING = "pending"  # Waiting for its first or next attempt
+    DELIVERED = "delivered"  # Accepted by the HRIS
+    FAILED = "failed"  # Retries exhausted
+    SUPERSEDED = "superseded"  # Replaced by a newer message before delivery
+
+
+@dataclass
+class OutboundMessage:
+    """An update or alert waiting to be delivered to an HRIS.
+
+    Exactly one of ``update`` and ``alert`` is set.
+
+    Attributes:
+        tenant_id: Tenant whose HRIS connection receives the message
+        employee_id: HRIS employee identifier
+        event_type: Published event type
+        update: Screening update to deliver
+        alert: Alert to deliver
+        coalesce_key: Messages sharing this key supersede each other
+        publish_result_id: PublishResult the message was created for
+        message_id: Unique identifier for this message
+        status: Delivery status
+        attempts: Delivery attempts made so far
+        next_attempt_at: Earliest time of the next attempt
+        last_error: Error from the last failed attempt
+        superseded_by: Message that replaced this one
+        created_at: When the message was enqueued
+        delivered_at: When the message was delivered
+    """
+
+    tenant_id: UUID
+    employee_id: str
+    event_type: "PublishEventType"
+    update: ScreeningUpdate | None = None
+    alert: AlertUpdate | None = None
+    coalesce_key: str | None = None
+    publish_result_id: UUID | None = None
+    message_id: UUID = field(default_factory=uuid7)
+    status: OutboundStatus = OutboundStatus.PENDING
+    attempts: int = 0
+    next_attempt_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    last_error: str | None = None
+    superseded_by: UUID | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    delivered_at: datetime | None = None
+
+    @property
+    def is_final(self) -> bool:
+        """Check if the message needs no further attempts."""
+        return self.status != OutboundStatus.PENDING
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "message_id": str(self.message_id),
+            "tenant_id": str(self.tenant_id),
+            "employee_id": self.employee_id,
+            "event_type": self.event_type.value,
+            "coalesce_key": self.coalesce_key,
+            "publish_result_id": str(self.publish_result_id) if self.publish_result_id else None,
+            "status": self.status.value,
+            "attempts": self.attempts,
+            "next_attempt_at": self.next_attempt_at.isoformat(),
+            "last_error": self.last_error,
+            "superseded_by": str(self.superseded_by) if self.superseded_by else None,
+            "created_at": self.created_at.isoformat(),
+            "delivered_at": self.delivered_at.isoformat() if self.delivered_at else None,
+        }
+
+
+class OutboundQueue(Protocol):
+    """Protocol for outbound HRIS message storage."""
+
+    async def enqueue(
+        self,
+        messages: list[OutboundMessage],
+        *,
+        claimed: bool = False,
+    ) -> list[OutboundMessage]:
+        """Add messages, superseding waiting messages with the same coalesce key.
+
+        Args:
+            messages: Messages to add
+            claimed: Keep the messages out of claim_due until they are saved
+                back, because the caller is delivering them now
+
+        Returns:
+            The waiting messages that were superseded
+        """
+        ...
+
+    async def claim_due(
+        self,
+        tenant_id: UUID,
+        as_of: datetime,
+        limit: int,
+    ) -> list[OutboundMessage]:
+        """Claim a tenant's pending messages due by ``as_of``, earliest first.
+
+        Claimed messages are not returned again until saved back as pending.
+        """
+        ...
+
+    async def save_messages(self, messages: list[OutboundMessage]) -> None:
+        """Save messages after a delivery attempt.
+
+        A pending message whose coalesce key was taken by a newer message
+        while it was being delivered is marked superseded instead of being
+        rescheduled.
+        """
+        ...
+
+    async def pending_tenants(self) -> list[UUID]:
+        """Get tenants with pending messages."""
+        ...
+
+    async def prune(self, before: datetime) -> int:
+        """Delete finished messages that finished before ``before``.
+
+        Returns:
+            Number of messages deleted
+        """
+        ...
+
+
+class InMemoryOutboundQueue:
+    """In-memory implementation of OutboundQueue for testing.
+
+    Only pending messages are kept; delivered, failed and superseded ones
+    are dropped once saved, since their attempts live in the delivery
+    history. Pending messages are kept in one heap per tenant, keyed on
+    next_attempt_at; heap items left behind by a later save or a
+    superseding message are skipped, and compacted once they outnumber
+    the live ones.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the queue."""
+        self._messages: dict[UUID, OutboundMessage] = {}
+        self._coalesced: dict[str, UUID] = {}
+        self._due: dict[UUID, list[tuple[datetime, int, UUID]]] = {}
+        self._scheduled: dict[UUID, int] = {}
+        self._sequence = 0
+        self._stale = 0
+
+    def __len__(self) -> int:
+        """Get the number of pending messages."""
+        return len(self._messages)
+
+    async def enqueue(
+        self,
+        messages: list[OutboundMessage],
+        *,
+        claimed: bool = False,
+    ) -> list[OutboundMessage]:
+        """Add messages, superseding waiting messages with the same coalesce key."""
+        superseded = []
+        for message in messages:
+            key = message.coalesce_key
+            if key is not None:
+                previous_id = self._coalesced.pop(key, None)
+                # Messages being delivered right now are left alone
+                if previous_id is not None and previous_id in self._scheduled:
+                    previous = self._messages.pop(previous_id)
+                    del self._scheduled[previous_id]
+                    previous.status = OutboundStatus.SUPERSEDED
+                    previous.superseded_by = message.message_id
+                    superseded.append(previous)
+                    self._stale += 1
+                self._coalesced[key] = message.message_id
+            self._messages[message.message_id] = message
+            if not claimed:
+                self._schedule(message)
+        self._compact()
+        return superseded
+
+    async def claim_due(
+        self,
+        tenant_id: UUID,
+        as_of: datetime,
+        limit: int,
+    ) -> list[OutboundMessage]:
+        """Claim a tenant's pending messages due by ``as_of``, earliest first."""
+        heap = self._due.get(tenant_id, [])
+        claimed: list[OutboundMessage] = []
+        while heap and heap[0][0] <= as_of and len(claimed) < limit:
+            _, sequence, message_id = heapq.heappop(heap)
+            if self._scheduled.get(message_id) != sequence:
+                self._stale = max(self._stale - 1, 0)
+                continue  # Superseded or saved again since
+            del self._scheduled[message_id]
+            claimed.append(self._messages[message_id])
+        if not heap:
+            self._due.pop(tenant_id, None)
+        return claimed
+
+    async def save_messages(self, messages: list[OutboundMessage]) -> None:
+        """Save messages after a delivery attempt."""
+        for message in messages:
+            key = message.coalesce_key
+            newer = self._coalesced.get(key) if key is not None else None
+            if not message.is_final and newer not in (None, message.message_id):
+                message.status = OutboundStatus.SUPERSEDED
+                message.superseded_by = newer
+
+            if message.is_final:
+                self._messages.pop(message.message_id, None)
+                if self._scheduled.pop(message.message_id, None) is not None:
+                    self._stale += 1
+                if key is not None and newer == message.message_id:
+                    del self._coalesced[key]
+                continue
+
+            self._messages[message.message_id] = message
+            if key is not None:
+                self._coalesced[key] = message.message_id
+            if message.message_id in self._scheduled:
+                self._stale += 1
+            self._schedule(message)
+        self._compact()
+
+    async def pending_tenants(self) -> list[UUID]:
+        """Get tenants with pending messages."""
+        return [tenant_id for tenant_id, heap in self._due.items() if heap]
+
+    async def prune(self, before: datetime) -> int:  # noqa: ARG002
+        """Delete finished messages; none are kept, so there is nothing to delete."""
+        return 0
+
+    def _schedule(self, message: OutboundMessage) -> None:
+        self._sequence += 1
+        self._scheduled[message.message_id] = self._sequence
+        heapq.heappush(
+            self._due.setdefault(message.tenant_id, []),
+            (message.next_attempt_at, self._sequence, message.message_id),
+        )
+
+    def _compact(self) -> None:
+        if self._stale <= max(len(self._scheduled), 1024):
+            return
+        for tenant_id, heap in list(self._due.items()):
+            live = [item for item in heap if self._scheduled.get(item[2]) == item[1]]
+            if live:
+                heapq.heapify(live)
+                self._due[tenant_id] = live
+            else:
+                del self._due[tenant_id]
+        self._stale = 0
+
+
+class SQLAlchemyOutboundQueue:
+    """OutboundQueue stored in the outbox_messages table.
+
+    Pending messages survive a restart and can be dispatched by any
+    process. A claim is a lease: a message claimed by a process that died
+    before saving it back is claimed again once ``claim_lease`` has passed.
+
+    Attributes:
+        topic: Topic of the queue's rows in outbox_messages
+    """
+
+    topic = "hris.outbound"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        claim_lease: timedelta = timedelta(minutes=5),
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            session_factory: Factory for database sessions
+            claim_lease: How long a claim holds if the message is not saved back
+        """
+        self.session_factory = session_factory
+        self.claim_lease = claim_lease
+
+    async def enqueue(
+        self,
+        messages: list[OutboundMessage],
+        *,
+        claimed: bool = False,
+    ) -> list[OutboundMessage]:
+        """Add messages, superseding waiting messages with the same coalesce key."""
+        if not messages:
+            return []
+        now = datetime.now(UTC)
+        claimed_until = now + self.claim_lease if claimed else None
+        newest = {m.coalesce_key: m.message_id for m in messages if m.coalesce_key is not None}
+        superseded = []
+        async with self.session_factory() as session:
+            repository = OutboxRepository(session)
+            waiting = await repository.list_pending_by_key(self.topic, newest)
+            values = []
+            for row in waiting:
+                # Messages being delivered right now are left alone
+                if row.claimed_until is not None and as_utc(row.claimed_until) >= now:
+                    continue
+                previous = self._from_row(row)
+                previous.status = OutboundStatus.SUPERSEDED
+                previous.superseded_by = newest[row.key]
+                values.append(self._values(previous, now))
+                superseded.append(previous)
+            await repository.update_many(values)
+
+            for message in messages:
+                key = message.coalesce_key
+                if key is not None and newest[key] != message.message_id:
+                    # An earlier message of the same batch never reaches the queue
+                    message.status = OutboundStatus.SUPERSEDED
+                    message.superseded_by = newest[key]
+                    superseded.append(message)
+                    continue
+                session.add(self._to_row(message, claimed_until))
+            await session.commit()
+        return superseded
+
+    async def claim_due(
+        self,
+        tenant_id: UUID,
+        as_of: datetime,
+        limit: int,
+    ) -> list[OutboundMessage]:
+        """Claim a tenant's pending messages due by ``as_of``, earliest first."""
+        now = datetime.now(UTC)
+        async with self.session_factory() as session:
+            rows = await OutboxRepository(session).claim_due(
+                self.topic,
+                str(tenant_id),
+                as_of,
+                limit,
+                now=now,
+                lease_until=now + self.claim_lease,
+            )
+            messages = [self._from_row(row) for row in rows]
+            await session.commit()
+        return messages
+
+    async def save_messages(self, messages: list[OutboundMessage]) -> None:
+        """Save messages after a delivery attempt, releasing their claims."""
+        if not messages:
+            return
+        now = datetime.now(UTC)
+        async with self.session_factory() as session:
+            repository = OutboxRepository(session)
+            keys = {m.coalesce_key for m in messages if m.coalesce_key is not None}
+            newer: dict[str, UUID] = {}
+            for row in await repository.list_pending_by_key(self.topic, keys):
+                if row.key not in newer or row.message_id > newer[row.key]:
+                    newer[row.key] = row.message_id
+            # Message IDs are UUIDv7, so a greater ID was enqueued later
+            for message in messages:
+                latest = newer.get(message.coalesce_key) if message.coalesce_key else None
+                if not message.is_final and latest is not None and latest > message.message_id:
+                    message.status = OutboundStatus.SUPERSEDED
+                    message.superseded_by = latest
+            await repository.update_many([self._values(m, now) for m in messages])
+            await session.commit()
+
+    async def pending_tenants(self) -> list[UUID]:
+        """Get tenants with pending messages."""
+        async with self.session_factory() as session:
+            partitions = await OutboxRepository(session).pending_partitions(
+                self.topic, datetime.now(UTC)
+            )
+        return [UUID(partition) for partition in partitions]
+
+    async def prune(self, before: datetime) -> int:
+        """Delete delivered, failed and superseded messages that finished before ``before``."""
+        async with self.session_factory() as session:
+            pruned = await OutboxRepository(session).prune(self.topic, before)
+            await session.commit()
+        return pruned
+
+    @staticmethod
+    def _payload(message: OutboundMessage) -> dict[str, Any]:
+        update, alert = message.update, message.alert
+        return {
+            "employee_id": message.employee_id,
+            "event_type": message.event_type.value,
+            "update": _update_to_dict(update) if update is not None else None,
+            "alert": _alert_to_dict(alert) if alert is not None else None,
+            "superseded_by": str(message.superseded_by) if message.superseded_by else None,
+            "delivered_at": message.delivered_at.isoformat() if message.delivered_at else None,
+        }
+
+    def _values(self, message: OutboundMessage, now: datetime) -> dict[str, Any]:
+        return {
+            "message_id": message.message_id,
+            "status": message.status.value,
+            "attempts": message.attempts,
+            "next_attempt_at": message.next_attempt_at,
+            "claimed_until": None,
+            "last_error": message.last_error,
+            "payload": self._payload(message),
+            "finished_at": (message.delivered_at or now) if message.is_final else None,
+        }
+
+    def _to_row(self, message: OutboundMessage, claimed_until: datetime | None) -> OutboxMessage:
+        return OutboxMessage(
+            message_id=message.message_id,
+            topic=self.topic,
+            partition=str(message.tenant_id),
+            status=message.status.value,
+            key=message.coalesce_key,
+            reference_id=message.publish_result_id,
+            attempts=message.attempts,
+            next_attempt_at=message.next_attempt_at,
+            claimed_until=claimed_until,
+            last_error=message.last_error,
+            payload=self._payload(message),
+            created_at=message.created_at,
+        )
+
+    @staticmethod
+    def _from_row(row: OutboxMessage) -> OutboundMessage:
+        from elile.hris.result_publisher import PublishEventType
+
+        payload = row.payload
+        update, alert = payload.get("update"), payload.get("alert")
+        superseded_by, delivered_at = payload.get("superseded_by"), payload.get("delivered_at")
+        return OutboundMessage(
+            tenant_id=UUID(row.partition),
+            employee_id=payload["employee_id"],
+            event_type=PublishEventType(payload["event_type"]),
+            update=_update_from_dict(update) if update is not None else None,
+            alert=_alert_from_dict(alert) if alert is not None else None,
+            coalesce_key=row.key,
+            publish_result_id=row.reference_id,
+            message_id=row.message_id,
+            status=OutboundStatus(row.status),
+            attempts=row.attempts,
+            next_attempt_at=as_utc(row.next_attempt_at),
+            last_error=row.last_error,
+            superseded_by=UUID(superseded_by) if superseded_by else None,
+            created_at=as_utc(row.created_at),
+            delivered_at=datetime.fromisoformat(delivered_at) if delivered_at else None,
+        )
+
+
+def _update_to_dict(update: ScreeningUpdate) -> dict[str, Any]:
+    estimated = update.estimated_completion
+    return {
+        "screening_id": str(update.screening_id),
+        "status": update.status,
+        "timestamp": update.timestamp.isoformat(),
+        "progress_percent": update.progress_percent,
+        "risk_level": update.risk_level,
+        "recommendation": update.recommendation,
+        "estimated_completion": estimated.isoformat() if estimated else None,
+        "findings_summary": update.findings_summary,
+        "review_reason": update.review_reason,
+    }
+
+
+def _update_from_dict(data: dict[str, Any]) -> ScreeningUpdate:
+    estimated = data.get("estimated_completion")
+    return ScreeningUpdate(
+        screening_id=UUID(data["screening_id"]),
+        status=data["status"],
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+        progress_percent=data.get("progress_percent"),
+        risk_level=data.get("risk_level"),
+        recommendation=data.get("recommendation"),
+        estimated_completion=datetime.fromisoformat(estimated) if estimated else None,
+        findings_summary=data.get("findings_summary"),
+        review_reason=data.get("review_reason"),
+    )
+
+
+def _alert_to_dict(alert: AlertUpdate) -> dict[str, Any]:
+    return {
+        "alert_id": str(alert.alert_id),
+        "employee_id": alert.employee_id,
+        "severity": alert.severity,
+        "title": alert.title,
+        "description": alert.description,
+        "created_at": alert.created_at.isoformat(),
+        "requires_action": alert.requires_action,
+        "action_url": alert.action_url,
+    }
+
+
+def _alert_from_dict(data: dict[str, Any]) -> AlertUpdate:
+    return AlertUpdate(
+        alert_id=UUID(data["alert_id"]),
+        employee_id=data["employee_id"],
+        severity=data["severity"],
+        title=data["title"],
+        description=data["description"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        requires_action=data.get("requires_action", False),
+        action_url=data.get("action_url"),
+    )
+
+
+class DeliveryHistoryStore(Protocol):
+    """Protocol for HRIS delivery history storage."""
+
+    async def save_records(self, records: list["DeliveryRecord"]) -> None:
+        """Save delivery records."""
+        ...
+
+    async def get_records(
+        self,
+        tenant_id: UUID | None = None,
+        event_type: "PublishEventType | None" = None,
+        limit: int = 100,
+    ) -> list["DeliveryRecord"]:
+        """Get delivery records, most recent first."""
+        ...
+
+    async def purge(self, older_than: datetime) -> int:
+        """Delete records attempted before ``older_than``.
+
+        Returns:
+            Number of records deleted
+        """
+        ...
+
+
+class InMemoryDeliveryHistoryStore:
+    """In-memory implementation of DeliveryHistoryStore for testing.
+
+    Holds at most ``max_records`` records; the oldest are dropped first.
+    """
+
+    def __init__(self, max_records: int = 100_000) -> None:
+        """Initialize the store.
+
+        Args:
+            max_records: Maximum records to keep
+        """
+        self._records: deque[DeliveryRecord] = deque(maxlen=max_records)
+
+    def __len__(self) -> int:
+        """Get the number of stored records."""
+        return len(self._records)
+
+    def clear(self) -> None:
+        """Delete all records."""
+        self._records.clear()
+
+    async def save_records(self, records: list["DeliveryRecord"]) -> None:
+        """Save delivery records."""
+        self._records.extend(records)
+
+    async def get_records(
+        self,
+        tenant_id: UUID | None = None,
+        event_type: "PublishEventType | None" = None,
+        limit: int = 100,
+    ) -> list["DeliveryRecord"]:
+        """Get delivery records, most recent first."""
+        found: list[DeliveryRecord] = []
+        for record in reversed(self._records):
+            if len(found) >= limit:
+                break
+            if tenant_id is not None and record.tenant_id != tenant_id:
+                continue
+            if event_type is not None and record.event_type != event_type:
+                continue
+            found.append(record)
+        return found
+
+    async def purge(self, older_than: datetime) -> int:
+        """Delete records attempted before ``older_than``."""
+        before = len(self._records)
+        self._records = deque(
+            (r for r in self._records if r.attempted_at >= older_than),
+            maxlen=self._records.maxlen,
+        )
+        return before - len(self._records)
+
+
+class SQLAlchemyDeliveryHistoryStore:
+    """DeliveryHistoryStore backed by the hris_delivery_records table.
+
+    Records are kept until purge() removes them, so history outlives the
+    process that made the attempts and any single worker's memory.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Initialize the store.
+
+        Args:
+            session_factory: Factory for database sessions
+        """
+        self.session_factory = session_factory
+
+    async def save_records(self, records: list["DeliveryRecord"]) -> None:
+        """Save delivery records in one insert."""
+        if not records:
+            return
+        async with self.session_factory() as session:
+            await session.execute(
+                insert(HRISDeliveryRecord), [self._values(record) for record in records]
+            )
+            await session.commit()
+
+    async def get_records(
+        self,
+        tenant_id: UUID | None = None,
+        event_type: "PublishEventType | None" = None,
+        limit: int = 100,
+    ) -> list["DeliveryRecord"]:
+        """Get delivery records, most recent first."""
+        stmt = (
+            select(HRISDeliveryRecord)
+            .order_by(HRISDeliveryRecord.attempted_at.desc(), HRISDeliveryRecord.record_id.desc())
+            .limit(limit)
+        )
+        if tenant_id is not None:
+            stmt = stmt.where(HRISDeliveryRecord.tenant_id == tenant_id)
+        if event_type is not None:
+            stmt = stmt.where(HRISDeliveryRecord.event_type == event_type.value)
+        async with self.session_factory() as session:
+            rows = (await session.execute(stmt)).scalars().all()
+        return [self._from_row(row) for row in rows]
+
+    async def purge(self, older_than: datetime) -> int:
+        """Delete records attempted before ``older_than``."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                delete(HRISDeliveryRecord).where(HRISDeliveryRecord.attempted_at < older_than)
+            )
+            await session.commit()
+        return result.rowcount or 0
+
+    @staticmethod
+    def _values(record: "DeliveryRecord") -> dict[str, Any]:
+        return {
+            "record_id": record.record_id,
+            "tenant_id": record.tenant_id,
+            "event_type": record.event_type.value,
+            "success": record.success,
+            "attempted_at": record.attempted_at,
+            "payload": {
+                "publish_result_id": str(record.publish_result_id),
+                "employee_id": record.employee_id,
+                "attempt_number": record.attempt_number,
+                "error_message": record.error_message,
+                "response_code": record.response_code,
+                "response_time_ms": record.response_time_ms,
+            },
+        }
+
+    @staticmethod
+    def _from_row(row: HRISDeliveryRecord) -> "DeliveryRecord":
+        # Imported here: result_publisher imports this module
+        from elile.hris.result_publisher import DeliveryRecord, PublishEventType
+
+        payload = row.payload
+        return DeliveryRecord(
+            record_id=row.record_id,
+            publish_result_id=UUID(payload["publish_result_id"]),
+            event_type=PublishEventType(row.event_type),
+            tenant_id=row.tenant_id,
+            employee_id=payload.get("employee_id", ""),
+            attempt_number=payload.get("attempt_number", 1),
+            attempted_at=as_utc(row.attempted_at),
+            success=row.success,
+            error_message=payload.get("error_message"),
+            response_code=payload.get("response_code"),
+            response_time_ms=payload.get("response_time_ms"),
+        )
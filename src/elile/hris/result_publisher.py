@@ -7,11 +7,19 @@ This module provides the HRISResultPublisher class for publishing:
 - Adverse action pending notifications (FCRA compliance)
 - Review required notifications
 
-All publishing uses the HRISGateway for delivery with retry logic.
+All publishing goes through a durable outbound queue (see outbound_queue):
+events are enqueued before delivery, progress updates are held for a short
+coalescing window in which newer ones for the same screening supersede
+them, queued updates are delivered per tenant in batches where the adapter
+supports it, and failed deliveries are retried with exponential backoff by
+dispatch_queue(). The application's OutboxDispatcher (elile.core.outbox)
+calls dispatch_queue() in the background and prune() to apply the
+retention of the queue and the delivery history.
 """
 
+import asyncio
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
 from uuid import UUID, uuid7
@@ -19,11 +27,20 @@ from uuid import UUID, uuid7
 import structlog
 from pydantic import BaseModel, Field
 
+from elile.core.outbox import retry_delay
 from elile.hris.gateway import (
     AlertUpdate,
     HRISGateway,
     ScreeningUpdate,
 )
+from elile.hris.outbound_queue import (
+    DeliveryHistoryStore,
+    InMemoryDeliveryHistoryStore,
+    InMemoryOutboundQueue,
+    OutboundMessage,
+    OutboundQueue,
+    OutboundStatus,
+)
 from elile.monitoring.types import MonitoringAlert
 from elile.screening.types import ScreeningResult, ScreeningStatus
 
@@ -183,6 +200,63 @@ class PublisherConfig(BaseModel):
         description="Default credentials reference if not specified per-tenant",
     )
 
+    # Delivery
+    deliver_immediately: bool = Field(
+        default=True,
+        description="Attempt delivery when an event is published; if False, "
+        "events are only queued for dispatch_queue()",
+    )
+    coalesce_window_seconds: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=3600.0,
+        description="How long progress updates are held for a newer update of the same "
+        "screening to supersede them; 0 delivers them like any other event",
+    )
+    max_retries: int = Field(
+        default=3,
+        ge=0,
+        le=10,
+        description="Retries of a failed delivery before it is marked failed",
+    )
+    retry_delay_seconds: int = Field(
+        default=30,
+        ge=1,
+        le=3600,
+        description="Delay before the first retry; doubles with each attempt",
+    )
+    retry_backoff_max_seconds: int = Field(
+        default=3600,
+        ge=1,
+        le=86400,
+        description="Upper bound on the retry delay",
+    )
+    batch_size: int = Field(
+        default=50,
+        ge=1,
+        le=1000,
+        description="Screening updates per batch request to one tenant's HRIS",
+    )
+    max_concurrent_tenants: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Tenants delivered to concurrently by dispatch_queue()",
+    )
+
+    # History
+    history_window_size: int = Field(
+        default=1000,
+        ge=0,
+        description="Delivery records kept in memory when no history store is configured",
+    )
+    history_retention_days: int = Field(
+        default=90,
+        ge=1,
+        le=3650,
+        description="Days delivery records are kept in the history store",
+    )
+
 
 # =============================================================================
 # HRIS Result Publisher
@@ -219,6 +293,11 @@ class HRISResultPublisher:
             employee_id="EMP-001",
             tenant_id=tenant_id,
         )
+
+        # Progress updates (and, with deliver_immediately=False, every
+        # event) are only queued; deliver them and any retries that are due
+        # periodically, e.g. from the OutboxDispatcher
+        await publisher.dispatch_queue()
     """
 
     def __init__(
@@ -226,6 +305,8 @@ class HRISResultPublisher:
         gateway: HRISGateway,
         config: PublisherConfig | None = None,
         credentials_store: dict[UUID, dict[str, Any]] | None = None,
+        queue: OutboundQueue | None = None,
+        history_store: DeliveryHistoryStore | None = None,
     ) -> None:
         """Initialize the result publisher.
 
@@ -233,12 +314,23 @@ class HRISResultPublisher:
             gateway: HRIS gateway for publishing events.
             config: Publisher configuration.
             credentials_store: Optional mapping of tenant_id to credentials.
+            queue: Optional outbound queue. Defaults to an in-memory queue.
+            history_store: Optional store for delivery records. Defaults to an
+                in-memory store of the most recent history_window_size records.
         """
         self._gateway = gateway
         self.config = config or PublisherConfig()
         self._credentials_store = credentials_store or {}
-        self._delivery_history: list[DeliveryRecord] = []
+        self.queue: OutboundQueue = queue if queue is not None else InMemoryOutboundQueue()
+        self.history_store: DeliveryHistoryStore = (
+            history_store
+            if history_store is not None
+            else InMemoryDeliveryHistoryStore(max_records=self.config.history_window_size)
+        )
         self._published_count: dict[PublishEventType, int] = {}
+        self._delivery_count = 0
+        self._success_count = 0
+        self._superseded_count = 0
 
     def _get_credentials(self, tenant_id: UUID) -> dict[str, Any]:
         """Get credentials for a tenant.
@@ -333,7 +425,13 @@ class HRISResultPublisher:
             estimated_completion=estimated_completion,
         )
 
-        return await self._publish_update(result, update, employee_id, tenant_id)
+        return await self._publish_update(
+            result,
+            update,
+            employee_id,
+            tenant_id,
+            coalesce_key=_progress_key(tenant_id, screening_id),
+        )
 
     async def publish_screening_complete(
         self,
@@ -393,7 +491,15 @@ class HRISResultPublisher:
             recommendation=result.recommendation,
         )
 
-        return await self._publish_update(publish_result, update, employee_id, tenant_id)
+        # Supersedes a progress update still held for the screening, which
+        # would otherwise reach the HRIS after the completion
+        return await self._publish_update(
+            publish_result,
+            update,
+            employee_id,
+            tenant_id,
+            coalesce_key=_progress_key(tenant_id, screening_id),
+        )
 
     async def publish_review_required(
         self,
@@ -556,6 +662,7 @@ class HRISResultPublisher:
         update: ScreeningUpdate,
         employee_id: str,
         tenant_id: UUID,
+        coalesce_key: str | None = None,
     ) -> PublishResult:
         """Internal method to publish a screening update.
 
@@ -564,73 +671,21 @@ class HRISResultPublisher:
             update: Screening update to publish.
             employee_id: HRIS employee identifier.
             tenant_id: Tenant ID.
+            coalesce_key: Key under which a newer update supersedes this one
+                while it is still queued.
 
         Returns:
             Updated PublishResult.
         """
-        credentials = self._get_credentials(tenant_id)
-        publish_result.last_attempt_at = datetime.now(UTC)
-        publish_result.attempts += 1
-
-        # Create delivery record
-        delivery_record = DeliveryRecord(
-            publish_result_id=publish_result.result_id,
-            event_type=publish_result.event_type,
+        message = OutboundMessage(
             tenant_id=tenant_id,
             employee_id=employee_id,
-            attempt_number=publish_result.attempts,
-        )
-
-        try:
-            success = await self._gateway.publish_screening_update(
-                tenant_id=tenant_id,
-                employee_id=employee_id,
-                update=update,
-                credentials=credentials,
-            )
-
-            delivery_record.success = success
-            if success:
-                publish_result.status = PublishStatus.DELIVERED
-                publish_result.delivered_at = datetime.now(UTC)
-
-                logger.info(
-                    "AUDIT: hris_update_published",
-                    audit_event_type="hris.update_published",
-                    event_type=publish_result.event_type.value,
-                    screening_id=str(update.screening_id),
-                    tenant_id=str(tenant_id),
-                    employee_id=employee_id,
-                    status=update.status,
-                )
-            else:
-                publish_result.status = PublishStatus.FAILED
-                publish_result.error_message = "Gateway returned failure"
-                delivery_record.error_message = "Gateway returned failure"
-
-        except Exception as e:
-            publish_result.status = PublishStatus.FAILED
-            publish_result.error_message = str(e)
-            delivery_record.success = False
-            delivery_record.error_message = str(e)
-
-            logger.error(
-                "Failed to publish HRIS update",
-                event_type=publish_result.event_type.value,
-                tenant_id=str(tenant_id),
-                employee_id=employee_id,
-                error=str(e),
-            )
-
-        # Record delivery attempt
-        self._delivery_history.append(delivery_record)
-
-        # Update statistics
-        self._published_count[publish_result.event_type] = (
-            self._published_count.get(publish_result.event_type, 0) + 1
+            event_type=publish_result.event_type,
+            update=update,
+            coalesce_key=coalesce_key,
+            publish_result_id=publish_result.result_id,
         )
-
-        return publish_result
+        return await self._publish_message(publish_result, message)
 
     async def _publish_alert(
         self,
@@ -650,76 +705,260 @@ class HRISResultPublisher:
         Returns:
             Updated PublishResult.
         """
-        credentials = self._get_credentials(tenant_id)
-        publish_result.last_attempt_at = datetime.now(UTC)
-        publish_result.attempts += 1
-
-        # Create delivery record
-        delivery_record = DeliveryRecord(
-            publish_result_id=publish_result.result_id,
-            event_type=publish_result.event_type,
+        message = OutboundMessage(
             tenant_id=tenant_id,
             employee_id=employee_id,
-            attempt_number=publish_result.attempts,
+            event_type=publish_result.event_type,
+            alert=alert_update,
+            publish_result_id=publish_result.result_id,
         )
+        return await self._publish_message(publish_result, message)
 
-        try:
-            success = await self._gateway.publish_alert(
-                tenant_id=tenant_id,
-                employee_id=employee_id,
-                alert=alert_update,
-                credentials=credentials,
-            )
+    async def _publish_message(
+        self,
+        publish_result: PublishResult,
+        message: OutboundMessage,
+    ) -> PublishResult:
+        """Enqueue a message and, if configured, deliver it right away.
 
-            delivery_record.success = success
-            if success:
-                publish_result.status = PublishStatus.DELIVERED
-                publish_result.delivered_at = datetime.now(UTC)
+        Progress updates are held for coalesce_window_seconds instead, so a burst of updates for one
+        screening is delivered once; the delivery time is in the result
+        metadata. A failed first attempt marks the result FAILED while the
+        message stays queued for retry; the retry time is in the result
+        metadata.
 
-                logger.info(
-                    "AUDIT: hris_alert_published",
-                    audit_event_type="hris.alert_published",
-                    alert_id=str(alert_update.alert_id),
+        Args:
+            publish_result: The result object to populate.
+            message: Message to publish.
+
+        Returns:
+            PublishResult for the first attempt, or PENDING if the message
+            was only queued.
+        """
+        window = self.config.coalesce_window_seconds
+        held = message.event_type == PublishEventType.SCREENING_PROGRESS and window > 0
+        if held:
+            message.next_attempt_at = message.created_at + timedelta(seconds=window)
+        immediate = self.config.deliver_immediately and not held
+        superseded = await self.queue.enqueue([message], claimed=immediate)
+        self._superseded_count += len(superseded)
+        self._published_count[publish_result.event_type] = (
+            self._published_count.get(publish_result.event_type, 0) + 1
+        )
+        publish_result.metadata["outbound_message_id"] = str(message.message_id)
+
+        if not immediate:
+            if held:
+                publish_result.metadata["deliver_at"] = message.next_attempt_at.isoformat()
+            return publish_result
+
+        publish_result.last_attempt_at = datetime.now(UTC)
+        await self._send_tenant(message.tenant_id, [message])
+
+        publish_result.attempts = message.attempts
+        if message.status == OutboundStatus.DELIVERED:
+            publish_result.status = PublishStatus.DELIVERED
+            publish_result.delivered_at = message.delivered_at
+        else:
+            publish_result.status = PublishStatus.FAILED
+            publish_result.error_message = message.last_error
+            if not message.is_final:
+                publish_result.metadata["retry_at"] = message.next_attempt_at.isoformat()
+
+        return publish_result
+
+    async def dispatch_queue(self, as_of: datetime | None = None) -> list[OutboundMessage]:
+        """Deliver queued messages that are due.
+
+        Tenants are drained concurrently, at most max_concurrent_tenants at
+        a time. Each tenant's messages are sent in order, batch_size at a
+        time, including retries whose backoff has elapsed.
+
+        Args:
+            as_of: Reference time for due messages. Defaults to now.
+
+        Returns:
+            Messages attempted, with their updated status
+        """
+        as_of = as_of or datetime.now(UTC)
+        slots = asyncio.Semaphore(self.config.max_concurrent_tenants)
+
+        async def drain(tenant_id: UUID) -> list[OutboundMessage]:
+            attempted: list[OutboundMessage] = []
+            async with slots:
+                while messages := await self.queue.claim_due(
+                    tenant_id, as_of, self.config.batch_size
+                ):
+                    await self._send_tenant(tenant_id, messages)
+                    attempted.extend(messages)
+            return attempted
+
+        tenants = await self.queue.pending_tenants()
+        drained = await asyncio.gather(*(drain(tenant_id) for tenant_id in tenants))
+        attempted = [message for messages in drained for message in messages]
+
+        logger.info(
+            "HRIS outbound queue dispatched",
+            tenants=len(tenants),
+            attempted=len(attempted),
+            delivered=sum(1 for m in attempted if m.status == OutboundStatus.DELIVERED),
+            failed=sum(1 for m in attempted if m.status == OutboundStatus.FAILED),
+        )
+        return attempted
+
+    async def _send_tenant(self, tenant_id: UUID, messages: list[OutboundMessage]) -> None:
+        """Deliver one tenant's messages and record the attempts.
+
+        Screening updates go to the gateway together, which sends them in a
+        single request when the adapter supports batching; alerts are sent
+        one at a time. The gateway makes a single attempt at each; failures
+        are retried with backoff from the queue.
+
+        Args:
+            tenant_id: Tenant the messages are for.
+            messages: Messages to deliver.
+        """
+        credentials = self._get_credentials(tenant_id)
+        outcomes: list[tuple[OutboundMessage, bool, str | None]] = []
+
+        updates = [(m, m.update) for m in messages if m.update is not None]
+        if updates:
+            try:
+                delivered = await self._gateway.publish_screening_updates(
+                    tenant_id=tenant_id,
+                    updates=[(m.employee_id, update) for m, update in updates],
+                    credentials=credentials,
+                )
+                outcomes.extend(
+                    (m, success, None if success else "Gateway returned failure")
+                    for (m, _), success in zip(updates, delivered, strict=True)
+                )
+            except Exception as e:
+                logger.error(
+                    "Failed to publish HRIS update",
+                    tenant_id=str(tenant_id),
+                    updates=len(updates),
+                    error=str(e),
+                )
+                outcomes.extend((m, False, str(e)) for m, _ in updates)
+
+        for message, alert in [(m, m.alert) for m in messages if m.alert is not None]:
+            try:
+                success = await self._gateway.publish_alert(
+                    tenant_id=tenant_id,
+                    employee_id=message.employee_id,
+                    alert=alert,
+                    credentials=credentials,
+                    retry=False,
+                )
+                outcomes.append((message, success, None if success else "Gateway returned failure"))
+            except Exception as e:
+                logger.error(
+                    "Failed to publish HRIS alert",
+                    alert_id=str(alert.alert_id),
                     tenant_id=str(tenant_id),
-                    employee_id=employee_id,
-                    severity=alert_update.severity,
+                    employee_id=message.employee_id,
+                    error=str(e),
                 )
-            else:
-                publish_result.status = PublishStatus.FAILED
-                publish_result.error_message = "Gateway returned failure"
-                delivery_record.error_message = "Gateway returned failure"
+                outcomes.append((message, False, str(e)))
 
-        except Exception as e:
-            publish_result.status = PublishStatus.FAILED
-            publish_result.error_message = str(e)
-            delivery_record.success = False
-            delivery_record.error_message = str(e)
-
-            logger.error(
-                "Failed to publish HRIS alert",
-                alert_id=str(alert_update.alert_id),
-                tenant_id=str(tenant_id),
-                employee_id=employee_id,
-                error=str(e),
-            )
+        now = datetime.now(UTC)
+        records = [self._record_attempt(m, success, error, now) for m, success, error in outcomes]
+        await self.queue.save_messages(messages)
 
-        # Record delivery attempt
-        self._delivery_history.append(delivery_record)
+        await self.history_store.save_records(records)
 
-        # Update statistics
-        self._published_count[publish_result.event_type] = (
-            self._published_count.get(publish_result.event_type, 0) + 1
+    def _record_attempt(
+        self,
+        message: OutboundMessage,
+        success: bool,
+        error: str | None,
+        now: datetime,
+    ) -> DeliveryRecord:
+        """Apply a delivery outcome to a queued message.
+
+        Args:
+            message: Message that was sent.
+            success: Whether the HRIS accepted it.
+            error: Error message for a failed attempt.
+            now: Time of the attempt.
+
+        Returns:
+            DeliveryRecord for the attempt.
+        """
+        message.attempts += 1
+        self._delivery_count += 1
+        record = DeliveryRecord(
+            publish_result_id=message.publish_result_id or message.message_id,
+            event_type=message.event_type,
+            tenant_id=message.tenant_id,
+            employee_id=message.employee_id,
+            attempt_number=message.attempts,
+            attempted_at=now,
+            success=success,
+            error_message=error,
         )
 
-        return publish_result
+        if success:
+            self._success_count += 1
+            message.status = OutboundStatus.DELIVERED
+            message.delivered_at = now
+            message.last_error = None
+            if message.update is not None:
+                logger.info(
+                    "AUDIT: hris_update_published",
+                    audit_event_type="hris.update_published",
+                    event_type=message.event_type.value,
+                    screening_id=str(message.update.screening_id),
+                    tenant_id=str(message.tenant_id),
+                    employee_id=message.employee_id,
+                    status=message.update.status,
+                )
+            elif message.alert is not None:
+                logger.info(
+                    "AUDIT: hris_alert_published",
+                    audit_event_type="hris.alert_published",
+                    alert_id=str(message.alert.alert_id),
+                    tenant_id=str(message.tenant_id),
+                    employee_id=message.employee_id,
+                    severity=message.alert.severity,
+                )
+            return record
+
+        message.last_error = error
+        if message.attempts > self.config.max_retries:
+            message.status = OutboundStatus.FAILED
+            logger.warning(
+                "HRIS delivery failed, retries exhausted",
+                event_type=message.event_type.value,
+                tenant_id=str(message.tenant_id),
+                employee_id=message.employee_id,
+                attempts=message.attempts,
+                error=error,
+            )
+        else:
+            message.next_attempt_at = now + retry_delay(
+                message.attempts,
+                self.config.retry_delay_seconds,
+                self.config.retry_backoff_max_seconds,
+            )
+            logger.debug(
+                "HRIS delivery failed, will retry",
+                event_type=message.event_type.value,
+                tenant_id=str(message.tenant_id),
+                attempt=message.attempts,
+                retry_at=message.next_attempt_at.isoformat(),
+                error=error,
+            )
+        return record
 
-    def get_delivery_history(
+    async def get_delivery_history(
         self,
         tenant_id: UUID | None = None,
         event_type: PublishEventType | None = None,
         limit: int = 100,
     ) -> list[DeliveryRecord]:
-        """Get delivery history with optional filters.
+        """Get recent delivery history from the history store.
 
         Args:
             tenant_id: Filter by tenant ID.
@@ -727,18 +966,38 @@ class HRISResultPublisher:
             limit: Maximum records to return.
 
         Returns:
-            List of delivery records matching filters.
+            Delivery records matching the filters, most recent first.
         """
-        records = self._delivery_history
+        return await self.history_store.get_records(
+            tenant_id=tenant_id, event_type=event_type, limit=limit
+        )
 
-        if tenant_id is not None:
-            records = [r for r in records if r.tenant_id == tenant_id]
+    async def purge_delivery_history(self, as_of: datetime | None = None) -> int:
+        """Delete stored delivery records older than the retention period.
 
-        if event_type is not None:
-            records = [r for r in records if r.event_type == event_type]
+        Args:
+            as_of: Reference time for the retention period. Defaults to now.
+
+        Returns:
+            Number of records deleted from the history store.
+        """
+        cutoff = (as_of or datetime.now(UTC)) - timedelta(days=self.config.history_retention_days)
+        return await self.history_store.purge(cutoff)
 
-        # Return most recent first
-        return list(reversed(records[-limit:]))
+    async def prune(self, before: datetime) -> int:
+        """Prune the queue and the delivery history.
+
+        Matches the OutboxDispatcher's prune function: finished queue
+        messages are deleted if they finished before ``before``, delivery
+        records once history_retention_days have passed.
+
+        Args:
+            before: Finish time before which queue messages are deleted.
+
+        Returns:
+            Number of messages and records deleted.
+        """
+        return await self.queue.prune(before) + await self.purge_delivery_history()
 
     def get_statistics(self) -> dict[str, Any]:
         """Get publishing statistics.
@@ -746,20 +1005,29 @@ class HRISResultPublisher:
         Returns:
             Dictionary with publishing counts by event type and delivery success rates.
         """
-        total_deliveries = len(self._delivery_history)
-        successful_deliveries = sum(1 for r in self._delivery_history if r.success)
+        total_deliveries = self._delivery_count
+        successful_deliveries = self._success_count
 
         return {
             "events_published": dict(self._published_count),
             "total_deliveries": total_deliveries,
             "successful_deliveries": successful_deliveries,
             "failed_deliveries": total_deliveries - successful_deliveries,
+            "superseded_updates": self._superseded_count,
             "success_rate": successful_deliveries / total_deliveries if total_deliveries > 0 else 0,
         }
 
     def clear_history(self) -> None:
-        """Clear delivery history (for testing/maintenance)."""
-        self._delivery_history.clear()
+        """Clear in-memory delivery history and statistics (for testing/maintenance)."""
+        if isinstance(self.history_store, InMemoryDeliveryHistoryStore):
+            self.history_store.clear()
+        self._delivery_count = 0
+        self._success_count = 0
+
+
+def _progress_key(tenant_id: UUID, screening_id: UUID) -> str:
+    """Get the coalesce key of a screening's progress and completion updates."""
+    return f"progress:{tenant_id}:{screening_id}"
 
 
 # =============================================================================
@@ -771,6 +1039,8 @@ def create_result_publisher(
     gateway: HRISGateway,
     config: PublisherConfig | None = None,
     credentials_store: dict[UUID, dict[str, Any]] | None = None,
+    queue: OutboundQueue | None = None,
+    history_store: DeliveryHistoryStore | None = None,
 ) -> HRISResultPublisher:
     """Create an HRIS result publisher.
 
@@ -778,6 +1048,8 @@ def create_result_publisher(
         gateway: HRIS gateway for publishing events.
         config: Optional publisher configuration.
         credentials_store: Optional mapping of tenant_id to credentials.
+        queue: Optional outbound queue.
+        history_store: Optional delivery history store.
 
     Returns:
         Configured HRISResultPublisher instance.
@@ -786,4 +1058,6 @@ def create_result_publisher(
         gateway=gateway,
         config=config,
         credentials_store=credentials_store,
+        queue=queue,
+        history_store=history_store,
     )
@@ -66,96 +66,109 @@ Example:
     ```
 """
 
-from elile.investigation.models import (
-    CompletionReason,
-    SARConfig,
-    SARIterationState,
-    SARPhase,
-    SARSummary,
-    SARTypeState,
-)
-from elile.investigation.query_executor import (
-    ExecutionSummary,
-    ExecutorConfig,
-    QueryExecutor,
-    QueryResult,
-    QueryStatus,
-    create_query_executor,
-)
-from elile.investigation.query_planner import (
-    INFO_TYPE_TO_CHECK_TYPES,
-    QueryPlanner,
-    QueryPlanResult,
-    QueryType,
-    SearchQuery,
-)
-from elile.investigation.information_type_manager import (
-    PHASE_ORDER,
-    PHASE_TYPES,
-    TYPE_DEPENDENCIES,
-    InformationPhase,
-    InformationTypeManager,
-    TypeDependency,
-    TypeSequence,
-    create_information_type_manager,
-)
-from elile.investigation.query_refiner import (
-    QueryRefiner,
-    RefinerConfig,
-    RefinementResult,
-    create_query_refiner,
-)
-from elile.investigation.confidence_scorer import (
-    ConfidenceScore,
-    ConfidenceScorer,
-    FactorBreakdown,
-    ScorerConfig,
-    create_confidence_scorer,
-    DEFAULT_EXPECTED_FACTS,
-)
-from elile.investigation.result_assessor import (
-    AssessmentResult,
-    ConfidenceFactors,
-    DetectedInconsistency,
-    DiscoveredEntity,
-    Fact,
-    Gap,
-    ResultAssessor,
-    create_result_assessor,
-)
-from elile.investigation.sar_machine import (
-    FOUNDATION_TYPES,
-    SARStateMachine,
-    create_sar_machine,
-)
-from elile.investigation.iteration_controller import (
-    ControllerConfig,
-    DecisionType,
-    IterationController,
-    IterationDecision,
-    create_iteration_controller,
-)
-from elile.investigation.sar_orchestrator import (
-    InvestigationResult,
-    OrchestratorConfig,
-    OrchestratorPhase,
-    ProgressEvent,
-    SARLoopOrchestrator,
-    TypeCycleResult,
-    create_sar_orchestrator,
-)
-from elile.investigation.checkpoint import (
-    CheckpointConfig,
-    CheckpointData,
-    CheckpointManager,
-    CheckpointReason,
-    CheckpointStatus,
-    CheckpointStorage,
-    InMemoryCheckpointStorage,
-    ResumeResult,
-    ResumeStrategy,
-    create_checkpoint_manager,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.investigation.models import (
+        CompletionReason,
+        SARConfig,
+        SARIterationState,
+        SARPhase,
+        SARSummary,
+        SARTypeState,
+    )
+    from elile.investigation.query_executor import (
+        ExecutionSummary,
+        ExecutorConfig,
+        QueryExecutor,
+        QueryResult,
+        QueryStatus,
+        create_query_executor,
+    )
+    from elile.investigation.query_planner import (
+        INFO_TYPE_TO_CHECK_TYPES,
+        QueryPlanner,
+        QueryPlanResult,
+        QueryType,
+        SearchQuery,
+    )
+    from elile.investigation.information_type_manager import (
+        PHASE_ORDER,
+        PHASE_TYPES,
+        TYPE_DEPENDENCIES,
+        InformationPhase,
+        InformationTypeManager,
+        TypeDependency,
+        TypeSequence,
+        create_information_type_manager,
+    )
+    from elile.investigation.query_refiner import (
+        QueryRefiner,
+        RefinerConfig,
+        RefinementResult,
+        create_query_refiner,
+    )
+    from elile.investigation.confidence_scorer import (
+        ConfidenceScore,
+        ConfidenceScorer,
+        FactorBreakdown,
+        ScorerConfig,
+        create_confidence_scorer,
+        DEFAULT_EXPECTED_FACTS,
+    )
+    from elile.investigation.result_assessor import (
+        AssessmentResult,
+        ConfidenceFactors,
+        DetectedInconsistency,
+        DiscoveredEntity,
+        Fact,
+        Gap,
+        ResultAssessor,
+        create_result_assessor,
+    )
+    from elile.investigation.sar_machine import (
+        FOUNDATION_TYPES,
+        SARStateMachine,
+        create_sar_machine,
+    )
+    from elile.investigation.iteration_controller import (
+        ControllerConfig,
+        DecisionType,
+        IterationController,
+        IterationDecision,
+        create_iteration_controller,
+    )
+    from elile.investigation.sar_orchestrator import (
+        InvestigationResult,
+        OrchestratorConfig,
+        OrchestratorPhase,
+        ProgressEvent,
+        SARLoopOrchestrator,
+        TypeCycleResult,
+        create_sar_orchestrator,
+    )
+    from elile.investigation.checkpoint import (
+        CheckpointConfig,
+        CheckpointData,
+        CheckpointManager,
+        CheckpointReason,
+        CheckpointStatus,
+        CheckpointStorage,
+        InMemoryCheckpointStorage,
+        ResumeResult,
+        ResumeStrategy,
+        create_checkpoint_manager,
+    )
+    from elile.investigation.checkpoint_store import (
+        CheckpointStoreStats,
+        FileCheckpointStorage,
+        apply_delta,
+        compute_delta,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # State machine
@@ -238,6 +251,10 @@ __all__ = [
     "CheckpointStatus",
     "CheckpointStorage",
     "InMemoryCheckpointStorage",
+    "FileCheckpointStorage",
+    "CheckpointStoreStats",
+    "compute_delta",
+    "apply_delta",
     "ResumeResult",
     "ResumeStrategy",
 ]
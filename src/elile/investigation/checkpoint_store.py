@@ -0,0 +1,717 @@
+"""Durable, delta-encoded checkpoint storage.
+
+Long investigations checkpoint every few iterations, and consecutive
+checkpoints are nearly identical: a handful of new facts in the knowledge
+snapshot, one or two changed type states. Storing a full snapshot each time
+wastes disk and write time, so this backend stores periodic full snapshots
+and, in between, compact JSON-patch style deltas against the previous record.
+
+Layout (one directory per investigation under ``root``):
+
+    <investigation_id>/segments-<n>.dat   append-only zlib-compressed records
+    <investigation_id>/index.jsonl        append-only journal of index entries
+
+Records are immutable once written. The index journal names the current
+segment file, maps checkpoint IDs to record offsets and carries the mutable
+metadata (status, deletion), so status changes never rewrite payloads. Reads
+go through a read-only mmap of the segment file and rebuild state by
+replaying deltas from the nearest full snapshot.
+
+Example:
+    ```python
+    storage = FileCheckpointStorage(Path("/var/lib/elile/checkpoints"))
+    manager = CheckpointManager(storage=storage)
+    ```
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from elile.core.logging import get_logger
+from elile.investigation.checkpoint import CheckpointData, CheckpointStatus
+
+logger = get_logger(__name__)
+
+_INDEX_FILE = "index.jsonl"
+_UNASSIGNED_DIR = "_unassigned"
+
+
+# =============================================================================
+# Delta Encoding
+# =============================================================================
+
+
+def compute_delta(old: Any, new: Any, path: list[Any] | None = None) -> list[dict[str, Any]]:
+    """Compute JSON-patch style operations transforming ``old`` into ``new``.
+
+    Paths are lists of keys/indices rather than RFC 6901 pointer strings so
+    that keys containing ``/`` need no escaping. Besides ``add``, ``remove``
+    and ``replace``, an ``extend`` operation appends to a list whose existing
+    prefix is unchanged, which is the common case for growing finding lists.
+
+    Args:
+        old: Previous JSON-compatible value.
+        new: Current JSON-compatible value.
+        path: Path prefix for emitted operations.
+
+    Returns:
+        List of patch operations (empty when the values are equal).
+    """
+    path = path or []
+    if old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": [*path, key]})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "add", "path": [*path, key], "value": value})
+            else:
+                ops.extend(compute_delta(old[key], value, [*path, key]))
+        return ops
+
+    if (
+        isinstance(old, list)
+        and isinstance(new, list)
+        and len(new) > len(old)
+        and new[: len(old)] == old
+    ):
+        return [{"op": "extend", "path": path, "value": new[len(old) :]}]
+
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_delta(base: Any, ops: list[dict[str, Any]]) -> Any:
+    """Apply operations produced by :func:`compute_delta` to ``base``.
+
+    ``base`` is modified in place where possible; callers that need to keep
+    the original must pass a copy.
+
+    Args:
+        base: JSON-compatible value to patch.
+        ops: Patch operations.
+
+    Returns:
+        The patched value.
+
+    Raises:
+        ValueError: If an operation is malformed.
+    """
+    for op in ops:
+        path = op["path"]
+        kind = op["op"]
+
+        if not path:
+            if kind == "replace":
+                base = op["value"]
+            elif kind == "extend":
+                base.extend(op["value"])
+            else:
+                raise ValueError(f"Invalid root patch operation: {kind}")
+            continue
+
+        parent = base
+        for key in path[:-1]:
+            parent = parent[key]
+        key = path[-1]
+
+        if kind in ("add", "replace"):
+            parent[key] = op["value"]
+        elif kind == "remove":
+            del parent[key]
+        elif kind == "extend":
+            parent[key].extend(op["value"])
+        else:
+            raise ValueError(f"Unknown patch operation: {kind}")
+
+    return base
+
+
+# =============================================================================
+# File Storage
+# =============================================================================
+
+
+@dataclass
+class _IndexEntry:
+    """In-memory index entry for a stored checkpoint."""
+
+    checkpoint_id: UUID
+    offset: int
+    length: int
+    kind: str
+    base_offset: int | None
+    content_hash: str
+    created_at: str
+    status: CheckpointStatus
+    requires_review: bool
+
+
+@dataclass
+class _InvestigationIndex:
+    """Index of one investigation's segment file."""
+
+    directory: Path
+    segment_name: str = "segments-0.dat"
+    entries: dict[UUID, _IndexEntry] = field(default_factory=dict)
+    records: dict[int, tuple[int | None, int]] = field(default_factory=dict)
+    tip_offset: int | None = None
+    tip_state: dict[str, Any] | None = None
+    chain_length: int = 0
+    live_bytes: int = 0
+    total_bytes: int = 0
+    mapped: mmap.mmap | None = None
+
+    @property
+    def segment_path(self) -> Path:
+        return self.directory / self.segment_name
+
+
+@dataclass
+class CheckpointStoreStats:
+    """Write statistics for a :class:`FileCheckpointStorage`."""
+
+    checkpoints_written: int = 0
+    full_snapshots: int = 0
+    deltas: int = 0
+    status_updates: int = 0
+    bytes_written: int = 0
+    raw_bytes: int = 0
+    compactions: int = 0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Uncompressed full-snapshot bytes per byte actually written."""
+        if self.bytes_written == 0:
+            return 0.0
+        return self.raw_bytes / self.bytes_written
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "checkpoints_written": self.checkpoints_written,
+            "full_snapshots": self.full_snapshots,
+            "deltas": self.deltas,
+            "status_updates": self.status_updates,
+            "bytes_written": self.bytes_written,
+            "raw_bytes": self.raw_bytes,
+            "compactions": self.compactions,
+            "compression_ratio": self.compression_ratio,
+        }
+
+
+class FileCheckpointStorage:
+    """Durable local-file checkpoint storage with delta encoding.
+
+    Implements the ``CheckpointStorage`` protocol. Every
+    ``full_snapshot_interval``-th record per investigation is a full
+    snapshot; the others are deltas against the previously written record,
+    so rebuilding any checkpoint replays at most ``full_snapshot_interval - 1``
+    deltas.
+
+    Deleted checkpoints are tombstoned in the index. Their records stay on
+    disk while later deltas may depend on them and are reclaimed by
+    :meth:`compact`, which runs automatically once dead bytes exceed
+    ``compaction_threshold`` of the segment file.
+    """
+
+    def __init__(
+        self,
+        root: Path | str,
+        full_snapshot_interval: int = 10,
+        compression_level: int = 6,
+        compaction_threshold: float = 0.5,
+        fsync: bool = True,
+    ) -> None:
+        """Initialize storage.
+
+        Args:
+            root: Directory holding per-investigation checkpoint files.
+            full_snapshot_interval: Records per full snapshot (1 disables deltas).
+            compression_level: zlib compression level (0-9).
+            compaction_threshold: Dead-byte fraction that triggers compaction.
+            fsync: Whether to fsync after each write for crash durability.
+
+        Raises:
+            ValueError: If full_snapshot_interval is less than 1.
+        """
+        if full_snapshot_interval < 1:
+            raise ValueError("full_snapshot_interval must be at least 1")
+
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.full_snapshot_interval = full_snapshot_interval
+        self.compression_level = compression_level
+        self.compaction_threshold = compaction_threshold
+        self.fsync = fsync
+        self.stats = CheckpointStoreStats()
+
+        self._indexes: dict[str, _InvestigationIndex] = {}
+        self._locations: dict[UUID, str] = {}
+        self._lock = threading.RLock()
+        self._discover()
+
+    # -------------------------------------------------------------------------
+    # CheckpointStorage protocol
+    # -------------------------------------------------------------------------
+
+    def save(self, checkpoint: CheckpointData) -> None:
+        """Save a checkpoint."""
+        with self._lock:
+            key = self._key(checkpoint.investigation_id)
+            index = self._index(key)
+            state = self._payload(checkpoint)
+            encoded = _canonical(state)
+            content_hash = hashlib.sha256(encoded).hexdigest()
+
+            existing = index.entries.get(checkpoint.checkpoint_id)
+            if existing is not None and existing.content_hash == content_hash:
+                # Only metadata changed - journal it without touching payloads
+                self._set_status(index, existing, checkpoint.status)
+                return
+
+            self._load_tip_state(index)
+            use_delta = (
+                index.tip_state is not None
+                and index.tip_offset is not None
+                and index.chain_length < self.full_snapshot_interval
+            )
+            if use_delta:
+                record: dict[str, Any] = {
+                    "kind": "delta",
+                    "ops": compute_delta(index.tip_state, state),
+                }
+                base_offset = index.tip_offset
+            else:
+                record = {"kind": "full", "state": state}
+                base_offset = None
+
+            data = zlib.compress(_canonical(record), self.compression_level)
+            offset = self._append_segment(index, data)
+
+            if existing is not None:
+                index.live_bytes -= existing.length
+            entry = _IndexEntry(
+                checkpoint_id=checkpoint.checkpoint_id,
+                offset=offset,
+                length=len(data),
+                kind=record["kind"],
+                base_offset=base_offset,
+                content_hash=content_hash,
+                created_at=checkpoint.created_at.isoformat(),
+                status=checkpoint.status,
+                requires_review=checkpoint.requires_review,
+            )
+            self._append_index(index, _entry_to_journal(entry))
+            self._register(index, entry)
+            self._locations[entry.checkpoint_id] = key
+
+            index.tip_offset = offset
+            index.tip_state = json.loads(encoded)
+            index.chain_length = index.chain_length + 1 if use_delta else 1
+
+            self.stats.checkpoints_written += 1
+            self.stats.bytes_written += len(data)
+            self.stats.raw_bytes += len(encoded)
+            if use_delta:
+                self.stats.deltas += 1
+            else:
+                self.stats.full_snapshots += 1
+
+    def load(self, checkpoint_id: UUID) -> CheckpointData | None:
+        """Load a checkpoint by ID."""
+        with self._lock:
+            key = self._locations.get(checkpoint_id)
+            if key is None:
+                return None
+            index = self._index(key)
+            entry = index.entries.get(checkpoint_id)
+            if entry is None:
+                return None
+            return self._materialize(index, entry)
+
+    def load_latest(self, investigation_id: UUID) -> CheckpointData | None:
+        """Load the most recent active checkpoint for an investigation."""
+        with self._lock:
+            index = self._index(self._key(investigation_id))
+            active = [e for e in index.entries.values() if e.status == CheckpointStatus.ACTIVE]
+            if not active:
+                return None
+            latest = max(active, key=lambda e: (e.created_at, e.offset))
+            return self._materialize(index, latest)
+
+    def list_checkpoints(
+        self,
+        investigation_id: UUID,
+        limit: int = 10,
+    ) -> list[CheckpointData]:
+        """List checkpoints for an investigation, newest first."""
+        with self._lock:
+            index = self._index(self._key(investigation_id))
+            entries = sorted(
+                index.entries.values(),
+                key=lambda e: (e.created_at, e.offset),
+                reverse=True,
+            )
+            return [self._materialize(index, e) for e in entries[:limit]]
+
+    def delete(self, checkpoint_id: UUID) -> bool:
+        """Delete a checkpoint.
+
+        The record is tombstoned; its bytes are reclaimed on compaction.
+        """
+        with self._lock:
+            key = self._locations.pop(checkpoint_id, None)
+            if key is None:
+                return False
+            index = self._index(key)
+            entry = index.entries.pop(checkpoint_id, None)
+            if entry is None:
+                return False
+
+            index.live_bytes -= entry.length
+            self._append_index(index, {"type": "delete", "checkpoint_id": str(checkpoint_id)})
+
+            dead_bytes = index.total_bytes - index.live_bytes
+            if index.total_bytes and dead_bytes / index.total_bytes > self.compaction_threshold:
+                self._compact(key, index)
+            return True
+
+    def mark_superseded(self, checkpoint_id: UUID) -> None:
+        """Mark a checkpoint as superseded."""
+        with self._lock:
+            key = self._locations.get(checkpoint_id)
+            if key is None:
+                return
+            index = self._index(key)
+            entry = index.entries.get(checkpoint_id)
+            if entry is not None:
+                self._set_status(index, entry, CheckpointStatus.SUPERSEDED)
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def compact(self, investigation_id: UUID | None) -> None:
+        """Rewrite an investigation's files, dropping deleted records.
+
+        Args:
+            investigation_id: Investigation to compact.
+        """
+        with self._lock:
+            key = self._key(investigation_id)
+            self._compact(key, self._index(key))
+
+    def storage_bytes(self, investigation_id: UUID | None = None) -> int:
+        """Get on-disk size of checkpoint files.
+
+        Args:
+            investigation_id: Investigation to measure, or None for all.
+
+        Returns:
+            Total size in bytes of segment and index files.
+        """
+        with self._lock:
+            keys = (
+                [self._key(investigation_id)]
+                if investigation_id is not None
+                else list(self._indexes)
+            )
+            total = 0
+            for key in keys:
+                index = self._index(key)
+                for path in (index.segment_path, index.directory / _INDEX_FILE):
+                    if path.exists():
+                        total += path.stat().st_size
+            return total
+
+    def close(self) -> None:
+        """Release memory maps."""
+        with self._lock:
+            for index in self._indexes.values():
+                if index.mapped is not None:
+                    index.mapped.close()
+                    index.mapped = None
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _key(investigation_id: UUID | None) -> str:
+        return str(investigation_id) if investigation_id else _UNASSIGNED_DIR
+
+    @staticmethod
+    def _payload(checkpoint: CheckpointData) -> dict[str, Any]:
+        """Serialize checkpoint content; mutable metadata lives in the index."""
+        payload = checkpoint.to_dict()
+        payload.pop("status")
+        return payload
+
+    def _discover(self) -> None:
+        """Load indexes for existing investigations so loads by ID resolve."""
+        for directory in self.root.iterdir():
+            if directory.is_dir() and (directory / _INDEX_FILE).exists():
+                self._index(directory.name)
+
+    def _index(self, key: str) -> _InvestigationIndex:
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._read_index(self.root / key)
+            self._indexes[key] = index
+            for checkpoint_id in index.entries:
+                self._locations[checkpoint_id] = key
+        return index
+
+    def _read_index(self, directory: Path) -> _InvestigationIndex:
+        """Replay the index journal, ignoring torn trailing writes."""
+        index = _InvestigationIndex(directory=directory)
+        index_path = directory / _INDEX_FILE
+        if not index_path.exists():
+            return index
+
+        with index_path.open("r", encoding="utf-8") as handle:
+            lines = handle.readlines()
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("Skipping corrupt checkpoint index line", path=str(index_path))
+                continue
+
+            record_type = record.get("type")
+            if record_type == "header":
+                index.segment_name = record["segment"]
+                segment_path = index.segment_path
+                index.total_bytes = segment_path.stat().st_size if segment_path.exists() else 0
+                continue
+
+            checkpoint_id = UUID(record["checkpoint_id"])
+            if record_type == "put":
+                if record["offset"] + record["length"] > index.total_bytes:
+                    continue  # Segment write never completed
+                entry = _IndexEntry(
+                    checkpoint_id=checkpoint_id,
+                    offset=record["offset"],
+                    length=record["length"],
+                    kind=record["kind"],
+                    base_offset=record.get("base_offset"),
+                    content_hash=record["content_hash"],
+                    created_at=record["created_at"],
+                    status=CheckpointStatus(record["status"]),
+                    requires_review=record.get("requires_review", False),
+                )
+                previous = index.entries.get(checkpoint_id)
+                if previous is not None:
+                    index.live_bytes -= previous.length
+                self._register(index, entry)
+                index.chain_length = 1 if entry.kind == "full" else index.chain_length + 1
+                index.tip_offset = entry.offset
+            elif record_type == "status" and checkpoint_id in index.entries:
+                index.entries[checkpoint_id].status = CheckpointStatus(record["status"])
+            elif record_type == "delete":
+                removed = index.entries.pop(checkpoint_id, None)
+                if removed is not None:
+                    index.live_bytes -= removed.length
+
+        # Drop segments orphaned by a compaction that crashed before committing
+        for path in directory.glob("segments-*.dat"):
+            if path.name != index.segment_name:
+                path.unlink(missing_ok=True)
+
+        return index
+
+    @staticmethod
+    def _register(index: _InvestigationIndex, entry: _IndexEntry) -> None:
+        index.entries[entry.checkpoint_id] = entry
+        index.records[entry.offset] = (entry.base_offset, entry.length)
+        index.live_bytes += entry.length
+
+    def _set_status(
+        self,
+        index: _InvestigationIndex,
+        entry: _IndexEntry,
+        status: CheckpointStatus,
+    ) -> None:
+        entry.status = status
+        self._append_index(
+            index,
+            {"type": "status", "checkpoint_id": str(entry.checkpoint_id), "status": status.value},
+        )
+        self.stats.status_updates += 1
+
+    def _append_segment(self, index: _InvestigationIndex, data: bytes) -> int:
+        if not (index.directory / _INDEX_FILE).exists():
+            self._append_index(index, {"type": "header", "segment": index.segment_name})
+        with index.segment_path.open("ab") as handle:
+            offset = handle.tell()
+            handle.write(data)
+            handle.flush()
+            if self.fsync:
+                os.fsync(handle.fileno())
+        index.total_bytes = offset + len(data)
+        return offset
+
+    def _append_index(self, index: _InvestigationIndex, record: dict[str, Any]) -> None:
+        index.directory.mkdir(parents=True, exist_ok=True)
+        with (index.directory / _INDEX_FILE).open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+            handle.flush()
+            if self.fsync:
+                os.fsync(handle.fileno())
+
+    def _read_record(self, index: _InvestigationIndex, offset: int) -> dict[str, Any]:
+        """Read a record through a read-only memory map of the segment file."""
+        _, length = index.records[offset]
+        end = offset + length
+        if index.mapped is None or len(index.mapped) < end:
+            if index.mapped is not None:
+                index.mapped.close()
+            with index.segment_path.open("rb") as handle:
+                index.mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        result: dict[str, Any] = json.loads(zlib.decompress(index.mapped[offset:end]))
+        return result
+
+    def _rebuild_state(self, index: _InvestigationIndex, offset: int) -> dict[str, Any]:
+        """Rebuild a record's full state by replaying deltas from its snapshot."""
+        chain: list[int] = []
+        current: int | None = offset
+        while current is not None:
+            chain.append(current)
+            current = index.records[current][0]
+
+        state: dict[str, Any] = {}
+        for record_offset in reversed(chain):
+            record = self._read_record(index, record_offset)
+            if record["kind"] == "full":
+                state = record["state"]
+            else:
+                state = apply_delta(state, record["ops"])
+        return state
+
+    def _load_tip_state(self, index: _InvestigationIndex) -> None:
+        if index.tip_state is None and index.tip_offset is not None:
+            index.tip_state = self._rebuild_state(index, index.tip_offset)
+
+    def _materialize(self, index: _InvestigationIndex, entry: _IndexEntry) -> CheckpointData:
+        if entry.offset == index.tip_offset and index.tip_state is not None:
+            state = json.loads(_canonical(index.tip_state))
+        else:
+            state = self._rebuild_state(index, entry.offset)
+        state["status"] = entry.status.value
+        return CheckpointData.from_dict(state)
+
+    def _compact(self, key: str, index: _InvestigationIndex) -> None:
+        """Rewrite live checkpoints into a new segment generation.
+
+        The rewritten index journal is renamed over the old one, which is the
+        single atomic commit point; a crash before it leaves the old files
+        intact and the orphaned new segment is removed on the next open.
+        """
+        live = sorted(index.entries.values(), key=lambda e: e.offset)
+        states = [(entry, self._rebuild_state(index, entry.offset)) for entry in live]
+
+        if index.mapped is not None:
+            index.mapped.close()
+            index.mapped = None
+
+        generation = int(index.segment_name.removeprefix("segments-").removesuffix(".dat"))
+        fresh = _InvestigationIndex(
+            directory=index.directory,
+            segment_name=f"segments-{generation + 1}.dat",
+        )
+        tmp_index = index.directory / f"{_INDEX_FILE}.tmp"
+
+        previous: dict[str, Any] | None = None
+        with (
+            fresh.segment_path.open("wb") as segments,
+            tmp_index.open("w", encoding="utf-8") as journal,
+        ):
+            journal.write(json.dumps({"type": "header", "segment": fresh.segment_name}) + "\n")
+            for entry, state in states:
+                if previous is not None and fresh.chain_length < self.full_snapshot_interval:
+                    record: dict[str, Any] = {
+                        "kind": "delta",
+                        "ops": compute_delta(previous, state),
+                    }
+                    base_offset = fresh.tip_offset
+                    fresh.chain_length += 1
+                else:
+                    record = {"kind": "full", "state": state}
+                    base_offset = None
+                    fresh.chain_length = 1
+
+                data = zlib.compress(_canonical(record), self.compression_level)
+                offset = segments.tell()
+                segments.write(data)
+
+                new_entry = _IndexEntry(
+                    checkpoint_id=entry.checkpoint_id,
+                    offset=offset,
+                    length=len(data),
+                    kind=record["kind"],
+                    base_offset=base_offset,
+                    content_hash=entry.content_hash,
+                    created_at=entry.created_at,
+                    status=entry.status,
+                    requires_review=entry.requires_review,
+                )
+                journal.write(
+                    json.dumps(_entry_to_journal(new_entry), separators=(",", ":")) + "\n"
+                )
+                self._register(fresh, new_entry)
+                fresh.tip_offset = offset
+                fresh.total_bytes = offset + len(data)
+                previous = state
+
+            segments.flush()
+            journal.flush()
+            if self.fsync:
+                os.fsync(segments.fileno())
+                os.fsync(journal.fileno())
+
+        os.replace(tmp_index, index.directory / _INDEX_FILE)
+        index.segment_path.unlink(missing_ok=True)
+
+        fresh.tip_state = previous
+        self._indexes[key] = fresh
+        self.stats.compactions += 1
+
+        logger.debug(
+            "Compacted checkpoint storage",
+            investigation=key,
+            live_checkpoints=len(fresh.entries),
+            bytes_before=index.total_bytes,
+            bytes_after=fresh.total_bytes,
+        )
+
+
+def _entry_to_journal(entry: _IndexEntry) -> dict[str, Any]:
+    return {
+        "type": "put",
+        "checkpoint_id": str(entry.checkpoint_id),
+        "offset": entry.offset,
+        "length": entry.length,
+        "kind": entry.kind,
+        "base_offset": entry.base_offset,
+        "content_hash": entry.content_hash,
+        "created_at": entry.created_at,
+        "status": entry.status.value,
+        "requires_review": entry.requires_review,
+    }
+
+
+def _canonical(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), sort_keys=True).encode("utf-8")
@@ -8,73 +8,80 @@ This package provides phase handlers for the investigation process:
 - reconciliation: Reconciliation phase (cross-source conflict resolution) - Task 5.15
 """
 
-from elile.investigation.phases.foundation import (
-    BaselineProfile,
-    EducationBaseline,
-    EmploymentBaseline,
-    FoundationConfig,
-    FoundationPhaseHandler,
-    FoundationPhaseResult,
-    IdentityBaseline,
-    VerificationStatus,
-    create_foundation_phase_handler,
-)
-from elile.investigation.phases.records import (
-    CivilRecord,
-    CriminalRecord,
-    FinancialRecord,
-    LicenseRecord,
-    RecordsConfig,
-    RecordsPhaseHandler,
-    RecordsPhaseResult,
-    RecordsProfile,
-    RecordSeverity,
-    RecordType,
-    RegulatoryRecord,
-    SanctionsRecord,
-    create_records_phase_handler,
-)
-from elile.investigation.phases.intelligence import (
-    IntelligenceConfig,
-    IntelligencePhaseHandler,
-    IntelligencePhaseResult,
-    IntelligenceProfile,
-    MediaCategory,
-    MediaMention,
-    MediaSentiment,
-    ProfessionalPresence,
-    RiskIndicator,
-    SocialPlatform,
-    SocialProfile,
-    create_intelligence_phase_handler,
-)
-from elile.investigation.phases.network import (
-    ConnectionStrength,
-    DiscoveredEntity,
-    EntityRelation,
-    EntityType,
-    NetworkConfig,
-    NetworkPhaseHandler,
-    NetworkPhaseResult,
-    NetworkProfile,
-    RelationType,
-    RiskConnection,
-    RiskLevel,
-    create_network_phase_handler,
-)
-from elile.investigation.phases.reconciliation import (
-    ConflictResolution,
-    DeceptionAnalysis,
-    DeceptionRiskLevel,
-    Inconsistency,
-    InconsistencyType,
-    ReconciliationConfig,
-    ReconciliationPhaseHandler,
-    ReconciliationPhaseResult,
-    ReconciliationProfile,
-    ResolutionStatus,
-    create_reconciliation_phase_handler,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.investigation.phases.foundation import (
+        BaselineProfile,
+        EducationBaseline,
+        EmploymentBaseline,
+        FoundationConfig,
+        FoundationPhaseHandler,
+        FoundationPhaseResult,
+        IdentityBaseline,
+        VerificationStatus,
+        create_foundation_phase_handler,
+    )
+    from elile.investigation.phases.records import (
+        CivilRecord,
+        CriminalRecord,
+        FinancialRecord,
+        LicenseRecord,
+        RecordsConfig,
+        RecordsPhaseHandler,
+        RecordsPhaseResult,
+        RecordsProfile,
+        RecordSeverity,
+        RecordType,
+        RegulatoryRecord,
+        SanctionsRecord,
+        create_records_phase_handler,
+    )
+    from elile.investigation.phases.intelligence import (
+        IntelligenceConfig,
+        IntelligencePhaseHandler,
+        IntelligencePhaseResult,
+        IntelligenceProfile,
+        MediaCategory,
+        MediaMention,
+        MediaSentiment,
+        ProfessionalPresence,
+        RiskIndicator,
+        SocialPlatform,
+        SocialProfile,
+        create_intelligence_phase_handler,
+    )
+    from elile.investigation.phases.network import (
+        ConnectionStrength,
+        DiscoveredEntity,
+        EntityRelation,
+        EntityType,
+        NetworkConfig,
+        NetworkPhaseHandler,
+        NetworkPhaseResult,
+        NetworkProfile,
+        RelationType,
+        RiskConnection,
+        RiskLevel,
+        create_network_phase_handler,
+    )
+    from elile.investigation.phases.reconciliation import (
+        ConflictResolution,
+        DeceptionAnalysis,
+        DeceptionRiskLevel,
+        Inconsistency,
+        InconsistencyType,
+        ReconciliationConfig,
+        ReconciliationPhaseHandler,
+        ReconciliationPhaseResult,
+        ReconciliationProfile,
+        ResolutionStatus,
+        create_reconciliation_phase_handler,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Foundation phase (Task 5.11)
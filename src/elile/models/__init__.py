@@ -1,7 +1,33 @@
 """Model adapters for multi-model integration."""
 
-from elile.models.base import BaseModelAdapter, Message, ModelResponse, MessageRole
-from elile.models.registry import get_model
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.models.base import BaseModelAdapter, Message, ModelResponse, MessageRole
+    from elile.models.cache import (
+        CachingModelAdapter,
+        LLMCacheConfig,
+        LLMCacheStats,
+        RedisLLMCacheBackend,
+        SQLiteLLMCacheBackend,
+        create_caching_adapter,
+    )
+    from elile.models.registry import get_model, get_scheduler
+    from elile.models.scheduler import (
+        LLMScheduler,
+        ProviderLimits,
+        RequestPriority,
+        ScheduledModelAdapter,
+        SchedulerConfig,
+        SchedulerStats,
+        create_scheduler,
+        llm_priority,
+        parse_retry_after,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     "BaseModelAdapter",
@@ -9,4 +35,22 @@ __all__ = [
     "ModelResponse",
     "MessageRole",
     "get_model",
+    # Response cache
+    "CachingModelAdapter",
+    "LLMCacheConfig",
+    "LLMCacheStats",
+    "RedisLLMCacheBackend",
+    "SQLiteLLMCacheBackend",
+    "create_caching_adapter",
+    # Call scheduler
+    "LLMScheduler",
+    "ProviderLimits",
+    "RequestPriority",
+    "ScheduledModelAdapter",
+    "SchedulerConfig",
+    "SchedulerStats",
+    "create_scheduler",
+    "get_scheduler",
+    "llm_priority",
+    "parse_retry_after",
 ]
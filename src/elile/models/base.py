@@ -1,6 +1,7 @@
 """Abstract base class for model adapters."""
 
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from enum import Enum
 from typing import Any, TypeVar
 
@@ -29,10 +30,31 @@ class ModelResponse(BaseModel):
     model: str
     usage: dict[str, int] | None = None
     raw_response: Any = None
+    cached: bool = False  # Served from the response cache, not the provider
 
 
 T = TypeVar("T", bound=BaseModel)
 
+_serving_model: ContextVar[str | None] = ContextVar("llm_serving_model", default=None)
+
+
+def set_serving_model(model: str | None) -> None:
+    """Record the model that served the last call made in this context.
+
+    Adapters that may hand a call to a different model than their
+    ``model_name`` (such as a scheduler falling back to another provider)
+    set this after each call.
+
+    Args:
+        model: Name of the model that answered, or None to clear it.
+    """
+    _serving_model.set(model)
+
+
+def serving_model() -> str | None:
+    """Get the model that served the last call made in this context, if recorded."""
+    return _serving_model.get()
+
 
 class BaseModelAdapter(ABC):
     """Abstract base class for model adapters."""
@@ -0,0 +1,535 @@
+"""Response caching and request coalescing for model adapters.
+
+Synthesis and analysis prompts repeat across retries, re-screenings of the
+same subject and monitoring re-runs. ``CachingModelAdapter`` wraps any
+``BaseModelAdapter`` and serves repeated deterministic calls from:
+
+1. An in-process LRU with TTL
+2. An optional shared backend (Redis or SQLite) with the same TTL
+
+Identical calls that are already in flight are coalesced onto a single
+provider request. Calls with temperature > 0 bypass the cache by default,
+since their outputs are meant to vary. Responses served by a fallback model
+are returned but not cached, since keys are built from the wrapped
+adapter's model name.
+
+Example:
+    ```python
+    from elile.models.cache import CachingModelAdapter, RedisLLMCacheBackend
+
+    model = CachingModelAdapter(AnthropicAdapter(api_key), backend=RedisLLMCacheBackend())
+    response = await model.generate(messages, temperature=0.0)
+    ```
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import statistics
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+
+from pydantic import BaseModel
+
+from elile.config.settings import Settings, get_settings
+from elile.core.logging import get_logger
+from elile.core.redis import RedisCache
+from elile.models.base import (
+    BaseModelAdapter,
+    Message,
+    ModelResponse,
+    T,
+    serving_model,
+    set_serving_model,
+)
+from elile.observability.metrics import record_llm_cache_lookup
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class LLMCacheConfig:
+    """Configuration for the LLM response cache.
+
+    Attributes:
+        enabled: Whether caching is enabled.
+        ttl_seconds: Time-to-live for cached responses.
+        max_entries: Maximum entries in the in-process LRU.
+        cache_nonzero_temperature: Also cache calls with temperature > 0.
+        coalesce_in_flight: Share one provider call between identical requests.
+    """
+
+    enabled: bool = True
+    ttl_seconds: int = 86400
+    max_entries: int = 1024
+    cache_nonzero_temperature: bool = False
+    coalesce_in_flight: bool = True
+
+
+@dataclass
+class LLMCacheStats:
+    """Statistics about LLM cache effectiveness.
+
+    Attributes:
+        memory_hits: Hits served from the in-process LRU.
+        backend_hits: Hits served from the shared backend.
+        misses: Calls sent to the provider.
+        coalesced: Calls that waited on an identical in-flight call.
+        bypassed: Calls not eligible for caching.
+        fallbacks: Provider responses not cached because another model served them.
+        input_tokens_saved: Prompt tokens not spent.
+        output_tokens_saved: Completion tokens not spent.
+    """
+
+    memory_hits: int = 0
+    backend_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    bypassed: int = 0
+    fallbacks: int = 0
+    input_tokens_saved: int = 0
+    output_tokens_saved: int = 0
+    latency_saved: deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+
+    @property
+    def hits(self) -> int:
+        """Total cache hits, including coalesced calls."""
+        return self.memory_hits + self.backend_hits + self.coalesced
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable calls not sent to the provider."""
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    @property
+    def latency_saved_p50(self) -> float:
+        """Median provider latency avoided per hit, in seconds."""
+        if not self.latency_saved:
+            return 0.0
+        return statistics.median(self.latency_saved)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "memory_hits": self.memory_hits,
+            "backend_hits": self.backend_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "bypassed": self.bypassed,
+            "fallbacks": self.fallbacks,
+            "hit_rate": self.hit_rate,
+            "input_tokens_saved": self.input_tokens_saved,
+            "output_tokens_saved": self.output_tokens_saved,
+            "latency_saved_p50": self.latency_saved_p50,
+        }
+
+
+class LLMCacheBackend(Protocol):
+    """Shared storage tier for cached model responses."""
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Get a cached payload, or None if missing or expired."""
+        ...
+
+    async def set(self, key: str, value: dict[str, Any], ttl_seconds: int) -> None:
+        """Store a payload with a time-to-live."""
+        ...
+
+
+class RedisLLMCacheBackend:
+    """Redis-backed cache tier, shared across application instances."""
+
+    def __init__(self, cache: RedisCache | None = None) -> None:
+        """Initialize the backend.
+
+        Args:
+            cache: Redis cache to use. Defaults to one with the "llm" prefix.
+        """
+        self._cache = cache or RedisCache(prefix="llm")
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Get a cached payload."""
+        result = await self._cache.get(key)
+        return result.value if result.hit else None
+
+    async def set(self, key: str, value: dict[str, Any], ttl_seconds: int) -> None:
+        """Store a payload with a time-to-live."""
+        await self._cache.set(key, value, ttl=ttl_seconds)
+
+
+class SQLiteLLMCacheBackend:
+    """SQLite-backed cache tier for single-node deployments and development."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the backend.
+
+        Args:
+            path: Database file path. Parent directories are created.
+        """
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def _get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= time.time():
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                conn.commit()
+                return None
+            return json.loads(row[0])
+
+    def _set(self, key: str, value: dict[str, Any], ttl_seconds: int) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, default=str), time.time() + ttl_seconds),
+            )
+            conn.commit()
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Get a cached payload."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: dict[str, Any], ttl_seconds: int) -> None:
+        """Store a payload with a time-to-live."""
+        await asyncio.to_thread(self._set, key, value, ttl_seconds)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def make_cache_key(
+    model: str,
+    messages: list[Message],
+    temperature: float,
+    max_tokens: int,
+    response_model: type[BaseModel] | None = None,
+) -> str:
+    """Build a cache key for a model call.
+
+    Args:
+        model: Model name.
+        messages: Conversation messages.
+        temperature: Sampling temperature.
+        max_tokens: Maximum response tokens.
+        response_model: Structured response model, if any.
+
+    Returns:
+        Hex SHA-256 digest identifying the call.
+    """
+    schema = None
+    if response_model is not None:
+        schema = {
+            "name": f"{response_model.__module__}.{response_model.__qualname__}",
+            "schema": response_model.model_json_schema(),
+        }
+    canonical = json.dumps(
+        {
+            "model": model,
+            "messages": [[m.role.value, m.content] for m in messages],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "schema": schema,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass
+class _InFlight:
+    """A provider call shared by identical concurrent requests."""
+
+    task: asyncio.Task[tuple[Any, dict[str, Any]]]
+    waiters: int = 0
+
+
+class CachingModelAdapter(BaseModelAdapter):
+    """Model adapter that caches and coalesces calls to another adapter.
+
+    Attributes:
+        adapter: The wrapped adapter.
+        config: Cache configuration.
+        backend: Optional shared cache tier.
+        stats: Cache statistics.
+    """
+
+    def __init__(
+        self,
+        adapter: BaseModelAdapter,
+        config: LLMCacheConfig | None = None,
+        backend: LLMCacheBackend | None = None,
+    ) -> None:
+        """Initialize the caching adapter.
+
+        Args:
+            adapter: Adapter to send cache misses to.
+            config: Cache configuration.
+            backend: Optional shared cache tier (Redis or SQLite).
+        """
+        self.adapter = adapter
+        self.config = config or LLMCacheConfig()
+        self.backend = backend
+        self.stats = LLMCacheStats()
+        self._memory: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._in_flight: dict[str, _InFlight] = {}
+
+    @property
+    def model_name(self) -> str:
+        """Return the wrapped adapter's model name."""
+        return self.adapter.model_name
+
+    async def generate(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> ModelResponse:
+        """Generate a response, serving repeated calls from the cache."""
+
+        async def call() -> tuple[ModelResponse, dict[str, Any]]:
+            response = await self.adapter.generate(
+                messages, temperature=temperature, max_tokens=max_tokens
+            )
+            return response, {
+                "content": response.content,
+                "model": response.model,
+                "usage": response.usage,
+            }
+
+        if not self._is_cacheable(temperature):
+            return (await call())[0]
+
+        key = make_cache_key(self.model_name, messages, temperature, max_tokens)
+        result, payload = await self._cached_call(key, call)
+        if result is not None:
+            return result
+        return ModelResponse(
+            content=payload["content"],
+            model=payload["model"],
+            usage=payload.get("usage"),
+            cached=True,
+        )
+
+    async def generate_structured(
+        self,
+        messages: list[Message],
+        response_model: type[T],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> T:
+        """Generate a structured response, serving repeated calls from the cache."""
+
+        async def call() -> tuple[T, dict[str, Any]]:
+            response = await self.adapter.generate_structured(
+                messages, response_model, temperature=temperature, max_tokens=max_tokens
+            )
+            return response, {"data": response.model_dump(mode="json"), "usage": None}
+
+        if not self._is_cacheable(temperature):
+            return (await call())[0]
+
+        key = make_cache_key(self.model_name, messages, temperature, max_tokens, response_model)
+        result, payload = await self._cached_call(key, call)
+        if result is not None:
+            return result
+        return response_model.model_validate(payload["data"])
+
+    def clear(self) -> None:
+        """Drop all in-process entries (the shared backend is untouched)."""
+        self._memory.clear()
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _is_cacheable(self, temperature: float) -> bool:
+        if self.config.enabled and (temperature <= 0 or self.config.cache_nonzero_temperature):
+            return True
+        self.stats.bypassed += 1
+        record_llm_cache_lookup(self.model_name, "bypass")
+        return False
+
+    async def _cached_call(self, key: str, call: Any) -> tuple[Any, dict[str, Any]]:
+        """Look up ``key`` in each tier, falling back to a coalesced call.
+
+        The backend lookup and provider call run as a task of their own, so
+        cancelling the caller that started it does not fail the callers
+        coalesced onto it. The task is cancelled only once every caller
+        waiting on it has been cancelled.
+
+        Returns:
+            Tuple of (fresh result or None, payload). The fresh result is
+            only set for the caller that actually made the provider call.
+        """
+        payload = self._memory_get(key)
+        if payload is not None:
+            self.stats.memory_hits += 1
+            self._record_hit(payload)
+            return None, payload
+
+        flight = self._in_flight.get(key) if self.config.coalesce_in_flight else None
+        started = flight is None
+        if flight is None:
+            flight = _InFlight(asyncio.create_task(self._fetch(key, call)))
+            self._in_flight[key] = flight
+            flight.task.add_done_callback(lambda _: self._end_flight(key, flight))
+
+        flight.waiters += 1
+        try:
+            result, payload = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+        if started:
+            return result, payload
+        self.stats.coalesced += 1
+        self._record_hit(payload, outcome="coalesced")
+        return None, payload
+
+    async def _fetch(self, key: str, call: Any) -> tuple[Any, dict[str, Any]]:
+        """Read ``key`` from the backend or make the provider call and store it."""
+        payload = await self._backend_get(key)
+        if payload is not None:
+            self.stats.backend_hits += 1
+            self._memory_set(key, payload)
+            self._record_hit(payload)
+            return None, payload
+
+        # This task runs in a copy of the caller's context, so clearing the
+        # serving model here only affects the call below
+        set_serving_model(None)
+        start = time.perf_counter()
+        result, payload = await call()
+        payload["latency"] = time.perf_counter() - start
+        self.stats.misses += 1
+        record_llm_cache_lookup(self.model_name, "miss")
+
+        served_by = serving_model()
+        if served_by is not None and served_by != self.model_name:
+            # The key names the preferred model, so keep fallback answers out
+            self.stats.fallbacks += 1
+            logger.debug("LLM fallback response not cached", model=served_by)
+            return result, payload
+
+        self._memory_set(key, payload)
+        await self._backend_set(key, payload)
+        return result, payload
+
+    def _end_flight(self, key: str, flight: "_InFlight") -> None:
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+        if not flight.task.cancelled():
+            # Mark retrieved so a failed call with no waiters left does not warn
+            flight.task.exception()
+
+    def _record_hit(self, payload: dict[str, Any], outcome: str = "hit") -> None:
+        usage = payload.get("usage") or {}
+        latency = payload.get("latency")
+        self.stats.input_tokens_saved += usage.get("input_tokens", 0)
+        self.stats.output_tokens_saved += usage.get("output_tokens", 0)
+        if latency is not None:
+            self.stats.latency_saved.append(latency)
+        record_llm_cache_lookup(self.model_name, outcome, usage, latency)
+
+    def _memory_get(self, key: str) -> dict[str, Any] | None:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at <= time.monotonic():
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return payload
+
+    def _memory_set(self, key: str, payload: dict[str, Any]) -> None:
+        self._memory[key] = (time.monotonic() + self.config.ttl_seconds, payload)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.config.max_entries:
+            self._memory.popitem(last=False)
+
+    async def _backend_get(self, key: str) -> dict[str, Any] | None:
+        if self.backend is None:
+            return None
+        try:
+            return await self.backend.get(key)
+        except Exception as exc:
+            # The cache must never break generation
+            logger.warning("LLM cache backend read failed", error=str(exc))
+            return None
+
+    async def _backend_set(self, key: str, payload: dict[str, Any]) -> None:
+        if self.backend is None:
+            return
+        try:
+            await self.backend.set(key, payload, self.config.ttl_seconds)
+        except Exception as exc:
+            logger.warning("LLM cache backend write failed", error=str(exc))
+
+
+def create_caching_adapter(
+    adapter: BaseModelAdapter,
+    settings: Settings | None = None,
+) -> CachingModelAdapter:
+    """Wrap an adapter with the response cache configured in settings.
+
+    Args:
+        adapter: Adapter to wrap.
+        settings: Application settings. Defaults to the global settings.
+
+    Returns:
+        Configured CachingModelAdapter.
+    """
+    settings = settings or get_settings()
+    config = LLMCacheConfig(
+        enabled=settings.llm_cache_enabled,
+        ttl_seconds=settings.llm_cache_ttl_seconds,
+        max_entries=settings.llm_cache_max_entries,
+        cache_nonzero_temperature=settings.llm_cache_nonzero_temperature,
+    )
+
+    backend: LLMCacheBackend | None = None
+    match settings.llm_cache_backend:
+        case "redis":
+            backend = RedisLLMCacheBackend()
+        case "sqlite":
+            backend = SQLiteLLMCacheBackend(settings.llm_cache_sqlite_path)
+
+    return CachingModelAdapter(adapter, config=config, backend=backend)
@@ -2,14 +2,56 @@
 
 from functools import lru_cache
 
-from elile.config.settings import ModelProvider, get_settings
+from elile.config.settings import ModelProvider, Settings, get_settings
 from elile.models.anthropic_adapter import AnthropicAdapter
 from elile.models.base import BaseModelAdapter
+from elile.models.cache import create_caching_adapter
 from elile.models.gemini_adapter import GeminiAdapter
 from elile.models.openai_adapter import OpenAIAdapter
+from elile.models.scheduler import LLMScheduler, ScheduledModelAdapter, create_scheduler
 from elile.utils.exceptions import ConfigurationError
 
 
+def _create_adapter(provider: ModelProvider, settings: Settings) -> BaseModelAdapter:
+    """Create a bare adapter for a provider.
+
+    Raises:
+        ConfigurationError: If the API key for the provider is not configured.
+    """
+    api_key = settings.get_api_key(provider)
+    if api_key is None:
+        raise ConfigurationError(f"API key not configured for provider: {provider.value}")
+
+    model_name = settings.get_model_name(provider)
+
+    match provider:
+        case ModelProvider.ANTHROPIC:
+            return AnthropicAdapter(api_key=api_key, model=model_name)
+        case ModelProvider.OPENAI:
+            return OpenAIAdapter(api_key=api_key, model=model_name)
+        case ModelProvider.GOOGLE:
+            return GeminiAdapter(api_key=api_key, model=model_name)
+
+
+@lru_cache
+def get_scheduler() -> LLMScheduler:
+    """Get the shared scheduler for every provider with a configured API key.
+
+    Returns:
+        The process-wide LLMScheduler.
+
+    Raises:
+        ConfigurationError: If no provider has an API key configured.
+    """
+    settings = get_settings()
+    adapters = {
+        provider: _create_adapter(provider, settings)
+        for provider in ModelProvider
+        if settings.get_api_key(provider) is not None
+    }
+    return create_scheduler(adapters, settings)
+
+
 @lru_cache
 def get_model(provider: ModelProvider | None = None) -> BaseModelAdapter:
     """Get a model adapter for the specified provider.
@@ -28,16 +70,16 @@ def get_model(provider: ModelProvider | None = None) -> BaseModelAdapter:
     if provider is None:
         provider = settings.default_model_provider
 
-    api_key = settings.get_api_key(provider)
-    if api_key is None:
-        raise ConfigurationError(f"API key not configured for provider: {provider.value}")
-
-    model_name = settings.get_model_name(provider)
+    adapter: BaseModelAdapter
+    if settings.llm_scheduler_enabled:
+        scheduler = get_scheduler()
+        if provider not in scheduler.providers:
+            raise ConfigurationError(f"API key not configured for provider: {provider.value}")
+        adapter = ScheduledModelAdapter(scheduler, provider)
+    else:
+        adapter = _create_adapter(provider, settings)
 
-    match provider:
-        case ModelProvider.ANTHROPIC:
-            return AnthropicAdapter(api_key=api_key, model=model_name)
-        case ModelProvider.OPENAI:
-            return OpenAIAdapter(api_key=api_key, model=model_name)
-        case ModelProvider.GOOGLE:
-            return GeminiAdapter(api_key=api_key, model=model_name)
+    # Cache outside the scheduler so hits never consume provider budget
+    if settings.llm_cache_enabled:
+        return create_caching_adapter(adapter, settings)
+    return adapter
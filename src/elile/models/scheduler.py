@@ -0,0 +1,699 @@
+"""Shared scheduler for model adapter calls.
+
+Callers used to fire model requests at will, so under load providers
+returned 429s and every caller retried at once. ``LLMScheduler`` sits in
+front of the adapters and gives each provider:
+
+1. A concurrency limit that halves on rate limits and recovers gradually
+2. A tokens-per-minute budget (reserved up front, reconciled with usage)
+3. A priority queue, so interactive calls run ahead of batch monitoring
+4. Backoff driven by ``retry-after`` and provider rate-limit reset headers
+
+When a provider is backing off or its queue is saturated, calls fall back
+to the next configured provider.
+
+Example:
+    ```python
+    from elile.models.scheduler import LLMScheduler, RequestPriority, llm_priority
+
+    scheduler = LLMScheduler({ModelProvider.ANTHROPIC: claude, ModelProvider.OPENAI: gpt})
+    model = ScheduledModelAdapter(scheduler, ModelProvider.ANTHROPIC)
+
+    with llm_priority(RequestPriority.BATCH):
+        response = await model.generate(messages)
+    ```
+"""
+
+import asyncio
+import heapq
+import itertools
+import re
+import time
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Any, TypeVar
+
+from elile.config.settings import ModelProvider, Settings, get_settings
+from elile.core.logging import get_logger
+from elile.models.base import BaseModelAdapter, Message, ModelResponse, T, set_serving_model
+from elile.observability.metrics import observe_llm_queue_wait, record_llm_scheduler_event
+from elile.utils.exceptions import ConfigurationError, RateLimitError
+
+logger = get_logger(__name__)
+
+R = TypeVar("R")
+
+
+class RequestPriority(str, Enum):
+    """Scheduling priority of a model call."""
+
+    INTERACTIVE = "interactive"  # User-facing report generation
+    NORMAL = "normal"
+    BATCH = "batch"  # Background monitoring and re-screening
+
+
+_PRIORITY_RANK = {
+    RequestPriority.INTERACTIVE: 0,
+    RequestPriority.NORMAL: 1,
+    RequestPriority.BATCH: 2,
+}
+
+_current_priority: ContextVar[RequestPriority] = ContextVar(
+    "llm_priority", default=RequestPriority.NORMAL
+)
+
+
+@contextmanager
+def llm_priority(priority: RequestPriority) -> Iterator[None]:
+    """Set the scheduling priority for model calls made in this context.
+
+    Args:
+        priority: Priority applied to calls that do not pass one explicitly.
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+@dataclass
+class ProviderLimits:
+    """Per-provider scheduling limits.
+
+    Attributes:
+        max_concurrency: Maximum in-flight calls.
+        tokens_per_minute: Token budget per minute (input plus max output).
+        saturation_queue_depth: Queued calls beyond which the provider is
+            considered saturated and calls fall back to another provider.
+    """
+
+    max_concurrency: int = 8
+    tokens_per_minute: int = 400_000
+    saturation_queue_depth: int = 16
+
+
+@dataclass
+class SchedulerConfig:
+    """Configuration for the LLM scheduler.
+
+    Attributes:
+        default_limits: Limits for providers without an explicit entry.
+        provider_limits: Per-provider overrides.
+        fallback_order: Providers to try, in order, when the requested one
+            is saturated.
+        max_retries: Rate-limited attempts retried before giving up.
+        base_backoff_seconds: First backoff when no header gives a delay.
+        max_backoff_seconds: Upper bound for any backoff.
+        recovery_successes: Successful calls before the concurrency limit is
+            raised by one after a rate limit.
+    """
+
+    default_limits: ProviderLimits = field(default_factory=ProviderLimits)
+    provider_limits: dict[ModelProvider, ProviderLimits] = field(default_factory=dict)
+    fallback_order: list[ModelProvider] = field(default_factory=list)
+    max_retries: int = 3
+    base_backoff_seconds: float = 1.0
+    max_backoff_seconds: float = 60.0
+    recovery_successes: int = 10
+
+    def limits_for(self, provider: ModelProvider) -> ProviderLimits:
+        """Get the limits for a provider."""
+        return self.provider_limits.get(provider, self.default_limits)
+
+
+@dataclass
+class SchedulerStats:
+    """Statistics about scheduled model calls.
+
+    Attributes:
+        submitted: Calls submitted to the scheduler.
+        completed: Calls that returned a result.
+        failed: Calls that raised.
+        rate_limited: Provider responses that were rate limits.
+        retries: Attempts retried after a rate limit.
+        fallbacks: Calls dispatched to a fallback provider.
+        queue_wait_seconds: Total time calls spent queued.
+    """
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rate_limited: int = 0
+    retries: int = 0
+    fallbacks: int = 0
+    queue_wait_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rate_limited": self.rate_limited,
+            "retries": self.retries,
+            "fallbacks": self.fallbacks,
+            "queue_wait_seconds": round(self.queue_wait_seconds, 3),
+        }
+
+
+# =============================================================================
+# Rate-limit detection
+# =============================================================================
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_delay(value: str) -> float | None:
+    """Parse a header value as seconds, a duration like ``6m0s`` or a timestamp."""
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(n + u for n, u in parts) == value:
+        return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return max(0.0, (moment - datetime.now(UTC)).total_seconds())
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """Get the delay a provider asked for from its rate-limit headers.
+
+    Prefers ``retry-after-ms`` and ``retry-after`` (seconds or HTTP date).
+    Otherwise uses the latest Anthropic ``anthropic-ratelimit-*-reset``
+    timestamp or OpenAI ``x-ratelimit-reset-*`` duration.
+
+    Args:
+        headers: Response headers.
+
+    Returns:
+        Delay in seconds, or None if no header gives one.
+    """
+    lowered = {key.lower(): value for key, value in headers.items()}
+    if "retry-after-ms" in lowered:
+        try:
+            return max(0.0, float(lowered["retry-after-ms"]) / 1000)
+        except ValueError:
+            pass
+    if "retry-after" in lowered:
+        delay = _parse_delay(lowered["retry-after"])
+        if delay is not None:
+            return delay
+
+    delays = [
+        delay
+        for key, value in lowered.items()
+        if "ratelimit" in key and (key.endswith("-reset") or "-reset-" in key)
+        if (delay := _parse_delay(value)) is not None
+    ]
+    return max(delays) if delays else None
+
+
+def _is_rate_limit(exc: BaseException) -> bool:
+    if isinstance(exc, RateLimitError):
+        return True
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    return type(exc).__name__ in ("RateLimitError", "ResourceExhausted")
+
+
+def _retry_after(exc: BaseException) -> float | None:
+    retry_after = getattr(exc, "retry_after", None)
+    if isinstance(retry_after, int | float):
+        return float(retry_after)
+    headers = getattr(exc, "headers", None) or getattr(
+        getattr(exc, "response", None), "headers", None
+    )
+    if headers:
+        return parse_retry_after(headers)
+    return None
+
+
+def estimate_tokens(messages: list[Message], max_tokens: int) -> int:
+    """Estimate the tokens a call will count against a TPM budget.
+
+    Uses roughly four characters per input token plus the full output
+    allowance; the reservation is reconciled with reported usage afterwards.
+
+    Args:
+        messages: Call messages.
+        max_tokens: Output token limit.
+
+    Returns:
+        Estimated token cost.
+    """
+    return sum(len(message.content) for message in messages) // 4 + max_tokens
+
+
+# =============================================================================
+# Provider lane
+# =============================================================================
+
+
+class _ProviderLane:
+    """Queue, concurrency limit and token bucket for one provider."""
+
+    def __init__(
+        self, provider: ModelProvider, limits: ProviderLimits, recovery_successes: int
+    ) -> None:
+        self.provider = provider
+        self.limits = limits
+        self.recovery_successes = recovery_successes
+        self.limit = limits.max_concurrency  # Adaptive, at most max_concurrency
+        self.in_flight = 0
+        self.tokens = float(limits.tokens_per_minute)
+        self.backoff_until = 0.0
+        self._refilled_at = time.monotonic()
+        self._consecutive_rate_limits = 0
+        self._successes = 0
+        self._waiters: list[tuple[int, int, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    def saturated(self, tokens: int) -> bool:
+        """Whether a call should go elsewhere instead of queueing here."""
+        if time.monotonic() < self.backoff_until:
+            return True
+        self._refill()
+        can_start = (
+            not self._waiters and self.in_flight < self.limit and self._cost(tokens) <= self.tokens
+        )
+        return not can_start and self.queued >= self.limits.saturation_queue_depth
+
+    async def acquire(self, tokens: int, rank: int) -> int:
+        """Wait for a slot and reserve tokens.
+
+        Returns:
+            Tokens reserved, to be passed to ``release``.
+        """
+        cost = self._cost(tokens)
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (rank, next(self._seq), cost, future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before cancellation; give the slot back
+                self.release(cost, 0)
+            raise
+        return cost
+
+    def release(self, reserved: int, used: int | None) -> None:
+        """Free a slot, refunding unused tokens when actual usage is known."""
+        self.in_flight -= 1
+        if used is not None:
+            self.tokens = min(self.limits.tokens_per_minute, self.tokens + reserved - used)
+        self._dispatch()
+
+    def on_success(self) -> None:
+        self._consecutive_rate_limits = 0
+        if self.limit < self.limits.max_concurrency:
+            self._successes += 1
+            if self._successes >= self.recovery_successes:
+                self.limit += 1
+                self._successes = 0
+
+    def on_rate_limit(self, delay: float) -> None:
+        self._consecutive_rate_limits += 1
+        self.backoff_until = max(self.backoff_until, time.monotonic() + delay)
+        self.limit = max(1, self.limit // 2)
+        self._successes = 0
+
+    def backoff_delay(self, config: SchedulerConfig, retry_after: float | None) -> float:
+        if retry_after is not None:
+            return min(retry_after, config.max_backoff_seconds)
+        exponent = self._consecutive_rate_limits
+        return min(config.base_backoff_seconds * 2**exponent, config.max_backoff_seconds)
+
+    def _cost(self, tokens: int) -> int:
+        # A call larger than the whole budget would never start otherwise
+        return min(tokens, self.limits.tokens_per_minute)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        rate = self.limits.tokens_per_minute / 60
+        self.tokens = min(
+            self.limits.tokens_per_minute, self.tokens + (now - self._refilled_at) * rate
+        )
+        self._refilled_at = now
+
+    def _dispatch(self) -> None:
+        now = time.monotonic()
+        if now < self.backoff_until:
+            self._wake_in(self.backoff_until - now)
+            return
+
+        self._refill()
+        while self._waiters:
+            _, _, cost, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self.in_flight >= self.limit:
+                return  # release() dispatches again
+            if cost > self.tokens:
+                self._wake_in((cost - self.tokens) / (self.limits.tokens_per_minute / 60))
+                return
+            heapq.heappop(self._waiters)
+            self.in_flight += 1
+            self.tokens -= cost
+            future.set_result(None)
+
+    def _wake_in(self, delay: float) -> None:
+        loop = asyncio.get_running_loop()
+        when = loop.time() + delay
+        if self._timer is not None:
+            if self._timer.when() <= when:
+                return
+            self._timer.cancel()
+        self._timer = loop.call_at(when, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+
+# =============================================================================
+# Scheduler
+# =============================================================================
+
+
+class LLMScheduler:
+    """Schedules model calls across providers under shared limits.
+
+    Attributes:
+        config: Scheduler configuration.
+        stats: Scheduler statistics.
+    """
+
+    def __init__(
+        self,
+        adapters: Mapping[ModelProvider, BaseModelAdapter],
+        config: SchedulerConfig | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            adapters: Adapter for each available provider.
+            config: Scheduler configuration.
+        """
+        if not adapters:
+            raise ConfigurationError("LLM scheduler needs at least one model adapter")
+        self.config = config or SchedulerConfig()
+        self.stats = SchedulerStats()
+        self._adapters = dict(adapters)
+        self._lanes = {
+            provider: _ProviderLane(
+                provider, self.config.limits_for(provider), self.config.recovery_successes
+            )
+            for provider in self._adapters
+        }
+
+    @property
+    def providers(self) -> list[ModelProvider]:
+        """Providers this scheduler can dispatch to."""
+        return list(self._adapters)
+
+    def adapter(self, provider: ModelProvider) -> BaseModelAdapter:
+        """Get the adapter for a provider."""
+        return self._adapters[provider]
+
+    def load(self, provider: ModelProvider) -> dict[str, Any]:
+        """Get the current load of a provider."""
+        lane = self._lanes[provider]
+        return {
+            "in_flight": lane.in_flight,
+            "queued": lane.queued,
+            "concurrency_limit": lane.limit,
+            "tokens_available": int(lane.tokens),
+            "backing_off": time.monotonic() < lane.backoff_until,
+        }
+
+    async def generate(
+        self,
+        messages: list[Message],
+        *,
+        provider: ModelProvider | None = None,
+        priority: RequestPriority | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> ModelResponse:
+        """Generate a response through the scheduler.
+
+        Args:
+            messages: List of messages in the conversation.
+            provider: Preferred provider. Defaults to the first configured.
+            priority: Call priority. Defaults to the context priority.
+            temperature: Sampling temperature.
+            max_tokens: Maximum tokens in the response.
+
+        Returns:
+            ModelResponse from whichever provider served the call.
+        """
+        return await self._submit(
+            messages,
+            max_tokens,
+            provider,
+            priority,
+            lambda adapter: adapter.generate(
+                messages, temperature=temperature, max_tokens=max_tokens
+            ),
+            lambda response: (
+                sum(response.usage.get(k, 0) for k in ("input_tokens", "output_tokens"))
+                if response.usage
+                else None
+            ),
+        )
+
+    async def generate_structured(
+        self,
+        messages: list[Message],
+        response_model: type[T],
+        *,
+        provider: ModelProvider | None = None,
+        priority: RequestPriority | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> T:
+        """Generate a structured response through the scheduler.
+
+        Args:
+            messages: List of messages in the conversation.
+            response_model: Pydantic model class for the expected response.
+            provider: Preferred provider. Defaults to the first configured.
+            priority: Call priority. Defaults to the context priority.
+            temperature: Sampling temperature.
+            max_tokens: Maximum tokens in the response.
+
+        Returns:
+            Instance of response_model.
+        """
+        return await self._submit(
+            messages,
+            max_tokens,
+            provider,
+            priority,
+            lambda adapter: adapter.generate_structured(
+                messages, response_model, temperature=temperature, max_tokens=max_tokens
+            ),
+            lambda _: None,
+        )
+
+    async def _submit(
+        self,
+        messages: list[Message],
+        max_tokens: int,
+        provider: ModelProvider | None,
+        priority: RequestPriority | None,
+        call: Callable[[BaseModelAdapter], Awaitable[R]],
+        usage_of: Callable[[R], int | None],
+    ) -> R:
+        preferred = provider or next(iter(self._adapters))
+        if preferred not in self._adapters:
+            raise ConfigurationError(f"No adapter scheduled for provider: {preferred.value}")
+        priority = priority or _current_priority.get()
+        rank = _PRIORITY_RANK[priority]
+        estimate = estimate_tokens(messages, max_tokens)
+        self.stats.submitted += 1
+
+        attempt = 0
+        while True:
+            lane = self._select_lane(preferred, estimate)
+            queued_at = time.monotonic()
+            reserved = await lane.acquire(estimate, rank)
+            waited = time.monotonic() - queued_at
+            self.stats.queue_wait_seconds += waited
+            observe_llm_queue_wait(lane.provider.value, priority.value, waited)
+
+            try:
+                result = await call(self._adapters[lane.provider])
+            except Exception as exc:
+                if not _is_rate_limit(exc):
+                    lane.release(reserved, None)
+                    self.stats.failed += 1
+                    raise
+                # Back off before freeing the slot, or release() would hand it
+                # straight to a queued call. A rejected call consumed no tokens.
+                delay = lane.backoff_delay(self.config, _retry_after(exc))
+                lane.on_rate_limit(delay)
+                lane.release(reserved, 0)
+                self.stats.rate_limited += 1
+                record_llm_scheduler_event(lane.provider.value, "rate_limited")
+                logger.warning(
+                    "LLM provider rate limited",
+                    provider=lane.provider.value,
+                    backoff_seconds=round(delay, 3),
+                    concurrency_limit=lane.limit,
+                )
+                attempt += 1
+                if attempt > self.config.max_retries:
+                    self.stats.failed += 1
+                    raise
+                self.stats.retries += 1
+                record_llm_scheduler_event(lane.provider.value, "retry")
+                continue
+            except BaseException:
+                lane.release(reserved, None)
+                raise
+
+            lane.on_success()
+            lane.release(reserved, usage_of(result))
+            self.stats.completed += 1
+            set_serving_model(self._adapters[lane.provider].model_name)
+            return result
+
+    def _select_lane(self, preferred: ModelProvider, tokens: int) -> _ProviderLane:
+        candidates = [preferred] + [
+            p for p in self.config.fallback_order if p != preferred and p in self._lanes
+        ]
+        lanes = [self._lanes[p] for p in candidates]
+        for lane in lanes:
+            if not lane.saturated(tokens):
+                break
+        else:
+            # Everything is busy: queue where the backoff ends soonest
+            lane = min(lanes, key=lambda candidate: candidate.backoff_until)
+
+        if lane.provider != preferred:
+            self.stats.fallbacks += 1
+            record_llm_scheduler_event(lane.provider.value, "fallback")
+        return lane
+
+
+class ScheduledModelAdapter(BaseModelAdapter):
+    """Model adapter that routes calls through an ``LLMScheduler``.
+
+    Attributes:
+        scheduler: Scheduler calls are submitted to.
+        provider: Preferred provider.
+        priority: Fixed priority, or None to use the context priority.
+    """
+
+    def __init__(
+        self,
+        scheduler: LLMScheduler,
+        provider: ModelProvider,
+        priority: RequestPriority | None = None,
+    ) -> None:
+        """Initialize the scheduled adapter.
+
+        Args:
+            scheduler: Scheduler to submit calls to.
+            provider: Preferred provider.
+            priority: Fixed priority, or None to use the context priority.
+        """
+        self.scheduler = scheduler
+        self.provider = provider
+        self.priority = priority
+
+    @property
+    def model_name(self) -> str:
+        """Return the preferred provider's model name."""
+        return self.scheduler.adapter(self.provider).model_name
+
+    async def generate(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> ModelResponse:
+        """Generate a response through the scheduler."""
+        return await self.scheduler.generate(
+            messages,
+            provider=self.provider,
+            priority=self.priority,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+    async def generate_structured(
+        self,
+        messages: list[Message],
+        response_model: type[T],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> T:
+        """Generate a structured response through the scheduler."""
+        return await self.scheduler.generate_structured(
+            messages,
+            response_model,
+            provider=self.provider,
+            priority=self.priority,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+
+def create_scheduler(
+    adapters: Mapping[ModelProvider, BaseModelAdapter],
+    settings: Settings | None = None,
+) -> LLMScheduler:
+    """Create a scheduler with the limits configured in settings.
+
+    Args:
+        adapters: Adapter for each available provider.
+        settings: Application settings. Defaults to the global settings.
+
+    Returns:
+        Configured LLMScheduler.
+    """
+    settings = settings or get_settings()
+    return LLMScheduler(
+        adapters,
+        SchedulerConfig(
+            default_limits=ProviderLimits(
+                max_concurrency=settings.llm_max_concurrency,
+                tokens_per_minute=settings.llm_tokens_per_minute,
+            ),
+            fallback_order=list(settings.llm_fallback_providers),
+            max_retries=settings.llm_max_retries,
+        ),
+    )
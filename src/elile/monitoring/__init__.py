@@ -4,60 +4,81 @@ This module provides scheduling and execution of periodic monitoring checks
 based on vigilance levels (V1/V2/V3) for ongoing employee surveillance.
 """
 
-from elile.monitoring.alert_generator import (
-    AUTO_ALERT_THRESHOLDS,
-    AlertConfig,
-    AlertGenerator,
-    AlertStatus,
-    EscalationTrigger,
-    GeneratedAlert,
-    MockEmailChannel,
-    MockSMSChannel,
-    MockWebhookChannel,
-    NotificationChannel,
-    NotificationChannelType,
-    NotificationResult,
-    create_alert_generator,
-)
-from elile.monitoring.delta_detector import (
-    ConnectionChange,
-    DeltaDetector,
-    DeltaResult,
-    DeltaType,
-    DetectorConfig,
-    FindingChange,
-    RiskScoreChange,
-    create_delta_detector,
-)
-from elile.monitoring.scheduler import (
-    MonitoringScheduler,
-    SchedulerConfig,
-    create_monitoring_scheduler,
-)
-from elile.monitoring.types import (
-    CheckType,
-    LifecycleEvent,
-    LifecycleEventType,
-    MonitoringCheck,
-    MonitoringConfig,
-    MonitoringError,
-    MonitoringStatus,
-    ProfileDelta,
-    ScheduleResult,
-)
-from elile.monitoring.vigilance_manager import (
-    RISK_THRESHOLD_V2,
-    RISK_THRESHOLD_V3,
-    ROLE_DEFAULT_VIGILANCE,
-    EscalationAction,
-    ManagerConfig,
-    RoleVigilanceMapping,
-    VigilanceChangeReason,
-    VigilanceDecision,
-    VigilanceManager,
-    VigilanceUpdate,
-    create_vigilance_manager,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.monitoring.alert_generator import (
+        AUTO_ALERT_THRESHOLDS,
+        AlertConfig,
+        AlertGenerator,
+        AlertStatus,
+        BatchNotificationChannel,
+        EscalationTrigger,
+        GeneratedAlert,
+        MockEmailChannel,
+        MockSMSChannel,
+        MockWebhookChannel,
+        NotificationChannel,
+        NotificationChannelType,
+        NotificationMessage,
+        NotificationResult,
+        create_alert_generator,
+    )
+    from elile.monitoring.alert_outbox import (
+        AlertOutbox,
+        InMemoryAlertOutbox,
+        OutboxEntry,
+        OutboxStatus,
+    )
+    from elile.monitoring.delta_detector import (
+        ConnectionChange,
+        DeltaDetector,
+        DeltaResult,
+        DeltaType,
+        DetectorConfig,
+        FindingChange,
+        RiskScoreChange,
+        create_delta_detector,
+    )
+    from elile.monitoring.fingerprints import (
+        ProfileDigest,
+        compute_profile_digest,
+    )
+    from elile.monitoring.scheduler import (
+        MonitoringScheduler,
+        ProfileSnapshot,
+        ProfileSource,
+        SchedulerConfig,
+        create_monitoring_scheduler,
+    )
+    from elile.monitoring.types import (
+        CheckType,
+        LifecycleEvent,
+        LifecycleEventType,
+        MonitoringCheck,
+        MonitoringConfig,
+        MonitoringError,
+        MonitoringStatus,
+        ProfileDelta,
+        ScheduleResult,
+    )
+    from elile.monitoring.vigilance_manager import (
+        RISK_THRESHOLD_V2,
+        RISK_THRESHOLD_V3,
+        ROLE_DEFAULT_VIGILANCE,
+        EscalationAction,
+        ManagerConfig,
+        RoleVigilanceMapping,
+        VigilanceChangeReason,
+        VigilanceDecision,
+        VigilanceManager,
+        VigilanceUpdate,
+        create_vigilance_manager,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Alert Generator
@@ -69,11 +90,18 @@ __all__ = [
     "NotificationChannel",
     "NotificationChannelType",
     "NotificationResult",
+    "NotificationMessage",
+    "BatchNotificationChannel",
     "MockEmailChannel",
     "MockWebhookChannel",
     "MockSMSChannel",
     "AUTO_ALERT_THRESHOLDS",
     "create_alert_generator",
+    # Alert Outbox
+    "AlertOutbox",
+    "InMemoryAlertOutbox",
+    "OutboxEntry",
+    "OutboxStatus",
     # Delta Detector
     "DeltaDetector",
     "DetectorConfig",
@@ -83,8 +111,13 @@ __all__ = [
     "ConnectionChange",
     "RiskScoreChange",
     "create_delta_detector",
+    # Fingerprints
+    "ProfileDigest",
+    "compute_profile_digest",
     # Scheduler
     "MonitoringScheduler",
+    "ProfileSnapshot",
+    "ProfileSource",
     "SchedulerConfig",
     "create_monitoring_scheduler",
     # Vigilance Manager
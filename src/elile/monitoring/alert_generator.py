@@ -11,8 +11,17 @@ Classes:
     AlertConfig: Configuration for alert generator
     GeneratedAlert: Extended alert with delivery tracking
     AlertGenerator: Main alert generation class
+
+Notifications go through a durable outbox (see alert_outbox): alerts and
+their notifications are persisted first, then delivered concurrently per
+channel, in batches where the channel supports it. Failed notifications
+are retried with exponential backoff by dispatch_outbox(). Alert history
+is read from the outbox, so it includes delivery results recorded by any
+process and is bounded by the outbox's pruning.
 """
 
+import asyncio
+import hashlib
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import Enum
@@ -23,6 +32,13 @@ from pydantic import BaseModel, Field
 
 from elile.agent.state import VigilanceLevel
 from elile.core.logging import get_logger
+from elile.core.outbox import retry_delay
+from elile.monitoring.alert_outbox import (
+    AlertOutbox,
+    InMemoryAlertOutbox,
+    OutboxEntry,
+    OutboxStatus,
+)
 from elile.monitoring.types import (
     AlertSeverity,
     DeltaSeverity,
@@ -130,6 +146,19 @@ class NotificationResult:
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "NotificationResult":
+        """Create from a dictionary produced by to_dict."""
+        return cls(
+            channel_type=NotificationChannelType(data["channel_type"]),
+            recipient=data["recipient"],
+            success=data["success"],
+            message_id=data.get("message_id"),
+            error=data.get("error"),
+            delivered_at=datetime.fromisoformat(data["delivered_at"]),
+            metadata=dict(data.get("metadata") or {}),
+        )
+
 
 class NotificationChannel(Protocol):
     """Protocol for notification delivery channels."""
@@ -160,6 +189,38 @@ class NotificationChannel(Protocol):
         ...
 
 
+@dataclass
+class NotificationMessage:
+    """A notification in a batch send.
+
+    Attributes:
+        recipient: Recipient identifier
+        subject: Notification subject/title
+        body: Notification body content
+        metadata: Additional metadata (alert ID, idempotency key)
+    """
+
+    recipient: str
+    subject: str
+    body: str
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+class BatchNotificationChannel(NotificationChannel, Protocol):
+    """Protocol for channels that can send many notifications per request."""
+
+    async def send_batch(self, messages: list[NotificationMessage]) -> list[NotificationResult]:
+        """Send a batch of notifications.
+
+        Args:
+            messages: Notifications to send
+
+        Returns:
+            One NotificationResult per message, in order
+        """
+        ...
+
+
 # =============================================================================
 # Mock Notification Channels (for testing/development)
 # =============================================================================
@@ -173,6 +234,7 @@ class MockEmailChannel:
     def __init__(self, should_fail: bool = False) -> None:
         self.should_fail = should_fail
         self.sent_messages: list[dict[str, Any]] = []
+        self.batch_sizes: list[int] = []
 
     async def send(
         self,
@@ -206,6 +268,11 @@ class MockEmailChannel:
             message_id=f"mock-email-{uuid7()}",
         )
 
+    async def send_batch(self, messages: list[NotificationMessage]) -> list[NotificationResult]:
+        """Send mock emails as one bulk request."""
+        self.batch_sizes.append(len(messages))
+        return [await self.send(m.recipient, m.subject, m.body, m.metadata) for m in messages]
+
 
 class MockWebhookChannel:
     """Mock webhook notification channel for testing."""
@@ -215,6 +282,7 @@ class MockWebhookChannel:
     def __init__(self, should_fail: bool = False) -> None:
         self.should_fail = should_fail
         self.sent_webhooks: list[dict[str, Any]] = []
+        self.batch_sizes: list[int] = []
 
     async def send(
         self,
@@ -248,6 +316,11 @@ class MockWebhookChannel:
             message_id=f"mock-webhook-{uuid7()}",
         )
 
+    async def send_batch(self, messages: list[NotificationMessage]) -> list[NotificationResult]:
+        """Send mock webhooks as one batched request."""
+        self.batch_sizes.append(len(messages))
+        return [await self.send(m.recipient, m.subject, m.body, m.metadata) for m in messages]
+
 
 class MockSMSChannel:
     """Mock SMS notification channel for testing."""
@@ -405,6 +478,32 @@ class GeneratedAlert:
             "delivery_success_rate": self.delivery_success_rate,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "GeneratedAlert":
+        """Create from a dictionary produced by to_dict."""
+
+        def timestamp(key: str) -> datetime | None:
+            value = data.get(key)
+            return datetime.fromisoformat(value) if value else None
+
+        trigger = data.get("escalation_trigger")
+        return cls(
+            alert=MonitoringAlert.from_dict(data["alert"]),
+            status=AlertStatus(data["status"]),
+            notification_results=[
+                NotificationResult.from_dict(r) for r in data.get("notification_results", ())
+            ],
+            escalation_trigger=EscalationTrigger(trigger) if trigger else None,
+            escalated_at=timestamp("escalated_at"),
+            acknowledged_at=timestamp("acknowledged_at"),
+            acknowledged_by=data.get("acknowledged_by"),
+            resolved_at=timestamp("resolved_at"),
+            resolved_by=data.get("resolved_by"),
+            resolution_notes=data.get("resolution_notes"),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+        )
+
 
 # =============================================================================
 # Configuration
@@ -421,7 +520,15 @@ class AlertConfig(BaseModel):
         alert_window_hours: Window for counting multiple alerts
         include_delta_details: Include delta details in notifications
         notification_retry_count: Number of retry attempts
-        notification_retry_delay_seconds: Delay between retries
+        notification_retry_delay_seconds: Delay before the first retry;
+            doubles with each further retry
+        notification_backoff_max_seconds: Upper bound on the retry delay
+        notification_batch_size: Notifications per batch request
+        max_concurrent_sends_per_channel: Concurrent requests per channel
+        notification_dedup_window_hours: Window in which a repeat of the
+            same notification to the same recipient is dropped
+        deliver_immediately: Attempt delivery when an alert is generated;
+            if False, alerts are only enqueued for dispatch_outbox()
     """
 
     auto_escalate_critical: bool = True
@@ -431,6 +538,11 @@ class AlertConfig(BaseModel):
     include_delta_details: bool = True
     notification_retry_count: int = Field(default=3, ge=0, le=10)
     notification_retry_delay_seconds: int = Field(default=60, ge=10, le=3600)
+    notification_backoff_max_seconds: int = Field(default=3600, ge=10, le=86400)
+    notification_batch_size: int = Field(default=100, ge=1, le=1000)
+    max_concurrent_sends_per_channel: int = Field(default=10, ge=1, le=100)
+    notification_dedup_window_hours: int = Field(default=24, ge=0, le=168)
+    deliver_immediately: bool = True
 
 
 # =============================================================================
@@ -448,22 +560,31 @@ class AlertGenerator:
     Attributes:
         config: Alert generator configuration
         channels: Notification channels by type
+        outbox: Durable store for alerts and pending notifications
     """
 
     def __init__(
         self,
         config: AlertConfig | None = None,
         channels: dict[NotificationChannelType, NotificationChannel] | None = None,
+        outbox: AlertOutbox | None = None,
     ) -> None:
         """Initialize the alert generator.
 
         Args:
             config: Optional configuration
             channels: Optional notification channels
+            outbox: Optional outbox storage. Defaults to an in-memory outbox.
         """
         self.config = config or AlertConfig()
         self.channels: dict[NotificationChannelType, NotificationChannel] = channels or {}
-        self._alert_history: list[GeneratedAlert] = []
+        self.outbox: AlertOutbox = (
+            outbox
+            if outbox is not None
+            else InMemoryAlertOutbox(
+                dedup_window=timedelta(hours=self.config.notification_dedup_window_hours)
+            )
+        )
 
     def add_channel(self, channel: NotificationChannel) -> None:
         """Add a notification channel.
@@ -521,15 +642,13 @@ class AlertGenerator:
         )
 
         # Check for escalation conditions
+        recent_alerts = await self._count_recent_alerts(monitoring_config)
         for alert in alerts:
-            self._check_escalation(alert, monitoring_config)
-
-        # Deliver notifications
-        for alert in alerts:
-            await self._deliver_notifications(alert, monitoring_config)
+            self._check_escalation(alert, monitoring_config, recent_alerts)
 
-        # Track in history
-        self._alert_history.extend(alerts)
+        # Persist, then deliver notifications
+        await self.outbox.save_alerts(alerts)
+        await self._deliver_notifications(alerts, monitoring_config)
 
         logger.info(
             "Generated alerts",
@@ -583,10 +702,9 @@ class AlertGenerator:
             if escalation_path:
                 monitoring_alert.escalated_to = list(escalation_path)
 
-        # Deliver notifications
-        await self._deliver_to_recipients(generated, recipients)
-
-        self._alert_history.append(generated)
+        # Persist, then deliver notifications
+        await self.outbox.save_alert(generated)
+        await self._deliver_to_recipients([(generated, list(recipients))])
 
         return generated
 
@@ -676,16 +794,35 @@ class AlertGenerator:
 
         return alerts
 
+    async def _count_recent_alerts(self, config: MonitoringConfig) -> int:
+        """Count the alerts of a monitoring config within the alert window.
+
+        Args:
+            config: Monitoring configuration
+
+        Returns:
+            Number of alerts created within alert_window_hours
+        """
+        window_start = datetime.now(UTC) - timedelta(hours=self.config.alert_window_hours)
+        recent = await self.outbox.list_alerts(
+            config_id=config.config_id,
+            since=window_start,
+            limit=self.config.max_alerts_before_escalation,
+        )
+        return len(recent)
+
     def _check_escalation(
         self,
         alert: GeneratedAlert,
         config: MonitoringConfig,
+        recent_alerts: int,
     ) -> None:
         """Check if alert should be escalated.
 
         Args:
             alert: Alert to check
             config: Monitoring configuration
+            recent_alerts: Earlier alerts of the config within the alert window
         """
         # Auto-escalate critical
         if self.config.auto_escalate_critical and alert.is_critical:
@@ -694,77 +831,327 @@ class AlertGenerator:
             return
 
         # Check for multiple alerts in window
-        window_start = datetime.now(UTC) - timedelta(hours=self.config.alert_window_hours)
-        recent_alerts = [
-            a for a in self._alert_history
-            if a.created_at >= window_start
-            and a.alert.monitoring_config_id == config.config_id
-        ]
-
-        if len(recent_alerts) >= self.config.max_alerts_before_escalation:
+        if recent_alerts >= self.config.max_alerts_before_escalation:
             alert.escalate(EscalationTrigger.MULTIPLE_ALERTS)
             alert.alert.escalated_to = list(config.escalation_path)
 
     async def _deliver_notifications(
         self,
-        alert: GeneratedAlert,
+        alerts: list[GeneratedAlert],
         config: MonitoringConfig,
     ) -> None:
-        """Deliver notifications for an alert.
+        """Deliver notifications for alerts.
 
         Args:
-            alert: Alert to deliver
+            alerts: Alerts to deliver
             config: Monitoring configuration
         """
-        recipients = list(config.alert_recipients)
-        if alert.is_escalated:
-            recipients.extend(config.escalation_path)
+        deliveries = []
+        for alert in alerts:
+            recipients = list(config.alert_recipients)
+            if alert.is_escalated:
+                recipients.extend(config.escalation_path)
+            deliveries.append((alert, recipients))
 
-        await self._deliver_to_recipients(alert, recipients)
+        await self._deliver_to_recipients(deliveries)
 
     async def _deliver_to_recipients(
         self,
-        alert: GeneratedAlert,
-        recipients: list[str],
+        deliveries: list[tuple[GeneratedAlert, list[str]]],
     ) -> None:
-        """Deliver notifications to recipients.
+        """Enqueue notifications for alerts and deliver them.
 
         Args:
-            alert: Alert to deliver
-            recipients: List of recipients
+            deliveries: Alerts with their recipients
         """
         if not self.channels:
             logger.warning("No notification channels configured")
-            alert.status = AlertStatus.PENDING
+            for alert, _ in deliveries:
+                alert.status = AlertStatus.PENDING
+            await self.outbox.save_alerts([alert for alert, _ in deliveries])
             return
 
-        subject = f"[{alert.severity.value.upper()}] {alert.alert.title}"
-        body = self._format_notification_body(alert)
+        entries: list[OutboxEntry] = []
+        for alert, recipients in deliveries:
+            subject = f"[{alert.severity.value.upper()}] {alert.alert.title}"
+            body = self._format_notification_body(alert)
+
+            for recipient in recipients:
+                # Determine channel based on recipient format
+                channel = self._get_channel_for_recipient(recipient)
+                if not channel:
+                    logger.warning("No channel for recipient", recipient=recipient)
+                    continue
+
+                entries.append(
+                    OutboxEntry(
+                        alert_id=alert.alert_id,
+                        channel_type=channel.channel_type,
+                        recipient=recipient,
+                        subject=subject,
+                        body=body,
+                        dedup_key=self._dedup_key(channel.channel_type, recipient, alert),
+                    )
+                )
+
+        immediate = self.config.deliver_immediately
+        entries = await self.outbox.enqueue(entries, claimed=immediate)
+        if immediate:
+            await self._send_entries(entries)
 
-        results: list[NotificationResult] = []
+        await self._update_delivery_status([alert for alert, _ in deliveries])
 
-        for recipient in recipients:
-            # Determine channel based on recipient format
-            channel = self._get_channel_for_recipient(recipient)
-            if not channel:
-                logger.warning("No channel for recipient", recipient=recipient)
-                continue
+    async def dispatch_outbox(self, as_of: datetime | None = None) -> list[OutboxEntry]:
+        """Deliver pending outbox notifications that are due.
 
-            # Send with retries
-            result = await self._send_with_retry(channel, recipient, subject, body)
-            results.append(result)
+        Drains every channel concurrently, in batches, including retries
+        whose backoff has elapsed.
 
-        alert.notification_results = results
+        Args:
+            as_of: Reference time for due notifications. Defaults to now.
 
-        # Update status based on results
-        if not results:
+        Returns:
+            Outbox entries attempted, with their updated status
+        """
+        as_of = as_of or datetime.now(UTC)
+        claim_size = (
+            self.config.notification_batch_size * self.config.max_concurrent_sends_per_channel
+        )
+
+        async def drain(channel_type: NotificationChannelType) -> list[OutboxEntry]:
+            attempted: list[OutboxEntry] = []
+            while entries := await self.outbox.claim_due(channel_type, as_of, claim_size):
+                await self._send_channel(channel_type, entries)
+                attempted.extend(entries)
+            return attempted
+
+        channels = await self.outbox.pending_channels()
+        drained = await asyncio.gather(*(drain(channel_type) for channel_type in channels))
+        attempted = [entry for entries in drained for entry in entries]
+
+        alert_ids = list(dict.fromkeys(entry.alert_id for entry in attempted))
+        await self._update_delivery_status(await self.outbox.get_alerts(alert_ids))
+
+        logger.info(
+            "Outbox dispatched",
+            attempted=len(attempted),
+            delivered=sum(1 for e in attempted if e.status == OutboxStatus.DELIVERED),
+            failed=sum(1 for e in attempted if e.status == OutboxStatus.FAILED),
+        )
+        return attempted
+
+    async def _send_entries(self, entries: list[OutboxEntry]) -> None:
+        """Send outbox entries, concurrently per channel.
+
+        Args:
+            entries: Entries to send
+        """
+        by_channel: dict[NotificationChannelType, list[OutboxEntry]] = {}
+        for entry in entries:
+            by_channel.setdefault(entry.channel_type, []).append(entry)
+
+        await asyncio.gather(
+            *(self._send_channel(channel_type, group) for channel_type, group in by_channel.items())
+        )
+
+    async def _send_channel(
+        self,
+        channel_type: NotificationChannelType,
+        entries: list[OutboxEntry],
+    ) -> None:
+        """Send entries through one channel and record the attempts.
+
+        Channels with send_batch get batches of notification_batch_size;
+        others get one request per notification. Either way at most
+        max_concurrent_sends_per_channel requests are in flight.
+
+        Args:
+            channel_type: Channel to send through
+            entries: Entries for this channel
+        """
+        channel = self.channels.get(channel_type)
+        send_batch = getattr(channel, "send_batch", None)
+        size = self.config.notification_batch_size if send_batch else 1
+        slots = asyncio.Semaphore(self.config.max_concurrent_sends_per_channel)
+
+        async def send(batch: list[OutboxEntry]) -> list[NotificationResult]:
+            if channel is None:
+                return self._failed_results(channel_type, batch, "Channel not configured")
+            messages = [
+                NotificationMessage(
+                    recipient=entry.recipient,
+                    subject=entry.subject,
+                    body=entry.body,
+                    metadata={
+                        "alert_id": str(entry.alert_id),
+                        "idempotency_key": str(entry.entry_id),
+                    },
+                )
+                for entry in batch
+            ]
+            async with slots:
+                try:
+                    if send_batch is not None:
+                        results = list(await send_batch(messages))
+                    else:
+                        message = messages[0]
+                        results = [
+                            await channel.send(
+                                message.recipient, message.subject, message.body, message.metadata
+                            )
+                        ]
+                except Exception as e:
+                    return self._failed_results(channel_type, batch, str(e))
+            if len(results) != len(batch):
+                return self._failed_results(
+                    channel_type, batch, f"Channel returned {len(results)} results"
+                )
+            return results
+
+        batches = [entries[i : i + size] for i in range(0, len(entries), size)]
+        sent = await asyncio.gather(*(send(batch) for batch in batches))
+
+        now = datetime.now(UTC)
+        for batch, results in zip(batches, sent, strict=True):
+            for entry, result in zip(batch, results, strict=True):
+                self._record_attempt(entry, result, now)
+        await self.outbox.save_entries(entries)
+
+    def _record_attempt(
+        self,
+        entry: OutboxEntry,
+        result: NotificationResult,
+        now: datetime,
+    ) -> None:
+        """Apply a delivery result to an outbox entry.
+
+        Args:
+            entry: Entry that was sent
+            result: Delivery result
+            now: Time of the attempt
+        """
+        entry.attempts += 1
+        if result.success:
+            entry.status = OutboxStatus.DELIVERED
+            entry.delivered_at = result.delivered_at
+            entry.message_id = result.message_id
+            entry.last_error = None
+            return
+
+        entry.last_error = result.error
+        if entry.attempts > self.config.notification_retry_count:
+            entry.status = OutboxStatus.FAILED
+            logger.warning(
+                "Notification failed, retries exhausted",
+                recipient=entry.recipient,
+                attempts=entry.attempts,
+                error=result.error,
+            )
+        else:
+            entry.next_attempt_at = now + retry_delay(
+                entry.attempts,
+                self.config.notification_retry_delay_seconds,
+                self.config.notification_backoff_max_seconds,
+            )
+            logger.debug(
+                "Notification failed, will retry",
+                attempt=entry.attempts,
+                recipient=entry.recipient,
+                retry_at=entry.next_attempt_at.isoformat(),
+                error=result.error,
+            )
+
+    async def _update_delivery_status(self, alerts: list[GeneratedAlert]) -> None:
+        """Update alerts' notification results and status from the outbox.
+
+        Reads the entries of every alert in one call and saves the alerts
+        in one transaction.
+
+        Args:
+            alerts: Alerts to update
+        """
+        if not alerts:
+            return
+        entries_by_alert = await self.outbox.get_entries_many([a.alert_id for a in alerts])
+        now = datetime.now(UTC)
+        for alert in alerts:
+            self._apply_entries(alert, entries_by_alert.get(alert.alert_id, []), now)
+        await self.outbox.save_alerts(alerts)
+
+    @staticmethod
+    def _apply_entries(alert: GeneratedAlert, entries: list[OutboxEntry], now: datetime) -> None:
+        """Set an alert's notification results and status from its outbox entries.
+
+        Args:
+            alert: Alert to update
+            entries: The alert's outbox entries
+            now: Time of the update
+        """
+        attempted = [e for e in entries if e.attempts]
+        alert.notification_results = [
+            NotificationResult(
+                channel_type=e.channel_type,
+                recipient=e.recipient,
+                success=e.status == OutboxStatus.DELIVERED,
+                message_id=e.message_id,
+                error=e.last_error,
+                metadata={"attempts": e.attempts, "outbox_status": e.status.value},
+            )
+            for e in attempted
+        ]
+
+        if alert.status in (AlertStatus.ACKNOWLEDGED, AlertStatus.RESOLVED):
+            return
+
+        delivered = sum(1 for e in entries if e.status == OutboxStatus.DELIVERED)
+        if not attempted:
             alert.status = AlertStatus.PENDING
-        elif all(r.success for r in results):
+        elif delivered == len(entries):
             alert.status = AlertStatus.DELIVERED
-        elif any(r.success for r in results):
+        elif delivered:
             alert.status = AlertStatus.PARTIALLY_DELIVERED
         else:
             alert.status = AlertStatus.FAILED
+        alert.updated_at = now
+
+    @staticmethod
+    def _failed_results(
+        channel_type: NotificationChannelType,
+        entries: list[OutboxEntry],
+        error: str,
+    ) -> list[NotificationResult]:
+        return [
+            NotificationResult(
+                channel_type=channel_type,
+                recipient=entry.recipient,
+                success=False,
+                error=error,
+            )
+            for entry in entries
+        ]
+
+    @staticmethod
+    def _dedup_key(
+        channel_type: NotificationChannelType,
+        recipient: str,
+        alert: GeneratedAlert,
+    ) -> str:
+        """Build the key that identifies repeats of a notification.
+
+        The same deltas sent to the same recipient over the same channel
+        are one notification, whichever alert carries them.
+
+        Args:
+            channel_type: Delivery channel
+            recipient: Recipient identifier
+            alert: Alert being delivered
+
+        Returns:
+            Hex digest
+        """
+        subject_ids = sorted(map(str, alert.alert.delta_ids)) or [str(alert.alert_id)]
+        key = "|".join([channel_type.value, recipient.strip().lower(), *subject_ids])
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
 
     def _get_channel_for_recipient(self, recipient: str) -> NotificationChannel | None:
         """Determine the appropriate channel for a recipient.
@@ -786,49 +1173,6 @@ class AlertGenerator:
         # Default to email if available
         return self.channels.get(NotificationChannelType.EMAIL)
 
-    async def _send_with_retry(
-        self,
-        channel: NotificationChannel,
-        recipient: str,
-        subject: str,
-        body: str,
-    ) -> NotificationResult:
-        """Send notification with retry logic.
-
-        Args:
-            channel: Notification channel
-            recipient: Recipient
-            subject: Subject
-            body: Body
-
-        Returns:
-            Final notification result
-        """
-        last_result: NotificationResult | None = None
-
-        for attempt in range(self.config.notification_retry_count + 1):
-            result = await channel.send(recipient, subject, body)
-            last_result = result
-
-            if result.success:
-                return result
-
-            if attempt < self.config.notification_retry_count:
-                # In production, would use asyncio.sleep
-                logger.debug(
-                    "Notification failed, will retry",
-                    attempt=attempt + 1,
-                    recipient=recipient,
-                    error=result.error,
-                )
-
-        return last_result or NotificationResult(
-            channel_type=channel.channel_type,
-            recipient=recipient,
-            success=False,
-            error="Max retries exceeded",
-        )
-
     def _generate_title(self, delta: ProfileDelta) -> str:
         """Generate alert title from delta.
 
@@ -912,53 +1256,51 @@ class AlertGenerator:
 
         return "\n".join(lines)
 
-    def get_alert_history(
+    async def get_alert_history(
         self,
         config_id: UUID | None = None,
         limit: int = 100,
     ) -> list[GeneratedAlert]:
-        """Get alert history.
+        """Get alert history from the outbox.
 
         Args:
             config_id: Optional filter by config ID
             limit: Maximum alerts to return
 
         Returns:
-            List of generated alerts
+            List of generated alerts, most recent first
         """
-        alerts = self._alert_history
-        if config_id:
-            alerts = [a for a in alerts if a.alert.monitoring_config_id == config_id]
+        return await self.outbox.list_alerts(config_id=config_id, limit=limit)
 
-        # Sort by created_at descending
-        alerts = sorted(alerts, key=lambda a: a.created_at, reverse=True)
-        return alerts[:limit]
-
-    def get_pending_alerts(self) -> list[GeneratedAlert]:
+    async def get_pending_alerts(self) -> list[GeneratedAlert]:
         """Get alerts pending acknowledgment.
 
         Returns:
             List of pending alerts
         """
-        return [a for a in self._alert_history if a.status == AlertStatus.PENDING]
+        return await self.outbox.list_alerts(statuses=[AlertStatus.PENDING])
 
-    def get_unresolved_alerts(self) -> list[GeneratedAlert]:
+    async def get_unresolved_alerts(self) -> list[GeneratedAlert]:
         """Get unresolved alerts.
 
         Returns:
             List of unresolved alerts (not resolved or acknowledged)
         """
         resolved_statuses = {AlertStatus.RESOLVED, AlertStatus.ACKNOWLEDGED}
-        return [a for a in self._alert_history if a.status not in resolved_statuses]
+        return await self.outbox.list_alerts(
+            statuses=[s for s in AlertStatus if s not in resolved_statuses]
+        )
 
     def clear_history(self) -> int:
-        """Clear alert history.
+        """Clear alert history kept in an in-memory outbox (for testing).
 
         Returns:
             Number of alerts cleared
         """
-        count = len(self._alert_history)
-        self._alert_history.clear()
+        if not isinstance(self.outbox, InMemoryAlertOutbox):
+            return 0
+        count = len(self.outbox)
+        self.outbox.clear()
         return count
 
 
@@ -970,17 +1312,19 @@ class AlertGenerator:
 def create_alert_generator(
     config: AlertConfig | None = None,
     include_mock_channels: bool = False,
+    outbox: AlertOutbox | None = None,
 ) -> AlertGenerator:
     """Create an alert generator.
 
     Args:
         config: Optional configuration
         include_mock_channels: Add mock channels for testing
+        outbox: Optional outbox storage. Defaults to an in-memory outbox.
 
     Returns:
         Configured AlertGenerator instance
     """
-    generator = AlertGenerator(config=config)
+    generator = AlertGenerator(config=config, outbox=outbox)
 
     if include_mock_channels:
         generator.add_channel(MockEmailChannel())
@@ -0,0 +1,666 @@
+"""Durable outbox for monitoring alert notifications.
+
+Alerts are persisted together with one outbox entry per notification
+before anything is sent. The AlertGenerator then delivers entries per
+channel, batching where the channel supports it, and writes each attempt
+back to the outbox: delivered entries are done, failed ones are
+rescheduled with exponential backoff until their retries run out.
+
+Entries carry a deduplication key, so the same change is not sent to the
+same recipient twice even when it is alerted more than once (for example
+a recipient on both the alert list and the escalation path).
+
+Delivered and failed entries are kept for reporting until prune() removes
+them, together with alerts left without entries; the application's
+OutboxDispatcher (elile.core.outbox) dispatches and prunes the outbox in
+the background. The outbox is also where alert history is read from.
+
+Classes:
+    OutboxStatus: Delivery status of an outbox entry
+    OutboxEntry: One notification to deliver
+    AlertOutbox: Protocol for outbox storage
+    InMemoryAlertOutbox: In-memory outbox implementation
+    SQLAlchemyAlertOutbox: Outbox stored in the database
+"""
+
+import heapq
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Protocol
+from uuid import UUID, uuid7
+
+from sqlalchemy import and_, delete, exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from elile.db.models.outbox import OutboxAlert, OutboxMessage
+from elile.db.repositories.outbox import OutboxRepository, as_utc
+
+if TYPE_CHECKING:
+    from elile.monitoring.alert_generator import (
+        AlertStatus,
+        GeneratedAlert,
+        NotificationChannelType,
+    )
+
+
+class OutboxStatus(str, Enum):
+    """Delivery status of an outbox entry."""
+
+    PENDING = "pending"  # Waiting for its first or next attempt
+    DELIVERED = "delivered"  # Sent successfully
+    FAILED = "failed"  # Retries exhausted
+
+
+@dataclass
+class OutboxEntry:
+    """A notification waiting in the outbox.
+
+    Attributes:
+        alert_id: Alert the notification belongs to
+        channel_type: Channel to deliver through
+        recipient: Recipient identifier
+        subject: Notification subject
+        body: Notification body
+        dedup_key: Key identifying duplicate notifications
+        entry_id: Unique identifier for this entry
+        status: Delivery status
+        attempts: Delivery attempts made so far
+        next_attempt_at: Earliest time of the next attempt
+        last_error: Error from the last failed attempt
+        message_id: External message ID once delivered
+        created_at: When the entry was enqueued
+        delivered_at: When the entry was delivered
+    """
+
+    alert_id: UUID
+    channel_type: "NotificationChannelType"
+    recipient: str
+    subject: str
+    body: str
+    dedup_key: str
+    entry_id: UUID = field(default_factory=uuid7)
+    status: OutboxStatus = OutboxStatus.PENDING
+    attempts: int = 0
+    next_attempt_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    last_error: str | None = None
+    message_id: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    delivered_at: datetime | None = None
+
+    @property
+    def is_final(self) -> bool:
+        """Check if the entry needs no further attempts."""
+        return self.status != OutboxStatus.PENDING
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "entry_id": str(self.entry_id),
+            "alert_id": str(self.alert_id),
+            "channel_type": self.channel_type.value,
+            "recipient": self.recipient,
+            "subject": self.subject,
+            "dedup_key": self.dedup_key,
+            "status": self.status.value,
+            "attempts": self.attempts,
+            "next_attempt_at": self.next_attempt_at.isoformat(),
+            "last_error": self.last_error,
+            "message_id": self.message_id,
+            "created_at": self.created_at.isoformat(),
+            "delivered_at": self.delivered_at.isoformat() if self.delivered_at else None,
+        }
+
+
+class AlertOutbox(Protocol):
+    """Protocol for alert and notification outbox storage."""
+
+    async def save_alert(self, alert: "GeneratedAlert") -> None:
+        """Save an alert."""
+        ...
+
+    async def save_alerts(self, alerts: list["GeneratedAlert"]) -> None:
+        """Save alerts in one transaction."""
+        ...
+
+    async def get_alert(self, alert_id: UUID) -> "GeneratedAlert | None":
+        """Get an alert by ID."""
+        ...
+
+    async def get_alerts(self, alert_ids: Collection[UUID]) -> list["GeneratedAlert"]:
+        """Get the alerts with the given IDs that exist."""
+        ...
+
+    async def list_alerts(
+        self,
+        *,
+        config_id: UUID | None = None,
+        statuses: Collection["AlertStatus"] | None = None,
+        since: datetime | None = None,
+        limit: int | None = None,
+    ) -> list["GeneratedAlert"]:
+        """Get alerts, most recent first.
+
+        Args:
+            config_id: Only alerts of this monitoring config
+            statuses: Only alerts with one of these statuses
+            since: Only alerts created at or after this time
+            limit: Maximum alerts to return
+        """
+        ...
+
+    async def enqueue(
+        self,
+        entries: list[OutboxEntry],
+        *,
+        claimed: bool = False,
+    ) -> list[OutboxEntry]:
+        """Add entries, dropping duplicates of recently enqueued ones.
+
+        Args:
+            entries: Entries to add
+            claimed: Keep the entries out of claim_due until they are saved
+                back, because the caller is delivering them now
+
+        Returns:
+            The entries that were added
+        """
+        ...
+
+    async def claim_due(
+        self,
+        channel_type: "NotificationChannelType",
+        as_of: datetime,
+        limit: int,
+    ) -> list[OutboxEntry]:
+        """Claim pending entries due by ``as_of``, earliest first.
+
+        Claimed entries are not returned again until saved back as pending.
+        """
+        ...
+
+    async def save_entries(self, entries: list[OutboxEntry]) -> None:
+        """Save entries after a delivery attempt."""
+        ...
+
+    async def get_entries(self, alert_id: UUID) -> list[OutboxEntry]:
+        """Get the entries of an alert."""
+        ...
+
+    async def get_entries_many(self, alert_ids: Collection[UUID]) -> dict[UUID, list[OutboxEntry]]:
+        """Get the entries of several alerts, by alert ID."""
+        ...
+
+    async def pending_channels(self) -> list["NotificationChannelType"]:
+        """Get channels with pending entries."""
+        ...
+
+    async def prune(self, before: datetime) -> int:
+        """Delete delivered and failed entries that finished before ``before``.
+
+        Alerts last updated before ``before`` that have no entries left
+        are deleted too.
+
+        Returns:
+            Number of entries deleted
+        """
+        ...
+
+
+class InMemoryAlertOutbox:
+    """In-memory implementation of AlertOutbox for testing.
+
+    Pending entries are kept in one heap per channel, keyed on
+    next_attempt_at; heap items left behind by a later save are skipped.
+    Finished entries stay until pruned, along with alerts that have no
+    entries left.
+    """
+
+    def __init__(self, dedup_window: timedelta = timedelta(hours=24)) -> None:
+        """Initialize the outbox.
+
+        Args:
+            dedup_window: How long a dedup key suppresses repeat entries
+        """
+        self.dedup_window = dedup_window
+        self._alerts: dict[UUID, GeneratedAlert] = {}
+        self._entries: dict[UUID, OutboxEntry] = {}
+        self._by_alert: dict[UUID, list[UUID]] = {}
+        self._dedup: dict[str, datetime] = {}
+        self._finished: dict[UUID, datetime] = {}
+        self._due: dict[NotificationChannelType, list[tuple[datetime, int, UUID]]] = {}
+        self._scheduled: dict[UUID, int] = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        """Get the number of stored alerts."""
+        return len(self._alerts)
+
+    def clear(self) -> None:
+        """Delete all alerts and entries."""
+        for index in (
+            self._alerts,
+            self._entries,
+            self._by_alert,
+            self._dedup,
+            self._finished,
+            self._due,
+            self._scheduled,
+        ):
+            index.clear()
+
+    async def save_alert(self, alert: "GeneratedAlert") -> None:
+        """Save an alert."""
+        self._alerts[alert.alert_id] = alert
+
+    async def save_alerts(self, alerts: list["GeneratedAlert"]) -> None:
+        """Save alerts."""
+        for alert in alerts:
+            self._alerts[alert.alert_id] = alert
+
+    async def get_alert(self, alert_id: UUID) -> "GeneratedAlert | None":
+        """Get an alert by ID."""
+        return self._alerts.get(alert_id)
+
+    async def get_alerts(self, alert_ids: Collection[UUID]) -> list["GeneratedAlert"]:
+        """Get the alerts with the given IDs that exist."""
+        return [self._alerts[i] for i in alert_ids if i in self._alerts]
+
+    async def list_alerts(
+        self,
+        *,
+        config_id: UUID | None = None,
+        statuses: Collection["AlertStatus"] | None = None,
+        since: datetime | None = None,
+        limit: int | None = None,
+    ) -> list["GeneratedAlert"]:
+        """Get alerts, most recent first."""
+        found = [
+            alert
+            for alert in self._alerts.values()
+            if (config_id is None or alert.alert.monitoring_config_id == config_id)
+            and (statuses is None or alert.status in statuses)
+            and (since is None or alert.created_at >= since)
+        ]
+        found.sort(key=lambda alert: (alert.created_at, alert.alert_id), reverse=True)
+        return found[:limit]
+
+    async def enqueue(
+        self,
+        entries: list[OutboxEntry],
+        *,
+        claimed: bool = False,
+    ) -> list[OutboxEntry]:
+        """Add entries, dropping duplicates of recently enqueued ones."""
+        added = []
+        for entry in entries:
+            seen_at = self._dedup.get(entry.dedup_key)
+            if seen_at is not None and entry.created_at - seen_at < self.dedup_window:
+                continue
+            self._dedup[entry.dedup_key] = entry.created_at
+            self._entries[entry.entry_id] = entry
+            self._by_alert.setdefault(entry.alert_id, []).append(entry.entry_id)
+            if not claimed:
+                self._schedule(entry)
+            added.append(entry)
+        return added
+
+    async def claim_due(
+        self,
+        channel_type: "NotificationChannelType",
+        as_of: datetime,
+        limit: int,
+    ) -> list[OutboxEntry]:
+        """Claim pending entries due by ``as_of``, earliest first."""
+        heap = self._due.get(channel_type, [])
+        claimed: list[OutboxEntry] = []
+        while heap and heap[0][0] <= as_of and len(claimed) < limit:
+            _, sequence, entry_id = heapq.heappop(heap)
+            if self._scheduled.get(entry_id) != sequence:
+                continue  # Superseded by a later save
+            del self._scheduled[entry_id]
+            claimed.append(self._entries[entry_id])
+        return claimed
+
+    async def save_entries(self, entries: list[OutboxEntry]) -> None:
+        """Save entries after a delivery attempt."""
+        now = datetime.now(UTC)
+        for entry in entries:
+            self._entries[entry.entry_id] = entry
+            if entry.is_final:
+                self._scheduled.pop(entry.entry_id, None)
+                self._finished[entry.entry_id] = entry.delivered_at or now
+            else:
+                self._schedule(entry)
+
+    async def get_entries(self, alert_id: UUID) -> list[OutboxEntry]:
+        """Get the entries of an alert."""
+        return [self._entries[entry_id] for entry_id in self._by_alert.get(alert_id, ())]
+
+    async def get_entries_many(self, alert_ids: Collection[UUID]) -> dict[UUID, list[OutboxEntry]]:
+        """Get the entries of several alerts, by alert ID."""
+        return {alert_id: await self.get_entries(alert_id) for alert_id in alert_ids}
+
+    async def pending_channels(self) -> list["NotificationChannelType"]:
+        """Get channels with pending entries."""
+        return [channel_type for channel_type, heap in self._due.items() if heap]
+
+    async def prune(self, before: datetime) -> int:
+        """Delete delivered and failed entries that finished before ``before``."""
+        pruned = [entry_id for entry_id, at in self._finished.items() if at < before]
+        alert_ids = set()
+        for entry_id in pruned:
+            del self._finished[entry_id]
+            alert_ids.add(self._entries.pop(entry_id).alert_id)
+        for alert_id in alert_ids:
+            remaining = [e for e in self._by_alert[alert_id] if e in self._entries]
+            if remaining:
+                self._by_alert[alert_id] = remaining
+            else:
+                del self._by_alert[alert_id]
+                self._alerts.pop(alert_id, None)
+        for alert_id in [
+            alert_id
+            for alert_id, alert in self._alerts.items()
+            if alert_id not in self._by_alert and alert.updated_at < before
+        ]:
+            del self._alerts[alert_id]
+
+        expired = datetime.now(UTC) - self.dedup_window
+        self._dedup = {key: at for key, at in self._dedup.items() if at >= expired}
+        return len(pruned)
+
+    def entries(self, statuses: Iterable[OutboxStatus] | None = None) -> list[OutboxEntry]:
+        """Get all entries, optionally filtered by status.
+
+        Args:
+            statuses: Statuses to include, or None for all
+
+        Returns:
+            Entries in enqueue order
+        """
+        wanted = set(statuses) if statuses is not None else None
+        return [e for e in self._entries.values() if wanted is None or e.status in wanted]
+
+    def _schedule(self, entry: OutboxEntry) -> None:
+        self._sequence += 1
+        self._scheduled[entry.entry_id] = self._sequence
+        heapq.heappush(
+            self._due.setdefault(entry.channel_type, []),
+            (entry.next_attempt_at, self._sequence, entry.entry_id),
+        )
+
+
+class SQLAlchemyAlertOutbox:
+    """AlertOutbox stored in the outbox_messages and outbox_alerts tables.
+
+    Pending entries survive a restart and can be dispatched by any process.
+    A claim is a lease: an entry claimed by a process that died before
+    saving it back is claimed again once ``claim_lease`` has passed.
+
+    Attributes:
+        topic: Topic of the outbox's rows in outbox_messages
+    """
+
+    topic = "monitoring.alerts"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        dedup_window: timedelta = timedelta(hours=24),
+        claim_lease: timedelta = timedelta(minutes=5),
+    ) -> None:
+        """Initialize the outbox.
+
+        Args:
+            session_factory: Factory for database sessions
+            dedup_window: How long a dedup key suppresses repeat entries
+            claim_lease: How long a claim holds if the entry is not saved back
+        """
+        self.session_factory = session_factory
+        self.dedup_window = dedup_window
+        self.claim_lease = claim_lease
+
+    async def save_alert(self, alert: "GeneratedAlert") -> None:
+        """Save an alert."""
+        await self.save_alerts([alert])
+
+    async def save_alerts(self, alerts: list["GeneratedAlert"]) -> None:
+        """Save alerts in one transaction."""
+        if not alerts:
+            return
+        async with self.session_factory() as session:
+            existing = set(
+                (
+                    await session.execute(
+                        select(OutboxAlert.alert_id).where(
+                            OutboxAlert.alert_id.in_([a.alert_id for a in alerts])
+                        )
+                    )
+                ).scalars()
+            )
+            values = [self._alert_values(a) for a in alerts if a.alert_id in existing]
+            if values:
+                await session.execute(update(OutboxAlert), values)
+            session.add_all(
+                OutboxAlert(**self._alert_values(a)) for a in alerts if a.alert_id not in existing
+            )
+            await session.commit()
+
+    async def get_alert(self, alert_id: UUID) -> "GeneratedAlert | None":
+        """Get an alert by ID."""
+        alerts = await self.get_alerts([alert_id])
+        return alerts[0] if alerts else None
+
+    async def get_alerts(self, alert_ids: Collection[UUID]) -> list["GeneratedAlert"]:
+        """Get the alerts with the given IDs that exist."""
+        if not alert_ids:
+            return []
+        return await self._fetch_alerts(
+            select(OutboxAlert).where(OutboxAlert.alert_id.in_(alert_ids))
+        )
+
+    async def list_alerts(
+        self,
+        *,
+        config_id: UUID | None = None,
+        statuses: Collection["AlertStatus"] | None = None,
+        since: datetime | None = None,
+        limit: int | None = None,
+    ) -> list["GeneratedAlert"]:
+        """Get alerts, most recent first."""
+        stmt = select(OutboxAlert).order_by(
+            OutboxAlert.created_at.desc(), OutboxAlert.alert_id.desc()
+        )
+        if config_id is not None:
+            stmt = stmt.where(OutboxAlert.monitoring_config_id == config_id)
+        if statuses is not None:
+            stmt = stmt.where(OutboxAlert.status.in_([s.value for s in statuses]))
+        if since is not None:
+            stmt = stmt.where(OutboxAlert.created_at >= since)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return await self._fetch_alerts(stmt)
+
+    async def enqueue(
+        self,
+        entries: list[OutboxEntry],
+        *,
+        claimed: bool = False,
+    ) -> list[OutboxEntry]:
+        """Add entries, dropping duplicates of recently enqueued ones."""
+        if not entries:
+            return []
+        claimed_until = datetime.now(UTC) + self.claim_lease if claimed else None
+        async with self.session_factory() as session:
+            seen = await OutboxRepository(session).latest_by_key(
+                self.topic,
+                {entry.dedup_key for entry in entries},
+                since=min(entry.created_at for entry in entries) - self.dedup_window,
+            )
+            seen = {key: as_utc(at) for key, at in seen.items()}
+            added = []
+            for entry in entries:
+                seen_at = seen.get(entry.dedup_key)
+                if seen_at is not None and entry.created_at - seen_at < self.dedup_window:
+                    continue
+                seen[entry.dedup_key] = entry.created_at
+                session.add(self._to_row(entry, claimed_until))
+                added.append(entry)
+            await session.commit()
+        return added
+
+    async def claim_due(
+        self,
+        channel_type: "NotificationChannelType",
+        as_of: datetime,
+        limit: int,
+    ) -> list[OutboxEntry]:
+        """Claim pending entries due by ``as_of``, earliest first."""
+        now = datetime.now(UTC)
+        async with self.session_factory() as session:
+            rows = await OutboxRepository(session).claim_due(
+                self.topic,
+                channel_type.value,
+                as_of,
+                limit,
+                now=now,
+                lease_until=now + self.claim_lease,
+            )
+            entries = [self._from_row(row) for row in rows]
+            await session.commit()
+        return entries
+
+    async def save_entries(self, entries: list[OutboxEntry]) -> None:
+        """Save entries after a delivery attempt, releasing their claims."""
+        now = datetime.now(UTC)
+        values = [
+            {
+                "message_id": entry.entry_id,
+                "status": entry.status.value,
+                "attempts": entry.attempts,
+                "next_attempt_at": entry.next_attempt_at,
+                "claimed_until": None,
+                "last_error": entry.last_error,
+                "payload": self._payload(entry),
+                "finished_at": (entry.delivered_at or now) if entry.is_final else None,
+            }
+            for entry in entries
+        ]
+        async with self.session_factory() as session:
+            await OutboxRepository(session).update_many(values)
+            await session.commit()
+
+    async def get_entries(self, alert_id: UUID) -> list[OutboxEntry]:
+        """Get the entries of an alert."""
+        async with self.session_factory() as session:
+            rows = await OutboxRepository(session).list_by_reference(self.topic, alert_id)
+            return [self._from_row(row) for row in rows]
+
+    async def get_entries_many(self, alert_ids: Collection[UUID]) -> dict[UUID, list[OutboxEntry]]:
+        """Get the entries of several alerts, by alert ID, in one query."""
+        found: dict[UUID, list[OutboxEntry]] = {alert_id: [] for alert_id in alert_ids}
+        async with self.session_factory() as session:
+            rows = await OutboxRepository(session).list_by_references(self.topic, found)
+        for row in rows:
+            found[row.reference_id].append(self._from_row(row))
+        return found
+
+    async def pending_channels(self) -> list["NotificationChannelType"]:
+        """Get channels with pending entries."""
+        from elile.monitoring.alert_generator import NotificationChannelType
+
+        async with self.session_factory() as session:
+            partitions = await OutboxRepository(session).pending_partitions(
+                self.topic, datetime.now(UTC)
+            )
+        return [NotificationChannelType(partition) for partition in partitions]
+
+    async def prune(self, before: datetime) -> int:
+        """Delete delivered and failed entries that finished before ``before``.
+
+        Alerts last updated before ``before`` that have no entries left
+        are deleted too.
+        """
+        has_entries = exists().where(
+            and_(
+                OutboxMessage.topic == self.topic,
+                OutboxMessage.reference_id == OutboxAlert.alert_id,
+            )
+        )
+        async with self.session_factory() as session:
+            pruned = await OutboxRepository(session).prune(self.topic, before)
+            await session.execute(
+                delete(OutboxAlert).where(OutboxAlert.updated_at < before, ~has_entries)
+            )
+            await session.commit()
+        return pruned
+
+    async def _fetch_alerts(self, stmt: Any) -> list["GeneratedAlert"]:
+        from elile.monitoring.alert_generator import GeneratedAlert
+
+        async with self.session_factory() as session:
+            rows = (await session.execute(stmt)).scalars().all()
+        return [GeneratedAlert.from_dict(row.payload) for row in rows]
+
+    @staticmethod
+    def _alert_values(alert: "GeneratedAlert") -> dict[str, Any]:
+        return {
+            "alert_id": alert.alert_id,
+            "monitoring_config_id": alert.alert.monitoring_config_id,
+            "status": alert.status.value,
+            "payload": alert.to_dict(),
+            "created_at": alert.created_at,
+            "updated_at": alert.updated_at,
+        }
+
+    @staticmethod
+    def _payload(entry: OutboxEntry) -> dict[str, Any]:
+        return {
+            "recipient": entry.recipient,
+            "subject": entry.subject,
+            "body": entry.body,
+            "message_id": entry.message_id,
+            "delivered_at": entry.delivered_at.isoformat() if entry.delivered_at else None,
+        }
+
+    def _to_row(self, entry: OutboxEntry, claimed_until: datetime | None) -> OutboxMessage:
+        return OutboxMessage(
+            message_id=entry.entry_id,
+            topic=self.topic,
+            partition=entry.channel_type.value,
+            status=entry.status.value,
+            key=entry.dedup_key,
+            reference_id=entry.alert_id,
+            attempts=entry.attempts,
+            next_attempt_at=entry.next_attempt_at,
+            claimed_until=claimed_until,
+            last_error=entry.last_error,
+            payload=self._payload(entry),
+            created_at=entry.created_at,
+        )
+
+    @staticmethod
+    def _from_row(row: OutboxMessage) -> OutboxEntry:
+        from elile.monitoring.alert_generator import NotificationChannelType
+
+        payload = row.payload
+        delivered_at = payload.get("delivered_at")
+        return OutboxEntry(
+            alert_id=row.reference_id,
+            channel_type=NotificationChannelType(row.partition),
+            recipient=payload["recipient"],
+            subject=payload["subject"],
+            body=payload["body"],
+            dedup_key=row.key,
+            entry_id=row.message_id,
+            status=OutboxStatus(row.status),
+            attempts=row.attempts,
+            next_attempt_at=as_utc(row.next_attempt_at),
+            last_error=row.last_error,
+            message_id=payload.get("message_id"),
+            created_at=as_utc(row.created_at),
+            delivered_at=datetime.fromisoformat(delivered_at) if delivered_at else None,
+        )
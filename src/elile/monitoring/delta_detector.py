@@ -13,6 +13,8 @@ Classes:
     DeltaDetector: Main delta detection class
 """
 
+from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -23,6 +25,12 @@ from pydantic import BaseModel, Field
 
 from elile.core.logging import get_logger
 from elile.investigation.finding_extractor import Finding, Severity
+from elile.monitoring.fingerprints import (
+    ProfileDigest,
+    compute_profile_digest,
+    finding_fingerprint,
+    finding_key,
+)
 from elile.monitoring.types import DeltaSeverity, ProfileDelta
 from elile.risk.risk_scorer import RiskLevel, RiskScore
 
@@ -182,6 +190,8 @@ class DeltaResult:
         has_escalation: Whether any escalation was detected
         requires_review: Whether human review is recommended
         summary: Human-readable summary of changes
+        current_digest: Content digest of the current profile, to store
+            with the new profile version
     """
 
     result_id: UUID = field(default_factory=uuid7)
@@ -209,6 +219,9 @@ class DeltaResult:
     requires_review: bool = False
     summary: str = ""
 
+    # Content digest of the current profile
+    current_digest: ProfileDigest | None = None
+
     @property
     def has_changes(self) -> bool:
         """Check if any changes were detected."""
@@ -254,6 +267,7 @@ class DeltaResult:
             "summary": self.summary,
             "has_changes": self.has_changes,
             "total_changes": self.total_changes,
+            "current_digest": self.current_digest.to_dict() if self.current_digest else None,
         }
 
 
@@ -331,6 +345,12 @@ class DeltaDetector:
     It generates ProfileDelta objects suitable for alerting and assigns
     severity levels based on the nature of changes.
 
+    Findings are paired by ID, then by content fingerprint, then by
+    identity key, so a re-screen that mints new finding IDs does not report
+    every finding as new and resolved. Each profile's content digest is
+    compared first: an unchanged profile skips comparison entirely, and a
+    changed one is only compared under the subtrees whose digest differs.
+
     Attributes:
         config: Detector configuration
     """
@@ -354,6 +374,7 @@ class DeltaDetector:
         entity_id: UUID | None = None,
         baseline_profile_id: UUID | None = None,
         current_profile_id: UUID | None = None,
+        baseline_digest: ProfileDigest | None = None,
     ) -> DeltaResult:
         """Detect all deltas between baseline and current state.
 
@@ -367,30 +388,57 @@ class DeltaDetector:
             entity_id: Entity being compared
             baseline_profile_id: ID of baseline profile
             current_profile_id: ID of current profile
+            baseline_digest: Digest stored with the baseline profile. Computed
+                from the baseline arguments if not provided.
 
         Returns:
             DeltaResult with all detected changes and generated deltas
         """
+        current_digest = compute_profile_digest(
+            current_findings, current_risk_score, current_connections
+        )
+        if baseline_digest is None:
+            baseline_digest = compute_profile_digest(
+                baseline_findings, baseline_risk_score, baseline_connections
+            )
+
         result = DeltaResult(
             entity_id=entity_id,
             baseline_profile_id=baseline_profile_id,
             current_profile_id=current_profile_id,
+            current_digest=current_digest,
         )
 
+        if baseline_digest.root == current_digest.root:
+            result.summary = self._generate_summary(result)
+            logger.debug(
+                "Profile unchanged, skipping delta detection",
+                entity_id=str(entity_id) if entity_id else None,
+            )
+            return result
+
         # Compare findings
-        new, resolved, changed = self._compare_findings(baseline_findings, current_findings)
-        result.new_findings = new
-        result.resolved_findings = resolved
-        result.changed_findings = changed
+        if baseline_digest.findings != current_digest.findings:
+            new, resolved, changed = self._compare_findings(baseline_findings, current_findings)
+            result.new_findings = new
+            result.resolved_findings = resolved
+            result.changed_findings = changed
 
         # Compare risk scores
-        if baseline_risk_score and current_risk_score:
+        if (
+            baseline_risk_score
+            and current_risk_score
+            and baseline_digest.risk_score != current_digest.risk_score
+        ):
             result.risk_score_change = self._compare_risk_scores(
                 baseline_risk_score, current_risk_score
             )
 
         # Compare connections (handle case where one list is empty but provided)
-        if self.config.compare_connections:
+        if (
+            self.config.compare_connections
+            and baseline_digest.connections != current_digest.connections
+        ):
             baseline_conns = baseline_connections if baseline_connections is not None else []
             current_conns = current_connections if current_connections is not None else []
             if baseline_conns or current_conns:
@@ -434,25 +482,31 @@ class DeltaDetector:
         Returns:
             Tuple of (new_findings, resolved_findings, changed_findings)
         """
-        baseline_by_id = {f.finding_id: f for f in baseline}
+        # Pair findings by ID, then identical content, then identity key
         current_by_id = {f.finding_id: f for f in current}
+        pairs: list[tuple[Finding, Finding]] = []
+        unmatched_baseline: list[Finding] = []
+        for old_finding in baseline:
+            new_finding = current_by_id.pop(old_finding.finding_id, None)
+            if new_finding is None:
+                unmatched_baseline.append(old_finding)
+            else:
+                pairs.append((old_finding, new_finding))
+        unmatched_current = [f for f in current if f.finding_id in current_by_id]
 
-        baseline_ids = set(baseline_by_id.keys())
-        current_ids = set(current_by_id.keys())
-
-        # New findings (in current but not baseline)
-        new_findings = [current_by_id[fid] for fid in (current_ids - baseline_ids)]
-
-        # Resolved findings (in baseline but not current)
-        resolved_findings = [baseline_by_id[fid] for fid in (baseline_ids - current_ids)]
+        unmatched_baseline, unmatched_current, _ = self._pair_findings(
+            unmatched_baseline, unmatched_current, finding_fingerprint
+        )
+        resolved_findings, new_findings, keyed_pairs = self._pair_findings(
+            unmatched_baseline, unmatched_current, finding_key
+        )
+        pairs.extend(keyed_pairs)
 
         # Changed findings (in both, check for changes)
         changed_findings: list[FindingChange] = []
-        common_ids = baseline_ids & current_ids
 
-        for fid in common_ids:
-            old_finding = baseline_by_id[fid]
-            new_finding = current_by_id[fid]
+        for old_finding, new_finding in pairs:
+            fid = new_finding.finding_id
 
             # Check severity change
             if old_finding.severity != new_finding.severity:
@@ -493,6 +547,43 @@ class DeltaDetector:
 
         return new_findings, resolved_findings, changed_findings
 
+    @staticmethod
+    def _pair_findings(
+        baseline: list[Finding],
+        current: list[Finding],
+        key: Callable[[Finding], str],
+    ) -> tuple[list[Finding], list[Finding], list[tuple[Finding, Finding]]]:
+        """Pair baseline and current findings that share a key.
+
+        Args:
+            baseline: Unpaired baseline findings
+            current: Unpaired current findings
+            key: Function giving each finding's pairing key
+
+        Returns:
+            Tuple of (unpaired_baseline, unpaired_current, pairs), each in
+            input order
+        """
+        if not baseline or not current:
+            return baseline, current, []
+
+        by_key: dict[str, list[Finding]] = defaultdict(list)
+        for finding in baseline:
+            by_key[key(finding)].append(finding)
+
+        pairs: list[tuple[Finding, Finding]] = []
+        unpaired_current: list[Finding] = []
+        for finding in current:
+            candidates = by_key.get(key(finding))
+            if candidates:
+                pairs.append((candidates.pop(0), finding))
+            else:
+                unpaired_current.append(finding)
+
+        paired = {id(old_finding) for old_finding, _ in pairs}
+        unpaired_baseline = [f for f in baseline if id(f) not in paired]
+        return unpaired_baseline, unpaired_current, pairs
+
     def _compare_risk_scores(
         self,
         baseline: RiskScore,
@@ -0,0 +1,206 @@
+"""Content fingerprints for monitoring delta detection.
+
+A re-screen mints new IDs for every finding, so comparing profiles by ID
+reports each finding as both new and resolved. Fingerprints hash what a
+finding, connection or risk score says rather than which record holds it:
+
+- finding_key: identity of a finding (type, category, subject and source
+  records), used to pair findings across screenings
+- finding_fingerprint: identity plus the content the delta detector
+  reports on (severity, summary, details)
+- connection_fingerprint / risk_score_fingerprint: canonical content hashes
+
+ProfileDigest combines them Merkle-style: one digest per subtree
+(findings, risk score, connections) and a root over the three. Storing the
+digest with each profile version lets an unchanged monitoring check be
+recognised with a single comparison, and a changed one be diffed only
+under the subtrees whose digest moved.
+
+Fingerprints are computed over the ``to_dict`` form, so findings and risk
+scores give the same digest as objects and as stored profile JSON.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from elile.investigation.finding_extractor import Finding
+    from elile.risk.risk_scorer import RiskScore
+
+DIGEST_SIZE = 16  # bytes; hex digests are twice as long
+
+# Digest of an absent subtree (no risk score, no connections)
+EMPTY_DIGEST = hashlib.blake2b(b"", digest_size=DIGEST_SIZE).hexdigest()
+
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=DIGEST_SIZE).hexdigest()
+
+
+def _combine(digests: Iterable[str]) -> str:
+    hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    for digest in digests:
+        hasher.update(bytes.fromhex(digest))
+    return hasher.hexdigest()
+
+
+def _as_dict(value: Any) -> dict[str, Any]:
+    return value if isinstance(value, dict) else value.to_dict()
+
+
+def finding_key(finding: Finding | dict[str, Any]) -> str:
+    """Get the identity of a finding, independent of its ID.
+
+    Findings backed by provider records are identified by those records;
+    others fall back to their summary and date.
+
+    Args:
+        finding: Finding to identify, or its ``to_dict`` form.
+
+    Returns:
+        Hex digest shared by the same finding across screenings.
+    """
+    data = _as_dict(finding)
+    records = sorted(
+        (source.get("provider_id"), source["record_id"])
+        for source in data.get("sources") or ()
+        if source.get("record_id")
+    )
+    identity: list[Any] = [
+        data.get("finding_type"),
+        data.get("category"),
+        data.get("subject_entity_id"),
+    ]
+    if records:
+        identity.append(records)
+    else:
+        summary = data.get("summary") or ""
+        identity.extend([data.get("finding_date"), " ".join(summary.lower().split())])
+    return _digest(identity)
+
+
+def finding_fingerprint(finding: Finding | dict[str, Any]) -> str:
+    """Get the content fingerprint of a finding.
+
+    Args:
+        finding: Finding to fingerprint, or its ``to_dict`` form.
+
+    Returns:
+        Hex digest that changes when the finding's reported content does.
+    """
+    data = _as_dict(finding)
+    return _digest(
+        [
+            finding_key(data),
+            data.get("severity"),
+            data.get("summary"),
+            data.get("details"),
+            data.get("corroborated"),
+        ]
+    )
+
+
+def connection_fingerprint(connection: dict[str, Any]) -> str:
+    """Get the content fingerprint of a connection.
+
+    Args:
+        connection: Connection dict as passed to the delta detector.
+
+    Returns:
+        Hex digest of the canonical connection content.
+    """
+    return _digest(connection)
+
+
+def risk_score_fingerprint(risk_score: RiskScore | dict[str, Any] | None) -> str:
+    """Get the content fingerprint of a risk score.
+
+    Args:
+        risk_score: Risk score or its ``to_dict`` form, or None.
+
+    Returns:
+        Hex digest of the score, level, category scores and recommendation,
+        or EMPTY_DIGEST for None.
+    """
+    if not risk_score:
+        return EMPTY_DIGEST
+    data = _as_dict(risk_score)
+    return _digest(
+        [
+            data.get("overall_score"),
+            data.get("risk_level"),
+            sorted((data.get("category_scores") or {}).items()),
+            data.get("recommendation"),
+        ]
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileDigest:
+    """Merkle-style digest of a profile snapshot.
+
+    Attributes:
+        root: Digest over the three subtree digests.
+        findings: Digest over the sorted finding fingerprints.
+        risk_score: Risk score fingerprint.
+        connections: Digest over the sorted connection fingerprints.
+    """
+
+    root: str
+    findings: str
+    risk_score: str
+    connections: str
+
+    def to_dict(self) -> dict[str, str]:
+        """Convert to dictionary."""
+        return {
+            "root": self.root,
+            "findings": self.findings,
+            "risk_score": self.risk_score,
+            "connections": self.connections,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, str]) -> ProfileDigest:
+        """Create from a dictionary produced by to_dict."""
+        return cls(
+            root=data["root"],
+            findings=data["findings"],
+            risk_score=data["risk_score"],
+            connections=data["connections"],
+        )
+
+
+def compute_profile_digest(
+    findings: Iterable[Finding | dict[str, Any]],
+    risk_score: RiskScore | dict[str, Any] | None = None,
+    connections: Iterable[dict[str, Any]] | None = None,
+) -> ProfileDigest:
+    """Compute the digest of a profile snapshot.
+
+    Subtree digests are order-independent, so the same findings and
+    connections in a different order give the same digest.
+
+    Args:
+        findings: Profile findings, as objects or ``to_dict`` forms.
+        risk_score: Profile risk score or its ``to_dict`` form, if any.
+        connections: Profile connections, if any.
+
+    Returns:
+        ProfileDigest for the snapshot.
+    """
+    findings_digest = _combine(sorted(map(finding_fingerprint, findings)))
+    risk_digest = risk_score_fingerprint(risk_score)
+    connections_digest = _combine(sorted(map(connection_fingerprint, connections or ())))
+    return ProfileDigest(
+        root=_combine([findings_digest, risk_digest, connections_digest]),
+        findings=findings_digest,
+        risk_score=risk_digest,
+        connections=connections_digest,
+    )
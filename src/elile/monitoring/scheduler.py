@@ -4,6 +4,9 @@ Manages scheduling based on vigilance levels (V1/V2/V3), executes periodic
 checks, and handles employee lifecycle events.
 """
 
+import asyncio
+import hashlib
+import heapq
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any, Protocol
@@ -11,6 +14,10 @@ from uuid import UUID
 
 from elile.agent.state import SearchDegree, ServiceTier, VigilanceLevel
 from elile.compliance.types import Locale, RoleCategory
+from elile.core.logging import get_logger
+from elile.investigation.finding_extractor import Finding
+from elile.monitoring.delta_detector import DeltaDetector, create_delta_detector
+from elile.monitoring.fingerprints import ProfileDigest
 from elile.monitoring.types import (
     AlertSeverity,
     CheckStatus,
@@ -28,6 +35,10 @@ from elile.monitoring.types import (
     ProfileDelta,
     ScheduleResult,
 )
+from elile.providers.rate_limit import ProviderRateLimitRegistry, get_rate_limit_registry
+from elile.risk.risk_scorer import RiskScore
+
+logger = get_logger(__name__)
 
 # =============================================================================
 # Alert Thresholds by Vigilance Level
@@ -91,17 +102,78 @@ class MonitoringStore(Protocol):
         ...
 
 
+@dataclass
+class ProfileSnapshot:
+    """Findings, risk score and connections of one profile version.
+
+    Attributes:
+        profile_id: Stored profile the snapshot belongs to, if any.
+        findings: Profile findings.
+        risk_score: Profile risk score, if any.
+        connections: Profile connections, if any.
+        digest: ProfileDigest stored with the profile (EntityProfile.digest),
+            or None to compute it from the snapshot.
+    """
+
+    profile_id: UUID | None = None
+    findings: list[Finding] = field(default_factory=list)
+    risk_score: RiskScore | None = None
+    connections: list[dict[str, Any]] | None = None
+    digest: ProfileDigest | None = None
+
+
+class ProfileSource(Protocol):
+    """Protocol for the profiles a monitoring check compares."""
+
+    async def get_baseline(self, config: MonitoringConfig) -> ProfileSnapshot | None:
+        """Get the baseline profile (config.baseline_profile_id) with its stored digest."""
+        ...
+
+    async def screen(self, config: MonitoringConfig) -> ProfileSnapshot:
+        """Screen the monitored subject against current data."""
+        ...
+
+
 class InMemoryMonitoringStore:
-    """In-memory implementation of MonitoringStore for testing."""
+    """In-memory implementation of MonitoringStore for testing.
+
+    Keeps a heap of (next_check_date, config_id) entries so due checks are
+    found without scanning every configuration, plus subject and tenant
+    indexes. Configurations are indexed when saved; heap entries left behind
+    by a later save are skipped lazily.
+    """
 
     def __init__(self) -> None:
         self._configs: dict[UUID, MonitoringConfig] = {}
         self._checks: dict[UUID, list[MonitoringCheck]] = {}
         self._events: list[LifecycleEvent] = []
+        self._due: list[tuple[datetime, int, UUID]] = []
+        self._scheduled: dict[UUID, tuple[datetime, int]] = {}
+        self._sequence = 0
+        self._by_subject: dict[tuple[UUID, UUID], list[UUID]] = {}
+        self._by_tenant: dict[UUID, dict[UUID, None]] = {}
+        self._index_keys: dict[UUID, tuple[UUID, UUID]] = {}
 
     async def save_config(self, config: MonitoringConfig) -> None:
         """Save monitoring configuration."""
-        self._configs[config.config_id] = config
+        config_id = config.config_id
+        self._configs[config_id] = config
+
+        key = (config.tenant_id, config.subject_id)
+        previous = self._index_keys.get(config_id)
+        if previous != key:
+            if previous is not None:
+                self._by_subject[previous].remove(config_id)
+                del self._by_tenant[previous[0]][config_id]
+            self._by_subject.setdefault(key, []).append(config_id)
+            self._by_tenant.setdefault(config.tenant_id, {})[config_id] = None
+            self._index_keys[config_id] = key
+
+        if config.status == MonitoringStatus.ACTIVE and config.next_check_date is not None:
+            if self._scheduled.get(config_id, (None,))[0] != config.next_check_date:
+                self._push_due(config_id, config.next_check_date)
+        else:
+            self._scheduled.pop(config_id, None)
 
     async def get_config(self, config_id: UUID) -> MonitoringConfig | None:
         """Get monitoring configuration by ID."""
@@ -111,31 +183,44 @@ class InMemoryMonitoringStore:
         self, subject_id: UUID, tenant_id: UUID
     ) -> MonitoringConfig | None:
         """Get monitoring configuration by subject ID."""
-        for config in self._configs.values():
-            if config.subject_id == subject_id and config.tenant_id == tenant_id:
-                return config
-        return None
+        config_ids = self._by_subject.get((tenant_id, subject_id))
+        return self._configs[config_ids[0]] if config_ids else None
 
     async def get_due_checks(self, as_of: datetime) -> list[MonitoringConfig]:
-        """Get all configurations with due checks."""
-        due = []
-        for config in self._configs.values():
+        """Get all configurations with due checks, earliest first."""
+        due: list[tuple[datetime, int, UUID]] = []
+        while self._due and self._due[0][0] <= as_of:
+            entry = heapq.heappop(self._due)
+            next_check_date, sequence, config_id = entry
+            if self._scheduled.get(config_id) != (next_check_date, sequence):
+                continue  # Superseded by a later save
+            config = self._configs[config_id]
             if (
                 config.status == MonitoringStatus.ACTIVE
-                and config.next_check_date is not None
-                and config.next_check_date <= as_of
+                and config.next_check_date == next_check_date
             ):
-                due.append(config)
-        return due
+                due.append(entry)
+            else:
+                del self._scheduled[config_id]
+
+        # Still due until rescheduled, so put them back
+        for entry in due:
+            heapq.heappush(self._due, entry)
+        return [self._configs[config_id] for _, _, config_id in due]
 
     async def get_active_configs(self, tenant_id: UUID) -> list[MonitoringConfig]:
         """Get all active monitoring configurations for a tenant."""
         return [
             config
-            for config in self._configs.values()
-            if config.tenant_id == tenant_id and config.status == MonitoringStatus.ACTIVE
+            for config in map(self._configs.__getitem__, self._by_tenant.get(tenant_id, ()))
+            if config.status == MonitoringStatus.ACTIVE
         ]
 
+    def _push_due(self, config_id: UUID, next_check_date: datetime) -> None:
+        self._sequence += 1
+        self._scheduled[config_id] = (next_check_date, self._sequence)
+        heapq.heappush(self._due, (next_check_date, self._sequence, config_id))
+
     async def save_check(self, check: MonitoringCheck) -> None:
         """Save monitoring check record."""
         config_id = check.monitoring_config_id
@@ -171,6 +256,15 @@ class SchedulerConfig:
         auto_resume_paused: Auto-resume paused configs past pause_until.
         check_execution_timeout: Timeout for check execution.
         max_concurrent_checks: Maximum concurrent check executions.
+        max_concurrent_checks_per_tenant: Maximum concurrent checks for one
+            tenant, so a large tenant cannot take every worker.
+        check_providers: Provider IDs each scheduled check queries; a check
+            waits for a rate limit token from each before running.
+        provider_token_timeout: Longest a check waits for its provider rate
+            limit tokens before it is recorded as failed.
+        schedule_jitter: Maximum offset added to interval-based check dates.
+            The offset is derived from the config ID, so each subject keeps
+            a steady cadence while subjects scheduled together spread out.
         enable_alerts: Enable alert generation.
         enable_escalation: Enable alert escalation.
     """
@@ -181,6 +275,10 @@ class SchedulerConfig:
     auto_resume_paused: bool = True
     check_execution_timeout: timedelta = field(default_factory=lambda: timedelta(minutes=30))
     max_concurrent_checks: int = 10
+    max_concurrent_checks_per_tenant: int = 5
+    check_providers: list[str] = field(default_factory=list)
+    provider_token_timeout: timedelta = field(default_factory=lambda: timedelta(minutes=1))
+    schedule_jitter: timedelta = field(default_factory=lambda: timedelta(seconds=30))
     enable_alerts: bool = True
     enable_escalation: bool = True
 
@@ -212,15 +310,26 @@ class MonitoringScheduler:
         self,
         store: MonitoringStore,
         config: SchedulerConfig | None = None,
+        rate_limiter: ProviderRateLimitRegistry | None = None,
+        profiles: ProfileSource | None = None,
+        delta_detector: DeltaDetector | None = None,
     ) -> None:
         """Initialize the monitoring scheduler.
 
         Args:
             store: Storage backend for monitoring configurations.
             config: Optional scheduler configuration.
+            rate_limiter: Provider rate limits for check_providers. Defaults
+                to the shared registry.
+            profiles: Source of baseline and current profiles. Without one,
+                checks detect no deltas.
+            delta_detector: Detector comparing the profiles.
         """
         self.config = config or SchedulerConfig()
         self.store = store
+        self.rate_limiter = rate_limiter
+        self.profiles = profiles
+        self.delta_detector = delta_detector or create_delta_detector()
 
         # Update intervals from config if provided
         if self.config.v1_interval:
@@ -248,6 +357,21 @@ class MonitoringScheduler:
             vigilance_level, self.VIGILANCE_INTERVALS[VigilanceLevel.V1]
         )
 
+    def get_jitter(self, config_id: UUID) -> timedelta:
+        """Get the schedule offset for a monitoring configuration.
+
+        Args:
+            config_id: The monitoring configuration ID.
+
+        Returns:
+            Offset between zero and schedule_jitter, fixed per config.
+        """
+        digest = hashlib.blake2b(config_id.bytes, digest_size=8).digest()
+        return self.config.schedule_jitter * (int.from_bytes(digest, "big") / 2**64)
+
+    def _next_check_after(self, config: MonitoringConfig, interval: timedelta) -> datetime:
+        return datetime.now(UTC) + interval + self.get_jitter(config.config_id)
+
     async def schedule_monitoring(
         self,
         subject_id: UUID,
@@ -304,7 +428,6 @@ class MonitoringScheduler:
 
         try:
             interval = self.get_interval(vigilance_level)
-            next_check = datetime.now(UTC) + interval
 
             config = MonitoringConfig(
                 subject_id=subject_id,
@@ -317,7 +440,6 @@ class MonitoringScheduler:
                 role_category=role_category,
                 baseline_profile_id=baseline_profile_id,
                 status=MonitoringStatus.ACTIVE,
-                next_check_date=next_check,
                 alert_recipients=alert_recipients or [],
                 escalation_path=escalation_path or [],
                 sanctions_realtime=sanctions_realtime,
@@ -325,6 +447,8 @@ class MonitoringScheduler:
                 dark_web_monitoring=dark_web_monitoring,
                 metadata=metadata or {},
             )
+            next_check = self._next_check_after(config, interval)
+            config.next_check_date = next_check
 
             await self.store.save_config(config)
 
@@ -349,23 +473,102 @@ class MonitoringScheduler:
     ) -> list[MonitoringCheck]:
         """Execute all due monitoring checks.
 
-        Finds all monitoring configurations with due checks and executes them.
+        Finds all monitoring configurations with due checks and executes them
+        concurrently, bounded by max_concurrent_checks overall and
+        max_concurrent_checks_per_tenant per tenant. Each check also waits for
+        rate limit tokens from the configured check providers.
+
+        A failed check, including one that times out waiting for rate limit
+        tokens, is recorded with FAILED status and logged; it does not stop
+        the remaining checks.
 
         Args:
             as_of: Reference time for determining due checks. Defaults to now.
 
         Returns:
-            List of executed MonitoringCheck records.
+            List of executed MonitoringCheck records, in due order.
         """
         as_of = as_of or datetime.now(UTC)
         due_configs = await self.store.get_due_checks(as_of)
+        if not due_configs:
+            return []
+
+        workers = asyncio.Semaphore(max(1, self.config.max_concurrent_checks))
+        per_tenant = max(1, self.config.max_concurrent_checks_per_tenant)
+        tenant_slots: dict[UUID, asyncio.Semaphore] = {}
+
+        async def run(config: MonitoringConfig) -> MonitoringCheck | None:
+            tenant_slot = tenant_slots.setdefault(config.tenant_id, asyncio.Semaphore(per_tenant))
+            # Take the tenant slot first so a tenant at its limit holds no worker
+            async with tenant_slot, workers:
+                try:
+                    await self._acquire_provider_tokens()
+                except Exception as e:
+                    await self._record_failed_check(config, e)
+                    return None
+                try:
+                    # Failures inside the check are recorded by the check itself
+                    return await self._execute_monitoring_check(config)
+                except Exception as e:
+                    self._log_failed_check(config, e)
+                    return None
+
+        results = await asyncio.gather(*(run(config) for config in due_configs))
+        checks = [check for check in results if check is not None]
+
+        logger.info(
+            "scheduled_checks_executed",
+            due=len(due_configs),
+            completed=len(checks),
+            failed=len(due_configs) - len(checks),
+        )
+        return checks
 
-        checks = []
-        for config in due_configs:
-            check = await self._execute_monitoring_check(config)
-            checks.append(check)
+    async def _acquire_provider_tokens(self) -> None:
+        """Wait for a rate limit token from each check provider.
 
-        return checks
+        Raises:
+            MonitoringExecutionError: If the tokens are not available within
+                provider_token_timeout.
+        """
+        if not self.config.check_providers:
+            return
+        registry = self.rate_limiter or get_rate_limit_registry()
+        timeout = self.config.provider_token_timeout.total_seconds()
+        provider_id = None
+        try:
+            async with asyncio.timeout(timeout):
+                for provider_id in self.config.check_providers:
+                    while not (await registry.acquire(provider_id, wait=True)).allowed:
+                        pass  # Another check took the refilled token; wait again
+        except TimeoutError as e:
+            raise MonitoringExecutionError(
+                f"Timed out after {timeout:g}s waiting for rate limit tokens",
+                details={"provider_id": provider_id},
+            ) from e
+
+    async def _record_failed_check(self, config: MonitoringConfig, error: Exception) -> None:
+        """Record a check that failed before it could run."""
+        self._log_failed_check(config, error)
+        check = MonitoringCheck(
+            monitoring_config_id=config.config_id,
+            check_type=CheckType.SCHEDULED,
+        )
+        check.start()
+        check.complete(CheckStatus.FAILED, error=str(error))
+        try:
+            await self.store.save_check(check)
+        except Exception as e:
+            self._log_failed_check(config, e)
+
+    def _log_failed_check(self, config: MonitoringConfig, error: Exception) -> None:
+        """Log a failed scheduled check."""
+        logger.warning(
+            "monitoring_check_failed",
+            config_id=str(config.config_id),
+            tenant_id=str(config.tenant_id),
+            error=str(error),
+        )
 
     async def _execute_monitoring_check(
         self,
@@ -409,7 +612,7 @@ class MonitoringScheduler:
 
             # Schedule next check
             interval = self.get_interval(config.vigilance_level)
-            config.next_check_date = datetime.now(UTC) + interval
+            config.next_check_date = self._next_check_after(config, interval)
             config.updated_at = datetime.now(UTC)
 
             await self.store.save_config(config)
@@ -427,31 +630,49 @@ class MonitoringScheduler:
 
     async def _perform_delta_detection(
         self,
-        config: MonitoringConfig,  # noqa: ARG002
+        config: MonitoringConfig,
         check: MonitoringCheck,
     ) -> list[ProfileDelta]:
         """Perform delta detection against baseline.
 
-        This is a placeholder that would integrate with the screening
-        orchestrator in production.
+        Screens the subject through the profile source and compares the
+        result with the baseline profile. The baseline's stored digest is
+        passed to the detector, so an unchanged profile is recognised
+        without fingerprinting the baseline again.
 
         Args:
-            config: The monitoring configuration (used in production implementation).
+            config: The monitoring configuration.
             check: The check record being executed.
 
         Returns:
             List of detected profile deltas.
         """
-        # In production, this would:
-        # 1. Execute a screening against current data using config.baseline_profile_id
-        # 2. Compare results to baseline profile
-        # 3. Return detected differences
-        #
-        # For now, return empty list (no deltas)
-        _ = config  # Will be used in production implementation
         check.data_sources_checked = 0
         check.queries_executed = 0
-        return []
+        if self.profiles is None:
+            return []
+
+        baseline = await self.profiles.get_baseline(config)
+        if baseline is None:
+            raise MonitoringExecutionError(
+                "Baseline profile not found",
+                details={"baseline_profile_id": str(config.baseline_profile_id)},
+            )
+        current = await self.profiles.screen(config)
+
+        result = self.delta_detector.detect_deltas(
+            baseline.findings,
+            current.findings,
+            baseline_risk_score=baseline.risk_score,
+            current_risk_score=current.risk_score,
+            baseline_connections=baseline.connections,
+            current_connections=current.connections,
+            entity_id=config.subject_id,
+            baseline_profile_id=baseline.profile_id or config.baseline_profile_id,
+            current_profile_id=current.profile_id,
+            baseline_digest=baseline.digest,
+        )
+        return result.deltas
 
     def _generate_alerts(
         self,
@@ -714,7 +935,7 @@ class MonitoringScheduler:
             config.vigilance_level = event.new_vigilance_level
             # Recalculate next check based on new vigilance
             interval = self.get_interval(event.new_vigilance_level)
-            config.next_check_date = datetime.now(UTC) + interval
+            config.next_check_date = self._next_check_after(config, interval)
             updated = True
 
         if updated:
@@ -762,7 +983,7 @@ class MonitoringScheduler:
 
             # Recalculate next check based on new level
             interval = self.get_interval(event.new_vigilance_level)
-            config.next_check_date = datetime.now(UTC) + interval
+            config.next_check_date = self._next_check_after(config, interval)
             config.updated_at = datetime.now(UTC)
 
             # Disable V3 features if downgrading from V3
@@ -873,7 +1094,7 @@ class MonitoringScheduler:
             config.next_check_date = datetime.now(UTC)
         else:
             interval = self.get_interval(config.vigilance_level)
-            config.next_check_date = datetime.now(UTC) + interval
+            config.next_check_date = self._next_check_after(config, interval)
 
         config.updated_at = datetime.now(UTC)
         await self.store.save_config(config)
@@ -940,7 +1161,7 @@ class MonitoringScheduler:
 
         # Recalculate next check
         interval = self.get_interval(new_level)
-        config.next_check_date = datetime.now(UTC) + interval
+        config.next_check_date = self._next_check_after(config, interval)
 
         # Disable V3 features if downgrading from V3
         if old_level == VigilanceLevel.V3 and new_level != VigilanceLevel.V3:
@@ -1058,12 +1279,14 @@ class MonitoringScheduler:
 def create_monitoring_scheduler(
     store: MonitoringStore | None = None,
     config: SchedulerConfig | None = None,
+    profiles: ProfileSource | None = None,
 ) -> MonitoringScheduler:
     """Create a monitoring scheduler with default or provided components.
 
     Args:
         store: Optional storage backend. Uses in-memory store if not provided.
         config: Optional scheduler configuration.
+        profiles: Optional source of baseline and current profiles.
 
     Returns:
         Configured MonitoringScheduler instance.
@@ -1071,4 +1294,5 @@ def create_monitoring_scheduler(
     return MonitoringScheduler(
         store=store or InMemoryMonitoringStore(),
         config=config,
+        profiles=profiles,
     )
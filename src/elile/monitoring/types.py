@@ -275,6 +275,32 @@ class MonitoringAlert:
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MonitoringAlert":
+        """Create from a dictionary produced by to_dict."""
+        acknowledged_at = data.get("acknowledged_at")
+        resolved_at = data.get("resolved_at")
+        return cls(
+            alert_id=UUID(data["alert_id"]),
+            monitoring_config_id=UUID(data["monitoring_config_id"]),
+            check_id=UUID(data["check_id"]),
+            severity=AlertSeverity(data["severity"]),
+            title=data["title"],
+            description=data["description"],
+            delta_ids=[UUID(d) for d in data["delta_ids"]],
+            recipients_notified=list(data["recipients_notified"]),
+            escalated=data["escalated"],
+            escalated_to=list(data["escalated_to"]),
+            acknowledged=data["acknowledged"],
+            acknowledged_by=data.get("acknowledged_by"),
+            acknowledged_at=datetime.fromisoformat(acknowledged_at) if acknowledged_at else None,
+            resolved=data["resolved"],
+            resolved_by=data.get("resolved_by"),
+            resolved_at=datetime.fromisoformat(resolved_at) if resolved_at else None,
+            created_at=datetime.fromisoformat(data["created_at"]),
+            metadata=dict(data.get("metadata") or {}),
+        )
+
 
 @dataclass
 class MonitoringCheck:
@@ -45,88 +45,103 @@ Usage:
     )
 """
 
-from elile.observability.metrics import (
-    ACTIVE_CONNECTIONS,
-    ANOMALIES_DETECTED,
-    CONNECTION_POOL_SIZE,
-    DB_QUERY_COUNT,
-    DB_QUERY_DURATION,
-    FINDINGS_COUNT,
-    HTTP_REQUEST_COUNT,
-    HTTP_REQUEST_DURATION,
-    HTTP_REQUEST_SIZE,
-    HTTP_RESPONSE_SIZE,
-    MEMORY_USAGE_BYTES,
-    PATTERNS_RECOGNIZED,
-    PROVIDER_CACHE_HITS,
-    PROVIDER_CACHE_MISSES,
-    PROVIDER_CIRCUIT_BREAKER_STATE,
-    PROVIDER_HEALTH_STATUS,
-    PROVIDER_QUERY_COUNT,
-    PROVIDER_QUERY_DURATION,
-    PROVIDER_RATE_LIMITED,
-    QUEUE_DEPTH,
-    RISK_LEVEL_COUNT,
-    RISK_SCORE_DISTRIBUTION,
-    SAR_CONFIDENCE_SCORE,
-    SAR_FACTS_DISCOVERED,
-    SAR_ITERATION_COUNT,
-    SAR_PHASE_DURATION,
-    SAR_QUERIES_EXECUTED,
-    SCREENING_COUNT,
-    SCREENING_DURATION,
-    SCREENING_IN_PROGRESS,
-    SCREENING_PHASE_DURATION,
-    SERVICE_INFO,
-    WORKER_COUNT,
-    MetricsConfig,
-    MetricsManager,
-    create_metrics_manager,
-    get_metrics,
-    get_metrics_manager,
-    observe_provider_query,
-    observe_risk_score,
-    observe_sar_iteration,
-    observe_screening_duration,
-    record_anomaly,
-    record_db_query,
-    record_finding,
-    record_http_request,
-    record_pattern,
-    record_provider_query,
-    record_provider_rate_limited,
-    record_sar_iteration,
-    record_sar_phase,
-    record_screening_complete,
-    record_screening_phase,
-    set_active_connections,
-    set_connection_pool_size,
-    set_memory_usage,
-    set_provider_circuit_breaker_state,
-    set_provider_health_status,
-    set_queue_depth,
-    set_worker_count,
-)
-from elile.observability.tracing import (
-    SpanKindType,
-    TracingConfig,
-    TracingManager,
-    add_span_attributes,
-    add_span_event,
-    create_span,
-    create_tracing_manager,
-    extract_trace_context,
-    get_current_span,
-    get_tracer,
-    get_tracing_manager,
-    inject_trace_context,
-    record_exception,
-    trace_provider_query,
-    trace_sar_loop,
-    trace_screening,
-    traced,
-    traced_async,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.observability.metrics import (
+        ACTIVE_CONNECTIONS,
+        ANOMALIES_DETECTED,
+        CONNECTION_POOL_SIZE,
+        DB_QUERY_COUNT,
+        DB_QUERY_DURATION,
+        FINDINGS_COUNT,
+        HTTP_REQUEST_COUNT,
+        HTTP_REQUEST_DURATION,
+        HTTP_REQUEST_SIZE,
+        HTTP_RESPONSE_SIZE,
+        LLM_CACHE_LOOKUPS,
+        LLM_LATENCY_SAVED,
+        LLM_SCHEDULER_EVENTS,
+        LLM_SCHEDULER_QUEUE_WAIT,
+        LLM_TOKENS_SAVED,
+        MEMORY_USAGE_BYTES,
+        PATTERNS_RECOGNIZED,
+        PROVIDER_CACHE_HITS,
+        PROVIDER_CACHE_MISSES,
+        PROVIDER_CIRCUIT_BREAKER_STATE,
+        PROVIDER_HEALTH_STATUS,
+        PROVIDER_QUERY_COUNT,
+        PROVIDER_QUERY_DURATION,
+        PROVIDER_RATE_LIMITED,
+        QUEUE_DEPTH,
+        RISK_LEVEL_COUNT,
+        RISK_SCORE_DISTRIBUTION,
+        SAR_CONFIDENCE_SCORE,
+        SAR_FACTS_DISCOVERED,
+        SAR_ITERATION_COUNT,
+        SAR_PHASE_DURATION,
+        SAR_QUERIES_EXECUTED,
+        SCREENING_COUNT,
+        SCREENING_DURATION,
+        SCREENING_IN_PROGRESS,
+        SCREENING_PHASE_DURATION,
+        SERVICE_INFO,
+        WORKER_COUNT,
+        MetricsConfig,
+        MetricsManager,
+        create_metrics_manager,
+        get_metrics,
+        get_metrics_manager,
+        observe_llm_queue_wait,
+        observe_provider_query,
+        observe_risk_score,
+        observe_sar_iteration,
+        observe_screening_duration,
+        record_anomaly,
+        record_db_query,
+        record_finding,
+        record_http_request,
+        record_llm_cache_lookup,
+        record_llm_scheduler_event,
+        record_pattern,
+        record_provider_query,
+        record_provider_rate_limited,
+        record_sar_iteration,
+        record_sar_phase,
+        record_screening_complete,
+        record_screening_phase,
+        set_active_connections,
+        set_connection_pool_size,
+        set_memory_usage,
+        set_provider_circuit_breaker_state,
+        set_provider_health_status,
+        set_queue_depth,
+        set_worker_count,
+    )
+    from elile.observability.tracing import (
+        SpanKindType,
+        TracingConfig,
+        TracingManager,
+        add_span_attributes,
+        add_span_event,
+        create_span,
+        create_tracing_manager,
+        extract_trace_context,
+        get_current_span,
+        get_tracer,
+        get_tracing_manager,
+        inject_trace_context,
+        record_exception,
+        trace_provider_query,
+        trace_sar_loop,
+        trace_screening,
+        traced,
+        traced_async,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Tracing
@@ -194,6 +209,15 @@ __all__ = [
     "record_finding",
     "record_anomaly",
     "record_pattern",
+    # LLM Metrics
+    "LLM_CACHE_LOOKUPS",
+    "LLM_TOKENS_SAVED",
+    "LLM_LATENCY_SAVED",
+    "record_llm_cache_lookup",
+    "LLM_SCHEDULER_QUEUE_WAIT",
+    "LLM_SCHEDULER_EVENTS",
+    "observe_llm_queue_wait",
+    "record_llm_scheduler_event",
     # HTTP Metrics
     "HTTP_REQUEST_DURATION",
     "HTTP_REQUEST_COUNT",
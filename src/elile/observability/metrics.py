@@ -43,6 +43,11 @@ __all__ = [
     "SAR_CONFIDENCE_SCORE",
     "RISK_SCORE_DISTRIBUTION",
     "RISK_LEVEL_COUNT",
+    "LLM_CACHE_LOOKUPS",
+    "LLM_TOKENS_SAVED",
+    "LLM_LATENCY_SAVED",
+    "LLM_SCHEDULER_QUEUE_WAIT",
+    "LLM_SCHEDULER_EVENTS",
     "HTTP_REQUEST_DURATION",
     "HTTP_REQUEST_COUNT",
     "DB_QUERY_DURATION",
@@ -51,6 +56,9 @@ __all__ = [
     "observe_provider_query",
     "observe_sar_iteration",
     "observe_risk_score",
+    "record_llm_cache_lookup",
+    "observe_llm_queue_wait",
+    "record_llm_scheduler_event",
     "get_metrics",
     "create_metrics_manager",
 ]
@@ -252,6 +260,42 @@ PATTERNS_RECOGNIZED = Counter(
     ["pattern_type"],
 )
 
+# ============================================================================
+# LLM Metrics
+# ============================================================================
+
+LLM_CACHE_LOOKUPS = Counter(
+    f"{_config.prefix}_llm_cache_lookups_total",
+    "LLM response cache lookups by outcome",
+    ["model", "outcome"],
+)
+
+LLM_TOKENS_SAVED = Counter(
+    f"{_config.prefix}_llm_tokens_saved_total",
+    "Model tokens not spent thanks to LLM cache hits",
+    ["model", "direction"],
+)
+
+LLM_LATENCY_SAVED = Histogram(
+    f"{_config.prefix}_llm_latency_saved_seconds",
+    "Model call latency avoided per LLM cache hit",
+    ["model"],
+    buckets=_config.histogram_buckets,
+)
+
+LLM_SCHEDULER_QUEUE_WAIT = Histogram(
+    f"{_config.prefix}_llm_scheduler_queue_wait_seconds",
+    "Time LLM calls waited for a scheduler slot",
+    ["provider", "priority"],
+    buckets=_config.histogram_buckets,
+)
+
+LLM_SCHEDULER_EVENTS = Counter(
+    f"{_config.prefix}_llm_scheduler_events_total",
+    "LLM scheduler events (rate_limited, fallback, retry)",
+    ["provider", "event"],
+)
+
 # ============================================================================
 # HTTP/API Metrics
 # ============================================================================
@@ -716,6 +760,53 @@ def record_pattern(pattern_type: str) -> None:
     PATTERNS_RECOGNIZED.labels(pattern_type=pattern_type).inc()
 
 
+def record_llm_cache_lookup(
+    model: str,
+    outcome: str,
+    usage: dict[str, int] | None = None,
+    latency_saved_seconds: float | None = None,
+) -> None:
+    """Record an LLM response cache lookup.
+
+    Args:
+        model: Model name.
+        outcome: Lookup outcome (hit, miss, coalesced, bypass).
+        usage: Token usage of the original call, for hits.
+        latency_saved_seconds: Latency of the original call, for hits.
+    """
+    LLM_CACHE_LOOKUPS.labels(model=model, outcome=outcome).inc()
+
+    if usage:
+        for direction in ("input", "output"):
+            tokens = usage.get(f"{direction}_tokens", 0)
+            if tokens:
+                LLM_TOKENS_SAVED.labels(model=model, direction=direction).inc(tokens)
+
+    if latency_saved_seconds is not None:
+        LLM_LATENCY_SAVED.labels(model=model).observe(latency_saved_seconds)
+
+
+def observe_llm_queue_wait(provider: str, priority: str, wait_seconds: float) -> None:
+    """Record how long an LLM call waited for a scheduler slot.
+
+    Args:
+        provider: Model provider the call was dispatched to.
+        priority: Request priority.
+        wait_seconds: Time spent queued.
+    """
+    LLM_SCHEDULER_QUEUE_WAIT.labels(provider=provider, priority=priority).observe(wait_seconds)
+
+
+def record_llm_scheduler_event(provider: str, event: str) -> None:
+    """Record an LLM scheduler event.
+
+    Args:
+        provider: Model provider the event applies to.
+        event: Event name (rate_limited, fallback, retry).
+    """
+    LLM_SCHEDULER_EVENTS.labels(provider=provider, event=event).inc()
+
+
 def record_http_request(
     method: str,
     endpoint: str,
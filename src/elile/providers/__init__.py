@@ -56,92 +56,112 @@ Provider Implementation:
             ...
 """
 
-from elile.providers.cache import (
-    CacheEntry,
-    CacheFreshnessConfig,
-    CacheLookupResult,
-    CacheStats,
-    ProviderCacheService,
-)
-from elile.providers.cost import (
-    BudgetConfig,
-    BudgetExceededError,
-    BudgetStatus,
-    CostRecord,
-    CostSummary,
-    ProviderCostService,
-    get_cost_service,
-    reset_cost_service,
-)
-from elile.providers.health import (
-    CircuitBreaker,
-    CircuitBreakerConfig,
-    CircuitBreakerRegistry,
-    CircuitOpenError,
-    CircuitState,
-    HealthMonitor,
-    HealthMonitorConfig,
-    ProviderMetrics,
-)
-from elile.providers.protocol import BaseDataProvider, DataProvider
-from elile.providers.rate_limit import (
-    ProviderRateLimitRegistry,
-    RateLimitConfig,
-    RateLimitExceededError,
-    RateLimitResult,
-    RateLimitStatus,
-    RateLimitStrategy,
-    TokenBucket,
-    get_rate_limit_registry,
-    reset_rate_limit_registry,
-)
-from elile.providers.registry import (
-    NoProviderAvailableError,
-    ProviderNotFoundError,
-    ProviderRegistry,
-    get_provider_registry,
-    reset_provider_registry,
-)
-from elile.providers.router import (
-    FailureReason,
-    RequestRouter,
-    RouteFailure,
-    RoutedRequest,
-    RoutedResult,
-    RoutingConfig,
-)
-from elile.providers.sanctions import (
-    EntityType,
-    FuzzyMatchConfig,
-    MatchType,
-    NameMatcher,
-    SanctionedEntity,
-    SanctionsAddress,
-    SanctionsAlias,
-    SanctionsIdentifier,
-    SanctionsList,
-    SanctionsListUnavailableError,
-    SanctionsMatch,
-    SanctionsProvider,
-    SanctionsProviderConfig,
-    SanctionsProviderError,
-    SanctionsScreeningError,
-    SanctionsScreeningResult,
-    create_name_matcher,
-    create_sanctions_provider,
-    get_sanctions_provider,
-)
-from elile.providers.types import (
-    CostTier,
-    DataSourceCategory,
-    ProviderCapability,
-    ProviderHealth,
-    ProviderInfo,
-    ProviderQuery,
-    ProviderQueryCost,
-    ProviderResult,
-    ProviderStatus,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.providers.cache import (
+        CacheEntry,
+        CacheFreshnessConfig,
+        CacheLookupResult,
+        CacheStats,
+        ProviderCacheService,
+    )
+    from elile.providers.cost import (
+        BudgetConfig,
+        BudgetExceededError,
+        BudgetStatus,
+        CostRecord,
+        CostSummary,
+        ProviderCostService,
+        get_cost_service,
+        reset_cost_service,
+    )
+    from elile.providers.health import (
+        CircuitBreaker,
+        CircuitBreakerConfig,
+        CircuitBreakerRegistry,
+        CircuitOpenError,
+        CircuitState,
+        HealthMonitor,
+        HealthMonitorConfig,
+        ProviderMetrics,
+    )
+    from elile.providers.protocol import BaseDataProvider, DataProvider
+    from elile.providers.rate_limit import (
+        ProviderRateLimitRegistry,
+        RateLimitConfig,
+        RateLimitExceededError,
+        RateLimitResult,
+        RateLimitStatus,
+        RateLimitStrategy,
+        TokenBucket,
+        get_rate_limit_registry,
+        reset_rate_limit_registry,
+    )
+    from elile.providers.reference_data import (
+        ReferenceDataConfig,
+        ReferenceDataError,
+        ReferenceDataset,
+        configure_reference_data,
+        get_reference_data_config,
+        get_reference_dataset,
+        list_reference_datasets,
+        preload_reference_data,
+        reference_dataset,
+        reload_reference_data,
+        reset_reference_data,
+    )
+    from elile.providers.registry import (
+        NoProviderAvailableError,
+        ProviderNotFoundError,
+        ProviderRegistry,
+        get_provider_registry,
+        reset_provider_registry,
+    )
+    from elile.providers.router import (
+        FailureReason,
+        RequestRouter,
+        RouteFailure,
+        RoutedRequest,
+        RoutedResult,
+        RoutingConfig,
+    )
+    from elile.providers.sanctions import (
+        EntityType,
+        FuzzyMatchConfig,
+        MatchType,
+        NameMatcher,
+        SanctionedEntity,
+        SanctionsAddress,
+        SanctionsAlias,
+        SanctionsIdentifier,
+        SanctionsList,
+        SanctionsListUnavailableError,
+        SanctionsMatch,
+        SanctionsProvider,
+        SanctionsProviderConfig,
+        SanctionsProviderError,
+        SanctionsScreeningError,
+        SanctionsScreeningResult,
+        create_name_matcher,
+        create_sanctions_provider,
+        get_sanctions_provider,
+    )
+    from elile.providers.types import (
+        CostTier,
+        DataSourceCategory,
+        ProviderCapability,
+        ProviderHealth,
+        ProviderInfo,
+        ProviderQuery,
+        ProviderQueryCost,
+        ProviderResult,
+        ProviderStatus,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Protocol
@@ -187,6 +207,18 @@ __all__ = [
     "ProviderCostService",
     "get_cost_service",
     "reset_cost_service",
+    # Reference Data
+    "ReferenceDataConfig",
+    "ReferenceDataError",
+    "ReferenceDataset",
+    "configure_reference_data",
+    "get_reference_data_config",
+    "get_reference_dataset",
+    "list_reference_datasets",
+    "preload_reference_data",
+    "reference_dataset",
+    "reload_reference_data",
+    "reset_reference_data",
     # Request Routing
     "FailureReason",
     "RequestRouter",
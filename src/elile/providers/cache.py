@@ -3,8 +3,14 @@
 This module provides caching functionality for data provider responses,
 implementing cache-aside pattern with configurable freshness periods
 and tenant-aware isolation.
+
+Payloads are stored zstd-compressed and AES-GCM encrypted (see
+cache_payload). Lookups read freshness metadata first, load the payload
+of the hit only, and decrypt it when normalized_data is first accessed.
 """
 
+import asyncio
+from collections.abc import Collection
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
@@ -14,16 +20,22 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from elile.core.encryption import Encryptor
+from elile.core.encryption import Encryptor, get_encryptor
 from elile.core.logging import get_logger
 from elile.db.models.cache import CachedDataSource, DataOrigin, FreshnessStatus
 from elile.db.repositories.cache import CacheRepository
 
+from .cache_payload import CachePayload, decode_payload, encode_json_payload, encode_payload
 from .types import ProviderResult
 
 logger = get_logger(__name__)
 
 
+def _utc(moment: datetime) -> datetime:
+    """Make a stored timestamp timezone-aware (SQLite returns naive UTC)."""
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=UTC)
+
+
 class CacheFreshnessConfig(BaseModel):
     """Configuration for cache freshness periods.
 
@@ -81,9 +93,32 @@ DEFAULT_FRESHNESS_CONFIGS: dict[str, CacheFreshnessConfig] = {
 }
 
 
+class _DecodedOnAccess:
+    """Dataclass field descriptor that decodes a CachePayload on first read."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = f"_{name}"
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            raise AttributeError(self._attr)  # The field has no default
+        value = instance.__dict__[self._attr]
+        if isinstance(value, CachePayload):
+            value = value.get()
+            instance.__dict__[self._attr] = value
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self._attr] = value
+
+
 @dataclass
 class CacheEntry:
-    """Represents a cached provider response."""
+    """Represents a cached provider response.
+
+    normalized_data may be given as a CachePayload, in which case it is
+    decrypted when first read.
+    """
 
     cache_id: UUID
     entity_id: UUID
@@ -93,7 +128,7 @@ class CacheEntry:
     acquired_at: datetime
     fresh_until: datetime
     stale_until: datetime
-    normalized_data: dict[str, Any]
+    normalized_data: dict[str, Any] = _DecodedOnAccess()  # type: ignore[assignment]
     cost_incurred: Decimal
     cost_currency: str
     data_origin: DataOrigin
@@ -199,12 +234,12 @@ class ProviderCacheService:
 
         Args:
             session: Database session for repository operations.
-            encryptor: Encryptor for raw response data (creates default if None).
+            encryptor: Encryptor for cached payloads (uses the configured one if None).
             freshness_configs: Custom freshness configs by check type category.
         """
         self._session = session
         self._repository = CacheRepository(session)
-        self._encryptor = encryptor or Encryptor()
+        self._encryptor = encryptor or get_encryptor()
         self._freshness_configs = freshness_configs or DEFAULT_FRESHNESS_CONFIGS
         self._stats = CacheStats()
 
@@ -258,22 +293,40 @@ class ProviderCacheService:
         """
         now = datetime.now(UTC)
 
-        if now < fresh_until:
+        if now < _utc(fresh_until):
             return FreshnessStatus.FRESH
-        elif now < stale_until:
+        elif now < _utc(stale_until):
             return FreshnessStatus.STALE
         else:
             return FreshnessStatus.EXPIRED
 
-    def _model_to_entry(self, model: CachedDataSource) -> CacheEntry:
+    def _payload(
+        self, normalized_data: dict[str, Any] | None, normalized_payload: bytes | None
+    ) -> dict[str, Any] | CachePayload:
+        """Get the normalized data of a row, still encrypted if it is."""
+        if normalized_data is not None:
+            return normalized_data  # Written before payloads were encrypted
+        if normalized_payload is None:
+            return {}
+        return CachePayload(self._encryptor, normalized_payload)
+
+    def _model_to_entry(
+        self,
+        model: CachedDataSource,
+        normalized_data: dict[str, Any] | CachePayload | None = None,
+    ) -> CacheEntry:
         """Convert database model to CacheEntry.
 
         Args:
             model: CachedDataSource database model.
+            normalized_data: Normalized data or payload, if not loaded on the model.
 
         Returns:
             CacheEntry dataclass.
         """
+        if normalized_data is None:
+            normalized_data = self._payload(model.normalized_data, model.normalized_payload)
+
         # Compute current freshness status
         freshness = self._compute_freshness_status(
             model.acquired_at,
@@ -287,10 +340,10 @@ class ProviderCacheService:
             provider_id=model.provider_id,
             check_type=model.check_type,
             freshness=freshness,
-            acquired_at=model.acquired_at,
-            fresh_until=model.fresh_until,
-            stale_until=model.stale_until,
-            normalized_data=model.normalized_data,
+            acquired_at=_utc(model.acquired_at),
+            fresh_until=_utc(model.fresh_until),
+            stale_until=_utc(model.stale_until),
+            normalized_data=normalized_data,
             cost_incurred=model.cost_incurred,
             cost_currency=model.cost_currency,
             data_origin=DataOrigin(model.data_origin),
@@ -325,6 +378,7 @@ class ProviderCacheService:
             entity_id=entity_id,
             provider_id=provider_id,
             check_type=check_type,
+            with_payload=True,
         )
 
         if cached is not None:
@@ -375,9 +429,16 @@ class ProviderCacheService:
                 ):
                     continue
 
-                entry = self._model_to_entry(model)
+                freshness = self._compute_freshness_status(
+                    model.acquired_at, model.fresh_until, model.stale_until
+                )
 
-                if entry.freshness == FreshnessStatus.STALE:
+                if freshness == FreshnessStatus.STALE:
+                    # Only the hit's payload is read
+                    payloads = await self._repository.get_payloads([model.cache_id])
+                    entry = self._model_to_entry(
+                        model, self._payload(*payloads.get(model.cache_id, (None, None)))
+                    )
                     self._stats.hits += 1
                     self._stats.stale_hits += 1
                     logger.debug(
@@ -398,6 +459,115 @@ class ProviderCacheService:
         )
         return CacheLookupResult(hit=False)
 
+    async def get_many(
+        self,
+        keys: Collection[tuple[UUID, str, str]],
+        *,
+        tenant_id: UUID | None = None,
+        include_stale: bool = True,
+    ) -> dict[tuple[UUID, str, str], CacheLookupResult]:
+        """Look up many cached provider responses at once.
+
+        Freshness metadata for all keys is read in one query and the
+        payloads of the hits in a second. Payloads are decrypted in a
+        thread pool so a large batch does not block the event loop.
+
+        Args:
+            keys: (entity_id, provider_id, check_type) to look up.
+            tenant_id: Optional tenant for isolation.
+            include_stale: Whether to return stale entries.
+
+        Returns:
+            CacheLookupResult per key.
+        """
+        wanted = set(keys)
+        self._stats.lookups += len(wanted)
+
+        models = await self._repository.get_for_entities(
+            {entity_id for entity_id, _, _ in wanted},
+            provider_ids={provider_id for _, provider_id, _ in wanted},
+            check_types={check_type for _, _, check_type in wanted},
+        )
+
+        # Newest usable entry per key, fresh before stale
+        found: dict[tuple[UUID, str, str], tuple[CachedDataSource, FreshnessStatus]] = {}
+        for model in models:
+            key = (model.entity_id, model.provider_id, model.check_type)
+            if key not in wanted:
+                continue
+            if (
+                model.data_origin == DataOrigin.CUSTOMER_PROVIDED.value
+                and tenant_id is not None
+                and model.customer_id != tenant_id
+            ):
+                continue
+
+            freshness = self._compute_freshness_status(
+                model.acquired_at, model.fresh_until, model.stale_until
+            )
+            if freshness == FreshnessStatus.FRESH:
+                if model.freshness_status != FreshnessStatus.FRESH.value:
+                    continue  # Invalidated
+            elif freshness != FreshnessStatus.STALE or not include_stale:
+                continue
+
+            current = found.get(key)
+            if current is None or (
+                current[1] == FreshnessStatus.STALE and freshness == FreshnessStatus.FRESH
+            ):
+                found[key] = (model, freshness)
+
+        stored = await self._repository.get_payloads(
+            [model.cache_id for model, _ in found.values()]
+        )
+        payloads = {
+            cache_id: self._payload(data, payload) for cache_id, (data, payload) in stored.items()
+        }
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(payload.get)
+                for payload in payloads.values()
+                if isinstance(payload, CachePayload)
+            )
+        )
+
+        results: dict[tuple[UUID, str, str], CacheLookupResult] = {}
+        for key in wanted:
+            if key not in found:
+                self._stats.misses += 1
+                results[key] = CacheLookupResult(hit=False)
+                continue
+
+            model, freshness = found[key]
+            entry = self._model_to_entry(model, payloads.get(model.cache_id, {}))
+            self._stats.hits += 1
+            if freshness == FreshnessStatus.FRESH:
+                self._stats.fresh_hits += 1
+            else:
+                self._stats.stale_hits += 1
+            results[key] = CacheLookupResult(hit=True, entry=entry, freshness=freshness)
+
+        logger.debug(
+            "cache_bulk_lookup",
+            lookups=len(wanted),
+            hits=len(found),
+        )
+        return results
+
+    async def get_raw_response(self, cache_id: UUID) -> bytes | None:
+        """Get the decrypted raw provider response of a cache entry.
+
+        Args:
+            cache_id: Cache entry ID.
+
+        Returns:
+            Raw response bytes, or None if the entry does not exist.
+        """
+        stored = await self._repository.get_raw_response(cache_id)
+        if stored is None:
+            return None
+        return await asyncio.to_thread(decode_payload, self._encryptor, stored)
+
     async def store(
         self,
         entity_id: UUID,
@@ -428,14 +598,16 @@ class ProviderCacheService:
         fresh_until = now + config.fresh_duration
         stale_until = now + config.total_usable_duration
 
-        # Encrypt raw response if provided
+        # Compress and encrypt raw response if provided
         if raw_response is not None:
             if isinstance(raw_response, str):
                 raw_response = raw_response.encode("utf-8")
-            encrypted_response = self._encryptor.encrypt(raw_response)
+            encrypted_response = encode_payload(self._encryptor, raw_response)
         else:
             # Store empty encrypted blob if no raw response
-            encrypted_response = self._encryptor.encrypt(b"")
+            encrypted_response = encode_payload(self._encryptor, b"")
+
+        normalized_data = result.normalized_data or {}
 
         # Create cache entry (store check_type as string value)
         check_type_str = (
@@ -454,7 +626,7 @@ class ProviderCacheService:
             fresh_until=fresh_until,
             stale_until=stale_until,
             raw_response=encrypted_response,
-            normalized_data=result.normalized_data or {},
+            normalized_payload=encode_json_payload(self._encryptor, normalized_data),
             cost_incurred=result.cost_incurred,
             cost_currency="USD",
         )
@@ -475,7 +647,7 @@ class ProviderCacheService:
             cost_usd=float(cached.cost_incurred),
         )
 
-        return self._model_to_entry(cached)
+        return self._model_to_entry(cached, normalized_data)
 
     async def invalidate(
         self,
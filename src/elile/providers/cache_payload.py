@@ -0,0 +1,106 @@
+"""Compressed, encrypted payloads for the provider cache.
+
+Cached provider responses are compressed with zstd and then encrypted
+with AES-256-GCM. Compression has to come first: ciphertext does not
+compress, while provider responses (JSON, XML and HTML reports) usually
+shrink several-fold.
+
+A payload is stored as ``PAYLOAD_MAGIC || nonce || ciphertext || tag``,
+with the magic also bound as associated data. Payloads written before
+compression was added (plain ``nonce || ciphertext || tag``) still decode.
+
+CachePayload defers decryption to the first access, so cache reads that
+only look at freshness metadata never pay for it.
+"""
+
+import json
+from typing import Any
+
+import zstandard
+
+from elile.core.encryption import DecryptionError, Encryptor
+
+# Marks (and authenticates) a compressed payload
+PAYLOAD_MAGIC = b"\xe1zs1"
+
+COMPRESSION_LEVEL = 3
+
+
+def encode_payload(encryptor: Encryptor, data: bytes) -> bytes:
+    """Compress and encrypt a payload.
+
+    Args:
+        encryptor: Encryptor to use
+        data: Plaintext payload
+
+    Returns:
+        Stored payload
+    """
+    compressed = zstandard.compress(data, COMPRESSION_LEVEL)
+    return PAYLOAD_MAGIC + encryptor.encrypt(compressed, PAYLOAD_MAGIC)
+
+
+def decode_payload(encryptor: Encryptor, payload: bytes) -> bytes:
+    """Decrypt and decompress a payload written by encode_payload.
+
+    Args:
+        encryptor: Encryptor to use
+        payload: Stored payload (compressed or legacy)
+
+    Returns:
+        Plaintext payload
+
+    Raises:
+        DecryptionError: If the payload cannot be decrypted
+    """
+    if payload.startswith(PAYLOAD_MAGIC):
+        try:
+            compressed = encryptor.decrypt(payload[len(PAYLOAD_MAGIC) :], PAYLOAD_MAGIC)
+        except DecryptionError:
+            pass  # Legacy payload whose nonce happens to start with the magic
+        else:
+            return zstandard.decompress(compressed)
+    return encryptor.decrypt(payload)
+
+
+def encode_json_payload(encryptor: Encryptor, data: Any) -> bytes:
+    """Serialize, compress and encrypt JSON data."""
+    return encode_payload(encryptor, json.dumps(data, separators=(",", ":"), default=str).encode())
+
+
+def decode_json_payload(encryptor: Encryptor, payload: bytes) -> Any:
+    """Decrypt, decompress and deserialize JSON data."""
+    return json.loads(decode_payload(encryptor, payload))
+
+
+class CachePayload:
+    """A stored JSON payload, decrypted on first access.
+
+    The decoded value is kept, and the stored bytes released, so a
+    payload is decrypted at most once.
+    """
+
+    __slots__ = ("_encryptor", "_payload", "_value")
+
+    def __init__(self, encryptor: Encryptor, payload: bytes):
+        """Initialize the payload.
+
+        Args:
+            encryptor: Encryptor the payload was written with
+            payload: Stored payload
+        """
+        self._encryptor = encryptor
+        self._payload: bytes | None = payload
+        self._value: Any = None
+
+    @property
+    def is_decoded(self) -> bool:
+        """Whether the payload has been decrypted."""
+        return self._payload is None
+
+    def get(self) -> Any:
+        """Get the decoded value, decrypting it on first call."""
+        if self._payload is not None:
+            self._value = decode_json_payload(self._encryptor, self._payload)
+            self._payload = None
+        return self._value
@@ -8,6 +8,7 @@ This module provides dark web monitoring for:
 
 Key Features:
 - Breach database with known data breaches
+- Memory-mapped breached-credential index for exact email lookups
 - Credential leak detection
 - Marketplace monitoring
 - Forum mention tracking
@@ -34,33 +35,49 @@ Usage:
         print(f"Critical findings: {result.get_critical_findings()}")
 """
 
-from .breach_database import (
-    BreachDatabase,
-    create_breach_database,
-)
-from .provider import (
-    DarkWebProvider,
-    create_darkweb_provider,
-    get_darkweb_provider,
-)
-from .types import (
-    BreachInfo,
-    ConfidenceLevel,
-    CredentialLeak,
-    CredentialType,
-    DarkWebProviderConfig,
-    DarkWebProviderError,
-    DarkWebRateLimitError,
-    DarkWebSearchError,
-    DarkWebSearchResult,
-    DarkWebServiceUnavailableError,
-    DarkWebSource,
-    ForumMention,
-    MarketplaceListing,
-    MentionType,
-    SeverityLevel,
-    ThreatIndicator,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .breach_database import (
+        BREACHES,
+        BreachDatabase,
+        BreachReferenceData,
+        create_breach_database,
+    )
+    from .credential_index import (
+        CredentialIndex,
+        CredentialIndexBuilder,
+        email_key,
+        open_credential_index,
+    )
+    from .provider import (
+        DarkWebProvider,
+        create_darkweb_provider,
+        get_darkweb_provider,
+    )
+    from .types import (
+        BreachInfo,
+        ConfidenceLevel,
+        CredentialIndexError,
+        CredentialLeak,
+        CredentialType,
+        DarkWebProviderConfig,
+        DarkWebProviderError,
+        DarkWebRateLimitError,
+        DarkWebSearchError,
+        DarkWebSearchResult,
+        DarkWebServiceUnavailableError,
+        DarkWebSource,
+        ForumMention,
+        MarketplaceListing,
+        MentionType,
+        SeverityLevel,
+        ThreatIndicator,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Provider
@@ -82,10 +99,18 @@ __all__ = [
     "ThreatIndicator",
     # Breach Database
     "BreachDatabase",
+    "BreachReferenceData",
+    "BREACHES",
     "create_breach_database",
+    # Credential Index
+    "CredentialIndex",
+    "CredentialIndexBuilder",
+    "email_key",
+    "open_credential_index",
     # Exceptions
     "DarkWebProviderError",
     "DarkWebSearchError",
     "DarkWebRateLimitError",
     "DarkWebServiceUnavailableError",
+    "CredentialIndexError",
 ]
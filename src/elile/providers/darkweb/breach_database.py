@@ -5,16 +5,26 @@ credential sources for reference in dark web monitoring.
 """
 
 from datetime import datetime
+from typing import NamedTuple
+
+from elile.providers.reference_data import reference_dataset
 
 from .types import BreachInfo
 
 
+class BreachReferenceData(NamedTuple):
+    """Breach reference tables shared by all BreachDatabase instances."""
+
+    breaches: dict[str, BreachInfo]
+    domains: dict[str, list[str]]
+
+
 class BreachDatabase:
     """Database of known data breaches.
 
     Provides lookup and matching capabilities for known breach events.
-    In production, this would be populated from breach notification services
-    and regularly updated.
+    In production, breach notification feeds are published to the shared
+    BREACHES dataset, which every instance reads.
 
     Usage:
         db = BreachDatabase()
@@ -151,10 +161,15 @@ class BreachDatabase:
         "experian.com": ["experian_2020"],
     }
 
-    def __init__(self) -> None:
-        """Initialize the breach database."""
-        self._breaches = self.KNOWN_BREACHES.copy()
-        self._domain_map = self.DOMAIN_MAPPINGS.copy()
+    @property
+    def _breaches(self) -> dict[str, BreachInfo]:
+        """Breaches shared by all instances (see BREACHES)."""
+        return BREACHES.get().breaches
+
+    @property
+    def _domain_map(self) -> dict[str, list[str]]:
+        """Domain to breach ID mapping shared by all instances."""
+        return BREACHES.get().domains
 
     def get_breach(self, breach_id: str) -> BreachInfo | None:
         """Get a breach by ID.
@@ -260,6 +275,17 @@ class BreachDatabase:
         return sum(b.records_affected for b in self._breaches.values() if b.records_affected)
 
 
+def _sample_breaches() -> BreachReferenceData:
+    """Build the sample breach tables."""
+    return BreachReferenceData(
+        breaches=dict(BreachDatabase.KNOWN_BREACHES),
+        domains=dict(BreachDatabase.DOMAIN_MAPPINGS),
+    )
+
+
+BREACHES = reference_dataset("darkweb.breaches", _sample_breaches, data_type=BreachReferenceData)
+
+
 def create_breach_database() -> BreachDatabase:
     """Factory function to create a BreachDatabase.
 
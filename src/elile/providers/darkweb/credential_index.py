@@ -0,0 +1,530 @@
+"""Memory-mapped index of breached email addresses.
+
+Credential-exposure checks look up one email among billions of leaked
+records. The index keeps those records on disk and memory-maps them, so
+lookups take microseconds and the process only touches the pages a
+lookup reads:
+
+- Each record is the first 16 bytes of SHA-256 of the normalized email
+  plus a 2-byte breach number, sorted
+- A fan-out table of 65,536 offsets splits records by their first two
+  bytes (k-anonymity style buckets); a lookup binary-searches one bucket
+- A Bloom filter answers most misses without touching the records
+
+File layout::
+
+    header (64 bytes) | fan-out (65,537 x uint64) | records | bloom | breach ids (JSON)
+
+Indexes are built from breach dumps with ``CredentialIndexBuilder`` or
+from the command line::
+
+    python -m elile.providers.darkweb.credential_index breaches.idx \\
+        --dump linkedin_2021=linkedin.txt --dump adobe_2013=adobe.csv
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from elile.core.logging import get_logger
+
+from .types import CredentialIndexError
+
+logger = get_logger(__name__)
+
+MAGIC = b"ELCRIDX1"
+FORMAT_VERSION = 1
+
+KEY_SIZE = 16
+RECORD_SIZE = KEY_SIZE + 2
+FANOUT_BUCKETS = 1 << 16
+MAX_BREACHES = 1 << 16
+
+# magic, version, bloom hashes, records, bloom bits, bloom offset,
+# breach table offset, breach table length
+_HEADER = struct.Struct("<8sIIQQQQQ")
+_HEADER_SIZE = 64
+_FANOUT = struct.Struct(f"<{FANOUT_BUCKETS + 1}Q")
+_RECORDS_OFFSET = _HEADER_SIZE + _FANOUT.size
+_UINT64 = struct.Struct("<Q")
+_ORDINAL = struct.Struct(">H")  # Big-endian so records sort by key, then breach
+_BLOOM_HASHES = struct.Struct("<QQ")
+
+DEFAULT_FALSE_POSITIVE_RATE = 0.001
+DEFAULT_CHUNK_RECORDS = 1_000_000
+
+_EMAIL_FIELD = re.compile(r"[^\s:;,|\"']+@[^\s:;,|\"']+")
+
+
+def normalize_email(email: str) -> str:
+    """Normalize an email address for hashing.
+
+    Args:
+        email: Email address.
+
+    Returns:
+        Trimmed, lowercased address.
+    """
+    return email.strip().lower()
+
+
+def email_key(email: str) -> bytes:
+    """Compute the index key for an email address.
+
+    Args:
+        email: Email address.
+
+    Returns:
+        First 16 bytes of SHA-256 of the normalized address.
+    """
+    return hashlib.sha256(normalize_email(email).encode()).digest()[:KEY_SIZE]
+
+
+def _bloom_bits(key: bytes, hashes: int, bits: int) -> Iterator[int]:
+    """Get the Bloom filter bit positions for a key (double hashing)."""
+    h1, h2 = _BLOOM_HASHES.unpack(key)
+    for i in range(hashes):
+        yield (h1 + i * h2) % bits
+
+
+class CredentialIndex:
+    """Read-only, memory-mapped breached-credential index.
+
+    Usage:
+        with CredentialIndex("breaches.idx") as index:
+            breach_ids = index.lookup("jane@example.com")
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open and map an index file.
+
+        Args:
+            path: Index file built by CredentialIndexBuilder.
+
+        Raises:
+            CredentialIndexError: If the file is not a valid index.
+        """
+        self.path = Path(path)
+        self._file = self.path.open("rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            self._file.close()
+            raise CredentialIndexError(str(path), "empty file") from e
+
+        try:
+            self._read_header()
+        except CredentialIndexError:
+            self.close()
+            raise
+
+    def _read_header(self) -> None:
+        if len(self._map) < _RECORDS_OFFSET:
+            raise CredentialIndexError(str(self.path), "truncated header")
+        (
+            magic,
+            version,
+            self._bloom_hashes,
+            self._record_count,
+            self._bloom_size,
+            self._bloom_offset,
+            breaches_offset,
+            breaches_length,
+        ) = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise CredentialIndexError(str(self.path), "not a credential index")
+        if version != FORMAT_VERSION:
+            raise CredentialIndexError(str(self.path), f"unsupported version {version}")
+        if breaches_offset + breaches_length > len(self._map):
+            raise CredentialIndexError(str(self.path), "truncated file")
+
+        self._breach_ids: list[str] = json.loads(
+            self._map[breaches_offset : breaches_offset + breaches_length]
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Get the number of (email, breach) records."""
+        return self._record_count
+
+    def __contains__(self, email: object) -> bool:
+        """Check whether an email appears in any breach."""
+        return isinstance(email, str) and bool(self.lookup(email))
+
+    @property
+    def breach_ids(self) -> list[str]:
+        """Breach ids covered by the index."""
+        return list(self._breach_ids)
+
+    def close(self) -> None:
+        """Unmap and close the index file."""
+        self._map.close()
+        self._file.close()
+
+    def lookup(self, email: str) -> list[str]:
+        """Find the breaches an email address appears in.
+
+        Args:
+            email: Email address.
+
+        Returns:
+            Breach ids, in the order they were imported.
+        """
+        return self.lookup_key(email_key(email))
+
+    def lookup_key(self, key: bytes) -> list[str]:
+        """Find the breaches for a precomputed key (see ``email_key``).
+
+        Args:
+            key: 16-byte email key.
+
+        Returns:
+            Breach ids, in the order they were imported.
+        """
+        if len(key) != KEY_SIZE or not self.might_contain(key):
+            return []
+
+        mm = self._map
+        bucket = key[0] << 8 | key[1]
+        low = _UINT64.unpack_from(mm, _HEADER_SIZE + bucket * 8)[0]
+        high = _UINT64.unpack_from(mm, _HEADER_SIZE + (bucket + 1) * 8)[0]
+
+        # Leftmost record with this key
+        while low < high:
+            middle = (low + high) // 2
+            offset = _RECORDS_OFFSET + middle * RECORD_SIZE
+            if mm[offset : offset + KEY_SIZE] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        breaches: list[str] = []
+        offset = _RECORDS_OFFSET + low * RECORD_SIZE
+        end = _RECORDS_OFFSET + self._record_count * RECORD_SIZE
+        while offset < end and mm[offset : offset + KEY_SIZE] == key:
+            ordinal = _ORDINAL.unpack_from(mm, offset + KEY_SIZE)[0]
+            breaches.append(self._breach_ids[ordinal])
+            offset += RECORD_SIZE
+        return breaches
+
+    def might_contain(self, key: bytes) -> bool:
+        """Check the Bloom filter for a key.
+
+        Args:
+            key: 16-byte email key.
+
+        Returns:
+            False if the key is definitely absent.
+        """
+        if self._bloom_size == 0:
+            return False
+        mm = self._map
+        base = self._bloom_offset
+        for bit in _bloom_bits(key, self._bloom_hashes, self._bloom_size):
+            if not mm[base + (bit >> 3)] & (1 << (bit & 7)):
+                return False
+        return True
+
+
+class CredentialIndexBuilder:
+    """Builds a credential index from breach dumps with an external sort.
+
+    Records are buffered up to ``chunk_records``, sorted and spilled to
+    temporary run files, then merged into the index. Memory stays bounded
+    by the chunk size plus the Bloom filter, whatever the dump size.
+
+    Usage:
+        builder = CredentialIndexBuilder("breaches.idx")
+        builder.add_dump_file("linkedin_2021", "linkedin.txt")
+        builder.build()
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        chunk_records: int = DEFAULT_CHUNK_RECORDS,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+        temp_dir: str | Path | None = None,
+    ) -> None:
+        """Initialize the builder.
+
+        Args:
+            path: Output index file (replaced atomically on build).
+            chunk_records: Records sorted in memory per run.
+            false_positive_rate: Target Bloom filter false-positive rate.
+            temp_dir: Directory for run files (defaults to the output's).
+        """
+        self.path = Path(path)
+        self.chunk_records = chunk_records
+        self.false_positive_rate = false_positive_rate
+        self._temp_dir = tempfile.TemporaryDirectory(
+            dir=temp_dir or self.path.parent, prefix=".credidx-"
+        )
+        self._breach_ids: list[str] = []
+        self._ordinals: dict[str, int] = {}
+        self._buffer: list[bytes] = []
+        self._runs: list[Path] = []
+        self._run_records = 0
+        self.skipped_lines = 0
+
+    def add_breach(self, breach_id: str, emails: Iterable[str]) -> int:
+        """Add the email addresses exposed in a breach.
+
+        Args:
+            breach_id: Breach identifier (see BreachDatabase).
+            emails: Email addresses.
+
+        Returns:
+            Number of addresses added.
+        """
+        ordinal = _ORDINAL.pack(self._ordinal(breach_id))
+        added = 0
+        for email in emails:
+            self._buffer.append(email_key(email) + ordinal)
+            added += 1
+            if len(self._buffer) >= self.chunk_records:
+                self._spill()
+        return added
+
+    def add_dump_lines(self, breach_id: str, lines: Iterable[str]) -> int:
+        """Add a breach dump, taking the first email-like field of each line.
+
+        Handles ``email``, ``email:password`` and CSV-style dumps. Lines
+        without an email are counted in ``skipped_lines``.
+
+        Args:
+            breach_id: Breach identifier.
+            lines: Dump lines.
+
+        Returns:
+            Number of addresses added.
+        """
+
+        def emails() -> Iterator[str]:
+            for line in lines:
+                match = _EMAIL_FIELD.search(line)
+                if match is None:
+                    self.skipped_lines += 1
+                    continue
+                yield match.group()
+
+        return self.add_breach(breach_id, emails())
+
+    def add_dump_file(self, breach_id: str, path: str | Path) -> int:
+        """Add a breach dump file.
+
+        Args:
+            breach_id: Breach identifier.
+            path: Dump file path (UTF-8; undecodable bytes are replaced).
+
+        Returns:
+            Number of addresses added.
+        """
+        with Path(path).open(encoding="utf-8", errors="replace") as dump:
+            return self.add_dump_lines(breach_id, dump)
+
+    def build(self) -> int:
+        """Merge all runs into the index file.
+
+        Returns:
+            Number of unique (email, breach) records written.
+        """
+        self._spill()
+        bloom_size, bloom_hashes = _bloom_parameters(self._run_records, self.false_positive_rate)
+        bloom = bytearray((bloom_size + 7) // 8)
+        fanout = [0] * (FANOUT_BUCKETS + 1)
+
+        output = self.path.with_name(self.path.name + ".tmp")
+        records = 0
+        with output.open("wb") as out:
+            out.write(bytes(_RECORDS_OFFSET))
+
+            previous = None
+            previous_key = None
+            pending: list[bytes] = []
+            for record in heapq.merge(*(_read_run(run) for run in self._runs)):
+                if record == previous:
+                    continue
+                previous = record
+                pending.append(record)
+                records += 1
+                key = record[:KEY_SIZE]
+                fanout[(key[0] << 8 | key[1]) + 1] += 1
+                if key != previous_key:
+                    previous_key = key
+                    for bit in _bloom_bits(key, bloom_hashes, bloom_size):
+                        bloom[bit >> 3] |= 1 << (bit & 7)
+                if len(pending) >= 65_536:
+                    out.write(b"".join(pending))
+                    pending.clear()
+            out.write(b"".join(pending))
+
+            bloom_offset = out.tell()
+            out.write(bloom)
+            breaches_offset = out.tell()
+            breach_table = json.dumps(self._breach_ids).encode()
+            out.write(breach_table)
+
+            for bucket in range(FANOUT_BUCKETS):
+                fanout[bucket + 1] += fanout[bucket]
+            out.seek(0)
+            out.write(
+                _HEADER.pack(
+                    MAGIC,
+                    FORMAT_VERSION,
+                    bloom_hashes,
+                    records,
+                    bloom_size,
+                    bloom_offset,
+                    breaches_offset,
+                    len(breach_table),
+                ).ljust(_HEADER_SIZE, b"\0")
+            )
+            out.write(_FANOUT.pack(*fanout))
+
+        os.replace(output, self.path)
+        self._temp_dir.cleanup()
+        logger.info(
+            "credential_index_built",
+            path=str(self.path),
+            records=records,
+            breaches=len(self._breach_ids),
+            bloom_bytes=len(bloom),
+        )
+        return records
+
+    def _ordinal(self, breach_id: str) -> int:
+        ordinal = self._ordinals.get(breach_id)
+        if ordinal is None:
+            if len(self._breach_ids) >= MAX_BREACHES:
+                raise CredentialIndexError(str(self.path), "too many breaches")
+            ordinal = len(self._breach_ids)
+            self._ordinals[breach_id] = ordinal
+            self._breach_ids.append(breach_id)
+        return ordinal
+
+    def _spill(self) -> None:
+        if not self._buffer:
+            return
+        self._buffer.sort()
+        run = Path(self._temp_dir.name) / f"run-{len(self._runs):05d}"
+        with run.open("wb") as out:
+            out.write(b"".join(self._buffer))
+        self._runs.append(run)
+        self._run_records += len(self._buffer)
+        self._buffer.clear()
+
+
+def _read_run(path: Path, block_records: int = 65_536) -> Iterator[bytes]:
+    """Stream the sorted records of a run file."""
+    with path.open("rb") as run:
+        while block := run.read(RECORD_SIZE * block_records):
+            for offset in range(0, len(block), RECORD_SIZE):
+                yield block[offset : offset + RECORD_SIZE]
+
+
+def _bloom_parameters(items: int, false_positive_rate: float) -> tuple[int, int]:
+    """Size a Bloom filter.
+
+    Args:
+        items: Expected number of keys.
+        false_positive_rate: Target false-positive rate.
+
+    Returns:
+        Tuple of (bits, hash count).
+    """
+    items = max(items, 1)
+    bits = math.ceil(-items * math.log(false_positive_rate) / math.log(2) ** 2)
+    bits = max(64, bits)
+    hashes = max(1, round(bits / items * math.log(2)))
+    return bits, hashes
+
+
+def open_credential_index(path: str | Path) -> CredentialIndex:
+    """Open a credential index.
+
+    Args:
+        path: Index file path.
+
+    Returns:
+        Memory-mapped CredentialIndex.
+    """
+    return CredentialIndex(path)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Build a credential index from breach dump files.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv).
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m elile.providers.darkweb.credential_index",
+        description="Build a memory-mapped breached-credential index from dump files.",
+    )
+    parser.add_argument("output", help="index file to write")
+    parser.add_argument(
+        "--dump",
+        action="append",
+        required=True,
+        metavar="BREACH_ID=PATH",
+        help="breach dump file; may be repeated",
+    )
+    parser.add_argument(
+        "--fp-rate",
+        type=float,
+        default=DEFAULT_FALSE_POSITIVE_RATE,
+        help="Bloom filter false-positive rate",
+    )
+    parser.add_argument(
+        "--chunk-records",
+        type=int,
+        default=DEFAULT_CHUNK_RECORDS,
+        help="records sorted in memory per run",
+    )
+    args = parser.parse_args(argv)
+
+    builder = CredentialIndexBuilder(
+        args.output,
+        chunk_records=args.chunk_records,
+        false_positive_rate=args.fp_rate,
+    )
+    for dump in args.dump:
+        breach_id, sep, path = dump.partition("=")
+        if not sep or not breach_id or not path:
+            parser.error(f"--dump must be BREACH_ID=PATH, got {dump!r}")
+        added = builder.add_dump_file(breach_id, path)
+        print(f"{breach_id}: {added} addresses from {path}")
+
+    records = builder.build()
+    print(f"Wrote {records} records to {args.output} ({builder.skipped_lines} lines skipped)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -26,7 +26,9 @@ from elile.providers.types import (
 )
 
 from .breach_database import BreachDatabase, create_breach_database
+from .credential_index import CredentialIndex, open_credential_index
 from .types import (
+    BreachInfo,
     ConfidenceLevel,
     CredentialLeak,
     CredentialType,
@@ -75,6 +77,9 @@ class DarkWebProvider(BaseDataProvider):
         """
         self._config = config or DarkWebProviderConfig()
         self._breach_db = create_breach_database()
+        self._credential_index: CredentialIndex | None = None
+        if self._config.credential_index_path:
+            self._credential_index = open_credential_index(self._config.credential_index_path)
 
         # Provider info
         provider_info = ProviderInfo(
@@ -371,6 +376,9 @@ class DarkWebProvider(BaseDataProvider):
         Returns:
             List of CredentialLeak findings.
         """
+        if self._credential_index is not None:
+            return self._lookup_credential_leaks(self._credential_index, identifiers)
+
         leaks: list[CredentialLeak] = []
 
         for identifier in identifiers:
@@ -403,6 +411,44 @@ class DarkWebProvider(BaseDataProvider):
 
         return leaks
 
+    def _lookup_credential_leaks(
+        self,
+        index: CredentialIndex,
+        identifiers: list[str],
+    ) -> list[CredentialLeak]:
+        """Look up email identifiers in the breached-credential index.
+
+        Args:
+            index: Breached-credential index.
+            identifiers: Identifiers to search for.
+
+        Returns:
+            One CredentialLeak per breach each email appears in.
+        """
+        leaks: list[CredentialLeak] = []
+
+        for identifier in identifiers:
+            if "@" not in identifier:
+                continue
+            for breach_id in index.lookup(identifier):
+                breach = self._breach_db.get_breach(breach_id) or BreachInfo(
+                    breach_id=breach_id, breach_name=breach_id
+                )
+                leaks.append(
+                    CredentialLeak(
+                        leak_id=uuid7(),
+                        email=identifier,
+                        credential_type=CredentialType.EMAIL_PASSWORD,
+                        breach=breach,
+                        source=DarkWebSource.BREACH_DATABASE,
+                        discovered_at=datetime.now(UTC),
+                        last_seen_at=breach.discovered_date,
+                        is_active=None,  # Not checked
+                    )
+                )
+
+        return leaks
+
     async def _search_marketplaces(
         self,
         identifiers: list[str],
@@ -557,9 +603,8 @@ class DarkWebProvider(BaseDataProvider):
 
         # Credential leaks are high severity
         for leak in result.credential_leaks:
-            if (
-                leak.credential_type == CredentialType.PLAINTEXT
-                or (leak.breach and "ssn" in leak.breach.data_types)
+            if leak.credential_type == CredentialType.PLAINTEXT or (
+                leak.breach and "ssn" in leak.breach.data_types
             ):
                 summary["critical"] += 1
             else:
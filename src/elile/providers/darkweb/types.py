@@ -297,6 +297,9 @@ class DarkWebProviderConfig(BaseModel):
         cache_ttl_seconds: How long to cache results.
         timeout_ms: Request timeout in milliseconds.
         min_confidence: Minimum confidence level to report.
+        credential_index_path: Memory-mapped breached-credential index built
+            with ``credential_index``. If unset, credential leaks are
+            simulated from the email domain.
     """
 
     api_key: str | None = None
@@ -308,6 +311,7 @@ class DarkWebProviderConfig(BaseModel):
     cache_ttl_seconds: int = 3600  # 1 hour
     timeout_ms: int = 60000  # 60 seconds (dark web queries can be slow)
     min_confidence: ConfidenceLevel = ConfidenceLevel.MEDIUM
+    credential_index_path: str | None = None
 
 
 # =============================================================================
@@ -357,3 +361,15 @@ class DarkWebServiceUnavailableError(DarkWebProviderError):
         )
         self.service_name = service_name
         self.reason = reason
+
+
+class CredentialIndexError(DarkWebProviderError):
+    """Raised when a breached-credential index file is invalid."""
+
+    def __init__(self, path: str, reason: str) -> None:
+        super().__init__(
+            f"Credential index {path} is invalid: {reason}",
+            details={"path": path, "reason": reason},
+        )
+        self.path = path
+        self.reason = reason
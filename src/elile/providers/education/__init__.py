@@ -36,45 +36,56 @@ Usage:
         print("Education verified!")
 """
 
-from .diploma_mill import (
-    DiplomaMilDetector,
-    create_diploma_mill_detector,
-    is_diploma_mill,
-)
-from .matcher import (
-    DegreeTypeMatcher,
-    InstitutionMatcher,
-    create_institution_matcher,
-)
-from .provider import (
-    EducationProvider,
-    create_education_provider,
-    get_education_provider,
-)
-from .types import (
-    AccreditationType,
-    ClaimedEducation,
-    DegreeType,
-    DiplomaMilDetectedError,
-    EducationDiscrepancy,
-    EducationProviderConfig,
-    EducationProviderError,
-    EducationVerificationResult,
-    Institution,
-    InstitutionMatchResult,
-    InstitutionNotFoundError,
-    InstitutionType,
-    MatchConfidence,
-    VerificationFailedError,
-    VerificationStatus,
-    VerifiedEducation,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .diploma_mill import (
+        DIPLOMA_MILLS,
+        DiplomaMilDetector,
+        create_diploma_mill_detector,
+        is_diploma_mill,
+    )
+    from .matcher import (
+        DegreeTypeMatcher,
+        InstitutionMatcher,
+        create_institution_matcher,
+    )
+    from .name_index import NameIndex
+    from .provider import (
+        INSTITUTIONS,
+        EducationProvider,
+        create_education_provider,
+        get_education_provider,
+    )
+    from .types import (
+        AccreditationType,
+        ClaimedEducation,
+        DegreeType,
+        DiplomaMilDetectedError,
+        EducationDiscrepancy,
+        EducationProviderConfig,
+        EducationProviderError,
+        EducationVerificationResult,
+        Institution,
+        InstitutionMatchResult,
+        InstitutionNotFoundError,
+        InstitutionType,
+        MatchConfidence,
+        VerificationFailedError,
+        VerificationStatus,
+        VerifiedEducation,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Provider
     "EducationProvider",
     "create_education_provider",
     "get_education_provider",
+    "INSTITUTIONS",
     # Types
     "AccreditationType",
     "ClaimedEducation",
@@ -92,8 +103,10 @@ __all__ = [
     "InstitutionMatcher",
     "DegreeTypeMatcher",
     "create_institution_matcher",
+    "NameIndex",
     # Diploma Mill Detection
     "DiplomaMilDetector",
+    "DIPLOMA_MILLS",
     "create_diploma_mill_detector",
     "is_diploma_mill",
     # Exceptions
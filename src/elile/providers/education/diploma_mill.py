@@ -5,10 +5,29 @@ that offer fraudulent degrees with little or no academic requirements.
 """
 
 import re
+from collections.abc import Iterable
 from difflib import SequenceMatcher
 
+from elile.providers.reference_data import reference_dataset
+
+from .name_index import NameIndex
 from .types import AccreditationType, Institution
 
+# Minimum similarity to a known mill to flag a name. High to avoid false
+# positives on legitimate institutions.
+MILL_SIMILARITY_THRESHOLD = 0.92
+
+
+def _normalize(name: str) -> str:
+    """Normalize a name for comparison."""
+    return re.sub(r"[^\w\s]", "", name.lower().strip())
+
+
+def _mill_index(known_mills: Iterable[str]) -> tuple[set[str], NameIndex]:
+    """Normalize known mill names and index them for fuzzy matching."""
+    normalized = {_normalize(name) for name in known_mills}
+    return normalized, NameIndex(normalized)
+
 
 class DiplomaMilDetector:
     """Detector for diploma mills and degree mills.
@@ -136,14 +155,43 @@ class DiplomaMilDetector:
         "world online education accrediting commission",
     }
 
-    def __init__(self) -> None:
-        """Initialize the detector."""
-        # Normalize known mills for matching
-        self._normalized_mills = {self._normalize(name) for name in self.KNOWN_DIPLOMA_MILLS}
+    def __init__(self, known_mills: Iterable[str] | None = None) -> None:
+        """Initialize the detector.
+
+        Args:
+            known_mills: Known diploma mill names (defaults to the shared
+                DIPLOMA_MILLS dataset).
+        """
+        self._custom_mills: tuple[set[str], NameIndex] | None = None
+        if known_mills is not None:
+            self.refresh(known_mills)
+
+    def refresh(self, known_mills: Iterable[str]) -> None:
+        """Replace the known diploma mill names and rebuild the index.
+
+        Only this detector is affected; the shared DIPLOMA_MILLS dataset
+        is updated with ``DIPLOMA_MILLS.publish()``.
+
+        Args:
+            known_mills: Known diploma mill names.
+        """
+        self._custom_mills = _mill_index(known_mills)
+
+    @property
+    def _mills(self) -> tuple[set[str], NameIndex]:
+        """Normalized mill names and their index, built once per dataset generation."""
+        if self._custom_mills is not None:
+            return self._custom_mills
+        return DIPLOMA_MILLS.derived("index", _mill_index)
+
+    @property
+    def _normalized_mills(self) -> set[str]:
+        """Normalized known mill names."""
+        return self._mills[0]
 
     def _normalize(self, name: str) -> str:
         """Normalize a name for comparison."""
-        return re.sub(r"[^\w\s]", "", name.lower().strip())
+        return _normalize(name)
 
     def check_institution(self, institution_name: str) -> list[str]:
         """Check if an institution appears to be a diploma mill.
@@ -156,16 +204,18 @@ class DiplomaMilDetector:
         """
         flags: list[str] = []
         normalized = self._normalize(institution_name)
+        normalized_mills, mill_index = self._mills
 
         # Check against known diploma mills
-        if normalized in self._normalized_mills:
+        if normalized in normalized_mills:
             flags.append(f"Institution '{institution_name}' is in known diploma mill database")
 
-        # Check for fuzzy matches against known mills
-        # Use a high threshold (0.92) to avoid false positives on legitimate institutions
-        for mill in self._normalized_mills:
+        # Check for fuzzy matches against known mills. The index skips mills
+        # that cannot reach the threshold and keeps the set's order.
+        for mill_id in mill_index.within_ratio(normalized, MILL_SIMILARITY_THRESHOLD):
+            mill = mill_index.names[mill_id]
             similarity = SequenceMatcher(None, normalized, mill).ratio()
-            if similarity > 0.92 and normalized != mill:
+            if similarity > MILL_SIMILARITY_THRESHOLD and normalized != mill:
                 flags.append(f"Name very similar to known diploma mill: {mill} ({similarity:.0%})")
                 break
 
@@ -278,6 +328,16 @@ class DiplomaMilDetector:
         return list(set(flags))  # Remove duplicates
 
 
+def _sample_diploma_mills() -> frozenset[str]:
+    """Build the sample diploma mill names."""
+    return frozenset(DiplomaMilDetector.KNOWN_DIPLOMA_MILLS)
+
+
+DIPLOMA_MILLS = reference_dataset(
+    "education.diploma_mills", _sample_diploma_mills, data_type=frozenset[str]
+)
+
+
 def create_diploma_mill_detector() -> DiplomaMilDetector:
     """Factory function to create a DiplomaMilDetector.
 
@@ -5,14 +5,23 @@ handling abbreviations, alternative names, and common variations.
 """
 
 import re
+from collections import Counter
 from difflib import SequenceMatcher
 
+from .name_index import NameIndex
 from .types import (
     Institution,
     InstitutionMatchResult,
     MatchConfidence,
 )
 
+# Institutions ranked highest by shared trigrams are scored before the
+# exhaustive bound check, so the result cutoff rises early
+DEFAULT_CANDIDATE_LIMIT = 25
+
+# Slack on score bounds so float rounding never drops a tied institution
+_BOUND_EPSILON = 1e-9
+
 
 class InstitutionMatcher:
     """Fuzzy matcher for educational institution names.
@@ -28,6 +37,10 @@ class InstitutionMatcher:
         matcher = InstitutionMatcher()
         results = matcher.find_matches("MIT", institutions)
         best_match = results[0] if results else None
+
+        # For a large reference database, index it once and omit the list
+        matcher.build_index(institutions)
+        results = matcher.find_matches("MIT")
     """
 
     # Common abbreviations and their expansions
@@ -70,6 +83,7 @@ class InstitutionMatcher:
         high_threshold: float = 0.85,
         medium_threshold: float = 0.70,
         low_threshold: float = 0.55,
+        candidate_limit: int = DEFAULT_CANDIDATE_LIMIT,
     ) -> None:
         """Initialize the matcher with configurable thresholds.
 
@@ -78,11 +92,40 @@ class InstitutionMatcher:
             high_threshold: Score for high confidence.
             medium_threshold: Score for medium confidence.
             low_threshold: Score for low confidence (minimum to report).
+            candidate_limit: Top trigram candidates scored first on indexed lookups.
         """
         self.exact_threshold = exact_threshold
         self.high_threshold = high_threshold
         self.medium_threshold = medium_threshold
         self.low_threshold = low_threshold
+        self.candidate_limit = candidate_limit
+        self._institutions: list[Institution] = []
+        self._owners: list[int] = []
+        self._index = NameIndex()
+
+    def build_index(self, institutions: list[Institution]) -> None:
+        """Index institutions for lookups with ``find_matches(query)``.
+
+        Call again to refresh the index after the reference data changes.
+
+        Args:
+            institutions: Institutions to index (names and aliases).
+        """
+        names: list[str] = []
+        owners: list[int] = []
+        for position, institution in enumerate(institutions):
+            for name in (institution.name, *institution.aliases):
+                names.append(self.normalize_name(name))
+                owners.append(position)
+
+        self._institutions = list(institutions)
+        self._owners = owners
+        self._index.rebuild(names)
+
+    @property
+    def indexed_count(self) -> int:
+        """Number of institutions in the index."""
+        return len(self._institutions)
 
     def normalize_name(self, name: str) -> str:
         """Normalize an institution name for comparison.
@@ -218,7 +261,7 @@ class InstitutionMatcher:
     def find_matches(
         self,
         query: str,
-        institutions: list[Institution],
+        institutions: list[Institution] | None = None,
         *,
         max_results: int = 5,
     ) -> list[InstitutionMatchResult]:
@@ -226,51 +269,143 @@ class InstitutionMatcher:
 
         Args:
             query: The institution name to search for.
-            institutions: List of institutions to search.
+            institutions: List of institutions to search. If omitted, the
+                institutions passed to ``build_index`` are searched through
+                the index, with identical results.
             max_results: Maximum number of results to return.
 
         Returns:
             List of InstitutionMatchResult sorted by score (highest first).
         """
+        if institutions is None:
+            return self._find_indexed(query, max_results)
+
         results: list[InstitutionMatchResult] = []
 
         for institution in institutions:
-            # Check primary name
-            best_score, best_reasons = self.calculate_score(query, institution.name)
-
-            # Check aliases
-            for alias in institution.aliases:
-                alias_score, alias_reasons = self.calculate_score(query, alias)
-                if alias_score > best_score:
-                    best_score = alias_score
-                    best_reasons = alias_reasons + [f"Matched alias: {alias}"]
-
-            # Only include if meets minimum threshold
-            confidence = self.score_to_confidence(best_score)
-            if confidence != MatchConfidence.NO_MATCH:
-                results.append(
-                    InstitutionMatchResult(
-                        institution=institution,
-                        confidence=confidence,
-                        score=best_score,
-                        match_reasons=best_reasons,
-                    )
-                )
+            result = self._match_institution(query, institution)
+            if result is not None:
+                results.append(result)
 
         # Sort by score (highest first) and limit results
         results.sort(key=lambda r: r.score, reverse=True)
         return results[:max_results]
 
+    def _match_institution(
+        self,
+        query: str,
+        institution: Institution,
+    ) -> InstitutionMatchResult | None:
+        """Score a query against an institution's name and aliases.
+
+        Args:
+            query: The institution name to search for.
+            institution: Institution to score.
+
+        Returns:
+            Match result, or None if below the minimum threshold.
+        """
+        # Check primary name
+        best_score, best_reasons = self.calculate_score(query, institution.name)
+
+        # Check aliases
+        for alias in institution.aliases:
+            alias_score, alias_reasons = self.calculate_score(query, alias)
+            if alias_score > best_score:
+                best_score = alias_score
+                best_reasons = alias_reasons + [f"Matched alias: {alias}"]
+
+        # Only include if meets minimum threshold
+        confidence = self.score_to_confidence(best_score)
+        if confidence == MatchConfidence.NO_MATCH:
+            return None
+        return InstitutionMatchResult(
+            institution=institution,
+            confidence=confidence,
+            score=best_score,
+            match_reasons=best_reasons,
+        )
+
+    def _find_indexed(self, query: str, max_results: int) -> list[InstitutionMatchResult]:
+        """Find matches among indexed institutions.
+
+        Institutions are fully scored only when an upper bound on their
+        score can still reach the current cutoff: the max_results-th best
+        score so far, or the minimum threshold until that many are found.
+        calculate_score adds at most 0.15 (exact abbreviation expansion,
+        looked up directly) or 0.1 (partial expansion, only if the query
+        has expandable tokens) to max(sequence ratio, token score).
+
+        Args:
+            query: The institution name to search for.
+            max_results: Maximum number of results to return.
+
+        Returns:
+            Same results as find_matches over the indexed list.
+        """
+        if max_results <= 0:
+            return []
+
+        index = self._index
+        query_norm = self.normalize_name(query)
+        query_tokens = set(query_norm.split())
+        variants = {self.normalize_name(v) for v in self.expand_abbreviations(query)[1:]}
+        partial_bonus = 0.1 if any(v != query_norm for v in variants) else 0.0
+
+        scored: set[int] = set()
+        best: list[tuple[int, InstitutionMatchResult]] = []
+        cutoff = self.low_threshold
+
+        def score(name_id: int) -> None:
+            nonlocal cutoff
+            position = self._owners[name_id]
+            if position in scored:
+                return
+            scored.add(position)
+            result = self._match_institution(query, self._institutions[position])
+            if result is None:
+                return
+            best.append((position, result))
+            best.sort(key=lambda item: (-item[1].score, item[0]))
+            del best[max_results:]
+            if len(best) == max_results:
+                cutoff = best[-1][1].score
+
+        # Exact and abbreviation-expanded names, then the closest by trigrams
+        for name in (query_norm, *variants):
+            for name_id in index.lookup(name):
+                score(name_id)
+        for name_id in index.ranked_by_trigrams(query_norm, self.candidate_limit):
+            score(name_id)
+
+        # Everything else that can still reach the cutoff. Names outside
+        # these sets have a ratio bound below it and share no tokens.
+        query_counts = Counter(query_norm)
+        candidates = set(index.within_ratio(query_norm, cutoff - partial_bonus - _BOUND_EPSILON))
+        candidates |= index.sharing_tokens(query_norm)
+        for name_id in sorted(candidates):
+            if self._owners[name_id] in scored:
+                continue
+            total = len(query_norm) + len(index.names[name_id])
+            base = max(
+                index.ratio_upper_bound(query_counts, total, name_id),
+                index.token_score(query_tokens, name_id),
+            )
+            if min(1.0, base + partial_bonus) >= cutoff - _BOUND_EPSILON:
+                score(name_id)
+
+        return [result for _, result in best]
+
     def match_single(
         self,
         query: str,
-        institutions: list[Institution],
+        institutions: list[Institution] | None = None,
     ) -> InstitutionMatchResult | None:
         """Find the best matching institution for a query.
 
         Args:
             query: The institution name to search for.
-            institutions: List of institutions to search.
+            institutions: List of institutions to search (None = the index).
 
         Returns:
             Best matching InstitutionMatchResult or None if no match.
@@ -367,6 +502,7 @@ def create_institution_matcher(
     high_threshold: float = 0.85,
     medium_threshold: float = 0.70,
     low_threshold: float = 0.55,
+    candidate_limit: int = DEFAULT_CANDIDATE_LIMIT,
 ) -> InstitutionMatcher:
     """Factory function to create an InstitutionMatcher.
 
@@ -375,6 +511,7 @@ def create_institution_matcher(
         high_threshold: Score for high confidence.
         medium_threshold: Score for medium confidence.
         low_threshold: Minimum score to report.
+        candidate_limit: Top trigram candidates scored first on indexed lookups.
 
     Returns:
         Configured InstitutionMatcher instance.
@@ -384,4 +521,5 @@ def create_institution_matcher(
         high_threshold=high_threshold,
         medium_threshold=medium_threshold,
         low_threshold=low_threshold,
+        candidate_limit=candidate_limit,
     )
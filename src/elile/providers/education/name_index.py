@@ -0,0 +1,204 @@
+"""Inverted index over normalized institution names.
+
+Fuzzy name matching scores a query against every known name with
+SequenceMatcher, which is linear in the size of the reference database.
+NameIndex narrows that down without changing results:
+
+- Trigram postings rank names by shared trigrams, so likely matches are
+  scored first and the caller's score cutoff rises early
+- Token postings find every name sharing a word with the query
+- Names are sorted by length, and each name's character counts are kept,
+  so names whose SequenceMatcher ratio provably cannot reach a cutoff
+  are skipped without being scored
+
+The bounds are the same ones SequenceMatcher.quick_ratio() uses, so any
+name skipped by the index would also have scored below the cutoff.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+
+
+def trigrams(text: str) -> set[str]:
+    """Split text into padded character trigrams.
+
+    Args:
+        text: Normalized text.
+
+    Returns:
+        Set of trigrams; short texts still get at least one.
+    """
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def ratio_bound(matches: int, total_length: int) -> float:
+    """Compute SequenceMatcher's ratio for a given number of matched characters.
+
+    Args:
+        matches: Matched characters (or an upper bound on them).
+        total_length: Combined length of both strings.
+
+    Returns:
+        Ratio, computed exactly as SequenceMatcher does.
+    """
+    if total_length == 0:
+        return 1.0
+    return 2.0 * matches / total_length
+
+
+class NameIndex:
+    """Trigram, token and length index over a list of normalized names.
+
+    Names are identified by their position in the list they were built
+    from, so callers can map them back to their own records.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """Build the index.
+
+        Args:
+            names: Normalized names to index.
+        """
+        self.rebuild(names)
+
+    def rebuild(self, names: Iterable[str]) -> None:
+        """Replace the indexed names.
+
+        Args:
+            names: Normalized names to index.
+        """
+        self.names: list[str] = list(names)
+        self._exact: dict[str, list[int]] = defaultdict(list)
+        self._trigrams: dict[str, list[int]] = defaultdict(list)
+        self._tokens: dict[str, list[int]] = defaultdict(list)
+        self._token_sets: list[set[str]] = []
+        self._char_counts: list[Counter[str]] = []
+
+        for name_id, name in enumerate(self.names):
+            self._exact[name].append(name_id)
+            for gram in trigrams(name):
+                self._trigrams[gram].append(name_id)
+            tokens = set(name.split())
+            self._token_sets.append(tokens)
+            for token in tokens:
+                self._tokens[token].append(name_id)
+            self._char_counts.append(Counter(name))
+
+        self._by_length = sorted(range(len(self.names)), key=lambda i: len(self.names[i]))
+        self._lengths = [len(self.names[i]) for i in self._by_length]
+
+    def __len__(self) -> int:
+        """Get the number of indexed names."""
+        return len(self.names)
+
+    def lookup(self, name: str) -> list[int]:
+        """Get names equal to ``name``.
+
+        Args:
+            name: Normalized name.
+
+        Returns:
+            Matching name ids in ascending order.
+        """
+        return list(self._exact.get(name, ()))
+
+    def ranked_by_trigrams(self, query: str, limit: int) -> list[int]:
+        """Get the names sharing the most trigrams with the query.
+
+        Args:
+            query: Normalized query.
+            limit: Maximum names to return.
+
+        Returns:
+            Name ids, most shared trigrams first (ties by id).
+        """
+        shared: Counter[int] = Counter()
+        for gram in trigrams(query):
+            shared.update(self._trigrams.get(gram, ()))
+        ranked = sorted(shared.items(), key=lambda item: (-item[1], item[0]))
+        return [name_id for name_id, _ in ranked[:limit]]
+
+    def sharing_tokens(self, query: str) -> set[int]:
+        """Get names that share at least one token with the query.
+
+        Args:
+            query: Normalized query.
+
+        Returns:
+            Name ids.
+        """
+        found: set[int] = set()
+        for token in set(query.split()):
+            found.update(self._tokens.get(token, ()))
+        return found
+
+    def token_score(self, query_tokens: set[str], name_id: int) -> float:
+        """Compute the token overlap score used by the matchers.
+
+        Args:
+            query_tokens: Token set of the normalized query.
+            name_id: Indexed name.
+
+        Returns:
+            Shared tokens over the larger token set, or 0.0.
+        """
+        tokens = self._token_sets[name_id]
+        if not query_tokens or not tokens:
+            return 0.0
+        return len(query_tokens & tokens) / max(len(query_tokens), len(tokens))
+
+    def within_ratio(self, query: str, min_ratio: float) -> list[int]:
+        """Get names whose SequenceMatcher ratio with the query may reach ``min_ratio``.
+
+        Uses the length bound to pick a window of name lengths, then the
+        character-count bound on each name in the window.
+
+        Args:
+            query: Normalized query.
+            min_ratio: Ratio the name must be able to reach.
+
+        Returns:
+            Name ids in ascending order (a superset of the names whose
+            actual ratio reaches ``min_ratio``).
+        """
+        if min_ratio <= 0.0:
+            return list(range(len(self.names)))
+
+        if min_ratio > 1.0:
+            return []
+        query_length = len(query)
+        # 2 * min(q, n) / (q + n) >= r  <=>  q * r / (2 - r) <= n <= q * (2 - r) / r
+        low = query_length * min_ratio / (2.0 - min_ratio)
+        high = query_length * (2.0 - min_ratio) / min_ratio
+        start = bisect_left(self._lengths, int(low))
+        end = bisect_right(self._lengths, int(high) + 1)
+
+        query_counts = Counter(query)
+        found = []
+        for name_id in self._by_length[start:end]:
+            total = query_length + len(self.names[name_id])
+            if self.ratio_upper_bound(query_counts, total, name_id) >= min_ratio:
+                found.append(name_id)
+        found.sort()
+        return found
+
+    def ratio_upper_bound(
+        self,
+        query_counts: Counter[str],
+        total_length: int,
+        name_id: int,
+    ) -> float:
+        """Bound the SequenceMatcher ratio between the query and a name.
+
+        Args:
+            query_counts: Character counts of the normalized query.
+            total_length: Length of the query plus the name.
+            name_id: Indexed name.
+
+        Returns:
+            Upper bound on the ratio.
+        """
+        shared = (query_counts & self._char_counts[name_id]).total()
+        return ratio_bound(shared, total_length)
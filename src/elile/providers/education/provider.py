@@ -4,6 +4,8 @@ This module provides the EducationProvider class for verifying education
 credentials through the National Student Clearinghouse and other sources.
 """
 
+from collections import ChainMap
+from collections.abc import Mapping
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from typing import Any
@@ -14,6 +16,7 @@ from elile.compliance.types import CheckType, Locale
 from elile.core.logging import get_logger
 from elile.entity.types import SubjectIdentifiers
 from elile.providers.protocol import BaseDataProvider
+from elile.providers.reference_data import reference_dataset
 from elile.providers.types import (
     CostTier,
     DataSourceCategory,
@@ -76,13 +79,12 @@ class EducationProvider(BaseDataProvider):
             config: Optional provider configuration.
         """
         self._config = config or EducationProviderConfig()
-        self._matcher = create_institution_matcher()
         self._diploma_mill_detector = create_diploma_mill_detector()
 
-        # In-memory institution database (simulated)
-        # In production, this would be populated from actual data sources
-        self._institutions_db: dict[str, Institution] = {}
-        self._load_sample_institutions()
+        # Institutions added to this provider only, layered over the shared
+        # INSTITUTIONS dataset; the matcher is rebuilt once any are indexed
+        self._local_institutions: dict[str, Institution] = {}
+        self._local_matcher: InstitutionMatcher | None = None
 
         # Provider info
         provider_info = ProviderInfo(
@@ -129,7 +131,14 @@ class EducationProvider(BaseDataProvider):
     @property
     def matcher(self) -> InstitutionMatcher:
         """Get the institution matcher."""
-        return self._matcher
+        if self._local_matcher is not None:
+            return self._local_matcher
+        return INSTITUTIONS.derived("matcher", _institution_matcher)
+
+    @property
+    def _institutions_db(self) -> ChainMap[str, Institution]:
+        """Local institutions over those shared by all providers (see INSTITUTIONS)."""
+        return ChainMap(self._local_institutions, INSTITUTIONS.get())
 
     @property
     def diploma_mill_detector(self) -> DiplomaMilDetector:
@@ -296,8 +305,7 @@ class EducationProvider(BaseDataProvider):
         diploma_mill_flags = self._diploma_mill_detector.check_institution(institution_name)
 
         # Try to find in database
-        institutions_list = list(self._institutions_db.values())
-        match_result = self._matcher.match_single(institution_name, institutions_list)
+        match_result = self.matcher.match_single(institution_name)
 
         return {
             "institution_name": institution_name,
@@ -309,6 +317,13 @@ class EducationProvider(BaseDataProvider):
             "match_score": match_result.score if match_result else None,
         }
 
+    def refresh_institution_index(self) -> None:
+        """Rebuild the institution name index from the institution database.
+
+        Call after changing the institution database.
+        """
+        self._local_matcher = _institution_matcher(self._institutions_db)
+
     async def get_institution_database_stats(self) -> dict[str, Any]:
         """Get statistics about the institution database.
 
@@ -363,8 +378,7 @@ class EducationProvider(BaseDataProvider):
                 return result
 
         # Step 2: Find the institution in our database
-        institutions_list = list(self._institutions_db.values())
-        match_result = self._matcher.match_single(claimed.institution_name, institutions_list)
+        match_result = self.matcher.match_single(claimed.institution_name)
 
         if match_result is None:
             result.status = VerificationStatus.NO_RECORD
@@ -647,172 +661,185 @@ class EducationProvider(BaseDataProvider):
             counts[country] = counts.get(country, 0) + 1
         return counts
 
-    def _load_sample_institutions(self) -> None:
-        """Load sample institution data for testing.
 
-        In production, this would load from actual data sources.
-        """
-        sample_institutions = [
-            Institution(
-                institution_id="MIT001",
-                name="Massachusetts Institute of Technology",
-                aliases=["MIT", "Mass Tech"],
-                type=InstitutionType.UNIVERSITY,
-                city="Cambridge",
-                state_province="MA",
-                country="US",
-                accreditation=AccreditationType.REGIONAL_NECHE,
-                accreditor_name="New England Commission of Higher Education",
-                ope_id="00215300",
-                ipeds_id="166683",
-                nsc_code="002178",
-                founded_year=1861,
-                website="https://www.mit.edu",
-            ),
-            Institution(
-                institution_id="HARV001",
-                name="Harvard University",
-                aliases=["Harvard", "Harvard College"],
-                type=InstitutionType.UNIVERSITY,
-                city="Cambridge",
-                state_province="MA",
-                country="US",
-                accreditation=AccreditationType.REGIONAL_NECHE,
-                accreditor_name="New England Commission of Higher Education",
-                ope_id="00215600",
-                ipeds_id="166027",
-                nsc_code="002155",
-                founded_year=1636,
-                website="https://www.harvard.edu",
-            ),
-            Institution(
-                institution_id="STAN001",
-                name="Stanford University",
-                aliases=["Stanford", "Leland Stanford Junior University"],
-                type=InstitutionType.UNIVERSITY,
-                city="Stanford",
-                state_province="CA",
-                country="US",
-                accreditation=AccreditationType.REGIONAL_WASC,
-                accreditor_name="WASC Senior College and University Commission",
-                ope_id="00130500",
-                ipeds_id="243744",
-                nsc_code="001305",
-                founded_year=1885,
-                website="https://www.stanford.edu",
-            ),
-            Institution(
-                institution_id="UCLA001",
-                name="University of California, Los Angeles",
-                aliases=["UCLA", "UC Los Angeles"],
-                type=InstitutionType.UNIVERSITY,
-                city="Los Angeles",
-                state_province="CA",
-                country="US",
-                accreditation=AccreditationType.REGIONAL_WASC,
-                accreditor_name="WASC Senior College and University Commission",
-                ope_id="00131000",
-                ipeds_id="110662",
-                nsc_code="001315",
-                founded_year=1919,
-                website="https://www.ucla.edu",
-            ),
-            Institution(
-                institution_id="NYU001",
-                name="New York University",
-                aliases=["NYU"],
-                type=InstitutionType.UNIVERSITY,
-                city="New York",
-                state_province="NY",
-                country="US",
-                accreditation=AccreditationType.REGIONAL_MSCHE,
-                accreditor_name="Middle States Commission on Higher Education",
-                ope_id="00278500",
-                ipeds_id="193900",
-                nsc_code="002785",
-                founded_year=1831,
-                website="https://www.nyu.edu",
-            ),
-            Institution(
-                institution_id="UCB001",
-                name="University of California, Berkeley",
-                aliases=["UC Berkeley", "Cal", "Berkeley"],
-                type=InstitutionType.UNIVERSITY,
-                city="Berkeley",
-                state_province="CA",
-                country="US",
-                accreditation=AccreditationType.REGIONAL_WASC,
-                accreditor_name="WASC Senior College and University Commission",
-                ope_id="00131200",
-                ipeds_id="110635",
-                nsc_code="001312",
-                founded_year=1868,
-                website="https://www.berkeley.edu",
-            ),
-            Institution(
-                institution_id="UMICH001",
-                name="University of Michigan",
-                aliases=["UMich", "Michigan", "U of M"],
-                type=InstitutionType.UNIVERSITY,
-                city="Ann Arbor",
-                state_province="MI",
-                country="US",
-                accreditation=AccreditationType.REGIONAL_HLC,
-                accreditor_name="Higher Learning Commission",
-                ope_id="00222000",
-                ipeds_id="170976",
-                nsc_code="002325",
-                founded_year=1817,
-                website="https://www.umich.edu",
-            ),
-            Institution(
-                institution_id="OXFD001",
-                name="University of Oxford",
-                aliases=["Oxford", "Oxford University"],
-                type=InstitutionType.UNIVERSITY,
-                city="Oxford",
-                state_province="Oxfordshire",
-                country="GB",
-                accreditation=AccreditationType.INTERNATIONAL,
-                accreditor_name="UK Quality Assurance Agency",
-                founded_year=1096,
-                website="https://www.ox.ac.uk",
-            ),
-            Institution(
-                institution_id="CAMB001",
-                name="University of Cambridge",
-                aliases=["Cambridge", "Cambridge University"],
-                type=InstitutionType.UNIVERSITY,
-                city="Cambridge",
-                state_province="Cambridgeshire",
-                country="GB",
-                accreditation=AccreditationType.INTERNATIONAL,
-                accreditor_name="UK Quality Assurance Agency",
-                founded_year=1209,
-                website="https://www.cam.ac.uk",
-            ),
-            Institution(
-                institution_id="COMM001",
-                name="Santa Monica Community College",
-                aliases=["SMC", "Santa Monica College"],
-                type=InstitutionType.COMMUNITY_COLLEGE,
-                city="Santa Monica",
-                state_province="CA",
-                country="US",
-                accreditation=AccreditationType.REGIONAL_WASC,
-                accreditor_name="WASC Senior College and University Commission",
-                founded_year=1929,
-                website="https://www.smc.edu",
-            ),
-        ]
+# =============================================================================
+# Reference data
+# =============================================================================
 
-        for inst in sample_institutions:
-            self._institutions_db[inst.institution_id] = inst
 
-        logger.info(
-            "sample_institution_data_loaded",
-            total_institutions=len(self._institutions_db),
-        )
+def _sample_institutions() -> dict[str, Institution]:
+    """Build sample institution data for testing.
+
+    In production, institutions are loaded from NSC and registrar data and
+    published with ``INSTITUTIONS.publish()``.
+    """
+    sample_institutions = [
+        Institution(
+            institution_id="MIT001",
+            name="Massachusetts Institute of Technology",
+            aliases=["MIT", "Mass Tech"],
+            type=InstitutionType.UNIVERSITY,
+            city="Cambridge",
+            state_province="MA",
+            country="US",
+            accreditation=AccreditationType.REGIONAL_NECHE,
+            accreditor_name="New England Commission of Higher Education",
+            ope_id="00215300",
+            ipeds_id="166683",
+            nsc_code="002178",
+            founded_year=1861,
+            website="https://www.mit.edu",
+        ),
+        Institution(
+            institution_id="HARV001",
+            name="Harvard University",
+            aliases=["Harvard", "Harvard College"],
+            type=InstitutionType.UNIVERSITY,
+            city="Cambridge",
+            state_province="MA",
+            country="US",
+            accreditation=AccreditationType.REGIONAL_NECHE,
+            accreditor_name="New England Commission of Higher Education",
+            ope_id="00215600",
+            ipeds_id="166027",
+            nsc_code="002155",
+            founded_year=1636,
+            website="https://www.harvard.edu",
+        ),
+        Institution(
+            institution_id="STAN001",
+            name="Stanford University",
+            aliases=["Stanford", "Leland Stanford Junior University"],
+            type=InstitutionType.UNIVERSITY,
+            city="Stanford",
+            state_province="CA",
+            country="US",
+            accreditation=AccreditationType.REGIONAL_WASC,
+            accreditor_name="WASC Senior College and University Commission",
+            ope_id="00130500",
+            ipeds_id="243744",
+            nsc_code="001305",
+            founded_year=1885,
+            website="https://www.stanford.edu",
+        ),
+        Institution(
+            institution_id="UCLA001",
+            name="University of California, Los Angeles",
+            aliases=["UCLA", "UC Los Angeles"],
+            type=InstitutionType.UNIVERSITY,
+            city="Los Angeles",
+            state_province="CA",
+            country="US",
+            accreditation=AccreditationType.REGIONAL_WASC,
+            accreditor_name="WASC Senior College and University Commission",
+            ope_id="00131000",
+            ipeds_id="110662",
+            nsc_code="001315",
+            founded_year=1919,
+            website="https://www.ucla.edu",
+        ),
+        Institution(
+            institution_id="NYU001",
+            name="New York University",
+            aliases=["NYU"],
+            type=InstitutionType.UNIVERSITY,
+            city="New York",
+            state_province="NY",
+            country="US",
+            accreditation=AccreditationType.REGIONAL_MSCHE,
+            accreditor_name="Middle States Commission on Higher Education",
+            ope_id="00278500",
+            ipeds_id="193900",
+            nsc_code="002785",
+            founded_year=1831,
+            website="https://www.nyu.edu",
+        ),
+        Institution(
+            institution_id="UCB001",
+            name="University of California, Berkeley",
+            aliases=["UC Berkeley", "Cal", "Berkeley"],
+            type=InstitutionType.UNIVERSITY,
+            city="Berkeley",
+            state_province="CA",
+            country="US",
+            accreditation=AccreditationType.REGIONAL_WASC,
+            accreditor_name="WASC Senior College and University Commission",
+            ope_id="00131200",
+            ipeds_id="110635",
+            nsc_code="001312",
+            founded_year=1868,
+            website="https://www.berkeley.edu",
+        ),
+        Institution(
+            institution_id="UMICH001",
+            name="University of Michigan",
+            aliases=["UMich", "Michigan", "U of M"],
+            type=InstitutionType.UNIVERSITY,
+            city="Ann Arbor",
+            state_province="MI",
+            country="US",
+            accreditation=AccreditationType.REGIONAL_HLC,
+            accreditor_name="Higher Learning Commission",
+            ope_id="00222000",
+            ipeds_id="170976",
+            nsc_code="002325",
+            founded_year=1817,
+            website="https://www.umich.edu",
+        ),
+        Institution(
+            institution_id="OXFD001",
+            name="University of Oxford",
+            aliases=["Oxford", "Oxford University"],
+            type=InstitutionType.UNIVERSITY,
+            city="Oxford",
+            state_province="Oxfordshire",
+            country="GB",
+            accreditation=AccreditationType.INTERNATIONAL,
+            accreditor_name="UK Quality Assurance Agency",
+            founded_year=1096,
+            website="https://www.ox.ac.uk",
+        ),
+        Institution(
+            institution_id="CAMB001",
+            name="University of Cambridge",
+            aliases=["Cambridge", "Cambridge University"],
+            type=InstitutionType.UNIVERSITY,
+            city="Cambridge",
+            state_province="Cambridgeshire",
+            country="GB",
+            accreditation=AccreditationType.INTERNATIONAL,
+            accreditor_name="UK Quality Assurance Agency",
+            founded_year=1209,
+            website="https://www.cam.ac.uk",
+        ),
+        Institution(
+            institution_id="COMM001",
+            name="Santa Monica Community College",
+            aliases=["SMC", "Santa Monica College"],
+            type=InstitutionType.COMMUNITY_COLLEGE,
+            city="Santa Monica",
+            state_province="CA",
+            country="US",
+            accreditation=AccreditationType.REGIONAL_WASC,
+            accreditor_name="WASC Senior College and University Commission",
+            founded_year=1929,
+            website="https://www.smc.edu",
+        ),
+    ]
+
+    return {inst.institution_id: inst for inst in sample_institutions}
+
+
+def _institution_matcher(institutions: Mapping[str, Institution]) -> InstitutionMatcher:
+    """Build an institution matcher indexed over the institutions."""
+    matcher = create_institution_matcher()
+    matcher.build_index(list(institutions.values()))
+    return matcher
+
+
+INSTITUTIONS = reference_dataset(
+    "education.institutions", _sample_institutions, data_type=dict[str, Institution]
+)
 
 
 # =============================================================================
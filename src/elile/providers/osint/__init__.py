@@ -28,44 +28,58 @@ Example:
     )
 """
 
-from .deduplicator import (
-    DeduplicationResult,
-    OSINTDeduplicator,
-    create_deduplicator,
-)
-from .entity_extractor import (
-    EntityExtractor,
-    RelationshipExtractor,
-    create_entity_extractor,
-    create_relationship_extractor,
-)
-from .provider import (
-    OSINTProvider,
-    create_osint_provider,
-    get_osint_provider,
-)
-from .types import (
-    DataFreshness,
-    DuplicateGroup,
-    EntityType,
-    ExtractedEntity,
-    ExtractedRelationship,
-    NewsMention,
-    OSINTProviderConfig,
-    OSINTProviderError,
-    OSINTRateLimitError,
-    OSINTSearchError,
-    OSINTSearchResult,
-    OSINTSource,
-    OSINTSourceUnavailableError,
-    ProfessionalInfo,
-    PublicRecord,
-    RelationshipType,
-    RelevanceScore,
-    SentimentType,
-    SocialMediaProfile,
-    SourceReliability,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .deduplicator import (
+        DeduplicationResult,
+        OSINTDeduplicator,
+        create_deduplicator,
+    )
+    from .entity_extractor import (
+        EntityExtractor,
+        RelationshipExtractor,
+        TextMatch,
+        create_entity_extractor,
+        create_relationship_extractor,
+        get_scan_pool,
+        scan_text,
+        scan_texts,
+        scan_texts_async,
+        shutdown_scan_pool,
+    )
+    from .near_duplicates import CandidateIndex, MinHasher, SimilarText
+    from .provider import (
+        OSINTProvider,
+        create_osint_provider,
+        get_osint_provider,
+    )
+    from .types import (
+        DataFreshness,
+        DuplicateGroup,
+        EntityType,
+        ExtractedEntity,
+        ExtractedRelationship,
+        NewsMention,
+        OSINTProviderConfig,
+        OSINTProviderError,
+        OSINTRateLimitError,
+        OSINTSearchError,
+        OSINTSearchResult,
+        OSINTSource,
+        OSINTSourceUnavailableError,
+        ProfessionalInfo,
+        PublicRecord,
+        RelationshipType,
+        RelevanceScore,
+        SentimentType,
+        SocialMediaProfile,
+        SourceReliability,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Provider
@@ -93,11 +107,20 @@ __all__ = [
     "OSINTDeduplicator",
     "DeduplicationResult",
     "create_deduplicator",
+    "CandidateIndex",
+    "MinHasher",
+    "SimilarText",
     # Entity extraction
     "EntityExtractor",
     "RelationshipExtractor",
     "create_entity_extractor",
     "create_relationship_extractor",
+    "TextMatch",
+    "scan_text",
+    "scan_texts",
+    "scan_texts_async",
+    "get_scan_pool",
+    "shutdown_scan_pool",
     # Exceptions
     "OSINTProviderError",
     "OSINTSearchError",
@@ -4,12 +4,16 @@ This module provides deduplication logic for OSINT results,
 identifying and merging duplicate entries across sources.
 """
 
+from collections import Counter
+from collections.abc import Callable, Hashable
+from datetime import UTC
 from difflib import SequenceMatcher
 from typing import Any, TypeVar
 from uuid import uuid7
 
 from pydantic import BaseModel
 
+from .near_duplicates import CandidateIndex, MinHasher, SimilarText
 from .types import (
     DuplicateGroup,
     NewsMention,
@@ -20,6 +24,18 @@ from .types import (
 
 T = TypeVar("T", bound=BaseModel)
 
+# Texts at least this long are keyed by LSH bands; shorter ones, and any
+# that could match a shorter one, by character prefixes
+LSH_MIN_TEXT_LENGTH = 32
+
+# Below this threshold fuzzy matches can share too few shingles for LSH
+# to find them reliably, so only character prefixes are used
+LSH_MIN_SIMILARITY_THRESHOLD = 0.8
+
+# Headline matches need publication dates less than 2 days apart, so at
+# most 2 calendar days apart: windows of 3 days, keyed twice, cover them
+_HEADLINE_WINDOW_DAYS = 3
+
 
 class DeduplicationResult(BaseModel):
     """Result of deduplication.
@@ -29,6 +45,7 @@ class DeduplicationResult(BaseModel):
         total_output: Total items after dedup.
         duplicates_removed: Number of duplicates removed.
         duplicate_groups: Groups of duplicates found.
+        comparisons: Pairs checked with the exact match rules.
         items: Deduplicated items.
     """
 
@@ -36,6 +53,7 @@ class DeduplicationResult(BaseModel):
     total_output: int = 0
     duplicates_removed: int = 0
     duplicate_groups: list[DuplicateGroup] = []
+    comparisons: int = 0
     items: list[Any] = []
 
 
@@ -43,19 +61,27 @@ class OSINTDeduplicator:
     """Deduplicates OSINT results across sources.
 
     This class identifies duplicate entries across different sources
-    and merges them into canonical records.
+    and merges them into canonical records. Small inputs are compared
+    pairwise; from ``lsh_min_items`` items on, only candidate pairs that
+    share a blocking key get the match check.
 
     Attributes:
         similarity_threshold: Minimum similarity for duplicate detection.
+        lsh_min_items: Input size from which only candidate pairs are
+            compared.
     """
 
-    def __init__(self, similarity_threshold: float = 0.85) -> None:
+    def __init__(self, similarity_threshold: float = 0.85, lsh_min_items: int = 200) -> None:
         """Initialize the deduplicator.
 
         Args:
             similarity_threshold: Minimum similarity for duplicates.
+            lsh_min_items: Input size from which candidate pairs from
+                blocking keys are compared instead of all pairs.
         """
         self.similarity_threshold = similarity_threshold
+        self.lsh_min_items = lsh_min_items
+        self._hasher = MinHasher()
 
     def deduplicate_profiles(
         self,
@@ -72,25 +98,7 @@ class OSINTDeduplicator:
         if not profiles:
             return DeduplicationResult(items=[])
 
-        groups: list[list[SocialMediaProfile]] = []
-        used: set[int] = set()
-
-        for i, profile in enumerate(profiles):
-            if i in used:
-                continue
-
-            group = [profile]
-            used.add(i)
-
-            for j, other in enumerate(profiles):
-                if j in used:
-                    continue
-
-                if self._profiles_match(profile, other):
-                    group.append(other)
-                    used.add(j)
-
-            groups.append(group)
+        groups, comparisons = self._group(profiles, self._profiles_match, self._profile_keys)
 
         # Merge groups into canonical profiles
         result_profiles = []
@@ -120,6 +128,7 @@ class OSINTDeduplicator:
             total_output=len(result_profiles),
             duplicates_removed=len(profiles) - len(result_profiles),
             duplicate_groups=duplicate_groups,
+            comparisons=comparisons,
             items=result_profiles,
         )
 
@@ -138,25 +147,7 @@ class OSINTDeduplicator:
         if not mentions:
             return DeduplicationResult(items=[])
 
-        groups: list[list[NewsMention]] = []
-        used: set[int] = set()
-
-        for i, mention in enumerate(mentions):
-            if i in used:
-                continue
-
-            group = [mention]
-            used.add(i)
-
-            for j, other in enumerate(mentions):
-                if j in used:
-                    continue
-
-                if self._news_matches(mention, other):
-                    group.append(other)
-                    used.add(j)
-
-            groups.append(group)
+        groups, comparisons = self._group(mentions, self._news_matches, self._news_keys)
 
         # Merge groups into canonical mentions
         result_mentions = []
@@ -186,6 +177,7 @@ class OSINTDeduplicator:
             total_output=len(result_mentions),
             duplicates_removed=len(mentions) - len(result_mentions),
             duplicate_groups=duplicate_groups,
+            comparisons=comparisons,
             items=result_mentions,
         )
 
@@ -204,25 +196,7 @@ class OSINTDeduplicator:
         if not records:
             return DeduplicationResult(items=[])
 
-        groups: list[list[PublicRecord]] = []
-        used: set[int] = set()
-
-        for i, record in enumerate(records):
-            if i in used:
-                continue
-
-            group = [record]
-            used.add(i)
-
-            for j, other in enumerate(records):
-                if j in used:
-                    continue
-
-                if self._records_match(record, other):
-                    group.append(other)
-                    used.add(j)
-
-            groups.append(group)
+        groups, comparisons = self._group(records, self._records_match, self._record_keys)
 
         # Merge groups into canonical records
         result_records = []
@@ -252,6 +226,7 @@ class OSINTDeduplicator:
             total_output=len(result_records),
             duplicates_removed=len(records) - len(result_records),
             duplicate_groups=duplicate_groups,
+            comparisons=comparisons,
             items=result_records,
         )
 
@@ -270,25 +245,9 @@ class OSINTDeduplicator:
         if not infos:
             return DeduplicationResult(items=[])
 
-        groups: list[list[ProfessionalInfo]] = []
-        used: set[int] = set()
-
-        for i, info in enumerate(infos):
-            if i in used:
-                continue
-
-            group = [info]
-            used.add(i)
-
-            for j, other in enumerate(infos):
-                if j in used:
-                    continue
-
-                if self._professional_matches(info, other):
-                    group.append(other)
-                    used.add(j)
-
-            groups.append(group)
+        groups, comparisons = self._group(
+            infos, self._professional_matches, self._professional_keys
+        )
 
         # Merge groups into canonical info
         result_infos = []
@@ -318,9 +277,142 @@ class OSINTDeduplicator:
             total_output=len(result_infos),
             duplicates_removed=len(infos) - len(result_infos),
             duplicate_groups=duplicate_groups,
+            comparisons=comparisons,
             items=result_infos,
         )
 
+    def _group(
+        self,
+        items: list[T],
+        matches: Callable[[T, T], bool],
+        blocking_keys: Callable[[T], list[Hashable]],
+    ) -> tuple[list[list[T]], int]:
+        """Group items with the first unused item of each group as its seed.
+
+        Each item joins the group of the earliest seed it matches. From
+        ``lsh_min_items`` items on, only candidate pairs are checked, which
+        yields the same groups as checking all pairs because the blocking
+        keys cover every way the match check can succeed. The exception is
+        long texts keyed by LSH, which finds lightly edited copies all but
+        always but can miss pairs just above the threshold whose edits are
+        spread across the text (see near_duplicates for measured rates).
+
+        Args:
+            items: Items to group.
+            matches: Exact match check between a seed and another item.
+            blocking_keys: Keys under which an item's duplicates must fall.
+
+        Returns:
+            Tuple of (groups in seed order, number of pairs checked).
+        """
+        index: CandidateIndex | None = None
+        if len(items) >= self.lsh_min_items:
+            index = CandidateIndex()
+            for i, item in enumerate(items):
+                index.add(i, blocking_keys(item))
+
+        groups: list[list[T]] = []
+        used: set[int] = set()
+        comparisons = 0
+
+        for i, item in enumerate(items):
+            if i in used:
+                continue
+
+            group = [item]
+            used.add(i)
+
+            others = index.candidates(i) if index is not None else range(i + 1, len(items))
+            for j in others:
+                if j in used:
+                    continue
+
+                comparisons += 1
+                if matches(item, items[j]):
+                    group.append(items[j])
+                    used.add(j)
+
+            groups.append(group)
+
+        return groups, comparisons
+
+    def _text_keys(
+        self,
+        namespace: str,
+        text: str | None,
+        threshold: float,
+        scopes: tuple[Hashable, ...] = (None,),
+    ) -> list[Hashable]:
+        """Blocking keys for a fuzzy text rule.
+
+        Long texts get LSH band keys. Texts that could reach the threshold
+        against one shorter than ``LSH_MIN_TEXT_LENGTH`` also get a
+        ``SimilarText`` key under each of ``scopes``, so mixed pairs are
+        never missed.
+        """
+        if not text:
+            return []
+        if threshold < LSH_MIN_SIMILARITY_THRESHOLD:
+            return [SimilarText((namespace, scope), ((text, threshold),)) for scope in scopes]
+        keys: list[Hashable] = []
+        if len(text) >= LSH_MIN_TEXT_LENGTH:
+            keys.extend(self._hasher.band_keys(namespace, text))
+        if len(text) * threshold < LSH_MIN_TEXT_LENGTH * (2.0 - threshold):
+            keys.extend(SimilarText((namespace, scope), ((text, threshold),)) for scope in scopes)
+        return keys
+
+    def _profile_keys(self, profile: SocialMediaProfile) -> list[Hashable]:
+        """Blocking keys covering every way _profiles_match can succeed."""
+        keys: list[Hashable] = []
+        if profile.username:
+            keys.append(("username", profile.source, profile.username))
+        name = (profile.display_name, self.similarity_threshold)
+        if profile.location:
+            keys.append(SimilarText(("display_name", profile.location), (name,)))
+        if profile.bio:
+            keys.append(SimilarText("display_name_bio", (name, (profile.bio, 0.7))))
+        return keys
+
+    def _news_keys(self, mention: NewsMention) -> list[Hashable]:
+        """Blocking keys covering every way _news_matches can succeed."""
+        keys: list[Hashable] = []
+        if mention.url:
+            keys.append(("url", mention.url))
+        if mention.published_at:
+            published = mention.published_at
+            if published.tzinfo is not None:
+                published = published.astimezone(UTC)
+            window = published.toordinal() // _HEADLINE_WINDOW_DAYS
+            keys.extend(
+                self._text_keys(
+                    "headline", mention.headline, self.similarity_threshold, (window, window + 1)
+                )
+            )
+        keys.extend(self._text_keys("snippet", mention.snippet, 0.9))
+        return keys
+
+    def _record_keys(self, record: PublicRecord) -> list[Hashable]:
+        """Blocking keys covering every way _records_match can succeed."""
+        keys: list[Hashable] = []
+        if record.case_number and record.jurisdiction:
+            keys.append(("case", record.case_number, record.jurisdiction))
+        if record.url:
+            keys.append(("url", record.url))
+        if record.filing_date is not None:
+            # Title matches also require the same filing date
+            title = ((record.title, self.similarity_threshold),)
+            keys.append(SimilarText(("title", record.filing_date), title))
+        return keys
+
+    def _professional_keys(self, info: ProfessionalInfo) -> list[Hashable]:
+        """Blocking keys covering every way _professional_matches can succeed."""
+        keys: list[Hashable] = []
+        if info.current_company and info.current_title:
+            keys.append(("role", info.current_company, info.current_title))
+        if info.company_url:
+            keys.append(("company_url", info.company_url))
+        return keys
+
     def _string_similarity(self, s1: str | None, s2: str | None) -> float:
         """Calculate string similarity using SequenceMatcher.
 
@@ -335,6 +427,31 @@ class OSINTDeduplicator:
             return 0.0
         return SequenceMatcher(None, s1.lower(), s2.lower()).ratio()
 
+    def _similar(self, s1: str | None, s2: str | None, threshold: float) -> bool:
+        """Check ``_string_similarity(s1, s2) >= threshold`` cheaply.
+
+        Upper bounds from string lengths and character counts rule out most
+        non-matches before a SequenceMatcher is built.
+
+        Args:
+            s1: First string.
+            s2: Second string.
+            threshold: Minimum similarity.
+
+        Returns:
+            True if the similarity reaches the threshold.
+        """
+        if not s1 or not s2:
+            return threshold <= 0.0
+        a, b = s1.lower(), s2.lower()
+        total = len(a) + len(b)
+        # Same expressions as SequenceMatcher.real_quick_ratio and quick_ratio
+        if 2.0 * min(len(a), len(b)) / total < threshold:
+            return False
+        if 2.0 * (Counter(a) & Counter(b)).total() / total < threshold:
+            return False
+        return SequenceMatcher(None, a, b).ratio() >= threshold
+
     def _profiles_match(
         self,
         p1: SocialMediaProfile,
@@ -354,11 +471,10 @@ class OSINTDeduplicator:
             return True
 
         # Check display name similarity
-        name_sim = self._string_similarity(p1.display_name, p2.display_name)
-        if name_sim >= self.similarity_threshold:
+        if self._similar(p1.display_name, p2.display_name, self.similarity_threshold):
             # Additional signals
             location_match = p1.location and p1.location == p2.location
-            bio_sim = self._string_similarity(p1.bio, p2.bio) >= 0.7
+            bio_sim = self._similar(p1.bio, p2.bio, 0.7)
             if location_match or bio_sim:
                 return True
 
@@ -434,19 +550,17 @@ class OSINTDeduplicator:
             return True
 
         # Check headline similarity
-        headline_sim = self._string_similarity(n1.headline, n2.headline)
         if (
-            headline_sim >= self.similarity_threshold
-            and n1.published_at
+            n1.published_at
             and n2.published_at
+            and self._similar(n1.headline, n2.headline, self.similarity_threshold)
         ):
             days_diff = abs((n1.published_at - n2.published_at).days)
             if days_diff <= 1:
                 return True
 
         # Check snippet similarity for syndicated content
-        snippet_sim = self._string_similarity(n1.snippet, n2.snippet)
-        return snippet_sim >= 0.9
+        return self._similar(n1.snippet, n2.snippet, 0.9)
 
     def _news_similarity(self, n1: NewsMention, n2: NewsMention) -> float:
         """Calculate similarity between news mentions.
@@ -518,11 +632,10 @@ class OSINTDeduplicator:
             return True
 
         # Similar title with same filing date
-        title_sim = self._string_similarity(r1.title, r2.title)
         return (
-            title_sim >= self.similarity_threshold
-            and r1.filing_date is not None
+            r1.filing_date is not None
             and r1.filing_date == r2.filing_date
+            and self._similar(r1.title, r2.title, self.similarity_threshold)
         )
 
     def _record_similarity(self, r1: PublicRecord, r2: PublicRecord) -> float:
@@ -594,13 +707,12 @@ class OSINTDeduplicator:
         ):
             return True
 
-        # Check company URL match
-        if p1.company_url and p1.company_url == p2.company_url:
-            title_sim = self._string_similarity(p1.current_title, p2.current_title)
-            if title_sim >= 0.8:
-                return True
-
-        return False
+        # Same company URL with a similar title
+        return bool(
+            p1.company_url
+            and p1.company_url == p2.company_url
+            and self._similar(p1.current_title, p2.current_title, 0.8)
+        )
 
     def _professional_similarity(
         self,
@@ -668,13 +780,17 @@ class OSINTDeduplicator:
         return canonical
 
 
-def create_deduplicator(similarity_threshold: float = 0.85) -> OSINTDeduplicator:
+def create_deduplicator(
+    similarity_threshold: float = 0.85,
+    lsh_min_items: int = 200,
+) -> OSINTDeduplicator:
     """Create an OSINT deduplicator.
 
     Args:
         similarity_threshold: Similarity threshold for dedup.
+        lsh_min_items: Input size from which LSH candidate pairs are used.
 
     Returns:
         Configured deduplicator.
     """
-    return OSINTDeduplicator(similarity_threshold=similarity_threshold)
+    return OSINTDeduplicator(similarity_threshold=similarity_threshold, lsh_min_items=lsh_min_items)
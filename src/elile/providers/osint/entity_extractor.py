@@ -2,9 +2,21 @@
 
 This module provides extraction of entities and relationships
 from OSINT data using pattern matching and NLP techniques.
+
+Free text is scanned once with a combined pattern (see ``scan_text``).
+Large batches of text are scanned across a shared process pool with
+``scan_texts``, or ``scan_texts_async`` from the event loop.
 """
 
+import asyncio
+import atexit
+import multiprocessing
+import os
 import re
+import threading
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from uuid import uuid7
 
@@ -20,6 +32,23 @@ from .types import (
     SocialMediaProfile,
 )
 
+# Scan batches below this many characters inline; a process pool only
+# pays off for large volumes of text
+PARALLEL_SCAN_MIN_CHARS = 1_000_000
+
+CONTEXT_WINDOW = 50
+
+
+@dataclass(frozen=True, slots=True)
+class TextMatch:
+    """An entity found in free text."""
+
+    entity_type: EntityType
+    value: str
+    start: int
+    end: int
+    context: str
+
 
 class EntityExtractor:
     """Extract entities from OSINT data.
@@ -85,9 +114,22 @@ class EntityExtractor:
         "executive",
     }
 
-    def __init__(self) -> None:
-        """Initialize the entity extractor."""
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        parallel_min_chars: int = PARALLEL_SCAN_MIN_CHARS,
+    ) -> None:
+        """Initialize the entity extractor.
+
+        Args:
+            max_workers: Process pool size for large batches (None = CPU count).
+            parallel_min_chars: Batches with at least this many characters of
+                free text are scanned in a process pool.
+        """
+        self.max_workers = max_workers
+        self.parallel_min_chars = parallel_min_chars
         self._entity_cache: dict[str, ExtractedEntity] = {}
+        self._scanned: dict[str, list[TextMatch]] = {}
 
     def extract_from_profiles(
         self,
@@ -102,6 +144,7 @@ class EntityExtractor:
             List of extracted entities.
         """
         entities: list[ExtractedEntity] = []
+        self._prescan(_free_texts(profiles))
 
         for profile in profiles:
             # Extract person entity from profile
@@ -143,6 +186,7 @@ class EntityExtractor:
             List of extracted entities.
         """
         entities: list[ExtractedEntity] = []
+        self._prescan(_free_texts(mentions))
 
         for mention in mentions:
             # Process headline
@@ -198,6 +242,7 @@ class EntityExtractor:
             List of extracted entities.
         """
         entities: list[ExtractedEntity] = []
+        self._prescan(_free_texts(records))
 
         for record in records:
             # Extract parties
@@ -332,86 +377,54 @@ class EntityExtractor:
         Returns:
             List of extracted entities.
         """
-        entities: list[ExtractedEntity] = []
-
-        # Extract emails
-        for match in self.EMAIL_PATTERN.finditer(text):
-            entity = self._get_or_create_entity(
-                name=match.group(),
-                entity_type=EntityType.EMAIL,
-                source=source,
-                context=self._get_context(text, match.start(), match.end()),
-            )
-            entities.append(entity)
-
-        # Extract phones
-        for match in self.PHONE_PATTERN.finditer(text):
-            entity = self._get_or_create_entity(
-                name=match.group(),
-                entity_type=EntityType.PHONE,
+        matches = self._scanned.pop(text, None)
+        if matches is None:
+            matches = scan_text(text)
+
+        return [
+            self._get_or_create_entity(
+                name=match.value,
+                entity_type=match.entity_type,
                 source=source,
-                context=self._get_context(text, match.start(), match.end()),
+                context=match.context,
             )
-            entities.append(entity)
+            for match in matches
+        ]
 
-        # Extract URLs
-        for match in self.URL_PATTERN.finditer(text):
-            entity = self._get_or_create_entity(
-                name=match.group(),
-                entity_type=EntityType.URL,
-                source=source,
-                context=self._get_context(text, match.start(), match.end()),
-            )
-            entities.append(entity)
-
-        # Extract social handles
-        for match in self.SOCIAL_HANDLE_PATTERN.finditer(text):
-            entity = self._get_or_create_entity(
-                name=match.group(),
-                entity_type=EntityType.SOCIAL_HANDLE,
-                source=source,
-                context=self._get_context(text, match.start(), match.end()),
-            )
-            entities.append(entity)
+    async def prescan(self, items: Iterable[object]) -> None:
+        """Scan the free text of a large batch of items in the process pool.
 
-        # Extract money
-        for match in self.MONEY_PATTERN.finditer(text):
-            entity = self._get_or_create_entity(
-                name=match.group(),
-                entity_type=EntityType.MONEY,
-                source=source,
-                context=self._get_context(text, match.start(), match.end()),
-            )
-            entities.append(entity)
+        Call before the ``extract_from_*`` method for the items, from the
+        event loop; the extraction then reuses the matches. Small batches
+        are left to be scanned inline.
 
-        # Extract dates
-        for pattern in self.DATE_PATTERNS:
-            for match in pattern.finditer(text):
-                entity = self._get_or_create_entity(
-                    name=match.group(),
-                    entity_type=EntityType.DATE,
-                    source=source,
-                    context=self._get_context(text, match.start(), match.end()),
-                )
-                entities.append(entity)
+        Args:
+            items: Profiles, news mentions or public records.
+        """
+        batch = self._unscanned(_free_texts(items))
+        if batch:
+            results = await scan_texts_async(batch, max_workers=self.max_workers)
+            self._scanned.update(zip(batch, results, strict=True))
 
-        return entities
+    def _prescan(self, texts: Iterable[str | None]) -> None:
+        """Scan a large batch of texts across the process pool up front.
 
-    def _get_context(self, text: str, start: int, end: int, window: int = 50) -> str:
-        """Get context around a match.
+        Small batches are left to ``_extract_from_text`` to scan inline.
 
         Args:
-            text: Full text.
-            start: Match start position.
-            end: Match end position.
-            window: Context window size.
-
-        Returns:
-            Context string.
+            texts: Texts the caller is about to extract from.
         """
-        context_start = max(0, start - window)
-        context_end = min(len(text), end + window)
-        return text[context_start:context_end].strip()
+        batch = self._unscanned(texts)
+        if batch:
+            results = scan_texts(batch, max_workers=self.max_workers, min_parallel_chars=0)
+            self._scanned.update(zip(batch, results, strict=True))
+
+    def _unscanned(self, texts: Iterable[str | None]) -> list[str]:
+        """Get the texts not scanned yet, if together they are large enough for the pool."""
+        batch = [text for text in dict.fromkeys(texts) if text and text not in self._scanned]
+        if len(batch) < 2 or sum(map(len, batch)) < self.parallel_min_chars:
+            return []
+        return batch
 
     def _get_or_create_entity(
         self,
@@ -541,6 +554,186 @@ class EntityExtractor:
     def clear_cache(self) -> None:
         """Clear the entity cache."""
         self._entity_cache.clear()
+        self._scanned.clear()
+
+
+_SCAN_GROUPS: dict[str, EntityType] = {
+    "url": EntityType.URL,
+    "email": EntityType.EMAIL,
+    "date": EntityType.DATE,
+    "phone": EntityType.PHONE,
+    "money": EntityType.MONEY,
+    "handle": EntityType.SOCIAL_HANDLE,
+}
+
+# One alternation over all text patterns. Where matches would overlap the
+# earlier alternative wins, so an email is not also reported as a handle
+# and a URL is not split into a phone number (the separate per-pattern
+# passes this replaces reported both).
+_SCAN_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern})"
+        for name, pattern in (
+            ("url", EntityExtractor.URL_PATTERN.pattern),
+            ("email", EntityExtractor.EMAIL_PATTERN.pattern),
+            ("date", "|".join(p.pattern for p in EntityExtractor.DATE_PATTERNS)),
+            ("phone", EntityExtractor.PHONE_PATTERN.pattern),
+            ("money", EntityExtractor.MONEY_PATTERN.pattern),
+            ("handle", EntityExtractor.SOCIAL_HANDLE_PATTERN.pattern),
+        )
+    )
+)
+
+
+def scan_text(text: str, window: int = CONTEXT_WINDOW) -> list[TextMatch]:
+    """Find emails, phones, URLs, handles, money and dates in one pass.
+
+    Args:
+        text: Text to scan.
+        window: Characters of context on each side of a match.
+
+    Returns:
+        Matches in text order.
+    """
+    matches: list[TextMatch] = []
+    for match in _SCAN_PATTERN.finditer(text):
+        start, end = match.span()
+        matches.append(
+            TextMatch(
+                entity_type=_SCAN_GROUPS[match.lastgroup],  # type: ignore[index]
+                value=match.group(),
+                start=start,
+                end=end,
+                context=text[max(0, start - window) : end + window].strip(),
+            )
+        )
+    return matches
+
+
+def scan_texts(
+    texts: Sequence[str],
+    *,
+    max_workers: int | None = None,
+    min_parallel_chars: int = PARALLEL_SCAN_MIN_CHARS,
+) -> list[list[TextMatch]]:
+    """Scan many texts, using the shared process pool for large batches.
+
+    This blocks until the scan is done; from the event loop, use
+    ``scan_texts_async``.
+
+    Args:
+        texts: Texts to scan.
+        max_workers: Process pool size if the pool is not running yet
+            (None = CPU count).
+        min_parallel_chars: Batches smaller than this are scanned inline.
+
+    Returns:
+        Matches for each text, in input order.
+    """
+    if len(texts) < 2 or sum(map(len, texts)) < min_parallel_chars:
+        return [scan_text(text) for text in texts]
+
+    pool = get_scan_pool(max_workers)
+    chunks = pool.map(_scan_chunk, _chunked(texts))
+    return [matches for chunk in chunks for matches in chunk]
+
+
+async def scan_texts_async(
+    texts: Sequence[str],
+    *,
+    max_workers: int | None = None,
+    min_parallel_chars: int = PARALLEL_SCAN_MIN_CHARS,
+) -> list[list[TextMatch]]:
+    """Scan many texts without blocking the event loop.
+
+    Large batches are submitted to the shared process pool; small ones are
+    scanned inline.
+
+    Args:
+        texts: Texts to scan.
+        max_workers: Process pool size if the pool is not running yet
+            (None = CPU count).
+        min_parallel_chars: Batches smaller than this are scanned inline.
+
+    Returns:
+        Matches for each text, in input order.
+    """
+    if len(texts) < 2 or sum(map(len, texts)) < min_parallel_chars:
+        return [scan_text(text) for text in texts]
+
+    loop = asyncio.get_running_loop()
+    pool = get_scan_pool(max_workers)
+    chunks = await asyncio.gather(
+        *(loop.run_in_executor(pool, _scan_chunk, chunk) for chunk in _chunked(texts))
+    )
+    return [matches for chunk in chunks for matches in chunk]
+
+
+_scan_pool: ProcessPoolExecutor | None = None
+_scan_pool_workers = 0
+_scan_pool_lock = threading.Lock()
+
+
+def get_scan_pool(max_workers: int | None = None) -> ProcessPoolExecutor:
+    """Get the process pool for text scanning, starting it on first use.
+
+    The pool lives until ``shutdown_scan_pool`` or interpreter exit. Its
+    workers are started by a fork server (spawned where that is not
+    available) rather than forked from this process, which may be running
+    other threads.
+
+    Args:
+        max_workers: Pool size if the pool is not running yet (None = CPU count).
+
+    Returns:
+        The shared pool.
+    """
+    global _scan_pool, _scan_pool_workers
+    with _scan_pool_lock:
+        if _scan_pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            method = "forkserver" if "forkserver" in methods else "spawn"
+            _scan_pool_workers = max_workers or os.cpu_count() or 1
+            _scan_pool = ProcessPoolExecutor(
+                max_workers=_scan_pool_workers,
+                mp_context=multiprocessing.get_context(method),
+            )
+        return _scan_pool
+
+
+def shutdown_scan_pool() -> None:
+    """Stop the text scanning pool; the next large scan starts a new one."""
+    global _scan_pool
+    with _scan_pool_lock:
+        pool, _scan_pool = _scan_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_scan_pool)
+
+
+def _scan_chunk(texts: list[str]) -> list[list[TextMatch]]:
+    return [scan_text(text) for text in texts]
+
+
+def _chunked(texts: Sequence[str]) -> list[list[str]]:
+    """Split texts into about four chunks per pool worker, in order."""
+    size = max(1, len(texts) // (_scan_pool_workers * 4))
+    return [list(texts[i : i + size]) for i in range(0, len(texts), size)]
+
+
+def _free_texts(items: Iterable[object]) -> Iterable[str | None]:
+    """Get the free text fields of profiles, news mentions and public records."""
+    for item in items:
+        if isinstance(item, SocialMediaProfile):
+            yield item.bio
+        elif isinstance(item, NewsMention):
+            yield item.headline
+            yield item.snippet
+        elif isinstance(item, PublicRecord):
+            yield item.title
+            yield item.summary
 
 
 class RelationshipExtractor:
@@ -826,13 +1019,20 @@ class RelationshipExtractor:
         self._relationship_cache.clear()
 
 
-def create_entity_extractor() -> EntityExtractor:
+def create_entity_extractor(
+    max_workers: int | None = None,
+    parallel_min_chars: int = PARALLEL_SCAN_MIN_CHARS,
+) -> EntityExtractor:
     """Create an entity extractor.
 
+    Args:
+        max_workers: Process pool size for large batches (None = CPU count).
+        parallel_min_chars: Free-text volume that triggers parallel scanning.
+
     Returns:
         Entity extractor instance.
     """
-    return EntityExtractor()
+    return EntityExtractor(max_workers=max_workers, parallel_min_chars=parallel_min_chars)
 
 
 def create_relationship_extractor() -> RelationshipExtractor:
@@ -7,6 +7,9 @@ multiple open-source intelligence sources into a unified profile.
 import asyncio
 import hashlib
 import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any
@@ -27,10 +30,15 @@ from elile.providers.types import (
 
 from .deduplicator import create_deduplicator
 from .entity_extractor import (
+    EntityExtractor,
+    RelationshipExtractor,
     create_entity_extractor,
     create_relationship_extractor,
 )
 from .types import (
+    DuplicateGroup,
+    ExtractedEntity,
+    ExtractedRelationship,
     NewsMention,
     OSINTProviderConfig,
     OSINTSearchResult,
@@ -46,6 +54,44 @@ from .types import (
 # Singleton instance
 _osint_provider: "OSINTProvider | None" = None
 
+# Source names, also the keys of OSINTProviderConfig.source_timeouts_ms
+_SOCIAL_MEDIA = "social_media"
+_NEWS = "news"
+_PUBLIC_RECORDS = "public_records"
+_PROFESSIONAL = "professional"
+
+
+@dataclass
+class _SourceSearch:
+    """An enabled source and the search that queries it."""
+
+    name: str
+    label: str
+    platforms: int
+    search: Callable[[str, list[str]], Awaitable[list[Any]]]
+
+
+@dataclass
+class _SourceOutcome:
+    """Result of running one source search."""
+
+    name: str
+    platforms: int
+    items: list[Any]
+    latency_ms: int
+    error: str | None = None
+    timed_out: bool = False
+
+
+@dataclass
+class _ProcessedSource:
+    """One source's results after deduplication and extraction."""
+
+    items: list[Any] = field(default_factory=list)
+    duplicate_groups: list[DuplicateGroup] = field(default_factory=list)
+    entities: list[ExtractedEntity] = field(default_factory=list)
+    relationships: list[ExtractedRelationship] = field(default_factory=list)
+
 
 class OSINTProvider(BaseDataProvider):
     """OSINT Aggregator Provider.
@@ -64,9 +110,9 @@ class OSINTProvider(BaseDataProvider):
             config: Optional configuration.
         """
         self.config = config or OSINTProviderConfig()
-        self._deduplicator = create_deduplicator(self.config.dedup_similarity_threshold)
-        self._entity_extractor = create_entity_extractor()
-        self._relationship_extractor = create_relationship_extractor()
+        self._deduplicator = create_deduplicator(
+            self.config.dedup_similarity_threshold, self.config.dedup_lsh_min_items
+        )
 
         # Define provider info
         provider_info = ProviderInfo(
@@ -204,6 +250,11 @@ class OSINTProvider(BaseDataProvider):
     ) -> OSINTSearchResult:
         """Gather OSINT from all enabled sources.
 
+        Enabled sources are searched concurrently, each under its own
+        timeout. Deduplication and extraction run on each source's results
+        as soon as they arrive, and sources that fail or time out are
+        reported in ``errors`` while the remaining results are returned.
+
         Args:
             subject_name: Name of the subject.
             identifiers: Additional identifiers to search.
@@ -215,121 +266,58 @@ class OSINTProvider(BaseDataProvider):
         search_id = uuid7()
         start_time = datetime.utcnow()
         errors: list[str] = []
+        timed_out_sources: list[str] = []
+        source_latencies_ms: dict[str, int] = {}
 
-        # Initialize result collections
-        social_profiles: list[SocialMediaProfile] = []
-        news_mentions: list[NewsMention] = []
-        public_records: list[PublicRecord] = []
-        professional_info: list[ProfessionalInfo] = []
+        # Per-call extractors: extraction now spans awaits, so concurrent
+        # searches must not share extractor caches
+        entity_extractor = create_entity_extractor()
+        relationship_extractor = create_relationship_extractor()
+        processed: dict[str, _ProcessedSource] = {}
 
         sources_searched = 0
         sources_with_results = 0
+        total_items = 0
 
-        # Gather from enabled sources based on check type
-        if self.config.enable_social_media and (
-            check_type is None or check_type == CheckType.SOCIAL_MEDIA
-        ):
-            try:
-                profiles = await self._search_social_media(subject_name, identifiers)
-                social_profiles.extend(profiles)
-                sources_searched += 5  # Approximate social platforms
-                if profiles:
-                    sources_with_results += 1
-            except Exception as e:
-                errors.append(f"Social media search failed: {e}")
-
-        if self.config.enable_news_search and (
-            check_type is None or check_type == CheckType.ADVERSE_MEDIA
-        ):
-            try:
-                mentions = await self._search_news(subject_name, identifiers)
-                news_mentions.extend(mentions)
-                sources_searched += 3  # Approximate news sources
-                if mentions:
-                    sources_with_results += 1
-            except Exception as e:
-                errors.append(f"News search failed: {e}")
-
-        if self.config.enable_public_records and (
-            check_type is None or check_type == CheckType.DIGITAL_FOOTPRINT
-        ):
-            try:
-                records = await self._search_public_records(subject_name, identifiers)
-                public_records.extend(records)
-                sources_searched += 4  # Approximate record sources
-                if records:
-                    sources_with_results += 1
-            except Exception as e:
-                errors.append(f"Public records search failed: {e}")
-
-        if self.config.enable_professional:
-            try:
-                infos = await self._search_professional(subject_name, identifiers)
-                professional_info.extend(infos)
-                sources_searched += 2  # LinkedIn, etc.
-                if infos:
+        tasks = [
+            asyncio.create_task(self._run_source(source, subject_name, identifiers))
+            for source in self._enabled_sources(check_type)
+        ]
+        try:
+            for next_outcome in asyncio.as_completed(tasks):
+                outcome = await next_outcome
+                source_latencies_ms[outcome.name] = outcome.latency_ms
+                if outcome.error is not None:
+                    errors.append(outcome.error)
+                    if outcome.timed_out:
+                        timed_out_sources.append(outcome.name)
+                    continue
+
+                sources_searched += outcome.platforms
+                total_items += len(outcome.items)
+                if outcome.items:
                     sources_with_results += 1
-            except Exception as e:
-                errors.append(f"Professional search failed: {e}")
-
-        # Count totals before dedup
-        total_items = (
-            len(social_profiles) + len(news_mentions) + len(public_records) + len(professional_info)
-        )
-
-        # Deduplicate if enabled
-        duplicate_groups = []
-        if self.config.enable_deduplication:
-            # Dedupe profiles
-            profile_result = self._deduplicator.deduplicate_profiles(social_profiles)
-            social_profiles = profile_result.items
-            duplicate_groups.extend(profile_result.duplicate_groups)
-
-            # Dedupe news
-            news_result = self._deduplicator.deduplicate_news(news_mentions)
-            news_mentions = news_result.items
-            duplicate_groups.extend(news_result.duplicate_groups)
-
-            # Dedupe records
-            record_result = self._deduplicator.deduplicate_records(public_records)
-            public_records = record_result.items
-            duplicate_groups.extend(record_result.duplicate_groups)
-
-            # Dedupe professional
-            prof_result = self._deduplicator.deduplicate_professional(professional_info)
-            professional_info = prof_result.items
-            duplicate_groups.extend(prof_result.duplicate_groups)
-
-        unique_items = (
-            len(social_profiles) + len(news_mentions) + len(public_records) + len(professional_info)
-        )
+                processed[outcome.name] = await self._process_source(
+                    outcome.name,
+                    outcome.items,
+                    subject_name,
+                    entity_extractor,
+                    relationship_extractor,
+                )
+        finally:
+            # Only has work to do if this search itself was cancelled
+            for task in tasks:
+                task.cancel()
 
-        # Extract entities if enabled
-        extracted_entities = []
-        if self.config.enable_entity_extraction:
-            self._entity_extractor.clear_cache()
-            extracted_entities.extend(self._entity_extractor.extract_from_profiles(social_profiles))
-            extracted_entities.extend(self._entity_extractor.extract_from_news(news_mentions))
-            extracted_entities.extend(self._entity_extractor.extract_from_records(public_records))
-            extracted_entities.extend(
-                self._entity_extractor.extract_from_professional(professional_info)
-            )
+        # Assemble in a fixed source order regardless of arrival order
+        empty = _ProcessedSource()
+        social = processed.get(_SOCIAL_MEDIA, empty)
+        news = processed.get(_NEWS, empty)
+        records = processed.get(_PUBLIC_RECORDS, empty)
+        professional = processed.get(_PROFESSIONAL, empty)
+        ordered = [social, news, records, professional]
 
-        # Extract relationships if enabled
-        extracted_relationships = []
-        if self.config.enable_relationship_extraction:
-            self._relationship_extractor.clear_cache()
-            extracted_relationships.extend(
-                self._relationship_extractor.extract_from_professional(
-                    professional_info, subject_name
-                )
-            )
-            extracted_relationships.extend(
-                self._relationship_extractor.extract_from_news(news_mentions, subject_name)
-            )
-            extracted_relationships.extend(
-                self._relationship_extractor.extract_from_profiles(social_profiles, subject_name)
-            )
+        unique_items = sum(len(p.items) for p in ordered)
 
         # Calculate duration
         duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
@@ -338,13 +326,15 @@ class OSINTProvider(BaseDataProvider):
             search_id=search_id,
             subject_name=subject_name,
             search_identifiers=identifiers,
-            social_profiles=social_profiles,
-            news_mentions=news_mentions,
-            public_records=public_records,
-            professional_info=professional_info,
-            extracted_entities=extracted_entities,
-            extracted_relationships=extracted_relationships,
-            duplicate_groups=duplicate_groups,
+            social_profiles=social.items,
+            news_mentions=news.items,
+            public_records=records.items,
+            professional_info=professional.items,
+            extracted_entities=[e for p in ordered for e in p.entities],
+            extracted_relationships=[
+                r for p in (professional, news, social) for r in p.relationships
+            ],
+            duplicate_groups=[g for p in ordered for g in p.duplicate_groups],
             total_sources_searched=sources_searched,
             sources_with_results=sources_with_results,
             total_items_found=total_items,
@@ -352,9 +342,140 @@ class OSINTProvider(BaseDataProvider):
             dedup_removed_count=total_items - unique_items,
             searched_at=start_time,
             search_duration_ms=duration_ms,
+            source_latencies_ms=source_latencies_ms,
+            timed_out_sources=timed_out_sources,
             errors=errors,
         )
 
+    def _enabled_sources(self, check_type: CheckType | None) -> list[_SourceSearch]:
+        """Get the source searches enabled for a check type."""
+        sources: list[_SourceSearch] = []
+        if self.config.enable_social_media and (
+            check_type is None or check_type == CheckType.SOCIAL_MEDIA
+        ):
+            # Approximate social platforms
+            sources.append(
+                _SourceSearch(_SOCIAL_MEDIA, "Social media", 5, self._search_social_media)
+            )
+        if self.config.enable_news_search and (
+            check_type is None or check_type == CheckType.ADVERSE_MEDIA
+        ):
+            # Approximate news sources
+            sources.append(_SourceSearch(_NEWS, "News", 3, self._search_news))
+        if self.config.enable_public_records and (
+            check_type is None or check_type == CheckType.DIGITAL_FOOTPRINT
+        ):
+            # Approximate record sources
+            sources.append(
+                _SourceSearch(_PUBLIC_RECORDS, "Public records", 4, self._search_public_records)
+            )
+        if self.config.enable_professional:
+            # LinkedIn, etc.
+            sources.append(
+                _SourceSearch(_PROFESSIONAL, "Professional", 2, self._search_professional)
+            )
+        return sources
+
+    async def _run_source(
+        self,
+        source: _SourceSearch,
+        subject_name: str,
+        identifiers: list[str],
+    ) -> _SourceOutcome:
+        """Run one source search under its timeout.
+
+        Args:
+            source: Source search to run.
+            subject_name: Name to search.
+            identifiers: Additional identifiers.
+
+        Returns:
+            Outcome with the items or an error message.
+        """
+        timeout_ms = self.config.source_timeouts_ms.get(source.name, self.config.search_timeout_ms)
+        started = time.perf_counter()
+        items: list[Any] = []
+        error: str | None = None
+        timed_out = False
+        try:
+            async with asyncio.timeout(timeout_ms / 1000):
+                items = await source.search(subject_name, identifiers)
+        except TimeoutError:
+            error = f"{source.label} search timed out after {timeout_ms}ms"
+            timed_out = True
+        except Exception as e:
+            error = f"{source.label} search failed: {e}"
+
+        return _SourceOutcome(
+            name=source.name,
+            platforms=source.platforms,
+            items=items,
+            latency_ms=int((time.perf_counter() - started) * 1000),
+            error=error,
+            timed_out=timed_out,
+        )
+
+    async def _process_source(
+        self,
+        name: str,
+        items: list[Any],
+        subject_name: str,
+        entity_extractor: EntityExtractor,
+        relationship_extractor: RelationshipExtractor,
+    ) -> _ProcessedSource:
+        """Deduplicate and extract from one source's results.
+
+        Dedup and extraction are CPU-bound (large article text), so they run
+        in a thread; the free text of large batches is scanned in the
+        extractor's process pool.
+
+        Args:
+            name: Source name.
+            items: Items returned by the source.
+            subject_name: Name of the subject.
+            entity_extractor: Extractor for this search.
+            relationship_extractor: Relationship extractor for this search.
+
+        Returns:
+            Processed items, duplicate groups, entities and relationships.
+        """
+        dedupe, extract_entities, extract_relationships = {
+            _SOCIAL_MEDIA: (
+                self._deduplicator.deduplicate_profiles,
+                entity_extractor.extract_from_profiles,
+                relationship_extractor.extract_from_profiles,
+            ),
+            _NEWS: (
+                self._deduplicator.deduplicate_news,
+                entity_extractor.extract_from_news,
+                relationship_extractor.extract_from_news,
+            ),
+            _PUBLIC_RECORDS: (
+                self._deduplicator.deduplicate_records,
+                entity_extractor.extract_from_records,
+                None,
+            ),
+            _PROFESSIONAL: (
+                self._deduplicator.deduplicate_professional,
+                entity_extractor.extract_from_professional,
+                relationship_extractor.extract_from_professional,
+            ),
+        }[name]
+
+        result = _ProcessedSource(items=items)
+        if self.config.enable_deduplication:
+            dedup_result = await asyncio.to_thread(dedupe, items)
+            result.items = dedup_result.items
+            result.duplicate_groups = dedup_result.duplicate_groups
+        if self.config.enable_entity_extraction:
+            await entity_extractor.prescan(result.items)
+            result.entities = await asyncio.to_thread(extract_entities, result.items)
+        if self.config.enable_relationship_extraction and extract_relationships is not None:
+            result.relationships = await asyncio.to_thread(
+                extract_relationships, result.items, subject_name
+            )
+        return result
+
     async def search_social_media(
         self,
         subject_name: str,
@@ -822,6 +943,8 @@ class OSINTProvider(BaseDataProvider):
                 "duplicates_removed": result.dedup_removed_count,
                 "searched_at": result.searched_at.isoformat(),
                 "duration_ms": result.search_duration_ms,
+                "source_latencies_ms": result.source_latencies_ms,
+                "timed_out_sources": result.timed_out_sources,
             },
             "social_profiles": [
                 {
@@ -405,6 +405,8 @@ class OSINTSearchResult(BaseModel):
         dedup_removed_count: Number of duplicates removed.
         searched_at: When search was performed.
         search_duration_ms: How long the search took.
+        source_latencies_ms: Latency of each source search, by source name.
+        timed_out_sources: Sources that hit their timeout.
         errors: Any errors during search.
     """
 
@@ -425,6 +427,8 @@ class OSINTSearchResult(BaseModel):
     dedup_removed_count: int = 0
     searched_at: datetime = Field(default_factory=datetime.utcnow)
     search_duration_ms: int = 0
+    source_latencies_ms: dict[str, int] = Field(default_factory=dict)
+    timed_out_sources: list[str] = Field(default_factory=list)
     errors: list[str] = Field(default_factory=list)
 
     def has_results(self) -> bool:
@@ -474,9 +478,13 @@ class OSINTProviderConfig(BaseModel):
         enable_relationship_extraction: Enable relationship extraction.
         enable_deduplication: Enable deduplication.
         max_results_per_source: Maximum results per source.
-        search_timeout_ms: Timeout for each search.
+        search_timeout_ms: Timeout for each source search.
+        source_timeouts_ms: Per-source timeout overrides (social_media, news,
+            public_records, professional).
         cache_ttl_seconds: Cache TTL for results.
         dedup_similarity_threshold: Similarity threshold for dedup.
+        dedup_lsh_min_items: Result count from which dedup compares only
+            candidate pairs sharing a blocking key.
         min_match_confidence: Minimum confidence for matches.
         news_lookback_days: How far back to search news.
         sources_to_include: Specific sources to include.
@@ -493,8 +501,10 @@ class OSINTProviderConfig(BaseModel):
     enable_deduplication: bool = True
     max_results_per_source: int = 100
     search_timeout_ms: int = 30000
+    source_timeouts_ms: dict[str, int] = Field(default_factory=dict)
     cache_ttl_seconds: int = 3600
     dedup_similarity_threshold: float = 0.85
+    dedup_lsh_min_items: int = 200
     min_match_confidence: float = 0.6
     news_lookback_days: int = 365
     sources_to_include: list[OSINTSource] | None = None
@@ -0,0 +1,541 @@
+"""Shared reference data for providers.
+
+Providers screen against reference datasets: sanctions lists, breach
+catalogs, institution directories, diploma mill lists. A ReferenceDataset
+builds or loads its data once per process, on first use, and every provider
+instance reads the same read-only copy, so constructing a provider does no
+data work. Structures computed from a dataset (normalized name sets, search
+indexes) are built with ``derived()``, once per dataset generation.
+
+Snapshots:
+    With a snapshot directory configured (``REFERENCE_DATA_DIR``), the first
+    process that needs a dataset serializes it to
+    ``<dir>/<name>.v<version>.snapshot``. Other processes memory-map the file
+    and deserialize it instead of building the data again. ``publish()``
+    replaces a snapshot atomically, for example after a list update, and
+    every process picks it up on its next access once
+    ``REFERENCE_DATA_RELOAD_INTERVAL`` seconds have passed, or immediately
+    on ``reload()``.
+
+    Snapshots hold JSON, validated against the dataset's ``data_type`` when
+    they are read, so a snapshot file cannot run code in the service.
+
+Sharing across workers:
+    Python objects cannot live in the mapped file itself, so worker
+    processes share datasets only by forking from a process that loaded
+    them. With ``REFERENCE_DATA_PRELOAD``, the API application factory and
+    the screening queue factory call ``preload_reference_data()``, which
+    loads every dataset and moves the objects to the permanent GC
+    generation (``gc.freeze``), so collections in forked workers never
+    write to their pages and the pages stay shared copy-on-write.
+
+    The pages are only shared when the factory runs before the fork: serve
+    the API with gunicorn and ``preload_app`` (``elile.api.gunicorn_conf``),
+    which creates the application in the master and forks uvicorn workers
+    from it. ``uvicorn --workers`` spawns its workers, and screening queue
+    workers are separate processes; each of those loads its own copy, from
+    the snapshot when one is configured.
+
+Usage:
+    SANCTIONS_LISTS = reference_dataset(
+        "sanctions.lists",
+        load_sanctions_lists,
+        data_type=dict[SanctionsList, list[SanctionedEntity]],
+    )
+
+    entities = SANCTIONS_LISTS.get()[SanctionsList.OFAC_SDN]
+    index = SANCTIONS_LISTS.derived("name_index", build_name_index)
+
+    # After downloading new lists
+    SANCTIONS_LISTS.publish(new_lists)
+"""
+
+import gc
+import importlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from elile.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+D = TypeVar("D")
+
+# Snapshot layout: magic, format version and metadata length, JSON metadata, JSON data
+SNAPSHOT_MAGIC = b"ELRD"
+SNAPSHOT_FORMAT = 2
+_HEADER = struct.Struct(">4sHI")
+
+
+class ReferenceDataError(Exception):
+    """Raised when a reference data snapshot cannot be read."""
+
+    def __init__(self, path: Path, reason: str):
+        super().__init__(f"Unreadable reference data snapshot {path}: {reason}")
+        self.path = path
+        self.reason = reason
+
+
+class ReferenceDataConfig(BaseModel):
+    """Configuration for reference data snapshots."""
+
+    directory: Path | None = Field(
+        default=None, description="Snapshot directory (None keeps datasets in memory only)"
+    )
+    reload_interval: float = Field(
+        default=60.0, ge=0, description="Seconds between snapshot change checks (0 disables)"
+    )
+
+
+# =============================================================================
+# Snapshot files
+# =============================================================================
+
+
+def _stat_key(stat: os.stat_result) -> tuple[int, int, int]:
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def write_snapshot(
+    path: Path, name: str, version: int, data: Any, *, data_type: Any = Any
+) -> tuple[int, int, int]:
+    """Serialize a dataset to a snapshot file, replacing it atomically.
+
+    Args:
+        path: Snapshot path
+        name: Dataset name
+        version: Dataset version
+        data: Dataset value
+        data_type: Type of the value, used to serialize it to JSON
+
+    Returns:
+        Identity of the written file, to detect later replacements
+    """
+    metadata = json.dumps(
+        {"dataset": name, "version": version, "created_at": datetime.now(UTC).isoformat()}
+    ).encode()
+    payload = TypeAdapter(data_type).dump_json(data)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, len(metadata)))
+            f.write(metadata)
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    return _stat_key(path.stat())
+
+
+def read_snapshot(
+    path: Path, name: str, version: int, *, data_type: Any = Any
+) -> tuple[Any, dict[str, Any], tuple[int, int, int]]:
+    """Load a dataset from a memory-mapped snapshot file.
+
+    Args:
+        path: Snapshot path
+        name: Expected dataset name
+        version: Expected dataset version
+        data_type: Type to validate the data against
+
+    Returns:
+        (data, metadata, identity of the file read)
+
+    Raises:
+        FileNotFoundError: If there is no snapshot
+        ReferenceDataError: If the file is not a snapshot of this dataset version
+    """
+    with path.open("rb") as f:
+        key = _stat_key(os.fstat(f.fileno()))
+        if key[1] < _HEADER.size:
+            raise ReferenceDataError(path, "truncated header")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            magic, snapshot_format, metadata_length = _HEADER.unpack_from(mapped, 0)
+            if magic != SNAPSHOT_MAGIC or snapshot_format != SNAPSHOT_FORMAT:
+                raise ReferenceDataError(path, "not a snapshot in a supported format")
+            start = _HEADER.size + metadata_length
+            try:
+                metadata = json.loads(mapped[_HEADER.size : start])
+            except ValueError as e:
+                raise ReferenceDataError(path, "invalid metadata") from e
+            if metadata.get("dataset") != name or metadata.get("version") != version:
+                raise ReferenceDataError(path, f"holds {metadata.get('dataset')!r}")
+
+            try:
+                data = TypeAdapter(data_type).validate_json(mapped[start:])
+            except ValidationError as e:
+                raise ReferenceDataError(path, f"invalid payload ({e})") from e
+    return data, metadata, key
+
+
+# =============================================================================
+# Datasets
+# =============================================================================
+
+
+class ReferenceDataset(Generic[T]):  # noqa: UP046
+    """A read-only dataset loaded once per process and shared by providers.
+
+    Attributes:
+        name: Unique dataset name, ``<provider>.<dataset>``
+        builder: Builds the data when no snapshot exists
+        version: Data format version; bump it when the builder's output changes shape
+        data_type: Type of the data, used to write and validate snapshots
+        generation: Incremented whenever new data is swapped in
+        source: Where the current data came from: builder, snapshot or publish
+        loaded_at: When the current data was swapped in
+    """
+
+    def __init__(
+        self,
+        name: str,
+        builder: Callable[[], T],
+        *,
+        version: int = 1,
+        data_type: Any = Any,
+        config: ReferenceDataConfig | None = None,
+    ):
+        """Initialize the dataset without loading it.
+
+        Args:
+            name: Unique dataset name
+            builder: Builds the data when no snapshot exists
+            version: Data format version
+            data_type: Type of the data (default: plain JSON values)
+            config: Snapshot configuration (default: the global configuration)
+        """
+        self.name = name
+        self.builder = builder
+        self.version = version
+        self.data_type = data_type
+        self.generation = 0
+        self.source: str | None = None
+        self.loaded_at: datetime | None = None
+        self._config = config
+        self._lock = threading.RLock()
+        self._data: T | None = None
+        self._loaded = False
+        self._derived: dict[str, tuple[int, Any]] = {}
+        self._snapshot_key: tuple[int, int, int] | None = None
+        self._checked_at = 0.0
+
+    @property
+    def config(self) -> ReferenceDataConfig:
+        """Get the snapshot configuration in effect."""
+        return self._config or get_reference_data_config()
+
+    @property
+    def snapshot_path(self) -> Path | None:
+        """Get the snapshot file path, if snapshots are enabled."""
+        directory = self.config.directory
+        if directory is None:
+            return None
+        return Path(directory) / f"{self.name}.v{self.version}.snapshot"
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the data is loaded in this process."""
+        return self._loaded
+
+    def get(self) -> T:
+        """Get the data, loading it on first use.
+
+        Also reloads the data when its snapshot was replaced and the reload
+        interval has passed since the last check.
+        """
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._load()
+        elif self._reload_due():
+            try:
+                self.reload()
+            except ReferenceDataError as e:
+                # Keep serving the current data rather than failing checks
+                logger.warning("reference_data_reload_failed", dataset=self.name, error=str(e))
+        return self._data  # type: ignore[return-value]
+
+    def derived(self, key: str, factory: Callable[[T], D]) -> D:
+        """Get a structure computed from the data, building it once per generation.
+
+        Args:
+            key: Name of the derived structure
+            factory: Computes the structure from the data
+
+        Returns:
+            The structure for the current data
+        """
+        self.get()
+        cached = self._derived.get(key)
+        if cached is None or cached[0] != self.generation:
+            with self._lock:
+                cached = self._derived.get(key)
+                if cached is None or cached[0] != self.generation:
+                    cached = (self.generation, factory(self._data))  # type: ignore[arg-type]
+                    self._derived[key] = cached
+        return cached[1]
+
+    def publish(self, data: T) -> None:
+        """Replace the data in this process and, with snapshots enabled, in all others.
+
+        Args:
+            data: New dataset value
+        """
+        with self._lock:
+            path = self.snapshot_path
+            key = self._write(path, data) if path else None
+            self._swap(data, "publish", key)
+
+    def reload(self, *, force: bool = False) -> bool:
+        """Reload the data if its snapshot was replaced.
+
+        Args:
+            force: Reload even if the snapshot is unchanged; without
+                snapshots, rebuild the data
+
+        Returns:
+            Whether new data was swapped in
+
+        Raises:
+            ReferenceDataError: If the replaced snapshot cannot be read
+        """
+        with self._lock:
+            self._checked_at = time.monotonic()
+            path = self.snapshot_path
+            if path is None:
+                if force:
+                    self._swap(self.builder(), "builder", None)
+                return force
+            try:
+                current = _stat_key(path.stat())
+            except FileNotFoundError:
+                if force:
+                    self._build(path)
+                return force
+            if current == self._snapshot_key and not force:
+                return False
+            data, _, key = self._read(path)
+            self._swap(data, "snapshot", key)
+            return True
+
+    def unload(self) -> None:
+        """Drop the data from this process; the next access loads it again."""
+        with self._lock:
+            self._data = None
+            self._loaded = False
+            self._derived.clear()
+            self._snapshot_key = None
+            self.source = None
+            self.loaded_at = None
+
+    def info(self) -> dict[str, Any]:
+        """Get the dataset state for diagnostics."""
+        path = self.snapshot_path
+        return {
+            "name": self.name,
+            "version": self.version,
+            "loaded": self._loaded,
+            "generation": self.generation,
+            "source": self.source,
+            "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None,
+            "snapshot_path": str(path) if path else None,
+        }
+
+    def _load(self) -> None:
+        path = self.snapshot_path
+        if path is not None:
+            try:
+                data, _, key = self._read(path)
+            except FileNotFoundError:
+                pass
+            except ReferenceDataError as e:
+                logger.warning("reference_snapshot_unreadable", dataset=self.name, error=str(e))
+            else:
+                self._swap(data, "snapshot", key)
+                return
+        self._build(path)
+
+    def _build(self, path: Path | None) -> None:
+        data = self.builder()
+        key = self._write(path, data) if path else None
+        self._swap(data, "builder", key)
+
+    def _read(self, path: Path) -> tuple[T, dict[str, Any], tuple[int, int, int]]:
+        return read_snapshot(path, self.name, self.version, data_type=self.data_type)
+
+    def _write(self, path: Path, data: T) -> tuple[int, int, int]:
+        return write_snapshot(path, self.name, self.version, data, data_type=self.data_type)
+
+    def _swap(self, data: T, source: str, key: tuple[int, int, int] | None) -> None:
+        self._data = data
+        self._snapshot_key = key
+        self._derived.clear()
+        self.generation += 1
+        self.source = source
+        self.loaded_at = datetime.now(UTC)
+        self._checked_at = time.monotonic()
+        self._loaded = True
+        logger.info(
+            "reference_data_loaded",
+            dataset=self.name,
+            source=source,
+            generation=self.generation,
+        )
+
+    def _reload_due(self) -> bool:
+        config = self.config
+        return (
+            config.directory is not None
+            and config.reload_interval > 0
+            and time.monotonic() - self._checked_at >= config.reload_interval
+        )
+
+    def _after_fork(self) -> None:
+        # The parent's lock may have been held by another thread at fork time
+        self._lock = threading.RLock()
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+_datasets: dict[str, ReferenceDataset[Any]] = {}
+_PROVIDER_MODULES = (
+    "elile.providers.darkweb.breach_database",
+    "elile.providers.education.diploma_mill",
+    "elile.providers.education.provider",
+    "elile.providers.sanctions.provider",
+)
+_config: ReferenceDataConfig | None = None
+
+
+def reference_dataset(  # noqa: UP047
+    name: str, builder: Callable[[], T], *, version: int = 1, data_type: Any = Any
+) -> ReferenceDataset[T]:
+    """Create and register a dataset using the global configuration.
+
+    Args:
+        name: Unique dataset name
+        builder: Builds the data when no snapshot exists
+        version: Data format version
+        data_type: Type of the data, used to write and validate snapshots
+
+    Returns:
+        The registered dataset (not loaded yet)
+
+    Raises:
+        ValueError: If a dataset with the name is already registered
+    """
+    if name in _datasets:
+        raise ValueError(f"Reference dataset {name!r} is already registered")
+    dataset = ReferenceDataset(name, builder, version=version, data_type=data_type)
+    _datasets[name] = dataset
+    return dataset
+
+
+def get_reference_dataset(name: str) -> ReferenceDataset[Any]:
+    """Get a registered dataset by name.
+
+    Raises:
+        KeyError: If no dataset has the name
+    """
+    return _datasets[name]
+
+
+def list_reference_datasets() -> list[ReferenceDataset[Any]]:
+    """Get all registered datasets, sorted by name."""
+    return [_datasets[name] for name in sorted(_datasets)]
+
+
+def get_reference_data_config() -> ReferenceDataConfig:
+    """Get the global snapshot configuration, from settings unless configured."""
+    global _config
+    if _config is None:
+        from elile.config.settings import get_settings
+
+        settings = get_settings()
+        _config = ReferenceDataConfig(
+            directory=settings.REFERENCE_DATA_DIR,
+            reload_interval=settings.REFERENCE_DATA_RELOAD_INTERVAL,
+        )
+    return _config
+
+
+def configure_reference_data(config: ReferenceDataConfig | None) -> None:
+    """Set the global snapshot configuration (None: back to settings).
+
+    Loaded datasets keep their data until they are reloaded.
+    """
+    global _config
+    _config = config
+
+
+def preload_reference_data(names: Iterable[str] | None = None, *, freeze: bool = True) -> None:
+    """Load datasets ahead of use, typically in a parent process before forking workers.
+
+    Args:
+        names: Datasets to load (default: every provider dataset)
+        freeze: Move every live object to the permanent GC generation, so
+            forked workers share the loaded pages instead of copying them
+    """
+    if names is None:
+        # Datasets register when their provider module is imported
+        for module in _PROVIDER_MODULES:
+            importlib.import_module(module)
+    for name in sorted(_datasets) if names is None else names:
+        _datasets[name].get()
+    if freeze:
+        gc.collect()
+        gc.freeze()
+
+
+def reload_reference_data(*, force: bool = False) -> list[str]:
+    """Reload every loaded dataset whose snapshot was replaced.
+
+    Args:
+        force: Reload even unchanged datasets
+
+    Returns:
+        Names of the datasets that were reloaded
+    """
+    return [
+        dataset.name
+        for dataset in list_reference_datasets()
+        if dataset.is_loaded and dataset.reload(force=force)
+    ]
+
+
+def reset_reference_data() -> None:
+    """Unload every dataset and reset the configuration.
+
+    Primarily used for testing.
+    """
+    configure_reference_data(None)
+    for dataset in _datasets.values():
+        dataset.unload()
+
+
+def _after_fork_in_child() -> None:
+    for dataset in _datasets.values():
+        dataset._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
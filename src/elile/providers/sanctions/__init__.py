@@ -35,37 +35,45 @@ Example:
     await scheduler.start()
 """
 
-from .matcher import NameMatcher, create_name_matcher
-from .provider import (
-    SanctionsProvider,
-    SanctionsProviderConfig,
-    create_sanctions_provider,
-    get_sanctions_provider,
-)
-from .scheduler import (
-    ListUpdateConfig,
-    ListUpdateResult,
-    SanctionsUpdateScheduler,
-    UpdateFrequency,
-    UpdateSchedulerConfig,
-    create_update_scheduler,
-    get_update_scheduler,
-)
-from .types import (
-    EntityType,
-    FuzzyMatchConfig,
-    MatchType,
-    SanctionedEntity,
-    SanctionsAddress,
-    SanctionsAlias,
-    SanctionsIdentifier,
-    SanctionsList,
-    SanctionsListUnavailableError,
-    SanctionsMatch,
-    SanctionsProviderError,
-    SanctionsScreeningError,
-    SanctionsScreeningResult,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .matcher import NameMatcher, create_name_matcher
+    from .provider import (
+        SANCTIONS_LISTS,
+        SanctionsProvider,
+        SanctionsProviderConfig,
+        create_sanctions_provider,
+        get_sanctions_provider,
+    )
+    from .scheduler import (
+        ListUpdateConfig,
+        ListUpdateResult,
+        SanctionsUpdateScheduler,
+        UpdateFrequency,
+        UpdateSchedulerConfig,
+        create_update_scheduler,
+        get_update_scheduler,
+    )
+    from .types import (
+        EntityType,
+        FuzzyMatchConfig,
+        MatchType,
+        SanctionedEntity,
+        SanctionsAddress,
+        SanctionsAlias,
+        SanctionsIdentifier,
+        SanctionsList,
+        SanctionsListUnavailableError,
+        SanctionsMatch,
+        SanctionsProviderError,
+        SanctionsScreeningError,
+        SanctionsScreeningResult,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Provider
@@ -73,6 +81,7 @@ __all__ = [
     "SanctionsProviderConfig",
     "create_sanctions_provider",
     "get_sanctions_provider",
+    "SANCTIONS_LISTS",
     # Matcher
     "NameMatcher",
     "create_name_matcher",
@@ -15,6 +15,7 @@ from elile.compliance.types import CheckType, Locale
 from elile.core.logging import get_logger
 from elile.entity.types import SubjectIdentifiers
 from elile.providers.protocol import BaseDataProvider
+from elile.providers.reference_data import reference_dataset
 from elile.providers.types import (
     CostTier,
     DataSourceCategory,
@@ -116,14 +117,6 @@ class SanctionsProvider(BaseDataProvider):
         self._config = config or SanctionsProviderConfig()
         self._matcher = create_name_matcher(self._config.match_config)
 
-        # In-memory sanctions database (simulated)
-        # In production, this would be populated from actual OFAC/UN/EU feeds
-        self._sanctions_db: dict[SanctionsList, list[SanctionedEntity]] = {}
-        self._last_update: datetime | None = None
-
-        # Initialize with sample data for testing
-        self._load_sample_data()
-
         # Provider info
         provider_info = ProviderInfo(
             provider_id="sanctions_provider",
@@ -191,6 +184,11 @@ class SanctionsProvider(BaseDataProvider):
         """Get the name matcher."""
         return self._matcher
 
+    @property
+    def _sanctions_db(self) -> dict[SanctionsList, list[SanctionedEntity]]:
+        """Sanctions lists shared by all provider instances (see SANCTIONS_LISTS)."""
+        return SANCTIONS_LISTS.get()
+
     async def execute_check(
         self,
         check_type: CheckType,
@@ -352,7 +350,9 @@ class SanctionsProvider(BaseDataProvider):
                 for list_source, entities in self._sanctions_db.items()
             },
             "total_entities": sum(len(e) for e in self._sanctions_db.values()),
-            "last_update": self._last_update.isoformat() if self._last_update else None,
+            "last_update": (
+                SANCTIONS_LISTS.loaded_at.isoformat() if SANCTIONS_LISTS.loaded_at else None
+            ),
         }
 
     async def _screen_subject(
@@ -502,15 +502,23 @@ class SanctionsProvider(BaseDataProvider):
         cost_per_list = Decimal("0.01")  # $0.01 per list
         return cost_per_list * len(lists_screened)
 
-    def _load_sample_data(self) -> None:
-        """Load sample sanctions data for testing.
 
-        In production, this would load from OFAC/UN/EU APIs or data feeds.
-        """
-        from datetime import date
+# =============================================================================
+# Reference data
+# =============================================================================
+
+
+def _sample_sanctions_lists() -> dict[SanctionsList, list[SanctionedEntity]]:
+    """Build sample sanctions lists for testing.
+
+    In production, lists are loaded from OFAC/UN/EU feeds and published
+    with ``SANCTIONS_LISTS.publish()``.
+    """
+    from datetime import date
 
+    return {
         # Sample OFAC SDN entries
-        self._sanctions_db[SanctionsList.OFAC_SDN] = [
+        SanctionsList.OFAC_SDN: [
             SanctionedEntity(
                 entity_id="OFAC-12345",
                 list_source=SanctionsList.OFAC_SDN,
@@ -554,10 +562,9 @@ class SanctionsProvider(BaseDataProvider):
                 listed_date=date(2012, 2, 6),
                 last_updated=datetime.now(UTC),
             ),
-        ]
-
+        ],
         # Sample UN entries
-        self._sanctions_db[SanctionsList.UN_CONSOLIDATED] = [
+        SanctionsList.UN_CONSOLIDATED: [
             SanctionedEntity(
                 entity_id="UN-67890",
                 list_source=SanctionsList.UN_CONSOLIDATED,
@@ -572,10 +579,9 @@ class SanctionsProvider(BaseDataProvider):
                 listed_date=date(2001, 10, 8),
                 last_updated=datetime.now(UTC),
             ),
-        ]
-
+        ],
         # Sample EU entries
-        self._sanctions_db[SanctionsList.EU_CONSOLIDATED] = [
+        SanctionsList.EU_CONSOLIDATED: [
             SanctionedEntity(
                 entity_id="EU-11111",
                 list_source=SanctionsList.EU_CONSOLIDATED,
@@ -590,10 +596,9 @@ class SanctionsProvider(BaseDataProvider):
                 listed_date=date(2020, 10, 2),
                 last_updated=datetime.now(UTC),
             ),
-        ]
-
+        ],
         # Sample PEP entries
-        self._sanctions_db[SanctionsList.WORLD_PEP] = [
+        SanctionsList.WORLD_PEP: [
             SanctionedEntity(
                 entity_id="PEP-22222",
                 list_source=SanctionsList.WORLD_PEP,
@@ -604,14 +609,15 @@ class SanctionsProvider(BaseDataProvider):
                 remarks="Son of US President Joseph Biden",
                 last_updated=datetime.now(UTC),
             ),
-        ]
+        ],
+    }
 
-        self._last_update = datetime.now(UTC)
 
-        logger.info(
-            "sample_sanctions_data_loaded",
-            total_entities=sum(len(e) for e in self._sanctions_db.values()),
-        )
+SANCTIONS_LISTS = reference_dataset(
+    "sanctions.lists",
+    _sample_sanctions_lists,
+    data_type=dict[SanctionsList, list[SanctionedEntity]],
+)
 
 
 # =============================================================================
@@ -29,48 +29,55 @@ Example:
     )
 """
 
-from .provider import (
-    SUPPORTED_CHECK_TYPES,
-    AttestationScorer,
-    ClaimedEducation,
-    ClaimedEmployment,
-    EducationAttestationAggregator,
-    EmploymentAttestationAggregator,
-    LLMSynthesisProvider,
-    create_synthesis_provider,
-    get_synthesis_provider,
-)
-from .types import (
-    AttestationType,
-    ConfidenceFactor,
-    ConsensusFailedError,
-    EducationAttestation,
-    EmploymentAttestation,
-    LinkedInEducation,
-    LinkedInExperience,
-    LinkedInProfile,
-    LinkedInRecommendation,
-    LLMExtractionError,
-    LLMSynthesisProviderConfig,
-    NewsArticle,
-    PublicSource,
-    PublicSourceType,
-    RelationshipType,
-    SECFiling,
-    SourceFetchError,
-    SourceType,
-    SynthesisLLMModel,
-    SynthesisProvenance,
-    SynthesisProviderError,
-    SynthesizedAdverseMedia,
-    SynthesizedCorporateAffiliation,
-    SynthesizedCorporateAffiliations,
-    SynthesizedEducationVerification,
-    SynthesizedEmploymentVerification,
-    SynthesizedLicenseVerification,
-    SynthesizedSocialMedia,
-    UnsupportedCheckTypeError,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .provider import (
+        SUPPORTED_CHECK_TYPES,
+        AttestationScorer,
+        ClaimedEducation,
+        ClaimedEmployment,
+        EducationAttestationAggregator,
+        EmploymentAttestationAggregator,
+        LLMSynthesisProvider,
+        create_synthesis_provider,
+        get_synthesis_provider,
+    )
+    from .types import (
+        AttestationType,
+        ConfidenceFactor,
+        ConsensusFailedError,
+        EducationAttestation,
+        EmploymentAttestation,
+        LinkedInEducation,
+        LinkedInExperience,
+        LinkedInProfile,
+        LinkedInRecommendation,
+        LLMExtractionError,
+        LLMSynthesisProviderConfig,
+        NewsArticle,
+        PublicSource,
+        PublicSourceType,
+        RelationshipType,
+        SECFiling,
+        SourceFetchError,
+        SourceType,
+        SynthesisLLMModel,
+        SynthesisProvenance,
+        SynthesisProviderError,
+        SynthesizedAdverseMedia,
+        SynthesizedCorporateAffiliation,
+        SynthesizedCorporateAffiliations,
+        SynthesizedEducationVerification,
+        SynthesizedEmploymentVerification,
+        SynthesizedLicenseVerification,
+        SynthesizedSocialMedia,
+        UnsupportedCheckTypeError,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Provider
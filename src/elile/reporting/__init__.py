@@ -34,34 +34,41 @@ Example:
     ```
 """
 
-from elile.reporting.report_generator import (
-    GeneratorConfig,
-    ReportGenerator,
-    create_report_generator,
-)
-from elile.reporting.template_definitions import (
-    ReportTemplate,
-    TemplateRegistry,
-    create_template_registry,
-)
-from elile.reporting.types import (
-    BrandingConfig,
-    DisclosureType,
-    FieldRule,
-    GeneratedReport,
-    GeneratedReportMetadata,
-    InvalidRedactionError,
-    LayoutConfig,
-    OutputFormat,
-    RedactionLevel,
-    RenderingError,
-    ReportContent,
-    ReportGenerationError,
-    ReportPersona,
-    ReportRequest,
-    ReportSection,
-    TemplateNotFoundError,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.reporting.report_generator import (
+        GeneratorConfig,
+        ReportGenerator,
+        create_report_generator,
+    )
+    from elile.reporting.template_definitions import (
+        ReportTemplate,
+        TemplateRegistry,
+        create_template_registry,
+    )
+    from elile.reporting.types import (
+        BrandingConfig,
+        DisclosureType,
+        FieldRule,
+        GeneratedReport,
+        GeneratedReportMetadata,
+        InvalidRedactionError,
+        LayoutConfig,
+        OutputFormat,
+        RedactionLevel,
+        RenderingError,
+        ReportContent,
+        ReportGenerationError,
+        ReportPersona,
+        ReportRequest,
+        ReportSection,
+        TemplateNotFoundError,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Main classes
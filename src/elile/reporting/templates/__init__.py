@@ -13,61 +13,68 @@ This package also re-exports core template classes from template_definitions
 for convenience.
 """
 
-from elile.reporting.template_definitions import (
-    ReportTemplate,
-    TemplateRegistry,
-    create_template_registry,
-)
-from elile.reporting.templates.compliance_audit import (
-    AppliedRule,
-    AuditTrailEvent,
-    AuditTrailSection,
-    ComplianceAuditBuilder,
-    ComplianceAuditConfig,
-    ComplianceAuditContent,
-    ComplianceRulesSection,
-    ComplianceStatus,
-    ConsentRecord,
-    ConsentVerificationSection,
-    DataHandlingAttestation,
-    DataHandlingSection,
-    DataHandlingStatus,
-    DataSourceAccess,
-    DataSourcesSection,
-    DisclosureRecord,
-    create_compliance_audit_builder,
-)
-from elile.reporting.templates.hr_summary import (
-    CategoryScore,
-    CategoryStatus,
-    FindingIndicator,
-    HRSummaryBuilder,
-    HRSummaryConfig,
-    HRSummaryContent,
-    RecommendedAction,
-    RiskAssessmentDisplay,
-    create_hr_summary_builder,
-)
-from elile.reporting.templates.security_investigation import (
-    ConnectionNetworkSection,
-    DetailedFinding,
-    DetailedFindingsSection,
-    EvolutionSignal,
-    EvolutionSignalsSection,
-    EvolutionTrend,
-    FindingsByCategory,
-    NetworkEdge,
-    NetworkNode,
-    RiskPath,
-    SecurityInvestigationBuilder,
-    SecurityInvestigationConfig,
-    SecurityInvestigationContent,
-    SignalType,
-    ThreatAssessmentSection,
-    ThreatFactor,
-    ThreatLevel,
-    create_security_investigation_builder,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.reporting.template_definitions import (
+        ReportTemplate,
+        TemplateRegistry,
+        create_template_registry,
+    )
+    from elile.reporting.templates.compliance_audit import (
+        AppliedRule,
+        AuditTrailEvent,
+        AuditTrailSection,
+        ComplianceAuditBuilder,
+        ComplianceAuditConfig,
+        ComplianceAuditContent,
+        ComplianceRulesSection,
+        ComplianceStatus,
+        ConsentRecord,
+        ConsentVerificationSection,
+        DataHandlingAttestation,
+        DataHandlingSection,
+        DataHandlingStatus,
+        DataSourceAccess,
+        DataSourcesSection,
+        DisclosureRecord,
+        create_compliance_audit_builder,
+    )
+    from elile.reporting.templates.hr_summary import (
+        CategoryScore,
+        CategoryStatus,
+        FindingIndicator,
+        HRSummaryBuilder,
+        HRSummaryConfig,
+        HRSummaryContent,
+        RecommendedAction,
+        RiskAssessmentDisplay,
+        create_hr_summary_builder,
+    )
+    from elile.reporting.templates.security_investigation import (
+        ConnectionNetworkSection,
+        DetailedFinding,
+        DetailedFindingsSection,
+        EvolutionSignal,
+        EvolutionSignalsSection,
+        EvolutionTrend,
+        FindingsByCategory,
+        NetworkEdge,
+        NetworkNode,
+        RiskPath,
+        SecurityInvestigationBuilder,
+        SecurityInvestigationConfig,
+        SecurityInvestigationContent,
+        SignalType,
+        ThreatAssessmentSection,
+        ThreatFactor,
+        ThreatLevel,
+        create_security_investigation_builder,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Core template classes (re-exported from template_definitions)
@@ -1,130 +1,137 @@
 """Risk assessment module for analyzing findings and scoring risks."""
 
-from elile.risk.analyzer import RiskAnalyzer
-from elile.risk.anomaly_detector import (
-    ANOMALY_TYPE_SEVERITY,
-    Anomaly,
-    AnomalyDetector,
-    AnomalyType,
-    create_anomaly_detector,
-    DeceptionAssessment,
-    DECEPTION_LIKELIHOOD,
-    DetectorConfig,
-)
-from elile.risk.connection_analyzer import (
-    AnalyzerConfig,
-    ConnectionAnalysisResult,
-    ConnectionAnalyzer,
-    ConnectionEdge,
-    ConnectionGraph,
-    ConnectionNode,
-    ConnectionRiskType,
-    RELATION_RISK_FACTOR,
-    RISK_DECAY_PER_HOP,
-    RiskPropagationPath,
-    STRENGTH_MULTIPLIER,
-    create_connection_analyzer,
-)
-from elile.risk.finding_classifier import (
-    CATEGORY_KEYWORDS,
-    ClassificationResult,
-    ClassifierConfig,
-    FindingClassifier,
-    ROLE_RELEVANCE_MATRIX,
-    SubCategory,
-    SUBCATEGORY_KEYWORDS,
-    create_finding_classifier,
-)
-from elile.risk.inconsistency import InconsistencyAnalyzer
-from elile.risk.pattern_recognizer import (
-    create_pattern_recognizer,
-    Pattern,
-    PatternRecognizer,
-    PatternSummary,
-    PatternType,
-    RecognizerConfig,
-)
-from elile.risk.risk_aggregator import (
-    AggregatorConfig,
-    AssessmentConfidence,
-    ANOMALY_SEVERITY_WEIGHT,
-    CONNECTION_RISK_WEIGHT,
-    ComprehensiveRiskAssessment,
-    PATTERN_SEVERITY_WEIGHT,
-    RiskAdjustment,
-    RiskAggregator,
-    create_risk_aggregator,
-)
-from elile.risk.risk_scorer import (
-    Recommendation,
-    RiskLevel,
-    RiskScore,
-    RiskScorer,
-    ScorerConfig,
-    create_risk_scorer,
-)
-from elile.risk.scoring import calculate_risk_score
-from elile.risk.severity_calculator import (
-    CalculatorConfig,
-    ROLE_SEVERITY_ADJUSTMENTS,
-    SEVERITY_RULES,
-    SUBCATEGORY_SEVERITY,
-    SeverityCalculator,
-    SeverityDecision,
-    create_severity_calculator,
-)
-from elile.risk.temporal_risk_tracker import (
-    CategoryDelta,
-    create_temporal_risk_tracker,
-    EvolutionSignal,
-    EvolutionSignalType,
-    RiskDelta,
-    RiskSnapshot,
-    RiskTrend,
-    TemporalRiskTracker,
-    TrackerConfig,
-    TrendDirection,
-)
-from elile.risk.trends import (
-    create_risk_trend_analyzer,
-    PortfolioRiskLevel,
-    PortfolioRiskSummary,
-    PredictionConfidence,
-    RiskPrediction,
-    RiskTrendAnalyzer,
-    RiskTrajectory,
-    SubjectTrendSummary,
-    TrendAnalyzerConfig,
-    VelocityMetrics,
-)
-from elile.risk.thresholds import (
-    BreachSeverity,
-    CONSERVATIVE_THRESHOLDS,
-    create_threshold_manager,
-    LENIENT_THRESHOLDS,
-    ROLE_THRESHOLD_TEMPLATES,
-    STANDARD_THRESHOLDS,
-    ThresholdAction,
-    ThresholdBreach,
-    ThresholdConfig,
-    ThresholdHistory,
-    ThresholdManager,
-    ThresholdManagerConfig,
-    ThresholdScope,
-    ThresholdSet,
-)
-from elile.risk.explanations import (
-    ContributingFactor,
-    create_risk_explainer,
-    ExplanationDepth,
-    ExplanationFormat,
-    ExplainerConfig,
-    FactorImpact,
-    RiskExplainer,
-    RiskExplanation,
-    ScoreBreakdown,
-    WhatIfScenario,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.risk.analyzer import RiskAnalyzer
+    from elile.risk.anomaly_detector import (
+        ANOMALY_TYPE_SEVERITY,
+        Anomaly,
+        AnomalyDetector,
+        AnomalyType,
+        create_anomaly_detector,
+        DeceptionAssessment,
+        DECEPTION_LIKELIHOOD,
+        DetectorConfig,
+    )
+    from elile.risk.connection_analyzer import (
+        AnalyzerConfig,
+        ConnectionAnalysisResult,
+        ConnectionAnalyzer,
+        ConnectionEdge,
+        ConnectionGraph,
+        ConnectionNode,
+        ConnectionRiskType,
+        RELATION_RISK_FACTOR,
+        RISK_DECAY_PER_HOP,
+        RiskPropagationPath,
+        STRENGTH_MULTIPLIER,
+        create_connection_analyzer,
+    )
+    from elile.risk.finding_classifier import (
+        CATEGORY_KEYWORDS,
+        ClassificationResult,
+        ClassifierConfig,
+        FindingClassifier,
+        ROLE_RELEVANCE_MATRIX,
+        SubCategory,
+        SUBCATEGORY_KEYWORDS,
+        create_finding_classifier,
+    )
+    from elile.risk.inconsistency import InconsistencyAnalyzer
+    from elile.risk.pattern_recognizer import (
+        create_pattern_recognizer,
+        Pattern,
+        PatternRecognizer,
+        PatternSummary,
+        PatternType,
+        RecognizerConfig,
+    )
+    from elile.risk.risk_aggregator import (
+        AggregatorConfig,
+        AssessmentConfidence,
+        ANOMALY_SEVERITY_WEIGHT,
+        CONNECTION_RISK_WEIGHT,
+        ComprehensiveRiskAssessment,
+        PATTERN_SEVERITY_WEIGHT,
+        RiskAdjustment,
+        RiskAggregator,
+        create_risk_aggregator,
+    )
+    from elile.risk.risk_scorer import (
+        Recommendation,
+        RiskLevel,
+        RiskScore,
+        RiskScorer,
+        ScorerConfig,
+        create_risk_scorer,
+    )
+    from elile.risk.scoring import calculate_risk_score
+    from elile.risk.severity_calculator import (
+        CalculatorConfig,
+        ROLE_SEVERITY_ADJUSTMENTS,
+        SEVERITY_RULES,
+        SUBCATEGORY_SEVERITY,
+        SeverityCalculator,
+        SeverityDecision,
+        create_severity_calculator,
+    )
+    from elile.risk.temporal_risk_tracker import (
+        CategoryDelta,
+        create_temporal_risk_tracker,
+        EvolutionSignal,
+        EvolutionSignalType,
+        RiskDelta,
+        RiskSnapshot,
+        RiskTrend,
+        TemporalRiskTracker,
+        TrackerConfig,
+        TrendDirection,
+    )
+    from elile.risk.trends import (
+        create_risk_trend_analyzer,
+        PortfolioRiskLevel,
+        PortfolioRiskSummary,
+        PredictionConfidence,
+        RiskPrediction,
+        RiskTrendAnalyzer,
+        RiskTrajectory,
+        SubjectTrendSummary,
+        TrendAnalyzerConfig,
+        VelocityMetrics,
+    )
+    from elile.risk.thresholds import (
+        BreachSeverity,
+        CONSERVATIVE_THRESHOLDS,
+        create_threshold_manager,
+        LENIENT_THRESHOLDS,
+        ROLE_THRESHOLD_TEMPLATES,
+        STANDARD_THRESHOLDS,
+        ThresholdAction,
+        ThresholdBreach,
+        ThresholdConfig,
+        ThresholdHistory,
+        ThresholdManager,
+        ThresholdManagerConfig,
+        ThresholdScope,
+        ThresholdSet,
+    )
+    from elile.risk.explanations import (
+        ContributingFactor,
+        create_risk_explainer,
+        ExplanationDepth,
+        ExplanationFormat,
+        ExplainerConfig,
+        FactorImpact,
+        RiskExplainer,
+        RiskExplanation,
+        ScoreBreakdown,
+        WhatIfScenario,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Analyzer
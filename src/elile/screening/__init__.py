@@ -34,132 +34,139 @@ Usage:
         print(f"Risk score: {result.risk_score}")
 """
 
-from elile.screening.cost_estimator import (
-    BulkCostEstimate,
-    CostBreakdown,
-    CostCategory,
-    CostComparison,
-    CostEstimate,
-    CostEstimator,
-    EstimatorConfig,
-    create_cost_estimator,
-    get_cost_estimator,
-    reset_cost_estimator,
-)
-from elile.screening.degree_handlers import (
-    D1Handler,
-    D1Result,
-    D2Handler,
-    D2Result,
-    D3Handler,
-    D3Result,
-    DegreeHandlerConfig,
-    create_d1_handler,
-    create_d2_handler,
-    create_d3_handler,
-)
-from elile.screening.index import (
-    ConnectionStrength,
-    ConnectionType,
-    CrossScreeningIndex,
-    CrossScreeningIndexError,
-    CrossScreeningResult,
-    EntityReference,
-    IndexConfig,
-    IndexingError,
-    IndexStatistics,
-    NetworkEdge,
-    NetworkGraph,
-    NetworkNode,
-    ScreeningEntity,
-    ScreeningNotIndexedError,
-    SubjectConnection,
-    SubjectNotFoundError,
-    create_index,
-    get_cross_screening_index,
-)
-from elile.screening.orchestrator import (
-    OrchestratorConfig,
-    ScreeningOrchestrator,
-    create_screening_orchestrator,
-)
-from elile.screening.progress import (
-    ETAEstimate,
-    HistoricalDuration,
-    PhaseProgress,
-    ProgressNotification,
-    ProgressNotificationType,
-    ProgressStep,
-    ProgressTracker,
-    ProgressTrackerConfig,
-    ScreeningProgress,
-    StallReason,
-    create_progress_tracker,
-    get_progress_tracker,
-    reset_progress_tracker,
-)
-from elile.screening.queue import (
-    DequeueResult,
-    InMemoryQueueStorage,
-    QueueConfig,
-    QueuedScreening,
-    QueueMetrics,
-    QueueStatus,
-    QueueStorage,
-    RedisQueueStorage,
-    ScreeningQueueManager,
-    WorkerStatus,
-    create_queue_manager,
-    create_queue_manager_async,
-)
-from elile.screening.result_compiler import (
-    CategorySummary,
-    CompiledResult,
-    CompilerConfig,
-    ConnectionSummary,
-    FindingsSummary,
-    InvestigationSummary,
-    ResultCompiler,
-    SARSummary,
-    SummaryFormat,
-    create_result_compiler,
-)
-from elile.screening.state_manager import (
-    InMemoryStateStore,
-    ProgressEvent,
-    ProgressEventType,
-    ScreeningPhase,
-    ScreeningState,
-    ScreeningStateManager,
-    StateManagerConfig,
-    StateStore,
-    create_state_manager,
-)
-from elile.screening.tier_router import (
-    DataSourceSpec,
-    DataSourceTier,
-    RoutingResult,
-    TierCapabilities,
-    TierRouter,
-    TierRouterConfig,
-    create_default_data_sources,
-    create_tier_router,
-)
-from elile.screening.types import (
-    GeneratedReport,
-    ReportType,
-    ScreeningComplianceError,
-    ScreeningCostSummary,
-    ScreeningError,
-    ScreeningExecutionError,
-    ScreeningPhaseResult,
-    ScreeningPriority,
-    ScreeningRequest,
-    ScreeningRequestCreate,
-    ScreeningResult,
-    ScreeningStatus,
-    ScreeningValidationError,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.screening.cost_estimator import (
+        BulkCostEstimate,
+        CostBreakdown,
+        CostCategory,
+        CostComparison,
+        CostEstimate,
+        CostEstimator,
+        EstimatorConfig,
+        create_cost_estimator,
+        get_cost_estimator,
+        reset_cost_estimator,
+    )
+    from elile.screening.degree_handlers import (
+        D1Handler,
+        D1Result,
+        D2Handler,
+        D2Result,
+        D3Handler,
+        D3Result,
+        DegreeHandlerConfig,
+        create_d1_handler,
+        create_d2_handler,
+        create_d3_handler,
+    )
+    from elile.screening.index import (
+        ConnectionStrength,
+        ConnectionType,
+        CrossScreeningIndex,
+        CrossScreeningIndexError,
+        CrossScreeningResult,
+        EntityReference,
+        IndexConfig,
+        IndexingError,
+        IndexStatistics,
+        NetworkEdge,
+        NetworkGraph,
+        NetworkNode,
+        ScreeningEntity,
+        ScreeningNotIndexedError,
+        SubjectConnection,
+        SubjectNotFoundError,
+        create_index,
+        get_cross_screening_index,
+    )
+    from elile.screening.orchestrator import (
+        OrchestratorConfig,
+        ScreeningOrchestrator,
+        create_screening_orchestrator,
+    )
+    from elile.screening.progress import (
+        ETAEstimate,
+        HistoricalDuration,
+        PhaseProgress,
+        ProgressNotification,
+        ProgressNotificationType,
+        ProgressStep,
+        ProgressTracker,
+        ProgressTrackerConfig,
+        ScreeningProgress,
+        StallReason,
+        create_progress_tracker,
+        get_progress_tracker,
+        reset_progress_tracker,
+    )
+    from elile.screening.queue import (
+        DequeueResult,
+        InMemoryQueueStorage,
+        QueueConfig,
+        QueuedScreening,
+        QueueMetrics,
+        QueueStatus,
+        QueueStorage,
+        RedisQueueStorage,
+        ScreeningQueueManager,
+        WorkerStatus,
+        create_queue_manager,
+        create_queue_manager_async,
+    )
+    from elile.screening.result_compiler import (
+        CategorySummary,
+        CompiledResult,
+        CompilerConfig,
+        ConnectionSummary,
+        FindingsSummary,
+        InvestigationSummary,
+        ResultCompiler,
+        SARSummary,
+        SummaryFormat,
+        create_result_compiler,
+    )
+    from elile.screening.state_manager import (
+        InMemoryStateStore,
+        ProgressEvent,
+        ProgressEventType,
+        ScreeningPhase,
+        ScreeningState,
+        ScreeningStateManager,
+        StateManagerConfig,
+        StateStore,
+        create_state_manager,
+    )
+    from elile.screening.tier_router import (
+        DataSourceSpec,
+        DataSourceTier,
+        RoutingResult,
+        TierCapabilities,
+        TierRouter,
+        TierRouterConfig,
+        create_default_data_sources,
+        create_tier_router,
+    )
+    from elile.screening.types import (
+        GeneratedReport,
+        ReportType,
+        ScreeningComplianceError,
+        ScreeningCostSummary,
+        ScreeningError,
+        ScreeningExecutionError,
+        ScreeningPhaseResult,
+        ScreeningPriority,
+        ScreeningRequest,
+        ScreeningRequestCreate,
+        ScreeningResult,
+        ScreeningStatus,
+        ScreeningValidationError,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Orchestrator
@@ -45,28 +45,35 @@ Relationship Strength:
     )
 """
 
-from elile.screening.index.index import (
-    CrossScreeningIndex,
-    IndexConfig,
-    IndexStatistics,
-    create_index,
-    get_cross_screening_index,
-)
-from elile.screening.index.types import (
-    ConnectionStrength,
-    ConnectionType,
-    CrossScreeningIndexError,
-    CrossScreeningResult,
-    EntityReference,
-    IndexingError,
-    NetworkEdge,
-    NetworkGraph,
-    NetworkNode,
-    ScreeningEntity,
-    ScreeningNotIndexedError,
-    SubjectConnection,
-    SubjectNotFoundError,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.screening.index.index import (
+        CrossScreeningIndex,
+        IndexConfig,
+        IndexStatistics,
+        create_index,
+        get_cross_screening_index,
+    )
+    from elile.screening.index.types import (
+        ConnectionStrength,
+        ConnectionType,
+        CrossScreeningIndexError,
+        CrossScreeningResult,
+        EntityReference,
+        IndexingError,
+        NetworkEdge,
+        NetworkGraph,
+        NetworkNode,
+        ScreeningEntity,
+        ScreeningNotIndexedError,
+        SubjectConnection,
+        SubjectNotFoundError,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Main class
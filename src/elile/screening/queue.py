@@ -24,6 +24,7 @@ from pydantic import BaseModel, Field
 from redis.asyncio import Redis
 
 from elile.agent.state import ServiceTier
+from elile.config.settings import get_settings
 from elile.core.redis import RateLimiter, RateLimitResult, get_redis_client
 from elile.screening.types import ScreeningPriority, ScreeningRequest
 
@@ -932,7 +933,10 @@ async def create_queue_manager_async(
 ) -> ScreeningQueueManager:
     """Create a screening queue manager with Redis client.
 
-    This async version initializes the Redis client.
+    This async version initializes the Redis client. It is what worker
+    processes call at startup, so it also preloads provider reference data
+    when ``REFERENCE_DATA_PRELOAD`` is set. Each worker process loads its
+    own copy.
 
     Args:
         config: Queue configuration.
@@ -943,6 +947,12 @@ async def create_queue_manager_async(
     config = config or QueueConfig()
     client = await get_redis_client()
 
+    # Load the data at worker startup rather than on the first screening
+    if get_settings().REFERENCE_DATA_PRELOAD:
+        from elile.providers.reference_data import preload_reference_data
+
+        preload_reference_data()
+
     storage = RedisQueueStorage(client=client, config=config)
     rate_limiter = RateLimiter(client=client, prefix="screening:ratelimit")
 
@@ -1,9 +1,21 @@
 """Search system module for executing and managing searches."""
 
-from elile.search.dispatcher import DispatchResult, PriorityConfig, QueryDispatcher, QueryPriority
-from elile.search.engine import SearchEngine
-from elile.search.enricher import QueryEnricher
-from elile.search.query import QueryBuilder, QueryCategory, SearchQuery
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.search.dispatcher import (
+        DispatchResult,
+        PriorityConfig,
+        QueryDispatcher,
+        QueryPriority,
+    )
+    from elile.search.engine import SearchEngine
+    from elile.search.enricher import QueryEnricher
+    from elile.search.query import QueryBuilder, QueryCategory, SearchQuery
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     "DispatchResult",
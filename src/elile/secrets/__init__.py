@@ -23,31 +23,38 @@ Example:
     await manager.rotate_secret(SecretPath.DATABASE, new_credentials)
 """
 
-from elile.secrets.cache import SecretCache, SecretCacheConfig
-from elile.secrets.config import SecretsConfig, create_secrets_config
-from elile.secrets.environment import EnvironmentSecretsManager
-from elile.secrets.manager import get_secrets_manager, initialize_secrets, shutdown_secrets
-from elile.secrets.protocol import (
-    SecretPath,
-    SecretsManager,
-    SecretValue,
-)
-from elile.secrets.rotation import (
-    RotationConfig,
-    RotationResult,
-    RotationStatus,
-    SecretRotator,
-    create_secret_rotator,
-)
-from elile.secrets.types import (
-    AIProviderSecrets,
-    DatabaseCredentials,
-    EncryptionKeys,
-    ProviderApiKey,
-    SecretMetadata,
-    SecretType,
-)
-from elile.secrets.vault import VaultConfig, VaultSecretsManager
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from elile.secrets.cache import SecretCache, SecretCacheConfig
+    from elile.secrets.config import SecretsConfig, create_secrets_config
+    from elile.secrets.environment import EnvironmentSecretsManager
+    from elile.secrets.manager import get_secrets_manager, initialize_secrets, shutdown_secrets
+    from elile.secrets.protocol import (
+        SecretPath,
+        SecretsManager,
+        SecretValue,
+    )
+    from elile.secrets.rotation import (
+        RotationConfig,
+        RotationResult,
+        RotationStatus,
+        SecretRotator,
+        create_secret_rotator,
+    )
+    from elile.secrets.types import (
+        AIProviderSecrets,
+        DatabaseCredentials,
+        EncryptionKeys,
+        ProviderApiKey,
+        SecretMetadata,
+        SecretType,
+    )
+    from elile.secrets.vault import VaultConfig, VaultSecretsManager
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Protocol
@@ -9,37 +9,44 @@ This module provides comprehensive security measures including:
 - Trusted host validation
 """
 
-from .config import (
-    CSPDirective,
-    RateLimitConfig,
-    SecurityConfig,
-    SecurityHeadersConfig,
-    TrustedHostsConfig,
-    create_default_security_config,
-)
-from .headers import (
-    SecurityHeadersMiddleware,
-    build_csp_header,
-)
-from .rate_limiter import (
-    InMemoryRateLimitStore,
-    RateLimiter,
-    RateLimiterMiddleware,
-    RateLimitExceeded,
-    RateLimitResult,
-    RateLimitStore,
-    SlidingWindowCounter,
-)
-from .sanitization import (
-    HTMLSanitizer,
-    InputSanitizer,
-    SQLSafetyChecker,
-    sanitize_filename,
-    sanitize_html,
-    sanitize_string,
-    validate_email,
-    validate_url,
-)
+from typing import TYPE_CHECKING
+
+from elile.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .config import (
+        CSPDirective,
+        RateLimitConfig,
+        SecurityConfig,
+        SecurityHeadersConfig,
+        TrustedHostsConfig,
+        create_default_security_config,
+    )
+    from .headers import (
+        SecurityHeadersMiddleware,
+        build_csp_header,
+    )
+    from .rate_limiter import (
+        InMemoryRateLimitStore,
+        RateLimiter,
+        RateLimiterMiddleware,
+        RateLimitExceeded,
+        RateLimitResult,
+        RateLimitStore,
+        SlidingWindowCounter,
+    )
+    from .sanitization import (
+        HTMLSanitizer,
+        InputSanitizer,
+        SQLSafetyChecker,
+        sanitize_filename,
+        sanitize_html,
+        sanitize_string,
+        validate_email,
+        validate_url,
+    )
+
+__getattr__, __dir__ = lazy_exports(__name__, __file__)
 
 __all__ = [
     # Configuration
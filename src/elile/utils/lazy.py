@@ -0,0 +1,106 @@
+"""Lazy re-exports for package namespaces.
+
+A package ``__init__`` lists its re-exports as ordinary imports under
+``if TYPE_CHECKING:``, so type checkers and IDEs resolve them, and hands
+itself to ``lazy_exports``. Importing the package then imports none of its
+submodules; each name is imported on first access and cached in the package
+namespace, so later lookups cost nothing.
+
+    from typing import TYPE_CHECKING
+
+    from elile.utils.lazy import lazy_exports
+
+    if TYPE_CHECKING:
+        from elile.risk.analyzer import RiskAnalyzer
+
+    __getattr__, __dir__ = lazy_exports(__name__, __file__)
+
+``from elile.risk import RiskAnalyzer`` and ``import elile.risk.analyzer``
+keep working unchanged; only the cost moves to first use.
+"""
+
+import ast
+import importlib
+import importlib.util
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+
+def _type_checking_block(tree: ast.Module) -> list[ast.stmt]:
+    for node in tree.body:
+        if isinstance(node, ast.If) and ast.unparse(node.test) in (
+            "TYPE_CHECKING",
+            "typing.TYPE_CHECKING",
+        ):
+            return node.body
+    return []
+
+
+def parse_exports(package: str, path: str | Path) -> dict[str, tuple[str, str]]:
+    """Read the re-exports declared under ``if TYPE_CHECKING:`` in a module.
+
+    Args:
+        package: Name of the package the module belongs to
+        path: Path of the module source
+
+    Returns:
+        Exported name -> (absolute module name, attribute name)
+
+    Raises:
+        ValueError: If the block holds anything but ``from ... import`` statements
+    """
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    exports: dict[str, tuple[str, str]] = {}
+    for node in _type_checking_block(tree):
+        if not isinstance(node, ast.ImportFrom) or any(a.name == "*" for a in node.names):
+            raise ValueError(
+                f"{path}:{node.lineno}: lazy exports must be 'from module import name' statements"
+            )
+        module = importlib.util.resolve_name("." * node.level + (node.module or ""), package)
+        for alias in node.names:
+            exports[alias.asname or alias.name] = (module, alias.name)
+    return exports
+
+
+def lazy_exports(
+    package: str, path: str | Path
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build the module ``__getattr__`` and ``__dir__`` of a lazy package.
+
+    Args:
+        package: The package's ``__name__``
+        path: The package's ``__file__``
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign in the package namespace
+    """
+    exports = parse_exports(package, path)
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        if name in exports:
+            module_name, attribute = exports[name]
+            if module_name == package:
+                # ``from . import submodule``
+                value = importlib.import_module(f"{package}.{attribute}")
+            else:
+                value = getattr(importlib.import_module(module_name), attribute)
+        elif not name.startswith("__"):
+            # Submodule not imported yet, as ``package.submodule`` used to be
+            try:
+                value = importlib.import_module(f"{package}.{name}")
+            except ModuleNotFoundError as e:
+                if e.name != f"{package}.{name}":
+                    raise
+                raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,15 @@
+"""Benchmark suite for the screening hot paths.
+
+Benchmarks run deterministically and offline: workloads come from seeded
+generators (``data``) and external services are replaced by local
+stand-ins (``stand_ins``). Run them as a module from the repository root:
+
+    python -m tests.benchmarks list
+    python -m tests.benchmarks run -o baseline.json
+    python -m tests.benchmarks run -k "matching" -k "risk_aggregator.*" -o current.json
+    python -m tests.benchmarks compare baseline.json current.json \\
+        --threshold 0.2 --threshold-for "screening_orchestrator.*=0.5"
+
+``compare`` exits with status 1 when any benchmark regressed beyond its
+threshold. Compare runs made on the same machine at the same scale.
+"""
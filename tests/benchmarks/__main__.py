@@ -0,0 +1,111 @@
+"""Command line for the benchmark suite: list, run and compare."""
+
+import argparse
+import sys
+from pathlib import Path
+
+from elile.core.logging import setup_logging
+
+from .harness import (
+    METRICS,
+    BenchmarkRun,
+    ComparisonStatus,
+    compare_runs,
+    format_comparisons,
+    format_results,
+    load_benchmarks,
+    run_benchmarks,
+    select_benchmarks,
+)
+
+
+def _threshold(value: str) -> tuple[str, float]:
+    name, sep, threshold = value.rpartition("=")
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(f"expected NAME=THRESHOLD, got {value!r}")
+    try:
+        return name, float(threshold)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid threshold in {value!r}") from e
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_cmd = commands.add_parser("list", help="List registered benchmarks")
+    list_cmd.add_argument("-k", dest="patterns", action="append", help="Name or group glob")
+
+    run_cmd = commands.add_parser("run", help="Run benchmarks")
+    run_cmd.add_argument("-k", dest="patterns", action="append", help="Name or group glob")
+    run_cmd.add_argument("--rounds", type=int, default=5, help="Timed rounds per benchmark")
+    run_cmd.add_argument("--warmup", type=int, default=1, help="Untimed rounds per benchmark")
+    run_cmd.add_argument(
+        "--scale-factor", type=float, default=1.0, help="Multiplier for problem sizes"
+    )
+    run_cmd.add_argument("-o", "--output", type=Path, help="Write results to a JSON file")
+
+    compare_cmd = commands.add_parser("compare", help="Compare two result files")
+    compare_cmd.add_argument("baseline", type=Path)
+    compare_cmd.add_argument("current", type=Path)
+    compare_cmd.add_argument(
+        "--threshold", type=float, default=0.2, help="Allowed relative slowdown (0.2 = 20%%)"
+    )
+    compare_cmd.add_argument(
+        "--threshold-for",
+        type=_threshold,
+        action="append",
+        default=[],
+        metavar="NAME=THRESHOLD",
+        help="Threshold for benchmarks matching a name or glob",
+    )
+    compare_cmd.add_argument("--metric", choices=METRICS, default="median")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command line; returns the exit status."""
+    args = _parser().parse_args(argv)
+    setup_logging(log_level="WARNING")
+
+    if args.command == "compare":
+        comparisons = compare_runs(
+            BenchmarkRun.load(args.baseline),
+            BenchmarkRun.load(args.current),
+            threshold=args.threshold,
+            thresholds=dict(args.threshold_for),
+            metric=args.metric,
+        )
+        print(format_comparisons(comparisons))
+        regressed = [c for c in comparisons if c.status == ComparisonStatus.REGRESSED]
+        if regressed:
+            print(f"\n{len(regressed)} benchmark(s) regressed", file=sys.stderr)
+            return 1
+        return 0
+
+    load_benchmarks()
+    benchmarks = select_benchmarks(args.patterns)
+    if not benchmarks:
+        print("No benchmarks match", file=sys.stderr)
+        return 2
+
+    if args.command == "list":
+        for bench in benchmarks:
+            print(f"{bench.name:45} {bench.group:10} {bench.scale:>7}  {bench.description}")
+        return 0
+
+    run = run_benchmarks(
+        benchmarks,
+        rounds=args.rounds,
+        warmup=args.warmup,
+        scale_factor=args.scale_factor,
+        on_result=lambda r: print(f"{r.name}: {r.median * 1000:.2f} ms", file=sys.stderr),
+    )
+    print(format_results(run))
+    if args.output:
+        run.save(args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""Benchmarks for the iterative search graph in sequential and parallel type modes."""
+
+import asyncio
+from collections.abc import Callable, Generator
+from typing import Any
+from unittest.mock import patch
+
+from elile.agent import graph as graph_module
+from elile.agent import nodes
+from elile.agent.graph import compile_iterative_search_graph
+from elile.agent.state import SubjectInfo
+
+from .harness import benchmark
+
+# Simulated provider round trip of each search step
+SEARCH_LATENCY = 0.005
+
+
+def iterative_search(scale: int, *, parallel: bool) -> Generator[Callable[[], Any], None, None]:
+    """Run ``scale`` searches concurrently with a fixed latency per search step."""
+    original = nodes.search_type
+
+    async def search_type(state: dict) -> dict:
+        await asyncio.sleep(SEARCH_LATENCY)
+        return await original(state)
+
+    with (
+        patch.object(nodes, "search_type", search_type),
+        patch.object(graph_module, "search_type", search_type),
+    ):
+        graph = compile_iterative_search_graph(parallel_types=parallel)
+        subjects = [SubjectInfo(full_name=f"Subject {index}") for index in range(scale)]
+
+        async def run() -> list:
+            return await asyncio.gather(
+                *(
+                    graph.ainvoke({"subject": subject}, {"recursion_limit": 500})
+                    for subject in subjects
+                )
+            )
+
+        yield run
+
+
+@benchmark("iterative_search.sequential_types", group="agent", scale=5)
+def iterative_search_sequential(scale: int) -> Generator[Callable[[], Any], None, None]:
+    """Run the iterative search graph one information type at a time."""
+    yield from iterative_search(scale, parallel=False)
+
+
+@benchmark("iterative_search.parallel_types", group="agent", scale=5)
+def iterative_search_parallel(scale: int) -> Generator[Callable[[], Any], None, None]:
+    """Run the iterative search graph with a phase's types fanned out concurrently."""
+    yield from iterative_search(scale, parallel=True)
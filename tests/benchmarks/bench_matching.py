@@ -0,0 +1,119 @@
+"""Benchmarks for name matching, entity resolution and OSINT deduplication."""
+
+import random
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import elile.db.models  # noqa: F401  # Register all tables
+from elile.agent.state import ServiceTier
+from elile.db.models.base import Base
+from elile.db.models.entity import Entity, EntityType
+from elile.entity import EntityMatcher, SubjectIdentifiers
+from elile.providers.osint.deduplicator import OSINTDeduplicator
+from elile.providers.sanctions.matcher import NameMatcher
+
+from . import data
+from .harness import benchmark, report
+
+
+@benchmark("name_matcher.match_names", group="matching", scale=2_000)
+def name_matcher_match_names(scale: int) -> Callable[[], Any]:
+    """Score name pairs, half of them misspelled or reordered variants."""
+    matcher = NameMatcher()
+    pairs = data.name_pairs(scale)
+    return lambda: [matcher.match_names(first, second) for first, second in pairs]
+
+
+@benchmark("name_matcher.screen_list", group="matching", scale=2_000)
+def name_matcher_screen_list(scale: int) -> Callable[[], Any]:
+    """Screen five subjects against a sanctions list, checking aliases, DOB and country."""
+    matcher = NameMatcher()
+    entities = data.sanctioned_entities(scale)
+    rng = random.Random(8)
+    queries = [
+        (data.name_variant(entity.name, rng), entity.date_of_birth, "US")
+        for entity in rng.sample(entities, min(5, len(entities)))
+    ]
+
+    def screen() -> list:
+        return [
+            [
+                matcher.match_entity(name, entity, query_dob=dob, query_country=country)
+                for entity in entities
+            ]
+            for name, dob, country in queries
+        ]
+
+    return screen
+
+
+@benchmark("entity_matcher.resolve", group="matching", scale=1_000)
+async def entity_matcher_resolve(scale: int) -> AsyncGenerator[Callable[[], Any], None]:
+    """Resolve subjects against stored entities: exact SSN hits, then fuzzy fallbacks."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    stored = data.subjects(scale)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        session.add_all(
+            Entity(
+                entity_type=EntityType.INDIVIDUAL.value,
+                canonical_identifiers=data.canonical_identifiers(subject),
+            )
+            for subject in stored
+        )
+        await session.commit()
+
+    # Known subjects by SSN, and name-only lookups that fall through to fuzzy matching
+    rng = random.Random(9)
+    queries = [
+        SubjectIdentifiers(full_name=subject.full_name, ssn=subject.ssn)
+        for subject in rng.sample(stored, min(5, len(stored)))
+    ] + [
+        SubjectIdentifiers(
+            full_name=data.name_variant(subject.full_name, rng),
+            date_of_birth=subject.date_of_birth,
+            street_address=subject.street_address,
+        )
+        for subject in rng.sample(stored, min(5, len(stored)))
+    ]
+
+    async def resolve() -> list:
+        async with session_factory() as session:
+            matcher = EntityMatcher(session)
+            return [await matcher.resolve(query, tier=ServiceTier.ENHANCED) for query in queries]
+
+    yield resolve
+
+    await engine.dispose()
+
+
+def osint_deduplicator_news(scale: int) -> Callable[[], Any]:
+    """Deduplicate news mentions with syndicated near-duplicate headlines."""
+    deduplicator = OSINTDeduplicator()
+    mentions = data.news_mentions(scale)
+
+    def deduplicate() -> None:
+        result = deduplicator.deduplicate_news(mentions)
+        report("comparisons", result.comparisons)
+
+    return deduplicate
+
+
+# Candidate selection should keep the cost close to linear in the corpus size
+for _scale in (100, 1_000, 5_000, 20_000):
+    benchmark(f"osint_deduplicator.news_{_scale}", group="matching", scale=_scale)(
+        osint_deduplicator_news
+    )
+
+
+@benchmark("osint_deduplicator.profiles", group="matching", scale=1_000)
+def osint_deduplicator_profiles(scale: int) -> Callable[[], Any]:
+    """Deduplicate social profiles of the same people across platforms."""
+    deduplicator = OSINTDeduplicator()
+    profiles = data.social_profiles(scale)
+    return lambda: deduplicator.deduplicate_profiles(profiles)
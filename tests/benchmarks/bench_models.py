@@ -0,0 +1,57 @@
+"""Benchmarks for LLM calls against a provider with a hard concurrency limit.
+
+Compares callers retrying on 429 responses with the same calls queued
+through LLMScheduler, which keeps them within the provider's capacity.
+"""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from elile.config.settings import ModelProvider
+from elile.models.base import Message, MessageRole
+from elile.models.scheduler import LLMScheduler, ProviderLimits, SchedulerConfig
+
+from .harness import benchmark
+from .stand_ins import CapacityLimitedModel, ProviderRateLimited
+
+MESSAGES = [Message(role=MessageRole.USER, content="Assess the employment history.")]
+
+# Simulated provider: 4 concurrent calls, 10 ms per call, 50 ms retry-after
+CAPACITY = 4
+LATENCY = 0.01
+RETRY_AFTER = 0.05
+
+
+@benchmark("llm_scheduler.unscheduled", group="models", scale=40)
+def llm_unscheduled(scale: int) -> Callable[[], Any]:
+    """Issue ``scale`` concurrent calls, each retrying after its 429 retry-after."""
+
+    async def call_with_retry(model: CapacityLimitedModel) -> None:
+        while True:
+            try:
+                await model.generate(MESSAGES)
+                return
+            except ProviderRateLimited as exc:
+                await asyncio.sleep(float(exc.headers["retry-after"]))
+
+    async def run() -> None:
+        model = CapacityLimitedModel(CAPACITY, LATENCY, RETRY_AFTER)
+        await asyncio.gather(*(call_with_retry(model) for _ in range(scale)))
+
+    return run
+
+
+@benchmark("llm_scheduler.scheduled", group="models", scale=40)
+def llm_scheduled(scale: int) -> Callable[[], Any]:
+    """Issue ``scale`` concurrent calls through the scheduler at the provider's capacity."""
+
+    async def run() -> None:
+        model = CapacityLimitedModel(CAPACITY, LATENCY, RETRY_AFTER)
+        scheduler = LLMScheduler(
+            {ModelProvider.ANTHROPIC: model},
+            SchedulerConfig(default_limits=ProviderLimits(max_concurrency=CAPACITY)),
+        )
+        await asyncio.gather(*(scheduler.generate(MESSAGES) for _ in range(scale)))
+
+    return run
@@ -0,0 +1,106 @@
+"""Benchmarks for provider construction, credential lookups and OSINT source fan-out."""
+
+import asyncio
+import tempfile
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import Any
+
+from elile.providers.darkweb import DarkWebProvider
+from elile.providers.darkweb.credential_index import CredentialIndex, CredentialIndexBuilder
+from elile.providers.education import EducationProvider
+from elile.providers.osint.provider import OSINTProvider
+from elile.providers.osint.types import OSINTProviderConfig
+from elile.providers.sanctions import SanctionsProvider
+
+from .harness import benchmark
+
+# Extra latency of each OSINT source on top of its built-in simulated search
+SOURCE_LATENCY = 0.1
+OSINT_SOURCES = (
+    "_search_social_media",
+    "_search_news",
+    "_search_public_records",
+    "_search_professional",
+)
+
+
+@benchmark("providers.construct", group="providers", scale=200)
+def providers_construct(scale: int) -> Callable[[], Any]:
+    """Construct sanctions, education and dark web providers, as worker startup does."""
+
+    def construct() -> None:
+        for _ in range(scale):
+            SanctionsProvider()
+            EducationProvider()
+            DarkWebProvider()
+
+    return construct
+
+
+def credential_lookups(
+    scale: int, email: Callable[[int], str]
+) -> Generator[Callable[[], Any], None, None]:
+    """Look up 2,000 emails in a credential index of ``scale`` records."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "breaches.idx"
+        builder = CredentialIndexBuilder(path)
+        builder.add_breach("dump", (f"user{i}@example.com" for i in range(scale)))
+        builder.build()
+        queries = [email(i) for i in range(2_000)]
+        with CredentialIndex(path) as index:
+            yield lambda: [index.lookup(query) for query in queries]
+
+
+@benchmark("credential_index.lookup_hits", group="providers", scale=200_000)
+def credential_index_hits(scale: int) -> Generator[Callable[[], Any], None, None]:
+    """Look up breached emails: Bloom filter, fan-out bucket, then binary search."""
+    yield from credential_lookups(scale, lambda i: f"user{i * 37 % scale}@example.com")
+
+
+@benchmark("credential_index.lookup_misses", group="providers", scale=200_000)
+def credential_index_misses(scale: int) -> Generator[Callable[[], Any], None, None]:
+    """Look up emails absent from every breach, mostly rejected by the Bloom filter."""
+    yield from credential_lookups(scale, lambda i: f"other{i}@example.com")
+
+
+def slow_sources(provider: OSINTProvider, delays: dict[str, float]) -> OSINTProvider:
+    """Delay the provider's source searches, standing in for slow upstream APIs."""
+
+    def slow(search, delay: float):
+        async def slow_search(subject_name: str, identifiers: list[str]):
+            await asyncio.sleep(delay)
+            return await search(subject_name, identifiers)
+
+        return slow_search
+
+    for name, delay in delays.items():
+        setattr(provider, name, slow(getattr(provider, name), delay))
+    return provider
+
+
+@benchmark("osint.gather_intelligence", group="providers", scale=5)
+def osint_gather(scale: int) -> Callable[[], Any]:
+    """Gather intelligence for ``scale`` subjects with every source slowed down."""
+    provider = slow_sources(OSINTProvider(), dict.fromkeys(OSINT_SOURCES, SOURCE_LATENCY))
+
+    async def gather() -> None:
+        for index in range(scale):
+            await provider.gather_intelligence(subject_name=f"Subject {index}", identifiers=[])
+
+    return gather
+
+
+@benchmark("osint.gather_intelligence.source_timeout", group="providers", scale=5)
+def osint_gather_source_timeout(scale: int) -> Callable[[], Any]:
+    """Gather intelligence for ``scale`` subjects while the news source hangs past its timeout."""
+    provider = slow_sources(
+        OSINTProvider(OSINTProviderConfig(source_timeouts_ms={"news": 200})),
+        {**dict.fromkeys(OSINT_SOURCES, SOURCE_LATENCY), "_search_news": 5.0},
+    )
+
+    async def gather() -> None:
+        for index in range(scale):
+            await provider.gather_intelligence(subject_name=f"Subject {index}", identifiers=[])
+
+    return gather
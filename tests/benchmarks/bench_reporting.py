@@ -0,0 +1,64 @@
+"""Benchmarks for report generation."""
+
+from collections.abc import Callable
+from typing import Any
+from uuid import uuid7
+
+from elile.agent.state import SearchDegree
+from elile.compliance.types import RoleCategory
+from elile.reporting import GeneratorConfig, OutputFormat, ReportGenerator, ReportPersona
+from elile.risk import ConnectionAnalyzer, RiskAggregator, RiskScorer
+from elile.screening.result_compiler import CompiledResult, ResultCompiler
+
+from . import data
+from .harness import benchmark
+
+
+def compiled_result(finding_count: int) -> CompiledResult:
+    """Compile a screening result from generated findings and a generated network."""
+    entity_id = uuid7()
+    findings = data.findings(finding_count, entity_id=entity_id)
+    subject, entities, relations = data.network(max(10, finding_count // 5))
+    connections = ConnectionAnalyzer().analyze_connections(
+        subject_entity=subject,
+        discovered_entities=entities,
+        relations=relations,
+        degree=SearchDegree.D3,
+    )
+    assessment = RiskAggregator().aggregate_risk(
+        base_score=RiskScorer().calculate_risk_score(findings, RoleCategory.FINANCIAL),
+        connections=connections,
+        findings=findings,
+        role_category=RoleCategory.FINANCIAL,
+    )
+    return ResultCompiler().compile_results(
+        sar_results={},
+        findings=findings,
+        risk_assessment=assessment,
+        connections=entities,
+        relations=relations,
+        risk_connections=connections.risk_connections_found,
+        screening_id=uuid7(),
+        entity_id=entity_id,
+        tenant_id=uuid7(),
+    )
+
+
+@benchmark("report_generator.html", group="reporting", scale=500)
+def report_generator_html(scale: int) -> Callable[[], Any]:
+    """Generate HTML reports for every persona from one compiled result."""
+    generator = ReportGenerator(config=GeneratorConfig(require_context=False))
+    compiled = compiled_result(scale)
+    return lambda: generator.generate_reports(
+        compiled, list(ReportPersona), output_format=OutputFormat.HTML
+    )
+
+
+@benchmark("report_generator.json", group="reporting", scale=500)
+def report_generator_json(scale: int) -> Callable[[], Any]:
+    """Generate a JSON investigator report from one compiled result."""
+    generator = ReportGenerator(config=GeneratorConfig(require_context=False))
+    compiled = compiled_result(scale)
+    return lambda: generator.generate_report(
+        compiled, ReportPersona.INVESTIGATOR, output_format=OutputFormat.JSON
+    )
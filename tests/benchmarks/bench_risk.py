@@ -0,0 +1,60 @@
+"""Benchmarks for connection analysis, finding classification and risk aggregation."""
+
+from collections.abc import Callable
+from typing import Any
+
+from elile.agent.state import SearchDegree
+from elile.compliance.types import RoleCategory
+from elile.risk import ConnectionAnalyzer, FindingClassifier, RiskAggregator, RiskScorer
+
+from . import data
+from .harness import benchmark
+
+
+@benchmark("connection_analyzer.analyze", group="risk", scale=100)
+def connection_analyzer_analyze(scale: int) -> Callable[[], Any]:
+    """Build and score a D3 network: centrality, risk propagation and risk connections."""
+    analyzer = ConnectionAnalyzer()
+    subject, entities, relations = data.network(scale)
+    return lambda: analyzer.analyze_connections(
+        subject_entity=subject,
+        discovered_entities=entities,
+        relations=relations,
+        degree=SearchDegree.D3,
+    )
+
+
+@benchmark("finding_classifier.classify", group="risk", scale=2_000)
+def finding_classifier_classify(scale: int) -> Callable[[], Any]:
+    """Validate, reclassify and weight findings for a financial role."""
+    classifier = FindingClassifier()
+    findings = data.findings(scale)
+    return lambda: classifier.classify_findings(
+        findings, RoleCategory.FINANCIAL, update_findings=False
+    )
+
+
+@benchmark("risk_aggregator.aggregate", group="risk", scale=1_000)
+def risk_aggregator_aggregate(scale: int) -> Callable[[], Any]:
+    """Score findings and aggregate them with a network analysis into an assessment."""
+    scorer = RiskScorer()
+    aggregator = RiskAggregator()
+    findings = data.findings(scale)
+    subject, entities, relations = data.network(max(10, scale // 10))
+    connections = ConnectionAnalyzer().analyze_connections(
+        subject_entity=subject,
+        discovered_entities=entities,
+        relations=relations,
+        degree=SearchDegree.D3,
+    )
+
+    def aggregate() -> Any:
+        base_score = scorer.calculate_risk_score(findings, RoleCategory.FINANCIAL)
+        return aggregator.aggregate_risk(
+            base_score=base_score,
+            connections=connections,
+            findings=findings,
+            role_category=RoleCategory.FINANCIAL,
+        )
+
+    return aggregate
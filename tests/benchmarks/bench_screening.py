@@ -0,0 +1,156 @@
+"""Benchmarks for request routing, HRIS event ingestion and end-to-end screenings."""
+
+import asyncio
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid7
+
+from elile.agent.state import SearchDegree, ServiceTier
+from elile.compliance.types import Locale
+from elile.hris.event_processor import HRISEventProcessor, ProcessingStatus
+from elile.hris.gateway import HRISEvent, HRISEventType, HRISPlatform
+from elile.providers.health import CircuitBreakerRegistry
+from elile.providers.registry import ProviderRegistry
+from elile.providers.router import RequestRouter, RoutedRequest, RoutingConfig
+from elile.providers.types import CostTier
+from elile.screening import (
+    ReportType,
+    ScreeningOrchestrator,
+    ScreeningRequest,
+    ScreeningStatus,
+)
+
+from . import data
+from .harness import benchmark
+from .stand_ins import (
+    LocalInvestigation,
+    LocalRiskAggregator,
+    LocalScreeningService,
+    SimulatedProvider,
+)
+
+# No backoff: the benchmark measures routing work, not sleeps between retries
+ROUTING_CONFIG = RoutingConfig(base_retry_delay=0, retry_jitter=0)
+
+
+def simulated_providers() -> list[SimulatedProvider]:
+    """A flaky low-cost primary for every screening check and a reliable fallback."""
+    return [
+        SimulatedProvider(
+            "sim_primary", data.SCREENING_CHECKS, failure_rate=0.2, cost_tier=CostTier.LOW, seed=10
+        ),
+        SimulatedProvider(
+            "sim_fallback", data.SCREENING_CHECKS, cost_tier=CostTier.MEDIUM, seed=11
+        ),
+    ]
+
+
+def simulated_registry(providers: list[SimulatedProvider]) -> ProviderRegistry:
+    """Register the providers in a fresh registry."""
+    registry = ProviderRegistry()
+    for provider in providers:
+        registry.register(provider)
+    return registry
+
+
+@benchmark("request_router.route_batch", group="screening", scale=500)
+def request_router_route_batch(scale: int) -> Callable[[], Any]:
+    """Route a batch of checks with retries, circuit breakers and fallback."""
+    providers = simulated_providers()
+    registry = simulated_registry(providers)
+    tenant_id = uuid7()
+    subjects = data.subjects(max(1, scale // len(data.SCREENING_CHECKS)))
+    requests = [
+        RoutedRequest.create(
+            check_type=data.SCREENING_CHECKS[index % len(data.SCREENING_CHECKS)],
+            subject=subjects[index % len(subjects)],
+            locale=Locale.US,
+            entity_id=uuid7(),
+            tenant_id=tenant_id,
+        )
+        for index in range(scale)
+    ]
+
+    async def route() -> list:
+        # Fresh breakers and provider sequences, so every round routes identically
+        for provider in providers:
+            provider.reset()
+        router = RequestRouter(
+            registry, circuit_registry=CircuitBreakerRegistry(), config=ROUTING_CONFIG
+        )
+        return await router.route_batch(requests)
+
+    return route
+
+
+@benchmark("screening_orchestrator.execute_screening", group="screening", scale=20)
+def screening_orchestrator_execute_screening(scale: int) -> Callable[[], Any]:
+    """Run concurrent screenings end to end, from validation to the summary report."""
+    providers = simulated_providers()
+    router = RequestRouter(simulated_registry(providers), config=ROUTING_CONFIG)
+    orchestrator = ScreeningOrchestrator(
+        sar_orchestrator=LocalInvestigation(router, data.SCREENING_CHECKS),
+        risk_aggregator=LocalRiskAggregator(),
+    )
+    tenant_id = uuid7()
+    requests = [
+        ScreeningRequest(
+            tenant_id=tenant_id,
+            subject=subject,
+            locale=Locale.US,
+            service_tier=ServiceTier.STANDARD,
+            search_degree=SearchDegree.D1,
+            consent_token=f"consent-{index}",
+            report_types=[ReportType.SUMMARY],
+        )
+        for index, subject in enumerate(data.subjects(scale))
+    ]
+
+    async def screen() -> list:
+        for provider in providers:
+            provider.reset()
+        results = await asyncio.gather(
+            *(orchestrator.execute_screening(request) for request in requests)
+        )
+        failed = [result for result in results if result.status != ScreeningStatus.COMPLETE]
+        if failed:
+            raise RuntimeError(f"Screening did not complete: {failed[0].error_message}")
+        return results
+
+    return screen
+
+
+@benchmark("hris_event_processor.onboarding_wave", group="screening", scale=5_000)
+def hris_onboarding_wave(scale: int) -> Callable[[], Any]:
+    """Ingest hire and consent events for ``scale`` new employees in one batch."""
+    tenant_id = uuid7()
+
+    def event(index: int, event_type: HRISEventType, event_data: dict) -> HRISEvent:
+        return HRISEvent(
+            event_id=uuid7(),
+            tenant_id=tenant_id,
+            employee_id=f"EMP-{index:05d}",
+            event_type=event_type,
+            platform=HRISPlatform.WORKDAY,
+            raw_payload=event_data,
+            event_data=event_data,
+            received_at=datetime.now(UTC),
+        )
+
+    events = [
+        event(index, HRISEventType.HIRE_INITIATED, {"full_name": f"Employee {index}"})
+        for index in range(scale)
+    ] + [
+        event(index, HRISEventType.CONSENT_GRANTED, {"consent_token": f"consent-{index}"})
+        for index in range(scale)
+    ]
+
+    async def ingest() -> None:
+        # A fresh processor each round, so no event is a duplicate of the last round
+        processor = HRISEventProcessor(screening_service=LocalScreeningService())
+        batch = await processor.process_events(events)
+        if batch.count(ProcessingStatus.SUCCESS) != len(events):
+            raise RuntimeError("Onboarding wave did not ingest every event")
+
+    return ingest
@@ -0,0 +1,45 @@
+"""Benchmarks for the cold start of the API and a worker process."""
+
+import os
+import subprocess
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import elile
+
+from .harness import benchmark
+
+SRC = Path(elile.__file__).parents[1]
+
+
+def _cold_start(statement: str, scale: int) -> Callable[[], Any]:
+    """Run a statement in ``scale`` fresh interpreters, one after another."""
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")])),
+    }
+
+    def run() -> None:
+        for _ in range(scale):
+            subprocess.run(
+                [sys.executable, "-W", "ignore", "-c", statement],
+                check=True,
+                env=env,
+                timeout=120,
+            )
+
+    return run
+
+
+@benchmark("startup.create_app", group="startup", scale=1)
+def startup_create_app(scale: int) -> Callable[[], Any]:
+    """Start an interpreter, import the API and create the application."""
+    return _cold_start("from elile.api.app import create_app; create_app()", scale)
+
+
+@benchmark("startup.worker", group="startup", scale=1)
+def startup_worker(scale: int) -> Callable[[], Any]:
+    """Start an interpreter and import the screening queue a worker runs."""
+    return _cold_start("from elile.screening.queue import ScreeningQueueManager", scale)
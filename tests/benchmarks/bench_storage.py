@@ -0,0 +1,392 @@
+"""Benchmarks for encrypted columns, audit writes, retention sweeps and stored history.
+
+Stored history covers compact profile versions and delta-encoded checkpoints.
+"""
+
+import json
+import tempfile
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Generator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from uuid import uuid7
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from elile.compliance.retention.manager import RetentionManager, RetentionManagerConfig
+from elile.compliance.retention.store import InMemoryRetentionStore
+from elile.compliance.retention.types import (
+    DataType,
+    DeletionMethod,
+    RetentionPolicy,
+    RetentionRecord,
+)
+from elile.core import encryption
+from elile.core.audit import AuditLogger
+from elile.core.audit_writer import AuditWriterConfig, BufferedAuditWriter
+from elile.core.encryption import Encryptor, generate_key
+from elile.db.models.audit import AuditEvent, AuditEventType
+from elile.db.models.base import Base
+from elile.db.models.entity import Entity, EntityType
+from elile.db.models.profile import EntityProfile, ProfileEncoding, ProfileTrigger
+from elile.db.profile_delta import SNAPSHOT_FIELDS, snapshot_size
+from elile.db.repositories import ProfileRepository
+from elile.db.types import EncryptedJSON, decrypt_values_async
+from elile.investigation.checkpoint import CheckpointData, InMemoryCheckpointStorage
+from elile.investigation.checkpoint_store import FileCheckpointStorage
+
+from .harness import benchmark, report
+
+
+@contextmanager
+def _encrypted_page(scale: int) -> Iterator[list[str]]:
+    """Encrypt a page of JSON values under a temporary global encryptor."""
+    previous = encryption._encryptor
+    encryption._encryptor = Encryptor(generate_key())
+    try:
+        column = EncryptedJSON()
+        yield [
+            column.process_bind_param({"ssn": f"000-00-{i:04d}", "dob": "1990-01-01"}, None)
+            for i in range(scale)
+        ]
+    finally:
+        encryption._encryptor = previous
+
+
+@benchmark("encrypted_json.load_page", group="storage", scale=10_000)
+def encrypted_json_load_page(scale: int) -> Generator[Callable[[], Any], None, None]:
+    """Load a page of eager EncryptedJSON values, decrypting each on the event loop."""
+    column = EncryptedJSON()
+    with _encrypted_page(scale) as stored:
+        yield lambda: [column.process_result_value(value, None) for value in stored]
+
+
+@benchmark("encrypted_json.load_page_lazy", group="storage", scale=10_000)
+def encrypted_json_load_page_lazy(scale: int) -> Generator[Callable[[], Any], None, None]:
+    """Load a page of lazy EncryptedJSON values as proxies, without decrypting."""
+    column = EncryptedJSON(lazy=True)
+    with _encrypted_page(scale) as stored:
+        yield lambda: [column.process_result_value(value, None) for value in stored]
+
+
+@benchmark("encrypted_json.decrypt_page_async", group="storage", scale=10_000)
+def encrypted_json_decrypt_page_async(scale: int) -> Generator[Callable[[], Any], None, None]:
+    """Load a page of lazy EncryptedJSON values and decrypt them in worker thread batches."""
+    column = EncryptedJSON(lazy=True)
+    with _encrypted_page(scale) as stored:
+
+        async def load_and_decrypt() -> list:
+            proxies = [column.process_result_value(value, None) for value in stored]
+            await decrypt_values_async(proxies)
+            return proxies
+
+        yield load_and_decrypt
+
+
+# Audit events a request logs
+_EVENTS_PER_REQUEST = 5
+
+
+@asynccontextmanager
+async def _audit_database() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    """File-backed SQLite database with the audit table."""
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(directory) / 'audit.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=[AuditEvent.__table__])
+        try:
+            yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        finally:
+            await engine.dispose()
+
+
+async def _log_requests(
+    session_factory: async_sessionmaker[AsyncSession],
+    requests: int,
+    writer: BufferedAuditWriter | None = None,
+) -> None:
+    correlation_id = uuid7()
+    for _ in range(requests):
+        async with session_factory() as session:
+            logger = AuditLogger(session, writer=writer)
+            for index in range(_EVENTS_PER_REQUEST):
+                await logger.log_event(
+                    AuditEventType.DATA_ACCESSED, correlation_id, {"index": index}
+                )
+            await session.commit()
+
+
+@benchmark("audit_writer.per_event_flush", group="storage", scale=50)
+async def audit_writer_per_event_flush(scale: int) -> AsyncGenerator[Callable[[], Any], None]:
+    """Log the audit events of requests with one flush per event."""
+    async with _audit_database() as session_factory:
+        yield lambda: _log_requests(session_factory, scale)
+
+
+@benchmark("audit_writer.buffered", group="storage", scale=50)
+async def audit_writer_buffered(scale: int) -> AsyncGenerator[Callable[[], Any], None]:
+    """Log the audit events of requests through the buffered writer, then flush it."""
+    async with _audit_database() as session_factory:
+        writer = BufferedAuditWriter(session_factory, AuditWriterConfig(flush_interval=60))
+
+        async def log_and_flush() -> None:
+            await _log_requests(session_factory, scale, writer)
+            await writer.flush()
+
+        yield log_and_flush
+
+
+# Records that fall due between retention sweeps
+_DUE_RECORDS = 5_000
+
+
+def _retention_records(
+    policy: RetentionPolicy, count: int, expires_in: timedelta
+) -> list[RetentionRecord]:
+    expires_at = datetime.utcnow() + expires_in
+    return [
+        RetentionRecord(
+            data_type=policy.data_type, policy_id=policy.policy_id, expires_at=expires_at
+        )
+        for _ in range(count)
+    ]
+
+
+@benchmark("retention_manager.sweep", group="storage", scale=50_000)
+async def retention_manager_sweep(scale: int) -> AsyncGenerator[Callable[[], Any], None]:
+    """Track 5,000 newly expired records among ``scale`` long-lived ones, then sweep."""
+    policy = RetentionPolicy(
+        name="benchmark",
+        data_type=DataType.CACHE_ENTRY,
+        retention_days=30,
+        deletion_method=DeletionMethod.HARD_DELETE,
+    )
+    store = InMemoryRetentionStore()
+    manager = RetentionManager(
+        config=RetentionManagerConfig(batch_size=2_500, auto_delete=True), store=store
+    )
+    manager.register_policy(policy)
+    await store.save_records(_retention_records(policy, scale, timedelta(days=300)))
+    await manager.run_sweep()  # Indexes the bulk load
+
+    async def sweep() -> None:
+        await store.save_records(_retention_records(policy, _DUE_RECORDS, timedelta(days=-1)))
+        progress = await manager.run_sweep()
+        if progress.deleted != _DUE_RECORDS:
+            raise RuntimeError(f"Sweep deleted {progress.deleted} of {_DUE_RECORDS} records")
+
+    yield sweep
+
+
+# Latest-version reads per round
+_PROFILE_READS = 20
+
+
+def _profile_snapshot(findings: int) -> dict[str, Any]:
+    """Profile snapshot with ``findings`` court records, as a monitoring check stores it."""
+    return {
+        "findings": {
+            "items": [
+                {
+                    "finding_id": f"f-{i}",
+                    "finding_type": "criminal_record",
+                    "severity": "medium",
+                    "summary": f"Court record {i} found in county search",
+                    "details": {"court": "Springfield County", "case_number": f"CR-{1000 + i}"},
+                    "sources": [{"provider_id": "courts", "record_id": f"r-{i}"}],
+                }
+                for i in range(findings)
+            ]
+        },
+        "risk_score": {"overall": 0.4, "level": "moderate", "categories": {"criminal": 0.4}},
+        "connections": {
+            "nodes": [{"id": f"n-{i}", "name": f"Associate {i}"} for i in range(10)],
+            "edges": [{"from": "n-0", "to": f"n-{i}"} for i in range(1, 10)],
+        },
+        "data_sources_used": [{"provider": f"provider-{i}"} for i in range(6)],
+        "stale_data_used": {},
+    }
+
+
+@asynccontextmanager
+async def _profile_history(
+    versions: int, *, compact: bool
+) -> AsyncIterator[tuple[async_sessionmaker[AsyncSession], Entity]]:
+    """Store ``versions`` monitoring profiles of one entity, reporting bytes per version."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all, tables=[Entity.__table__, EntityProfile.__table__]
+        )
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as session:
+            entity = Entity(
+                entity_id=uuid7(),
+                entity_type=EntityType.INDIVIDUAL.value,
+                canonical_identifiers={},
+            )
+            session.add(entity)
+            await session.commit()
+            profiles = [
+                EntityProfile(
+                    entity_id=entity.entity_id,
+                    version=version,
+                    trigger_type=ProfileTrigger.MONITORING.value,
+                    connection_count=10,
+                    evolution_signals={},
+                    # Monitoring checks mostly find nothing new
+                    **_profile_snapshot(40 + version // 10),
+                )
+                for version in range(1, versions + 1)
+            ]
+            await ProfileRepository(session, compact=compact).create_many(profiles)
+
+        stored = sum(
+            (
+                snapshot_size({name: getattr(p, name) for name in SNAPSHOT_FIELDS})
+                if p.encoding == ProfileEncoding.FULL.value
+                else len(p.snapshot_delta)
+            )
+            for p in profiles
+        )
+        report("bytes_per_version", stored / versions)
+        yield session_factory, entity
+    finally:
+        await engine.dispose()
+
+
+async def _profile_get_latest(
+    versions: int, *, compact: bool
+) -> AsyncGenerator[Callable[[], Any], None]:
+    async with _profile_history(versions, compact=compact) as (session_factory, entity):
+
+        async def get_latest() -> None:
+            async with session_factory() as session:
+                repo = ProfileRepository(session)
+                for _ in range(_PROFILE_READS):
+                    session.expunge_all()
+                    await repo.get_latest(entity.entity_id)
+
+        yield get_latest
+
+
+async def _profile_get_by_version(
+    versions: int, *, compact: bool
+) -> AsyncGenerator[Callable[[], Any], None]:
+    async with _profile_history(versions, compact=compact) as (session_factory, entity):
+
+        async def get_every_version() -> None:
+            async with session_factory() as session:
+                repo = ProfileRepository(session)
+                for version in range(1, versions + 1):
+                    session.expunge_all()
+                    await repo.get_by_version(entity.entity_id, version)
+
+        yield get_every_version
+
+
+@benchmark("profile_repository.get_latest_full", group="storage", scale=60)
+async def profile_get_latest_full(scale: int) -> AsyncGenerator[Callable[[], Any], None]:
+    """Read the latest of ``scale`` profile versions, each stored as a full snapshot."""
+    async for target in _profile_get_latest(scale, compact=False):
+        yield target
+
+
+@benchmark("profile_repository.get_latest_compact", group="storage", scale=60)
+async def profile_get_latest_compact(scale: int) -> AsyncGenerator[Callable[[], Any], None]:
+    """Read the latest of ``scale`` profile versions stored as deltas between snapshots."""
+    async for target in _profile_get_latest(scale, compact=True):
+        yield target
+
+
+@benchmark("profile_repository.get_by_version_full", group="storage", scale=60)
+async def profile_get_by_version_full(scale: int) -> AsyncGenerator[Callable[[], Any], None]:
+    """Read each of ``scale`` profile versions, each stored as a full snapshot."""
+    async for target in _profile_get_by_version(scale, compact=False):
+        yield target
+
+
+@benchmark("profile_repository.get_by_version_compact", group="storage", scale=60)
+async def profile_get_by_version_compact(scale: int) -> AsyncGenerator[Callable[[], Any], None]:
+    """Read each of ``scale`` profile versions stored as deltas between snapshots."""
+    async for target in _profile_get_by_version(scale, compact=True):
+        yield target
+
+
+def _knowledge_snapshots(checkpoints: int) -> list[dict[str, Any]]:
+    """Knowledge snapshots of an investigation gaining a few facts per checkpoint."""
+    facts = [
+        {"fact_id": i, "type": "employment", "value": f"Employer {i}", "confidence": 0.8}
+        for i in range(200 + checkpoints * 5)
+    ]
+    return [
+        {
+            "facts": facts[: 200 + index * 5],
+            "summary": {"fact_count": 200 + index * 5, "sources": ["sterling", "checkr"]},
+        }
+        for index in range(checkpoints)
+    ]
+
+
+def _save_investigation(
+    storage: InMemoryCheckpointStorage | FileCheckpointStorage,
+    snapshots: list[dict[str, Any]],
+) -> list[CheckpointData]:
+    """Save one checkpoint per snapshot for a new investigation."""
+    investigation_id = uuid7()
+    checkpoints = [
+        CheckpointData(
+            investigation_id=investigation_id,
+            current_phase="foundation",
+            iteration_count=index,
+            type_states={"employment": {"iteration": index}},
+            knowledge_snapshot=snapshot,
+        )
+        for index, snapshot in enumerate(snapshots)
+    ]
+    for checkpoint in checkpoints:
+        storage.save(checkpoint)
+    return checkpoints
+
+
+@benchmark("checkpoint_storage.in_memory", group="storage", scale=100)
+def checkpoint_storage_in_memory(scale: int) -> Callable[[], Any]:
+    """Save ``scale`` checkpoints of a growing investigation, keeping each full snapshot."""
+    snapshots = _knowledge_snapshots(scale)
+    storage = InMemoryCheckpointStorage()
+    # Held in memory, each checkpoint is a full snapshot of this serialized size
+    checkpoints = _save_investigation(InMemoryCheckpointStorage(), snapshots)
+    serialized = sum(len(json.dumps(checkpoint.to_dict())) for checkpoint in checkpoints)
+    report("bytes_per_checkpoint", serialized / scale)
+
+    return lambda: _save_investigation(storage, snapshots)
+
+
+def _file_checkpoints(
+    scale: int, full_snapshot_interval: int
+) -> Generator[Callable[[], Any], None, None]:
+    snapshots = _knowledge_snapshots(scale)
+    with tempfile.TemporaryDirectory() as directory:
+        storage = FileCheckpointStorage(directory, full_snapshot_interval=full_snapshot_interval)
+
+        def save() -> None:
+            _save_investigation(storage, snapshots)
+            stats = storage.stats
+            report("bytes_per_checkpoint", stats.bytes_written / stats.checkpoints_written)
+
+        yield save
+        storage.close()
+
+
+@benchmark("checkpoint_storage.file_full_snapshots", group="storage", scale=100)
+def checkpoint_storage_file_full(scale: int) -> Generator[Callable[[], Any], None, None]:
+    """Save ``scale`` checkpoints to files, each as a compressed full snapshot."""
+    yield from _file_checkpoints(scale, full_snapshot_interval=1)
+
+
+@benchmark("checkpoint_storage.file_deltas", group="storage", scale=100)
+def checkpoint_storage_file_deltas(scale: int) -> Generator[Callable[[], Any], None, None]:
+    """Save ``scale`` checkpoints to files as deltas between every tenth full snapshot."""
+    yield from _file_checkpoints(scale, full_snapshot_interval=10)
@@ -0,0 +1,355 @@
+"""Synthetic data generators for benchmarks.
+
+Every generator takes a ``seed`` and is deterministic, so two runs (and
+two commits) benchmark exactly the same workload.
+"""
+
+import random
+import string
+from datetime import UTC, date, datetime, timedelta
+from uuid import UUID, uuid7
+
+from elile.compliance.types import CheckType
+from elile.entity.types import SubjectIdentifiers
+from elile.investigation.finding_extractor import (
+    DataSourceRef,
+    Finding,
+    FindingCategory,
+    Severity,
+)
+from elile.investigation.phases.network import (
+    ConnectionStrength,
+    DiscoveredEntity,
+    EntityRelation,
+    EntityType,
+    RelationType,
+)
+from elile.providers.osint.types import NewsMention, OSINTSource, SocialMediaProfile
+from elile.providers.sanctions.types import EntityType as SanctionsEntityType
+from elile.providers.sanctions.types import SanctionedEntity, SanctionsAlias, SanctionsList
+
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+    "William", "Elizabeth", "David", "Barbara", "Maria", "Jose", "Wei", "Li",
+    "Mohammed", "Fatima", "Olga", "Dmitri", "Aisha", "Hiroshi", "Yuki", "Priya",
+    "Rahul", "Chloe", "Lucas", "Sofia", "Mateo", "Ingrid",
+]  # fmt: skip
+
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wang", "Chen", "Al-Rashid",
+    "Haddad", "Ivanov", "Petrov", "Tanaka", "Suzuki", "Patel", "Sharma", "Dubois",
+    "Moreau", "Rossi", "Nguyen", "Kowalski", "Okafor", "Larsen", "O'Brien",
+]  # fmt: skip
+
+STREETS = ["Main St", "Oak Ave", "Maple Dr", "Cedar Ln", "Elm St", "Park Blvd", "Lake Rd"]
+CITIES = [
+    ("Springfield", "IL", "62701"),
+    ("Austin", "TX", "78701"),
+    ("Boston", "MA", "02108"),
+    ("Denver", "CO", "80202"),
+    ("Seattle", "WA", "98101"),
+]
+COUNTRIES = ["US", "GB", "RU", "IR", "CN", "MX", "NG", "AE", "DE", "FR"]
+COMPANY_WORDS = ["Global", "Holdings", "Capital", "Trading", "Partners", "Ventures", "Group"]
+
+# Finding text per category, with the keywords the classifier looks for
+FINDING_TEXT: dict[FindingCategory, list[tuple[str, str]]] = {
+    FindingCategory.CRIMINAL: [
+        ("Felony theft conviction", "Convicted of felony theft; sentenced to probation"),
+        ("DUI arrest", "Arrested for driving under the influence, misdemeanor charge"),
+        ("Fraud charge", "Charged with wire fraud in federal court"),
+    ],
+    FindingCategory.FINANCIAL: [
+        ("Chapter 7 bankruptcy", "Filed for bankruptcy with outstanding debt and liens"),
+        ("Civil judgment", "Judgment entered for unpaid debt collection"),
+        ("Tax lien", "Federal tax lien recorded against property"),
+    ],
+    FindingCategory.REGULATORY: [
+        ("License suspension", "Professional license suspended by state board"),
+        ("SEC enforcement action", "Regulatory sanction and fine for compliance violation"),
+    ],
+    FindingCategory.REPUTATION: [
+        ("Adverse media coverage", "News articles report allegations of misconduct"),
+        ("Negative press", "Media coverage of lawsuit and public controversy"),
+    ],
+    FindingCategory.VERIFICATION: [
+        ("Employment verified", "Employment dates and title verified with employer"),
+        ("Degree discrepancy", "Education degree could not be verified; discrepancy in dates"),
+    ],
+    FindingCategory.BEHAVIORAL: [
+        ("Pattern of job changes", "Frequent short tenures suggest a behavioral pattern"),
+    ],
+    FindingCategory.NETWORK: [
+        ("Association with sanctioned entity", "Business associate appears on a sanctions list"),
+    ],
+}
+
+# Check types the simulated providers answer, weighted toward record checks
+SCREENING_CHECKS = [
+    CheckType.IDENTITY_BASIC,
+    CheckType.SSN_TRACE,
+    CheckType.CRIMINAL_NATIONAL,
+    CheckType.CRIMINAL_COUNTY,
+    CheckType.CIVIL_LITIGATION,
+    CheckType.BANKRUPTCY,
+    CheckType.EMPLOYMENT_VERIFICATION,
+    CheckType.EDUCATION_VERIFICATION,
+    CheckType.SANCTIONS_OFAC,
+    CheckType.SANCTIONS_PEP,
+    CheckType.ADVERSE_MEDIA,
+    CheckType.LICENSE_VERIFICATION,
+]
+
+
+def person_name(rng: random.Random) -> str:
+    """Generate a person name."""
+    if rng.random() < 0.2:
+        return f"{rng.choice(FIRST_NAMES)} {rng.choice(string.ascii_uppercase)}. {rng.choice(LAST_NAMES)}"
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def name_variant(name: str, rng: random.Random) -> str:
+    """Generate a misspelled, reordered or abbreviated variant of a name."""
+    parts = name.split()
+    match rng.randrange(4):
+        case 0:  # Typo
+            chars = list(name)
+            index = rng.randrange(len(chars))
+            chars[index] = rng.choice(string.ascii_lowercase)
+            return "".join(chars)
+        case 1:  # Last name first
+            return f"{parts[-1]}, {' '.join(parts[:-1])}"
+        case 2:  # Initial
+            return f"{parts[0][0]}. {parts[-1]}"
+        case _:  # Title and case
+            return f"Mr. {name.upper()}"
+
+
+def name_pairs(count: int, seed: int = 1) -> list[tuple[str, str]]:
+    """Generate name pairs, half of them variants of the same name."""
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(count):
+        name = person_name(rng)
+        other = name_variant(name, rng) if rng.random() < 0.5 else person_name(rng)
+        pairs.append((name, other))
+    return pairs
+
+
+def birth_date(rng: random.Random) -> date:
+    """Generate a date of birth for an adult."""
+    return date(1950, 1, 1) + timedelta(days=rng.randrange(50 * 365))
+
+
+def sanctioned_entities(count: int, seed: int = 2) -> list[SanctionedEntity]:
+    """Generate a sanctions list with aliases, dates of birth and nationalities."""
+    rng = random.Random(seed)
+    entities = []
+    for index in range(count):
+        name = person_name(rng)
+        entities.append(
+            SanctionedEntity(
+                entity_id=f"SDN-{index:06d}",
+                list_source=rng.choice(list(SanctionsList)),
+                entity_type=SanctionsEntityType.INDIVIDUAL,
+                name=name,
+                aliases=[
+                    SanctionsAlias(alias_name=name_variant(name, rng))
+                    for _ in range(rng.randint(0, 3))
+                ],
+                date_of_birth=birth_date(rng) if rng.random() < 0.7 else None,
+                nationality=rng.sample(COUNTRIES, rng.randint(0, 2)),
+                programs=["SDGT"],
+            )
+        )
+    return entities
+
+
+def subjects(count: int, seed: int = 3) -> list[SubjectIdentifiers]:
+    """Generate screening subjects with addresses and SSNs."""
+    rng = random.Random(seed)
+    result = []
+    for _ in range(count):
+        city, state, postal_code = rng.choice(CITIES)
+        result.append(
+            SubjectIdentifiers(
+                full_name=person_name(rng),
+                date_of_birth=birth_date(rng),
+                street_address=f"{rng.randint(1, 9999)} {rng.choice(STREETS)}",
+                city=city,
+                state=state,
+                postal_code=postal_code,
+                country="US",
+                ssn=f"{rng.randint(100, 899):03d}-{rng.randint(10, 99):02d}-{rng.randint(1000, 9999)}",
+            )
+        )
+    return result
+
+
+def canonical_identifiers(subject: SubjectIdentifiers) -> dict:
+    """Get the canonical identifiers stored on an Entity for a subject."""
+    return {
+        "full_name": {"value": subject.full_name},
+        "date_of_birth": {"value": str(subject.date_of_birth)},
+        "address": {"value": f"{subject.street_address}, {subject.city}, {subject.state}"},
+        "ssn": {"value": subject.ssn},
+    }
+
+
+def news_mentions(count: int, seed: int = 4) -> list[NewsMention]:
+    """Generate news mentions of one subject, with syndicated near-duplicates."""
+    rng = random.Random(seed)
+    vocabulary = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(2_000)
+    ]
+    published = datetime(2024, 1, 1, tzinfo=UTC)
+    originals: list[NewsMention] = []
+    mentions: list[NewsMention] = []
+    while len(mentions) < count:
+        if originals and rng.random() < 0.3:
+            original = rng.choice(originals)
+            headline = list(original.headline or "")
+            for _ in range(rng.randint(1, 3)):
+                headline[rng.randrange(len(headline))] = rng.choice(string.ascii_lowercase)
+            mentions.append(
+                original.model_copy(
+                    update={
+                        "mention_id": uuid7(),
+                        "headline": "".join(headline),
+                        "url": f"https://news.example.com/{len(mentions)}",
+                    }
+                )
+            )
+            continue
+        original = NewsMention(
+            mention_id=uuid7(),
+            source=rng.choice([OSINTSource.NEWS_WIRE, OSINTSource.LOCAL_NEWS]),
+            headline=f"Jane Doe {' '.join(rng.choices(vocabulary, k=rng.randint(5, 9)))}",
+            snippet=" ".join(rng.choices(vocabulary, k=12)),
+            url=f"https://news.example.com/{len(mentions)}",
+            published_at=published + timedelta(days=rng.randrange(365)),
+        )
+        originals.append(original)
+        mentions.append(original)
+    return mentions
+
+
+def social_profiles(count: int, seed: int = 5) -> list[SocialMediaProfile]:
+    """Generate social media profiles, several per person across platforms."""
+    rng = random.Random(seed)
+    people = [person_name(rng) for _ in range(max(1, count // 3))]
+    platforms = [OSINTSource.TWITTER, OSINTSource.LINKEDIN, OSINTSource.GITHUB]
+    profiles = []
+    for _ in range(count):
+        name = rng.choice(people)
+        username = name.lower().replace(" ", "").replace(".", "")
+        profiles.append(
+            SocialMediaProfile(
+                profile_id=uuid7(),
+                source=rng.choice(platforms),
+                username=f"{username}{rng.randint(0, 3)}",
+                display_name=name if rng.random() < 0.7 else name_variant(name, rng),
+                location=rng.choice([f"{city}, {state}" for city, state, _ in CITIES] + [None]),
+                follower_count=rng.randint(0, 5_000),
+            )
+        )
+    return profiles
+
+
+def network(
+    size: int, seed: int = 6
+) -> tuple[DiscoveredEntity, list[DiscoveredEntity], list[EntityRelation]]:
+    """Generate a D2/D3 network around a subject.
+
+    Returns:
+        Tuple of (subject, discovered entities, relations)
+    """
+    rng = random.Random(seed)
+    subject = DiscoveredEntity(entity_type=EntityType.PERSON, name="Jane Doe", discovery_degree=1)
+    entities: list[DiscoveredEntity] = []
+    relations: list[EntityRelation] = []
+    d2_count = max(1, size // 3)
+    for index in range(size):
+        degree = 2 if index < d2_count else 3
+        is_company = rng.random() < 0.4
+        entity = DiscoveredEntity(
+            entity_type=(
+                rng.choice([EntityType.COMPANY, EntityType.SHELL_COMPANY])
+                if is_company
+                else EntityType.PERSON
+            ),
+            name=(
+                f"{rng.choice(LAST_NAMES)} {rng.choice(COMPANY_WORDS)}"
+                if is_company
+                else person_name(rng)
+            ),
+            discovery_degree=degree,
+            confidence=rng.uniform(0.4, 1.0),
+            risk_indicators=rng.choice([[], [], ["offshore"], ["criminal record"], ["pep"]]),
+            is_sanctioned=rng.random() < 0.03,
+            is_pep=rng.random() < 0.05,
+        )
+        source = subject if degree == 2 else rng.choice(entities[:d2_count])
+        relations.append(
+            EntityRelation(
+                source_entity_id=source.entity_id,
+                target_entity_id=entity.entity_id,
+                relation_type=rng.choice(
+                    [
+                        RelationType.BUSINESS,
+                        RelationType.FAMILY,
+                        RelationType.OWNERSHIP,
+                        RelationType.EMPLOYMENT,
+                        RelationType.FINANCIAL,
+                    ]
+                ),
+                strength=rng.choice(list(ConnectionStrength)),
+                confidence=rng.uniform(0.4, 1.0),
+                end_date=None if rng.random() < 0.7 else datetime(2020, 1, 1, tzinfo=UTC),
+            )
+        )
+        entities.append(entity)
+
+    # Cross links between entities already in the network
+    for _ in range(size // 4):
+        first, second = rng.sample(entities, 2)
+        relations.append(
+            EntityRelation(
+                source_entity_id=first.entity_id,
+                target_entity_id=second.entity_id,
+                relation_type=RelationType.BUSINESS,
+                strength=ConnectionStrength.WEAK,
+            )
+        )
+    return subject, entities, relations
+
+
+def findings(count: int, seed: int = 7, *, entity_id: UUID | None = None) -> list[Finding]:
+    """Generate findings across categories, severities and sources."""
+    rng = random.Random(seed)
+    today = date(2025, 1, 1)
+    categories = list(FINDING_TEXT)
+    result = []
+    for _ in range(count):
+        category = rng.choice(categories)
+        summary, details = rng.choice(FINDING_TEXT[category])
+        result.append(
+            Finding(
+                finding_type=summary.lower().replace(" ", "_"),
+                # Leave some for the classifier to categorize from text
+                category=category if rng.random() < 0.7 else None,
+                summary=summary,
+                details=details,
+                severity=rng.choice(list(Severity)),
+                confidence=rng.uniform(0.5, 1.0),
+                sources=[
+                    DataSourceRef(provider_id=f"provider_{rng.randint(1, 4)}")
+                    for _ in range(rng.randint(1, 3))
+                ],
+                corroborated=rng.random() < 0.4,
+                finding_date=today - timedelta(days=rng.randrange(10 * 365)),
+                subject_entity_id=entity_id,
+            )
+        )
+    return result
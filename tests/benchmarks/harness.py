@@ -0,0 +1,479 @@
+"""Benchmark registry, runner and result comparison.
+
+Benchmarks are registered with the ``benchmark`` decorator. The decorated
+function receives the problem size and prepares the workload; it returns
+the callable to time, or yields it (sync or async generator) when the
+workload needs cleaning up afterwards. The timed callable may be a
+coroutine function.
+
+    @benchmark("name_matcher.match_names", group="matching", scale=200)
+    def name_matcher_match_names(scale: int):
+        matcher = NameMatcher()
+        pairs = data.name_pairs(scale)
+        return lambda: [matcher.match_names(a, b) for a, b in pairs]
+
+Besides time, a benchmark can ``report`` metrics such as bytes written;
+the last value reported for each name is kept with its result.
+
+Results are saved as JSON and two runs can be compared with per-benchmark
+thresholds, so a change that slows a hot path down can fail review.
+"""
+
+import asyncio
+import fnmatch
+import gc
+import importlib
+import inspect
+import json
+import pkgutil
+import platform
+import statistics
+import time
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+# Registered benchmarks by name
+BENCHMARKS: dict[str, "Benchmark"] = {}
+
+# Version of the results file format
+RESULTS_VERSION = 1
+
+METRICS = ("min", "median", "mean")
+
+# Metrics reported by the benchmark being measured
+_reported: dict[str, float] = {}
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A registered benchmark.
+
+    Attributes:
+        name: Unique name, ``<component>.<operation>``
+        group: Group for reporting (matching, risk, ...)
+        setup: Prepares the workload for a problem size
+        scale: Default problem size
+        description: What is measured
+    """
+
+    name: str
+    group: str
+    setup: Callable[[int], Any]
+    scale: int
+    description: str = ""
+
+
+def benchmark(name: str, *, group: str, scale: int) -> Callable[[Callable], Callable]:
+    """Register a benchmark.
+
+    Args:
+        name: Unique benchmark name
+        group: Benchmark group
+        scale: Default problem size passed to the function
+
+    Returns:
+        Decorator registering the function unchanged
+    """
+
+    def decorator(setup: Callable[[int], Any]) -> Callable[[int], Any]:
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark {name!r} is already registered")
+        doc = inspect.getdoc(setup) or ""
+        BENCHMARKS[name] = Benchmark(
+            name=name,
+            group=group,
+            setup=setup,
+            scale=scale,
+            description=doc.splitlines()[0] if doc else "",
+        )
+        return setup
+
+    return decorator
+
+
+def report(name: str, value: float) -> None:
+    """Report a metric of the running benchmark, from its setup or timed callable.
+
+    Args:
+        name: Metric name, e.g. ``bytes_per_version``
+        value: Metric value; a later report of the same name replaces it
+    """
+    _reported[name] = value
+
+
+def load_benchmarks() -> dict[str, Benchmark]:
+    """Import every ``bench_*`` module in this package, registering its benchmarks."""
+    package = importlib.import_module(__package__)
+    for module in pkgutil.iter_modules(package.__path__):
+        if module.name.startswith("bench_"):
+            importlib.import_module(f"{__package__}.{module.name}")
+    return BENCHMARKS
+
+
+def select_benchmarks(patterns: Iterable[str] | None = None) -> list[Benchmark]:
+    """Get registered benchmarks whose name or group matches any glob pattern."""
+    patterns = list(patterns or [])
+    return [
+        bench
+        for name, bench in sorted(BENCHMARKS.items())
+        if not patterns
+        or any(fnmatch.fnmatch(name, p) or fnmatch.fnmatch(bench.group, p) for p in patterns)
+    ]
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of one benchmark, in seconds per round, and the metrics it reported."""
+
+    name: str
+    group: str
+    scale: int
+    rounds: int
+    min: float
+    max: float
+    mean: float
+    median: float
+    stddev: float
+    metrics: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def ops(self) -> float:
+        """Rounds per second, from the mean."""
+        return 1 / self.mean if self.mean else 0.0
+
+    @classmethod
+    def from_timings(
+        cls,
+        bench: Benchmark,
+        scale: int,
+        timings: list[float],
+        metrics: dict[str, float] | None = None,
+    ) -> "BenchmarkResult":
+        """Summarize the timings of a benchmark."""
+        return cls(
+            name=bench.name,
+            group=bench.group,
+            scale=scale,
+            rounds=len(timings),
+            min=min(timings),
+            max=max(timings),
+            mean=statistics.fmean(timings),
+            median=statistics.median(timings),
+            stddev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            metrics=dict(metrics or {}),
+        )
+
+
+@dataclass
+class BenchmarkRun:
+    """Results of one benchmark run, with the machine they came from."""
+
+    results: list[BenchmarkResult] = field(default_factory=list)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    machine: dict[str, str] = field(default_factory=lambda: _machine_info())
+
+    def get(self, name: str) -> BenchmarkResult | None:
+        """Get the result of a benchmark by name."""
+        return next((r for r in self.results if r.name == name), None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "version": RESULTS_VERSION,
+            "created_at": self.created_at.isoformat(),
+            "machine": self.machine,
+            "results": [asdict(result) for result in self.results],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BenchmarkRun":
+        """Create from a dictionary written by to_dict."""
+        if data.get("version") != RESULTS_VERSION:
+            raise ValueError(f"Unsupported benchmark results version: {data.get('version')}")
+        return cls(
+            results=[BenchmarkResult(**result) for result in data["results"]],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            machine=data.get("machine", {}),
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the run to a JSON file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> "BenchmarkRun":
+        """Read a run from a JSON file."""
+        return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+def _machine_info() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+async def _call(target: Callable[[], Any]) -> None:
+    result = target()
+    if inspect.isawaitable(result):
+        await result
+
+
+async def measure(
+    bench: Benchmark,
+    *,
+    rounds: int = 5,
+    warmup: int = 1,
+    scale: int | None = None,
+) -> BenchmarkResult:
+    """Time a benchmark.
+
+    Args:
+        bench: Benchmark to run
+        rounds: Timed rounds
+        warmup: Untimed rounds run first
+        scale: Problem size (default: the benchmark's)
+
+    Returns:
+        Timings of the rounds
+    """
+    scale = scale or bench.scale
+    _reported.clear()
+    prepared = bench.setup(scale)
+    if inspect.isawaitable(prepared):
+        prepared = await prepared
+
+    if isinstance(prepared, Generator):
+        target = next(prepared)
+    elif isinstance(prepared, AsyncGenerator):
+        target = await anext(prepared)
+    else:
+        target = prepared
+
+    try:
+        for _ in range(warmup):
+            await _call(target)
+
+        timings: list[float] = []
+        for _ in range(rounds):
+            gc.collect()
+            start = time.perf_counter()
+            await _call(target)
+            timings.append(time.perf_counter() - start)
+    finally:
+        # Run the cleanup after the yield
+        if isinstance(prepared, Generator):
+            next(prepared, None)
+        elif isinstance(prepared, AsyncGenerator):
+            await anext(prepared, None)
+
+    return BenchmarkResult.from_timings(bench, scale, timings, _reported)
+
+
+async def run_benchmarks_async(
+    benchmarks: Iterable[Benchmark],
+    *,
+    rounds: int = 5,
+    warmup: int = 1,
+    scale_factor: float = 1.0,
+    on_result: Callable[[BenchmarkResult], None] | None = None,
+) -> BenchmarkRun:
+    """Run benchmarks one after another.
+
+    Args:
+        benchmarks: Benchmarks to run
+        rounds: Timed rounds per benchmark
+        warmup: Untimed rounds per benchmark
+        scale_factor: Multiplier for each benchmark's default problem size
+        on_result: Called with each result as it completes
+
+    Returns:
+        The run's results
+    """
+    run = BenchmarkRun()
+    for bench in benchmarks:
+        scale = max(1, round(bench.scale * scale_factor))
+        result = await measure(bench, rounds=rounds, warmup=warmup, scale=scale)
+        run.results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return run
+
+
+def run_benchmarks(benchmarks: Iterable[Benchmark], **kwargs: Any) -> BenchmarkRun:
+    """Run benchmarks in a new event loop; see run_benchmarks_async."""
+    return asyncio.run(run_benchmarks_async(benchmarks, **kwargs))
+
+
+class ComparisonStatus(str, Enum):
+    """Outcome of comparing a benchmark between two runs."""
+
+    REGRESSED = "regressed"
+    IMPROVED = "improved"
+    UNCHANGED = "unchanged"
+    ADDED = "added"  # Only in the current run
+    REMOVED = "removed"  # Only in the baseline
+    INCOMPARABLE = "incomparable"  # Run at different problem sizes
+
+
+@dataclass
+class Comparison:
+    """A benchmark compared between a baseline and a current run.
+
+    Attributes:
+        name: Benchmark name
+        status: Outcome
+        baseline: Baseline time in seconds, if present
+        current: Current time in seconds, if present
+        threshold: Allowed relative change
+    """
+
+    name: str
+    status: ComparisonStatus
+    baseline: float | None = None
+    current: float | None = None
+    threshold: float = 0.0
+
+    @property
+    def change(self) -> float | None:
+        """Relative change in time, positive when slower."""
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1
+
+
+def compare_runs(
+    baseline: BenchmarkRun,
+    current: BenchmarkRun,
+    *,
+    threshold: float = 0.2,
+    thresholds: dict[str, float] | None = None,
+    metric: str = "median",
+) -> list[Comparison]:
+    """Compare two runs benchmark by benchmark.
+
+    A benchmark regresses when its time grows by more than its threshold
+    and improves when it shrinks by more than the threshold.
+
+    Args:
+        baseline: Reference run
+        current: Run being checked
+        threshold: Default allowed relative change (0.2 = 20%)
+        thresholds: Per-benchmark thresholds, by name or glob pattern
+        metric: Timing to compare: min, median or mean
+
+    Returns:
+        Comparisons sorted by benchmark name
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric {metric!r}; expected one of {', '.join(METRICS)}")
+    thresholds = thresholds or {}
+
+    def threshold_for(name: str) -> float:
+        if name in thresholds:
+            return thresholds[name]
+        for pattern, value in thresholds.items():
+            if fnmatch.fnmatch(name, pattern):
+                return value
+        return threshold
+
+    comparisons: list[Comparison] = []
+    names = {r.name for r in baseline.results} | {r.name for r in current.results}
+    for name in sorted(names):
+        before, after = baseline.get(name), current.get(name)
+        allowed = threshold_for(name)
+        if before is None or after is None:
+            comparisons.append(
+                Comparison(
+                    name=name,
+                    status=ComparisonStatus.ADDED if before is None else ComparisonStatus.REMOVED,
+                    baseline=getattr(before, metric, None),
+                    current=getattr(after, metric, None),
+                    threshold=allowed,
+                )
+            )
+            continue
+
+        old, new = getattr(before, metric), getattr(after, metric)
+        if before.scale != after.scale:
+            status = ComparisonStatus.INCOMPARABLE
+        elif new > old * (1 + allowed):
+            status = ComparisonStatus.REGRESSED
+        elif old > new * (1 + allowed):
+            status = ComparisonStatus.IMPROVED
+        else:
+            status = ComparisonStatus.UNCHANGED
+        comparisons.append(
+            Comparison(name=name, status=status, baseline=old, current=new, threshold=allowed)
+        )
+    return comparisons
+
+
+def _format_time(seconds: float | None) -> str:
+    if seconds is None:
+        return "-"
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} us"
+
+
+def format_results(run: BenchmarkRun) -> str:
+    """Format a run as a text table, with a metrics column if any were reported."""
+    with_metrics = any(r.metrics for r in run.results)
+    rows = [("benchmark", "scale", "min", "median", "mean", "stddev")]
+    rows += [
+        (
+            r.name,
+            str(r.scale),
+            _format_time(r.min),
+            _format_time(r.median),
+            _format_time(r.mean),
+            _format_time(r.stddev),
+        )
+        for r in run.results
+    ]
+    if with_metrics:
+        rows[0] += ("metrics",)
+        for index, r in enumerate(run.results, start=1):
+            rows[index] += (", ".join(f"{k}={v:g}" for k, v in sorted(r.metrics.items())),)
+    return _table(rows)
+
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    """Format comparisons as a text table."""
+    rows = [("benchmark", "baseline", "current", "change", "threshold", "status")]
+    for c in comparisons:
+        change = c.change
+        rows.append(
+            (
+                c.name,
+                _format_time(c.baseline),
+                _format_time(c.current),
+                "-" if change is None else f"{change:+.1%}",
+                f"{c.threshold:.0%}",
+                c.status.value,
+            )
+        )
+    return _table(rows)
+
+
+def _table(rows: list[tuple[str, ...]]) -> str:
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+
+    def line(row: tuple[str, ...]) -> str:
+        cells = [row[0].ljust(widths[0])]
+        cells += [cell.rjust(width) for cell, width in zip(row[1:], widths[1:], strict=True)]
+        return "  ".join(cells)
+
+    lines = [line(row) for row in rows]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
@@ -0,0 +1,351 @@
+"""Local stand-ins for external services used by the screening benchmarks.
+
+SimulatedProvider answers checks from generated records, with optional
+latency and failures, so RequestRouter runs its real selection, retry and
+fallback logic without network access. LocalInvestigation and
+LocalRiskAggregator adapt the investigation and risk components to the
+interfaces ScreeningOrchestrator calls, so execute_screening runs end to
+end against them. LocalScreeningService accepts screenings started by
+the HRIS event processor. CapacityLimitedModel is an LLM adapter that
+answers with HTTP 429 above a fixed number of concurrent calls, as hosted
+models do.
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import UUID, uuid7
+
+from elile.agent.state import KnowledgeBase, ServiceTier
+from elile.compliance.types import CheckType, Locale, RoleCategory
+from elile.entity.types import SubjectIdentifiers
+from elile.investigation import InvestigationResult
+from elile.investigation.finding_extractor import (
+    DataSourceRef,
+    Finding,
+    FindingCategory,
+    Severity,
+)
+from elile.models.base import BaseModelAdapter, Message, ModelResponse, T
+from elile.providers.protocol import BaseDataProvider
+from elile.providers.router import RequestRouter, RoutedRequest
+from elile.providers.types import (
+    CostTier,
+    DataSourceCategory,
+    ProviderCapability,
+    ProviderHealth,
+    ProviderInfo,
+    ProviderResult,
+    ProviderStatus,
+)
+from elile.risk import (
+    ComprehensiveRiskAssessment,
+    FindingClassifier,
+    RiskAggregator,
+    RiskScorer,
+)
+from elile.screening.types import ScreeningRequest
+
+from .data import FINDING_TEXT
+
+
+class SimulatedProvider(BaseDataProvider):
+    """Data provider answering checks with generated records.
+
+    Attributes:
+        calls: Number of checks executed
+    """
+
+    def __init__(
+        self,
+        provider_id: str,
+        check_types: list[CheckType],
+        *,
+        records_per_check: int = 3,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        cost_tier: CostTier = CostTier.LOW,
+        seed: int = 0,
+    ):
+        """Initialize the provider.
+
+        Args:
+            provider_id: Provider ID
+            check_types: Checks the provider supports (US locale)
+            records_per_check: Records returned per check
+            latency: Seconds each check takes
+            failure_rate: Fraction of checks failing with a retryable error
+            cost_tier: Cost tier of every capability
+            seed: Seed for records and failures
+        """
+        super().__init__(
+            ProviderInfo(
+                provider_id=provider_id,
+                name=f"Simulated {provider_id}",
+                category=DataSourceCategory.CORE,
+                capabilities=[
+                    ProviderCapability(
+                        check_type=check_type,
+                        supported_locales=[Locale.US],
+                        cost_tier=cost_tier,
+                    )
+                    for check_type in check_types
+                ],
+            )
+        )
+        self.records_per_check = records_per_check
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.calls = 0
+        self._seed = seed
+        self._rng = random.Random(seed)
+
+    def reset(self) -> None:
+        """Restart the record and failure sequence, so each round sees the same one."""
+        self.calls = 0
+        self._rng = random.Random(self._seed)
+
+    async def execute_check(
+        self,
+        check_type: CheckType,
+        subject: SubjectIdentifiers,
+        locale: Locale,
+        **_: object,
+    ) -> ProviderResult:
+        """Return generated records for the subject, or a retryable failure."""
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self._rng.random() < self.failure_rate:
+            return ProviderResult(
+                provider_id=self.provider_id,
+                check_type=check_type,
+                locale=locale,
+                success=False,
+                error_code="UPSTREAM_UNAVAILABLE",
+                error_message="Simulated upstream failure",
+                retryable=True,
+            )
+
+        categories = list(FINDING_TEXT)
+        records = []
+        for index in range(self.records_per_check):
+            category = self._rng.choice(categories)
+            summary, details = self._rng.choice(FINDING_TEXT[category])
+            records.append(
+                {
+                    "record_id": f"{check_type.value}-{index}",
+                    "subject": subject.full_name,
+                    "category": category.value,
+                    "severity": self._rng.choice(list(Severity)).value,
+                    "summary": summary,
+                    "details": details,
+                }
+            )
+        return ProviderResult(
+            provider_id=self.provider_id,
+            check_type=check_type,
+            locale=locale,
+            success=True,
+            normalized_data={"records": records},
+            cost_incurred=Decimal("1.50"),
+        )
+
+    async def health_check(self) -> ProviderHealth:
+        """Report the provider as healthy."""
+        return ProviderHealth(
+            provider_id=self.provider_id,
+            status=ProviderStatus.HEALTHY,
+            last_check=datetime.now(UTC),
+        )
+
+
+@dataclass
+class LocalInvestigation:
+    """Investigation stand-in: routes one request per check and extracts findings.
+
+    Takes the place of the SAR loop in ScreeningOrchestrator. Each check
+    goes through the real RequestRouter; every record returned becomes a
+    finding.
+    """
+
+    router: RequestRouter
+    check_types: list[CheckType]
+    tenant_id: UUID = field(default_factory=uuid7)
+
+    async def execute_investigation(
+        self,
+        knowledge_base: KnowledgeBase,
+        locale: Locale,
+        tier: ServiceTier,
+        role_category: RoleCategory,  # noqa: ARG002
+    ) -> InvestigationResult:
+        """Run the checks for the subject in the knowledge base."""
+        subject = SubjectIdentifiers(
+            full_name=knowledge_base.confirmed_names[0] if knowledge_base.confirmed_names else None
+        )
+        entity_id = uuid7()
+        requests = [
+            RoutedRequest.create(
+                check_type=check_type,
+                subject=subject,
+                locale=locale,
+                entity_id=entity_id,
+                tenant_id=self.tenant_id,
+                service_tier=tier,
+            )
+            for check_type in self.check_types
+        ]
+        routed = await self.router.route_batch(requests)
+
+        findings: list[Finding] = []
+        for routed_result in routed:
+            if not routed_result.success or routed_result.result is None:
+                continue
+            for record in routed_result.result.normalized_data.get("records", []):
+                findings.append(
+                    Finding(
+                        finding_type=record["record_id"],
+                        category=FindingCategory(record["category"]),
+                        summary=record["summary"],
+                        details=record["details"],
+                        severity=Severity(record["severity"]),
+                        sources=[
+                            DataSourceRef(
+                                provider_id=routed_result.provider_id or "",
+                                query_type=routed_result.check_type.value,
+                                record_id=record["record_id"],
+                            )
+                        ],
+                        subject_entity_id=entity_id,
+                    )
+                )
+
+        result = InvestigationResult(total_queries=len(requests))
+        result.all_findings = findings
+        return result
+
+
+class LocalRiskAggregator:
+    """Risk stand-in: classifies and scores findings, then aggregates.
+
+    Adapts FindingClassifier, RiskScorer and RiskAggregator to the
+    single awaitable call ScreeningOrchestrator makes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with default risk components."""
+        self.classifier = FindingClassifier()
+        self.scorer = RiskScorer()
+        self.aggregator = RiskAggregator()
+
+    async def aggregate_risk(
+        self,
+        findings: list[Finding],
+        patterns: list,
+        anomalies: list,
+        connections: object | None,  # noqa: ARG002
+        role_category: RoleCategory,
+    ) -> ComprehensiveRiskAssessment:
+        """Classify, score and aggregate the findings of a screening."""
+        self.classifier.classify_findings(findings, role_category)
+        base_score = self.scorer.calculate_risk_score(findings, role_category)
+        return self.aggregator.aggregate_risk(
+            base_score=base_score,
+            patterns=patterns,
+            anomalies=anomalies,
+            findings=findings,
+            role_category=role_category,
+        )
+
+
+class LocalScreeningService:
+    """Screening service stand-in that accepts screenings without running them.
+
+    Attributes:
+        started: Number of screenings started
+    """
+
+    def __init__(self) -> None:
+        self.started = 0
+
+    async def initiate_screening(self, request: ScreeningRequest) -> UUID:
+        """Accept one screening."""
+        self.started += 1
+        return request.screening_id
+
+    async def initiate_screenings(self, requests: list[ScreeningRequest]) -> list[UUID]:
+        """Accept a batch of screenings."""
+        self.started += len(requests)
+        return [request.screening_id for request in requests]
+
+    async def get_screening_status(self, screening_id: UUID) -> None:  # noqa: ARG002
+        """Screenings are never run, so there is no status."""
+        return None
+
+
+class ProviderRateLimited(Exception):
+    """Provider SDK style 429 error carrying response headers."""
+
+    status_code = 429
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        super().__init__("rate limited")
+        self.headers = headers
+
+
+class CapacityLimitedModel(BaseModelAdapter):
+    """LLM adapter rejecting calls above its concurrency capacity.
+
+    Attributes:
+        calls: Number of calls answered
+        rejections: Number of calls rejected with a 429
+    """
+
+    def __init__(self, capacity: int, latency: float, retry_after: float) -> None:
+        self.capacity = capacity
+        self.latency = latency
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.calls = 0
+        self.rejections = 0
+
+    @property
+    def model_name(self) -> str:
+        return "capacity-limited"
+
+    async def generate(
+        self,
+        messages: list[Message],  # noqa: ARG002
+        *,
+        temperature: float = 0.7,  # noqa: ARG002
+        max_tokens: int = 4096,  # noqa: ARG002
+    ) -> ModelResponse:
+        """Answer after ``latency`` seconds, or raise a 429 when at capacity."""
+        if self.in_flight >= self.capacity:
+            self.rejections += 1
+            raise ProviderRateLimited({"retry-after": str(self.retry_after)})
+        self.in_flight += 1
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        return ModelResponse(
+            content="ok",
+            model=self.model_name,
+            usage={"input_tokens": 10, "output_tokens": 5},
+        )
+
+    async def generate_structured(
+        self,
+        messages: list[Message],
+        response_model: type[T],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> T:
+        """Structured output is not simulated."""
+        raise NotImplementedError
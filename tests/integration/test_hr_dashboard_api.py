@@ -441,7 +441,7 @@ class TestAlertsListEndpoint:
                 description=f"Alert description {i}",
             )
             generated = GeneratedAlert(alert=alert)
-            generator._alert_history.append(generated)
+            await generator.outbox.save_alert(generated)
 
         response = await dashboard_client.get(
             "/v1/dashboard/hr/alerts",
@@ -466,7 +466,7 @@ class TestAlertsListEndpoint:
                 title=f"{severity.value} Alert",
                 description="Test",
             )
-            generator._alert_history.append(GeneratedAlert(alert=alert))
+            await generator.outbox.save_alert(GeneratedAlert(alert=alert))
 
         response = await dashboard_client.get(
             "/v1/dashboard/hr/alerts",
@@ -491,7 +491,7 @@ class TestAlertsListEndpoint:
             description="Test",
             acknowledged=False,
         )
-        generator._alert_history.append(GeneratedAlert(alert=alert1))
+        await generator.outbox.save_alert(GeneratedAlert(alert=alert1))
 
         # Add acknowledged
         alert2 = MonitoringAlert(
@@ -500,7 +500,7 @@ class TestAlertsListEndpoint:
             description="Test",
             acknowledged=True,
         )
-        generator._alert_history.append(GeneratedAlert(alert=alert2))
+        await generator.outbox.save_alert(GeneratedAlert(alert=alert2))
 
         response = await dashboard_client.get(
             "/v1/dashboard/hr/alerts",
@@ -526,7 +526,7 @@ class TestAlertsListEndpoint:
                 description="Test",
                 acknowledged=False,
             )
-            generator._alert_history.append(GeneratedAlert(alert=alert))
+            await generator.outbox.save_alert(GeneratedAlert(alert=alert))
 
         # Add 2 acknowledged
         for i in range(2):
@@ -536,7 +536,7 @@ class TestAlertsListEndpoint:
                 description="Test",
                 acknowledged=True,
             )
-            generator._alert_history.append(GeneratedAlert(alert=alert))
+            await generator.outbox.save_alert(GeneratedAlert(alert=alert))
 
         response = await dashboard_client.get("/v1/dashboard/hr/alerts")
 
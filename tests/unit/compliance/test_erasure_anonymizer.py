@@ -447,3 +447,68 @@ class TestRandomReplacement:
         result = anonymizer.generate_random_replacement("test", preserve_format=False)
         # Default is 10 chars, but generate_random_replacement uses hex which gives length/2
         assert len(result) >= 5
+
+
+class TestAnonymizationPlans:
+    """Tests for precompiled anonymization plans and batch anonymization."""
+
+    def test_plan_shared_per_schema(self):
+        """Test that records with the same schema share one plan."""
+        anonymizer = DataAnonymizer()
+        plan = anonymizer.compile_plan(["full_name", "status", "email"])
+        assert set(plan.rules) == {"full_name", "email"}
+        assert anonymizer.compile_plan(["full_name", "status", "email"]) is plan
+
+    def test_plan_depends_on_rules(self):
+        """Test that explicit rules compile a separate plan."""
+        anonymizer = DataAnonymizer()
+        rules = {"status": AnonymizationRule("status", AnonymizationMethod.REDACTION)}
+        default = anonymizer.compile_plan(["status"])
+        explicit = anonymizer.compile_plan(["status"], explicit_rules=rules)
+        assert "status" not in default.rules
+        assert explicit.rules["status"].method == AnonymizationMethod.REDACTION
+
+    def test_batch_matches_single(self):
+        """Test that batch anonymization gives the same output as single records."""
+        anonymizer = DataAnonymizer(AnonymizationConfig(hash_salt="fixed"))
+        records = [
+            {
+                "full_name": f"Person {i}",
+                "email": f"p{i}@example.com",
+                "ssn": "123-45-6789",
+                "score": i,
+                "address_history": [{"street": "1 Main St", "years": 2}],
+                "employer": {"name": "Acme", "city": "Springfield"},
+            }
+            for i in range(5)
+        ]
+        data_ids = [uuid7() for _ in records]
+
+        batch = anonymizer.anonymize_records(
+            records, data_ids=data_ids, data_type=DataType.ENTITY_PROFILE
+        )
+
+        for record, data_id, (anonymized, report) in zip(records, data_ids, batch, strict=True):
+            expected, expected_report = anonymizer.anonymize_record(record)
+            assert anonymized == expected
+            assert report.data_id == data_id
+            assert report.data_type == DataType.ENTITY_PROFILE
+            assert report.fields_anonymized == expected_report.fields_anonymized
+            assert report.anonymized_hash == expected_report.anonymized_hash
+
+    def test_batch_requires_matching_ids(self):
+        """Test that data IDs must match the records."""
+        anonymizer = DataAnonymizer()
+        with pytest.raises(ValueError):
+            anonymizer.anonymize_records([{"name": "A"}], data_ids=[])
+
+    def test_explicit_rules_not_modified(self):
+        """Test that custom rules are not merged into the caller's rules."""
+        custom = {"status": AnonymizationRule("status", AnonymizationMethod.REDACTION)}
+        anonymizer = DataAnonymizer(AnonymizationConfig(custom_rules=custom))
+        rules = {"email": AnonymizationRule("email", AnonymizationMethod.REDACTION)}
+        result, _ = anonymizer.anonymize_record(
+            {"email": "a@example.com", "status": "x"}, explicit_rules=rules
+        )
+        assert result["status"] == "[REDACTED]"
+        assert list(rules) == ["email"]
@@ -1,9 +1,12 @@
 """Unit tests for GDPR Erasure Service."""
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
 from uuid import uuid7
 
 import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import undefer_group
 
 from elile.compliance.erasure.anonymizer import DataAnonymizer
 from elile.compliance.erasure.service import (
@@ -15,6 +18,11 @@ from elile.compliance.erasure.service import (
     get_erasure_service,
     initialize_erasure_service,
 )
+from elile.compliance.erasure.store import (
+    InMemorySubjectDataStore,
+    SQLAlchemySubjectDataStore,
+    SubjectDataItem,
+)
 from elile.compliance.erasure.types import (
     ErasureBlockedException,
     ErasureExemption,
@@ -24,8 +32,22 @@ from elile.compliance.erasure.types import (
     LegalHoldException,
 )
 from elile.compliance.retention.manager import RetentionManager
-from elile.compliance.retention.types import DataType, RetentionStatus
+from elile.compliance.retention.types import DataType, DeletionMethod, RetentionStatus
 from elile.compliance.types import Locale
+from elile.core.encryption import Encryptor, generate_key
+from elile.db.models.audit import AuditEvent
+from elile.db.models.base import Base
+from elile.db.models.cache import PAYLOAD_GROUP, CachedDataSource, DataOrigin, FreshnessStatus
+from elile.db.models.entity import Entity
+from elile.db.models.profile import EntityProfile, ProfileEncoding, ProfileTrigger
+from elile.db.models.tenant import Tenant
+from elile.db.repositories.profile import ProfileRepository
+from elile.providers.cache_payload import (
+    decode_json_payload,
+    decode_payload,
+    encode_json_payload,
+    encode_payload,
+)
 
 
 @pytest.fixture
@@ -239,7 +261,7 @@ class TestProcessErasureRequest:
         tenant_id = uuid7()
         # Track some data
         data_id = uuid7()
-        retention_manager.track_data(
+        await retention_manager.track_data(
             data_id=data_id,
             data_type=DataType.ENTITY_PROFILE,
             tenant_id=tenant_id,
@@ -293,12 +315,12 @@ class TestProcessErasureRequest:
         tenant_id = uuid7()
         data_id = uuid7()
         # Track data with legal hold
-        record = retention_manager.track_data(
+        record = await retention_manager.track_data(
             data_id=data_id,
             data_type=DataType.ENTITY_PROFILE,
             tenant_id=tenant_id,
         )
-        retention_manager.place_legal_hold(data_id, "Litigation hold")
+        await retention_manager.place_legal_hold(data_id, "Litigation hold")
         # Submit and verify
         operation = await erasure_service.submit_erasure_request(
             subject_id=uuid7(),
@@ -319,7 +341,7 @@ class TestProcessErasureRequest:
         """Test that audit logs are exempt from erasure."""
         tenant_id = uuid7()
         data_id = uuid7()
-        retention_manager.track_data(
+        await retention_manager.track_data(
             data_id=data_id,
             data_type=DataType.AUDIT_LOG,
             tenant_id=tenant_id,
@@ -344,7 +366,7 @@ class TestProcessErasureRequest:
         """Test that consent records are exempt from erasure."""
         tenant_id = uuid7()
         data_id = uuid7()
-        retention_manager.track_data(
+        await retention_manager.track_data(
             data_id=data_id,
             data_type=DataType.CONSENT_RECORD,
             tenant_id=tenant_id,
@@ -389,7 +411,7 @@ class TestConfirmationReport:
         """Test generating report for completed operation."""
         tenant_id = uuid7()
         data_id = uuid7()
-        retention_manager.track_data(
+        await retention_manager.track_data(
             data_id=data_id,
             data_type=DataType.ENTITY_PROFILE,
             tenant_id=tenant_id,
@@ -444,7 +466,7 @@ class TestConfirmationReport:
         """Test that report includes explanation for retained data."""
         tenant_id = uuid7()
         data_id = uuid7()
-        retention_manager.track_data(
+        await retention_manager.track_data(
             data_id=data_id,
             data_type=DataType.AUDIT_LOG,
             tenant_id=tenant_id,
@@ -566,3 +588,388 @@ class TestConstants:
         assert DataType.CONSENT_RECORD in DATA_TYPE_EXEMPTIONS
         assert DataType.ADVERSE_ACTION in DATA_TYPE_EXEMPTIONS
         assert DataType.SCREENING_RESULT in DATA_TYPE_EXEMPTIONS
+
+
+class TestBulkErasure:
+    """Tests for bulk processing of erasure requests."""
+
+    @pytest.fixture
+    def deleted_batches(self):
+        """Record the batches passed to the bulk delete callback."""
+        return []
+
+    @pytest.fixture
+    def bulk_retention_manager(self, deleted_batches):
+        """Create a retention manager that hard deletes in bulk."""
+
+        async def bulk_delete(items):
+            deleted_batches.append([data_id for data_id, _ in items])
+            return [True] * len(items)
+
+        manager = RetentionManager(bulk_delete_callback=bulk_delete)
+        # Default policies are shared, so replace them with copies
+        for policy in list(manager._policies.values()):
+            manager.register_policy(
+                policy.model_copy(
+                    update={
+                        "archive_before_delete": False,
+                        "deletion_method": DeletionMethod.HARD_DELETE,
+                    }
+                )
+            )
+        return manager
+
+    @pytest.fixture
+    def data_store(self):
+        """Create a subject data store."""
+        return InMemorySubjectDataStore()
+
+    @pytest.fixture
+    def bulk_service(self, bulk_retention_manager, data_store):
+        """Create an erasure service with a subject data store."""
+        return ErasureService(
+            config=ErasureServiceConfig(bulk_batch_size=2),
+            retention_manager=bulk_retention_manager,
+            data_store=data_store,
+        )
+
+    async def _store_subject(self, manager, store, tenant_id, subject_id, data_types):
+        items = []
+        for data_type in data_types:
+            item = SubjectDataItem(
+                data_id=uuid7(),
+                data_type=data_type,
+                subject_id=subject_id,
+                tenant_id=tenant_id,
+                payload={"full_name": "Jane Doe", "email": "jane@example.com", "score": 42},
+            )
+            await manager.track_data(item.data_id, data_type, tenant_id, locale=Locale.EU)
+            items.append(item)
+        await store.save_items(items)
+        return items
+
+    async def _verified_request(self, service, tenant_id, subject_id):
+        operation = await service.submit_erasure_request(
+            subject_id=subject_id,
+            tenant_id=tenant_id,
+            locale=Locale.EU,
+        )
+        await service.verify_identity(operation.operation_id, verification_method="email")
+        return operation
+
+    @pytest.mark.asyncio
+    async def test_bulk_erases_each_subject(
+        self, bulk_service, bulk_retention_manager, data_store, deleted_batches
+    ):
+        """Test that each request erases only its subject's data, in batches."""
+        tenant_id = uuid7()
+        data_types = [DataType.ENTITY_PROFILE, DataType.CACHE_ENTRY, DataType.AUDIT_LOG]
+        subjects = [uuid7() for _ in range(3)]
+        items = {
+            subject_id: await self._store_subject(
+                bulk_retention_manager, data_store, tenant_id, subject_id, data_types
+            )
+            for subject_id in subjects
+        }
+        bystander = await self._store_subject(
+            bulk_retention_manager, data_store, tenant_id, uuid7(), data_types
+        )
+        operations = [
+            await self._verified_request(bulk_service, tenant_id, subject_id)
+            for subject_id in subjects
+        ]
+
+        processed = await bulk_service.process_erasure_requests(
+            [op.operation_id for op in operations]
+        )
+
+        assert processed == operations
+        for operation in operations:
+            assert operation.status == ErasureStatus.PARTIALLY_COMPLETED
+            assert operation.items_erased_count == 2
+            assert [item["data_type"] for item in operation.retained_items] == [
+                DataType.AUDIT_LOG.value
+            ]
+        # 6 deletions in batches of 2
+        assert [len(batch) for batch in deleted_batches] == [2, 2, 2]
+
+        for subject_id in subjects:
+            profile, cache_entry, audit_log = items[subject_id]
+            assert profile.payload["full_name"] == "[REDACTED]"
+            assert profile.payload["email"].startswith("tok_")
+            assert profile.payload["score"] == 42
+            assert cache_entry.anonymized_at is not None
+            assert audit_log.payload["full_name"] == "Jane Doe"
+            record = await bulk_retention_manager.get_record_by_data_id(profile.data_id)
+            assert record.status == RetentionStatus.DELETED
+        assert all(item.payload["full_name"] == "Jane Doe" for item in bystander)
+        record = await bulk_retention_manager.get_record_by_data_id(bystander[0].data_id)
+        assert record.status == RetentionStatus.ACTIVE
+
+    @pytest.mark.asyncio
+    async def test_bulk_skips_unverified_and_blocks_legal_hold(
+        self, bulk_service, bulk_retention_manager, data_store
+    ):
+        """Test that single requests do not fail the whole bulk run."""
+        tenant_id = uuid7()
+        held_subject, free_subject = uuid7(), uuid7()
+        held = await self._store_subject(
+            bulk_retention_manager, data_store, tenant_id, held_subject, [DataType.ENTITY_PROFILE]
+        )
+        await bulk_retention_manager.place_legal_hold(held[0].data_id, "Litigation hold")
+        free = await self._store_subject(
+            bulk_retention_manager, data_store, tenant_id, free_subject, [DataType.ENTITY_PROFILE]
+        )
+
+        held_op = await self._verified_request(bulk_service, tenant_id, held_subject)
+        free_op = await self._verified_request(bulk_service, tenant_id, free_subject)
+        unverified_op = await bulk_service.submit_erasure_request(
+            subject_id=uuid7(), tenant_id=tenant_id, locale=Locale.EU
+        )
+
+        processed = await bulk_service.process_erasure_requests(
+            [held_op.operation_id, unverified_op.operation_id, free_op.operation_id]
+        )
+
+        assert processed == [held_op, free_op]
+        assert held_op.status == ErasureStatus.BLOCKED
+        assert held[0].payload["full_name"] == "Jane Doe"
+        assert free_op.status == ErasureStatus.COMPLETED
+        assert free[0].payload["full_name"] == "[REDACTED]"
+        assert unverified_op.status == ErasureStatus.PENDING
+
+    @pytest.mark.asyncio
+    async def test_untracked_data_is_anonymized(self, bulk_service, data_store):
+        """Test that data without a retention record is anonymized in place."""
+        tenant_id, subject_id = uuid7(), uuid7()
+        item = SubjectDataItem(
+            data_id=uuid7(),
+            data_type=DataType.SCREENING_RAW_DATA,
+            subject_id=subject_id,
+            tenant_id=tenant_id,
+            payload={"ssn": "123-45-6789", "phone": "555-123-4567"},
+        )
+        await data_store.save_items([item])
+        operation = await self._verified_request(bulk_service, tenant_id, subject_id)
+
+        result = await bulk_service.process_erasure_request(operation.operation_id)
+
+        assert result.status == ErasureStatus.COMPLETED
+        assert item.payload == {"ssn": "***-**-6789", "phone": "***-***-4567"}
+        assert result.erased_items[0]["action"] == ErasureType.ANONYMIZE.value
+
+    @pytest.mark.asyncio
+    async def test_failed_batches_only_fail_their_items(
+        self, bulk_service, bulk_retention_manager, data_store, monkeypatch
+    ):
+        """Test that a failed write-back or deletion batch does not fail the run."""
+        tenant_id = uuid7()
+        subjects = [uuid7() for _ in range(4)]
+        items = {
+            subject_id: await self._store_subject(
+                bulk_retention_manager, data_store, tenant_id, subject_id, [DataType.CACHE_ENTRY]
+            )
+            for subject_id in subjects
+        }
+        operations = [
+            await self._verified_request(bulk_service, tenant_id, subject_id)
+            for subject_id in subjects
+        ]
+
+        save_items = data_store.save_items
+        process_deletions = bulk_retention_manager.process_deletions
+        calls = {"save": 0, "delete": 0}
+
+        async def flaky_save(batch):
+            calls["save"] += 1
+            if calls["save"] == 1:
+                raise ConnectionError("connection lost")
+            await save_items(batch)
+
+        async def flaky_delete(records):
+            calls["delete"] += 1
+            if calls["delete"] == 2:
+                raise ConnectionError("connection lost")
+            return await process_deletions(records)
+
+        monkeypatch.setattr(data_store, "save_items", flaky_save)
+        monkeypatch.setattr(bulk_retention_manager, "process_deletions", flaky_delete)
+
+        processed = await bulk_service.process_erasure_requests(
+            [op.operation_id for op in operations]
+        )
+
+        assert processed == operations
+        # Batches of 2: the first write-back and the second deletion failed
+        first, second, third, fourth = operations
+        assert first.items_erased_count == second.items_erased_count == 1
+        assert third.items_erased_count == fourth.items_erased_count == 1
+        assert [len(op.errors) for op in operations] == [1, 1, 1, 1]
+        assert "Failed to anonymize" in first.errors[0]
+        assert "Failed to delete" in third.errors[0]
+        assert all(op.status == ErasureStatus.PARTIALLY_COMPLETED for op in operations)
+        assert items[subjects[0]][0].payload["full_name"] == "Jane Doe"
+        assert items[subjects[2]][0].payload["full_name"] == "[REDACTED]"
+        record = await bulk_retention_manager.get_record_by_data_id(items[subjects[2]][0].data_id)
+        assert record.status == RetentionStatus.ACTIVE
+
+
+class TestSQLAlchemySubjectDataStore:
+    """Tests for the store over the profile, cache and audit tables."""
+
+    @pytest.fixture
+    async def session_factory(self, tmp_path):
+        """Create a SQLite database with the tables that hold subject data."""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'subjects.db'}")
+        tables = [Tenant, Entity, EntityProfile, CachedDataSource, AuditEvent]
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                Base.metadata.create_all, tables=[model.__table__ for model in tables]
+            )
+        yield async_sessionmaker(engine, expire_on_commit=False)
+        await engine.dispose()
+
+    @staticmethod
+    def _snapshot(name: str, score: float) -> dict:
+        return {
+            "findings": [{"summary": f"Lawsuit naming {name}", "email": "jane@example.com"}],
+            "risk_score": {"overall": score},
+            "connections": [],
+            "data_sources_used": [],
+            "stale_data_used": {},
+        }
+
+    async def _seed(self, session_factory, encryptor, tenant_id, other_tenant):
+        """Store three entities of the tenant and one of another tenant, with their data."""
+        subjects = [uuid7() for _ in range(3)]
+        other = uuid7()
+        now = datetime.now(UTC)
+        async with session_factory() as session:
+            owners = [(subject_id, tenant_id) for subject_id in subjects] + [(other, other_tenant)]
+            session.add_all(
+                Entity(entity_id=entity_id, entity_type="individual", tenant_id=tenant)
+                for entity_id, tenant in owners
+            )
+            await session.flush()
+            await ProfileRepository(session, compact=True).create_many(
+                [
+                    EntityProfile(
+                        entity_id=entity_id,
+                        version=version,
+                        trigger_type=(
+                            ProfileTrigger.SCREENING if version == 1 else ProfileTrigger.MONITORING
+                        ).value,
+                        connection_count=0,
+                        evolution_signals={},
+                        **self._snapshot("Jane Doe", 0.1 * version),
+                    )
+                    for entity_id in [subjects[0], other]
+                    for version in (1, 2, 3)
+                ],
+                commit=False,
+            )
+            session.add(
+                CachedDataSource(
+                    entity_id=subjects[1],
+                    provider_id="courts",
+                    check_type="criminal",
+                    data_origin=DataOrigin.PAID_EXTERNAL.value,
+                    acquired_at=now,
+                    freshness_status=FreshnessStatus.FRESH.value,
+                    fresh_until=now,
+                    stale_until=now,
+                    raw_response=encode_payload(encryptor, b"Jane Doe"),
+                    normalized_payload=encode_json_payload(encryptor, {"full_name": "Jane Doe"}),
+                    cost_incurred=Decimal("1.00"),
+                )
+            )
+            session.add(
+                AuditEvent(
+                    event_type="data.accessed",
+                    tenant_id=tenant_id,
+                    correlation_id=uuid7(),
+                    entity_id=subjects[2],
+                    event_data={"full_name": "Jane Doe"},
+                )
+            )
+            await session.commit()
+        return subjects, other
+
+    @pytest.mark.asyncio
+    async def test_find_subject_data_in_existing_tables(self, session_factory):
+        """Test profiles, cache entries and audit payloads are found per subject and tenant."""
+        encryptor = Encryptor(generate_key())
+        tenant_id = uuid7()
+        subjects, other = await self._seed(session_factory, encryptor, tenant_id, uuid7())
+        data_store = SQLAlchemySubjectDataStore(session_factory, encryptor=encryptor, chunk_size=2)
+
+        found = await data_store.find_subject_data(tenant_id, [*subjects, other])
+
+        assert sorted((item.subject_id, item.data_type) for item in found) == sorted(
+            [
+                (subjects[0], DataType.SCREENING_RESULT),
+                (subjects[0], DataType.ENTITY_PROFILE),
+                (subjects[0], DataType.ENTITY_PROFILE),
+                (subjects[1], DataType.CACHE_ENTRY),
+                (subjects[2], DataType.AUDIT_LOG),
+            ]
+        )
+        profiles = [item for item in found if item.data_type == DataType.ENTITY_PROFILE]
+        assert [item.payload["risk_score"] for item in profiles] == [
+            {"overall": 0.2},
+            {"overall": 0.30000000000000004},
+        ]
+        (cached,) = [item for item in found if item.data_type == DataType.CACHE_ENTRY]
+        assert cached.payload == {"full_name": "Jane Doe"}
+
+        only_cache = await data_store.find_subject_data(
+            tenant_id, subjects, data_types={DataType.CACHE_ENTRY}
+        )
+        assert [item.data_id for item in only_cache] == [cached.data_id]
+
+    @pytest.mark.asyncio
+    async def test_save_items_updates_rows_in_place(self, session_factory):
+        """Test anonymized payloads are written back to their rows, keeping delta chains."""
+        encryptor = Encryptor(generate_key())
+        tenant_id = uuid7()
+        subjects, _ = await self._seed(session_factory, encryptor, tenant_id, uuid7())
+        data_store = SQLAlchemySubjectDataStore(session_factory, encryptor=encryptor)
+        found = await data_store.find_subject_data(
+            tenant_id, subjects, data_types={DataType.ENTITY_PROFILE, DataType.CACHE_ENTRY}
+        )
+        middle = next(item for item in found if item.payload.get("risk_score") == {"overall": 0.2})
+        cached = next(item for item in found if item.data_type == DataType.CACHE_ENTRY)
+
+        async with session_factory() as session:
+            encodings = [
+                p.encoding for p in await ProfileRepository(session).get_by_entity(subjects[0])
+            ]
+        assert encodings == [ProfileEncoding.DELTA.value] * 2 + [ProfileEncoding.FULL.value]
+
+        middle.payload = self._snapshot("[REDACTED]", 0.2)
+        cached.payload = {"full_name": "[REDACTED]"}
+        await data_store.save_items([middle, cached])
+
+        async with session_factory() as session:
+            repository = ProfileRepository(session)
+            second = await repository.get_by_version(subjects[0], 2)
+            third = await repository.get_by_version(subjects[0], 3)
+            row = await session.get(
+                CachedDataSource, cached.data_id, options=[undefer_group(PAYLOAD_GROUP)]
+            )
+        assert second.findings[0]["summary"] == "Lawsuit naming [REDACTED]"
+        assert second.encoding == ProfileEncoding.FULL.value
+        assert third.findings[0]["summary"] == "Lawsuit naming Jane Doe"
+        assert decode_json_payload(encryptor, row.normalized_payload) == {"full_name": "[REDACTED]"}
+        assert decode_payload(encryptor, row.raw_response) == b""
+
+    @pytest.mark.asyncio
+    async def test_unstored_data_type_rejected(self, session_factory):
+        """Test items of a type no table holds are not silently dropped."""
+        data_store = SQLAlchemySubjectDataStore(session_factory)
+        item = SubjectDataItem(
+            data_id=uuid7(), data_type=DataType.REPORT, subject_id=uuid7(), tenant_id=uuid7()
+        )
+
+        with pytest.raises(ValueError, match="report"):
+            await data_store.save_items([item])
@@ -1,6 +1,7 @@
 """Unit tests for the HRIS Event Processor."""
 
 from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID, uuid7
 
 import pytest
@@ -741,3 +742,244 @@ class TestErrorHandling:
 
         assert result.processing_time_ms >= 0
         assert result.processed_at is not None
+
+
+# =============================================================================
+# Batch Processing Tests
+# =============================================================================
+
+
+class RecordingScreeningService:
+    """Screening service that records how screenings were started."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+        self.started: list[ScreeningRequest] = []
+
+    async def initiate_screening(self, request: ScreeningRequest) -> UUID:
+        self.started.append(request)
+        return request.screening_id
+
+    async def initiate_screenings(self, requests: list[ScreeningRequest]) -> list[UUID]:
+        self.batch_sizes.append(len(requests))
+        return [await self.initiate_screening(r) for r in requests]
+
+    async def get_screening_status(self, screening_id: UUID) -> None:  # noqa: ARG002
+        return None
+
+
+class CountingEventStore(InMemoryEventStore):
+    """Event store that counts calls per method."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: dict[str, int] = {}
+
+    def __getattribute__(self, name: str) -> Any:
+        attribute = super().__getattribute__(name)
+        if not name.startswith(("get_", "save_", "remove_")):
+            return attribute
+        calls = super().__getattribute__("calls")
+
+        async def counted(*args: Any, **kwargs: Any) -> Any:
+            calls[name] = calls.get(name, 0) + 1
+            return await attribute(*args, **kwargs)
+
+        return counted
+
+
+def onboarding_wave(tenant_id: UUID, size: int) -> list[HRISEvent]:
+    """Hire and consent events for ``size`` new employees."""
+    hires = [
+        create_hris_event(
+            tenant_id,
+            f"EMP-{i:05d}",
+            HRISEventType.HIRE_INITIATED,
+            {"full_name": f"Employee {i}", "job_title": "Analyst"},
+        )
+        for i in range(size)
+    ]
+    consents = [
+        create_hris_event(
+            tenant_id,
+            f"EMP-{i:05d}",
+            HRISEventType.CONSENT_GRANTED,
+            {"consent_token": f"consent-{i}"},
+        )
+        for i in range(size)
+    ]
+    return hires + consents
+
+
+class TestBatchProcessing:
+    """Tests for bulk event ingestion."""
+
+    @pytest.mark.asyncio
+    async def test_hire_and_consent_in_one_batch(self, tenant_id: UUID) -> None:
+        """Should start screenings for hires consented within the same batch."""
+        service = RecordingScreeningService()
+        store = InMemoryEventStore()
+        processor = HRISEventProcessor(
+            config=ProcessorConfig(screening_batch_size=4),
+            screening_service=service,
+            event_store=store,
+        )
+
+        batch = await processor.process_events(onboarding_wave(tenant_id, 10))
+
+        assert batch.total == 20
+        assert batch.count(ProcessingStatus.SUCCESS) == 20
+        consents = batch.results[10:]
+        assert all(r.details["screening_status"] == "started" for r in consents)
+        assert [r.screening_id for r in consents] == [r.screening_id for r in batch.results[:10]]
+        assert sorted(service.batch_sizes) == [2, 4, 4]
+        assert await store.get_pending_screening(tenant_id, "EMP-00003") is None
+        assert await store.get_subject_id_by_employee_id(tenant_id, "EMP-00003") is not None
+
+    @pytest.mark.asyncio
+    async def test_store_queried_once_per_batch(self, tenant_id: UUID) -> None:
+        """Should resolve and write employee state with batched store calls."""
+        store = CountingEventStore()
+        processor = HRISEventProcessor(event_store=store)
+
+        await processor.process_events(onboarding_wave(tenant_id, 50))
+
+        # Consents within the batch cancel the hires' pending screenings,
+        # so those are never written
+        assert store.calls == {
+            "get_pending_screenings": 1,
+            "get_subject_ids_by_employee_ids": 1,
+            "save_employee_mappings": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_consent_for_earlier_hire(self, tenant_id: UUID, employee_id: str) -> None:
+        """Should start and clear pending screenings stored before the batch."""
+        store = InMemoryEventStore()
+        service = RecordingScreeningService()
+        processor = HRISEventProcessor(screening_service=service, event_store=store)
+        hire = await processor.process_event(
+            create_hris_event(
+                tenant_id, employee_id, HRISEventType.HIRE_INITIATED, {"full_name": "John Doe"}
+            )
+        )
+
+        batch = await processor.process_events(
+            [create_hris_event(tenant_id, employee_id, HRISEventType.CONSENT_GRANTED)]
+        )
+
+        assert batch.results[0].screening_id == hire.screening_id
+        assert service.batch_sizes == [1]
+        assert await store.get_pending_screening(tenant_id, employee_id) is None
+
+    @pytest.mark.asyncio
+    async def test_repeated_events_skipped(self, tenant_id: UUID, employee_id: str) -> None:
+        """Should skip repeats within a batch and across batches."""
+        processor = HRISEventProcessor()
+        hire = create_hris_event(
+            tenant_id, employee_id, HRISEventType.HIRE_INITIATED, {"full_name": "John Doe"}
+        )
+        retry = create_hris_event(
+            tenant_id, employee_id, HRISEventType.HIRE_INITIATED, {"full_name": "John Doe"}
+        )
+
+        first = await processor.process_events([hire, retry])
+        second = await processor.process_events([retry])
+
+        assert first.duplicates == 1
+        assert first.results[1].status == ProcessingStatus.SKIPPED
+        assert first.results[1].details["duplicate_of"] == str(hire.event_id)
+        assert second.duplicates == 1
+        assert processor.get_statistics()["duplicates_skipped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_platform_event_id_used_for_dedup(self, tenant_id: UUID) -> None:
+        """Should treat events with the same platform event ID as repeats."""
+        processor = HRISEventProcessor()
+        events = [
+            create_hris_event(
+                tenant_id,
+                "EMP-001",
+                HRISEventType.HIRE_INITIATED,
+                {"event_id": "wd-123", "full_name": name},
+            )
+            for name in ("John Doe", "Jon Doe")
+        ]
+
+        batch = await processor.process_events(events)
+
+        assert batch.duplicates == 1
+
+    @pytest.mark.asyncio
+    async def test_store_failure_fails_tenant_events(self, tenant_id: UUID) -> None:
+        """Should fail a tenant's events when their changes cannot be written."""
+
+        class BrokenStore(InMemoryEventStore):
+            async def save_employee_mappings(
+                self,
+                tenant_id: UUID,  # noqa: ARG002
+                mappings: dict[str, UUID],  # noqa: ARG002
+            ) -> None:
+                raise RuntimeError("Database connection failed")
+
+        processor = HRISEventProcessor(event_store=BrokenStore())
+        other_tenant = uuid7()
+
+        batch = await processor.process_events(
+            onboarding_wave(tenant_id, 2)[:2]
+            + [create_hris_event(other_tenant, "EMP-9", HRISEventType.EMPLOYEE_TERMINATED)]
+        )
+
+        assert [r.status for r in batch.results] == [
+            ProcessingStatus.FAILED,
+            ProcessingStatus.FAILED,
+            ProcessingStatus.SKIPPED,
+        ]
+        assert "Database connection failed" in (batch.results[0].error_message or "")
+
+    @pytest.mark.asyncio
+    async def test_failed_events_processed_on_redelivery(self, tenant_id: UUID) -> None:
+        """Should not skip the redelivery of an event that failed."""
+
+        class FlakyStore(InMemoryEventStore):
+            failures = 1
+
+            async def save_employee_mappings(
+                self, tenant_id: UUID, mappings: dict[str, UUID]
+            ) -> None:
+                if self.failures:
+                    self.failures -= 1
+                    raise RuntimeError("Database connection failed")
+                await super().save_employee_mappings(tenant_id, mappings)
+
+        processor = HRISEventProcessor(event_store=FlakyStore())
+        wave = onboarding_wave(tenant_id, 2)
+
+        failed = await processor.process_events(wave)
+        redelivered = await processor.process_events(wave)
+
+        assert failed.count(ProcessingStatus.FAILED) == 4
+        assert redelivered.duplicates == 0
+        assert redelivered.count(ProcessingStatus.SUCCESS) == 4
+        assert (await processor.process_events(wave)).duplicates == 4
+
+    @pytest.mark.asyncio
+    async def test_onboarding_wave_batched(self, tenant_id: UUID) -> None:
+        """Should ingest a large wave with one query per store method and full screening batches.
+
+        Throughput is measured by the hris_event_processor.onboarding_wave benchmark.
+        """
+        service = RecordingScreeningService()
+        store = CountingEventStore()
+        processor = HRISEventProcessor(screening_service=service, event_store=store)
+
+        batch = await processor.process_events(onboarding_wave(tenant_id, 1_000))
+
+        assert batch.count(ProcessingStatus.SUCCESS) == 2_000
+        assert len(service.started) == 1_000
+        assert store.calls == {
+            "get_pending_screenings": 1,
+            "get_subject_ids_by_employee_ids": 1,
+            "save_employee_mappings": 1,
+        }
+        assert service.batch_sizes == [50] * 20
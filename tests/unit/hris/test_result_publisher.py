@@ -1,10 +1,15 @@
 """Unit tests for the HRIS Result Publisher."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
 from uuid import UUID, uuid7
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
+from elile.db.models import HRISDeliveryRecord, OutboxMessage
+from elile.db.models.base import Base
 from elile.hris.gateway import (
     GatewayConfig,
     HRISConnection,
@@ -12,8 +17,17 @@ from elile.hris.gateway import (
     HRISGateway,
     HRISPlatform,
     MockHRISAdapter,
+    ScreeningUpdate,
     create_hris_gateway,
 )
+from elile.hris.outbound_queue import (
+    InMemoryDeliveryHistoryStore,
+    InMemoryOutboundQueue,
+    OutboundMessage,
+    OutboundStatus,
+    SQLAlchemyDeliveryHistoryStore,
+    SQLAlchemyOutboundQueue,
+)
 from elile.hris.result_publisher import (
     DeliveryRecord,
     HRISResultPublisher,
@@ -331,7 +345,7 @@ class TestPublishScreeningProgress:
         screening_id: UUID,
         employee_id: str,
     ) -> None:
-        """Should publish progress update."""
+        """Should hold progress for the coalescing window, then deliver it."""
         result = await publisher.publish_screening_progress(
             screening_id=screening_id,
             employee_id=employee_id,
@@ -340,6 +354,36 @@ class TestPublishScreeningProgress:
         )
 
         assert result.event_type == PublishEventType.SCREENING_PROGRESS
+        assert result.status == PublishStatus.PENDING
+        deliver_at = datetime.fromisoformat(result.metadata["deliver_at"])
+        assert await publisher.dispatch_queue() == []
+
+        attempted = await publisher.dispatch_queue(as_of=deliver_at)
+
+        assert [m.status for m in attempted] == [OutboundStatus.DELIVERED]
+        assert attempted[0].attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_progress_without_window(
+        self,
+        gateway_with_connection: HRISGateway,
+        tenant_id: UUID,
+        screening_id: UUID,
+        employee_id: str,
+    ) -> None:
+        """Should deliver progress right away when coalescing is disabled."""
+        publisher = HRISResultPublisher(
+            gateway=gateway_with_connection,
+            config=PublisherConfig(coalesce_window_seconds=0),
+        )
+
+        result = await publisher.publish_screening_progress(
+            screening_id=screening_id,
+            employee_id=employee_id,
+            tenant_id=tenant_id,
+            progress_percent=50,
+        )
+
         assert result.status == PublishStatus.DELIVERED
         assert result.attempts == 1
 
@@ -691,6 +735,7 @@ class TestStatistics:
             tenant_id=tenant_id,
             progress_percent=50,
         )
+        await publisher.dispatch_queue(as_of=datetime.now(UTC) + timedelta(minutes=1))
 
         stats = publisher.get_statistics()
 
@@ -714,7 +759,7 @@ class TestStatistics:
             tenant_id=tenant_id,
         )
 
-        history = publisher.get_delivery_history(tenant_id=tenant_id)
+        history = await publisher.get_delivery_history(tenant_id=tenant_id)
 
         assert len(history) == 1
         assert history[0].tenant_id == tenant_id
@@ -741,25 +786,22 @@ class TestStatistics:
             progress_percent=50,
         )
 
-        history = publisher.get_delivery_history(
+        history = await publisher.get_delivery_history(
             event_type=PublishEventType.SCREENING_STARTED,
         )
 
         assert len(history) == 1
         assert history[0].event_type == PublishEventType.SCREENING_STARTED
 
-    def test_clear_history(self, publisher: HRISResultPublisher) -> None:
+    async def test_clear_history(self, publisher: HRISResultPublisher) -> None:
         """Should clear delivery history."""
-        publisher._delivery_history.append(
-            DeliveryRecord(
-                tenant_id=uuid7(),
-                employee_id="EMP-001",
-            )
+        await publisher.history_store.save_records(
+            [DeliveryRecord(tenant_id=uuid7(), employee_id="EMP-001")]
         )
 
-        assert len(publisher._delivery_history) == 1
+        assert len(await publisher.get_delivery_history()) == 1
         publisher.clear_history()
-        assert len(publisher._delivery_history) == 0
+        assert await publisher.get_delivery_history() == []
 
 
 # =============================================================================
@@ -788,3 +830,487 @@ class TestCredentials:
 
         result = publisher._get_credentials(uuid7())
         assert result == {}
+
+
+# =============================================================================
+# Outbound Queue Tests
+# =============================================================================
+
+
+class FlakyHRISAdapter(MockHRISAdapter):
+    """Mock adapter that rejects the first ``failures`` batches."""
+
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+
+    async def publish_updates(
+        self,
+        tenant_id: UUID,
+        updates: list[tuple[str, ScreeningUpdate]],
+        credentials: dict[str, Any],
+    ) -> list[bool]:
+        if self.failures > 0:
+            self.failures -= 1
+            self.batch_sizes.append(len(updates))
+            return [False] * len(updates)
+        return await super().publish_updates(tenant_id, updates, credentials)
+
+
+class SingleUpdateHRISAdapter(MockHRISAdapter):
+    """Mock adapter without batch support."""
+
+    publish_updates = None  # type: ignore[assignment]
+
+
+def _connect(gateway: HRISGateway, adapter: MockHRISAdapter, tenant_id: UUID) -> None:
+    gateway.register_adapter(adapter)
+    gateway.register_connection(
+        HRISConnection(
+            connection_id=uuid7(),
+            tenant_id=tenant_id,
+            platform=adapter.platform_id,
+            status=HRISConnectionStatus.CONNECTED,
+            enabled=True,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+    )
+
+
+class TestOutboundQueue:
+    """Tests for the in-memory outbound queue."""
+
+    @staticmethod
+    def _progress(tenant_id: UUID, screening_id: UUID, percent: int) -> OutboundMessage:
+        return OutboundMessage(
+            tenant_id=tenant_id,
+            employee_id="EMP-001",
+            event_type=PublishEventType.SCREENING_PROGRESS,
+            update=ScreeningUpdate(
+                screening_id=screening_id,
+                status="in_progress",
+                timestamp=datetime.now(UTC),
+                progress_percent=percent,
+            ),
+            coalesce_key=f"progress:{screening_id}",
+        )
+
+    async def test_waiting_progress_superseded(self, tenant_id: UUID, screening_id: UUID) -> None:
+        """Should replace a waiting progress update with the newer one."""
+        queue = InMemoryOutboundQueue()
+        first = self._progress(tenant_id, screening_id, 25)
+        second = self._progress(tenant_id, screening_id, 50)
+
+        await queue.enqueue([first])
+        superseded = await queue.enqueue([second])
+        claimed = await queue.claim_due(tenant_id, datetime.now(UTC), 10)
+
+        assert superseded == [first]
+        assert first.status == OutboundStatus.SUPERSEDED
+        assert first.superseded_by == second.message_id
+        assert claimed == [second]
+        assert len(queue) == 1
+
+    async def test_in_flight_message_not_superseded(
+        self, tenant_id: UUID, screening_id: UUID
+    ) -> None:
+        """Should keep a claimed message, but drop it on save if a newer one waits."""
+        queue = InMemoryOutboundQueue()
+        first = self._progress(tenant_id, screening_id, 25)
+        await queue.enqueue([first])
+        await queue.claim_due(tenant_id, datetime.now(UTC), 10)
+
+        second = self._progress(tenant_id, screening_id, 50)
+        assert await queue.enqueue([second]) == []
+
+        # The in-flight attempt failed; retrying stale progress is pointless
+        first.attempts = 1
+        await queue.save_messages([first])
+
+        assert first.status == OutboundStatus.SUPERSEDED
+        assert await queue.claim_due(tenant_id, datetime.now(UTC), 10) == [second]
+
+    async def test_final_messages_leave_queue(self, tenant_id: UUID, screening_id: UUID) -> None:
+        """Should only hold messages that still need delivery."""
+        queue = InMemoryOutboundQueue()
+        message = self._progress(tenant_id, screening_id, 25)
+        await queue.enqueue([message], claimed=True)
+
+        message.status = OutboundStatus.DELIVERED
+        await queue.save_messages([message])
+
+        assert len(queue) == 0
+        assert await queue.pending_tenants() == []
+
+
+class TestQueuedDelivery:
+    """Tests for queued delivery through dispatch_queue."""
+
+    def test_supplied_empty_queue_used(self, gateway_with_connection: HRISGateway) -> None:
+        """Should use a supplied queue even while it is empty."""
+        queue = InMemoryOutboundQueue()
+
+        publisher = HRISResultPublisher(gateway=gateway_with_connection, queue=queue)
+
+        assert publisher.queue is queue
+
+    async def test_progress_burst_coalesced(
+        self,
+        gateway_with_connection: HRISGateway,
+        mock_adapter: MockHRISAdapter,
+        tenant_id: UUID,
+        screening_id: UUID,
+        employee_id: str,
+    ) -> None:
+        """Should deliver only the latest queued progress of a screening."""
+        publisher = HRISResultPublisher(
+            gateway=gateway_with_connection,
+            config=PublisherConfig(deliver_immediately=False),
+        )
+
+        for percent in (10, 20, 30, 40):
+            result = await publisher.publish_screening_progress(
+                screening_id=screening_id,
+                employee_id=employee_id,
+                tenant_id=tenant_id,
+                progress_percent=percent,
+            )
+            assert result.status == PublishStatus.PENDING
+
+        attempted = await publisher.dispatch_queue(as_of=datetime.now(UTC) + timedelta(minutes=1))
+
+        assert len(attempted) == 1
+        assert [u.progress_percent for u in mock_adapter.published_updates] == [40]
+        assert publisher.get_statistics()["superseded_updates"] == 3
+
+    async def test_completion_supersedes_held_progress(
+        self,
+        publisher: HRISResultPublisher,
+        mock_adapter: MockHRISAdapter,
+        tenant_id: UUID,
+        screening_id: UUID,
+        employee_id: str,
+        screening_result: ScreeningResult,
+    ) -> None:
+        """Should not deliver a held progress update after the completion."""
+        await publisher.publish_screening_progress(
+            screening_id=screening_id,
+            employee_id=employee_id,
+            tenant_id=tenant_id,
+            progress_percent=75,
+        )
+        result = await publisher.publish_screening_complete(
+            screening_id=screening_id,
+            employee_id=employee_id,
+            tenant_id=tenant_id,
+            result=screening_result,
+        )
+
+        assert result.status == PublishStatus.DELIVERED
+        assert await publisher.dispatch_queue(as_of=datetime.now(UTC) + timedelta(minutes=1)) == []
+        assert [u.progress_percent for u in mock_adapter.published_updates] == [100]
+
+    async def test_updates_batched_per_tenant(
+        self,
+        gateway: HRISGateway,
+        mock_adapter: MockHRISAdapter,
+        monitoring_alert: MonitoringAlert,
+    ) -> None:
+        """Should send each tenant's updates in batches of batch_size."""
+        tenants = [uuid7(), uuid7()]
+        for tenant in tenants:
+            _connect(gateway, mock_adapter, tenant)
+        publisher = HRISResultPublisher(
+            gateway=gateway,
+            config=PublisherConfig(deliver_immediately=False, batch_size=4),
+        )
+
+        for tenant in tenants:
+            for i in range(6):
+                await publisher.publish_screening_started(
+                    screening_id=uuid7(), employee_id=f"EMP-{i}", tenant_id=tenant
+                )
+        await publisher.publish_alert(monitoring_alert, "EMP-0", tenants[0])
+
+        attempted = await publisher.dispatch_queue()
+
+        assert len(attempted) == 13
+        assert all(m.status == OutboundStatus.DELIVERED for m in attempted)
+        assert sorted(mock_adapter.batch_sizes) == [2, 2, 4, 4]
+        assert len(mock_adapter.published_alerts) == 1
+
+    async def test_failed_delivery_retried_with_backoff(
+        self, gateway: HRISGateway, tenant_id: UUID, employee_id: str
+    ) -> None:
+        """Should reschedule failed deliveries and deliver them once due."""
+        adapter = FlakyHRISAdapter(failures=1)
+        _connect(gateway, adapter, tenant_id)
+        publisher = HRISResultPublisher(gateway=gateway)
+
+        result = await publisher.publish_screening_started(
+            screening_id=uuid7(), employee_id=employee_id, tenant_id=tenant_id
+        )
+
+        assert result.status == PublishStatus.FAILED
+        assert "retry_at" in result.metadata
+        assert await publisher.dispatch_queue() == []  # Backoff not yet elapsed
+
+        attempted = await publisher.dispatch_queue(as_of=datetime.now(UTC) + timedelta(hours=1))
+
+        assert [m.status for m in attempted] == [OutboundStatus.DELIVERED]
+        assert attempted[0].attempts == 2
+        assert [r.success for r in await publisher.get_delivery_history()] == [True, False]
+
+    async def test_retries_exhausted(
+        self, gateway: HRISGateway, tenant_id: UUID, employee_id: str
+    ) -> None:
+        """Should mark a message failed after max_retries retries."""
+        adapter = FlakyHRISAdapter(failures=10)
+        _connect(gateway, adapter, tenant_id)
+        publisher = HRISResultPublisher(gateway=gateway, config=PublisherConfig(max_retries=2))
+
+        await publisher.publish_screening_started(
+            screening_id=uuid7(), employee_id=employee_id, tenant_id=tenant_id
+        )
+        attempted = await publisher.dispatch_queue(as_of=datetime.now(UTC) + timedelta(days=1))
+
+        assert attempted[-1].status == OutboundStatus.FAILED
+        assert attempted[-1].attempts == 3
+        assert len(publisher.queue) == 0  # type: ignore[arg-type]
+
+    async def test_failed_batch_attempted_once(
+        self, gateway: HRISGateway, tenant_id: UUID, employee_id: str
+    ) -> None:
+        """Should leave retries of a failed batch to the queue's backoff."""
+        adapter = FlakyHRISAdapter(failures=0)
+        _connect(gateway, adapter, tenant_id)
+        calls = 0
+
+        async def failing_batch(**_: Any) -> list[bool]:
+            nonlocal calls
+            calls += 1
+            raise ConnectionError("HRIS unavailable")
+
+        adapter.publish_updates = failing_batch  # type: ignore[method-assign]
+        publisher = HRISResultPublisher(gateway=gateway)
+
+        result = await publisher.publish_screening_started(
+            screening_id=uuid7(), employee_id=employee_id, tenant_id=tenant_id
+        )
+
+        assert result.status == PublishStatus.FAILED
+        assert "retry_at" in result.metadata
+        assert calls == 1
+
+    async def test_adapter_without_batch_support(
+        self, gateway: HRISGateway, tenant_id: UUID
+    ) -> None:
+        """Should fall back to one request per update."""
+        adapter = SingleUpdateHRISAdapter()
+        _connect(gateway, adapter, tenant_id)
+        publisher = HRISResultPublisher(
+            gateway=gateway, config=PublisherConfig(deliver_immediately=False)
+        )
+
+        for i in range(3):
+            await publisher.publish_screening_started(
+                screening_id=uuid7(), employee_id=f"EMP-{i}", tenant_id=tenant_id
+            )
+        attempted = await publisher.dispatch_queue()
+
+        assert all(m.status == OutboundStatus.DELIVERED for m in attempted)
+        assert len(adapter.published_updates) == 3
+        assert adapter.batch_sizes == []
+
+    async def test_history_store_and_retention(
+        self,
+        gateway_with_connection: HRISGateway,
+        tenant_id: UUID,
+        employee_id: str,
+    ) -> None:
+        """Should serve history from the store and purge it by age."""
+        store = InMemoryDeliveryHistoryStore()
+        publisher = HRISResultPublisher(
+            gateway=gateway_with_connection,
+            config=PublisherConfig(history_window_size=2, history_retention_days=30),
+            history_store=store,
+        )
+        default = HRISResultPublisher(
+            gateway=gateway_with_connection,
+            config=PublisherConfig(history_window_size=2),
+        )
+
+        for _ in range(5):
+            for p in (publisher, default):
+                await p.publish_screening_started(
+                    screening_id=uuid7(), employee_id=employee_id, tenant_id=tenant_id
+                )
+
+        assert len(await publisher.get_delivery_history()) == 5
+        assert len(await default.get_delivery_history()) == 2  # In-memory window
+        assert publisher.get_statistics()["total_deliveries"] == 5
+
+        assert await publisher.purge_delivery_history() == 0
+        purged = await publisher.purge_delivery_history(
+            as_of=datetime.now(UTC) + timedelta(days=31)
+        )
+        assert purged == 5
+        assert len(store) == 0
+
+
+# =============================================================================
+# Database Outbound Queue Tests
+# =============================================================================
+
+
+@pytest.fixture
+async def outbox_engine(tmp_path: Path) -> AsyncEngine:
+    """File-backed SQLite engine with the outbox and delivery record tables."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[OutboxMessage.__table__, HRISDeliveryRecord.__table__],
+        )
+    yield engine
+    await engine.dispose()
+
+
+def _db_queue(engine: AsyncEngine) -> SQLAlchemyOutboundQueue:
+    return SQLAlchemyOutboundQueue(async_sessionmaker(engine, expire_on_commit=False))
+
+
+class TestSQLAlchemyOutboundQueue:
+    """Tests for the database-backed outbound queue."""
+
+    async def test_queued_messages_survive_restart(
+        self,
+        outbox_engine: AsyncEngine,
+        gateway_with_connection: HRISGateway,
+        mock_adapter: MockHRISAdapter,
+        tenant_id: UUID,
+        screening_id: UUID,
+        employee_id: str,
+        monitoring_alert: MonitoringAlert,
+    ) -> None:
+        """Should deliver messages queued by one publisher from another."""
+        publisher = HRISResultPublisher(
+            gateway=gateway_with_connection,
+            config=PublisherConfig(deliver_immediately=False),
+            queue=_db_queue(outbox_engine),
+        )
+        for percent in (10, 20, 30):
+            await publisher.publish_screening_progress(
+                screening_id=screening_id,
+                employee_id=employee_id,
+                tenant_id=tenant_id,
+                progress_percent=percent,
+                estimated_completion=datetime.now(UTC),
+            )
+        await publisher.publish_alert(monitoring_alert, employee_id, tenant_id)
+
+        restarted = HRISResultPublisher(
+            gateway=gateway_with_connection, queue=_db_queue(outbox_engine)
+        )
+        assert await restarted.queue.pending_tenants() == [tenant_id]
+        attempted = await restarted.dispatch_queue(as_of=datetime.now(UTC) + timedelta(minutes=1))
+
+        assert [m.status for m in attempted] == [OutboundStatus.DELIVERED] * 2
+        assert [u.progress_percent for u in mock_adapter.published_updates] == [30]
+        assert mock_adapter.published_alerts[0].alert_id == monitoring_alert.alert_id
+        assert publisher.get_statistics()["superseded_updates"] == 2
+        assert await restarted.queue.pending_tenants() == []
+
+    async def test_in_flight_message_superseded_on_save(
+        self, outbox_engine: AsyncEngine, tenant_id: UUID, screening_id: UUID
+    ) -> None:
+        """Should keep a claimed message, but drop it on save if a newer one waits."""
+        queue = _db_queue(outbox_engine)
+        first = TestOutboundQueue._progress(tenant_id, screening_id, 25)
+        await queue.enqueue([first])
+        [claimed] = await queue.claim_due(tenant_id, datetime.now(UTC), 10)
+
+        second = TestOutboundQueue._progress(tenant_id, screening_id, 50)
+        assert await queue.enqueue([second]) == []
+
+        claimed.attempts = 1
+        await queue.save_messages([claimed])
+
+        assert claimed.status == OutboundStatus.SUPERSEDED
+        assert claimed.superseded_by == second.message_id
+        [due] = await queue.claim_due(tenant_id, datetime.now(UTC), 10)
+        assert due.message_id == second.message_id
+        assert due.update is not None and due.update.progress_percent == 50
+
+    async def test_retry_backoff_persisted_and_pruned(
+        self, outbox_engine: AsyncEngine, gateway: HRISGateway, tenant_id: UUID, employee_id: str
+    ) -> None:
+        """Should keep the retry schedule in the database and prune finished messages."""
+        _connect(gateway, FlakyHRISAdapter(failures=1), tenant_id)
+        publisher = HRISResultPublisher(gateway=gateway, queue=_db_queue(outbox_engine))
+
+        result = await publisher.publish_screening_started(
+            screening_id=uuid7(), employee_id=employee_id, tenant_id=tenant_id
+        )
+
+        assert result.status == PublishStatus.FAILED
+        assert await publisher.dispatch_queue() == []  # Backoff not yet elapsed
+
+        attempted = await publisher.dispatch_queue(as_of=datetime.now(UTC) + timedelta(hours=1))
+
+        assert [m.status for m in attempted] == [OutboundStatus.DELIVERED]
+        assert attempted[0].attempts == 2
+        assert await publisher.queue.prune(datetime.now(UTC) - timedelta(hours=1)) == 0
+        assert await publisher.queue.prune(datetime.now(UTC) + timedelta(seconds=1)) == 1
+
+
+class TestSQLAlchemyDeliveryHistoryStore:
+    """Tests for the database-backed delivery history."""
+
+    async def test_history_survives_restart_and_is_pruned(
+        self,
+        outbox_engine: AsyncEngine,
+        gateway: HRISGateway,
+        tenant_id: UUID,
+        employee_id: str,
+    ) -> None:
+        """Should serve history written by one publisher from another and prune it."""
+        session_factory = async_sessionmaker(outbox_engine, expire_on_commit=False)
+        _connect(gateway, FlakyHRISAdapter(failures=1), tenant_id)
+        publisher = HRISResultPublisher(
+            gateway=gateway,
+            queue=_db_queue(outbox_engine),
+            history_store=SQLAlchemyDeliveryHistoryStore(session_factory),
+        )
+        screening_id = uuid7()
+        await publisher.publish_screening_started(
+            screening_id=screening_id, employee_id=employee_id, tenant_id=tenant_id
+        )
+        await publisher.dispatch_queue(as_of=datetime.now(UTC) + timedelta(hours=1))
+
+        restarted = HRISResultPublisher(
+            gateway=gateway,
+            config=PublisherConfig(history_retention_days=30),
+            queue=_db_queue(outbox_engine),
+            history_store=SQLAlchemyDeliveryHistoryStore(session_factory),
+        )
+        history = await restarted.get_delivery_history(tenant_id=tenant_id)
+
+        assert [(r.attempt_number, r.success) for r in history] == [(2, True), (1, False)]
+        assert history[1].error_message
+        assert history[0].employee_id == employee_id
+        assert history[0].event_type == PublishEventType.SCREENING_STARTED
+        assert await restarted.get_delivery_history(tenant_id=uuid7()) == []
+        alerts = await restarted.get_delivery_history(event_type=PublishEventType.ALERT_GENERATED)
+        assert alerts == []
+
+        # The queue message is pruned on the dispatcher's cutoff; history is
+        # kept until its own retention has passed
+        assert await restarted.prune(datetime.now(UTC) + timedelta(seconds=1)) == 1
+        assert len(await restarted.get_delivery_history()) == 2
+        purged = await restarted.purge_delivery_history(
+            as_of=datetime.now(UTC) + timedelta(days=31)
+        )
+        assert purged == 2
+        assert await restarted.get_delivery_history() == []
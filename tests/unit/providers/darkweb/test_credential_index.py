@@ -0,0 +1,188 @@
+"""Tests for the memory-mapped breached-credential index."""
+
+import mmap
+from pathlib import Path
+
+import pytest
+
+from elile.providers.darkweb.credential_index import (
+    CredentialIndex,
+    CredentialIndexBuilder,
+    email_key,
+    main,
+)
+from elile.providers.darkweb.provider import DarkWebProvider
+from elile.providers.darkweb.types import CredentialIndexError, DarkWebProviderConfig
+
+
+def _build(path: Path, breaches: dict[str, list[str]], **kwargs: object) -> int:
+    builder = CredentialIndexBuilder(path, **kwargs)  # type: ignore[arg-type]
+    for breach_id, emails in breaches.items():
+        builder.add_breach(breach_id, emails)
+    return builder.build()
+
+
+class CountingMap(mmap.mmap):
+    """Memory map counting Bloom filter byte reads and record key reads."""
+
+    def __init__(self, *_args: object, **_kwargs: object) -> None:
+        self.bloom_reads = 0
+        self.key_reads = 0
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            self.key_reads += 1
+        else:
+            self.bloom_reads += 1
+        return super().__getitem__(item)
+
+
+def _counting(index: CredentialIndex) -> CountingMap:
+    index._map.close()
+    index._map = CountingMap(index._file.fileno(), 0, access=mmap.ACCESS_READ)
+    return index._map
+
+
+class TestCredentialIndex:
+    """Tests for building and querying the index."""
+
+    def test_lookup_finds_every_breach(self, tmp_path: Path) -> None:
+        """Test an email is reported once per breach it appears in."""
+        path = tmp_path / "breaches.idx"
+        records = _build(
+            path,
+            {
+                "linkedin_2021": ["jane@example.com", "bob@example.com"],
+                "adobe_2013": ["Jane@Example.com ", "carol@example.org"],
+            },
+        )
+
+        with CredentialIndex(path) as index:
+            assert records == 4
+            assert len(index) == 4
+            assert index.lookup("jane@example.com") == ["linkedin_2021", "adobe_2013"]
+            assert index.lookup("carol@example.org") == ["adobe_2013"]
+            assert index.lookup("nobody@example.com") == []
+            assert "bob@example.com" in index
+            assert index.breach_ids == ["linkedin_2021", "adobe_2013"]
+
+    def test_duplicates_collapsed_across_runs(self, tmp_path: Path) -> None:
+        """Test the external sort merges spilled runs and drops duplicates."""
+        path = tmp_path / "breaches.idx"
+        emails = [f"user{i % 50}@example.com" for i in range(200)]
+
+        records = _build(path, {"dump": emails}, chunk_records=7)
+
+        with CredentialIndex(path) as index:
+            assert records == 50
+            assert all(index.lookup(f"user{i}@example.com") == ["dump"] for i in range(50))
+
+    def test_bloom_filter_rejects_most_misses(self, tmp_path: Path) -> None:
+        """Test absent keys are mostly rejected before the binary search."""
+        path = tmp_path / "breaches.idx"
+        _build(path, {"dump": [f"user{i}@example.com" for i in range(5_000)]})
+
+        with CredentialIndex(path) as index:
+            present = [email_key(f"user{i}@example.com") for i in range(5_000)]
+            absent = [email_key(f"other{i}@example.com") for i in range(5_000)]
+            assert all(index.might_contain(key) for key in present)
+            assert sum(index.might_contain(key) for key in absent) < 50
+
+    def test_dump_parsing(self, tmp_path: Path) -> None:
+        """Test email:password and CSV dump lines are parsed, junk skipped."""
+        dump = tmp_path / "dump.txt"
+        dump.write_text(
+            "alice@example.com:hunter2\n"
+            '"7","Bob@Example.com","5f4dcc3b"\n'
+            "no email here\n"
+            "carol@example.org\n"
+        )
+        builder = CredentialIndexBuilder(tmp_path / "breaches.idx")
+
+        added = builder.add_dump_file("forum_2020", dump)
+        builder.build()
+
+        assert added == 3
+        assert builder.skipped_lines == 1
+        with CredentialIndex(tmp_path / "breaches.idx") as index:
+            assert index.lookup("bob@example.com") == ["forum_2020"]
+
+    def test_empty_index(self, tmp_path: Path) -> None:
+        """Test an index with no records answers every lookup with a miss."""
+        path = tmp_path / "breaches.idx"
+        _build(path, {})
+
+        with CredentialIndex(path) as index:
+            assert len(index) == 0
+            assert index.lookup("jane@example.com") == []
+
+    def test_invalid_file_rejected(self, tmp_path: Path) -> None:
+        """Test files that are not indexes raise CredentialIndexError."""
+        empty = tmp_path / "empty.idx"
+        empty.write_bytes(b"")
+        garbage = tmp_path / "garbage.idx"
+        garbage.write_bytes(b"x" * 1_000_000)
+
+        with pytest.raises(CredentialIndexError):
+            CredentialIndex(empty)
+        with pytest.raises(CredentialIndexError, match="not a credential index"):
+            CredentialIndex(garbage)
+
+    def test_lookup_probes_few_records(self, tmp_path: Path) -> None:
+        """Test the fan-out table narrows each binary search to a few records."""
+        path = tmp_path / "breaches.idx"
+        _build(path, {"dump": (f"user{i}@example.com" for i in range(50_000))})
+
+        with CredentialIndex(path) as index:
+            counting = _counting(index)
+            queries = [f"user{i * 37}@example.com" for i in range(1_000)]
+            hits = sum(bool(index.lookup(email)) for email in queries)
+
+            # log2(50,000) ~ 16 probes without the fan-out; buckets hold ~1 record
+            assert hits == 1_000
+            assert counting.key_reads / len(queries) < 5
+
+    def test_misses_rejected_by_bloom_filter(self, tmp_path: Path) -> None:
+        """Test absent emails rarely reach the records."""
+        path = tmp_path / "breaches.idx"
+        _build(path, {"dump": (f"user{i}@example.com" for i in range(50_000))})
+
+        with CredentialIndex(path) as index:
+            counting = _counting(index)
+            queries = [f"other{i}@example.com" for i in range(1_000)]
+            hits = sum(bool(index.lookup(email)) for email in queries)
+
+            assert hits == 0
+            assert counting.bloom_reads <= len(queries) * index._bloom_hashes
+            # Only Bloom false positives (0.1% target) read a record key
+            assert counting.key_reads < 10
+
+    def test_command_line_import(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        """Test the bulk import tool builds an index from dump files."""
+        dump = tmp_path / "linkedin.txt"
+        dump.write_text("jane@example.com:pw\nbob@example.com:pw\n")
+        output = tmp_path / "breaches.idx"
+
+        assert main([str(output), "--dump", f"linkedin_2021={dump}"]) == 0
+
+        assert "Wrote 2 records" in capsys.readouterr().out
+        with CredentialIndex(output) as index:
+            assert index.lookup("bob@example.com") == ["linkedin_2021"]
+
+
+class TestProviderCredentialIndex:
+    """Tests for DarkWebProvider lookups through the index."""
+
+    async def test_exact_email_lookup(self, tmp_path: Path) -> None:
+        """Test credential leaks come from exact index matches."""
+        path = tmp_path / "breaches.idx"
+        _build(path, {"linkedin_2021": ["jane@example.com"], "unlisted_2024": ["jane@example.com"]})
+        provider = DarkWebProvider(DarkWebProviderConfig(credential_index_path=str(path)))
+
+        leaks = await provider.check_credential_leaks("jane@example.com")
+        misses = await provider.check_credential_leaks("someone@linkedin.com")
+
+        assert [leak.breach.breach_id for leak in leaks] == ["linkedin_2021", "unlisted_2024"]
+        assert leaks[0].breach.breach_name == "LinkedIn 2021"
+        assert leaks[1].breach.breach_name == "unlisted_2024"
+        assert misses == []
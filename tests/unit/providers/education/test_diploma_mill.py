@@ -1,5 +1,7 @@
 """Tests for diploma mill detection."""
 
+from difflib import SequenceMatcher
+
 import pytest
 
 from elile.providers.education.diploma_mill import (
@@ -276,6 +278,44 @@ class TestFuzzyMatching:
         assert not any("diploma mill database" in f.lower() for f in flags)
 
 
+class TestMillIndex:
+    """Tests for indexed fuzzy matching against known mills."""
+
+    def test_flags_match_linear_scan(self) -> None:
+        """Test the index flags exactly what comparing every mill would."""
+        detector = DiplomaMilDetector()
+        names = [
+            "Belfort University",
+            "Almeda Universty",
+            "Rochvile University",
+            "Stanford University",
+            "Hill Universities",
+            "University of Berkeley",
+            "Kennedy Western Univ",
+        ]
+
+        for name in names:
+            normalized = detector._normalize(name)
+            expected = [
+                mill
+                for mill in detector._normalized_mills
+                if SequenceMatcher(None, normalized, mill).ratio() > 0.92 and normalized != mill
+            ][:1]
+            fuzzy = [f for f in detector.check_institution(name) if "very similar" in f]
+            assert [f.split(": ")[1].rsplit(" (", 1)[0] for f in fuzzy] == expected
+
+    def test_custom_mills_and_refresh(self) -> None:
+        """Test the mill list can be supplied and refreshed."""
+        detector = DiplomaMilDetector(known_mills=["Quickdegree Academy"])
+        assert detector.check_institution("Quickdegree Academy")
+        assert not detector.check_institution("Belford University")
+
+        detector.refresh(["Belford University"])
+
+        assert detector.check_institution("Belford University")
+        assert not detector.check_institution("Quickdegree Academy")
+
+
 class TestNormalization:
     """Tests for name normalization in diploma mill detection."""
 
@@ -1,5 +1,7 @@
 """Tests for education provider institution and degree matching."""
 
+import random
+
 import pytest
 
 from elile.providers.education.matcher import (
@@ -417,3 +419,169 @@ class TestAbbreviationExpansion:
         """Test expanding '&' to 'and'."""
         variants = matcher.expand_abbreviations("Arts & Sciences")
         assert any("and" in v for v in variants)
+
+
+PLACES = [
+    "Ashford",
+    "Bellmont",
+    "Cedar",
+    "Dunmore",
+    "Eastlake",
+    "Fairview",
+    "Glenwood",
+    "Harbor",
+    "Ironwood",
+    "Jasper",
+    "Kingston",
+    "Lakeside",
+    "Maple",
+    "Northgate",
+    "Oakridge",
+    "Pinecrest",
+    "Quarry",
+    "Riverside",
+    "Summit",
+    "Tidewater",
+    "Upland",
+    "Valley",
+    "Westfield",
+    "York",
+    "Georgia",
+    "Ohio",
+    "Texas",
+    "Oregon",
+    "Saint Louis",
+]
+KINDS = [
+    "University",
+    "College",
+    "State University",
+    "Institute of Technology",
+    "Community College",
+    "Technical College",
+    "Polytechnic Institute",
+]
+
+
+def _institution_db(size: int, seed: int = 3) -> list[Institution]:
+    """Generate a reference database of plausible institution names."""
+    rng = random.Random(seed)
+    institutions = []
+    for i in range(size):
+        place = " ".join(rng.sample(PLACES, rng.choice([1, 1, 2])))
+        kind = rng.choice(KINDS)
+        name = f"University of {place}" if rng.random() < 0.2 else f"{place} {kind}"
+        initials = "".join(word[0] for word in name.split() if word[0].isupper())
+        institutions.append(
+            Institution(
+                institution_id=f"INST{i:05d}",
+                name=name,
+                aliases=[initials, name.replace("University", "Univ")],
+                type=InstitutionType.UNIVERSITY,
+            )
+        )
+    return institutions
+
+
+def _queries(institutions: list[Institution], seed: int = 5) -> list[str]:
+    """Generate exact, abbreviated, misspelled and unrelated queries."""
+    rng = random.Random(seed)
+    queries = ["University", "MIT", "Georgia Tech", "Ohio St Univ", "Cedar CC", "Nowhere XYZ"]
+    for institution in rng.sample(institutions, 12):
+        name = institution.name
+        position = rng.randrange(len(name))
+        queries.append(name)
+        queries.append(name[:position] + name[position + 1 :])
+        queries.append(institution.aliases[0])
+    return queries
+
+
+def _summary(results: list) -> list[tuple]:
+    return [(r.institution.institution_id, r.score, r.confidence, r.match_reasons) for r in results]
+
+
+@pytest.fixture(scope="module")
+def institutions() -> list[Institution]:
+    """Create a reference database shared by the index tests."""
+    return _institution_db(150)
+
+
+class TestInstitutionIndex:
+    """Tests for indexed institution lookups."""
+
+    @pytest.mark.parametrize("max_results", [1, 5])
+    def test_indexed_results_identical(
+        self, institutions: list[Institution], max_results: int
+    ) -> None:
+        """Test indexed lookups return exactly the linear scan's results."""
+        matcher = InstitutionMatcher()
+        matcher.build_index(institutions)
+
+        for query in _queries(institutions):
+            expected = matcher.find_matches(query, institutions, max_results=max_results)
+            actual = matcher.find_matches(query, max_results=max_results)
+            assert _summary(actual) == _summary(expected), query
+
+    def test_indexed_results_identical_custom_thresholds(
+        self, institutions: list[Institution]
+    ) -> None:
+        """Test equivalence holds for lower thresholds and small candidate limits."""
+        matcher = InstitutionMatcher(low_threshold=0.4, candidate_limit=2)
+        matcher.build_index(institutions)
+
+        for query in _queries(institutions)[:12]:
+            expected = matcher.find_matches(query, institutions, max_results=10)
+            assert _summary(matcher.find_matches(query, max_results=10)) == _summary(expected)
+
+    def test_match_single_uses_index(self, institutions: list[Institution]) -> None:
+        """Test match_single without a list searches the index."""
+        matcher = InstitutionMatcher()
+        matcher.build_index(institutions)
+
+        result = matcher.match_single(institutions[7].name)
+
+        assert result is not None
+        assert result.score == 1.0
+        assert matcher.indexed_count == 150
+
+    def test_rebuild_refreshes_index(self, institutions: list[Institution]) -> None:
+        """Test building again replaces the indexed institutions."""
+        matcher = InstitutionMatcher()
+        matcher.build_index(institutions[:10])
+        matcher.build_index(institutions[10:20])
+
+        result = matcher.match_single(institutions[15].name)
+
+        assert result is not None
+        assert result.institution.institution_id == institutions[15].institution_id
+        query = institutions[0].name
+        expected = matcher.find_matches(query, institutions[10:20], max_results=20)
+        assert _summary(matcher.find_matches(query, max_results=20)) == _summary(expected)
+
+    def test_empty_index(self) -> None:
+        """Test lookups before an index is built find nothing."""
+        assert InstitutionMatcher().find_matches("Harvard University") == []
+
+    def test_indexed_lookup_scores_fewer_candidates(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test match_single scores far fewer institutions than a linear scan."""
+        institutions = _institution_db(1_000, seed=11)
+        matcher = InstitutionMatcher()
+        matcher.build_index(institutions)
+        queries = [institution.name for institution in institutions[:4]]
+        scored = 0
+        match_institution = matcher._match_institution
+
+        def counting_match(query: str, institution: Institution):
+            nonlocal scored
+            scored += 1
+            return match_institution(query, institution)
+
+        monkeypatch.setattr(matcher, "_match_institution", counting_match)
+
+        indexed = [matcher.match_single(query) for query in queries]
+        indexed_scored, scored = scored, 0
+        linear = [matcher.match_single(query, institutions) for query in queries]
+
+        assert _summary(indexed) == _summary(linear)
+        assert scored == len(queries) * len(institutions)
+        assert indexed_scored * 5 < scored
@@ -16,6 +16,8 @@ from elile.providers.education.types import (
     ClaimedEducation,
     DegreeType,
     EducationProviderConfig,
+    Institution,
+    InstitutionType,
     MatchConfidence,
     VerificationStatus,
 )
@@ -65,6 +67,22 @@ class TestEducationProviderInit:
         provider = EducationProvider()
         assert len(provider._institutions_db) > 0
 
+    async def test_refresh_institution_index(self) -> None:
+        """Test institutions added to the database are found after a refresh."""
+        provider = EducationProvider()
+        institution = Institution(
+            institution_id="NEW001",
+            name="Quarry Hill Polytechnic Institute",
+            type=InstitutionType.UNIVERSITY,
+        )
+        provider._institutions_db[institution.institution_id] = institution
+
+        provider.refresh_institution_index()
+        info = await provider.check_institution("Quarry Hill Polytechnic Institute")
+
+        assert info["matched_institution"] == "Quarry Hill Polytechnic Institute"
+        assert info["match_score"] == 1.0
+
 
 class TestEducationProviderExecuteCheck:
     """Tests for EducationProvider.execute_check method."""
@@ -1,5 +1,9 @@
 """Tests for OSINT deduplicator."""
 
+import random
+import string
+from datetime import datetime, timedelta
+from difflib import SequenceMatcher
 from uuid import uuid7
 
 import pytest
@@ -9,6 +13,7 @@ from elile.providers.osint.deduplicator import (
     OSINTDeduplicator,
     create_deduplicator,
 )
+from elile.providers.osint.near_duplicates import CandidateIndex, MinHasher, SimilarText
 from elile.providers.osint.types import (
     NewsMention,
     OSINTSource,
@@ -331,3 +336,285 @@ class TestStringSimilarity:
         """Test similarity is case insensitive."""
         sim = deduplicator._string_similarity("HELLO", "hello")
         assert sim == 1.0
+
+
+def _news_corpus(size: int, seed: int = 7) -> list[NewsMention]:
+    """News mentions about one subject with syndicated near-duplicates."""
+    rng = random.Random(seed)
+    vocabulary = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(2_000)
+    ]
+    published = datetime(2024, 1, 1)
+    mentions: list[NewsMention] = []
+    originals: list[NewsMention] = []
+    while len(mentions) < size:
+        if mentions and rng.random() < 0.3:
+            original = rng.choice(originals)
+            headline = list(original.headline)
+            for _ in range(rng.randint(1, 3)):
+                headline[rng.randrange(len(headline))] = rng.choice(string.ascii_lowercase)
+            mentions.append(
+                original.model_copy(
+                    update={
+                        "mention_id": uuid7(),
+                        "headline": "".join(headline),
+                        "url": f"https://example.com/{len(mentions)}",
+                    }
+                )
+            )
+            continue
+        words = " ".join(rng.choices(vocabulary, k=rng.randint(5, 9)))
+        originals.append(
+            NewsMention(
+                mention_id=uuid7(),
+                source=OSINTSource.NEWS_WIRE,
+                headline=f"Jane Doe {words}",
+                snippet=f"...{' '.join(rng.choices(vocabulary, k=8))}...",
+                url=f"https://example.com/{len(mentions)}",
+                published_at=published + timedelta(days=rng.randint(0, 365)),
+            )
+        )
+        mentions.append(originals[-1])
+    return mentions
+
+
+def _group_signature(result: DeduplicationResult) -> list[tuple]:
+    return [(g.canonical_item_id, tuple(g.duplicate_item_ids)) for g in result.duplicate_groups]
+
+
+def _short_name_profiles(size: int, seed: int) -> list[SocialMediaProfile]:
+    """Profiles with short, overlapping names that share few shingles."""
+    rng = random.Random(seed)
+    first = ["Ann", "Anna", "Jon", "John", "Jane", "Janet", "Li", "Lee", "Mark", "Marc"]
+    last = ["Li", "Lee", "Smith", "Smyth", "Doe", "Dow", "Garcia", "Garza"]
+    bios = ["Engineer at Acme", "Engineer at Acme Corp", "Chef", "Painter and writer", None]
+    return [
+        SocialMediaProfile(
+            profile_id=uuid7(),
+            source=rng.choice([OSINTSource.TWITTER, OSINTSource.GITHUB]),
+            username=f"user{index}",
+            display_name=f"{rng.choice(first)} {rng.choice(last)}",
+            location=rng.choice(["Austin", "Boston", None]),
+            bio=rng.choice(bios),
+        )
+        for index in range(size)
+    ]
+
+
+def _scattered_edit(text: str, rng: random.Random, low: float, high: float) -> str:
+    """Edit characters across ``text`` until its similarity lands in [low, high)."""
+    while True:
+        chars = list(text)
+        while True:
+            position = rng.randrange(len(chars))
+            operation = rng.random()
+            if operation < 0.4:
+                chars[position] = rng.choice(string.ascii_lowercase)
+            elif operation < 0.7:
+                chars.insert(position, rng.choice(string.ascii_lowercase))
+            else:
+                del chars[position]
+            ratio = SequenceMatcher(None, text.lower(), "".join(chars).lower()).ratio()
+            if ratio < low:
+                break  # Overshot: start again from the original
+            if ratio < high:
+                return "".join(chars)
+
+
+class TestNearDuplicates:
+    """Tests for MinHash signatures and the candidate index."""
+
+    def test_signature_is_deterministic(self) -> None:
+        """Test identical text gets identical signatures across hashers."""
+        text = "Jane Doe appointed to the board of Acme Corp"
+        assert MinHasher().signature(text) == MinHasher().signature(text.upper())
+        assert MinHasher().signature("   ") is None
+
+    def test_near_duplicates_share_a_band(self) -> None:
+        """Test a lightly edited headline collides in at least one band."""
+        hasher = MinHasher()
+        original = set(hasher.band_keys("h", "Jane Doe appointed to the board of Acme Corp"))
+        edited = set(hasher.band_keys("h", "Jane Doe appointed to the board of Acme Corp."))
+        unrelated = set(hasher.band_keys("h", "Quarterly earnings beat analyst expectations"))
+
+        assert original & edited
+        assert not original & unrelated
+
+    def test_syndicated_copies_rarely_missed(self) -> None:
+        """Test copies with a few substituted characters almost always share a band."""
+        hasher = MinHasher()
+        missed = 0
+        for original in _news_corpus(300, seed=3):
+            headline = list(original.headline)
+            rng = random.Random(original.headline)
+            for _ in range(rng.randint(1, 3)):
+                headline[rng.randrange(len(headline))] = rng.choice(string.ascii_lowercase)
+            keys = set(hasher.band_keys("h", original.headline))
+            missed += not keys & set(hasher.band_keys("h", "".join(headline)))
+
+        assert missed / 300 <= 0.01
+
+    @pytest.mark.parametrize(
+        ("low", "high", "max_miss_rate"),
+        [(0.95, 1.0, 0.0), (0.9, 0.95, 0.03), (0.85, 0.9, 0.3)],
+    )
+    def test_lsh_miss_rate_near_threshold(
+        self, low: float, high: float, max_miss_rate: float
+    ) -> None:
+        """Test how often pairs with scattered edits fail to share a band.
+
+        LSH recall follows shingle overlap rather than SequenceMatcher
+        ratio, so pairs just above the threshold can be missed.
+        """
+        hasher = MinHasher()
+        rng = random.Random(17)
+        pairs = 300
+        missed = 0
+        for mention in _news_corpus(pairs, seed=5):
+            edited = _scattered_edit(mention.headline, rng, low, high)
+            keys = set(hasher.band_keys("h", mention.headline))
+            missed += not keys & set(hasher.band_keys("h", edited))
+
+        assert missed / pairs <= max_miss_rate
+
+    def test_candidate_index(self) -> None:
+        """Test items sharing a key are candidates of each other."""
+        index = CandidateIndex()
+        index.add(0, ["a", "b"])
+        index.add(1, ["b"])
+        index.add(2, ["c"])
+
+        assert index.candidates(0) == [1]
+        assert index.candidates(1) == [0]
+        assert index.candidates(2) == []
+
+    def test_similar_text_keys(self) -> None:
+        """Test texts that may reach the threshold share a prefix key."""
+        index = CandidateIndex()
+        for item, name in enumerate(["Ann Li", "Anna Li", "Bob Stone", "Ann Li"]):
+            scope = "other" if item == 3 else "name"
+            index.add(item, [SimilarText(scope, ((name, 0.85),))])
+
+        assert index.candidates(0) == [1]
+        assert index.candidates(2) == []
+        assert index.candidates(3) == []
+
+
+class TestLSHDeduplication:
+    """Tests for LSH candidate selection in OSINTDeduplicator."""
+
+    def test_news_groups_match_all_pairs(self) -> None:
+        """Test LSH produces the same groups as comparing all pairs."""
+        mentions = _news_corpus(400)
+
+        exact = OSINTDeduplicator(lsh_min_items=10**9).deduplicate_news(mentions)
+        lsh = OSINTDeduplicator(lsh_min_items=0).deduplicate_news(mentions)
+
+        assert exact.duplicates_removed > 50
+        assert _group_signature(lsh) == _group_signature(exact)
+        assert [m.mention_id for m in lsh.items] == [m.mention_id for m in exact.items]
+        assert lsh.comparisons < exact.comparisons / 10
+
+    def test_exact_signals_always_candidates(self) -> None:
+        """Test exact-key matches are found without any text similarity."""
+        records = [
+            PublicRecord(
+                record_id=uuid7(),
+                source=OSINTSource.COURT_RECORDS,
+                record_type="Court Record",
+                title=title,
+                case_number="CA-1234-567",
+                jurisdiction="California",
+            )
+            for title in ("Smith v. Jones", "Unrelated caption entirely")
+        ]
+        infos = [
+            ProfessionalInfo(
+                info_id=uuid7(),
+                source=source,
+                current_title="CTO",
+                current_company="Acme",
+            )
+            for source in (OSINTSource.LINKEDIN, OSINTSource.CRUNCHBASE)
+        ]
+        deduplicator = OSINTDeduplicator(lsh_min_items=0)
+
+        assert deduplicator.deduplicate_records(records).duplicates_removed == 1
+        assert deduplicator.deduplicate_professional(infos).duplicates_removed == 1
+
+    def test_profiles_match_all_pairs(self) -> None:
+        """Test profile groups match all-pairs comparison."""
+        rng = random.Random(3)
+        names = ["Jane Doe", "Jane A. Doe", "John Smith", "Maria Garcia", "Li Wei"]
+        profiles = [
+            SocialMediaProfile(
+                profile_id=uuid7(),
+                source=rng.choice([OSINTSource.TWITTER, OSINTSource.GITHUB]),
+                username=f"user{rng.randint(0, 150)}",
+                display_name=rng.choice(names),
+                location=rng.choice(["Austin, TX", "Boston, MA", None]),
+            )
+            for _ in range(300)
+        ]
+
+        exact = OSINTDeduplicator(lsh_min_items=10**9).deduplicate_profiles(profiles)
+        lsh = OSINTDeduplicator(lsh_min_items=0).deduplicate_profiles(profiles)
+
+        assert _group_signature(lsh) == _group_signature(exact)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_short_names_match_all_pairs(self, seed: int) -> None:
+        """Test short names that share few shingles are still compared."""
+        profiles = _short_name_profiles(300, seed)
+
+        exact = OSINTDeduplicator(lsh_min_items=10**9).deduplicate_profiles(profiles)
+        candidates = OSINTDeduplicator(lsh_min_items=0).deduplicate_profiles(profiles)
+
+        assert _group_signature(candidates) == _group_signature(exact)
+        assert [p.profile_id for p in candidates.items] == [p.profile_id for p in exact.items]
+        assert candidates.comparisons < exact.comparisons
+
+    def test_records_match_all_pairs(self) -> None:
+        """Test record groups match all-pairs comparison."""
+        rng = random.Random(11)
+        titles = ["Smith v. Jones", "Smith v Jones", "In re Doe", "In re: Doe", "State v. Li"]
+        records = [
+            PublicRecord(
+                record_id=uuid7(),
+                source=OSINTSource.COURT_RECORDS,
+                record_type="Court Record",
+                title=rng.choice(titles),
+                filing_date=datetime(2024, 1, rng.randint(1, 3)),
+            )
+            for _ in range(200)
+        ]
+
+        exact = OSINTDeduplicator(lsh_min_items=10**9).deduplicate_records(records)
+        candidates = OSINTDeduplicator(lsh_min_items=0).deduplicate_records(records)
+
+        assert _group_signature(candidates) == _group_signature(exact)
+
+    def test_low_threshold_matches_all_pairs(self) -> None:
+        """Test thresholds below the LSH minimum still find every match."""
+        mentions = _news_corpus(100)
+
+        exact = OSINTDeduplicator(similarity_threshold=0.5, lsh_min_items=10**9)
+        candidates = OSINTDeduplicator(similarity_threshold=0.5, lsh_min_items=0)
+
+        assert _group_signature(candidates.deduplicate_news(mentions)) == _group_signature(
+            exact.deduplicate_news(mentions)
+        )
+
+
+class TestDeduplicationScaling:
+    """Scaling of news deduplication with corpus size.
+
+    Wall-clock timings live in the osint_deduplicator benchmarks.
+    """
+
+    @pytest.mark.parametrize("size", [100, 400, 1_000, 5_000])
+    def test_comparisons_grow_subquadratically(self, size: int) -> None:
+        """Test the number of checked pairs stays far below all pairs."""
+        result = OSINTDeduplicator(lsh_min_items=0).deduplicate_news(_news_corpus(size))
+
+        assert result.comparisons < size * 10
@@ -9,6 +9,10 @@ from elile.providers.osint.entity_extractor import (
     RelationshipExtractor,
     create_entity_extractor,
     create_relationship_extractor,
+    get_scan_pool,
+    scan_text,
+    scan_texts,
+    scan_texts_async,
 )
 from elile.providers.osint.types import (
     EntityType,
@@ -247,6 +251,140 @@ class TestEntityExtractor:
         assert len(extractor._entity_cache) == 0
 
 
+class TestTextScanner:
+    """Tests for the single-pass text scanner."""
+
+    TEXT = (
+        "On March 3, 2024 Jane (jane.doe@example.com, @janedoe) paid $2,500,000. "
+        "Call 415-555-1234 or see https://news.example.org/story on 2024-03-05."
+    )
+
+    def test_scan_finds_every_type_in_text_order(self) -> None:
+        """Test one scan reports type, span and context for each match."""
+        matches = scan_text(self.TEXT)
+
+        assert [(m.entity_type, m.value) for m in matches] == [
+            (EntityType.DATE, "March 3, 2024"),
+            (EntityType.EMAIL, "jane.doe@example.com"),
+            (EntityType.SOCIAL_HANDLE, "@janedoe"),
+            (EntityType.MONEY, "$2,500,000"),
+            (EntityType.PHONE, "415-555-1234"),
+            (EntityType.URL, "https://news.example.org/story"),
+            (EntityType.DATE, "2024-03-05"),
+        ]
+        for match in matches:
+            assert self.TEXT[match.start : match.end] == match.value
+            assert match.value in match.context
+
+    def test_overlapping_matches_reported_once(self) -> None:
+        """Test an email is not also reported as a handle, nor a URL as a phone."""
+        matches = scan_text("mail a.b@corp.com or https://x.com/4155551234")
+
+        assert [m.entity_type for m in matches] == [EntityType.EMAIL, EntityType.URL]
+
+    def test_matches_separate_pattern_passes(self) -> None:
+        """Test the scan reports what one pass per pattern did, minus overlaps.
+
+        Every match of the separate passes is reported, unless it overlaps
+        a match of an earlier alternative (a handle inside an email, a
+        phone number inside a URL).
+        """
+        patterns = [
+            (EntityType.EMAIL, EntityExtractor.EMAIL_PATTERN),
+            (EntityType.PHONE, EntityExtractor.PHONE_PATTERN),
+            (EntityType.URL, EntityExtractor.URL_PATTERN),
+            (EntityType.SOCIAL_HANDLE, EntityExtractor.SOCIAL_HANDLE_PATTERN),
+            (EntityType.MONEY, EntityExtractor.MONEY_PATTERN),
+            *((EntityType.DATE, pattern) for pattern in EntityExtractor.DATE_PATTERNS),
+        ]
+        texts = [
+            self.TEXT,
+            "mail a.b@corp.com or https://x.com/4155551234",
+            "@ceo of https://example.com/@team since 01/02/2020, paid $40 million",
+            "call +1 (415) 555-1234 on 2024-01-31 or 415.555.9876 via bob@mail.example.io",
+        ]
+        for text in texts:
+            separate = {
+                (entity_type, m.start(), m.end())
+                for entity_type, pattern in patterns
+                for m in pattern.finditer(text)
+            }
+            scanned = {(m.entity_type, m.start, m.end) for m in scan_text(text)}
+
+            assert scanned <= separate
+            for _, start, end in separate - scanned:
+                assert any(s < end and start < e for _, s, e in scanned)
+
+    def test_context_window(self) -> None:
+        """Test context is clipped to the window around the match."""
+        text = "x" * 100 + " test@example.com " + "y" * 100
+
+        (match,) = scan_text(text, window=5)
+
+        assert match.context == "xxxx test@example.com yyyy"
+
+    def test_parallel_batch_matches_inline(self) -> None:
+        """Test the process pool returns the same matches in input order."""
+        texts = [f"{self.TEXT} #{i} user{i}@example.com" for i in range(40)]
+
+        parallel = scan_texts(texts, max_workers=2, min_parallel_chars=0)
+
+        assert parallel == [scan_text(text) for text in texts]
+
+    async def test_async_batch_uses_shared_pool(self) -> None:
+        """Test async scans reuse one pool whose workers are not forked."""
+        texts = [f"{self.TEXT} user{i}@example.com" for i in range(40)]
+
+        first = await scan_texts_async(texts, max_workers=2, min_parallel_chars=0)
+        second = await scan_texts_async(texts[::-1], max_workers=2, min_parallel_chars=0)
+
+        assert first == [scan_text(text) for text in texts]
+        assert second == first[::-1]
+        assert get_scan_pool() is get_scan_pool(max_workers=8)
+        assert get_scan_pool()._mp_context.get_start_method() in ("forkserver", "spawn")
+
+    def test_extractor_prescans_large_batches(self) -> None:
+        """Test extraction results do not depend on parallel scanning."""
+        mentions = [
+            NewsMention(
+                mention_id=uuid7(),
+                source=OSINTSource.NEWS_WIRE,
+                headline=f"Story {i}",
+                snippet=f"{self.TEXT} contact{i}@example.com",
+            )
+            for i in range(20)
+        ]
+
+        inline = EntityExtractor().extract_from_news(mentions)
+        parallel = EntityExtractor(max_workers=2, parallel_min_chars=0).extract_from_news(mentions)
+
+        def summary(entities: list) -> list[tuple]:
+            return [(e.entity_type, e.name, e.context_snippets) for e in entities]
+
+        assert summary(parallel) == summary(inline)
+        assert sum(e.entity_type == EntityType.EMAIL for e in inline) == 21
+
+    async def test_prescan_matches_reused(self) -> None:
+        """Test prescanned matches are used by the following extraction."""
+        mentions = [
+            NewsMention(
+                mention_id=uuid7(),
+                source=OSINTSource.NEWS_WIRE,
+                headline=f"Story {i}",
+                snippet=f"{self.TEXT} contact{i}@example.com",
+            )
+            for i in range(20)
+        ]
+        extractor = EntityExtractor(max_workers=2, parallel_min_chars=0)
+
+        await extractor.prescan(mentions)
+
+        assert len(extractor._scanned) == 40
+        entities = extractor.extract_from_news(mentions)
+        assert not extractor._scanned
+        assert sum(e.entity_type == EntityType.EMAIL for e in entities) == 21
+
+
 class TestEntityTypeInference:
     """Tests for entity type inference."""
 
@@ -1,5 +1,6 @@
 """Tests for OSINT aggregator provider."""
 
+import asyncio
 from decimal import Decimal
 
 import pytest
@@ -454,3 +455,122 @@ class TestDeterministicResults:
         # Results may differ (though not guaranteed due to random seed)
         # At minimum, subject names should differ
         assert result1.subject_name != result2.subject_name
+
+
+class TestConcurrentSourceFanOut:
+    """Tests for concurrent source searches in gather_intelligence.
+
+    End-to-end latency with slow sources is measured by the
+    ``osint.gather_intelligence`` benchmarks in tests/benchmarks/bench_providers.py.
+    """
+
+    @staticmethod
+    def _slow(search, delay: float):
+        async def slow_search(subject_name: str, identifiers: list[str]):
+            await asyncio.sleep(delay)
+            return await search(subject_name, identifiers)
+
+        return slow_search
+
+    def _slow_sources(self, provider: OSINTProvider, delay: float) -> None:
+        for name in (
+            "_search_social_media",
+            "_search_news",
+            "_search_public_records",
+            "_search_professional",
+        ):
+            setattr(provider, name, self._slow(getattr(provider, name), delay))
+
+    @pytest.mark.asyncio
+    async def test_sources_run_concurrently(self) -> None:
+        """Test every source search is in flight before any of them finishes."""
+        provider = OSINTProvider()
+        self._slow_sources(provider, 0.15)
+        in_flight = 0
+        peak = 0
+
+        def tracked(search):
+            async def tracked_search(subject_name: str, identifiers: list[str]):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                try:
+                    return await search(subject_name, identifiers)
+                finally:
+                    in_flight -= 1
+
+            return tracked_search
+
+        for name in (
+            "_search_social_media",
+            "_search_news",
+            "_search_public_records",
+            "_search_professional",
+        ):
+            setattr(provider, name, tracked(getattr(provider, name)))
+
+        result = await provider.gather_intelligence(subject_name="Slow Sources", identifiers=[])
+
+        assert peak == 4
+        assert set(result.source_latencies_ms) == {
+            "social_media",
+            "news",
+            "public_records",
+            "professional",
+        }
+        assert all(ms >= 150 for ms in result.source_latencies_ms.values())
+
+    @pytest.mark.asyncio
+    async def test_timed_out_source_returns_partial_results(self) -> None:
+        """Test a slow source is cancelled and the rest are returned."""
+        provider = OSINTProvider(OSINTProviderConfig(source_timeouts_ms={"news": 20}))
+        provider._search_news = self._slow(provider._search_news, 5.0)
+        baseline = await OSINTProvider().gather_intelligence(
+            subject_name="Partial Results", identifiers=[]
+        )
+
+        result = await provider.gather_intelligence(subject_name="Partial Results", identifiers=[])
+
+        assert result.timed_out_sources == ["news"]
+        assert result.news_mentions == []
+        assert any("News search timed out" in error for error in result.errors)
+        assert len(result.social_profiles) == len(baseline.social_profiles)
+        assert len(result.professional_info) == len(baseline.professional_info)
+
+    @pytest.mark.asyncio
+    async def test_results_processed_as_sources_arrive(self) -> None:
+        """Test dedup runs on fast sources while slow ones are in flight."""
+        provider = OSINTProvider()
+        profiles_deduped = asyncio.Event()
+        dedupe_profiles = provider._deduplicator.deduplicate_profiles
+
+        def tracking_dedupe(profiles):
+            profiles_deduped.set()
+            return dedupe_profiles(profiles)
+
+        async def news_after_profiles(subject_name: str, identifiers: list[str]):  # noqa: ARG001
+            await asyncio.wait_for(profiles_deduped.wait(), timeout=2.0)
+            return []
+
+        provider._deduplicator.deduplicate_profiles = tracking_dedupe
+        provider._search_news = news_after_profiles
+
+        result = await provider.gather_intelligence(subject_name="Streaming Test", identifiers=[])
+
+        assert result.errors == []
+
+    @pytest.mark.asyncio
+    async def test_failed_source_reported(self) -> None:
+        """Test a failing source is reported without affecting others."""
+        provider = OSINTProvider()
+
+        async def failing_search(subject_name: str, identifiers: list[str]):  # noqa: ARG001
+            raise ConnectionError("registry unavailable")
+
+        provider._search_public_records = failing_search
+
+        result = await provider.gather_intelligence(subject_name="Failure Test", identifiers=[])
+
+        assert result.errors == ["Public records search failed: registry unavailable"]
+        assert result.timed_out_sources == []
+        assert "public_records" in result.source_latencies_ms
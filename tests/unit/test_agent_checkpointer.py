@@ -0,0 +1,299 @@
+"""Tests for the durable LangGraph checkpoint saver.
+
+Tests cover:
+- Put/get round trips through full and delta channel blobs
+- Delta chain limits and continuing chains after a restart
+- Pending writes, listing and thread deletion
+- State reducers used by the iterative search graph
+- Resuming an interrupted iterative search run
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.errors import GraphRecursionError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from elile.agent.checkpointer import PostgresCheckpointSaver
+from elile.agent.graph import compile_iterative_search_graph
+from elile.agent.state import (
+    InformationType,
+    SubjectInfo,
+    TypeProgress,
+    append_items,
+    merge_type_progress,
+)
+from elile.db.models import AgentCheckpoint, AgentCheckpointBlob, AgentCheckpointWrite
+from elile.db.models.base import Base
+
+
+@pytest.fixture
+async def checkpoint_engine(tmp_path: Path) -> AsyncEngine:
+    """File-backed SQLite engine with the checkpoint tables."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'checkpoints.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[
+                AgentCheckpoint.__table__,
+                AgentCheckpointBlob.__table__,
+                AgentCheckpointWrite.__table__,
+            ],
+        )
+    yield engine
+    await engine.dispose()
+
+
+def _saver(engine: AsyncEngine, **kwargs) -> PostgresCheckpointSaver:
+    return PostgresCheckpointSaver(async_sessionmaker(engine, expire_on_commit=False), **kwargs)
+
+
+async def _put_step(
+    saver: PostgresCheckpointSaver,
+    config: dict,
+    values: dict,
+    versions: dict,
+    step: int,
+) -> dict:
+    """Put a checkpoint where every channel in ``values`` changed."""
+    new_versions = {
+        channel: saver.get_next_version(versions.get(channel), None) for channel in values
+    }
+    versions.update(new_versions)
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = dict(values)
+    checkpoint["channel_versions"] = dict(versions)
+    return await saver.aput(
+        config, checkpoint, {"source": "loop", "step": step, "parents": {}}, new_versions
+    )
+
+
+async def _grow(saver: PostgresCheckpointSaver, steps: int, thread_id: str = "t1") -> tuple:
+    """Put ``steps`` checkpoints with a growing list and a partially changing dict."""
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    versions: dict = {}
+    findings: list = []
+    progress: dict = {f"type-{i}": {"iterations": 0} for i in range(10)}
+    for step in range(steps):
+        findings = append_items(findings, [{"step": step, "text": "x" * 200}])
+        progress = merge_type_progress(progress, {"type-0": {"iterations": step}})
+        config = await _put_step(
+            saver, config, {"findings": findings, "progress": progress}, versions, step
+        )
+    return config, findings, progress
+
+
+class TestReducers:
+    """Tests for the IterativeSearchState reducers."""
+
+    def test_append_items_returns_new_list(self) -> None:
+        """Test appending does not mutate the existing list."""
+        existing = [1, 2]
+        result = append_items(existing, [3])
+        assert result == [1, 2, 3]
+        assert existing == [1, 2]
+        assert append_items(None, None) == []
+
+    def test_merge_type_progress_replaces_changed_keys(self) -> None:
+        """Test merge keeps unchanged entries and replaces updated ones."""
+        pending = TypeProgress(info_type=InformationType.IDENTITY)
+        other = TypeProgress(info_type=InformationType.EMPLOYMENT)
+        done = pending.model_copy(update={"status": "complete"})
+
+        result = merge_type_progress({"identity": pending, "employment": other}, {"identity": done})
+
+        assert result["identity"] is done
+        assert result["employment"] is other
+
+
+class TestPostgresCheckpointSaver:
+    """Tests for PostgresCheckpointSaver."""
+
+    async def test_round_trip_uses_deltas(self, checkpoint_engine: AsyncEngine) -> None:
+        """Test growing channels are stored as deltas and reload exactly."""
+        saver = _saver(checkpoint_engine)
+
+        config, findings, progress = await _grow(saver, 20)
+
+        assert saver.stats.full_blobs == 2
+        assert saver.stats.delta_blobs == 38
+
+        loaded = await _saver(checkpoint_engine).aget_tuple(config)
+        assert loaded is not None
+        assert loaded.checkpoint["channel_values"] == {"findings": findings, "progress": progress}
+        assert loaded.metadata["step"] == 19
+        assert loaded.parent_config is not None
+
+    async def test_per_step_bytes_stay_flat(self, checkpoint_engine: AsyncEngine) -> None:
+        """Test checkpoint size does not grow with accumulated state."""
+        saver = _saver(checkpoint_engine, max_delta_chain=1000)
+        config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+        versions: dict = {}
+        findings: list = []
+        sizes = []
+        for step in range(60):
+            findings = append_items(findings, [{"step": step, "text": "x" * 200}])
+            config = await _put_step(saver, config, {"findings": findings}, versions, step)
+            sizes.append(saver.stats.last_checkpoint_bytes)
+
+        assert sizes[-1] < sizes[1] * 1.5
+
+    async def test_delta_chain_is_bounded(self, checkpoint_engine: AsyncEngine) -> None:
+        """Test a full snapshot is forced after max_delta_chain deltas."""
+        saver = _saver(checkpoint_engine, max_delta_chain=4)
+
+        config, findings, _ = await _grow(saver, 11)
+
+        # Each channel: full, 4 deltas, full, 4 deltas, full
+        assert saver.stats.full_blobs == 6
+        loaded = await saver.aget_tuple(config)
+        assert loaded.checkpoint["channel_values"]["findings"] == findings
+
+    async def test_older_checkpoints_remain_readable(self, checkpoint_engine: AsyncEngine) -> None:
+        """Test any checkpoint in a delta chain can be loaded by ID."""
+        saver = _saver(checkpoint_engine)
+        await _grow(saver, 5)
+
+        tuples = [t async for t in saver.alist({"configurable": {"thread_id": "t1"}})]
+
+        assert [t.metadata["step"] for t in tuples] == [4, 3, 2, 1, 0]
+        oldest = await saver.aget_tuple(tuples[-1].config)
+        assert len(oldest.checkpoint["channel_values"]["findings"]) == 1
+
+    async def test_restart_continues_delta_chain(self, checkpoint_engine: AsyncEngine) -> None:
+        """Test a new saver resumes deltas from loaded values."""
+        config, findings, progress = await _grow(_saver(checkpoint_engine), 3)
+
+        saver = _saver(checkpoint_engine)
+        loaded = await saver.aget_tuple(config)
+        values = loaded.checkpoint["channel_values"]
+        versions = dict(loaded.checkpoint["channel_versions"])
+        values["findings"] = append_items(values["findings"], [{"step": 3}])
+        config = await _put_step(saver, loaded.config, values, versions, 3)
+
+        assert saver.stats.full_blobs == 0
+        reloaded = await _saver(checkpoint_engine).aget_tuple(config)
+        assert reloaded.checkpoint["channel_values"]["findings"] == [*findings, {"step": 3}]
+        assert reloaded.checkpoint["channel_values"]["progress"] == progress
+
+    async def test_pending_writes(self, checkpoint_engine: AsyncEngine) -> None:
+        """Test writes are returned with their checkpoint."""
+        saver = _saver(checkpoint_engine)
+        config, _, _ = await _grow(saver, 1)
+
+        await saver.aput_writes(config, [("findings", ["a"]), ("progress", {"b": 1})], "task-1")
+        await saver.aput_writes(config, [("findings", ["dup"])], "task-1")
+
+        loaded = await saver.aget_tuple(config)
+        assert loaded.pending_writes == [
+            ("task-1", "findings", ["a"]),
+            ("task-1", "progress", {"b": 1}),
+        ]
+
+    async def test_list_filter_and_limit(self, checkpoint_engine: AsyncEngine) -> None:
+        """Test listing honours metadata filters, before and limit."""
+        saver = _saver(checkpoint_engine)
+        await _grow(saver, 6)
+        thread = {"configurable": {"thread_id": "t1"}}
+
+        filtered = [t async for t in saver.alist(thread, filter={"step": 2})]
+        limited = [t async for t in saver.alist(thread, limit=2)]
+        before = [t async for t in saver.alist(thread, before=limited[0].config, limit=1)]
+
+        assert [t.metadata["step"] for t in filtered] == [2]
+        assert [t.metadata["step"] for t in limited] == [5, 4]
+        assert [t.metadata["step"] for t in before] == [4]
+
+    async def test_delete_thread(self, checkpoint_engine: AsyncEngine) -> None:
+        """Test deleting a thread removes only its checkpoints."""
+        saver = _saver(checkpoint_engine)
+        config, _, _ = await _grow(saver, 2, thread_id="t1")
+        other, _, _ = await _grow(saver, 2, thread_id="t2")
+
+        await saver.adelete_thread("t1")
+
+        assert await saver.aget_tuple({"configurable": {"thread_id": "t1"}}) is None
+        assert await saver.aget_tuple(other) is not None
+
+    async def test_cached_delta_bases_are_bounded(self, checkpoint_engine: AsyncEngine) -> None:
+        """Test only the most recently written channels keep a delta base."""
+        saver = _saver(checkpoint_engine, max_cached_channels=2)
+
+        await _grow(saver, 2, thread_id="t1")
+        config, findings, _ = await _grow(saver, 2, thread_id="t2")
+
+        assert list(saver._heads) == [("t2", "", "findings"), ("t2", "", "progress")]
+        loaded = await saver.aget_tuple(config)
+        assert loaded.checkpoint["channel_values"]["findings"] == findings
+
+    async def test_evicted_channel_writes_full_snapshot(
+        self, checkpoint_engine: AsyncEngine
+    ) -> None:
+        """Test a channel without a cached base is stored in full and reloads exactly."""
+        saver = _saver(checkpoint_engine, max_cached_channels=1)
+
+        config, findings, progress = await _grow(saver, 5)
+
+        # Only one of the two channels keeps its base between steps
+        assert saver.stats.full_blobs == 6
+        loaded = await _saver(checkpoint_engine).aget_tuple(config)
+        assert loaded.checkpoint["channel_values"] == {"findings": findings, "progress": progress}
+
+    def test_sync_api(self, checkpoint_engine: AsyncEngine) -> None:
+        """Test the sync methods run the async API on the saver's own loop."""
+        saver = _saver(checkpoint_engine)
+        config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+        versions = {"findings": saver.get_next_version(None, None)}
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {"findings": ["a"]}
+        checkpoint["channel_versions"] = dict(versions)
+
+        stored = saver.put(config, checkpoint, {"source": "input", "step": 0}, versions)
+        saver.put_writes(stored, [("findings", ["b"])], "task-1")
+
+        loaded = saver.get_tuple(stored)
+        assert loaded.checkpoint["channel_values"] == {"findings": ["a"]}
+        assert loaded.pending_writes == [("task-1", "findings", ["b"])]
+        assert [t.config for t in saver.list({"configurable": {"thread_id": "t1"}})] == [
+            loaded.config
+        ]
+
+        saver.delete_thread("t1")
+        assert saver.get_tuple({"configurable": {"thread_id": "t1"}}) is None
+
+    async def test_sync_api_on_driving_loop_rejected(self, checkpoint_engine: AsyncEngine) -> None:
+        """Test sync calls on the loop running the saver fail instead of deadlocking."""
+        saver = _saver(checkpoint_engine)
+        await _grow(saver, 1)
+
+        with pytest.raises(asyncio.InvalidStateError):
+            saver.get_tuple({"configurable": {"thread_id": "t1"}})
+
+    async def test_sync_api_from_worker_thread(self, checkpoint_engine: AsyncEngine) -> None:
+        """Test sync calls from another thread run on the loop driving the saver."""
+        saver = _saver(checkpoint_engine)
+        config, findings, _ = await _grow(saver, 2)
+
+        loaded = await asyncio.to_thread(saver.get_tuple, config)
+
+        assert loaded.checkpoint["channel_values"]["findings"] == findings
+        assert saver._sync_loop is None
+
+
+class TestIterativeSearchResume:
+    """Tests for durable execution of the iterative search graph."""
+
+    async def test_resume_after_interruption(self, checkpoint_engine: AsyncEngine) -> None:
+        """Test an interrupted run resumes from its last checkpoint."""
+        config = {"configurable": {"thread_id": "screening-1"}, "recursion_limit": 10}
+        graph = compile_iterative_search_graph(checkpointer=_saver(checkpoint_engine))
+        with pytest.raises(GraphRecursionError):
+            await graph.ainvoke({"subject": SubjectInfo(full_name="Jane Doe")}, config)
+
+        resumed = compile_iterative_search_graph(checkpointer=_saver(checkpoint_engine))
+        result = await resumed.ainvoke(None, {**config, "recursion_limit": 500})
+
+        assert result["final_report"] is not None
+        assert result["type_progress"]["identity"].status == "complete"
@@ -0,0 +1,211 @@
+"""Tests for the parallel type fan-out mode of the iterative search graph.
+
+Tests cover:
+- Knowledge base and inconsistency merge reducers
+- Fan-out routing for parallel and sequential phases
+- Concurrent execution of a phase's types and equivalence with sequential mode
+
+Wall-clock comparisons of the two modes live in tests/benchmarks (bench_agent).
+"""
+
+import asyncio
+from datetime import date
+
+import pytest
+from langgraph.types import Send
+
+from elile.agent import graph as graph_module
+from elile.agent import nodes
+from elile.agent.graph import compile_iterative_search_graph, route_type_fan_out
+from elile.agent.state import (
+    PHASE_TYPES,
+    Address,
+    Inconsistency,
+    InconsistencyType,
+    InformationType,
+    KnowledgeBase,
+    KnowledgeBaseDelta,
+    SearchPhase,
+    ServiceConfiguration,
+    SubjectInfo,
+    TypeProgress,
+    merge_inconsistencies,
+    merge_knowledge_base,
+)
+
+
+def _inconsistency(severity: str = "low") -> Inconsistency:
+    return Inconsistency(
+        type_a=InformationType.EMPLOYMENT,
+        type_b=InformationType.EDUCATION,
+        field="dates",
+        value_a="2019",
+        value_b="2020",
+        sources=["a", "b"],
+        inconsistency_type=InconsistencyType.DATE_MINOR,
+        risk_severity=severity,
+        risk_rationale="Minor date mismatch",
+    )
+
+
+def _pending_progress() -> dict[str, TypeProgress]:
+    return {
+        info_type.value: TypeProgress(info_type=info_type)
+        for types in PHASE_TYPES.values()
+        for info_type in types
+    }
+
+
+class TestMergeReducers:
+    """Tests for the reducers used to join concurrent types."""
+
+    def test_knowledge_base_deltas_union(self) -> None:
+        """Test list facts added by concurrent branches are all kept."""
+        base = KnowledgeBase(confirmed_names=["Jane Doe"], known_states=["CA"])
+        left = base.model_copy(update={"known_states": ["CA", "NY"]})
+        right = base.model_copy(update={"confirmed_names": ["Jane Doe", "Jane Smith"]})
+
+        merged = merge_knowledge_base(merge_knowledge_base(base, left.diff(base)), right.diff(base))
+
+        assert merged.confirmed_names == ["Jane Doe", "Jane Smith"]
+        assert merged.known_states == ["CA", "NY"]
+        assert base.known_states == ["CA"]
+
+    def test_stale_branch_keeps_other_scalars(self) -> None:
+        """Test a branch that did not set a scalar leaves another branch's value."""
+        base = KnowledgeBase(confirmed_ssn_last4="1234")
+        left = base.model_copy(
+            update={"confirmed_dob": date(1980, 1, 2), "confirmed_ssn_last4": "5678"}
+        )
+        right = base.model_copy(update={"known_states": ["CA"]})
+
+        merged = merge_knowledge_base(merge_knowledge_base(base, left.diff(base)), right.diff(base))
+
+        assert merged.confirmed_dob == date(1980, 1, 2)
+        assert merged.confirmed_ssn_last4 == "5678"
+        assert merged.known_states == ["CA"]
+
+    def test_removed_items_not_resurrected(self) -> None:
+        """Test an item removed by one branch stays removed after merging another."""
+        base = KnowledgeBase(known_counties=["Alameda", "Marin"])
+        left = base.model_copy(update={"known_counties": ["Alameda"]})
+        right = base.model_copy(update={"known_counties": ["Alameda", "Marin", "Napa"]})
+
+        merged = merge_knowledge_base(merge_knowledge_base(base, left.diff(base)), right.diff(base))
+
+        assert merged.known_counties == ["Alameda", "Napa"]
+
+    def test_full_knowledge_base_replaces(self) -> None:
+        """Test a full knowledge base from a sequential node replaces the existing one."""
+        base = KnowledgeBase(known_states=["CA", "NY"])
+        updated = KnowledgeBase(known_states=["CA"])
+        assert merge_knowledge_base(base, updated) is updated
+
+    def test_knowledge_base_unchanged_is_identity(self) -> None:
+        """Test unchanged updates return the original knowledge base."""
+        base = KnowledgeBase(confirmed_addresses=[Address(state="CA")])
+        assert merge_knowledge_base(base, base.model_copy()) is base
+        assert merge_knowledge_base(base, base.model_copy().diff(base)) is base
+        assert merge_knowledge_base(base, KnowledgeBaseDelta()) is base
+
+    def test_inconsistencies_upsert_by_id(self) -> None:
+        """Test resolved copies replace entries and new ones are appended."""
+        first, second = _inconsistency(), _inconsistency("high")
+        resolved = first.model_copy(update={"resolved": True})
+        added = _inconsistency()
+
+        merged = merge_inconsistencies([first, second], [resolved, added])
+
+        assert merged == [resolved, second, added]
+        assert merged[1] is second
+        assert first.resolved is False
+
+
+class TestRouteTypeFanOut:
+    """Tests for route_type_fan_out."""
+
+    def test_parallel_phase_sends_all_pending_types(self) -> None:
+        """Test every enabled pending type in a parallel phase is sent."""
+        state = {
+            "current_phase": SearchPhase.RECORDS,
+            "type_progress": _pending_progress(),
+            "service_config": ServiceConfiguration(),
+        }
+
+        sends = route_type_fan_out(state)
+
+        assert all(isinstance(send, Send) for send in sends)
+        assert [send.arg["current_type"] for send in sends] == PHASE_TYPES[SearchPhase.RECORDS]
+
+    def test_sequential_phase_sends_one_type(self) -> None:
+        """Test sequential phases run one type at a time."""
+        progress = _pending_progress()
+        progress["identity"] = progress["identity"].model_copy(update={"status": "complete"})
+        state = {"current_phase": SearchPhase.FOUNDATION, "type_progress": progress}
+
+        sends = route_type_fan_out(state)
+
+        assert [send.arg["current_type"] for send in sends] == [InformationType.EMPLOYMENT]
+
+    def test_completed_phase_moves_on(self) -> None:
+        """Test a phase without pending types routes to the next phase."""
+        progress = {
+            key: value.model_copy(update={"status": "complete"})
+            for key, value in _pending_progress().items()
+        }
+        state = {"current_phase": SearchPhase.INTELLIGENCE, "type_progress": progress}
+
+        assert route_type_fan_out(state) == "next_phase"
+
+    def test_reconciliation_phase(self) -> None:
+        """Test the reconciliation phase routes on the inconsistency queue."""
+        state = {"current_phase": SearchPhase.RECONCILIATION, "inconsistency_queue": []}
+        assert route_type_fan_out(state) == "compile"
+
+        state["inconsistency_queue"] = [_inconsistency()]
+        assert route_type_fan_out(state) == "reconciliation"
+
+
+class TestParallelExecution:
+    """Tests for running the graph with parallel_types=True."""
+
+    async def _run(self, parallel: bool) -> dict:
+        graph = compile_iterative_search_graph(parallel_types=parallel)
+        return await graph.ainvoke(
+            {"subject": SubjectInfo(full_name="Jane Doe")}, {"recursion_limit": 500}
+        )
+
+    async def test_matches_sequential_mode(self) -> None:
+        """Test both modes complete the same types with a report."""
+        sequential = await self._run(parallel=False)
+        parallel = await self._run(parallel=True)
+
+        assert parallel["final_report"] is not None
+        assert {k: v.status for k, v in parallel["type_progress"].items()} == {
+            k: v.status for k, v in sequential["type_progress"].items()
+        }
+        assert parallel["type_progress"]["criminal"].iterations > 0
+
+    async def test_phase_types_run_concurrently(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a parallel phase overlaps its types' searches and sequential mode does not."""
+        original = nodes.search_type
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_search(state):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return await original(state)
+
+        monkeypatch.setattr(nodes, "search_type", slow_search)
+        monkeypatch.setattr(graph_module, "search_type", slow_search)
+
+        await self._run(parallel=True)
+        assert max_in_flight == len(PHASE_TYPES[SearchPhase.RECORDS])
+
+        max_in_flight = 0
+        await self._run(parallel=False)
+        assert max_in_flight == 1
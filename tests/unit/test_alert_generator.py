@@ -7,13 +7,26 @@ Tests cover:
 - Escalation logic
 - Alert status tracking
 - Alert history management
+- Durable outbox storage and pruning
 """
 
+import asyncio
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
 from uuid import uuid7
 
 import pytest
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from elile.agent.state import VigilanceLevel
+from elile.db.models import OutboxAlert, OutboxMessage
+from elile.db.models.base import Base
 from elile.monitoring.alert_generator import (
     AUTO_ALERT_THRESHOLDS,
     AlertConfig,
@@ -28,6 +41,11 @@ from elile.monitoring.alert_generator import (
     NotificationResult,
     create_alert_generator,
 )
+from elile.monitoring.alert_outbox import (
+    InMemoryAlertOutbox,
+    OutboxStatus,
+    SQLAlchemyAlertOutbox,
+)
 from elile.monitoring.types import (
     AlertSeverity,
     DeltaSeverity,
@@ -582,7 +600,7 @@ class TestAlertHistory:
             delta = make_delta(severity=DeltaSeverity.HIGH)
             await generator.generate_alerts([delta], monitoring_config)
 
-        history = generator.get_alert_history()
+        history = await generator.get_alert_history()
         assert len(history) == 3
 
     @pytest.mark.asyncio
@@ -594,7 +612,7 @@ class TestAlertHistory:
             delta = make_delta(severity=DeltaSeverity.HIGH)
             await generator.generate_alerts([delta], monitoring_config)
 
-        history = generator.get_alert_history(limit=3)
+        history = await generator.get_alert_history(limit=3)
         assert len(history) == 3
 
     @pytest.mark.asyncio
@@ -622,10 +640,10 @@ class TestAlertHistory:
         await generator.generate_alerts([delta], config1)
         await generator.generate_alerts([delta], config2)
 
-        history1 = generator.get_alert_history(config_id=config1.config_id)
+        history1 = await generator.get_alert_history(config_id=config1.config_id)
         assert len(history1) == 2
 
-        history2 = generator.get_alert_history(config_id=config2.config_id)
+        history2 = await generator.get_alert_history(config_id=config2.config_id)
         assert len(history2) == 1
 
     @pytest.mark.asyncio
@@ -638,7 +656,7 @@ class TestAlertHistory:
         delta = make_delta(severity=DeltaSeverity.HIGH)
         await generator.generate_alerts([delta], monitoring_config)
 
-        pending = generator.get_pending_alerts()
+        pending = await generator.get_pending_alerts()
         assert len(pending) == 1
 
     @pytest.mark.asyncio
@@ -649,12 +667,13 @@ class TestAlertHistory:
         delta = make_delta(severity=DeltaSeverity.HIGH)
         alerts = await generator.generate_alerts([delta], monitoring_config)
 
-        unresolved = generator.get_unresolved_alerts()
+        unresolved = await generator.get_unresolved_alerts()
         assert len(unresolved) == 1
 
         # Resolve it
         alerts[0].resolve(by="admin")
-        unresolved = generator.get_unresolved_alerts()
+        await generator.outbox.save_alert(alerts[0])
+        unresolved = await generator.get_unresolved_alerts()
         assert len(unresolved) == 0
 
     @pytest.mark.asyncio
@@ -665,11 +684,11 @@ class TestAlertHistory:
         delta = make_delta(severity=DeltaSeverity.HIGH)
         await generator.generate_alerts([delta], monitoring_config)
 
-        assert len(generator.get_alert_history()) == 1
+        assert len(await generator.get_alert_history()) == 1
 
         cleared = generator.clear_history()
         assert cleared == 1
-        assert len(generator.get_alert_history()) == 0
+        assert len(await generator.get_alert_history()) == 0
 
 
 # =============================================================================
@@ -895,3 +914,411 @@ class TestIntegrationScenarios:
         assert AlertSeverity.MEDIUM in severities
         assert AlertSeverity.HIGH in severities
         assert AlertSeverity.CRITICAL in severities
+
+
+# =============================================================================
+# Outbox Delivery Tests
+# =============================================================================
+
+
+class SlowSMSChannel(MockSMSChannel):
+    """SMS channel that takes a moment per message and records concurrency."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def send(
+        self,
+        recipient: str,
+        subject: str,
+        body: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> NotificationResult:
+        """Send after a short delay."""
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.005)
+            return await super().send(recipient, subject, body, metadata)
+        finally:
+            self.in_flight -= 1
+
+
+class TestOutboxDelivery:
+    """Tests for outbox-based notification delivery."""
+
+    async def test_alerts_and_entries_persisted(
+        self, generator: AlertGenerator, monitoring_config: MonitoringConfig
+    ) -> None:
+        """Test alerts and their notifications are stored in the outbox."""
+        alerts = await generator.generate_alerts(
+            [make_delta(severity=DeltaSeverity.HIGH)], monitoring_config
+        )
+
+        stored = await generator.outbox.get_alert(alerts[0].alert_id)
+        entries = await generator.outbox.get_entries(alerts[0].alert_id)
+
+        assert stored is alerts[0]
+        assert [e.recipient for e in entries] == ["security@example.com", "hr@example.com"]
+        assert all(e.status == OutboxStatus.DELIVERED and e.attempts == 1 for e in entries)
+
+    async def test_failed_notification_retried_with_backoff(
+        self, monitoring_config: MonitoringConfig
+    ) -> None:
+        """Test a failed notification waits for its backoff, then is retried."""
+        channel = MockEmailChannel(should_fail=True)
+        generator = AlertGenerator(config=AlertConfig(notification_retry_delay_seconds=60))
+        generator.add_channel(channel)
+        start = datetime.now(UTC)
+
+        alerts = await generator.generate_alerts(
+            [make_delta(severity=DeltaSeverity.HIGH)], monitoring_config
+        )
+        entries = await generator.outbox.get_entries(alerts[0].alert_id)
+
+        assert alerts[0].status == AlertStatus.FAILED
+        assert len(channel.sent_messages) == 2  # one attempt each, no busy retries
+        for entry in entries:
+            assert entry.status == OutboxStatus.PENDING
+            assert start + timedelta(seconds=30) <= entry.next_attempt_at
+            assert entry.next_attempt_at <= datetime.now(UTC) + timedelta(seconds=60)
+
+        assert await generator.dispatch_outbox() == []
+
+        channel.should_fail = False
+        retried = await generator.dispatch_outbox(as_of=start + timedelta(minutes=2))
+
+        assert len(retried) == 2
+        assert alerts[0].status == AlertStatus.DELIVERED
+        assert all(r.metadata["attempts"] == 2 for r in alerts[0].notification_results)
+
+    async def test_retries_exhausted(self, monitoring_config: MonitoringConfig) -> None:
+        """Test notifications fail permanently after the configured retries."""
+        generator = AlertGenerator(
+            config=AlertConfig(notification_retry_count=2, notification_retry_delay_seconds=10)
+        )
+        generator.add_channel(MockEmailChannel(should_fail=True))
+        alerts = await generator.generate_alerts(
+            [make_delta(severity=DeltaSeverity.HIGH)], monitoring_config
+        )
+
+        as_of = datetime.now(UTC)
+        for _ in range(4):
+            as_of += timedelta(hours=1)
+            await generator.dispatch_outbox(as_of=as_of)
+
+        entries = await generator.outbox.get_entries(alerts[0].alert_id)
+        assert all(e.status == OutboxStatus.FAILED and e.attempts == 3 for e in entries)
+        assert alerts[0].status == AlertStatus.FAILED
+
+    async def test_duplicate_recipients_notified_once(
+        self, generator: AlertGenerator, monitoring_config: MonitoringConfig
+    ) -> None:
+        """Test a recipient on both the alert list and escalation path gets one email."""
+        monitoring_config.escalation_path.append("security@example.com")
+
+        await generator.generate_alerts(
+            [make_delta(severity=DeltaSeverity.CRITICAL)], monitoring_config
+        )
+
+        email_channel = generator.channels[NotificationChannelType.EMAIL]
+        recipients = [m["recipient"] for m in email_channel.sent_messages]
+        assert sorted(recipients) == ["ciso@example.com", "hr@example.com", "security@example.com"]
+
+    async def test_realerting_same_delta_is_deduplicated(self, generator: AlertGenerator) -> None:
+        """Test the same delta alerted twice is only sent once per recipient."""
+        delta = make_delta(severity=DeltaSeverity.HIGH)
+
+        first = await generator.evaluate_single_delta(delta, VigilanceLevel.V2, ["a@example.com"])
+        second = await generator.evaluate_single_delta(delta, VigilanceLevel.V2, ["a@example.com"])
+
+        assert first is not None and first.status == AlertStatus.DELIVERED
+        assert second is not None and second.status == AlertStatus.PENDING
+        assert len(generator.channels[NotificationChannelType.EMAIL].sent_messages) == 1
+
+    async def test_mass_event_batched_and_bounded(self) -> None:
+        """Test a mass event is delivered in batches with bounded concurrency."""
+        email = MockEmailChannel()
+        sms = SlowSMSChannel()
+        generator = AlertGenerator(
+            config=AlertConfig(
+                deliver_immediately=False,
+                notification_batch_size=50,
+                max_concurrent_sends_per_channel=8,
+            ),
+            outbox=InMemoryAlertOutbox(),
+        )
+        generator.add_channel(email)
+        generator.add_channel(sms)
+
+        for i in range(300):
+            config = MonitoringConfig(
+                subject_id=uuid7(),
+                tenant_id=uuid7(),
+                vigilance_level=VigilanceLevel.V2,
+                baseline_profile_id=uuid7(),
+                alert_recipients=[f"hr{i}@example.com", f"+1555{i:07d}"],
+            )
+            alerts = await generator.generate_alerts(
+                [make_delta(severity=DeltaSeverity.HIGH)], config
+            )
+            assert alerts[0].status == AlertStatus.PENDING
+
+        attempted = await generator.dispatch_outbox()
+
+        assert len(attempted) == 600
+        assert all(e.status == OutboxStatus.DELIVERED for e in attempted)
+        assert email.batch_sizes == [50] * 6
+        assert len(sms.sent_sms) == 300
+        assert 1 < sms.peak_in_flight <= 8
+        history = await generator.get_alert_history(limit=300)
+        assert all(a.status == AlertStatus.DELIVERED for a in history)
+
+    async def test_channel_exception_recorded_as_failure(
+        self, monitoring_config: MonitoringConfig
+    ) -> None:
+        """Test a channel that raises is treated as a failed attempt."""
+
+        class BrokenChannel(MockEmailChannel):
+            async def send_batch(
+                self, messages: list[Any]  # noqa: ARG002
+            ) -> list[NotificationResult]:
+                raise ConnectionError("smtp relay unreachable")
+
+        generator = AlertGenerator()
+        generator.add_channel(BrokenChannel())
+
+        alerts = await generator.generate_alerts(
+            [make_delta(severity=DeltaSeverity.HIGH)], monitoring_config
+        )
+
+        assert alerts[0].status == AlertStatus.FAILED
+        assert alerts[0].notification_results[0].error == "smtp relay unreachable"
+
+
+# =============================================================================
+# Outbox Storage Tests
+# =============================================================================
+
+
+@pytest.fixture
+async def outbox_engine(tmp_path: Path) -> AsyncEngine:
+    """File-backed SQLite engine with the outbox tables."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all, tables=[OutboxMessage.__table__, OutboxAlert.__table__]
+        )
+    yield engine
+    await engine.dispose()
+
+
+def _db_outbox(engine: AsyncEngine, **kwargs: Any) -> SQLAlchemyAlertOutbox:
+    return SQLAlchemyAlertOutbox(async_sessionmaker(engine, expire_on_commit=False), **kwargs)
+
+
+class TestOutboxStorage:
+    """Tests for outbox pruning and the database-backed outbox."""
+
+    def test_generated_alert_round_trip(self) -> None:
+        """Test an alert survives to_dict/from_dict, as the database outbox stores it."""
+        alert = GeneratedAlert(
+            alert=MonitoringAlert(severity=AlertSeverity.HIGH, title="t", delta_ids=[uuid7()]),
+            notification_results=[
+                NotificationResult(
+                    channel_type=NotificationChannelType.EMAIL,
+                    recipient="a@example.com",
+                    success=True,
+                )
+            ],
+        )
+        alert.escalate(EscalationTrigger.SEVERITY)
+        alert.acknowledge("analyst")
+
+        restored = GeneratedAlert.from_dict(alert.to_dict())
+
+        assert restored.to_dict() == alert.to_dict()
+
+    async def test_in_memory_prune(self, monitoring_config: MonitoringConfig) -> None:
+        """Test pruning drops finished entries and alerts left without entries."""
+        outbox = InMemoryAlertOutbox()
+        generator = AlertGenerator(outbox=outbox)
+        generator.add_channel(MockEmailChannel())
+        alerts = await generator.generate_alerts(
+            [make_delta(severity=DeltaSeverity.HIGH)], monitoring_config
+        )
+
+        assert await outbox.prune(datetime.now(UTC) - timedelta(hours=1)) == 0
+        assert await outbox.prune(datetime.now(UTC) + timedelta(seconds=1)) == 2
+
+        assert outbox.entries() == []
+        assert await outbox.get_alert(alerts[0].alert_id) is None
+
+    async def test_pending_entries_survive_restart(
+        self, outbox_engine: AsyncEngine, monitoring_config: MonitoringConfig
+    ) -> None:
+        """Test entries enqueued by one process are delivered by another."""
+        generator = AlertGenerator(
+            config=AlertConfig(deliver_immediately=False), outbox=_db_outbox(outbox_engine)
+        )
+        generator.add_channel(MockEmailChannel())
+        alerts = await generator.generate_alerts(
+            [make_delta(severity=DeltaSeverity.HIGH)], monitoring_config
+        )
+
+        restarted = AlertGenerator(outbox=_db_outbox(outbox_engine))
+        email = MockEmailChannel()
+        restarted.add_channel(email)
+        attempted = await restarted.dispatch_outbox()
+
+        assert len(attempted) == 2
+        assert len(email.sent_messages) == 2
+        stored = await restarted.outbox.get_alert(alerts[0].alert_id)
+        assert stored is not None and stored.status == AlertStatus.DELIVERED
+        assert await restarted.outbox.pending_channels() == []
+
+    async def test_retry_backoff_persisted(
+        self, outbox_engine: AsyncEngine, monitoring_config: MonitoringConfig
+    ) -> None:
+        """Test a failed entry is rescheduled in the database, not retried at once."""
+        channel = MockEmailChannel(should_fail=True)
+        generator = AlertGenerator(outbox=_db_outbox(outbox_engine))
+        generator.add_channel(channel)
+        alerts = await generator.generate_alerts(
+            [make_delta(severity=DeltaSeverity.HIGH)], monitoring_config
+        )
+
+        assert await generator.dispatch_outbox() == []
+        channel.should_fail = False
+        retried = await generator.dispatch_outbox(as_of=datetime.now(UTC) + timedelta(hours=1))
+
+        assert [e.attempts for e in retried] == [2, 2]
+        entries = await generator.outbox.get_entries(alerts[0].alert_id)
+        assert all(e.status == OutboxStatus.DELIVERED for e in entries)
+
+    async def test_claims_expire(
+        self, outbox_engine: AsyncEngine, monitoring_config: MonitoringConfig
+    ) -> None:
+        """Test an entry claimed by a process that died becomes due again."""
+        outbox = _db_outbox(outbox_engine, claim_lease=timedelta(0))
+        generator = AlertGenerator(config=AlertConfig(deliver_immediately=False), outbox=outbox)
+        generator.add_channel(MockEmailChannel())
+        await generator.generate_alerts([make_delta(severity=DeltaSeverity.HIGH)], monitoring_config)
+
+        claimed = await outbox.claim_due(NotificationChannelType.EMAIL, datetime.now(UTC), 10)
+        leased = _db_outbox(outbox_engine)
+        reclaimed = await leased.claim_due(NotificationChannelType.EMAIL, datetime.now(UTC), 10)
+
+        assert len(claimed) == 2
+        assert {e.entry_id for e in reclaimed} == {e.entry_id for e in claimed}
+        assert await leased.claim_due(NotificationChannelType.EMAIL, datetime.now(UTC), 10) == []
+
+    async def test_dedup_across_processes(self, outbox_engine: AsyncEngine) -> None:
+        """Test the dedup window applies to entries enqueued by another outbox."""
+        delta = make_delta(severity=DeltaSeverity.HIGH)
+        first = AlertGenerator(outbox=_db_outbox(outbox_engine))
+        second = AlertGenerator(outbox=_db_outbox(outbox_engine))
+        for generator in (first, second):
+            generator.add_channel(MockEmailChannel())
+
+        await first.evaluate_single_delta(delta, VigilanceLevel.V2, ["a@example.com"])
+        again = await second.evaluate_single_delta(delta, VigilanceLevel.V2, ["a@example.com"])
+
+        assert again is not None and again.status == AlertStatus.PENDING
+        assert second.channels[NotificationChannelType.EMAIL].sent_messages == []
+
+    async def test_prune_deletes_finished_entries(
+        self, outbox_engine: AsyncEngine, monitoring_config: MonitoringConfig
+    ) -> None:
+        """Test pruning deletes delivered entries and keeps pending ones."""
+        outbox = _db_outbox(outbox_engine)
+        generator = AlertGenerator(outbox=outbox)
+        generator.add_channel(MockEmailChannel())
+        generator.add_channel(MockSMSChannel(should_fail=True))
+        monitoring_config.alert_recipients.append("+15551234567")
+        alerts = await generator.generate_alerts(
+            [make_delta(severity=DeltaSeverity.HIGH)], monitoring_config
+        )
+
+        assert await outbox.prune(datetime.now(UTC) - timedelta(hours=1)) == 0
+        assert await outbox.prune(datetime.now(UTC) + timedelta(seconds=1)) == 2
+
+        entries = await outbox.get_entries(alerts[0].alert_id)
+        assert [e.channel_type for e in entries] == [NotificationChannelType.SMS]
+        assert entries[0].status == OutboxStatus.PENDING
+
+    async def test_history_shows_background_delivery(
+        self, outbox_engine: AsyncEngine, monitoring_config: MonitoringConfig
+    ) -> None:
+        """Test history is read from the outbox, with results of a later dispatch."""
+        generator = AlertGenerator(
+            config=AlertConfig(deliver_immediately=False), outbox=_db_outbox(outbox_engine)
+        )
+        generator.add_channel(MockEmailChannel())
+        alerts = await generator.generate_alerts(
+            [make_delta(severity=DeltaSeverity.HIGH)], monitoring_config
+        )
+        assert [a.status for a in await generator.get_pending_alerts()] == [AlertStatus.PENDING]
+
+        await generator.dispatch_outbox()
+
+        [stored] = await generator.get_alert_history(config_id=monitoring_config.config_id)
+        assert stored.alert_id == alerts[0].alert_id
+        assert stored.status == AlertStatus.DELIVERED
+        assert len(stored.notification_results) == 2
+        assert await generator.get_pending_alerts() == []
+        assert await generator.get_alert_history(config_id=uuid7()) == []
+
+    async def test_alert_status_saved_in_one_transaction(
+        self, outbox_engine: AsyncEngine, monitoring_config: MonitoringConfig
+    ) -> None:
+        """Test the delivery status of a batch of alerts takes one read and one save."""
+        outbox = _db_outbox(outbox_engine)
+        generator = AlertGenerator(outbox=outbox)
+        generator.add_channel(MockEmailChannel())
+        generator.add_channel(MockSMSChannel())
+        monitoring_config.alert_recipients.append("+15551234567")
+        alerts = await generator.generate_alerts(
+            [
+                make_delta(severity=DeltaSeverity.HIGH),
+                make_delta(severity=DeltaSeverity.CRITICAL),
+            ],
+            monitoring_config,
+        )
+        assert len(alerts) == 2
+
+        sessions = 0
+        session_factory = outbox.session_factory
+
+        def counting_factory() -> AsyncSession:
+            nonlocal sessions
+            sessions += 1
+            return session_factory()
+
+        outbox.session_factory = counting_factory  # type: ignore[assignment]
+        await generator._update_delivery_status(alerts)
+
+        assert sessions == 2  # get_entries_many, save_alerts
+        entries = await outbox.get_entries_many([a.alert_id for a in alerts])
+        assert sorted(len(entries[a.alert_id]) for a in alerts) == [3, 4]  # Escalated
+        assert all(a.status == AlertStatus.DELIVERED for a in await outbox.get_alerts(entries))
+
+    async def test_prune_deletes_alerts_without_entries(
+        self, outbox_engine: AsyncEngine, monitoring_config: MonitoringConfig
+    ) -> None:
+        """Test pruning deletes alerts once their entries are gone."""
+        outbox = _db_outbox(outbox_engine)
+        generator = AlertGenerator(outbox=outbox)
+        generator.add_channel(MockEmailChannel())
+        alerts = await generator.generate_alerts(
+            [make_delta(severity=DeltaSeverity.HIGH)], monitoring_config
+        )
+
+        assert await outbox.prune(datetime.now(UTC) - timedelta(hours=1)) == 0
+        assert len(await generator.get_alert_history()) == 1
+        assert await outbox.prune(datetime.now(UTC) + timedelta(seconds=1)) == 2
+
+        assert await outbox.get_alert(alerts[0].alert_id) is None
+        assert await generator.get_alert_history() == []
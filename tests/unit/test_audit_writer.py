@@ -0,0 +1,396 @@
+"""Unit tests for the buffered audit writer."""
+
+import asyncio
+import fcntl
+import json
+import os
+from contextlib import asynccontextmanager
+from uuid import uuid7
+
+import pytest
+from sqlalchemy import event as sa_event
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from elile.core import audit_writer
+from elile.core.audit import AuditLogger
+from elile.core.audit_writer import (
+    AuditWriterConfig,
+    BufferedAuditWriter,
+    get_audit_writer,
+    start_audit_writer,
+    stop_audit_writer,
+)
+from elile.core.exceptions import AuditWriteError
+from elile.db.models.audit import AuditEvent, AuditEventType
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    """Create sessions on the test database."""
+    return async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+class _FlakyDatabase:
+    """Session factory that fails while ``down`` is set."""
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+        self.down = True
+
+    @asynccontextmanager
+    async def __call__(self):
+        if self.down:
+            raise ConnectionError("database unavailable")
+        async with self.session_factory() as session:
+            yield session
+
+
+def _event(correlation_id, index: int = 0) -> AuditEvent:
+    return AuditEvent(
+        event_type=AuditEventType.DATA_ACCESSED.value,
+        severity="info",
+        correlation_id=correlation_id,
+        event_data={"index": index},
+    )
+
+
+async def _stored(session_factory, correlation_id) -> list[int]:
+    async with session_factory() as session:
+        result = await session.execute(
+            select(AuditEvent)
+            .where(AuditEvent.correlation_id == correlation_id)
+            .order_by(AuditEvent.created_at, AuditEvent.audit_id)
+        )
+        return [event.event_data["index"] for event in result.scalars()]
+
+
+class TestBufferedAuditWriter:
+    """Tests for BufferedAuditWriter."""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_batches_in_order(self, session_factory):
+        """Test that queued events are written in batches, in order."""
+        writer = BufferedAuditWriter(session_factory, AuditWriterConfig(max_batch_size=4))
+        correlation_id = uuid7()
+
+        for index in range(10):
+            event = await writer.write(_event(correlation_id, index))
+            assert event.audit_id is not None
+        assert len(writer) == 10
+        assert await _stored(session_factory, correlation_id) == []
+
+        assert await writer.flush() == 10
+
+        assert len(writer) == 0
+        assert writer.stats.batches == 3
+        assert await _stored(session_factory, correlation_id) == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_sync_write(self, session_factory):
+        """Test that a sync write is committed before returning."""
+        writer = BufferedAuditWriter(session_factory)
+        correlation_id = uuid7()
+
+        await writer.write(_event(correlation_id, 0))
+        await writer.write(_event(correlation_id, 1), sync=True)
+
+        assert await _stored(session_factory, correlation_id) == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_background_flush(self, session_factory):
+        """Test that the background task flushes on interval and stop."""
+        writer = BufferedAuditWriter(session_factory, AuditWriterConfig(flush_interval=0.01))
+        correlation_id = uuid7()
+        await writer.start()
+
+        await writer.write(_event(correlation_id, 0))
+        for _ in range(100):
+            if writer.stats.written:
+                break
+            await asyncio.sleep(0.01)
+        assert await _stored(session_factory, correlation_id) == [0]
+
+        writer.config.flush_interval = 60
+        await asyncio.sleep(0.02)
+        await writer.write(_event(correlation_id, 1))
+        await writer.stop()
+
+        assert not writer.is_running
+        assert await _stored(session_factory, correlation_id) == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_failure_without_spool_keeps_events(self, session_factory):
+        """Test that a failed flush re-queues events when there is no spool."""
+        database = _FlakyDatabase(session_factory)
+        writer = BufferedAuditWriter(database)
+        correlation_id = uuid7()
+        await writer.write(_event(correlation_id, 0))
+
+        with pytest.raises(ConnectionError):
+            await writer.flush()
+        assert len(writer) == 1
+
+        database.down = False
+        await writer.flush()
+        assert await _stored(session_factory, correlation_id) == [0]
+
+    @pytest.mark.asyncio
+    async def test_spool_and_replay(self, session_factory, tmp_path):
+        """Test that events are spooled while the database is down and replayed in order."""
+        database = _FlakyDatabase(session_factory)
+        writer = BufferedAuditWriter(
+            database,
+            AuditWriterConfig(max_batch_size=2, spool_path=tmp_path / "audit" / "spool.jsonl"),
+        )
+        spool_path = writer.spool_path
+        assert spool_path.name == f"spool.{os.getpid()}.jsonl"
+        correlation_id = uuid7()
+
+        for index in range(3):
+            await writer.write(_event(correlation_id, index))
+        assert await writer.flush() == 0
+        with pytest.raises(AuditWriteError, match="spooled"):
+            await writer.write(_event(correlation_id, 3), sync=True)
+
+        assert len(writer) == 0
+        assert writer.stats.spooled == 4
+        records = [json.loads(line) for line in spool_path.read_text().splitlines()]
+        assert [record["event_data"]["index"] for record in records] == [0, 1, 2, 3]
+
+        database.down = False
+        await writer.write(_event(correlation_id, 4))
+        assert await writer.flush() == 1
+
+        assert not spool_path.exists()
+        assert writer.stats.replayed == 4
+        assert await _stored(session_factory, correlation_id) == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_start_replays_spool(self, session_factory, tmp_path):
+        """Test that events spooled by an earlier process are written on start."""
+        spool_path = tmp_path / "spool.jsonl"
+        database = _FlakyDatabase(session_factory)
+        config = AuditWriterConfig(spool_path=spool_path)
+        correlation_id = uuid7()
+        exited = BufferedAuditWriter(database, config)
+        await exited.write(_event(correlation_id, 0))
+        await exited.flush()
+        # As if spooled by another worker that has since exited
+        exited.spool_path.rename(tmp_path / "spool.1.jsonl")
+
+        writer = BufferedAuditWriter(session_factory, config)
+        await writer.start()
+        await writer.stop()
+
+        assert await _stored(session_factory, correlation_id) == [0]
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_locked_spool_is_left_to_its_process(self, session_factory, tmp_path):
+        """Test that a spool file another process holds is not replayed or removed."""
+        config = AuditWriterConfig(spool_path=tmp_path / "spool.jsonl")
+        correlation_id = uuid7()
+        other = BufferedAuditWriter(_FlakyDatabase(session_factory), config)
+        await other.write(_event(correlation_id, 0))
+        await other.flush()
+        foreign = other.spool_path.rename(tmp_path / "spool.1.jsonl")
+
+        writer = BufferedAuditWriter(session_factory, config)
+        with foreign.open("a") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            await writer.write(_event(correlation_id, 1))
+            assert await writer.flush() == 1
+            assert foreign.exists()
+
+        await writer.flush()
+        assert not foreign.exists()
+        assert await _stored(session_factory, correlation_id) == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_waiting_for_own_spool_does_not_block_loop(self, session_factory, tmp_path):
+        """Test that a spool lock held elsewhere is waited for without blocking the loop."""
+        config = AuditWriterConfig(spool_path=tmp_path / "spool.jsonl")
+        writer = BufferedAuditWriter(_FlakyDatabase(session_factory), config)
+        await writer.write(_event(uuid7()))
+
+        with writer.spool_path.open("a") as handle:
+            # As another worker replaying this process's spool would
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            flush = asyncio.create_task(writer.flush())
+            ticks = 0
+            for _ in range(10):
+                await asyncio.sleep(audit_writer._LOCK_RETRY_INTERVAL / 2)
+                ticks += 1
+            assert ticks == 10
+            assert not flush.done()
+        assert await flush == 0
+
+        assert writer.stats.spooled == 1
+        assert len(writer.spool_path.read_text().splitlines()) == 1
+
+    @pytest.mark.asyncio
+    async def test_rejected_events_are_dead_lettered(self, session_factory, tmp_path):
+        """Test that events the database rejects do not block or spool the others."""
+        writer = BufferedAuditWriter(
+            session_factory, AuditWriterConfig(spool_path=tmp_path / "spool.jsonl")
+        )
+        correlation_id = uuid7()
+        duplicate = await writer.write(_event(correlation_id, 0), sync=True)
+
+        rejected = _event(correlation_id, 2)
+        rejected.audit_id = duplicate.audit_id
+        for event in (_event(correlation_id, 1), rejected, _event(correlation_id, 3)):
+            await writer.write(event)
+        assert await writer.flush() == 2
+
+        assert writer.stats.dead_lettered == 1
+        assert writer.stats.spooled == 0
+        assert await _stored(session_factory, correlation_id) == [0, 1, 3]
+        (entry,) = [json.loads(line) for line in writer.dead_letter_path.read_text().splitlines()]
+        assert entry["record"]["event_data"] == {"index": 2}
+        assert entry["error"]
+
+        rejected = _event(correlation_id, 4)
+        rejected.audit_id = duplicate.audit_id
+        with pytest.raises(AuditWriteError, match="rejected"):
+            await writer.write(rejected, sync=True)
+
+    @pytest.mark.asyncio
+    async def test_unreadable_spool_lines_are_dead_lettered(self, session_factory, tmp_path):
+        """Test that a corrupt or truncated spool line does not block the replay."""
+        config = AuditWriterConfig(spool_path=tmp_path / "spool.jsonl")
+        correlation_id = uuid7()
+        spooling = BufferedAuditWriter(_FlakyDatabase(session_factory), config)
+        await spooling.write(_event(correlation_id, 0))
+        await spooling.write(_event(correlation_id, 1))
+        await spooling.flush()
+        first, second = spooling.spool_path.read_text().splitlines()
+        spooling.spool_path.write_text(f"{first}\nnot json\n{second}\n{second[:20]}")
+
+        writer = BufferedAuditWriter(session_factory, config)
+        await writer.flush()
+
+        assert not writer.spool_path.exists()
+        assert await _stored(session_factory, correlation_id) == [0, 1]
+        lines = [json.loads(line) for line in writer.dead_letter_path.read_text().splitlines()]
+        assert [entry["line"].strip() for entry in lines] == ["not json", second[:20]]
+
+    @pytest.mark.asyncio
+    async def test_backpressure(self, session_factory):
+        """Test that a full queue is flushed before accepting more events."""
+        writer = BufferedAuditWriter(
+            session_factory, AuditWriterConfig(max_batch_size=10, max_queue_size=3)
+        )
+        correlation_id = uuid7()
+
+        for index in range(5):
+            await writer.write(_event(correlation_id, index))
+
+        assert len(writer) == 2
+        assert writer.stats.written == 3
+
+
+class TestGlobalAuditWriter:
+    """Tests for the global writer and AuditLogger integration."""
+
+    @pytest.fixture(autouse=True)
+    def reset_writer(self, monkeypatch):
+        """Make sure no global writer leaks between tests."""
+        monkeypatch.setattr(audit_writer, "_audit_writer", None)
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self, session_factory):
+        """Test starting and stopping the global writer."""
+        writer = await start_audit_writer(session_factory=session_factory)
+
+        assert get_audit_writer() is writer
+        assert writer.is_running
+
+        await stop_audit_writer()
+        assert get_audit_writer() is None
+        assert not writer.is_running
+
+    @pytest.mark.asyncio
+    async def test_audit_logger_uses_running_writer(self, db_session, session_factory):
+        """Test that AuditLogger queues events instead of flushing its session."""
+        writer = await start_audit_writer(
+            AuditWriterConfig(flush_interval=60), session_factory=session_factory
+        )
+        correlation_id = uuid7()
+        logger = AuditLogger(db_session)
+        try:
+            await logger.log_event(AuditEventType.DATA_ACCESSED, correlation_id, {"index": 0})
+            assert len(writer) == 1
+            assert not db_session.new
+
+            await logger.log_event(
+                AuditEventType.DATA_ACCESSED, correlation_id, {"index": 1}, sync=True
+            )
+            assert len(writer) == 0
+        finally:
+            await stop_audit_writer()
+
+        assert await _stored(session_factory, correlation_id) == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_audit_logger_without_writer(self, db_session):
+        """Test that AuditLogger flushes in its session when no writer runs."""
+        logger = AuditLogger(db_session)
+
+        event = await logger.log_event(AuditEventType.DATA_ACCESSED, uuid7(), {"index": 0})
+
+        assert event in db_session
+
+
+class TestAuditWriterRoundTrips:
+    """Database round-trips per request, buffered versus one flush per event."""
+
+    REQUESTS = 50
+    EVENTS_PER_REQUEST = 5
+
+    @staticmethod
+    def _count_inserts(engine) -> list[bool]:
+        """Record each audit INSERT sent to the database."""
+        inserts: list[bool] = []
+
+        @sa_event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def count(_conn, _cursor, statement, _parameters, _context, executemany):
+            if statement.lstrip().upper().startswith("INSERT INTO AUDIT_EVENTS"):
+                inserts.append(executemany)
+
+        return inserts
+
+    async def _log_requests(self, session_factory, writer=None) -> None:
+        correlation_id = uuid7()
+        for _ in range(self.REQUESTS):
+            async with session_factory() as session:
+                logger = AuditLogger(session, writer=writer)
+                for index in range(self.EVENTS_PER_REQUEST):
+                    await logger.log_event(
+                        AuditEventType.DATA_ACCESSED, correlation_id, {"index": index}
+                    )
+                await session.commit()
+
+    @pytest.mark.asyncio
+    async def test_per_event_flush(self, test_engine, session_factory):
+        """Test that without a writer every event is its own INSERT."""
+        inserts = self._count_inserts(test_engine)
+
+        await self._log_requests(session_factory)
+
+        assert len(inserts) == self.REQUESTS * self.EVENTS_PER_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_buffered_requests_share_one_insert(self, test_engine, session_factory):
+        """Test that the writer batches the events of many requests into one INSERT."""
+        inserts = self._count_inserts(test_engine)
+        writer = BufferedAuditWriter(session_factory, AuditWriterConfig(flush_interval=60))
+
+        await self._log_requests(session_factory, writer)
+        assert inserts == []
+        await writer.flush()
+
+        assert inserts == [True]
+        assert writer.stats.batches == 1
+        assert writer.stats.written == self.REQUESTS * self.EVENTS_PER_REQUEST
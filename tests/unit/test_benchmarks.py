@@ -0,0 +1,243 @@
+"""Tests for the benchmark harness and a smoke run of the benchmark suite."""
+
+import pytest
+
+from tests.benchmarks import harness
+from tests.benchmarks.harness import (
+    BenchmarkResult,
+    BenchmarkRun,
+    ComparisonStatus,
+    benchmark,
+    compare_runs,
+    format_comparisons,
+    format_results,
+    load_benchmarks,
+    measure,
+    report,
+    run_benchmarks_async,
+    select_benchmarks,
+)
+
+
+@pytest.fixture
+def registry(monkeypatch: pytest.MonkeyPatch) -> dict:
+    """Isolate the global benchmark registry."""
+    benchmarks: dict = {}
+    monkeypatch.setattr(harness, "BENCHMARKS", benchmarks)
+    return benchmarks
+
+
+def result(name: str, median: float, scale: int = 100) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name,
+        group="test",
+        scale=scale,
+        rounds=3,
+        min=median,
+        max=median,
+        mean=median,
+        median=median,
+        stddev=0.0,
+    )
+
+
+class TestRegistry:
+    """Tests for registering and selecting benchmarks."""
+
+    def test_register(self, registry):
+        @benchmark("parser.parse", group="parsing", scale=10)
+        def parse(_scale: int):
+            """Parse documents."""
+            return lambda: None
+
+        bench = registry["parser.parse"]
+        assert bench.group == "parsing"
+        assert bench.scale == 10
+        assert bench.description == "Parse documents."
+
+    def test_duplicate_name(self, registry):
+        benchmark("parser.parse", group="parsing", scale=10)(lambda _: None)
+        with pytest.raises(ValueError, match="already registered"):
+            benchmark("parser.parse", group="parsing", scale=10)(lambda _: None)
+
+    def test_select_by_name_or_group(self, registry):
+        benchmark("parser.parse", group="parsing", scale=10)(lambda _: None)
+        benchmark("parser.tokenize", group="parsing", scale=10)(lambda _: None)
+        benchmark("writer.write", group="output", scale=10)(lambda _: None)
+
+        assert len(select_benchmarks()) == 3
+        assert [b.name for b in select_benchmarks(["parsing"])] == [
+            "parser.parse",
+            "parser.tokenize",
+        ]
+        assert [b.name for b in select_benchmarks(["*.write", "parser.parse"])] == [
+            "parser.parse",
+            "writer.write",
+        ]
+
+
+class TestMeasure:
+    """Tests for timing benchmarks."""
+
+    async def test_callable(self, registry):
+        calls = []
+        benchmark("work", group="test", scale=7)(lambda scale: lambda: calls.append(scale))
+
+        measured = await measure(registry["work"], rounds=3, warmup=2)
+
+        assert calls == [7] * 5
+        assert measured.rounds == 3
+        assert measured.scale == 7
+        assert measured.min <= measured.median <= measured.max
+
+    async def test_generator_cleanup(self, registry):
+        events = []
+
+        @benchmark("work", group="test", scale=1)
+        def work(_scale: int):
+            events.append("setup")
+            yield lambda: events.append("call")
+            events.append("cleanup")
+
+        await measure(registry["work"], rounds=2, warmup=0)
+
+        assert events == ["setup", "call", "call", "cleanup"]
+
+    async def test_async_generator_cleanup_on_failure(self, registry):
+        events = []
+
+        @benchmark("work", group="test", scale=1)
+        async def work(_scale: int):
+            async def fail():
+                raise RuntimeError("boom")
+
+            yield fail
+            events.append("cleanup")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await measure(registry["work"], rounds=1, warmup=0)
+        assert events == ["cleanup"]
+
+    async def test_reported_metrics(self, registry):
+        @benchmark("work", group="test", scale=1)
+        def work(_scale: int):
+            report("setup_items", 3)
+            return lambda: report("bytes", 10)
+
+        measured = await measure(registry["work"], rounds=2, warmup=0)
+
+        assert measured.metrics == {"setup_items": 3, "bytes": 10}
+        assert "bytes=10, setup_items=3" in format_results(BenchmarkRun(results=[measured]))
+
+    async def test_scale_factor(self, registry):
+        benchmark("work", group="test", scale=200)(lambda _: lambda: None)
+
+        run = await run_benchmarks_async(select_benchmarks(), rounds=1, scale_factor=0.01)
+
+        assert run.get("work").scale == 2
+
+
+class TestResults:
+    """Tests for saving and formatting results."""
+
+    def test_save_and_load(self, tmp_path):
+        run = BenchmarkRun(results=[result("a", 0.5), result("b", 0.002)])
+        path = tmp_path / "results" / "run.json"
+
+        run.save(path)
+        loaded = BenchmarkRun.load(path)
+
+        assert loaded.results == run.results
+        assert loaded.created_at == run.created_at
+        assert loaded.machine == run.machine
+
+    def test_unsupported_version(self):
+        with pytest.raises(ValueError, match="version"):
+            BenchmarkRun.from_dict({"version": 99, "results": []})
+
+    def test_format(self):
+        run = BenchmarkRun(results=[result("a", 1.5), result("b", 0.002)])
+
+        table = format_results(run)
+
+        assert "1.50 s" in table
+        assert "2.00 ms" in table
+
+
+class TestCompare:
+    """Tests for comparing runs."""
+
+    def test_statuses(self):
+        baseline = BenchmarkRun(
+            results=[
+                result("slower", 1.0),
+                result("faster", 1.0),
+                result("same", 1.0),
+                result("resized", 1.0),
+                result("removed", 1.0),
+            ]
+        )
+        current = BenchmarkRun(
+            results=[
+                result("slower", 1.3),
+                result("faster", 0.7),
+                result("same", 1.1),
+                result("resized", 1.0, scale=200),
+                result("added", 1.0),
+            ]
+        )
+
+        statuses = {c.name: c.status for c in compare_runs(baseline, current, threshold=0.2)}
+
+        assert statuses == {
+            "slower": ComparisonStatus.REGRESSED,
+            "faster": ComparisonStatus.IMPROVED,
+            "same": ComparisonStatus.UNCHANGED,
+            "resized": ComparisonStatus.INCOMPARABLE,
+            "removed": ComparisonStatus.REMOVED,
+            "added": ComparisonStatus.ADDED,
+        }
+
+    def test_per_benchmark_thresholds(self):
+        baseline = BenchmarkRun(
+            results=[result("db.query", 1.0), result("db.write", 1.0), result("cpu", 1.0)]
+        )
+        current = BenchmarkRun(
+            results=[result("db.query", 1.4), result("db.write", 1.4), result("cpu", 1.4)]
+        )
+
+        comparisons = compare_runs(
+            baseline, current, threshold=0.2, thresholds={"db.*": 0.5, "db.write": 0.3}
+        )
+
+        by_name = {c.name: c for c in comparisons}
+        assert by_name["db.query"].status == ComparisonStatus.UNCHANGED
+        assert by_name["db.query"].threshold == 0.5
+        assert by_name["db.write"].status == ComparisonStatus.REGRESSED
+        assert by_name["cpu"].status == ComparisonStatus.REGRESSED
+        assert by_name["cpu"].change == pytest.approx(0.4)
+        assert "+40.0%" in format_comparisons(comparisons)
+
+    def test_metric(self):
+        baseline = BenchmarkRun(results=[result("a", 1.0)])
+        current = BenchmarkRun(results=[result("a", 1.0)])
+        current.results[0].min = 2.0
+
+        assert compare_runs(baseline, current)[0].status == ComparisonStatus.UNCHANGED
+        assert compare_runs(baseline, current, metric="min")[0].status == (
+            ComparisonStatus.REGRESSED
+        )
+        with pytest.raises(ValueError, match="metric"):
+            compare_runs(baseline, current, metric="p99")
+
+
+class TestSuite:
+    """Smoke run of every registered benchmark at a small scale."""
+
+    async def test_all_benchmarks_run(self):
+        benchmarks = list(load_benchmarks().values())
+        assert {b.group for b in benchmarks} >= {"matching", "risk", "reporting", "screening"}
+
+        run = await run_benchmarks_async(benchmarks, rounds=1, warmup=0, scale_factor=0.01)
+
+        assert len(run.results) == len(benchmarks)
@@ -0,0 +1,98 @@
+"""Unit tests for compressed, encrypted provider cache payloads."""
+
+import json
+
+import pytest
+
+from elile.core.encryption import DecryptionError, Encryptor, generate_key
+from elile.providers.cache_payload import (
+    PAYLOAD_MAGIC,
+    CachePayload,
+    decode_json_payload,
+    decode_payload,
+    encode_json_payload,
+    encode_payload,
+)
+
+
+@pytest.fixture
+def encryptor() -> Encryptor:
+    """Create an encryptor with a random key."""
+    return Encryptor(generate_key())
+
+
+def _report(records: int) -> dict:
+    return {
+        "records": [
+            {
+                "case_number": f"CR-{1000 + i}",
+                "court": "Springfield County Superior Court",
+                "charge": "Misdemeanor - disorderly conduct",
+                "disposition": "Dismissed",
+            }
+            for i in range(records)
+        ]
+    }
+
+
+class TestPayloadCodec:
+    """Tests for payload encoding."""
+
+    def test_round_trip(self, encryptor):
+        """Test that encoded payloads decode to the original bytes."""
+        data = b"<report>" + b"clear " * 500 + b"</report>"
+        payload = encode_payload(encryptor, data)
+
+        assert payload.startswith(PAYLOAD_MAGIC)
+        assert decode_payload(encryptor, payload) == data
+
+    def test_json_round_trip(self, encryptor):
+        """Test that JSON payloads decode to the original data."""
+        data = _report(20)
+        assert decode_json_payload(encryptor, encode_json_payload(encryptor, data)) == data
+
+    def test_compresses_before_encrypting(self, encryptor):
+        """Test that repetitive provider data is stored much smaller."""
+        data = _report(200)
+        plain = json.dumps(data).encode()
+
+        payload = encode_json_payload(encryptor, data)
+
+        assert len(payload) < len(plain) / 5
+
+    def test_reads_legacy_payloads(self, encryptor):
+        """Test that payloads encrypted without compression still decode."""
+        legacy = encryptor.encrypt(b"legacy raw response")
+        assert decode_payload(encryptor, legacy) == b"legacy raw response"
+
+    def test_legacy_payload_with_magic_prefix(self, encryptor, monkeypatch):
+        """Test that a legacy nonce starting with the magic is not misread."""
+        monkeypatch.setattr(
+            "elile.core.encryption.secrets.token_bytes",
+            lambda size: (PAYLOAD_MAGIC + bytes(size))[:size],
+        )
+        legacy = encryptor.encrypt(b"legacy")
+
+        assert legacy.startswith(PAYLOAD_MAGIC)
+        assert decode_payload(encryptor, legacy) == b"legacy"
+
+    def test_wrong_key(self, encryptor):
+        """Test that a payload cannot be decoded with another key."""
+        payload = encode_payload(encryptor, b"secret")
+        with pytest.raises(DecryptionError):
+            decode_payload(Encryptor(generate_key()), payload)
+
+
+class TestCachePayload:
+    """Tests for lazily decoded payloads."""
+
+    def test_decodes_once(self, encryptor):
+        """Test that the payload is decrypted on first access only."""
+        payload = CachePayload(encryptor, encode_json_payload(encryptor, {"a": 1}))
+        assert not payload.is_decoded
+
+        first = payload.get()
+
+        assert payload.is_decoded
+        assert first == {"a": 1}
+        assert payload.get() is first
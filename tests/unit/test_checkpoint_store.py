@@ -0,0 +1,244 @@
+"""Tests for the delta-encoded file checkpoint storage.
+
+Tests cover:
+- Delta computation and application
+- Save/load round trips through full snapshots and deltas
+- Status journaling and durability across reopen
+- Tombstoning, compaction and crash recovery
+- Storage size compared to full snapshots
+"""
+
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from elile.agent.state import InformationType
+from elile.investigation.checkpoint import (
+    CheckpointData,
+    CheckpointManager,
+    CheckpointStatus,
+)
+from elile.investigation.checkpoint_store import (
+    FileCheckpointStorage,
+    apply_delta,
+    compute_delta,
+)
+
+
+def _knowledge(n_facts: int) -> dict:
+    """Build a knowledge snapshot that grows with the iteration number."""
+    return {
+        "facts": [
+            {"fact_id": i, "type": "employment", "value": f"Employer {i}", "confidence": 0.8}
+            for i in range(n_facts)
+        ],
+        "summary": {"fact_count": n_facts, "sources": ["sterling", "checkr"]},
+    }
+
+
+class TestDeltaEncoding:
+    """Tests for compute_delta/apply_delta."""
+
+    def test_equal_values_produce_no_ops(self) -> None:
+        """Test identical values yield an empty delta."""
+        assert compute_delta({"a": [1, 2]}, {"a": [1, 2]}) == []
+
+    def test_list_append_uses_extend(self) -> None:
+        """Test appended list items are encoded as a single extend op."""
+        ops = compute_delta({"items": [1, 2]}, {"items": [1, 2, 3, 4]})
+        assert ops == [{"op": "extend", "path": ["items"], "value": [3, 4]}]
+
+    def test_round_trip_nested_changes(self) -> None:
+        """Test apply_delta reproduces the new value."""
+        old = {"a": 1, "b": {"c": [1, 2], "d": "x"}, "gone": True, "k/slash": 1}
+        new = {"a": 2, "b": {"c": [9], "d": "x", "e": None}, "k/slash": 2}
+        ops = compute_delta(old, new)
+        assert apply_delta(dict(old, b=dict(old["b"])), ops) == new
+
+    def test_unknown_operation_raises(self) -> None:
+        """Test malformed operations are rejected."""
+        with pytest.raises(ValueError):
+            apply_delta({"a": 1}, [{"op": "move", "path": ["a"]}])
+
+
+class TestFileCheckpointStorage:
+    """Tests for FileCheckpointStorage."""
+
+    def test_invalid_interval(self, tmp_path: Path) -> None:
+        """Test full_snapshot_interval must be positive."""
+        with pytest.raises(ValueError):
+            FileCheckpointStorage(tmp_path, full_snapshot_interval=0)
+
+    def test_round_trip_through_deltas(self, tmp_path: Path) -> None:
+        """Test every checkpoint reconstructs exactly after delta replay."""
+        storage = FileCheckpointStorage(tmp_path, full_snapshot_interval=4, fsync=False)
+        investigation_id = uuid4()
+
+        saved = []
+        for i in range(10):
+            checkpoint = CheckpointData(
+                investigation_id=investigation_id,
+                current_phase="foundation",
+                iteration_count=i,
+                type_states={"identity": {"iteration": i}},
+                knowledge_snapshot=_knowledge(i * 3),
+            )
+            storage.save(checkpoint)
+            saved.append(checkpoint)
+
+        assert storage.stats.full_snapshots == 3
+        assert storage.stats.deltas == 7
+
+        for checkpoint in saved:
+            loaded = storage.load(checkpoint.checkpoint_id)
+            assert loaded is not None
+            assert loaded.to_dict() == checkpoint.to_dict()
+
+    def test_load_missing(self, tmp_path: Path) -> None:
+        """Test loading unknown checkpoints returns None."""
+        storage = FileCheckpointStorage(tmp_path, fsync=False)
+        assert storage.load(uuid4()) is None
+        assert storage.load_latest(uuid4()) is None
+        assert storage.delete(uuid4()) is False
+
+    def test_reopen_restores_state_and_status(self, tmp_path: Path) -> None:
+        """Test checkpoints and statuses survive a new storage instance."""
+        storage = FileCheckpointStorage(tmp_path, full_snapshot_interval=3, fsync=False)
+        manager = CheckpointManager(storage=storage)
+        investigation_id = uuid4()
+
+        checkpoints = [
+            manager.create_checkpoint(
+                investigation_id=investigation_id,
+                current_phase="records",
+                active_types=[InformationType.CRIMINAL],
+                knowledge_snapshot=_knowledge(i),
+                iteration_count=i,
+            )
+            for i in range(5)
+        ]
+        storage.close()
+
+        reopened = FileCheckpointStorage(tmp_path, full_snapshot_interval=3, fsync=False)
+        latest = reopened.load_latest(investigation_id)
+        assert latest is not None
+        assert latest.checkpoint_id == checkpoints[-1].checkpoint_id
+        assert latest.knowledge_snapshot == _knowledge(4)
+
+        first = reopened.load(checkpoints[0].checkpoint_id)
+        assert first is not None
+        assert first.status == CheckpointStatus.SUPERSEDED
+
+        # Writes continue the existing delta chain after reopen
+        reopened.save(CheckpointData(investigation_id=investigation_id, iteration_count=99))
+        assert reopened.stats.deltas == 1
+
+    def test_status_change_does_not_rewrite_payload(self, tmp_path: Path) -> None:
+        """Test re-saving with only a status change is journaled, not rewritten."""
+        storage = FileCheckpointStorage(tmp_path, fsync=False)
+        manager = CheckpointManager(storage=storage)
+        investigation_id = uuid4()
+        manager.create_checkpoint(
+            investigation_id=investigation_id,
+            current_phase="foundation",
+            knowledge_snapshot=_knowledge(50),
+        )
+        written = storage.stats.bytes_written
+
+        result = manager.resume(investigation_id)
+
+        assert result.success is True
+        assert storage.stats.bytes_written == written
+        loaded = storage.load(result.checkpoint_id)
+        assert loaded is not None
+        assert loaded.status == CheckpointStatus.RESTORED
+
+    def test_list_checkpoints_newest_first(self, tmp_path: Path) -> None:
+        """Test listing returns newest checkpoints first."""
+        storage = FileCheckpointStorage(tmp_path, fsync=False)
+        investigation_id = uuid4()
+        for i in range(4):
+            storage.save(CheckpointData(investigation_id=investigation_id, iteration_count=i))
+
+        listed = storage.list_checkpoints(investigation_id, limit=3)
+
+        assert [cp.iteration_count for cp in listed] == [3, 2, 1]
+
+    def test_delete_keeps_dependent_deltas_readable(self, tmp_path: Path) -> None:
+        """Test deleting a chain base leaves later deltas loadable."""
+        storage = FileCheckpointStorage(
+            tmp_path, full_snapshot_interval=10, compaction_threshold=0.99, fsync=False
+        )
+        investigation_id = uuid4()
+        checkpoints = []
+        for i in range(4):
+            checkpoint = CheckpointData(
+                investigation_id=investigation_id, knowledge_snapshot=_knowledge(i + 1)
+            )
+            storage.save(checkpoint)
+            checkpoints.append(checkpoint)
+
+        assert storage.delete(checkpoints[0].checkpoint_id) is True
+        assert storage.load(checkpoints[0].checkpoint_id) is None
+
+        loaded = storage.load(checkpoints[3].checkpoint_id)
+        assert loaded is not None
+        assert loaded.knowledge_snapshot == _knowledge(4)
+
+    def test_compaction_reclaims_space(self, tmp_path: Path) -> None:
+        """Test compaction drops deleted records and preserves live ones."""
+        storage = FileCheckpointStorage(
+            tmp_path, full_snapshot_interval=1, compaction_threshold=1.0, fsync=False
+        )
+        investigation_id = uuid4()
+        checkpoints = []
+        for i in range(6):
+            checkpoint = CheckpointData(
+                investigation_id=investigation_id, knowledge_snapshot=_knowledge(20 + i)
+            )
+            storage.save(checkpoint)
+            checkpoints.append(checkpoint)
+        for checkpoint in checkpoints[:5]:
+            storage.delete(checkpoint.checkpoint_id)
+        before = storage.storage_bytes(investigation_id)
+
+        storage.compact(investigation_id)
+
+        assert storage.storage_bytes(investigation_id) < before
+        assert len(list((tmp_path / str(investigation_id)).glob("segments-*.dat"))) == 1
+        reopened = FileCheckpointStorage(tmp_path, fsync=False)
+        loaded = reopened.load(checkpoints[5].checkpoint_id)
+        assert loaded is not None
+        assert loaded.knowledge_snapshot == _knowledge(25)
+
+    def test_torn_index_write_is_ignored(self, tmp_path: Path) -> None:
+        """Test a partial trailing index line does not break reopening."""
+        storage = FileCheckpointStorage(tmp_path, fsync=False)
+        investigation_id = uuid4()
+        checkpoint = CheckpointData(investigation_id=investigation_id, iteration_count=1)
+        storage.save(checkpoint)
+
+        with (tmp_path / str(investigation_id) / "index.jsonl").open("a") as handle:
+            handle.write('{"type":"put","checkpoint_id":')
+
+        reopened = FileCheckpointStorage(tmp_path, fsync=False)
+        assert reopened.load(checkpoint.checkpoint_id) is not None
+
+    def test_deltas_smaller_than_full_snapshots(self, tmp_path: Path) -> None:
+        """Test delta encoding stores far fewer bytes than full snapshots."""
+        full = FileCheckpointStorage(tmp_path / "full", full_snapshot_interval=1, fsync=False)
+        delta = FileCheckpointStorage(tmp_path / "delta", full_snapshot_interval=20, fsync=False)
+
+        for storage in (full, delta):
+            investigation_id = uuid4()
+            for i in range(20):
+                storage.save(
+                    CheckpointData(
+                        investigation_id=investigation_id,
+                        iteration_count=i,
+                        knowledge_snapshot=_knowledge(200 + i * 5),
+                    )
+                )
+
+        assert delta.stats.bytes_written * 5 < full.stats.bytes_written
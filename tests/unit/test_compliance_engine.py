@@ -3,8 +3,10 @@
 from datetime import timedelta
 
 import pytest
+from pydantic import ValidationError
 
 from elile.agent.state import ServiceTier
+from elile.compliance.decision_table import ComplianceDecisionTable, evaluate_rules
 from elile.compliance.engine import ComplianceEngine, get_compliance_engine
 from elile.compliance.rules import ComplianceRule, RuleRepository
 from elile.compliance.types import (
@@ -420,3 +422,89 @@ class TestCustomRuleRepository:
         )
         assert result.permitted is False
         assert "Custom block" in (result.block_reason or "")
+
+
+class TestDecisionTable:
+    """Tests for the compiled decision table."""
+
+    def test_table_matches_rule_evaluation(self):
+        """Test every compiled result equals direct rule evaluation."""
+        repo = RuleRepository.with_default_rules()
+        table = ComplianceDecisionTable.compile(repo)
+
+        for locale in Locale:
+            for role in RoleCategory:
+                for tier in ServiceTier:
+                    for check_type in CheckType:
+                        expected = evaluate_rules(repo, locale, check_type, role, tier)
+                        assert table.lookup(locale, check_type, role, tier) == expected
+
+        assert len(table) == len(Locale) * len(CheckType) * len(RoleCategory) * len(ServiceTier)
+
+    def test_evaluate_context(self):
+        """Test all checks of a context are returned in one call."""
+        engine = ComplianceEngine()
+
+        results = engine.evaluate_context(Locale.EU, tier=ServiceTier.ENHANCED)
+
+        assert set(results) == set(CheckType)
+        assert results[CheckType.CREDIT_REPORT].permitted is False
+        permitted = [c for c, r in results.items() if r.permitted]
+        assert permitted == engine.get_permitted_checks(Locale.EU, tier=ServiceTier.ENHANCED)
+
+    def test_results_are_immutable(self):
+        """Test shared results cannot be modified by callers."""
+        engine = ComplianceEngine()
+        result = engine.evaluate_check(Locale.US, CheckType.CRIMINAL_NATIONAL)
+
+        with pytest.raises(ValidationError):
+            result.permitted = False
+
+    def test_tables_shared_for_same_rules(self):
+        """Test engines with identical rules reuse the compiled results."""
+        first = ComplianceEngine().evaluate_check(Locale.UK, CheckType.CREDIT_REPORT)
+        second = ComplianceEngine().evaluate_check(Locale.UK, CheckType.CREDIT_REPORT)
+
+        assert first is second
+
+    def test_reload_rules(self):
+        """Test reloading rules swaps in a newly compiled table."""
+        engine = ComplianceEngine()
+        assert engine.evaluate_check(Locale.US, CheckType.CIVIL_LITIGATION).permitted is True
+
+        engine.reload_rules(
+            [
+                ComplianceRule(
+                    locale=Locale.US,
+                    check_type=CheckType.CIVIL_LITIGATION,
+                    permitted=False,
+                    restriction_type=RestrictionType.BLOCKED,
+                )
+            ]
+        )
+
+        result = engine.evaluate_check(Locale.US_CA, CheckType.CIVIL_LITIGATION)
+        assert result.permitted is False
+        assert result.block_reason == "Check type not permitted in this jurisdiction"
+        assert CheckType.CIVIL_LITIGATION not in engine.get_permitted_checks(Locale.US)
+
+    def test_repository_changes_recompile(self):
+        """Test rules loaded into the repository directly are picked up."""
+        repo = RuleRepository()
+        engine = ComplianceEngine(rule_repository=repo)
+        assert engine.evaluate_check(Locale.JP, CheckType.CREDIT_REPORT).permitted is True
+
+        repo.load_rules(
+            [
+                ComplianceRule(
+                    locale=Locale.JP,
+                    check_type=CheckType.CREDIT_REPORT,
+                    permitted=False,
+                    notes="Blocked in Japan",
+                )
+            ]
+        )
+
+        assert engine.evaluate_check(Locale.JP, CheckType.CREDIT_REPORT).permitted is False
+        blocked = engine.get_blocked_checks(Locale.JP)
+        assert (CheckType.CREDIT_REPORT, "Blocked in Japan") in blocked
@@ -31,6 +31,12 @@ from elile.monitoring.delta_detector import (
     severity_rank,
     severity_to_delta_severity,
 )
+from elile.monitoring.fingerprints import (
+    ProfileDigest,
+    compute_profile_digest,
+    finding_fingerprint,
+    finding_key,
+)
 from elile.monitoring.types import DeltaSeverity
 from elile.risk.risk_scorer import RiskLevel, RiskScore
 
@@ -1021,3 +1027,154 @@ class TestIntegrationScenarios:
         assert len(result.resolved_findings) == 10
         assert len(result.changed_findings) == 5
         assert result.total_changes == 35
+
+
+# =============================================================================
+# Fingerprint Tests
+# =============================================================================
+
+
+class TestFingerprints:
+    """Tests for content fingerprints and profile digests."""
+
+    def test_fingerprint_ignores_ids_and_timestamps(self) -> None:
+        """Test the same finding from two screenings has the same fingerprint."""
+        first = make_finding(summary="DUI conviction")
+        second = make_finding(summary="DUI conviction")
+
+        assert first.finding_id != second.finding_id
+        assert finding_fingerprint(first) == finding_fingerprint(second)
+
+    def test_fingerprint_tracks_content(self) -> None:
+        """Test severity and details changes change the fingerprint, not the key."""
+        base = make_finding(summary="DUI conviction")
+        escalated = make_finding(summary="DUI conviction", severity=Severity.HIGH)
+        detailed = make_finding(summary="DUI conviction", details="Updated")
+
+        assert finding_fingerprint(base) != finding_fingerprint(escalated)
+        assert finding_fingerprint(base) != finding_fingerprint(detailed)
+        assert finding_key(base) == finding_key(escalated) == finding_key(detailed)
+
+    def test_key_uses_source_records(self) -> None:
+        """Test findings backed by records are identified by those records."""
+        record = DataSourceRef(provider_id="sterling", record_id="case-1")
+        first = make_finding(summary="Felony charge filed")
+        first.sources = [record]
+        reworded = make_finding(summary="Felony charge, county court")
+        reworded.sources = [DataSourceRef(provider_id="sterling", record_id="case-1")]
+
+        assert finding_key(first) == finding_key(reworded)
+
+    def test_digest_order_independent(self) -> None:
+        """Test profile digests don't depend on finding or connection order."""
+        findings = [make_finding(summary=f"Finding {i}") for i in range(5)]
+        connections = [{"entity_id": str(uuid7()), "risk_score": 0.1} for _ in range(3)]
+        risk = make_risk_score()
+
+        forward = compute_profile_digest(findings, risk, connections)
+        backward = compute_profile_digest(findings[::-1], risk, connections[::-1])
+
+        assert forward == backward
+        assert ProfileDigest.from_dict(forward.to_dict()) == forward
+
+    def test_stored_form_has_same_digest(self) -> None:
+        """Test findings and risk scores digest the same as their to_dict form."""
+        findings = [make_finding(summary=f"Finding {i}") for i in range(3)]
+        findings[0].sources = [DataSourceRef(provider_id="sterling", record_id="case-1")]
+        risk = make_risk_score(category_scores={FindingCategory.CRIMINAL: 40})
+
+        stored = compute_profile_digest([f.to_dict() for f in findings], risk.to_dict())
+
+        assert stored == compute_profile_digest(findings, risk)
+
+    def test_digest_subtrees_change_independently(self) -> None:
+        """Test only the changed subtree's digest moves."""
+        findings = [make_finding(summary="Finding")]
+        before = compute_profile_digest(findings, make_risk_score(overall_score=40))
+        after = compute_profile_digest(findings, make_risk_score(overall_score=60))
+
+        assert before.findings == after.findings
+        assert before.connections == after.connections
+        assert before.risk_score != after.risk_score
+        assert before.root != after.root
+
+
+class TestRescreenComparison:
+    """Tests for comparing profiles whose findings were re-minted."""
+
+    def test_rescreen_with_new_ids_is_unchanged(self, detector: DeltaDetector) -> None:
+        """Test a re-screen with new finding IDs reports no changes."""
+        baseline = [make_finding(summary=f"Finding {i}") for i in range(20)]
+        current = [make_finding(summary=f"Finding {i}") for i in range(20)]
+
+        result = detector.detect_deltas(
+            baseline_findings=baseline,
+            current_findings=current,
+            baseline_risk_score=make_risk_score(),
+            current_risk_score=make_risk_score(),
+        )
+
+        assert result.has_changes is False
+        assert result.deltas == []
+        assert result.summary == "No changes detected"
+
+    def test_rescreen_pairs_by_key(self, detector: DeltaDetector) -> None:
+        """Test a re-minted finding with a new severity is a change, not new+resolved."""
+        baseline = [make_finding(summary="Lien filed", severity=Severity.LOW)]
+        current = [
+            make_finding(summary="Lien filed", severity=Severity.HIGH),
+            make_finding(summary="Lawsuit filed"),
+        ]
+
+        result = detector.detect_deltas(baseline_findings=baseline, current_findings=current)
+
+        assert [f.summary for f in result.new_findings] == ["Lawsuit filed"]
+        assert result.resolved_findings == []
+        assert len(result.changed_findings) == 1
+        change = result.changed_findings[0]
+        assert change.change_type == DeltaType.FINDING_SEVERITY_INCREASED
+        assert change.finding_id == current[0].finding_id
+
+    def test_unchanged_digest_skips_comparison(
+        self, detector: DeltaDetector, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a matching stored digest short-circuits delta detection."""
+        findings = [make_finding(summary="Finding")]
+        stored = compute_profile_digest(findings, make_risk_score())
+
+        def fail(*_args: object) -> None:
+            raise AssertionError("comparison should be skipped")
+
+        monkeypatch.setattr(detector, "_compare_findings", fail)
+        monkeypatch.setattr(detector, "_compare_risk_scores", fail)
+
+        result = detector.detect_deltas(
+            baseline_findings=[],
+            current_findings=[make_finding(summary="Finding")],
+            current_risk_score=make_risk_score(),
+            baseline_digest=stored,
+        )
+
+        assert result.has_changes is False
+        assert result.current_digest == stored
+
+    def test_only_changed_subtrees_compared(
+        self, detector: DeltaDetector, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test unchanged findings are not compared when only the risk score moved."""
+        findings = [make_finding(summary="Finding")]
+
+        def fail(*_args: object) -> None:
+            raise AssertionError("findings should not be compared")
+
+        monkeypatch.setattr(detector, "_compare_findings", fail)
+
+        result = detector.detect_deltas(
+            baseline_findings=findings,
+            current_findings=findings,
+            baseline_risk_score=make_risk_score(overall_score=30),
+            current_risk_score=make_risk_score(overall_score=70, risk_level=RiskLevel.HIGH),
+        )
+
+        assert result.risk_score_change is not None
+        assert result.risk_score_change.score_change == 40
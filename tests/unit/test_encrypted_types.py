@@ -0,0 +1,202 @@
+"""Unit tests for encrypted column types and bulk field encryption."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import Integer, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from elile.core import encryption
+from elile.core.encryption import Encryptor, generate_key, reset_encryptor
+from elile.db.types import (
+    EncryptedJSON,
+    EncryptedString,
+    EncryptedValue,
+    decrypt_values,
+    decrypt_values_async,
+    encrypt_values,
+    encrypt_values_async,
+    encrypted_values,
+)
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Person(_Base):
+    __tablename__ = "test_encrypted_people"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    ssn: Mapped[str] = mapped_column(EncryptedString(lazy=True))
+    details: Mapped[dict] = mapped_column(EncryptedJSON(lazy=True))
+
+
+@pytest.fixture(autouse=True)
+def encryptor(monkeypatch) -> Encryptor:
+    """Configure a global encryptor with a random key."""
+    encryptor = Encryptor(generate_key())
+    monkeypatch.setattr(encryption, "_encryptor", encryptor)
+    return encryptor
+
+
+class TestLazyColumnTypes:
+    """Tests for lazy EncryptedString and EncryptedJSON."""
+
+    def test_eager_types_unchanged(self):
+        """Test that types without lazy still decrypt on load."""
+        column = EncryptedJSON()
+        stored = column.process_bind_param({"a": 1}, None)
+        assert column.process_result_value(stored, None) == {"a": 1}
+
+    def test_lazy_string(self):
+        """Test that a lazy string column loads a proxy."""
+        column = EncryptedString(lazy=True)
+        stored = column.process_bind_param("123-45-6789", None)
+
+        value = column.process_result_value(stored, None)
+
+        assert isinstance(value, EncryptedValue)
+        assert not value.is_decrypted
+        assert "123-45-6789" not in repr(value)
+        assert value.get() == "123-45-6789"
+        assert value.is_decrypted
+
+    def test_lazy_json(self):
+        """Test that a lazy JSON column decrypts to the original data."""
+        column = EncryptedJSON(lazy=True)
+        stored = column.process_bind_param({"name": "Jane", "ids": [1, 2]}, None)
+
+        assert column.process_result_value(stored, None).get() == {"name": "Jane", "ids": [1, 2]}
+
+    def test_proxy_binds_ciphertext(self, encryptor):
+        """Test that writing a proxy back does not re-encrypt it."""
+        column = EncryptedString(lazy=True)
+        stored = column.process_bind_param("secret", None)
+        value = column.process_result_value(stored, None)
+
+        with patch.object(encryptor, "encrypt") as encrypt:
+            assert column.process_bind_param(value, None) == stored
+            encrypt.assert_not_called()
+
+
+class TestBulkEncryption:
+    """Tests for batch encryption and decryption of column values."""
+
+    def test_decrypt_values_in_one_batch(self, encryptor):
+        """Test that pending values are decrypted with one batch call."""
+        column = EncryptedString(lazy=True)
+        values = [
+            column.process_result_value(column.process_bind_param(f"v{i}", None), None)
+            for i in range(20)
+        ]
+        values[0].get()
+
+        with patch.object(encryptor, "decrypt_many", wraps=encryptor.decrypt_many) as batch:
+            decrypt_values(values)
+
+        batch.assert_called_once()
+        assert len(batch.call_args.args[0]) == 19
+        assert [value.get() for value in values] == [f"v{i}" for i in range(20)]
+
+    def test_unencrypted_values_fall_back(self):
+        """Test that values stored unencrypted are read as plaintext."""
+        column = EncryptedJSON(lazy=True)
+        values = [
+            column.process_result_value(column.process_bind_param({"a": 1}, None), None),
+            EncryptedValue('{"b": 2}', is_json=True),
+            EncryptedValue("not json", is_json=True),
+            EncryptedValue("123-45-6789"),
+        ]
+
+        decrypt_values(values)
+
+        assert [value.get() for value in values] == [{"a": 1}, {"b": 2}, "not json", "123-45-6789"]
+
+    def test_encrypt_values_readable_by_column(self):
+        """Test that batch-encrypted values decrypt like column values."""
+        strings = encrypt_values(["a", "b"])
+        documents = encrypt_values([{"x": 1}, [1, 2]], is_json=True)
+
+        assert strings[0].is_decrypted and strings[0].get() == "a"
+        assert [EncryptedString().process_result_value(v.stored, None) for v in strings] == [
+            "a",
+            "b",
+        ]
+        assert [EncryptedJSON().process_result_value(v.stored, None) for v in documents] == [
+            {"x": 1},
+            [1, 2],
+        ]
+
+    def test_encrypt_values_without_key(self, monkeypatch):
+        """Test the unencrypted development-mode fallback."""
+        monkeypatch.setattr(encryption, "_encryptor", None)
+        with patch("elile.config.settings.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(ENCRYPTION_KEY=None)
+            values = encrypt_values([{"a": 1}], is_json=True)
+        reset_encryptor()
+
+        assert values[0].stored == '{"a":1}'
+
+    @pytest.mark.asyncio
+    async def test_async_batches(self):
+        """Test encrypting and decrypting in worker thread batches."""
+        values = await encrypt_values_async([f"v{i}" for i in range(25)], batch_size=10)
+        loaded = [EncryptedValue(value.stored) for value in values]
+
+        await decrypt_values_async(loaded, batch_size=10)
+
+        assert all(value.is_decrypted for value in loaded)
+        assert [value.get() for value in loaded] == [f"v{i}" for i in range(25)]
+
+    @pytest.mark.asyncio
+    async def test_page_load(self, db_session: AsyncSession):
+        """Test loading lazy columns and decrypting a page in bulk."""
+        await db_session.run_sync(lambda session: _Base.metadata.create_all(session.connection()))
+        ssns = await encrypt_values_async([f"000-00-{i:04d}" for i in range(5)])
+        details = await encrypt_values_async([{"index": i} for i in range(5)], is_json=True)
+        db_session.add_all(
+            _Person(id=i, ssn=ssn, details=detail)
+            for i, (ssn, detail) in enumerate(zip(ssns, details, strict=True))
+        )
+        await db_session.commit()
+        db_session.expunge_all()
+
+        people = (await db_session.execute(select(_Person).order_by(_Person.id))).scalars().all()
+        pending = encrypted_values(people)
+        assert len(pending) == 10
+
+        await decrypt_values_async(pending)
+
+        assert [person.ssn.get() for person in people] == [f"000-00-{i:04d}" for i in range(5)]
+        assert people[3].details.get() == {"index": 3}
+        assert encrypted_values(people) == []
+
+
+class TestPageLoad:
+    """Loading a page of encrypted values lazily and decrypting it in bulk.
+
+    Timings are in the encrypted_json benchmarks (tests/benchmarks).
+    """
+
+    ROWS = 1_000
+
+    @pytest.mark.asyncio
+    async def test_lazy_page_matches_eager(self):
+        """Test that a lazily loaded page decrypts in bulk to the eager values."""
+        eager, lazy = EncryptedJSON(), EncryptedJSON(lazy=True)
+        stored = [
+            eager.process_bind_param({"ssn": f"000-00-{i:04d}", "dob": "1990-01-01"}, None)
+            for i in range(self.ROWS)
+        ]
+
+        decrypted = [eager.process_result_value(value, None) for value in stored]
+        proxies = [lazy.process_result_value(value, None) for value in stored]
+        # Loading the page does not decrypt
+        assert not any(proxy.is_decrypted for proxy in proxies)
+
+        await decrypt_values_async(proxies)
+
+        assert all(proxy.is_decrypted for proxy in proxies)
+        assert [proxy.get() for proxy in proxies] == decrypted
@@ -127,6 +127,25 @@ class TestEncryptor:
         decrypted = encryptor.decrypt(ciphertext)
         assert decrypted == plaintext
 
+    def test_encrypt_many_roundtrip(self, encryptor: Encryptor):
+        """Test batch encryption is compatible with single-value decryption."""
+        plaintexts = [f"value-{i}".encode() for i in range(50)] + [b""]
+        ciphertexts = encryptor.encrypt_many(plaintexts, b"aad")
+
+        assert len({ciphertext[:NONCE_SIZE] for ciphertext in ciphertexts}) == len(plaintexts)
+        assert [encryptor.decrypt(c, b"aad") for c in ciphertexts] == plaintexts
+        assert encryptor.decrypt_many(ciphertexts, b"aad") == plaintexts
+
+    def test_decrypt_many_fails_on_bad_value(self, encryptor: Encryptor):
+        """Test batch decryption reports a tampered value."""
+        ciphertexts = encryptor.encrypt_many([b"a", b"b"])
+        ciphertexts[1] = ciphertexts[1][:-1] + bytes([ciphertexts[1][-1] ^ 1])
+
+        with pytest.raises(DecryptionError):
+            encryptor.decrypt_many(ciphertexts)
+        with pytest.raises(DecryptionError, match="too short"):
+            encryptor.decrypt_many([b"short"])
+
 
 class TestEncryptorStrings:
     """Tests for string encryption methods."""
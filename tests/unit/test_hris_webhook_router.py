@@ -9,7 +9,11 @@ from fastapi import status
 from fastapi.testclient import TestClient
 
 from elile.api.app import create_app
-from elile.api.routers.v1.hris_webhook import get_hris_gateway, reset_gateway
+from elile.api.routers.v1.hris_webhook import (
+    get_hris_gateway,
+    reset_event_processor,
+    reset_gateway,
+)
 from elile.hris import (
     HRISConnection,
     HRISConnectionStatus,
@@ -432,3 +436,104 @@ class TestWebhookSignatureValidation:
         )
 
         assert response.status_code == status.HTTP_200_OK
+
+
+class TestReceiveWebhookBatch:
+    """Tests for POST /v1/hris/webhooks/{tenant_id}/batch."""
+
+    @pytest.fixture
+    def batch_client(self, client: TestClient) -> TestClient:
+        """Client with a fresh event processor."""
+        reset_event_processor()
+        yield client
+        reset_event_processor()
+
+    def test_receive_batch_success(self, batch_client: TestClient, tenant_id: UUID) -> None:
+        """Test a batch of events is processed with per-event results."""
+        events = [
+            {"type": "hire.initiated", "employee_id": f"EMP-{i}", "name": f"Employee {i}"}
+            for i in range(5)
+        ]
+
+        response = batch_client.post(
+            f"/v1/hris/webhooks/{tenant_id}/batch",
+            json={"events": events},
+            headers={"x-signature": "valid_signature"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["received"] == 5
+        assert data["processed"] == 5
+        assert data["events_per_second"] > 0
+        assert [r["index"] for r in data["results"]] == [0, 1, 2, 3, 4]
+        assert all(r["action"] == "screening_initiated" for r in data["results"])
+
+    def test_receive_batch_rejects_and_dedups_events(
+        self, batch_client: TestClient, tenant_id: UUID
+    ) -> None:
+        """Test untyped events are rejected and repeats reported as duplicates."""
+        hire = {"type": "hire.initiated", "employee_id": "EMP-001", "name": "John Doe"}
+        events = [hire, {"employee_id": "EMP-002"}, hire]
+
+        response = batch_client.post(
+            f"/v1/hris/webhooks/{tenant_id}/batch",
+            json={"events": events},
+            headers={"x-signature": "valid_signature"},
+        )
+
+        data = response.json()
+        assert [r["status"] for r in data["results"]] == ["processed", "rejected", "duplicate"]
+        assert data["results"][1]["error_code"] == "unknown_event_type"
+        assert (data["processed"], data["rejected"], data["duplicates"]) == (1, 1, 1)
+
+    def test_receive_batch_rate_limited_events(
+        self, batch_client: TestClient, gateway: HRISGateway, tenant_id: UUID
+    ) -> None:
+        """Test events beyond the rate limit are rejected individually."""
+        gateway._event_counts[tenant_id] = gateway.config.max_events_per_minute - 1
+        events = [{"type": "hire.initiated", "employee_id": f"EMP-{i}"} for i in range(3)]
+
+        response = batch_client.post(
+            f"/v1/hris/webhooks/{tenant_id}/batch",
+            json={"events": events},
+            headers={"x-signature": "valid_signature"},
+        )
+
+        data = response.json()
+        assert [r["status"] for r in data["results"]] == ["processed", "rejected", "rejected"]
+        assert data["results"][2]["error_code"] == "rate_limited"
+
+    def test_receive_batch_invalid_signature(
+        self, batch_client: TestClient, gateway: HRISGateway, tenant_id: UUID
+    ) -> None:
+        """Test the batch signature is validated once for the whole body."""
+        gateway.register_adapter(MockHRISAdapter(should_fail_validation=True))
+
+        response = batch_client.post(
+            f"/v1/hris/webhooks/{tenant_id}/batch",
+            json={"events": [{"type": "hire.initiated", "employee_id": "EMP-001"}]},
+            headers={"x-signature": "invalid_signature"},
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_receive_batch_invalid_body(self, batch_client: TestClient, tenant_id: UUID) -> None:
+        """Test a body without events returns 400."""
+        response = batch_client.post(
+            f"/v1/hris/webhooks/{tenant_id}/batch",
+            json={"events": []},
+            headers={"x-signature": "valid_signature"},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"]["error_code"] == "invalid_payload"
+
+    def test_receive_batch_unknown_tenant(self, batch_client: TestClient) -> None:
+        """Test a batch for an unknown tenant returns 404."""
+        response = batch_client.post(
+            f"/v1/hris/webhooks/{uuid4()}/batch",
+            json={"events": [{"type": "hire.initiated", "employee_id": "EMP-001"}]},
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,175 @@
+"""Tests for lazy package namespaces and the modules loaded at cold start.
+
+Cold-start times are in the startup benchmarks (tests/benchmarks).
+"""
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+import elile
+from elile.utils.lazy import lazy_exports, parse_exports
+
+SRC = Path(elile.__file__).parents[1]
+
+LAZY_PACKAGES = sorted(
+    ".".join(path.parent.relative_to(SRC).parts)
+    for path in (SRC / "elile").rglob("__init__.py")
+    if "lazy_exports(__name__, __file__)" in path.read_text(encoding="utf-8")
+)
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    """Write a lazy package ``lazypkg`` with two submodules and import it."""
+    root = tmp_path / "lazypkg"
+    root.mkdir()
+    (root / "__init__.py").write_text(textwrap.dedent('''
+            """Lazy test package."""
+
+            from typing import TYPE_CHECKING
+
+            from elile.utils.lazy import lazy_exports
+
+            if TYPE_CHECKING:
+                from . import extra
+                from .core import Widget, make_widget as build
+                from lazypkg.core import VERSION
+
+            __getattr__, __dir__ = lazy_exports(__name__, __file__)
+
+            __all__ = ["Widget", "build", "extra", "VERSION"]
+            '''))
+    (root / "core.py").write_text(
+        "VERSION = 2\n\nclass Widget:\n    pass\n\ndef make_widget():\n    return Widget()\n"
+    )
+    (root / "extra.py").write_text("VALUE = 1\n")
+    (root / "other.py").write_text("VALUE = 3\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module("lazypkg")
+    for name in [m for m in sys.modules if m == "lazypkg" or m.startswith("lazypkg.")]:
+        del sys.modules[name]
+
+
+class TestLazyExports:
+    """Tests for lazy_exports."""
+
+    def test_parse_exports(self, package):
+        assert parse_exports("lazypkg", package.__file__) == {
+            "extra": ("lazypkg", "extra"),
+            "Widget": ("lazypkg.core", "Widget"),
+            "build": ("lazypkg.core", "make_widget"),
+            "VERSION": ("lazypkg.core", "VERSION"),
+        }
+
+    def test_nothing_imported_until_accessed(self, package):
+        assert "lazypkg.core" not in sys.modules
+
+        widget = package.build()
+
+        assert "lazypkg.core" in sys.modules
+        assert isinstance(widget, package.Widget)
+        assert "lazypkg.extra" not in sys.modules
+
+    def test_value_cached_in_namespace(self, package):
+        from lazypkg import VERSION
+
+        assert VERSION == 2
+        assert vars(package)["VERSION"] == 2
+
+    def test_submodules(self, package):
+        assert package.extra.VALUE == 1
+        # Submodules that are not re-exported still resolve as attributes
+        assert package.other.VALUE == 3
+
+    def test_star_import(self, package):
+        namespace: dict = {}
+        exec("from lazypkg import *", namespace)
+
+        assert {"Widget", "build", "extra", "VERSION"} <= set(namespace)
+
+    def test_unknown_attribute(self, package):
+        with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+            package.missing  # noqa: B018
+        with pytest.raises(AttributeError):
+            package.__wrapped__  # noqa: B018
+
+    def test_dir(self, package):
+        assert {"Widget", "build", "extra", "VERSION", "__all__"} <= set(dir(package))
+
+    def test_rejects_plain_import(self, tmp_path):
+        path = tmp_path / "bad.py"
+        path.write_text("from typing import TYPE_CHECKING\n\nif TYPE_CHECKING:\n    import json\n")
+
+        with pytest.raises(ValueError, match="from module import name"):
+            lazy_exports("bad", path)
+
+
+class TestPackageNamespaces:
+    """Every lazy package namespace still provides its public names."""
+
+    def test_packages_found(self):
+        assert {"elile.core", "elile.risk", "elile.screening", "elile.providers"} <= set(
+            LAZY_PACKAGES
+        )
+
+    @pytest.mark.parametrize("name", LAZY_PACKAGES)
+    def test_all_names_resolve(self, name):
+        module = importlib.import_module(name)
+        exports = parse_exports(name, module.__file__)
+
+        assert set(module.__all__) == set(exports)
+        for export in module.__all__:
+            assert getattr(module, export) is not None
+
+
+def cold_start(statement: str) -> list[str]:
+    """Run a statement in a fresh interpreter, listing the elile modules it loads."""
+    script = textwrap.dedent(f"""
+        import json, sys
+        {statement}
+        modules = sorted(m for m in sys.modules if m == "elile" or m.startswith("elile."))
+        print(json.dumps(modules))
+        """)
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")])),
+    }
+    completed = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", script],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+    assert completed.returncode == 0, completed.stderr
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+class TestColdStart:
+    """Modules loaded by the API and a bare worker process."""
+
+    def test_create_app(self):
+        modules = cold_start("from elile.api.app import create_app; create_app()")
+
+        # Endpoints import what they serve; report rendering and the agent graph load on use
+        assert not [m for m in modules if m.startswith("elile.reporting")]
+        assert "elile.agent.graph" not in modules
+
+    def test_worker(self):
+        modules = cold_start("from elile.screening.queue import ScreeningQueueManager")
+
+        loaded_packages = {".".join(m.split(".")[:2]) for m in modules}
+        assert not loaded_packages & {
+            "elile.investigation",
+            "elile.monitoring",
+            "elile.providers",
+            "elile.reporting",
+            "elile.risk",
+        }
@@ -0,0 +1,371 @@
+"""Tests for the LLM response cache and request coalescing.
+
+Tests cover:
+- Cache keys over model, messages, temperature and response schema
+- In-process LRU hits, TTL expiry and eviction
+- Temperature bypass
+- Fallback responses kept out of the cache
+- Coalescing of identical in-flight calls, including cancelled callers
+- SQLite backend tier and backend failure handling
+- Token and latency savings metrics
+"""
+
+import asyncio
+from pathlib import Path
+
+from prometheus_client import REGISTRY
+from pydantic import BaseModel
+
+from elile.config.settings import Settings
+from elile.models.base import (
+    BaseModelAdapter,
+    Message,
+    MessageRole,
+    ModelResponse,
+    T,
+    set_serving_model,
+)
+from elile.models.cache import (
+    CachingModelAdapter,
+    LLMCacheConfig,
+    SQLiteLLMCacheBackend,
+    create_caching_adapter,
+    make_cache_key,
+)
+
+
+class Verdict(BaseModel):
+    """Structured response used in tests."""
+
+    label: str
+    score: float
+
+
+class FakeAdapter(BaseModelAdapter):
+    """Adapter that counts provider calls."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    @property
+    def model_name(self) -> str:
+        return "fake-model"
+
+    async def generate(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> ModelResponse:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return ModelResponse(
+            content=f"answer {self.calls}",
+            model=self.model_name,
+            usage={"input_tokens": 100, "output_tokens": 20},
+        )
+
+    async def generate_structured(
+        self,
+        messages: list[Message],
+        response_model: type[T],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> T:
+        self.calls += 1
+        return response_model(label="clear", score=0.1)
+
+
+class FallbackAdapter(FakeAdapter):
+    """Adapter whose calls are answered by another model, like a scheduler fallback."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.served_by = "fallback-model"
+
+    async def generate(self, messages: list[Message], **kwargs: object) -> ModelResponse:
+        response = await super().generate(messages, **kwargs)  # type: ignore[arg-type]
+        set_serving_model(self.served_by)
+        return response.model_copy(update={"model": self.served_by})
+
+    async def generate_structured(
+        self, messages: list[Message], response_model: type[T], **kwargs: object
+    ) -> T:
+        result = await super().generate_structured(messages, response_model, **kwargs)  # type: ignore[arg-type]
+        set_serving_model(self.served_by)
+        return result
+
+
+class FailingBackend:
+    """Backend whose every operation fails."""
+
+    async def get(self, key: str) -> dict | None:
+        raise ConnectionError("backend unavailable")
+
+    async def set(self, key: str, value: dict, ttl_seconds: int) -> None:
+        raise ConnectionError("backend unavailable")
+
+
+MESSAGES = [
+    Message(role=MessageRole.SYSTEM, content="You analyze screening findings."),
+    Message(role=MessageRole.USER, content="Summarize the criminal record findings."),
+]
+
+
+class TestCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_key_is_stable(self) -> None:
+        """Test identical calls produce identical keys."""
+        assert make_cache_key("m", MESSAGES, 0.0, 100) == make_cache_key("m", MESSAGES, 0.0, 100)
+
+    def test_key_varies_with_inputs(self) -> None:
+        """Test model, messages, temperature and schema all change the key."""
+        base = make_cache_key("m", MESSAGES, 0.0, 100)
+        assert make_cache_key("other", MESSAGES, 0.0, 100) != base
+        assert make_cache_key("m", MESSAGES[:1], 0.0, 100) != base
+        assert make_cache_key("m", MESSAGES, 0.2, 100) != base
+        assert make_cache_key("m", MESSAGES, 0.0, 100, Verdict) != base
+
+
+class TestCachingModelAdapter:
+    """Tests for CachingModelAdapter."""
+
+    async def test_repeated_call_served_from_memory(self) -> None:
+        """Test a repeated deterministic call does not reach the provider."""
+        inner = FakeAdapter()
+        adapter = CachingModelAdapter(inner)
+
+        first = await adapter.generate(MESSAGES, temperature=0.0)
+        second = await adapter.generate(MESSAGES, temperature=0.0)
+
+        assert inner.calls == 1
+        assert first.cached is False
+        assert second.cached is True
+        assert second.content == first.content
+        assert adapter.stats.memory_hits == 1
+        assert adapter.stats.input_tokens_saved == 100
+        assert adapter.stats.output_tokens_saved == 20
+        assert adapter.stats.latency_saved_p50 >= 0.0
+
+    async def test_nonzero_temperature_bypasses(self) -> None:
+        """Test sampled calls are not cached by default."""
+        inner = FakeAdapter()
+        adapter = CachingModelAdapter(inner)
+
+        await adapter.generate(MESSAGES, temperature=0.7)
+        await adapter.generate(MESSAGES, temperature=0.7)
+
+        assert inner.calls == 2
+        assert adapter.stats.bypassed == 2
+
+    async def test_nonzero_temperature_opt_in(self) -> None:
+        """Test sampled calls can be cached when configured."""
+        inner = FakeAdapter()
+        adapter = CachingModelAdapter(inner, LLMCacheConfig(cache_nonzero_temperature=True))
+
+        await adapter.generate(MESSAGES, temperature=0.7)
+        await adapter.generate(MESSAGES, temperature=0.7)
+
+        assert inner.calls == 1
+
+    async def test_structured_response_cached(self) -> None:
+        """Test structured responses are cached and revalidated per caller."""
+        inner = FakeAdapter()
+        adapter = CachingModelAdapter(inner)
+
+        first = await adapter.generate_structured(MESSAGES, Verdict, temperature=0.0)
+        second = await adapter.generate_structured(MESSAGES, Verdict, temperature=0.0)
+
+        assert inner.calls == 1
+        assert second == first
+        assert second is not first
+
+    async def test_identical_in_flight_calls_coalesce(self) -> None:
+        """Test concurrent identical calls share one provider request."""
+        inner = FakeAdapter(delay=0.05)
+        adapter = CachingModelAdapter(inner)
+
+        responses = await asyncio.gather(
+            *(adapter.generate(MESSAGES, temperature=0.0) for _ in range(5))
+        )
+
+        assert inner.calls == 1
+        assert {r.content for r in responses} == {"answer 1"}
+        assert adapter.stats.coalesced == 4
+
+    async def test_cancelled_first_caller_does_not_fail_others(self) -> None:
+        """Test followers get the response when the caller that started the call is cancelled."""
+        inner = FakeAdapter(delay=0.05)
+        adapter = CachingModelAdapter(inner)
+
+        first = asyncio.create_task(adapter.generate(MESSAGES, temperature=0.0))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.create_task(adapter.generate(MESSAGES, temperature=0.0)) for _ in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        responses = await asyncio.gather(*followers)
+
+        assert first.cancelled()
+        assert {r.content for r in responses} == {"answer 1"}
+        assert inner.calls == 1
+        assert (await adapter.generate(MESSAGES, temperature=0.0)).cached is True
+
+    async def test_cancelled_follower_does_not_fail_first_caller(self) -> None:
+        """Test cancelling a coalesced caller leaves the shared call running."""
+        inner = FakeAdapter(delay=0.05)
+        adapter = CachingModelAdapter(inner)
+
+        first = asyncio.create_task(adapter.generate(MESSAGES, temperature=0.0))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(adapter.generate(MESSAGES, temperature=0.0))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+
+        response = await first
+
+        assert follower.cancelled()
+        assert response.content == "answer 1"
+        assert response.cached is False
+
+    async def test_call_cancelled_when_every_caller_is(self) -> None:
+        """Test the provider call is abandoned once no caller waits for it."""
+        inner = FakeAdapter(delay=0.05)
+        adapter = CachingModelAdapter(inner)
+
+        callers = [
+            asyncio.create_task(adapter.generate(MESSAGES, temperature=0.0)) for _ in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert not adapter._in_flight
+        response = await adapter.generate(MESSAGES, temperature=0.0)
+        assert response.cached is False
+        assert inner.calls == 2
+
+    async def test_errors_propagate_and_are_not_cached(self) -> None:
+        """Test a failed call fails every waiter and is retried next time."""
+        inner = FakeAdapter(delay=0.01, fail=True)
+        adapter = CachingModelAdapter(inner)
+
+        results = await asyncio.gather(
+            adapter.generate(MESSAGES, temperature=0.0),
+            adapter.generate(MESSAGES, temperature=0.0),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        inner.fail = False
+        response = await adapter.generate(MESSAGES, temperature=0.0)
+        assert response.cached is False
+        assert inner.calls == 2
+
+    async def test_fallback_responses_not_cached(self) -> None:
+        """Test answers from a fallback model are returned but not cached."""
+        inner = FallbackAdapter()
+        adapter = CachingModelAdapter(inner)
+
+        first = await adapter.generate(MESSAGES, temperature=0.0)
+        await adapter.generate_structured(MESSAGES, Verdict, temperature=0.0)
+        assert first.model == "fallback-model"
+        assert adapter.stats.fallbacks == 2
+
+        inner.served_by = inner.model_name
+        second = await adapter.generate(MESSAGES, temperature=0.0)
+        third = await adapter.generate(MESSAGES, temperature=0.0)
+
+        assert second.cached is False
+        assert third.cached is True
+        assert third.model == "fake-model"
+        assert inner.calls == 3
+
+    async def test_ttl_expiry(self) -> None:
+        """Test expired entries are fetched again."""
+        inner = FakeAdapter()
+        adapter = CachingModelAdapter(inner, LLMCacheConfig(ttl_seconds=0))
+
+        await adapter.generate(MESSAGES, temperature=0.0)
+        await adapter.generate(MESSAGES, temperature=0.0)
+
+        assert inner.calls == 2
+
+    async def test_lru_eviction(self) -> None:
+        """Test the least recently used entry is evicted at capacity."""
+        inner = FakeAdapter()
+        adapter = CachingModelAdapter(inner, LLMCacheConfig(max_entries=2))
+        prompts = [[Message(role=MessageRole.USER, content=f"q{i}")] for i in range(3)]
+
+        for prompt in prompts:
+            await adapter.generate(prompt, temperature=0.0)
+        await adapter.generate(prompts[2], temperature=0.0)
+        await adapter.generate(prompts[0], temperature=0.0)
+
+        assert inner.calls == 4
+
+    async def test_sqlite_backend_shared_across_instances(self, tmp_path: Path) -> None:
+        """Test a second process-level cache is served from the backend tier."""
+        backend = SQLiteLLMCacheBackend(tmp_path / "llm.sqlite3")
+        inner = FakeAdapter()
+
+        await CachingModelAdapter(inner, backend=backend).generate(MESSAGES, temperature=0.0)
+        fresh = CachingModelAdapter(inner, backend=backend)
+        response = await fresh.generate(MESSAGES, temperature=0.0)
+        backend.close()
+
+        assert inner.calls == 1
+        assert response.cached is True
+        assert fresh.stats.backend_hits == 1
+
+    async def test_backend_failure_fails_open(self) -> None:
+        """Test backend errors fall back to the provider."""
+        inner = FakeAdapter()
+        adapter = CachingModelAdapter(inner, backend=FailingBackend())
+
+        response = await adapter.generate(MESSAGES, temperature=0.0)
+
+        assert response.content == "answer 1"
+        assert (await adapter.generate(MESSAGES, temperature=0.0)).cached is True
+
+    async def test_metrics_recorded(self) -> None:
+        """Test hits report lookups and tokens saved to Prometheus."""
+        labels = {"model": "fake-model", "direction": "input"}
+        before = REGISTRY.get_sample_value("elile_llm_tokens_saved_total", labels) or 0.0
+        adapter = CachingModelAdapter(FakeAdapter())
+
+        await adapter.generate(MESSAGES, temperature=0.0)
+        await adapter.generate(MESSAGES, temperature=0.0)
+
+        after = REGISTRY.get_sample_value("elile_llm_tokens_saved_total", labels)
+        assert after - before == 100
+
+
+class TestCreateCachingAdapter:
+    """Tests for create_caching_adapter."""
+
+    def test_configured_from_settings(self, tmp_path: Path) -> None:
+        """Test settings select the backend and limits."""
+        settings = Settings(
+            llm_cache_enabled=True,
+            llm_cache_backend="sqlite",
+            llm_cache_sqlite_path=str(tmp_path / "cache.sqlite3"),
+            llm_cache_max_entries=7,
+        )
+
+        adapter = create_caching_adapter(FakeAdapter(), settings)
+
+        assert isinstance(adapter.backend, SQLiteLLMCacheBackend)
+        assert adapter.config.max_entries == 7
+        assert adapter.model_name == "fake-model"
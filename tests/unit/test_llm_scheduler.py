@@ -0,0 +1,426 @@
+"""Tests for the shared LLM call scheduler.
+
+Tests cover:
+- Rate-limit header parsing
+- Per-provider concurrency and tokens-per-minute budgets
+- Priority ordering of queued calls
+- Adaptive backoff and concurrency reduction on rate limits
+- Fallback to another provider when one is saturated
+- Simulated-provider rejections with and without the scheduler
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from elile.config.settings import ModelProvider, Settings
+from elile.models import scheduler as scheduler_module
+from elile.models.base import (
+    BaseModelAdapter,
+    Message,
+    MessageRole,
+    ModelResponse,
+    T,
+    serving_model,
+)
+from elile.models.scheduler import (
+    LLMScheduler,
+    ProviderLimits,
+    RequestPriority,
+    ScheduledModelAdapter,
+    SchedulerConfig,
+    create_scheduler,
+    llm_priority,
+    parse_retry_after,
+)
+from elile.utils.exceptions import RateLimitError
+
+MESSAGES = [Message(role=MessageRole.USER, content="Assess the employment history.")]
+
+
+class ProviderRateLimited(Exception):
+    """Provider SDK style 429 error carrying response headers."""
+
+    status_code = 429
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        super().__init__("rate limited")
+        self.headers = headers
+
+
+class SimulatedProvider(BaseModelAdapter):
+    """Provider that rejects calls above its concurrency capacity."""
+
+    def __init__(
+        self,
+        name: str = "sim",
+        capacity: int = 4,
+        latency: float = 0.01,
+        retry_after: float = 0.05,
+    ) -> None:
+        self.name = name
+        self.capacity = capacity
+        self.latency = latency
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self.rejections = 0
+        self.order: list[str] = []
+
+    @property
+    def model_name(self) -> str:
+        return self.name
+
+    async def generate(
+        self,
+        messages: list[Message],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> ModelResponse:
+        if self.in_flight >= self.capacity:
+            self.rejections += 1
+            raise ProviderRateLimited({"retry-after": str(self.retry_after)})
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.calls += 1
+        self.order.append(messages[-1].content)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        return ModelResponse(
+            content="ok",
+            model=self.name,
+            usage={"input_tokens": 10, "output_tokens": 5},
+        )
+
+    async def generate_structured(
+        self,
+        messages: list[Message],
+        response_model: type[T],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> T:
+        raise NotImplementedError
+
+
+class FakeClock:
+    """Monotonic clock advanced by the test rather than by real time."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _scheduler(
+    adapters: dict[ModelProvider, BaseModelAdapter],
+    **limits,
+) -> LLMScheduler:
+    fallback = limits.pop("fallback_order", [])
+    return LLMScheduler(
+        adapters,
+        SchedulerConfig(
+            default_limits=ProviderLimits(**limits),
+            fallback_order=fallback,
+            base_backoff_seconds=0.02,
+        ),
+    )
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    def test_retry_after_seconds(self) -> None:
+        """Test numeric retry-after and retry-after-ms."""
+        assert parse_retry_after({"Retry-After": "2"}) == 2.0
+        assert parse_retry_after({"retry-after-ms": "250"}) == 0.25
+
+    def test_openai_reset_durations(self) -> None:
+        """Test OpenAI duration headers use the longest reset."""
+        headers = {"x-ratelimit-reset-requests": "120ms", "x-ratelimit-reset-tokens": "1m30s"}
+        assert parse_retry_after(headers) == 90.0
+
+    def test_anthropic_reset_timestamp(self) -> None:
+        """Test RFC 3339 reset timestamps become a delay."""
+        reset = (datetime.now(UTC) + timedelta(seconds=30)).isoformat()
+        delay = parse_retry_after({"anthropic-ratelimit-tokens-reset": reset})
+        assert 28 <= delay <= 30
+
+    def test_retry_after_preferred_over_resets(self) -> None:
+        """Test retry-after wins over reset headers for unrelated limits."""
+        headers = {"retry-after": "3", "x-ratelimit-reset-tokens": "6m0s"}
+        assert parse_retry_after(headers) == 3.0
+
+    def test_no_delay_headers(self) -> None:
+        """Test unrelated headers give no delay."""
+        assert parse_retry_after({"content-type": "application/json"}) is None
+
+
+class TestLLMScheduler:
+    """Tests for LLMScheduler."""
+
+    async def test_concurrency_limit(self) -> None:
+        """Test no more than max_concurrency calls are in flight."""
+        provider = SimulatedProvider(capacity=100)
+        scheduler = _scheduler({ModelProvider.ANTHROPIC: provider}, max_concurrency=3)
+
+        await asyncio.gather(*(scheduler.generate(MESSAGES) for _ in range(12)))
+
+        assert provider.max_in_flight == 3
+        assert scheduler.stats.completed == 12
+
+    async def test_priority_ordering(self) -> None:
+        """Test interactive calls overtake queued batch calls."""
+        provider = SimulatedProvider(capacity=100)
+        scheduler = _scheduler({ModelProvider.ANTHROPIC: provider}, max_concurrency=1)
+
+        def call(label: str, priority: RequestPriority):
+            messages = [Message(role=MessageRole.USER, content=label)]
+            return scheduler.generate(messages, priority=priority)
+
+        first = asyncio.create_task(call("first", RequestPriority.BATCH))
+        await asyncio.sleep(0)
+        with llm_priority(RequestPriority.BATCH):
+            batch = [asyncio.create_task(call(f"batch-{i}", None)) for i in range(3)]
+        interactive = asyncio.create_task(call("interactive", RequestPriority.INTERACTIVE))
+        await asyncio.gather(first, *batch, interactive)
+
+        assert provider.order == ["first", "interactive", "batch-0", "batch-1", "batch-2"]
+
+    async def test_token_budget_delays_calls(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test calls wait for the tokens-per-minute budget to refill."""
+        clock = FakeClock()
+        monkeypatch.setattr(scheduler_module, "time", clock)
+        provider = SimulatedProvider(capacity=100, latency=0.0)
+        # 6000 TPM refills 100 tokens per second; each call reserves 40 and uses 15
+        scheduler = _scheduler(
+            {ModelProvider.ANTHROPIC: provider}, tokens_per_minute=6000, max_concurrency=10
+        )
+        lane = scheduler._lanes[ModelProvider.ANTHROPIC]
+        lane.tokens = 40
+        waits: list[float] = []
+
+        def wake_in(delay: float) -> None:
+            # Advance the clock by the requested wait instead of sleeping through it
+            waits.append(delay)
+            clock.now += delay
+            asyncio.get_running_loop().call_soon(lane._dispatch)
+
+        monkeypatch.setattr(lane, "_wake_in", wake_in)
+
+        start = clock.now
+        await asyncio.gather(*(scheduler.generate(MESSAGES, max_tokens=33) for _ in range(3)))
+
+        # The first call spends the budget; the second waits for its 40 tokens at 100/s
+        assert provider.calls == 3
+        assert waits[0] == pytest.approx(0.4)
+        assert clock.now - start >= 0.2
+        assert scheduler.stats.queue_wait_seconds > 0
+
+    async def test_rate_limit_backs_off_and_halves_concurrency(self) -> None:
+        """Test a 429 triggers retry-after backoff and a lower limit."""
+        provider = SimulatedProvider(capacity=2, retry_after=0.03)
+        scheduler = _scheduler({ModelProvider.ANTHROPIC: provider}, max_concurrency=8)
+
+        await asyncio.gather(*(scheduler.generate(MESSAGES) for _ in range(8)))
+
+        assert scheduler.stats.completed == 8
+        assert scheduler.stats.rate_limited >= 1
+        assert scheduler.load(ModelProvider.ANTHROPIC)["concurrency_limit"] < 8
+
+    async def test_no_dispatch_during_backoff(self) -> None:
+        """Test a 429 does not hand its slot to a queued call before the backoff ends."""
+
+        class LimitedOnce(SimulatedProvider):
+            async def generate(self, messages, *, temperature=0.7, max_tokens=4096):
+                now = time.monotonic()
+                if now < lane.backoff_until:
+                    dispatched_in_backoff.append(now)
+                if not self.rejections:
+                    # Reject once the other calls are queued behind this one
+                    await asyncio.sleep(0.01)
+                    self.rejections += 1
+                    raise ProviderRateLimited({"retry-after": "0.05"})
+                return await super().generate(messages, max_tokens=max_tokens)
+
+        dispatched_in_backoff: list[float] = []
+        provider = LimitedOnce(capacity=100)
+        scheduler = _scheduler({ModelProvider.ANTHROPIC: provider}, max_concurrency=1)
+        lane = scheduler._lanes[ModelProvider.ANTHROPIC]
+
+        await asyncio.gather(*(scheduler.generate(MESSAGES) for _ in range(4)))
+
+        assert scheduler.stats.rate_limited == 1
+        assert scheduler.stats.completed == 4
+        assert dispatched_in_backoff == []
+
+    async def test_gives_up_after_max_retries(self) -> None:
+        """Test persistent rate limits surface after max_retries."""
+
+        class AlwaysLimited(SimulatedProvider):
+            async def generate(self, messages, *, temperature=0.7, max_tokens=4096):
+                raise RateLimitError("quota exhausted")
+
+        scheduler = LLMScheduler(
+            {ModelProvider.ANTHROPIC: AlwaysLimited()},
+            SchedulerConfig(max_retries=2, base_backoff_seconds=0.001),
+        )
+
+        with pytest.raises(RateLimitError):
+            await scheduler.generate(MESSAGES)
+        assert scheduler.stats.rate_limited == 3
+        assert scheduler.stats.failed == 1
+
+    async def test_other_errors_propagate_without_retry(self) -> None:
+        """Test non rate-limit errors are not retried and free their slot."""
+
+        class Broken(SimulatedProvider):
+            async def generate(self, messages, *, temperature=0.7, max_tokens=4096):
+                raise ValueError("bad request")
+
+        scheduler = _scheduler({ModelProvider.ANTHROPIC: Broken()}, max_concurrency=1)
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await scheduler.generate(MESSAGES)
+        assert scheduler.load(ModelProvider.ANTHROPIC)["in_flight"] == 0
+
+    async def test_fallback_when_backing_off(self) -> None:
+        """Test calls move to the fallback provider while the primary backs off."""
+        primary = SimulatedProvider("primary", capacity=1, retry_after=0.2)
+        secondary = SimulatedProvider("secondary", capacity=100)
+        scheduler = _scheduler(
+            {ModelProvider.ANTHROPIC: primary, ModelProvider.OPENAI: secondary},
+            max_concurrency=4,
+            fallback_order=[ModelProvider.OPENAI],
+        )
+
+        responses = await asyncio.gather(*(scheduler.generate(MESSAGES) for _ in range(6)))
+
+        assert {r.model for r in responses} == {"primary", "secondary"}
+        assert scheduler.stats.fallbacks >= 1
+        assert scheduler.stats.completed == 6
+
+    async def test_fallback_when_queue_saturated(self) -> None:
+        """Test a deep queue on the primary spills to the fallback."""
+        primary = SimulatedProvider("primary", capacity=100, latency=0.05)
+        secondary = SimulatedProvider("secondary", capacity=100, latency=0.05)
+        scheduler = _scheduler(
+            {ModelProvider.ANTHROPIC: primary, ModelProvider.OPENAI: secondary},
+            max_concurrency=2,
+            saturation_queue_depth=2,
+            fallback_order=[ModelProvider.OPENAI],
+        )
+
+        await asyncio.gather(*(scheduler.generate(MESSAGES) for _ in range(8)))
+
+        assert primary.calls == 4
+        assert secondary.calls == 4
+
+    async def test_cancelled_waiter_releases_nothing(self) -> None:
+        """Test cancelling a queued call does not leak a slot."""
+        provider = SimulatedProvider(capacity=100, latency=0.02)
+        scheduler = _scheduler({ModelProvider.ANTHROPIC: provider}, max_concurrency=1)
+
+        running = asyncio.create_task(scheduler.generate(MESSAGES))
+        queued = asyncio.create_task(scheduler.generate(MESSAGES))
+        await asyncio.sleep(0)
+        queued.cancel()
+        await running
+        await scheduler.generate(MESSAGES)
+
+        assert provider.calls == 2
+        assert scheduler.load(ModelProvider.ANTHROPIC)["in_flight"] == 0
+
+
+class TestScheduledModelAdapter:
+    """Tests for ScheduledModelAdapter and create_scheduler."""
+
+    async def test_adapter_routes_through_scheduler(self) -> None:
+        """Test the adapter reports its provider model and submits calls."""
+        provider = SimulatedProvider("claude")
+        scheduler = _scheduler({ModelProvider.ANTHROPIC: provider})
+        adapter = ScheduledModelAdapter(scheduler, ModelProvider.ANTHROPIC)
+
+        response = await adapter.generate(MESSAGES)
+
+        assert adapter.model_name == "claude"
+        assert response.content == "ok"
+        assert scheduler.stats.submitted == 1
+
+    async def test_fallback_records_serving_model(self) -> None:
+        """Test a call served by the fallback provider records that provider's model."""
+        primary = SimulatedProvider("primary")
+        secondary = SimulatedProvider("secondary")
+        scheduler = _scheduler(
+            {ModelProvider.ANTHROPIC: primary, ModelProvider.OPENAI: secondary},
+            fallback_order=[ModelProvider.OPENAI],
+        )
+        adapter = ScheduledModelAdapter(scheduler, ModelProvider.ANTHROPIC)
+
+        await adapter.generate(MESSAGES)
+        assert serving_model() == "primary"
+
+        scheduler._lanes[ModelProvider.ANTHROPIC].on_rate_limit(10.0)
+        await adapter.generate(MESSAGES)
+        assert serving_model() == "secondary"
+
+    def test_create_scheduler_from_settings(self) -> None:
+        """Test settings configure limits and fallback order."""
+        settings = Settings(
+            llm_max_concurrency=5,
+            llm_tokens_per_minute=1000,
+            llm_fallback_providers=[ModelProvider.OPENAI],
+        )
+
+        scheduler = create_scheduler({ModelProvider.ANTHROPIC: SimulatedProvider()}, settings)
+
+        assert scheduler.config.default_limits.max_concurrency == 5
+        assert scheduler.config.default_limits.tokens_per_minute == 1000
+        assert scheduler.config.fallback_order == [ModelProvider.OPENAI]
+
+
+class TestSimulatedProviderRejections:
+    """Calls against a provider with a hard concurrency limit.
+
+    Throughput with and without the scheduler is measured by the
+    ``llm_scheduler`` benchmarks in tests/benchmarks/bench_models.py.
+    """
+
+    CALLS = 40
+
+    async def test_unscheduled_callers_hit_rate_limits(self) -> None:
+        """Test callers retrying on 429 exceed the provider's capacity repeatedly."""
+        provider = SimulatedProvider(capacity=4)
+
+        async def call_with_retry() -> None:
+            while True:
+                try:
+                    await provider.generate(MESSAGES)
+                    return
+                except ProviderRateLimited as exc:
+                    await asyncio.sleep(float(exc.headers["retry-after"]))
+
+        await asyncio.gather(*(call_with_retry() for _ in range(self.CALLS)))
+
+        assert provider.calls == self.CALLS
+        assert provider.rejections > self.CALLS
+
+    async def test_scheduler_stays_within_capacity(self) -> None:
+        """Test the scheduler keeps calls at the provider's capacity without 429s."""
+        provider = SimulatedProvider(capacity=4)
+        scheduler = _scheduler({ModelProvider.ANTHROPIC: provider}, max_concurrency=4)
+
+        await asyncio.gather(*(scheduler.generate(MESSAGES) for _ in range(self.CALLS)))
+
+        assert provider.calls == self.CALLS
+        assert provider.rejections == 0
+        assert provider.max_in_flight == 4
+        assert scheduler.stats.rate_limited == 0
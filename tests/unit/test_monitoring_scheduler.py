@@ -3,6 +3,7 @@
 Tests scheduling, check execution, lifecycle events, and alert generation.
 """
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from uuid import UUID, uuid7
 
@@ -10,11 +11,14 @@ import pytest
 
 from elile.agent.state import SearchDegree, ServiceTier, VigilanceLevel
 from elile.compliance.types import Locale, RoleCategory
+from elile.investigation.finding_extractor import Finding, Severity
+from elile.monitoring.fingerprints import compute_profile_digest
 from elile.monitoring.scheduler import (
     AUTO_ALERT_THRESHOLDS,
     HUMAN_REVIEW_THRESHOLDS,
     InMemoryMonitoringStore,
     MonitoringScheduler,
+    ProfileSnapshot,
     SchedulerConfig,
     create_monitoring_scheduler,
 )
@@ -28,9 +32,11 @@ from elile.monitoring.types import (
     MonitoringCheck,
     MonitoringConfig,
     MonitoringConfigError,
+    MonitoringExecutionError,
     MonitoringStatus,
     ProfileDelta,
 )
+from elile.providers.rate_limit import ProviderRateLimitRegistry, RateLimitConfig
 
 # =============================================================================
 # Fixtures
@@ -1506,3 +1512,384 @@ class TestInMemoryStore:
         checks = await store.get_checks(config_id)
 
         assert len(checks) == 2
+
+    @pytest.mark.anyio
+    async def test_due_checks_in_due_order(self, store: InMemoryMonitoringStore) -> None:
+        """Due configurations come back earliest first, and stay due until rescheduled."""
+        now = datetime.now(UTC)
+        configs = [
+            MonitoringConfig(
+                subject_id=uuid7(),
+                tenant_id=uuid7(),
+                vigilance_level=VigilanceLevel.V2,
+                baseline_profile_id=uuid7(),
+                status=MonitoringStatus.ACTIVE,
+                next_check_date=now - timedelta(hours=hours),
+            )
+            for hours in (1, 3, 2)
+        ]
+        for config in configs:
+            await store.save_config(config)
+
+        first = await store.get_due_checks(now)
+        second = await store.get_due_checks(now)
+
+        expected = [configs[1].config_id, configs[2].config_id, configs[0].config_id]
+        assert [config.config_id for config in first] == expected
+        assert [config.config_id for config in second] == expected
+
+    @pytest.mark.anyio
+    async def test_due_index_follows_saves(self, store: InMemoryMonitoringStore) -> None:
+        """Rescheduled, paused and terminated configurations leave the due index."""
+        now = datetime.now(UTC)
+        configs = [
+            MonitoringConfig(
+                subject_id=uuid7(),
+                tenant_id=uuid7(),
+                vigilance_level=VigilanceLevel.V2,
+                baseline_profile_id=uuid7(),
+                status=MonitoringStatus.ACTIVE,
+                next_check_date=now - timedelta(hours=1),
+            )
+            for _ in range(4)
+        ]
+        for config in configs:
+            await store.save_config(config)
+
+        configs[0].next_check_date = now + timedelta(days=30)
+        configs[1].status = MonitoringStatus.PAUSED
+        configs[2].status = MonitoringStatus.TERMINATED
+        configs[2].next_check_date = None
+        for config in configs[:3]:
+            await store.save_config(config)
+
+        due = await store.get_due_checks(now)
+        later = await store.get_due_checks(now + timedelta(days=31))
+
+        assert [config.config_id for config in due] == [configs[3].config_id]
+        assert {config.config_id for config in later} == {
+            configs[0].config_id,
+            configs[3].config_id,
+        }
+
+    @pytest.mark.anyio
+    async def test_subject_index_scoped_by_tenant(self, store: InMemoryMonitoringStore) -> None:
+        """Subject lookups only match within the tenant."""
+        subject_id = uuid7()
+        tenant_a, tenant_b = uuid7(), uuid7()
+        config_a = MonitoringConfig(
+            subject_id=subject_id,
+            tenant_id=tenant_a,
+            vigilance_level=VigilanceLevel.V2,
+            baseline_profile_id=uuid7(),
+        )
+        config_b = MonitoringConfig(
+            subject_id=subject_id,
+            tenant_id=tenant_b,
+            vigilance_level=VigilanceLevel.V2,
+            baseline_profile_id=uuid7(),
+        )
+        await store.save_config(config_a)
+        await store.save_config(config_b)
+
+        found_a = await store.get_config_by_subject(subject_id, tenant_a)
+        found_b = await store.get_config_by_subject(subject_id, tenant_b)
+
+        assert found_a is config_a
+        assert found_b is config_b
+        assert await store.get_config_by_subject(uuid7(), tenant_a) is None
+
+
+# =============================================================================
+# Concurrent Execution Tests
+# =============================================================================
+
+
+class SlowCheckScheduler(MonitoringScheduler):
+    """Scheduler whose checks take a moment and record concurrency."""
+
+    def __init__(self, *args: object, failing: set[UUID] | None = None, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.failing = failing or set()
+        self.running: dict[UUID | None, int] = {}
+        self.peak: dict[UUID | None, int] = {}
+
+    async def _perform_delta_detection(
+        self,
+        config: MonitoringConfig,
+        check: MonitoringCheck,
+    ) -> list[ProfileDelta]:
+        for key in (None, config.tenant_id):
+            self.running[key] = self.running.get(key, 0) + 1
+            self.peak[key] = max(self.peak.get(key, 0), self.running[key])
+        try:
+            await asyncio.sleep(0.01)
+            if config.config_id in self.failing:
+                raise RuntimeError("provider unavailable")
+            return await super()._perform_delta_detection(config, check)
+        finally:
+            for key in (None, config.tenant_id):
+                self.running[key] -= 1
+
+
+async def _schedule_due(scheduler: MonitoringScheduler, tenant_id: UUID, count: int) -> list[UUID]:
+    config_ids = []
+    for _ in range(count):
+        result = await scheduler.schedule_monitoring(
+            subject_id=uuid7(),
+            vigilance_level=VigilanceLevel.V2,
+            baseline_profile_id=uuid7(),
+            tenant_id=tenant_id,
+        )
+        config = await scheduler.store.get_config(result.config_id)
+        assert config is not None
+        config.next_check_date = datetime.now(UTC) - timedelta(hours=1)
+        await scheduler.store.save_config(config)
+        config_ids.append(config.config_id)
+    return config_ids
+
+
+class TestConcurrentExecution:
+    """Test concurrent, rate-limited execution of due checks."""
+
+    @pytest.mark.anyio
+    async def test_checks_bounded_overall_and_per_tenant(
+        self, store: InMemoryMonitoringStore
+    ) -> None:
+        """Checks run concurrently within the worker and tenant limits."""
+        scheduler = SlowCheckScheduler(
+            store,
+            SchedulerConfig(max_concurrent_checks=6, max_concurrent_checks_per_tenant=4),
+        )
+        tenants = [uuid7() for _ in range(3)]
+        for tenant_id in tenants:
+            await _schedule_due(scheduler, tenant_id, 10)
+
+        checks = await scheduler.execute_scheduled_checks()
+
+        assert len(checks) == 30
+        assert all(check.status == CheckStatus.COMPLETED for check in checks)
+        assert 1 < scheduler.peak[None] <= 6
+        assert all(scheduler.peak[tenant_id] <= 4 for tenant_id in tenants)
+
+    @pytest.mark.anyio
+    async def test_failed_check_does_not_stop_others(
+        self, store: InMemoryMonitoringStore, tenant_id: UUID
+    ) -> None:
+        """A failing check is recorded and the rest of the sweep continues."""
+        scheduler = SlowCheckScheduler(store)
+        config_ids = await _schedule_due(scheduler, tenant_id, 3)
+        scheduler.failing = {config_ids[1]}
+
+        checks = await scheduler.execute_scheduled_checks()
+
+        assert [check.monitoring_config_id for check in checks] == [
+            config_ids[0],
+            config_ids[2],
+        ]
+        failed = await store.get_checks(config_ids[1])
+        assert failed[0].status == CheckStatus.FAILED
+
+    @pytest.mark.anyio
+    async def test_provider_tokens_acquired_per_check(
+        self, store: InMemoryMonitoringStore, tenant_id: UUID
+    ) -> None:
+        """Each check takes a token from every configured provider."""
+        registry = ProviderRateLimitRegistry()
+        registry.configure_provider(
+            "sterling",
+            RateLimitConfig(tokens_per_second=500.0, max_tokens=2.0),
+        )
+        scheduler = MonitoringScheduler(
+            store,
+            SchedulerConfig(check_providers=["sterling", "world_check"]),
+            rate_limiter=registry,
+        )
+        await _schedule_due(scheduler, tenant_id, 8)
+
+        checks = await scheduler.execute_scheduled_checks()
+
+        assert len(checks) == 8
+        assert registry.get_status("sterling").requests_allowed == 8
+        assert registry.get_status("world_check").requests_allowed == 8
+
+    @pytest.mark.anyio
+    async def test_provider_token_wait_times_out(
+        self, store: InMemoryMonitoringStore, tenant_id: UUID
+    ) -> None:
+        """Checks that cannot get a token in time are recorded as failed."""
+        registry = ProviderRateLimitRegistry()
+        registry.configure_provider(
+            "sterling",
+            RateLimitConfig(tokens_per_second=0.001, max_tokens=1.0),
+        )
+        scheduler = MonitoringScheduler(
+            store,
+            SchedulerConfig(
+                check_providers=["sterling"],
+                provider_token_timeout=timedelta(milliseconds=50),
+            ),
+            rate_limiter=registry,
+        )
+        config_ids = await _schedule_due(scheduler, tenant_id, 3)
+
+        checks = await scheduler.execute_scheduled_checks()
+
+        assert len(checks) == 1
+        failed = [
+            check
+            for config_id in config_ids
+            for check in await store.get_checks(config_id)
+            if check.status == CheckStatus.FAILED
+        ]
+        assert len(failed) == 2
+        assert all("rate limit tokens" in (check.error_message or "") for check in failed)
+
+    @pytest.mark.anyio
+    async def test_unexpected_error_does_not_abandon_sweep(
+        self, store: InMemoryMonitoringStore, tenant_id: UUID, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An unexpected error is recorded for its check and the sweep completes."""
+        registry = ProviderRateLimitRegistry()
+        scheduler = MonitoringScheduler(
+            store, SchedulerConfig(check_providers=["sterling"]), rate_limiter=registry
+        )
+        config_ids = await _schedule_due(scheduler, tenant_id, 3)
+        acquire = registry.acquire
+        calls = 0
+
+        async def flaky_acquire(*args: object, **kwargs: object) -> object:
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise RuntimeError("rate limit backend unavailable")
+            return await acquire(*args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(registry, "acquire", flaky_acquire)
+
+        checks = await scheduler.execute_scheduled_checks()
+
+        assert len(checks) == 2
+        statuses = [
+            check.status for config_id in config_ids for check in await store.get_checks(config_id)
+        ]
+        assert sorted(statuses) == sorted([CheckStatus.COMPLETED] * 2 + [CheckStatus.FAILED])
+
+
+class TestScheduleJitter:
+    """Test jitter applied to check dates."""
+
+    def test_jitter_fixed_per_config_and_bounded(self, store: InMemoryMonitoringStore) -> None:
+        """Each config gets a stable offset within schedule_jitter."""
+        scheduler = MonitoringScheduler(
+            store, SchedulerConfig(schedule_jitter=timedelta(minutes=10))
+        )
+        config_ids = [uuid7() for _ in range(50)]
+
+        offsets = [scheduler.get_jitter(config_id) for config_id in config_ids]
+
+        assert offsets == [scheduler.get_jitter(config_id) for config_id in config_ids]
+        assert all(timedelta(0) <= offset < timedelta(minutes=10) for offset in offsets)
+        assert len({offset.total_seconds() // 1 for offset in offsets}) > 40
+
+    @pytest.mark.anyio
+    async def test_scheduled_dates_spread(
+        self, store: InMemoryMonitoringStore, tenant_id: UUID
+    ) -> None:
+        """Subjects scheduled together fall due at different times."""
+        scheduler = MonitoringScheduler(store, SchedulerConfig(schedule_jitter=timedelta(hours=1)))
+        start = datetime.now(UTC)
+        dates = []
+        for _ in range(20):
+            result = await scheduler.schedule_monitoring(
+                subject_id=uuid7(),
+                vigilance_level=VigilanceLevel.V2,
+                baseline_profile_id=uuid7(),
+                tenant_id=tenant_id,
+            )
+            assert result.next_check_date is not None
+            dates.append(result.next_check_date)
+
+        assert all(
+            timedelta(days=30) <= date - start < timedelta(days=30, hours=1, seconds=5)
+            for date in dates
+        )
+        assert len({date.replace(microsecond=0) for date in dates}) > 15
+
+    def test_zero_jitter(self, store: InMemoryMonitoringStore) -> None:
+        """Jitter can be disabled."""
+        scheduler = MonitoringScheduler(store, SchedulerConfig(schedule_jitter=timedelta(0)))
+
+        assert scheduler.get_jitter(uuid7()) == timedelta(0)
+
+
+# =============================================================================
+# Profile Delta Detection Tests
+# =============================================================================
+
+
+class StaticProfileSource:
+    """Profile source returning fixed baseline and current snapshots."""
+
+    def __init__(self, baseline: ProfileSnapshot | None, current: ProfileSnapshot) -> None:
+        self.baseline = baseline
+        self.current = current
+
+    async def get_baseline(
+        self, config: MonitoringConfig  # noqa: ARG002
+    ) -> ProfileSnapshot | None:
+        return self.baseline
+
+    async def screen(self, config: MonitoringConfig) -> ProfileSnapshot:  # noqa: ARG002
+        return self.current
+
+
+class TestProfileDeltaDetection:
+    """Test checks comparing profiles from a profile source."""
+
+    async def _check(
+        self, source: StaticProfileSource, tenant_id: UUID, subject_id: UUID
+    ) -> MonitoringCheck:
+        scheduler = MonitoringScheduler(InMemoryMonitoringStore(), profiles=source)
+        result = await scheduler.schedule_monitoring(
+            subject_id=subject_id,
+            vigilance_level=VigilanceLevel.V3,
+            baseline_profile_id=uuid7(),
+            tenant_id=tenant_id,
+        )
+        return await scheduler.trigger_immediate_check(result.config_id, reason="test")
+
+    @pytest.mark.anyio
+    async def test_new_finding_detected(self, tenant_id: UUID, subject_id: UUID) -> None:
+        """A finding missing from the baseline is reported as a delta."""
+        finding = Finding(finding_type="dui", summary="DUI arrest", severity=Severity.HIGH)
+        source = StaticProfileSource(ProfileSnapshot(), ProfileSnapshot(findings=[finding]))
+
+        check = await self._check(source, tenant_id, subject_id)
+
+        assert check.status == CheckStatus.COMPLETED
+        assert [d.delta_type for d in check.deltas_detected] == ["new_finding"]
+        assert check.alerts_generated
+
+    @pytest.mark.anyio
+    async def test_stored_baseline_digest_used(self, tenant_id: UUID, subject_id: UUID) -> None:
+        """The baseline's stored digest is compared instead of its findings."""
+        findings = [Finding(finding_type="dui", summary="DUI arrest", severity=Severity.HIGH)]
+        stored = compute_profile_digest(findings)
+        source = StaticProfileSource(
+            ProfileSnapshot(profile_id=uuid7(), digest=stored),
+            ProfileSnapshot(findings=findings),
+        )
+
+        check = await self._check(source, tenant_id, subject_id)
+
+        assert check.status == CheckStatus.COMPLETED
+        assert check.deltas_detected == []
+
+    @pytest.mark.anyio
+    async def test_missing_baseline_fails_check(self, tenant_id: UUID, subject_id: UUID) -> None:
+        """A check without its baseline profile fails."""
+        source = StaticProfileSource(None, ProfileSnapshot())
+
+        with pytest.raises(MonitoringExecutionError, match="Baseline profile not found"):
+            await self._check(source, tenant_id, subject_id)
@@ -0,0 +1,92 @@
+"""Tests for the shared outbox backoff and background dispatcher."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from elile.core.outbox import (
+    OutboxDispatcher,
+    OutboxDispatcherConfig,
+    get_outbox_dispatcher,
+    retry_delay,
+    start_outbox_dispatcher,
+    stop_outbox_dispatcher,
+)
+
+
+class FakeOutbox:
+    """Outbox whose dispatch returns ``due`` once and records prune cutoffs."""
+
+    def __init__(self, due: int = 0, fail: bool = False) -> None:
+        self.due = due
+        self.fail = fail
+        self.dispatched = 0
+        self.pruned: list[datetime] = []
+
+    async def dispatch(self) -> list[int]:
+        self.dispatched += 1
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        attempted, self.due = list(range(self.due)), 0
+        return attempted
+
+    async def prune(self, before: datetime) -> int:
+        self.pruned.append(before)
+        return 3
+
+
+class TestRetryDelay:
+    """Tests for the shared retry backoff."""
+
+    @pytest.mark.parametrize(("attempts", "full"), [(1, 60), (2, 120), (3, 240), (10, 3600)])
+    def test_exponential_capped_with_jitter(self, attempts, full):
+        delays = {retry_delay(attempts, 60, 3600) for _ in range(20)}
+
+        assert all(timedelta(seconds=full / 2) <= d <= timedelta(seconds=full) for d in delays)
+        assert len(delays) > 1
+
+
+class TestOutboxDispatcher:
+    """Tests for dispatching and pruning registered outboxes."""
+
+    async def test_run_once_dispatches_and_prunes(self):
+        dispatcher = OutboxDispatcher(OutboxDispatcherConfig(retention_hours=24))
+        outbox = FakeOutbox(due=4)
+        dispatcher.register("alerts", outbox.dispatch, outbox.prune)
+
+        assert await dispatcher.run_once() == 4
+        assert await dispatcher.run_once() == 0
+
+        assert outbox.dispatched == 2
+        assert len(outbox.pruned) == 1  # Prune interval not yet elapsed
+        assert dispatcher.stats.attempted == 4
+        assert dispatcher.stats.pruned == 3
+
+    async def test_failing_outbox_does_not_block_others(self):
+        dispatcher = OutboxDispatcher()
+        broken, healthy = FakeOutbox(fail=True), FakeOutbox(due=2)
+        dispatcher.register("broken", broken.dispatch)
+        dispatcher.register("healthy", healthy.dispatch, healthy.prune)
+
+        assert await dispatcher.run_once() == 2
+        assert dispatcher.stats.errors == {"broken": 1}
+
+    async def test_background_loop(self):
+        outbox = FakeOutbox(due=1)
+        dispatcher = await start_outbox_dispatcher(OutboxDispatcherConfig(interval=0.01))
+        try:
+            assert get_outbox_dispatcher() is dispatcher
+            dispatcher.register("alerts", outbox.dispatch, outbox.prune)
+            dispatcher.wake()
+            for _ in range(100):
+                if outbox.dispatched >= 2:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await stop_outbox_dispatcher()
+
+        assert outbox.dispatched >= 2
+        assert dispatcher.stats.attempted == 1
+        assert not dispatcher.is_running
+        assert get_outbox_dispatcher() is None
@@ -0,0 +1,381 @@
+"""Unit tests for compact (delta) profile storage."""
+
+from typing import Any
+from uuid import uuid7
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from elile.db.models.entity import Entity, EntityType
+from elile.db.models.profile import EntityProfile, ProfileEncoding, ProfileTrigger
+from elile.db.profile_delta import (
+    SNAPSHOT_FIELDS,
+    apply_snapshot_delta,
+    apply_value,
+    decode_delta,
+    diff_snapshot,
+    diff_value,
+    encode_delta,
+    snapshot_size,
+)
+from elile.db.repositories import ProfileRepository
+from elile.investigation.finding_extractor import Finding
+from elile.monitoring.fingerprints import compute_profile_digest
+from elile.risk.risk_scorer import RiskLevel, RiskScore
+
+
+def _finding(i: int) -> dict[str, Any]:
+    return {
+        "finding_id": f"f-{i}",
+        "finding_type": "criminal_record",
+        "severity": "medium",
+        "summary": f"Court record {i} found in county search",
+        "details": {"court": "Springfield County", "case_number": f"CR-{1000 + i}"},
+        "sources": [{"provider_id": "courts", "record_id": f"r-{i}"}],
+    }
+
+
+def _snapshot(findings: int, score: float = 0.4) -> dict[str, Any]:
+    return {
+        "findings": {"items": [_finding(i) for i in range(findings)]},
+        "risk_score": {"overall": score, "level": "moderate", "categories": {"criminal": score}},
+        "connections": {
+            "nodes": [{"id": f"n-{i}", "name": f"Associate {i}"} for i in range(10)],
+            "edges": [{"from": "n-0", "to": f"n-{i}"} for i in range(1, 10)],
+        },
+        "data_sources_used": [{"provider": f"provider-{i}"} for i in range(6)],
+        "stale_data_used": {},
+    }
+
+
+class TestDeltaCodec:
+    """Tests for snapshot delta encoding."""
+
+    def test_unchanged_snapshot_has_empty_delta(self):
+        """Test that identical snapshots produce an empty delta."""
+        assert diff_snapshot(_snapshot(5), _snapshot(5)) == {}
+
+    def test_dict_patch(self):
+        """Test that dict changes are encoded as set, delete and nested patches."""
+        old = {"a": 1, "b": {"c": 2, "d": 3}, "e": 4}
+        new = {"a": 1, "b": {"c": 5, "d": 3}, "f": 6}
+        operation = diff_value(old, new)
+        assert operation == {
+            "d": {"set": {"f": 6}, "sub": {"b": {"d": {"sub": {"c": {"v": 5}}}}}, "del": ["e"]}
+        }
+        assert apply_value(old, operation) == new
+
+    def test_list_splice(self):
+        """Test that list changes keep the common prefix and suffix."""
+        old = [1, 2, 3, 4, 5]
+        new = [1, 2, 9, 9, 4, 5, 6]
+        operation = diff_value(old, new)
+        assert apply_value(old, operation) == new
+        appended = diff_value(old, [*old, 6])
+        assert appended == {"l": [5, 0, [6]]}
+
+    def test_type_change_replaces(self):
+        """Test that a change of type replaces the value."""
+        assert diff_value([1], {"a": 1}) == {"v": {"a": 1}}
+
+    def test_round_trip(self):
+        """Test that encoded deltas rebuild the snapshot."""
+        old = _snapshot(10)
+        new = _snapshot(11, score=0.7)
+        new["findings"]["items"][3]["severity"] = "high"
+        new["stale_data_used"] = {"provider-2": "2026-01-01"}
+
+        data = encode_delta(diff_snapshot(old, new))
+
+        assert apply_snapshot_delta(old, decode_delta(data)) == new
+        assert len(data) < snapshot_size(new) / 5
+
+    def test_unknown_operation(self):
+        """Test that unknown operations are rejected."""
+        with pytest.raises(ValueError):
+            apply_value({}, {"x": 1})
+
+
+class TestCompactProfileStorage:
+    """Tests for compact storage in ProfileRepository."""
+
+    @pytest_asyncio.fixture
+    async def entity(self, db_session: AsyncSession) -> Entity:
+        """Create a test entity."""
+        entity = Entity(
+            entity_id=uuid7(),
+            entity_type=EntityType.INDIVIDUAL.value,
+            canonical_identifiers={},
+        )
+        db_session.add(entity)
+        await db_session.commit()
+        return entity
+
+    @pytest_asyncio.fixture
+    async def repo(self, db_session: AsyncSession) -> ProfileRepository:
+        """Create a compact profile repository."""
+        return ProfileRepository(db_session, compact=True, max_delta_chain=4)
+
+    def _profile(self, entity: Entity, version: int, snapshot: dict[str, Any]) -> EntityProfile:
+        return EntityProfile(
+            entity_id=entity.entity_id,
+            version=version,
+            trigger_type=ProfileTrigger.MONITORING.value,
+            connection_count=len(snapshot["connections"]["nodes"]),
+            evolution_signals={},
+            **snapshot,
+        )
+
+    async def _write_history(self, repo, entity, versions: int) -> list[dict[str, Any]]:
+        snapshots = []
+        for version in range(1, versions + 1):
+            snapshot = _snapshot(version // 2, score=0.1 * (version % 3))
+            snapshots.append(snapshot)
+            await repo.create(self._profile(entity, version, snapshot))
+        return snapshots
+
+    @pytest.mark.asyncio
+    async def test_periodic_full_snapshots(self, repo, entity, db_session):
+        """Test that a full snapshot starts every chain of deltas."""
+        await self._write_history(repo, entity, 12)
+
+        rows = (
+            await db_session.execute(
+                select(
+                    EntityProfile.version,
+                    EntityProfile.encoding,
+                    EntityProfile.base_version,
+                    EntityProfile.chain_start,
+                    EntityProfile.findings,
+                )
+                .where(EntityProfile.entity_id == entity.entity_id)
+                .order_by(EntityProfile.version)
+            )
+        ).all()
+
+        full = [row.version for row in rows if row.encoding == ProfileEncoding.FULL.value]
+        assert full == [1, 6, 11]
+        for row in rows:
+            if row.encoding == ProfileEncoding.DELTA.value:
+                assert row.base_version == row.version - 1
+                assert row.chain_start == max(v for v in full if v < row.version)
+                assert row.findings is None
+
+    @pytest.mark.asyncio
+    async def test_created_profile_keeps_snapshot(self, repo, entity):
+        """Test that a created delta row still exposes its snapshot."""
+        await repo.create(self._profile(entity, 1, _snapshot(3)))
+        created = await repo.create(self._profile(entity, 2, _snapshot(4)))
+
+        assert created.encoding == ProfileEncoding.DELTA.value
+        assert created.findings == _snapshot(4)["findings"]
+
+    @pytest.mark.asyncio
+    async def test_digest_stored_with_each_version(self, repo, entity):
+        """Test that versions store the digest the delta detector compares."""
+        findings = [Finding(finding_type="dui", summary=f"Finding {i}") for i in range(3)]
+        risk = RiskScore(overall_score=40, risk_level=RiskLevel.MODERATE)
+        snapshot = {
+            "findings": [finding.to_dict() for finding in findings],
+            "risk_score": risk.to_dict(),
+            "connections": [],
+            "data_sources_used": [],
+            "stale_data_used": {},
+        }
+
+        created = await repo.create(
+            EntityProfile(
+                entity_id=entity.entity_id,
+                version=1,
+                trigger_type=ProfileTrigger.SCREENING.value,
+                connection_count=0,
+                evolution_signals={},
+                **snapshot,
+            )
+        )
+        assert created.digest == compute_profile_digest(findings, risk, []).to_dict()
+
+        updated = await repo.update(created, {"findings": snapshot["findings"][:1]})
+        assert updated.digest == compute_profile_digest(findings[:1], risk, []).to_dict()
+
+        # Snapshots not in the detector's shape get no digest
+        other = await repo.create(self._profile(entity, 2, _snapshot(3)))
+        assert other.digest is None
+
+    @pytest.mark.asyncio
+    async def test_reads_rebuild_versions(self, repo, entity, db_session):
+        """Test that every read path rebuilds delta rows."""
+        snapshots = await self._write_history(repo, entity, 12)
+        db_session.expunge_all()
+
+        for version in (12, 7, 3):
+            profile = await repo.get_by_version(entity.entity_id, version)
+            for name in SNAPSHOT_FIELDS:
+                assert getattr(profile, name) == snapshots[version - 1][name]
+
+        db_session.expunge_all()
+        latest = await repo.get_latest(entity.entity_id)
+        assert latest.version == 12
+        assert latest.findings == snapshots[-1]["findings"]
+
+        db_session.expunge_all()
+        history = await repo.get_by_entity(entity.entity_id)
+        assert [p.version for p in history] == list(range(12, 0, -1))
+        for profile in history:
+            assert profile.risk_score == snapshots[profile.version - 1]["risk_score"]
+        assert not db_session.dirty
+
+        fetched = await repo.get(history[0].profile_id)
+        assert fetched.findings == snapshots[-1]["findings"]
+
+    @pytest.mark.asyncio
+    async def test_rebuilt_versions_are_independent(self, repo, entity, db_session):
+        """Test that versions rebuilt together do not share objects."""
+        await self._write_history(repo, entity, 4)
+        db_session.expunge_all()
+
+        history = await repo.get_by_entity(entity.entity_id)
+        history[0].findings["items"].append({"finding_id": "extra"})
+
+        assert all(
+            {"finding_id": "extra"} not in profile.findings["items"] for profile in history[1:]
+        )
+
+    @pytest.mark.asyncio
+    async def test_extends_existing_full_rows(self, repo, entity, db_session):
+        """Test that compact writes build on rows stored in full."""
+        legacy = ProfileRepository(db_session)
+        await legacy.create(self._profile(entity, 1, _snapshot(2)))
+
+        created = await repo.create(self._profile(entity, 2, _snapshot(3)))
+        db_session.expunge_all()
+
+        assert created.encoding == ProfileEncoding.DELTA.value
+        profile = await legacy.get_by_version(entity.entity_id, 2)
+        assert profile.findings == _snapshot(3)["findings"]
+
+    @pytest.mark.asyncio
+    async def test_create_many_chains_batch(self, repo, entity, db_session):
+        """Test that a batch of versions is encoded against itself."""
+        snapshots = [_snapshot(i) for i in range(1, 4)]
+        await repo.create_many(
+            [self._profile(entity, v, s) for v, s in reversed(list(enumerate(snapshots, 1)))]
+        )
+        db_session.expunge_all()
+
+        history = await repo.get_by_entity(entity.entity_id)
+        assert [p.encoding for p in history] == ["delta", "delta", "full"]
+        assert [p.findings for p in reversed(history)] == [s["findings"] for s in snapshots]
+
+    @pytest.mark.asyncio
+    async def test_broken_chain(self, repo, entity, db_session):
+        """Test that a missing version in a chain is reported."""
+        await self._write_history(repo, entity, 3)
+        middle = await repo.get_by_version(entity.entity_id, 2)
+        await db_session.delete(middle)
+        await db_session.commit()
+        db_session.expunge_all()
+
+        with pytest.raises(ValueError, match="Broken profile delta chain"):
+            await repo.get_by_version(entity.entity_id, 3)
+
+    @pytest.mark.asyncio
+    async def test_update_keeps_chain(self, repo, entity, db_session):
+        """Test that updating a version keeps the versions built on it intact."""
+        snapshots = await self._write_history(repo, entity, 5)
+        middle = await repo.get_by_version(entity.entity_id, 3)
+        snapshots[2] = {**snapshots[2], "findings": _snapshot(7)["findings"]}
+
+        await repo.update(middle, {"findings": snapshots[2]["findings"]})
+        db_session.expunge_all()
+
+        history = await repo.get_by_entity(entity.entity_id)
+        assert [p.encoding for p in reversed(history)] == [
+            "full",
+            "delta",
+            "full",
+            "delta",
+            "delta",
+        ]
+        for profile in history:
+            for name in SNAPSHOT_FIELDS:
+                assert getattr(profile, name) == snapshots[profile.version - 1][name]
+
+    @pytest.mark.asyncio
+    async def test_delete_keeps_chain(self, repo, entity, db_session):
+        """Test that deleting a version stores the delta row built on it in full."""
+        snapshots = await self._write_history(repo, entity, 5)
+        middle = await repo.get_by_version(entity.entity_id, 3)
+
+        await repo.delete(middle)
+        db_session.expunge_all()
+
+        history = await repo.get_by_entity(entity.entity_id)
+        assert [p.version for p in history] == [5, 4, 2, 1]
+        assert [p.encoding for p in history] == ["delta", "full", "delta", "full"]
+        for profile in history:
+            for name in SNAPSHOT_FIELDS:
+                assert getattr(profile, name) == snapshots[profile.version - 1][name]
+
+
+class TestCompactStorageSize:
+    """Bytes per version of compact profile storage.
+
+    Read latency of full and compact storage is measured by the
+    ``profile_repository`` benchmarks in tests/benchmarks/bench_storage.py.
+    """
+
+    VERSIONS = 60
+
+    async def _store(self, db_session: AsyncSession, compact: bool) -> tuple[Entity, float]:
+        entity = Entity(
+            entity_id=uuid7(),
+            entity_type=EntityType.INDIVIDUAL.value,
+            canonical_identifiers={},
+        )
+        db_session.add(entity)
+        await db_session.commit()
+
+        repo = ProfileRepository(db_session, compact=compact)
+        profiles = []
+        for version in range(1, self.VERSIONS + 1):
+            # Monitoring checks mostly find nothing new
+            snapshot = _snapshot(40 + version // 10)
+            profiles.append(
+                EntityProfile(
+                    entity_id=entity.entity_id,
+                    version=version,
+                    trigger_type=ProfileTrigger.MONITORING.value,
+                    connection_count=10,
+                    evolution_signals={},
+                    **snapshot,
+                )
+            )
+        await repo.create_many(profiles)
+
+        stored = sum(
+            (
+                snapshot_size({name: getattr(p, name) for name in SNAPSHOT_FIELDS})
+                if p.encoding == ProfileEncoding.FULL.value
+                else len(p.snapshot_delta)
+            )
+            for p in profiles
+        )
+        return entity, stored / self.VERSIONS
+
+    @pytest.mark.asyncio
+    async def test_bytes_per_version(self, db_session):
+        """Test that compact storage shrinks history tenfold."""
+        _, full_bytes = await self._store(db_session, compact=False)
+        compact_entity, compact_bytes = await self._store(db_session, compact=True)
+
+        count = await db_session.scalar(
+            select(func.count(EntityProfile.profile_id)).where(
+                EntityProfile.entity_id == compact_entity.entity_id,
+                EntityProfile.encoding == ProfileEncoding.DELTA.value,
+            )
+        )
+        assert count == self.VERSIONS - 3  # full snapshots at versions 1, 22 and 43
+        assert compact_bytes < full_bytes / 10
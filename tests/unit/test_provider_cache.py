@@ -3,15 +3,20 @@
 Tests the ProviderCacheService and related classes.
 """
 
+import json
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
+from sqlalchemy import inspect, update
 
 from elile.compliance.types import CheckType, Locale
+from elile.core.encryption import Encryptor, generate_key
 from elile.db.models.cache import CachedDataSource, DataOrigin, FreshnessStatus
+from elile.db.models.entity import Entity, EntityType
 from elile.providers import (
     CacheEntry,
     CacheFreshnessConfig,
@@ -688,3 +693,166 @@ class TestTenantIsolation:
             )
 
             assert result_b.hit is True
+
+
+# =============================================================================
+# Compressed Payload Tests
+# =============================================================================
+
+
+class TestCompressedPayloads:
+    """Tests for compressed, lazily decrypted cache payloads."""
+
+    @pytest_asyncio.fixture
+    async def entity_ids(self, db_session):
+        """Create test entities."""
+        entities = [
+            Entity(entity_type=EntityType.INDIVIDUAL.value, canonical_identifiers={})
+            for _ in range(3)
+        ]
+        db_session.add_all(entities)
+        await db_session.commit()
+        return [entity.entity_id for entity in entities]
+
+    @pytest.fixture
+    def encryptor(self):
+        """Create an encryptor that records decryptions."""
+        encryptor = Encryptor(generate_key())
+        encryptor.decrypt = MagicMock(wraps=encryptor.decrypt)
+        return encryptor
+
+    @pytest.fixture
+    def cache_service(self, db_session, encryptor):
+        """Create cache service backed by the test database."""
+        return ProviderCacheService(session=db_session, encryptor=encryptor)
+
+    def _result(self, records: int, check_type=CheckType.CRIMINAL_NATIONAL) -> ProviderResult:
+        return ProviderResult(
+            provider_id="sterling",
+            check_type=check_type,
+            locale=Locale.US,
+            success=True,
+            normalized_data={
+                "records": [
+                    {"case_number": f"CR-{i}", "court": "Springfield County", "status": "closed"}
+                    for i in range(records)
+                ]
+            },
+            cost_incurred=Decimal("5.00"),
+        )
+
+    @pytest.mark.asyncio
+    async def test_store_compresses_payloads(self, cache_service, entity_ids):
+        """Test that stored payloads are compressed and encrypted."""
+        result = self._result(200)
+        entry = await cache_service.store(entity_ids[0], result, raw_response="x" * 10_000)
+
+        payloads = await cache_service._repository.get_payloads([entry.cache_id])
+        data, payload = payloads[entry.cache_id]
+
+        assert data is None
+        assert len(payload) < len(json.dumps(result.normalized_data)) / 5
+        raw = await cache_service._repository.get_raw_response(entry.cache_id)
+        assert len(raw) < 1_000
+        assert await cache_service.get_raw_response(entry.cache_id) == b"x" * 10_000
+
+    @pytest.mark.asyncio
+    async def test_metadata_queries_skip_payload(self, cache_service, db_session, entity_ids):
+        """Test that payload columns are not loaded by metadata queries."""
+        await cache_service.store(entity_ids[0], self._result(5))
+        db_session.expunge_all()
+
+        models = await cache_service._repository.get_for_entity(entity_ids[0])
+
+        unloaded = inspect(models[0]).unloaded
+        assert {"raw_response", "normalized_payload", "normalized_data"} <= unloaded
+
+    @pytest.mark.asyncio
+    async def test_get_decrypts_on_access(self, cache_service, encryptor, db_session, entity_ids):
+        """Test that a cache hit is only decrypted when its data is read."""
+        result = self._result(5)
+        await cache_service.store(entity_ids[0], result)
+        db_session.expunge_all()
+        encryptor.decrypt.reset_mock()
+
+        lookup = await cache_service.get(entity_ids[0], "sterling", "criminal_national")
+
+        assert lookup.is_fresh_hit
+        encryptor.decrypt.assert_not_called()
+        assert lookup.entry.normalized_data == result.normalized_data
+        assert lookup.entry.normalized_data == result.normalized_data
+        encryptor.decrypt.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stale_hit_loads_payload(self, cache_service, db_session, entity_ids):
+        """Test that a stale hit reads its payload."""
+        result = self._result(3)
+        entry = await cache_service.store(entity_ids[0], result)
+        now = datetime.now(UTC)
+        await db_session.execute(
+            update(CachedDataSource)
+            .where(CachedDataSource.cache_id == entry.cache_id)
+            .values(fresh_until=now - timedelta(days=1))
+        )
+        await db_session.commit()
+        db_session.expunge_all()
+
+        lookup = await cache_service.get(entity_ids[0], "sterling", "criminal_national")
+
+        assert lookup.is_stale_hit
+        assert lookup.entry.normalized_data == result.normalized_data
+
+    @pytest.mark.asyncio
+    async def test_get_many(self, cache_service, encryptor, db_session, entity_ids):
+        """Test bulk lookups across entities, including legacy rows."""
+        tenant_a, tenant_b = uuid4(), uuid4()
+        first = self._result(2)
+        second = self._result(4, CheckType.IDENTITY_BASIC)
+        await cache_service.store(entity_ids[0], first)
+        await cache_service.store(
+            entity_ids[1],
+            second,
+            tenant_id=tenant_b,
+            data_origin=DataOrigin.CUSTOMER_PROVIDED,
+        )
+        now = datetime.now(UTC)
+        db_session.add(
+            CachedDataSource(
+                entity_id=entity_ids[2],
+                provider_id="sterling",
+                check_type="criminal_national",
+                data_origin=DataOrigin.PAID_EXTERNAL.value,
+                acquired_at=now,
+                freshness_status=FreshnessStatus.FRESH.value,
+                fresh_until=now + timedelta(days=7),
+                stale_until=now + timedelta(days=30),
+                raw_response=b"legacy",
+                normalized_data={"legacy": True},
+                cost_incurred=Decimal("1.00"),
+            )
+        )
+        await db_session.commit()
+        db_session.expunge_all()
+        encryptor.decrypt.reset_mock()
+
+        keys = [
+            (entity_ids[0], "sterling", "criminal_national"),
+            (entity_ids[1], "sterling", "identity_basic"),
+            (entity_ids[2], "sterling", "criminal_national"),
+            (entity_ids[0], "sterling", "identity_basic"),
+        ]
+        results = await cache_service.get_many(keys, tenant_id=tenant_a)
+
+        assert results[keys[0]].is_fresh_hit
+        assert results[keys[0]].entry.normalized_data == first.normalized_data
+        assert results[keys[1]].hit is False  # Other tenant's data
+        assert results[keys[2]].entry.normalized_data == {"legacy": True}
+        assert results[keys[3]].hit is False
+        # Hits were decrypted up front, off the event loop
+        encryptor.decrypt.assert_called_once()
+        assert cache_service.stats.lookups == 4
+        assert cache_service.stats.fresh_hits == 2
+        assert cache_service.stats.misses == 2
+
+        results = await cache_service.get_many([keys[1]], tenant_id=tenant_b)
+        assert results[keys[1]].entry.normalized_data == second.normalized_data
@@ -0,0 +1,397 @@
+"""Tests for shared provider reference data."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from elile.config.settings import Settings
+from elile.providers import reference_data
+from elile.providers.darkweb import BREACHES, BreachDatabase
+from elile.providers.education import (
+    DIPLOMA_MILLS,
+    INSTITUTIONS,
+    DiplomaMilDetector,
+    EducationProvider,
+    Institution,
+    InstitutionType,
+)
+from elile.providers.reference_data import (
+    ReferenceDataConfig,
+    ReferenceDataError,
+    ReferenceDataset,
+    configure_reference_data,
+    get_reference_data_config,
+    get_reference_dataset,
+    list_reference_datasets,
+    preload_reference_data,
+    read_snapshot,
+    reference_dataset,
+    reload_reference_data,
+    reset_reference_data,
+    write_snapshot,
+)
+from elile.providers.sanctions import (
+    SANCTIONS_LISTS,
+    SanctionedEntity,
+    SanctionsList,
+    SanctionsProvider,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    """Unload the registered datasets after each test."""
+    yield
+    reset_reference_data()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the monotonic clock used for reload checks."""
+
+    class Clock:
+        now = 1000.0
+
+    monkeypatch.setattr(reference_data.time, "monotonic", lambda: Clock.now)
+    return Clock
+
+
+def counting_builder(value: object = None):
+    """Builder returning ``value`` (default: a fresh dict) and counting its calls."""
+
+    def builder():
+        builder.calls += 1
+        return {"build": builder.calls} if value is None else value
+
+    builder.calls = 0
+    return builder
+
+
+def snapshots(tmp_path: Path, **kwargs: float) -> ReferenceDataConfig:
+    return ReferenceDataConfig(directory=tmp_path, **kwargs)
+
+
+class TestReferenceDataset:
+    """Tests for loading datasets in memory."""
+
+    def test_loads_on_first_use_only(self):
+        builder = counting_builder()
+        dataset = ReferenceDataset("test.lazy", builder, config=ReferenceDataConfig())
+
+        assert not dataset.is_loaded
+        assert builder.calls == 0
+
+        first = dataset.get()
+        assert dataset.get() is first
+        assert builder.calls == 1
+        assert dataset.source == "builder"
+        assert dataset.generation == 1
+        assert dataset.loaded_at is not None
+
+    def test_derived_built_once_per_generation(self):
+        dataset = ReferenceDataset("test.derived", counting_builder(), config=ReferenceDataConfig())
+        calls = []
+
+        def factory(data):
+            calls.append(data)
+            return sorted(data)
+
+        assert dataset.derived("keys", factory) is dataset.derived("keys", factory)
+        assert len(calls) == 1
+
+        dataset.publish({"b": 1, "a": 2})
+
+        assert dataset.derived("keys", factory) == ["a", "b"]
+        assert len(calls) == 2
+
+    def test_publish_without_snapshots(self):
+        dataset = ReferenceDataset("test.publish", counting_builder(), config=ReferenceDataConfig())
+        dataset.get()
+
+        dataset.publish({"published": True})
+
+        assert dataset.get() == {"published": True}
+        assert dataset.source == "publish"
+        assert dataset.generation == 2
+
+    def test_forced_reload_rebuilds_without_snapshots(self):
+        builder = counting_builder()
+        dataset = ReferenceDataset("test.rebuild", builder, config=ReferenceDataConfig())
+        dataset.get()
+
+        assert not dataset.reload()
+        assert dataset.reload(force=True)
+        assert dataset.get() == {"build": 2}
+
+    def test_unload(self):
+        builder = counting_builder()
+        dataset = ReferenceDataset("test.unload", builder, config=ReferenceDataConfig())
+        dataset.get()
+
+        dataset.unload()
+
+        assert not dataset.is_loaded
+        assert dataset.get() == {"build": 2}
+
+
+class TestSnapshots:
+    """Tests for snapshot files shared between processes."""
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "data.snapshot"
+        write_snapshot(path, "test.data", 3, {"names": ["a", "b"]})
+
+        data, metadata, _ = read_snapshot(path, "test.data", 3)
+
+        assert data == {"names": ["a", "b"]}
+        assert metadata["dataset"] == "test.data"
+        assert metadata["version"] == 3
+        assert [p.name for p in tmp_path.iterdir()] == ["data.snapshot"]
+
+    def test_typed_round_trip_is_json(self, tmp_path):
+        path = tmp_path / "data.snapshot"
+        lists = SANCTIONS_LISTS.get()
+        write_snapshot(path, "test.lists", 1, lists, data_type=SANCTIONS_LISTS.data_type)
+
+        data, _, _ = read_snapshot(path, "test.lists", 1, data_type=SANCTIONS_LISTS.data_type)
+
+        assert data == lists
+        assert isinstance(data[SanctionsList.OFAC_SDN][0], SanctionedEntity)
+        content = path.read_bytes()
+        metadata_length = int.from_bytes(content[6:10], "big")
+        assert SanctionsList.OFAC_SDN.value in json.loads(content[10 + metadata_length :])
+
+    def test_payload_validated(self, tmp_path):
+        path = tmp_path / "data.snapshot"
+        write_snapshot(path, "test.data", 1, {"names": ["a"]})
+
+        with pytest.raises(ReferenceDataError, match="invalid payload"):
+            read_snapshot(path, "test.data", 1, data_type=dict[str, int])
+
+    @pytest.mark.parametrize(
+        ("name", "version"), [("test.other", 3), ("test.data", 4)], ids=["name", "version"]
+    )
+    def test_mismatch_rejected(self, tmp_path, name, version):
+        path = tmp_path / "data.snapshot"
+        write_snapshot(path, "test.data", 3, [1])
+
+        with pytest.raises(ReferenceDataError, match="holds 'test.data'"):
+            read_snapshot(path, name, version)
+
+    @pytest.mark.parametrize("content", [b"", b"ELRD", b"not a snapshot at all"])
+    def test_invalid_files_rejected(self, tmp_path, content):
+        path = tmp_path / "data.snapshot"
+        path.write_bytes(content)
+
+        with pytest.raises(ReferenceDataError):
+            read_snapshot(path, "test.data", 1)
+
+    def test_second_process_loads_snapshot(self, tmp_path):
+        config = snapshots(tmp_path)
+        first_builder, second_builder = counting_builder(), counting_builder()
+        first = ReferenceDataset("test.shared", first_builder, config=config)
+        second = ReferenceDataset("test.shared", second_builder, config=config)
+
+        assert first.get() == {"build": 1}
+        assert first.snapshot_path == tmp_path / "test.shared.v1.snapshot"
+        assert first.snapshot_path.exists()
+
+        assert second.get() == {"build": 1}
+        assert second.source == "snapshot"
+        assert second_builder.calls == 0
+
+    def test_version_bump_ignores_old_snapshot(self, tmp_path):
+        config = snapshots(tmp_path)
+        ReferenceDataset("test.versioned", counting_builder([1]), config=config).get()
+        builder = counting_builder([1, 2])
+        dataset = ReferenceDataset("test.versioned", builder, version=2, config=config)
+
+        assert dataset.get() == [1, 2]
+        assert builder.calls == 1
+
+    def test_corrupt_snapshot_rebuilt(self, tmp_path):
+        config = snapshots(tmp_path)
+        dataset = ReferenceDataset("test.corrupt", counting_builder(), config=config)
+        dataset.snapshot_path.write_bytes(b"ELRD\x00\x01garbage")
+
+        assert dataset.get() == {"build": 1}
+        assert dataset.source == "builder"
+        assert read_snapshot(dataset.snapshot_path, "test.corrupt", 1)[0] == {"build": 1}
+
+    def test_publish_reaches_other_process_after_interval(self, tmp_path, clock):
+        config = snapshots(tmp_path, reload_interval=30)
+        writer = ReferenceDataset("test.reload", counting_builder(), config=config)
+        reader = ReferenceDataset("test.reload", counting_builder(), config=config)
+        writer.get()
+        reader.get()
+
+        writer.publish({"published": True})
+
+        clock.now += 10
+        assert reader.get() == {"build": 1}
+        clock.now += 20
+        assert reader.get() == {"published": True}
+        assert reader.generation == 2
+
+    def test_reload_interval_zero_disables_checks(self, tmp_path, clock):
+        config = snapshots(tmp_path, reload_interval=0)
+        writer = ReferenceDataset("test.static", counting_builder(), config=config)
+        reader = ReferenceDataset("test.static", counting_builder(), config=config)
+        reader.get()
+
+        writer.publish({"published": True})
+        clock.now += 3600
+
+        assert reader.get() == {"build": 1}
+        assert reader.reload()
+        assert reader.get() == {"published": True}
+
+    def test_unreadable_replacement_keeps_current_data(self, tmp_path, clock):
+        config = snapshots(tmp_path, reload_interval=1)
+        dataset = ReferenceDataset("test.keep", counting_builder(), config=config)
+        dataset.get()
+        dataset.snapshot_path.write_bytes(b"truncated")
+
+        clock.now += 5
+
+        assert dataset.get() == {"build": 1}
+        with pytest.raises(ReferenceDataError):
+            dataset.reload()
+
+
+class TestRegistry:
+    """Tests for the registered datasets and global configuration."""
+
+    def test_provider_datasets_registered(self):
+        names = [dataset.name for dataset in list_reference_datasets()]
+
+        assert {
+            "darkweb.breaches",
+            "education.diploma_mills",
+            "education.institutions",
+            "sanctions.lists",
+        } <= set(names)
+        assert names == sorted(names)
+        assert get_reference_dataset("sanctions.lists") is SANCTIONS_LISTS
+
+    def test_duplicate_name_rejected(self):
+        with pytest.raises(ValueError, match="already registered"):
+            reference_dataset("sanctions.lists", dict)
+
+    def test_config_from_settings(self):
+        config = get_reference_data_config()
+
+        assert config.directory is None
+        assert config.reload_interval == 60.0
+
+    def test_configured_directory_used(self, tmp_path):
+        configure_reference_data(snapshots(tmp_path))
+
+        SANCTIONS_LISTS.get()
+
+        assert (tmp_path / "sanctions.lists.v1.snapshot").exists()
+
+    def test_preload_and_freeze(self, monkeypatch):
+        frozen = []
+        monkeypatch.setattr(reference_data.gc, "freeze", lambda: frozen.append(True))
+
+        preload_reference_data(["sanctions.lists", "darkweb.breaches"])
+
+        assert SANCTIONS_LISTS.is_loaded
+        assert BREACHES.is_loaded
+        assert not INSTITUTIONS.is_loaded
+        assert frozen == [True]
+
+    def test_preload_imports_provider_datasets(self, monkeypatch):
+        monkeypatch.setattr(reference_data.gc, "freeze", lambda: None)
+
+        preload_reference_data()
+
+        assert all(dataset.is_loaded for dataset in list_reference_datasets())
+
+    @pytest.mark.parametrize("preload", [True, False])
+    def test_app_preloads_when_configured(self, monkeypatch, preload):
+        from elile.api.app import create_app
+
+        calls = []
+        monkeypatch.setattr(reference_data, "preload_reference_data", lambda: calls.append(True))
+
+        create_app(Settings(REFERENCE_DATA_PRELOAD=preload))
+
+        assert calls == ([True] if preload else [])
+
+    def test_gunicorn_preloads_app_in_master(self):
+        from elile.api import gunicorn_conf
+
+        # The factory runs before the workers fork, so they share the data
+        assert gunicorn_conf.preload_app is True
+        assert gunicorn_conf.wsgi_app == "elile.api.app:create_app()"
+        assert gunicorn_conf.worker_class == "uvicorn.workers.UvicornWorker"
+
+    def test_reload_reference_data(self):
+        SANCTIONS_LISTS.get()
+
+        assert reload_reference_data() == []
+        assert reload_reference_data(force=True) == ["sanctions.lists"]
+
+
+class TestProviderSharing:
+    """Providers read shared datasets instead of building their own copy."""
+
+    def test_sanctions_lists_shared(self):
+        first, second = SanctionsProvider(), SanctionsProvider()
+
+        assert not SANCTIONS_LISTS.is_loaded
+        assert first._sanctions_db is second._sanctions_db
+        assert SanctionsList.OFAC_SDN in first._sanctions_db
+
+    def test_breaches_shared(self):
+        assert BreachDatabase().get_all_breaches() == BreachDatabase().get_all_breaches()
+        assert BreachDatabase().search_by_domain("linkedin.com")[0].breach_id == "linkedin_2021"
+
+    def test_published_breaches_visible(self):
+        db = BreachDatabase()
+        count = db.get_breach_count()
+
+        BREACHES.publish(BREACHES.get()._replace(breaches={}, domains={}))
+
+        assert db.get_breach_count() == 0
+        BREACHES.unload()
+        assert db.get_breach_count() == count
+
+    def test_diploma_mill_index_shared(self):
+        first, second = DiplomaMilDetector(), DiplomaMilDetector()
+
+        assert first._mills is second._mills
+        assert first.check_institution("Belford University")
+
+    def test_custom_diploma_mills_stay_local(self):
+        custom = DiplomaMilDetector(["Quarry Hill Degree Works"])
+
+        assert custom.check_institution("Quarry Hill Degree Works")
+        assert not DIPLOMA_MILLS.is_loaded
+        assert not DiplomaMilDetector().check_institution("Quarry Hill Degree Works")
+
+    def test_education_matcher_shared(self):
+        first, second = EducationProvider(), EducationProvider()
+
+        assert first.matcher is second.matcher
+        assert first.matcher.match_single("Stanford University") is not None
+
+    async def test_local_institutions_stay_local(self):
+        provider, other = EducationProvider(), EducationProvider()
+        institution = Institution(
+            institution_id="NEW001",
+            name="Quarry Hill Polytechnic Institute",
+            type=InstitutionType.UNIVERSITY,
+        )
+        provider._institutions_db[institution.institution_id] = institution
+        provider.refresh_institution_index()
+
+        found = await provider.check_institution("Quarry Hill Polytechnic Institute")
+        shared = await other.check_institution("Quarry Hill Polytechnic Institute")
+
+        assert found["matched_institution"] == "Quarry Hill Polytechnic Institute"
+        assert shared["matched_institution"] != "Quarry Hill Polytechnic Institute"
+        assert "NEW001" not in INSTITUTIONS.get()
@@ -1,9 +1,11 @@
 """Tests for data retention manager."""
 
 from datetime import datetime, timedelta
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from elile.compliance.retention.manager import (
     RetentionManager,
@@ -11,13 +13,23 @@ from elile.compliance.retention.manager import (
     get_retention_manager,
     initialize_retention_manager,
 )
+from elile.compliance.retention.store import (
+    InMemoryRetentionStore,
+    SQLAlchemyRetentionStore,
+    create_bulk_delete_callback,
+)
 from elile.compliance.retention.types import (
     DataType,
     DeletionMethod,
     RetentionPolicy,
+    RetentionRecord,
     RetentionStatus,
+    RetentionSweepPhase,
+    RetentionSweepProgress,
 )
 from elile.compliance.types import Locale
+from elile.db.models.base import Base
+from elile.db.models.retention import RetentionRecordModel, RetentionSweep
 
 
 class TestRetentionManagerConfig:
@@ -94,13 +106,13 @@ class TestRetentionManagerPolicies:
 class TestRetentionManagerRecords:
     """Tests for record management."""
 
-    def test_track_data(self) -> None:
+    async def test_track_data(self) -> None:
         """Test tracking data retention."""
         manager = RetentionManager()
         data_id = uuid4()
         tenant_id = uuid4()
 
-        record = manager.track_data(
+        record = await manager.track_data(
             data_id=data_id,
             data_type=DataType.SCREENING_RESULT,
             tenant_id=tenant_id,
@@ -112,11 +124,11 @@ class TestRetentionManagerRecords:
         assert record.status == RetentionStatus.ACTIVE
         assert len(record.events) == 1  # CREATED event
 
-    def test_track_data_with_locale(self) -> None:
+    async def test_track_data_with_locale(self) -> None:
         """Test tracking with locale-specific policy."""
         manager = RetentionManager()
 
-        record = manager.track_data(
+        record = await manager.track_data(
             data_id=uuid4(),
             data_type=DataType.SCREENING_RAW_DATA,
             tenant_id=uuid4(),
@@ -128,12 +140,12 @@ class TestRetentionManagerRecords:
         # Allow 1 second tolerance
         assert abs((record.expires_at - expected_expiry).total_seconds()) < 2
 
-    def test_track_data_with_custom_created_at(self) -> None:
+    async def test_track_data_with_custom_created_at(self) -> None:
         """Test tracking with custom creation date."""
         manager = RetentionManager()
         created = datetime(2024, 1, 1)
 
-        record = manager.track_data(
+        record = await manager.track_data(
             data_id=uuid4(),
             data_type=DataType.SCREENING_RESULT,
             tenant_id=uuid4(),
@@ -142,51 +154,51 @@ class TestRetentionManagerRecords:
 
         assert record.created_at == created
 
-    def test_get_record(self) -> None:
+    async def test_get_record(self) -> None:
         """Test getting record by ID."""
         manager = RetentionManager()
 
-        record = manager.track_data(
+        record = await manager.track_data(
             data_id=uuid4(),
             data_type=DataType.SCREENING_RESULT,
             tenant_id=uuid4(),
         )
 
-        retrieved = manager.get_record(record.record_id)
+        retrieved = await manager.get_record(record.record_id)
         assert retrieved is record
 
-    def test_get_record_by_data_id(self) -> None:
+    async def test_get_record_by_data_id(self) -> None:
         """Test getting record by data ID."""
         manager = RetentionManager()
         data_id = uuid4()
 
-        manager.track_data(
+        await manager.track_data(
             data_id=data_id,
             data_type=DataType.SCREENING_RESULT,
             tenant_id=uuid4(),
         )
 
-        retrieved = manager.get_record_by_data_id(data_id)
+        retrieved = await manager.get_record_by_data_id(data_id)
         assert retrieved is not None
         assert retrieved.data_id == data_id
 
-    def test_get_records_by_status(self) -> None:
+    async def test_get_records_by_status(self) -> None:
         """Test getting records by status."""
         manager = RetentionManager()
         tenant = uuid4()
 
         # Create some records
         for _ in range(3):
-            manager.track_data(
+            await manager.track_data(
                 data_id=uuid4(),
                 data_type=DataType.SCREENING_RESULT,
                 tenant_id=tenant,
             )
 
-        active = manager.get_records_by_status(RetentionStatus.ACTIVE)
+        active = await manager.get_records_by_status(RetentionStatus.ACTIVE)
         assert len(active) == 3
 
-    def test_get_records_by_tenant(self) -> None:
+    async def test_get_records_by_tenant(self) -> None:
         """Test getting records by tenant."""
         manager = RetentionManager()
         tenant1 = uuid4()
@@ -194,12 +206,12 @@ class TestRetentionManagerRecords:
 
         # Create records for two tenants
         for _ in range(2):
-            manager.track_data(uuid4(), DataType.SCREENING_RESULT, tenant1)
+            await manager.track_data(uuid4(), DataType.SCREENING_RESULT, tenant1)
         for _ in range(3):
-            manager.track_data(uuid4(), DataType.SCREENING_RESULT, tenant2)
+            await manager.track_data(uuid4(), DataType.SCREENING_RESULT, tenant2)
 
-        tenant1_records = manager.get_records_by_tenant(tenant1)
-        tenant2_records = manager.get_records_by_tenant(tenant2)
+        tenant1_records = await manager.get_records_by_tenant(tenant1)
+        tenant2_records = await manager.get_records_by_tenant(tenant2)
 
         assert len(tenant1_records) == 2
         assert len(tenant2_records) == 3
@@ -208,51 +220,51 @@ class TestRetentionManagerRecords:
 class TestLegalHold:
     """Tests for legal hold management."""
 
-    def test_place_legal_hold(self) -> None:
+    async def test_place_legal_hold(self) -> None:
         """Test placing legal hold."""
         manager = RetentionManager()
         data_id = uuid4()
 
-        manager.track_data(data_id, DataType.SCREENING_RESULT, uuid4())
+        await manager.track_data(data_id, DataType.SCREENING_RESULT, uuid4())
 
-        result = manager.place_legal_hold(data_id, "Litigation pending")
+        result = await manager.place_legal_hold(data_id, "Litigation pending")
 
         assert result is True
-        record = manager.get_record_by_data_id(data_id)
+        record = await manager.get_record_by_data_id(data_id)
         assert record.legal_hold is True
         assert record.status == RetentionStatus.LEGAL_HOLD
 
-    def test_place_legal_hold_not_found(self) -> None:
+    async def test_place_legal_hold_not_found(self) -> None:
         """Test placing hold on non-existent data."""
         manager = RetentionManager()
 
-        result = manager.place_legal_hold(uuid4(), "Test")
+        result = await manager.place_legal_hold(uuid4(), "Test")
 
         assert result is False
 
-    def test_release_legal_hold(self) -> None:
+    async def test_release_legal_hold(self) -> None:
         """Test releasing legal hold."""
         manager = RetentionManager()
         data_id = uuid4()
 
-        manager.track_data(data_id, DataType.SCREENING_RESULT, uuid4())
-        manager.place_legal_hold(data_id, "Test")
+        await manager.track_data(data_id, DataType.SCREENING_RESULT, uuid4())
+        await manager.place_legal_hold(data_id, "Test")
 
-        result = manager.release_legal_hold(data_id)
+        result = await manager.release_legal_hold(data_id)
 
         assert result is True
-        record = manager.get_record_by_data_id(data_id)
+        record = await manager.get_record_by_data_id(data_id)
         assert record.legal_hold is False
         assert record.status == RetentionStatus.ACTIVE
 
-    def test_release_legal_hold_not_held(self) -> None:
+    async def test_release_legal_hold_not_held(self) -> None:
         """Test releasing hold on data not under hold."""
         manager = RetentionManager()
         data_id = uuid4()
 
-        manager.track_data(data_id, DataType.SCREENING_RESULT, uuid4())
+        await manager.track_data(data_id, DataType.SCREENING_RESULT, uuid4())
 
-        result = manager.release_legal_hold(data_id)
+        result = await manager.release_legal_hold(data_id)
 
         assert result is False
 
@@ -266,7 +278,7 @@ class TestLifecycleProcessing:
         manager = RetentionManager()
 
         # Create record expiring soon
-        record = manager.track_data(uuid4(), DataType.CACHE_ENTRY, uuid4())
+        record = await manager.track_data(uuid4(), DataType.CACHE_ENTRY, uuid4())
         record.expires_at = datetime.utcnow() + timedelta(days=15)
 
         expiring = await manager.check_expiring_data()
@@ -280,9 +292,9 @@ class TestLifecycleProcessing:
         manager = RetentionManager()
         data_id = uuid4()
 
-        record = manager.track_data(data_id, DataType.CACHE_ENTRY, uuid4())
+        record = await manager.track_data(data_id, DataType.CACHE_ENTRY, uuid4())
         record.expires_at = datetime.utcnow() + timedelta(days=15)
-        manager.place_legal_hold(data_id, "Test")
+        await manager.place_legal_hold(data_id, "Test")
 
         expiring = await manager.check_expiring_data()
 
@@ -294,7 +306,7 @@ class TestLifecycleProcessing:
         manager = RetentionManager()
 
         # Create expired record
-        record = manager.track_data(uuid4(), DataType.CACHE_ENTRY, uuid4())
+        record = await manager.track_data(uuid4(), DataType.CACHE_ENTRY, uuid4())
         record.expires_at = datetime.utcnow() - timedelta(days=1)
 
         expired = await manager.check_expired_data()
@@ -308,7 +320,7 @@ class TestLifecycleProcessing:
         manager = RetentionManager()
 
         # Create record ready for archive
-        record = manager.track_data(uuid4(), DataType.SCREENING_RESULT, uuid4())
+        record = await manager.track_data(uuid4(), DataType.SCREENING_RESULT, uuid4())
         record.archive_at = datetime.utcnow() - timedelta(days=1)
 
         pending = await manager.check_archive_pending()
@@ -322,7 +334,7 @@ class TestLifecycleProcessing:
         manager = RetentionManager()
         data_id = uuid4()
 
-        record = manager.track_data(data_id, DataType.SCREENING_RESULT, uuid4())
+        record = await manager.track_data(data_id, DataType.SCREENING_RESULT, uuid4())
 
         result = await manager.process_archival(record)
 
@@ -336,8 +348,8 @@ class TestLifecycleProcessing:
         manager = RetentionManager()
         data_id = uuid4()
 
-        record = manager.track_data(data_id, DataType.SCREENING_RESULT, uuid4())
-        manager.place_legal_hold(data_id, "Test")
+        record = await manager.track_data(data_id, DataType.SCREENING_RESULT, uuid4())
+        await manager.place_legal_hold(data_id, "Test")
 
         result = await manager.process_archival(record)
 
@@ -350,7 +362,7 @@ class TestLifecycleProcessing:
         manager = RetentionManager()
         data_id = uuid4()
 
-        record = manager.track_data(data_id, DataType.SCREENING_RESULT, uuid4())
+        record = await manager.track_data(data_id, DataType.SCREENING_RESULT, uuid4())
 
         result = await manager.process_deletion(record)
 
@@ -364,14 +376,212 @@ class TestLifecycleProcessing:
         manager = RetentionManager()
         data_id = uuid4()
 
-        record = manager.track_data(data_id, DataType.SCREENING_RESULT, uuid4())
-        manager.place_legal_hold(data_id, "Test")
+        record = await manager.track_data(data_id, DataType.SCREENING_RESULT, uuid4())
+        await manager.place_legal_hold(data_id, "Test")
 
         result = await manager.process_deletion(record)
 
         assert result is False
 
 
+def _records(
+    policy: RetentionPolicy,
+    count: int,
+    expires_in: timedelta,
+    archive_in: timedelta | None = None,
+) -> list[RetentionRecord]:
+    now = datetime.utcnow()
+    return [
+        RetentionRecord(
+            data_type=policy.data_type,
+            policy_id=policy.policy_id,
+            expires_at=now + expires_in,
+            archive_at=now + archive_in if archive_in is not None else None,
+        )
+        for _ in range(count)
+    ]
+
+
+class FlakyStore(InMemoryRetentionStore):
+    """Store that fails one checkpointed save, like an interrupted transaction."""
+
+    def __init__(self, fail_on_save: int) -> None:
+        super().__init__()
+        self.fail_on_save = fail_on_save
+        self.checkpoints = 0
+
+    async def save_records(
+        self,
+        records: list[RetentionRecord],
+        progress: RetentionSweepProgress | None = None,
+    ) -> None:
+        if progress is not None and records:
+            self.checkpoints += 1
+            if self.checkpoints == self.fail_on_save:
+                raise ConnectionError("connection lost")
+        await super().save_records(records, progress)
+
+
+class TestRetentionSweep:
+    """Tests for time-indexed retention sweeps."""
+
+    @pytest.fixture
+    def policy(self) -> RetentionPolicy:
+        """Hard-delete policy for swept records."""
+        return RetentionPolicy(
+            name="sweep_test",
+            data_type=DataType.CACHE_ENTRY,
+            retention_days=30,
+            deletion_method=DeletionMethod.HARD_DELETE,
+        )
+
+    @pytest.mark.asyncio
+    async def test_sweep_claims_only_due_records(self, policy: RetentionPolicy) -> None:
+        """Test each phase only sees records whose deadline has passed."""
+        store = InMemoryRetentionStore()
+        manager = RetentionManager(store=store)
+        manager.register_policy(policy)
+        expired = _records(policy, 3, timedelta(days=-1))
+        warning = _records(policy, 2, timedelta(days=10))
+        archivable = _records(policy, 4, timedelta(days=300), archive_in=timedelta(days=-1))
+        later = _records(policy, 50, timedelta(days=300))
+        await store.save_records(expired + warning + archivable + later)
+
+        progress = await manager.run_sweep()
+
+        assert progress.is_complete
+        assert (progress.warned, progress.expired, progress.archive_due) == (5, 3, 4)
+        assert all(r.status == RetentionStatus.DELETION_PENDING for r in expired)
+        assert all(r.status == RetentionStatus.EXPIRY_WARNING for r in warning)
+        assert all(r.status == RetentionStatus.ARCHIVED for r in archivable)
+        assert len(await manager.get_records_by_status(RetentionStatus.ACTIVE)) == 50
+
+        again = await manager.run_sweep()
+        assert (again.warned, again.expired, again.archive_due, again.chunks) == (0, 0, 0, 0)
+
+    @pytest.mark.asyncio
+    async def test_bulk_deletion_in_chunks(self, policy: RetentionPolicy) -> None:
+        """Test expired records are deleted one chunk per bulk callback call."""
+        calls: list[list[tuple[UUID, DataType]]] = []
+
+        async def bulk_delete(items: list[tuple[UUID, DataType]]) -> list[bool]:
+            calls.append(items)
+            return [True] * len(items)
+
+        store = InMemoryRetentionStore()
+        manager = RetentionManager(
+            config=RetentionManagerConfig(batch_size=10, auto_delete=True),
+            store=store,
+            bulk_delete_callback=bulk_delete,
+        )
+        manager.register_policy(policy)
+        records = _records(policy, 25, timedelta(days=-1))
+        await store.save_records(records)
+
+        progress = await manager.run_sweep()
+
+        assert [len(items) for items in calls] == [10, 10, 5]
+        assert progress.deleted == 25
+        assert all(r.status == RetentionStatus.DELETED for r in records)
+
+    @pytest.mark.asyncio
+    async def test_failed_bulk_deletion_counted(self, policy: RetentionPolicy) -> None:
+        """Test a failing bulk callback leaves records pending deletion."""
+
+        async def bulk_delete(items: list[tuple[UUID, DataType]]) -> list[bool]:
+            raise ConnectionError(f"delete of {len(items)} items failed")
+
+        store = InMemoryRetentionStore()
+        manager = RetentionManager(
+            config=RetentionManagerConfig(auto_delete=True),
+            store=store,
+            bulk_delete_callback=bulk_delete,
+        )
+        manager.register_policy(policy)
+        records = _records(policy, 3, timedelta(days=-1))
+        await store.save_records(records)
+
+        progress = await manager.run_sweep()
+
+        assert (progress.expired, progress.deleted, progress.failed) == (3, 0, 3)
+        assert await manager.get_records_by_status(RetentionStatus.DELETION_PENDING) == records
+
+    @pytest.mark.asyncio
+    async def test_interrupted_sweep_resumes(self, policy: RetentionPolicy) -> None:
+        """Test an interrupted sweep resumes with its cutoff and counters."""
+        store = FlakyStore(fail_on_save=7)  # Second chunk of the expiry phase
+        manager = RetentionManager(
+            config=RetentionManagerConfig(batch_size=10, auto_delete=True), store=store
+        )
+        manager.register_policy(policy)
+        records = _records(policy, 45, timedelta(days=-1))
+        await store.save_records(records)
+
+        with pytest.raises(ConnectionError):
+            await manager.run_sweep()
+        interrupted = await store.get_sweep_progress()
+        assert interrupted is not None
+        assert interrupted.phase == RetentionSweepPhase.EXPIRY
+
+        resumed = await manager.run_sweep(as_of=datetime.utcnow() + timedelta(days=365))
+
+        assert resumed.sweep_id == interrupted.sweep_id
+        assert resumed.as_of == interrupted.as_of
+        assert resumed.is_complete
+        assert all(r.status == RetentionStatus.DELETED for r in records)
+
+    @pytest.mark.asyncio
+    async def test_legal_hold_skipped_until_released(self, policy: RetentionPolicy) -> None:
+        """Test held records are not swept until the hold is released."""
+        store = InMemoryRetentionStore()
+        manager = RetentionManager(store=store)
+        manager.register_policy(policy)
+        [record] = _records(policy, 1, timedelta(days=-1))
+        await store.save_records([record])
+        await manager.place_legal_hold(record.data_id, "Litigation")
+
+        held = await manager.run_sweep()
+        await manager.release_legal_hold(record.data_id)
+        released = await manager.run_sweep()
+
+        assert held.expired == 0
+        assert released.expired == 1
+        assert record.status == RetentionStatus.DELETION_PENDING
+
+    @pytest.mark.asyncio
+    async def test_large_sweep_touches_due_records_only(self, policy: RetentionPolicy) -> None:
+        """Test a sweep claims the due records, not the tracked total.
+
+        Sweep time over a large store is measured by the retention_manager.sweep benchmark.
+        """
+        store = InMemoryRetentionStore()
+        manager = RetentionManager(
+            config=RetentionManagerConfig(batch_size=500, auto_delete=True), store=store
+        )
+        manager.register_policy(policy)
+        await store.save_records(_records(policy, 20_000, timedelta(days=300)))
+        await manager.run_sweep()  # Indexes the bulk load
+        due = _records(policy, 1_000, timedelta(days=-1))
+        await store.save_records(due)
+        claims: list[tuple[RetentionSweepPhase, UUID]] = []
+        claim_due = store.claim_due
+
+        async def counting_claim_due(phase, as_of, limit=None):
+            records = await claim_due(phase, as_of, limit)
+            claims.extend((phase, record.record_id) for record in records)
+            return records
+
+        store.claim_due = counting_claim_due  # type: ignore[method-assign]
+
+        progress = await manager.run_sweep()
+
+        assert progress.deleted == 1_000
+        assert progress.chunks == 2 + 2  # Warning and expiry phases
+        assert len(claims) == 2 * len(due)
+        assert {record_id for _, record_id in claims} == {record.record_id for record in due}
+        assert len(await claim_due(RetentionSweepPhase.WARNING, datetime.utcnow())) == 0
+
+
 class TestErasureRequests:
     """Tests for GDPR erasure requests."""
 
@@ -433,8 +643,8 @@ class TestErasureRequests:
         tenant_id = uuid4()
 
         # Create some erasable data
-        manager.track_data(uuid4(), DataType.ENTITY_PROFILE, tenant_id, Locale.EU)
-        manager.track_data(uuid4(), DataType.CACHE_ENTRY, tenant_id, Locale.EU)
+        await manager.track_data(uuid4(), DataType.ENTITY_PROFILE, tenant_id, Locale.EU)
+        await manager.track_data(uuid4(), DataType.CACHE_ENTRY, tenant_id, Locale.EU)
 
         request = await manager.submit_erasure_request(
             subject_id=uuid4(),
@@ -457,8 +667,8 @@ class TestErasureRequests:
         data_id = uuid4()
 
         # Create data and place legal hold
-        manager.track_data(data_id, DataType.ENTITY_PROFILE, tenant_id, Locale.EU)
-        manager.place_legal_hold(data_id, "Litigation")
+        await manager.track_data(data_id, DataType.ENTITY_PROFILE, tenant_id, Locale.EU)
+        await manager.place_legal_hold(data_id, "Litigation")
 
         request = await manager.submit_erasure_request(
             subject_id=uuid4(),
@@ -475,67 +685,164 @@ class TestErasureRequests:
 class TestReporting:
     """Tests for retention reporting."""
 
-    def test_generate_report(self) -> None:
+    async def test_generate_report(self) -> None:
         """Test generating retention report."""
         manager = RetentionManager()
         tenant = uuid4()
 
         # Create various records
         for _ in range(5):
-            manager.track_data(uuid4(), DataType.SCREENING_RESULT, tenant)
+            await manager.track_data(uuid4(), DataType.SCREENING_RESULT, tenant)
         for _ in range(3):
-            manager.track_data(uuid4(), DataType.CACHE_ENTRY, tenant)
+            await manager.track_data(uuid4(), DataType.CACHE_ENTRY, tenant)
 
-        report = manager.generate_report(tenant)
+        report = await manager.generate_report(tenant)
 
         assert report is not None
         assert report.tenant_id == tenant
         assert report.active_count == 8
         assert report.total_count == 8
 
-    def test_generate_report_with_status(self) -> None:
+    async def test_generate_report_with_status(self) -> None:
         """Test report with different statuses."""
         manager = RetentionManager()
         tenant = uuid4()
 
         # Create records with different statuses
-        active_record = manager.track_data(uuid4(), DataType.SCREENING_RESULT, tenant)
+        active_record = await manager.track_data(uuid4(), DataType.SCREENING_RESULT, tenant)
 
-        archived_record = manager.track_data(uuid4(), DataType.SCREENING_RESULT, tenant)
+        archived_record = await manager.track_data(uuid4(), DataType.SCREENING_RESULT, tenant)
         archived_record.status = RetentionStatus.ARCHIVED
 
         hold_data = uuid4()
-        manager.track_data(hold_data, DataType.SCREENING_RESULT, tenant)
-        manager.place_legal_hold(hold_data, "Test")
+        await manager.track_data(hold_data, DataType.SCREENING_RESULT, tenant)
+        await manager.place_legal_hold(hold_data, "Test")
 
-        report = manager.generate_report(tenant)
+        report = await manager.generate_report(tenant)
 
         assert report.active_count == 1
         assert report.archived_count == 1
         assert report.legal_hold_count == 1
 
-    def test_generate_report_expiration_windows(self) -> None:
+    async def test_generate_report_expiration_windows(self) -> None:
         """Test report expiration window counts."""
         manager = RetentionManager()
         tenant = uuid4()
 
         # Create records expiring at different times
-        soon = manager.track_data(uuid4(), DataType.CACHE_ENTRY, tenant)
+        soon = await manager.track_data(uuid4(), DataType.CACHE_ENTRY, tenant)
         soon.expires_at = datetime.utcnow() + timedelta(days=5)
 
-        medium = manager.track_data(uuid4(), DataType.CACHE_ENTRY, tenant)
+        medium = await manager.track_data(uuid4(), DataType.CACHE_ENTRY, tenant)
         medium.expires_at = datetime.utcnow() + timedelta(days=20)
 
-        later = manager.track_data(uuid4(), DataType.CACHE_ENTRY, tenant)
+        later = await manager.track_data(uuid4(), DataType.CACHE_ENTRY, tenant)
         later.expires_at = datetime.utcnow() + timedelta(days=60)
 
-        report = manager.generate_report(tenant)
+        report = await manager.generate_report(tenant)
 
         assert report.expiring_next_7_days == 1
         assert report.expiring_next_30_days == 2
         assert report.expiring_next_90_days == 3
 
 
+@pytest.fixture
+async def session_factory(tmp_path):
+    """Session factory for a SQLite database with the retention tables."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'retention.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[RetentionRecordModel.__table__, RetentionSweep.__table__],
+        )
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+class TestSQLAlchemyRetentionStore:
+    """Tests for the database-backed retention store."""
+
+    @pytest.fixture
+    def policy(self) -> RetentionPolicy:
+        """Hard-delete policy for swept records."""
+        return RetentionPolicy(
+            name="sql_sweep_test",
+            data_type=DataType.CACHE_ENTRY,
+            retention_days=30,
+            deletion_method=DeletionMethod.HARD_DELETE,
+        )
+
+    async def test_sweep_persists_statuses(self, session_factory, policy) -> None:
+        """Test a sweep over the database store persists each phase's statuses."""
+        store = SQLAlchemyRetentionStore(session_factory, page_size=2)
+        manager = RetentionManager(config=RetentionManagerConfig(batch_size=2), store=store)
+        manager.register_policy(policy)
+        expired = _records(policy, 3, timedelta(days=-1))
+        warning = _records(policy, 2, timedelta(days=10))
+        later = _records(policy, 5, timedelta(days=300))
+        await store.save_records(expired + warning + later)
+
+        progress = await manager.run_sweep()
+
+        assert progress.is_complete
+        assert (progress.warned, progress.expired) == (5, 3)
+        pending = await store.get_records_by_status(RetentionStatus.DELETION_PENDING)
+        assert {r.record_id for r in pending} == {r.record_id for r in expired}
+        assert len(await store.get_records_by_status(RetentionStatus.EXPIRY_WARNING)) == 2
+        assert len([r async for r in store.iter_records()]) == 10
+
+        saved = await store.get_sweep_progress()
+        assert saved is not None
+        assert saved.sweep_id == progress.sweep_id
+        assert saved.is_complete
+
+        again = await manager.run_sweep()
+        assert (again.warned, again.expired, again.chunks) == (0, 0, 0)
+
+    async def test_claims_skip_held_and_claimed_records(self, session_factory, policy) -> None:
+        """Test legal holds persist and claimed records are not claimed twice."""
+        store = SQLAlchemyRetentionStore(session_factory)
+        manager = RetentionManager(store=store)
+        manager.register_policy(policy)
+        held, free = _records(policy, 2, timedelta(days=-1))
+        await store.save_records([held, free])
+        await manager.place_legal_hold(held.data_id, "Litigation")
+
+        reloaded = await store.get_record_by_data_id(held.data_id)
+        assert reloaded is not None
+        assert reloaded.legal_hold
+        assert reloaded.legal_hold_reason == "Litigation"
+
+        now = datetime.utcnow()
+        claimed = await store.claim_due(RetentionSweepPhase.EXPIRY, now)
+        assert [r.record_id for r in claimed] == [free.record_id]
+        assert await store.claim_due(RetentionSweepPhase.EXPIRY, now) == []
+
+        await store.save_records(claimed)
+        assert len(await store.claim_due(RetentionSweepPhase.EXPIRY, now)) == 1
+
+    async def test_bulk_delete_callback_deletes_in_chunks(self, session_factory) -> None:
+        """Test the bulk delete callback removes rows of mapped data types only."""
+        ids = [uuid4() for _ in range(5)]
+        async with session_factory() as session:
+            session.add_all(
+                RetentionSweep(sweep_id=i, started_at=datetime.utcnow(), payload={}) for i in ids
+            )
+            await session.commit()
+        bulk_delete = create_bulk_delete_callback(
+            session_factory, {DataType.CACHE_ENTRY: RetentionSweep}, chunk_size=2
+        )
+
+        results = await bulk_delete(
+            [(i, DataType.CACHE_ENTRY) for i in ids[:4]] + [(ids[4], DataType.AUDIT_LOG)]
+        )
+
+        assert results == [True, True, True, True, False]
+        async with session_factory() as session:
+            remaining = (await session.execute(select(RetentionSweep.sweep_id))).scalars().all()
+        assert remaining == [ids[4]]
+
+
 class TestGlobalManager:
     """Tests for global manager instance."""
 